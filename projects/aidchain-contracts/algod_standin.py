@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Local algod stand-in for deterministic client benchmarks.
+
+Serves the algod endpoints the Python clients use (params, submit, pending, simulate,
+boxes, application info, wait-for-block, block txids and compile) from AidchainContracts
+running in the algorand-python-testing emulator, without docker or block times. Rounds
+close after every group (or every --block-time seconds), and --latency, --jitter and
+--error-rate inject delays and HTTP 503 errors, so caching, pooling or group packing
+can be measured reproducibly. Balances, fees, signatures and opcode budgets are not
+modelled; use localnet for those. Prints the environment variables that point
+load_test.py, seed_dataset.py and the benchmarks at it.
+
+Usage:
+    python algod_standin.py                                  # http://127.0.0.1:4100
+    python algod_standin.py --block-time 2.8                 # rounds like localnet's
+    python algod_standin.py --latency 2 --jitter 1           # milliseconds per request
+    python algod_standin.py --error-rate 0.01 --fail-endpoints submit,simulate
+"""
+
+import argparse
+import base64
+import hashlib
+import logging
+import threading
+
+from algosdk import mnemonic
+from dotenv import load_dotenv
+from nacl.signing import SigningKey
+
+from smart_contracts._helpers.algod_standin import AlgodStandin, EmulatedLedger, Faults
+from smart_contracts.aidchain_contracts.contract import AidchainContracts
+from smart_contracts.artifacts.aidchain_contracts.aidchain_contracts_client import APP_SPEC
+
+logger = logging.getLogger(__name__)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Local algod stand-in for client benchmarks")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4100)
+    parser.add_argument(
+        "--block-time",
+        type=float,
+        default=0.0,
+        help="seconds per round (default: a round per accepted group)",
+    )
+    parser.add_argument("--latency", type=float, default=0.0, help="ms added per request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="up to this many ms more")
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="share of requests answered with 503"
+    )
+    parser.add_argument(
+        "--fail-endpoints",
+        help=f"endpoints faults apply to (default: all of {','.join(AlgodStandin.endpoints)})",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="random seed for the faults")
+    return parser.parse_args()
+
+
+def dispenser_mnemonic(seed: int) -> str:
+    """A fixed dispenser account per seed, so runs send identical transactions."""
+    key = SigningKey(hashlib.sha256(f"algod-standin-{seed}".encode()).digest())
+    private_key = base64.b64encode(key.encode() + key.verify_key.encode()).decode()
+    return str(mnemonic.from_private_key(private_key))
+
+
+def serve(args: argparse.Namespace) -> None:
+    endpoints = frozenset(args.fail_endpoints.split(",")) if args.fail_endpoints else None
+    unknown = (endpoints or set()) - set(AlgodStandin.endpoints)
+    if unknown:
+        raise Exception(f"Unknown endpoints {sorted(unknown)}")
+    standin = AlgodStandin(
+        # Like localnet, where deploys are updatable so watch mode can update in place.
+        EmulatedLedger(
+            AidchainContracts,
+            APP_SPEC,
+            {"UpdateApplication": "update"},
+            template_vars={"UPDATABLE": True},
+        ),
+        block_time=args.block_time,
+        faults=Faults(
+            latency=args.latency / 1000,
+            jitter=args.jitter / 1000,
+            error_rate=args.error_rate,
+            endpoints=endpoints,
+            seed=args.seed,
+        ),
+    )
+    with standin:
+        address = standin.start(args.host, args.port)
+        logger.info(f"algod stand-in listening on {address}; point scripts at it with:")
+        print(f"ALGOD_SERVER=http://{args.host}")
+        print(f"ALGOD_PORT={args.port}")
+        print(f"ALGOD_TOKEN={'a' * 64}")
+        print(f"DISPENSER_MNEMONIC=\"{dispenser_mnemonic(args.seed)}\"")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    load_dotenv()
+    serve(parse_args())
@@ -0,0 +1,204 @@
+"""
+Scaling benchmark for AidchainContracts box reads.
+
+For each dataset size N, an app holding N deliveries, N / 10 campaigns and N / 100
+organizations is seeded with the synthetic dataset generator (once per network; the app
+IDs are kept in .algokit/box-scaling-apps.json and reused). The benchmark then times:
+- listing the app's box names
+- the generated client's `_MapState.get_map` on deliveries, which reads box after box
+- the async client's concurrent `get_map`
+- a range read of --range consecutive deliveries through `get_values`
+- the median of the `get_delivery_details` and `get_campaign_details` getters (simulated)
+Times per record show where reads stop scaling linearly. A read that fails, such as box
+listing beyond algod's MaxAPIBoxPerApplication, is reported instead of a time.
+
+Usage: python -m benchmarks.bench_box_scaling [--sizes 1000,10000,100000] [--range 100]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+import algokit_utils
+
+from smart_contracts._helpers.async_algod import AsyncAlgodClient
+from smart_contracts._helpers.bulk_sender import BulkSender
+from smart_contracts._helpers.funding import ACCOUNT_MIN_BALANCE
+from smart_contracts.aidchain_contracts.async_client import AsyncAidchainContractsClient
+from smart_contracts.aidchain_contracts.deploy_config import APP_NAME
+from smart_contracts.aidchain_contracts.synthetic_data import (
+    DatasetSpec,
+    DatasetWriter,
+    existing_records,
+    plan_writes,
+)
+from smart_contracts.artifacts.aidchain_contracts.aidchain_contracts_client import (
+    AidchainContractsClient,
+    AidchainContractsFactory,
+)
+
+# Seeded apps per network and size, local to this checkout like the deploy registry.
+APPS = Path(__file__).parents[1] / ".algokit" / "box-scaling-apps.json"
+
+
+def dataset(size: int) -> DatasetSpec:
+    return DatasetSpec(
+        organizations=max(1, size // 100),
+        campaigns=max(1, size // 10),
+        milestones_per_campaign=1,
+        deliveries=size,
+    )
+
+
+async def seeded_app(
+    algorand: algokit_utils.AlgorandClient, algod: AsyncAlgodClient, size: int
+) -> AidchainContractsClient:
+    """An app holding the dataset for `size`, reused from an earlier run when it exists."""
+    sender = algorand.account.dispenser_from_environment()
+    network = algorand.client.algod.algod_address
+    apps = json.loads(APPS.read_text()) if APPS.exists() else {}
+    app_id = apps.get(network, {}).get(str(size))
+    if app_id:
+        try:
+            client = algorand.client.get_typed_app_client_by_id(
+                AidchainContractsClient, app_id=app_id, default_sender=sender.address
+            )
+            if existing_records(client)["deliveries"] == size:
+                return client
+        except Exception:
+            pass
+
+    factory = algorand.client.get_typed_app_factory(
+        AidchainContractsFactory,
+        app_name=f"{APP_NAME}-scale-{size}",
+        default_sender=sender.address,
+        compilation_params=algokit_utils.AppClientCompilationParams(updatable=False),
+    )
+    client, _ = factory.send.create.bare()
+    algorand.send.payment(
+        algokit_utils.PaymentParams(
+            sender=sender.address,
+            receiver=client.app_address,
+            amount=algokit_utils.AlgoAmount.from_micro_algo(ACCOUNT_MIN_BALANCE),
+        )
+    )
+    bulk_sender = BulkSender(algod)
+    try:
+        start = time.perf_counter()
+        sent = await DatasetWriter(client, sender, bulk_sender).write(
+            plan_writes(dataset(size), existing_records(client))
+        )
+        print(f"Seeded app {client.app_id}: {sent:,} calls in {time.perf_counter() - start:.0f}s")
+    finally:
+        await bulk_sender.confirmations.aclose()
+    apps.setdefault(network, {})[str(size)] = client.app_id
+    APPS.parent.mkdir(parents=True, exist_ok=True)
+    APPS.write_text(json.dumps(apps, indent=2) + "\n")
+    return client
+
+
+async def _timed(read: Callable[[], Awaitable[Any]]) -> float | str:
+    start = time.perf_counter()
+    try:
+        await read()
+    except Exception as error:
+        return f"failed: {str(error).splitlines()[0][:40]}"
+    return time.perf_counter() - start
+
+
+def _cell(value: float | str, records: int = 0) -> str:
+    if isinstance(value, str):
+        return value
+    per_record = f" ({value / records * 1e6:,.0f}us/rec)" if records else ""
+    return f"{value * 1000:,.1f} ms{per_record}"
+
+
+async def measure(
+    client: AidchainContractsClient,
+    size: int,
+    *,
+    range_size: int,
+    samples: int,
+    sync_limit: int,
+) -> dict[str, str]:
+    rng = random.Random(size)
+    async with AsyncAidchainContractsClient(client) as async_client:
+        deliveries = async_client.state.box.deliveries
+
+        async def sync_get_map() -> None:
+            client.state.box.deliveries.get_map()
+
+        async def details(method: str, count: int) -> float:
+            times = []
+            for _ in range(samples):
+                start = time.perf_counter()
+                getattr(client.send, method)(args=(rng.randint(1, count),))
+                times.append(time.perf_counter() - start)
+            return statistics.median(times)
+
+        first = rng.randint(1, max(1, size - range_size + 1))
+        return {
+            "list box names": _cell(
+                await _timed(lambda: async_client.algod.application_boxes(client.app_id))
+            ),
+            "get_map (sync)": (
+                _cell(await _timed(sync_get_map), size) if size <= sync_limit else "skipped"
+            ),
+            "get_map (async)": _cell(await _timed(deliveries.get_map), size),
+            f"range of {range_size}": _cell(
+                await _timed(lambda: deliveries.get_values(range(first, first + range_size))),
+                range_size,
+            ),
+            "get_delivery_details": _cell(await details("get_delivery_details", size)),
+            "get_campaign_details": _cell(
+                await details("get_campaign_details", dataset(size).campaigns)
+            ),
+        }
+
+
+async def run(args: argparse.Namespace) -> None:
+    algorand = algokit_utils.AlgorandClient.from_environment()
+    if algorand.client.is_mainnet() or algorand.client.is_testnet():
+        raise Exception("The benchmark seeds apps and only runs on localnet or a stand-in")
+    sizes = [int(size) for size in args.sizes.split(",")]
+    results: dict[int, dict[str, str]] = {}
+    async with AsyncAlgodClient.from_algod(algorand.client.algod) as algod:
+        for size in sizes:
+            client = await seeded_app(algorand, algod, size)
+            results[size] = await measure(
+                client,
+                size,
+                range_size=args.range,
+                samples=args.samples,
+                sync_limit=args.sync_limit,
+            )
+
+    columns = list(next(iter(results.values())))
+    width = max(len(cell) for row in results.values() for cell in row.values()) + 2
+    print(f"{'deliveries':>12}" + "".join(f"{column:>{width}}" for column in columns))
+    for size, row in results.items():
+        print(f"{size:>12,}" + "".join(f"{row[column]:>{width}}" for column in columns))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", default="1000,10000,100000", help="dataset sizes N")
+    parser.add_argument("--range", type=int, default=100, help="deliveries per range read")
+    parser.add_argument("--samples", type=int, default=20, help="getter calls per size")
+    parser.add_argument(
+        "--sync-limit",
+        type=int,
+        default=20_000,
+        help="largest N to time the sequential get_map for",
+    )
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
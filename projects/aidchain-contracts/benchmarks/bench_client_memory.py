@@ -0,0 +1,52 @@
+"""
+Memory benchmark for an in-memory mirror of the deliveries box map.
+
+Builds a synthetic `{delivery_id: DeliveryRecord}` mirror twice: once with plain dataclasses
+(as emitted by algokit-client-generator) and once with the slotted dataclasses the build
+post-processes the generated client into, and reports the traced allocation of each.
+
+Usage: python -m benchmarks.bench_client_memory [records]
+"""
+
+import dataclasses
+import sys
+import tracemalloc
+
+from smart_contracts.artifacts.aidchain_contracts.aidchain_contracts_client import (
+    DeliveryRecord,
+)
+
+PlainDeliveryRecord = dataclasses.make_dataclass(
+    "PlainDeliveryRecord",
+    [(field.name, field.type) for field in dataclasses.fields(DeliveryRecord)],
+    frozen=True,
+)
+
+
+def _mirror(cls: type, count: int) -> dict[int, object]:
+    return {
+        i: cls(i, f"Beneficiary {i}", f"Camp {i % 500}", f"Agent {i % 50}", i % 2)
+        for i in range(1, count + 1)
+    }
+
+
+def _traced_size(cls: type, count: int) -> int:
+    tracemalloc.start()
+    mirror = _mirror(cls, count)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del mirror
+    return size
+
+
+def main(count: int = 200_000) -> None:
+    plain = _traced_size(PlainDeliveryRecord, count)
+    slotted = _traced_size(DeliveryRecord, count)
+    print(f"{count:,} deliveries")
+    print(f"  plain dataclasses:   {plain / 2**20:>8.1f} MiB ({plain / count:.0f} B/record)")
+    print(f"  slotted dataclasses: {slotted / 2**20:>8.1f} MiB ({slotted / count:.0f} B/record)")
+    print(f"  saved: {(plain - slotted) / plain:.0%}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,56 @@
+"""
+Startup benchmark for the generated AidchainContracts client.
+
+Each run happens in a fresh interpreter, as it would for a CLI invocation or cron job, and
+measures the client module import, the first client construction plus method call (which
+parses the app spec), and a second construction plus call that reuses the memoized spec.
+No network access is needed: the call only builds transaction params.
+
+Usage: python -m benchmarks.bench_client_startup [runs]
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+
+_CHILD = """
+import json, time
+start = time.perf_counter()
+from smart_contracts.artifacts.aidchain_contracts import aidchain_contracts_client as c
+imported = time.perf_counter()
+import algokit_utils
+algorand = algokit_utils.AlgorandClient.default_localnet()
+sender = "A" * 58
+first_start = time.perf_counter()
+client = c.AidchainContractsClient(algorand=algorand, app_id=1, default_sender=sender)
+client.params.hello(args=("world",))
+first_end = time.perf_counter()
+client = c.AidchainContractsClient(algorand=algorand, app_id=2, default_sender=sender)
+client.clone(default_sender=sender).params.hello(args=("world",))
+second_end = time.perf_counter()
+print(json.dumps({
+    "import": imported - start,
+    "first call": first_end - first_start,
+    "next client + call": second_end - first_end,
+}))
+"""
+
+
+def _run_once() -> dict[str, float]:
+    result = subprocess.run(
+        [sys.executable, "-c", _CHILD], capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])  # type: ignore[no-any-return]
+
+
+def main(runs: int = 10) -> None:
+    _run_once()  # warm the bytecode cache
+    samples = [_run_once() for _ in range(runs)]
+    for phase in samples[0]:
+        median = statistics.median(sample[phase] for sample in samples)
+        print(f"{phase:<20} {median * 1000:>8.2f} ms (median of {runs})")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
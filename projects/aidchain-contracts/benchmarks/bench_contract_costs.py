@@ -0,0 +1,74 @@
+"""
+Opcode budget and fee regression gate for AidchainContracts.
+
+Runs the fixed workload of `profile_config.profile_calls` (every ABI method, in order)
+against a throwaway app on localnet through simulate, records per method the opcode budget
+consumed, box bytes read and written, inner transaction count and minimum outer fee, and
+compares them with the committed baseline. Exits with status 1 when any metric grows past
+the threshold, so it can gate contract changes in CI.
+
+Usage: python -m benchmarks.bench_contract_costs [--threshold 0.05] [--update-baseline]
+"""
+
+import argparse
+import dataclasses
+import sys
+from pathlib import Path
+
+from smart_contracts._helpers.cost_gate import (
+    METRICS,
+    MethodCosts,
+    compare,
+    load_baseline,
+    measure,
+    save_baseline,
+)
+from smart_contracts.aidchain_contracts.profile_config import traced_workload
+
+BASELINE = Path(__file__).parent / "contract_costs.json"
+
+
+def run_workload() -> dict[str, MethodCosts]:
+    source_map, workload = traced_workload()
+    return {method: measure(source_map, response) for method, response in workload}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.05,
+        help="Allowed relative growth of any metric (default 0.05)",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help=f"Record the measured costs as the new baseline in {BASELINE.name}",
+    )
+    args = parser.parse_args()
+
+    current = run_workload()
+    print(f"{'method':<26}" + "".join(f"{metric:>18}" for metric in METRICS))
+    for method, costs in current.items():
+        values = dataclasses.asdict(costs)
+        print(f"{method:<26}" + "".join(f"{values[metric]:>18}" for metric in METRICS))
+
+    if args.update_baseline:
+        save_baseline(BASELINE, current)
+        print(f"Baseline written to {BASELINE}")
+        return
+    baseline = load_baseline(BASELINE)
+    if not baseline:
+        sys.exit(f"No baseline in {BASELINE}; record one with --update-baseline")
+    regressions = compare(baseline, current, threshold=args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regressions over {args.threshold:.0%}:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+    print(f"\nNo regressions over {args.threshold:.0%} against {BASELINE.name}")
+
+
+if __name__ == "__main__":
+    main()
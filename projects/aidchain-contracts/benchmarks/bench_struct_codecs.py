@@ -0,0 +1,77 @@
+"""
+Microbenchmark for decoding struct box values.
+
+Compares the generic path used by the generated client (ABI tuple decoding followed by
+`_init_dataclass`) against the specialized functions in `aidchain_contracts_codecs`.
+
+Usage: python -m benchmarks.bench_struct_codecs [records]
+"""
+
+import random
+import string
+import sys
+import time
+from collections.abc import Callable
+
+from algokit_utils.applications.abi import get_abi_decoded_value
+
+from smart_contracts.artifacts.aidchain_contracts import aidchain_contracts_codecs
+from smart_contracts.artifacts.aidchain_contracts.aidchain_contracts_client import (
+    APP_SPEC,
+    CampaignInfo,
+    DeliveryRecord,
+    _init_dataclass,
+)
+
+
+def _text(rng: random.Random, max_length: int) -> str:
+    return "".join(rng.choices(string.ascii_letters + " ", k=rng.randint(0, max_length)))
+
+
+def _records(count: int) -> dict[str, list[bytes]]:
+    rng = random.Random(42)
+    campaigns = [
+        aidchain_contracts_codecs.encode_campaign_info(
+            CampaignInfo(i, _text(rng, 64), rng.randint(1, 10**9), 0, _text(rng, 32), 1)
+        )
+        for i in range(count)
+    ]
+    deliveries = [
+        aidchain_contracts_codecs.encode_delivery_record(
+            DeliveryRecord(i, _text(rng, 32), _text(rng, 48), _text(rng, 24), i % 2)
+        )
+        for i in range(count)
+    ]
+    return {"CampaignInfo": campaigns, "DeliveryRecord": deliveries}
+
+
+def _generic_decoder(struct_name: str) -> Callable[[bytes], object]:
+    cls = {"CampaignInfo": CampaignInfo, "DeliveryRecord": DeliveryRecord}[struct_name]
+
+    def decode(value: bytes) -> object:
+        return _init_dataclass(
+            cls, get_abi_decoded_value(value, struct_name, APP_SPEC.structs)  # type: ignore[arg-type]
+        )
+
+    return decode
+
+
+def _rate(decode: Callable[[bytes], object], values: list[bytes]) -> float:
+    start = time.perf_counter()
+    for value in values:
+        decode(value)
+    return len(values) / (time.perf_counter() - start)
+
+
+def main(count: int = 50_000) -> None:
+    for struct_name, values in _records(count).items():
+        generic = _rate(_generic_decoder(struct_name), values)
+        specialized = _rate(aidchain_contracts_codecs.DECODERS[struct_name], values)
+        print(
+            f"{struct_name:<16} generic: {generic:>12,.0f} rec/s   "
+            f"codecs: {specialized:>12,.0f} rec/s   speedup: {specialized / generic:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Roll out AidchainContracts to a fleet of app instances.
+
+Targets (one app per region/partner) are listed in a TOML manifest, see
+fleet.example.toml. Deploys run concurrently with bounded parallelism; per-target status
+is kept in .algokit/fleet-rollout.json so re-running the same rollout only retries the
+targets that did not succeed.
+
+Usage:
+    python deploy_fleet.py fleet.toml                        # deploy every target
+    python deploy_fleet.py fleet.toml --max-parallel 16      # more deploys in flight
+    python deploy_fleet.py fleet.toml --only eu-redcross     # selected targets
+    python deploy_fleet.py fleet.toml --on-update UpdateApp  # update targets in place
+    python deploy_fleet.py fleet.toml --status               # report without deploying
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+import algokit_utils
+from dotenv import load_dotenv
+
+# The deploy settings (AIDCHAIN_DEPLOY_FAST, AIDCHAIN_SHARDS) are read when deploy_config is
+# imported, so .env has to be loaded before that.
+load_dotenv()
+
+from smart_contracts._helpers.deploy_registry import Deployment, program_hash  # noqa: E402
+from smart_contracts._helpers.fleet import (  # noqa: E402
+    FleetTarget,
+    RolloutLog,
+    format_report,
+    load_manifest,
+    rollout,
+)
+from smart_contracts.aidchain_contracts import deploy_config  # noqa: E402
+
+ROLLOUT_LOG = Path(__file__).parent / ".algokit" / "fleet-rollout.json"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Deploy AidchainContracts to many targets")
+    parser.add_argument("manifest", type=Path, help="TOML manifest of fleet targets")
+    parser.add_argument("--max-parallel", type=int, default=8, help="deploys in flight")
+    parser.add_argument(
+        "--max-failures", type=int, help="stop starting new deploys after this many failures"
+    )
+    parser.add_argument("--only", nargs="+", metavar="NAME", help="targets to roll out")
+    parser.add_argument(
+        "--on-update",
+        choices=[member.name for member in algokit_utils.OnUpdate],
+        default="AppendApp",
+        help="what to do when a target's programs changed; UpdateApp deploys targets "
+        "updatable (TMPL_UPDATABLE) so they can be updated in place",
+    )
+    parser.add_argument(
+        "--restart", action="store_true", help="redeploy targets that already succeeded"
+    )
+    parser.add_argument("--status", action="store_true", help="report status and exit")
+    return parser.parse_args()
+
+
+def main(args: argparse.Namespace) -> int:
+    targets = load_manifest(args.manifest)
+    if args.only:
+        unknown = set(args.only) - {target.name for target in targets}
+        if unknown:
+            raise Exception(f"Unknown fleet targets: {', '.join(sorted(unknown))}")
+        targets = [target for target in targets if target.name in args.only]
+
+    log = RolloutLog(ROLLOUT_LOG)
+    if args.status:
+        print(format_report({target.name: log.get(target.name) for target in targets}))
+        return 0
+
+    artifacts_dir = deploy_config.artifacts_dir
+    revision = ":".join(
+        program_hash(artifacts_dir / f"{deploy_config.APP_NAME}.{program}.teal")
+        for program in ("approval", "clear")
+    )
+
+    on_update = algokit_utils.OnUpdate[args.on_update]
+
+    def deploy_target(target: FleetTarget) -> tuple[Deployment, str]:
+        return deploy_config.deploy_app(
+            target.algorand(),
+            app_name=target.app_name,
+            deployer=target.deployer,
+            on_update=on_update,
+        )
+
+    statuses = rollout(
+        targets,
+        deploy_target,
+        log,
+        revision=revision,
+        max_parallel=args.max_parallel,
+        max_failures=args.max_failures,
+        resume=not args.restart,
+    )
+    print(format_report(statuses))
+    return 0 if all(status.state == "succeeded" for status in statuses.values()) else 1
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s")
+    sys.exit(main(parse_args()))
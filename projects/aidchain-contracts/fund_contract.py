@@ -1,45 +1,104 @@
 #!/usr/bin/env python3
+"""
+Balance watchdog for AidchainContracts app accounts.
 
-import algokit_utils
+Inner transactions (create_voucher_asset, release_milestone_funds) and new boxes steadily
+consume app balances. This daemon tracks each managed app's spendable balance and burn
+rate and tops up every app that would fall under the floor within the lead time, batching
+payments into atomic groups. Metrics (balances, burn rates, runway) are served in
+Prometheus format.
+
+Usage:
+    python fund_contract.py                  # watch all apps recorded by deploys to this network
+    python fund_contract.py 1001 1002        # watch specific app IDs
+    python fund_contract.py --once 1001      # single top-up pass and exit
+"""
+
+import argparse
+import asyncio
 import logging
 
-def fund_contract():
-    logging.basicConfig(level=logging.INFO)
+import algokit_utils
+
+from smart_contracts._helpers.app_deploy import deploy_registry
+from smart_contracts._helpers.async_algod import AsyncAlgodClient
+from smart_contracts._helpers.balance_watchdog import BalanceWatchdog, TopUpPolicy, serve_metrics
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Keep AidchainContracts app accounts funded")
+    parser.add_argument(
+        "app_ids", nargs="*", type=int, help="apps to manage (default: deploy registry)"
+    )
+    parser.add_argument("--once", action="store_true", help="run a single top-up pass and exit")
+    parser.add_argument("--interval", type=float, default=60.0, help="seconds between polls")
+    parser.add_argument(
+        "--metrics-port", type=int, default=9102, help="0 disables the metrics endpoint"
+    )
+    parser.add_argument(
+        "--floor", type=int, default=TopUpPolicy.floor, help="minimum spendable microALGO"
+    )
+    parser.add_argument(
+        "--lead-time",
+        type=float,
+        default=TopUpPolicy.lead_time,
+        help="top up when the runway in seconds is below this",
+    )
+    parser.add_argument(
+        "--target-runway",
+        type=float,
+        default=TopUpPolicy.target_runway,
+        help="runway in seconds to top up to",
+    )
+    return parser.parse_args()
+
+
+async def fund_contracts(args: argparse.Namespace) -> None:
     logger = logging.getLogger(__name__)
-    
-    # Connect to LocalNet
+
     algorand = algokit_utils.AlgorandClient.from_environment()
     deployer = algorand.account.from_environment("DEPLOYER")
-    
-    contract_address = "H3V4Y43YUBL6LJPSHXBNQJAJANK7ZT4ZUGLGH3YDFZ2T7KCFIEYS6M72QI"
-    
-    logger.info(f"Deployer: {deployer.address}")
-    logger.info(f"Contract: {contract_address}")
-    
-    # Check deployer balance
-    deployer_info = algorand.account.get_information(deployer.address)
-    logger.info(f"Deployer balance: {deployer_info.amount.micro_algo / 1_000_000:.2f} ALGO")
-    
-    # Check contract balance before
-    contract_info = algorand.account.get_information(contract_address)
-    logger.info(f"Contract balance before: {contract_info.amount.micro_algo / 1_000_000:.6f} ALGO")
-    
-    # Fund the contract with 1 ALGO
-    result = algorand.send.payment(
-        algokit_utils.PaymentParams(
-            sender=deployer.address,
-            receiver=contract_address,
-            amount=algokit_utils.AlgoAmount.from_micro_algo(1_000_000)  # 1 ALGO in microALGOs
+
+    # Default to the apps recorded by deploys to this network
+    app_ids = args.app_ids or [
+        deployment.app_id
+        for deployment in deploy_registry.deployments(algorand.client.algod.algod_address).values()
+    ]
+    if not app_ids:
+        raise Exception("No deployments recorded for this network, pass app IDs")
+
+    async def send_payments(payments: list[tuple[str, int]]) -> None:
+        group = algorand.new_group()
+        for receiver, amount in payments:
+            group.add_payment(
+                algokit_utils.PaymentParams(
+                    sender=deployer.address,
+                    receiver=receiver,
+                    amount=algokit_utils.AlgoAmount.from_micro_algo(amount),
+                )
+            )
+        await asyncio.to_thread(group.send)
+
+    async with AsyncAlgodClient.from_algod(algorand.client.algod) as algod:
+        watchdog = BalanceWatchdog(
+            algod,
+            send_payments,
+            app_ids,
+            TopUpPolicy(
+                floor=args.floor, lead_time=args.lead_time, target_runway=args.target_runway
+            ),
         )
-    )
-    
-    logger.info(f"✅ Payment sent successfully!")
-    
-    # Check contract balance after
-    contract_info_after = algorand.account.get_information(contract_address)
-    logger.info(f"Contract balance after: {contract_info_after.amount.micro_algo / 1_000_000:.6f} ALGO")
-    
-    return True
+        logger.info(f"Funding from {deployer.address}, managing {len(app_ids)} apps")
+        if args.once:
+            await watchdog.poll()
+            print(watchdog.metrics(), end="")
+            return
+        if args.metrics_port:
+            serve_metrics(watchdog, args.metrics_port)
+            logger.info(f"Serving metrics on :{args.metrics_port}/metrics")
+        await watchdog.run(args.interval)
+
 
 if __name__ == "__main__":
-    fund_contract()
\ No newline at end of file
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(fund_contracts(parse_args()))
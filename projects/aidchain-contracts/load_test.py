@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Throughput and latency load generator for AidchainContracts.
+
+Sends an open-loop stream of calls (Poisson arrivals at --rate calls per second for
+--duration seconds) drawn from a weighted method mix to one app, spread over --senders
+funded accounts and packed into atomic groups of up to --group-size. Readonly getters are
+simulated. Prints calls/sec and confirmation latency percentiles per method, rejected
+calls with their reasons and the fees paid. Runs against the algod of the environment
+(localnet or a local stand-in), never against testnet or mainnet.
+
+With --replay, the calls of a log written by RecordingAidchainContractsClient are
+re-issued instead, at the recorded pace sped up by --speed (or as fast as possible with
+--speed max), e.g. to reproduce a donation spike. The recorded durations are reported
+next to the replay's.
+
+Usage:
+    python load_test.py                                   # 50 calls/s for 30 s, default mix
+    python load_test.py --rate 200 --group-size 8 --senders 16
+    python load_test.py --mix create_donation=3,log_delivery=1,get_campaign_details=2
+    python load_test.py --app-id 1001                     # load an existing app
+    python load_test.py --replay spike.calllog --speed 10  # replay recorded traffic
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import random
+from collections import Counter
+from pathlib import Path
+
+import algokit_utils
+from dotenv import load_dotenv
+
+from smart_contracts._helpers.async_algod import AsyncAlgodClient
+from smart_contracts._helpers.call_log import read_call_log
+from smart_contracts._helpers.funding import MIN_TXN_FEE, plan_funding
+from smart_contracts._helpers.load_generator import (
+    arrival_times,
+    format_report,
+    parse_mix,
+    run_open_loop,
+)
+from smart_contracts._helpers.localnet_workers import MAX_GROUP_SIZE
+from smart_contracts.aidchain_contracts.async_client import AsyncAidchainContractsClient
+from smart_contracts.aidchain_contracts.call_recording import (
+    CallReplay,
+    recorded_stats,
+    replay_usage,
+)
+from smart_contracts.aidchain_contracts.deploy_config import APP_NAME, artifacts_dir
+from smart_contracts.aidchain_contracts.load_workload import (
+    AidchainLoad,
+    default_mix,
+    expected_records,
+    supported_methods,
+)
+from smart_contracts.aidchain_contracts.synthetic_data import existing_records
+from smart_contracts.artifacts.aidchain_contracts.aidchain_contracts_client import (
+    AidchainContractsClient,
+    AidchainContractsFactory,
+)
+
+logger = logging.getLogger(__name__)
+
+# Balance each sender keeps on top of the fees it is expected to pay.
+sender_reserve = 1_000_000
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load test an AidchainContracts app")
+    parser.add_argument("--rate", type=float, default=50.0, help="calls per second")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds to send for")
+    parser.add_argument(
+        "--mix",
+        default=",".join(f"{method}={weight}" for method, weight in default_mix.items()),
+        help=f"method=weight list, methods from: {', '.join(supported_methods)}",
+    )
+    parser.add_argument("--senders", type=int, default=4, help="sender accounts to spread over")
+    parser.add_argument("--group-size", type=int, default=1, help="calls per atomic group")
+    parser.add_argument(
+        "--linger", type=float, default=10.0, help="ms to wait for a group to fill"
+    )
+    parser.add_argument(
+        "--fixed-arrivals", action="store_true", help="evenly spaced instead of Poisson arrivals"
+    )
+    parser.add_argument(
+        "--box-slack",
+        type=int,
+        default=3,
+        help="IDs either side of the expected one a create references boxes for",
+    )
+    parser.add_argument("--app-id", type=int, help="existing app to load (default: a new one)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed for arrivals and mix")
+    parser.add_argument("--replay", type=Path, help="call log to replay instead of a mix")
+    parser.add_argument(
+        "--speed",
+        type=lambda value: math.inf if value == "max" else float(value),
+        default=1.0,
+        help="replay speed-up, e.g. 1, 10 or max",
+    )
+    return parser.parse_args()
+
+
+def fund_senders(
+    algorand: algokit_utils.AlgorandClient, count: int, amount: int
+) -> list[algokit_utils.SigningAccount]:
+    dispenser = algorand.account.dispenser_from_environment()
+    senders = [algorand.account.random() for _ in range(count)]
+    for start in range(0, count, MAX_GROUP_SIZE):
+        group = algorand.new_group()
+        for sender in senders[start : start + MAX_GROUP_SIZE]:
+            group.add_payment(
+                algokit_utils.PaymentParams(
+                    sender=dispenser.address,
+                    receiver=sender.address,
+                    amount=algokit_utils.AlgoAmount.from_micro_algo(amount),
+                )
+            )
+        group.send()
+    return senders
+
+
+def create_app(
+    algorand: algokit_utils.AlgorandClient,
+    boxes: dict[str, int],
+    *,
+    created_assets: int = 0,
+    inner_txns: int = 0,
+    setup_calls: bool = True,
+) -> AidchainContractsClient:
+    """A new app funded for `boxes` records per box map, owned by the dispenser."""
+    dispenser = algorand.account.dispenser_from_environment()
+    factory = algorand.client.get_typed_app_factory(
+        AidchainContractsFactory,
+        app_name=f"{APP_NAME}-load",
+        default_sender=dispenser.address,
+        compilation_params=algokit_utils.AppClientCompilationParams(updatable=False),
+    )
+    app_client, _ = factory.send.create.bare()
+    app_spec = json.loads((artifacts_dir / f"{APP_NAME}.arc56.json").read_text())
+    funding = plan_funding(
+        app_spec, boxes=boxes, created_assets=created_assets, inner_txns=inner_txns
+    )
+    algorand.send.payment(
+        algokit_utils.PaymentParams(
+            sender=dispenser.address,
+            receiver=app_client.app_address,
+            amount=algokit_utils.AlgoAmount.from_micro_algo(funding.required),
+        )
+    )
+    if setup_calls:
+        # Calls on existing records need at least one of each.
+        app_client.send.register_organization(args=("Load org", dispenser.address))
+        app_client.send.create_campaign(args=("Load campaign", 10_000, "load"))
+        app_client.send.log_delivery(args=("Family 0", "Camp B"))
+    return app_client
+
+
+async def replay(algorand: algokit_utils.AlgorandClient, args: argparse.Namespace) -> None:
+    header, calls = read_call_log(args.replay)
+    records = list(calls)
+    calls_per_sender = Counter(record.sender for record in records)
+    senders = fund_senders(
+        algorand,
+        len(calls_per_sender),
+        max(calls_per_sender.values(), default=0) * MIN_TXN_FEE + sender_reserve,
+    )
+    if args.app_id:
+        app_client = algorand.client.get_typed_app_client_by_id(
+            AidchainContractsClient, app_id=args.app_id
+        )
+    else:
+        usage = replay_usage(records)
+        app_client = create_app(
+            algorand,
+            usage["boxes"],
+            created_assets=usage["created_assets"],
+            inner_txns=usage["inner_txns"],
+            setup_calls=False,
+        )
+    recorded = header.metadata.get("records", {})
+    current = existing_records(app_client)
+    if any(current.get(kind, 0) != count for kind, count in recorded.items()):
+        logger.warning(
+            f"App {app_client.app_id} holds {current} records, the recorded app held "
+            f"{recorded}; calls referring to record IDs may be rejected"
+        )
+    speed = "maximum speed" if math.isinf(args.speed) else f"{args.speed:g}x speed"
+    logger.info(
+        f"Replaying {len(records)} calls from {len(senders)} senders to app "
+        f"{app_client.app_id} at {speed}"
+    )
+
+    async with AsyncAidchainContractsClient(app_client) as async_client:
+        call_replay = CallReplay(
+            async_client,
+            {original: sender.address for original, sender in zip(calls_per_sender, senders)},
+        )
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await call_replay.run(records, speed=args.speed)
+        elapsed = loop.time() - start
+    recorded_span = max((record.offset for record in records), default=0.0) - min(
+        (record.offset for record in records), default=0.0
+    )
+    print("Recorded:")
+    print(format_report(recorded_stats(records), max(recorded_span, 1e-3), summary=False))
+    print()
+    print("Replayed:")
+    print(format_report(call_replay.stats, elapsed))
+
+
+async def load_test(args: argparse.Namespace) -> None:
+    algorand = algokit_utils.AlgorandClient.from_environment()
+    if algorand.client.is_mainnet() or algorand.client.is_testnet():
+        raise Exception("Load tests only run against localnet or a local algod stand-in")
+    if args.replay:
+        await replay(algorand, args)
+        return
+
+    mix = parse_mix(args.mix)
+    rng = random.Random(args.seed)
+    arrivals = arrival_times(args.rate, args.duration, rng=rng, poisson=not args.fixed_arrivals)
+    senders = fund_senders(
+        algorand,
+        args.senders,
+        len(arrivals) * MIN_TXN_FEE // args.senders + sender_reserve,
+    )
+    if args.app_id:
+        app_client = algorand.client.get_typed_app_client_by_id(
+            AidchainContractsClient, app_id=args.app_id
+        )
+    else:
+        # 20% headroom over the expected creates for the randomness of the mix.
+        expected = expected_records(mix, len(arrivals))
+        app_client = create_app(
+            algorand, {kind: count * 6 // 5 + 10 for kind, count in expected.items()}
+        )
+    state = app_client.state.global_state
+    existing = {
+        "organizations": state.organization_counter,
+        "campaigns": state.campaign_counter,
+        "deliveries": state.delivery_counter,
+    }
+    logger.info(
+        f"Sending {len(arrivals)} calls over {args.duration:.0f}s to app {app_client.app_id} "
+        f"from {len(senders)} senders, groups of up to {args.group_size}"
+    )
+
+    async with AsyncAlgodClient.from_algod(algorand.client.algod) as algod:
+        load = AidchainLoad(
+            app_client,
+            algod,
+            [sender.address for sender in senders],
+            rng=rng,
+            group_size=args.group_size,
+            linger=args.linger / 1000,
+            box_slack=args.box_slack,
+        )
+        load.seed(existing)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        load.stats.max_lag = await run_open_loop(arrivals, mix, load.arrive, rng=rng)
+        await load.drain()
+        print(format_report(load.stats, loop.time() - start))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    load_dotenv()
+    asyncio.run(load_test(parse_args()))
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Fleet-wide AidchainContracts statistics.
+
+Reads the global state counters (campaigns, organizations, donations, deliveries,
+vouchers, milestones) of many app instances concurrently and prints their totals.
+
+Usage:
+    python query_fleet_stats.py                   # AidchainContracts apps deployed to this network
+    python query_fleet_stats.py 1001 1002 1003    # specific app IDs
+    python query_fleet_stats.py --per-app         # include one row per app
+    python query_fleet_stats.py --json            # machine-readable output
+    python query_fleet_stats.py --interval 10     # refresh every 10 seconds
+"""
+
+import argparse
+import asyncio
+import json
+
+import algokit_utils
+from dotenv import load_dotenv
+
+from smart_contracts._helpers.app_deploy import deploy_registry
+from smart_contracts._helpers.async_algod import AsyncAlgodClient
+from smart_contracts.aidchain_contracts.fleet_stats import (
+    FleetSnapshot,
+    FleetStats,
+    fleet_app_ids,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Aggregate AidchainContracts global state")
+    parser.add_argument(
+        "app_ids", nargs="*", type=int, help="apps to query (default: deploy registry)"
+    )
+    parser.add_argument("--per-app", action="store_true", help="also print each app's counters")
+    parser.add_argument("--json", action="store_true", help="print JSON")
+    parser.add_argument("--interval", type=float, help="refresh every this many seconds")
+    parser.add_argument(
+        "--max-concurrency", type=int, default=32, help="algod requests in flight"
+    )
+    return parser.parse_args()
+
+
+def format_snapshot(snapshot: FleetSnapshot, *, per_app: bool) -> str:
+    lines = [f"{len(snapshot.per_app)} apps"]
+    lines += [f"  {name:<28} {value:>14,}" for name, value in sorted(snapshot.totals.items())]
+    if per_app:
+        for app_id, state in sorted(snapshot.per_app.items()):
+            counters = ", ".join(f"{name}={value}" for name, value in state.items())
+            lines.append(f"  app {app_id}: {counters}")
+    lines += [
+        f"  app {app_id} unavailable: {error}" for app_id, error in snapshot.unavailable.items()
+    ]
+    return "\n".join(lines)
+
+
+async def query(args: argparse.Namespace) -> None:
+    algorand = algokit_utils.AlgorandClient.from_environment()
+    app_ids = args.app_ids or fleet_app_ids(
+        deploy_registry.deployments(algorand.client.algod.algod_address)
+    )
+    if not app_ids:
+        raise Exception("No deployments recorded for this network, pass app IDs")
+
+    async with AsyncAlgodClient.from_algod(algorand.client.algod) as algod:
+        stats = FleetStats(algod, max_concurrency=args.max_concurrency)
+        while True:
+            snapshot = await stats.snapshot(app_ids)
+            if args.json:
+                print(
+                    json.dumps(
+                        {
+                            "totals": snapshot.totals,
+                            "per_app": snapshot.per_app if args.per_app else None,
+                            "unavailable": snapshot.unavailable,
+                        }
+                    )
+                )
+            else:
+                print(format_snapshot(snapshot, per_app=args.per_app))
+            if not args.interval:
+                return
+            await asyncio.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    asyncio.run(query(parse_args()))
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Synthetic dataset generator for AidchainContracts.
+
+Fills an app with realistic synthetic records for scale testing: organizations, campaigns
+with their milestones and deliveries, a share of them verified, with string lengths drawn
+from configurable distributions. Calls are pre-encoded, packed 15 per atomic group with a
+payment for the boxes they create and submitted back to back without waiting for each
+group to confirm. Runs against the algod of the environment (localnet or a local
+stand-in), never against testnet or mainnet.
+
+Usage:
+    python seed_dataset.py                       # 2k orgs, 20k campaigns, 1M deliveries
+    python seed_dataset.py --deliveries 50000 --campaigns 1000
+    python seed_dataset.py --length title=uniform:8:200 --length location=64
+    python seed_dataset.py --app-id 1001         # append to an existing app
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+import algokit_utils
+from dotenv import load_dotenv
+
+from smart_contracts._helpers.async_algod import AsyncAlgodClient
+from smart_contracts._helpers.bulk_sender import BulkSender
+from smart_contracts._helpers.funding import ACCOUNT_MIN_BALANCE
+from smart_contracts.aidchain_contracts.deploy_config import APP_NAME
+from smart_contracts.aidchain_contracts.synthetic_data import (
+    DatasetSpec,
+    DatasetWriter,
+    Lengths,
+    default_lengths,
+    existing_records,
+    plan_writes,
+)
+from smart_contracts.artifacts.aidchain_contracts.aidchain_contracts_client import (
+    AidchainContractsClient,
+    AidchainContractsFactory,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def parse_args() -> argparse.Namespace:
+    defaults = DatasetSpec()
+    parser = argparse.ArgumentParser(description="Fill an AidchainContracts app with test data")
+    parser.add_argument("--organizations", type=int, default=defaults.organizations)
+    parser.add_argument("--campaigns", type=int, default=defaults.campaigns)
+    parser.add_argument(
+        "--milestones-per-campaign", type=int, default=defaults.milestones_per_campaign
+    )
+    parser.add_argument("--deliveries", type=int, default=defaults.deliveries)
+    parser.add_argument(
+        "--verified",
+        type=float,
+        default=defaults.verified_fraction,
+        help="share of deliveries that are verified",
+    )
+    parser.add_argument(
+        "--length",
+        action="append",
+        default=[],
+        metavar="FIELD=SPEC",
+        help=(
+            "string length distribution, SPEC is N, uniform:LOW:HIGH or lognormal:MEDIAN:SIGMA; "
+            f"fields: {', '.join(default_lengths)}"
+        ),
+    )
+    parser.add_argument("--app-id", type=int, help="existing app to append to (default: a new one)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed for the generated data")
+    parser.add_argument(
+        "--max-in-flight", type=int, default=500, help="unconfirmed groups at any time"
+    )
+    return parser.parse_args()
+
+
+def dataset_spec(args: argparse.Namespace) -> DatasetSpec:
+    lengths = dict(default_lengths)
+    for item in args.length:
+        field, _, spec = item.partition("=")
+        if field not in lengths:
+            raise Exception(f"Unknown string field {field}, choose from {list(default_lengths)}")
+        lengths[field] = Lengths.parse(spec)
+    return DatasetSpec(
+        organizations=args.organizations,
+        campaigns=args.campaigns,
+        milestones_per_campaign=args.milestones_per_campaign,
+        deliveries=args.deliveries,
+        verified_fraction=args.verified,
+        lengths=lengths,
+        seed=args.seed,
+    )
+
+
+def create_app(
+    algorand: algokit_utils.AlgorandClient, sender: algokit_utils.SigningAccount
+) -> AidchainContractsClient:
+    factory = algorand.client.get_typed_app_factory(
+        AidchainContractsFactory,
+        app_name=f"{APP_NAME}-dataset",
+        default_sender=sender.address,
+        compilation_params=algokit_utils.AppClientCompilationParams(updatable=False),
+    )
+    app_client, _ = factory.send.create.bare()
+    # Each group of the dataset pays for its own boxes; the account itself needs this.
+    algorand.send.payment(
+        algokit_utils.PaymentParams(
+            sender=sender.address,
+            receiver=app_client.app_address,
+            amount=algokit_utils.AlgoAmount.from_micro_algo(ACCOUNT_MIN_BALANCE),
+        )
+    )
+    return app_client
+
+
+async def seed(args: argparse.Namespace) -> None:
+    algorand = algokit_utils.AlgorandClient.from_environment()
+    if algorand.client.is_mainnet() or algorand.client.is_testnet():
+        raise Exception("Synthetic data is only written to localnet or a local algod stand-in")
+    spec = dataset_spec(args)
+    sender = algorand.account.dispenser_from_environment()
+    if args.app_id:
+        app_client = algorand.client.get_typed_app_client_by_id(
+            AidchainContractsClient, app_id=args.app_id, default_sender=sender.address
+        )
+    else:
+        app_client = create_app(algorand, sender)
+    existing = existing_records(app_client)
+    logger.info(f"Writing {spec.writes:,} calls to app {app_client.app_id} (holds {existing})")
+
+    start = time.perf_counter()
+
+    def progress(sent: int) -> None:
+        if sent % 15_000 == 0:
+            rate = sent / (time.perf_counter() - start)
+            logger.info(f"{sent:,} / ~{spec.writes:,} calls sent ({rate:,.0f}/s)")
+
+    async with AsyncAlgodClient.from_algod(algorand.client.algod) as algod:
+        bulk_sender = BulkSender(algod, max_in_flight=args.max_in_flight)
+        writer = DatasetWriter(app_client, sender, bulk_sender)
+        try:
+            sent = await writer.write(plan_writes(spec, existing), progress)
+        finally:
+            await bulk_sender.confirmations.aclose()
+    elapsed = time.perf_counter() - start
+    logger.info(f"Wrote {sent:,} calls in {elapsed:.0f}s ({sent / elapsed:,.0f}/s)")
+    print(existing_records(app_client))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    load_dotenv()
+    asyncio.run(seed(parse_args()))
@@ -1,15 +1,31 @@
 import dataclasses
 import importlib
 import logging
+import os
 import subprocess
 import sys
+import time
 from collections.abc import Callable
+from concurrent.futures import FIRST_EXCEPTION, ProcessPoolExecutor, wait
 from pathlib import Path
 from shutil import rmtree
 
+import algokit_utils
 from algokit_utils.config import config
 from dotenv import load_dotenv
 
+from smart_contracts._helpers import client_postprocess, struct_codecs
+from smart_contracts._helpers.build_cache import (
+    BuildCache,
+    client_generator_version,
+    compiler_version,
+    contract_sources,
+)
+from smart_contracts._helpers.client_postprocess import postprocess_client
+from smart_contracts._helpers.struct_codecs import generate_codecs, snake_case
+from smart_contracts._helpers.teal_analyzer import TealAnalysis, format_report
+from smart_contracts._helpers.watch import watch_files
+
 # Set trace_all to True to capture all transactions, defaults to capturing traces only on failure
 # Learn more about using AlgoKit AVM Debugger to debug your TEAL source codes and inspect various kinds of
 # Algorand transactions in atomic groups -> https://github.com/algorandfoundation/algokit-avm-vscode-debugger
@@ -33,7 +49,8 @@ root_path = Path(__file__).parent
 class SmartContract:
     path: Path
     name: str
-    deploy: Callable[[], None] | None = None
+    deploy: Callable[..., None] | None = None
+    profile: Callable[..., None] | None = None
 
 
 def import_contract(folder: Path) -> Path:
@@ -45,7 +62,7 @@ def import_contract(folder: Path) -> Path:
         raise Exception(f"Contract not found in {folder}")
 
 
-def import_deploy_if_exists(folder: Path) -> Callable[[], None] | None:
+def import_deploy_if_exists(folder: Path) -> Callable[..., None] | None:
     """Imports the deploy function from a folder if it exists."""
     try:
         module_name = f"{folder.parent.name}.{folder.name}.deploy_config"
@@ -55,6 +72,16 @@ def import_deploy_if_exists(folder: Path) -> Callable[[], None] | None:
         return None
 
 
+def import_profile_if_exists(folder: Path) -> Callable[..., None] | None:
+    """Imports the opcode profile function from a folder if it exists."""
+    try:
+        module_name = f"{folder.parent.name}.{folder.name}.profile_config"
+        profile_module = importlib.import_module(module_name)
+        return profile_module.profile  # type: ignore[no-any-return, misc]
+    except ImportError:
+        return None
+
+
 def has_contract_file(directory: Path) -> bool:
     """Checks whether the directory contains a contract.py file."""
     return (directory / "contract.py").exists()
@@ -67,6 +94,7 @@ contracts: list[SmartContract] = [
         path=import_contract(folder),
         name=folder.name,
         deploy=import_deploy_if_exists(folder),
+        profile=import_profile_if_exists(folder),
     )
     for folder in root_path.iterdir()
     if folder.is_dir() and has_contract_file(folder) and not folder.name.startswith("_")
@@ -76,6 +104,25 @@ contracts: list[SmartContract] = [
 
 deployment_extension = "py"
 
+# Post-processing of generated Python clients: emit struct and `*Args` dataclasses
+# with `__slots__` (and optionally keep them frozen) to shrink large in-memory mirrors,
+# and parse the embedded app spec lazily, once per process, instead of at import time.
+client_dataclass_slots = True
+client_dataclass_frozen = True
+client_lazy_app_spec = True
+
+# Content-addressed build cache: unchanged contracts (same sources, compiler version and
+# build settings) are restored from here instead of being recompiled.
+# Set AIDCHAIN_BUILD_CACHE=0 to always rebuild.
+build_cache_enabled = os.getenv("AIDCHAIN_BUILD_CACHE", "1") != "0"
+build_cache = BuildCache(root_path.parent / ".algokit" / "build-cache")
+
+compile_flags = ["--no-output-arc32", "--output-arc56", "--output-source-map"]
+
+# Number of contracts compiled concurrently when building more than one contract.
+# Defaults to one per CPU; set AIDCHAIN_BUILD_JOBS=1 to build sequentially.
+build_jobs = int(os.getenv("AIDCHAIN_BUILD_JOBS", "0")) or os.cpu_count() or 1
+
 
 def _get_output_path(output_dir: Path, deployment_extension: str) -> Path:
     """Constructs the output path for the generated client file."""
@@ -86,12 +133,49 @@ def _get_output_path(output_dir: Path, deployment_extension: str) -> Path:
     )
 
 
+def _build_key(contract_path: Path) -> str:
+    """Hashes everything that determines the build output of a contract."""
+    return build_cache.key(
+        [
+            *contract_sources(contract_path),
+            Path(client_postprocess.__file__),
+            Path(struct_codecs.__file__),
+        ],
+        root_path.parent,
+        compiler=compiler_version(),
+        client_generator=client_generator_version(),
+        compile_flags=compile_flags,
+        deployment_extension=deployment_extension,
+        client_dataclass_slots=client_dataclass_slots,
+        client_dataclass_frozen=client_dataclass_frozen,
+        client_lazy_app_spec=client_lazy_app_spec,
+    )
+
+
+def _build_result(output_dir: Path) -> Path:
+    app_spec_file = next(output_dir.glob("*.arc56.json"), None)
+    return app_spec_file or output_dir
+
+
 def build(output_dir: Path, contract_path: Path) -> Path:
     """
     Builds the contract by exporting (compiling) its source and generating a client.
-    If the output directory already exists, it is cleared.
+    Unchanged contracts are restored from the build cache instead; otherwise the output
+    directory is cleared and rebuilt, and the result is added to the cache.
     """
     output_dir = output_dir.resolve()
+    if not build_cache_enabled:
+        return _build(output_dir, contract_path)
+    key = _build_key(contract_path)
+    if build_cache.restore(key, output_dir):
+        logger.info(f"Restored {contract_path} from build cache ({key[:12]})")
+        return _build_result(output_dir)
+    result = _build(output_dir, contract_path)
+    build_cache.store(key, output_dir)
+    return result
+
+
+def _build(output_dir: Path, contract_path: Path) -> Path:
     if output_dir.exists():
         rmtree(output_dir)
     output_dir.mkdir(exist_ok=True, parents=True)
@@ -105,9 +189,7 @@ def build(output_dir: Path, contract_path: Path) -> Path:
             "python",
             str(contract_path.resolve()),
             f"--out-dir={output_dir}",
-            "--no-output-arc32",
-            "--output-arc56",
-            "--output-source-map",
+            *compile_flags,
         ],
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
@@ -152,15 +234,122 @@ def build(output_dir: Path, contract_path: Path) -> Path:
                     raise Exception(
                         f"Could not generate typed client:\n{generate_result.stdout}"
                     )
+            if deployment_extension == "py":
+                postprocess_client(
+                    output_dir / f"{snake_case(file_name.split('.')[0])}_client.py",
+                    slots=client_dataclass_slots,
+                    frozen=client_dataclass_frozen,
+                    lazy_spec=client_lazy_app_spec,
+                )
+                codecs_file = generate_codecs(output_dir / file_name, output_dir)
+                logger.info(f"Generated struct codecs {codecs_file.name}")
     if client_file:
         return output_dir / client_file
     return output_dir
 
 
+def _build_contract(name: str, output_dir: Path, contract_path: Path) -> Path:
+    """Process pool entry point: builds one contract, tagging its log lines with its name."""
+    for handler in logging.getLogger().handlers:
+        handler.setFormatter(
+            logging.Formatter(f"%(asctime)s %(levelname)-10s: [{name}] %(message)s")
+        )
+    logger.info(f"Building app at {contract_path}")
+    return build(output_dir, contract_path)
+
+
+def build_contracts(artifact_path: Path, contracts: list[SmartContract]) -> None:
+    """
+    Builds contracts in parallel with a process pool.
+    The first failure cancels the builds that have not started yet and is re-raised. Builds
+    already running are not interrupted: they finish in their workers, which the interpreter
+    still waits for before it exits.
+    """
+    if len(contracts) <= 1 or build_jobs == 1:
+        for contract in contracts:
+            logger.info(f"Building app at {contract.path}")
+            build(artifact_path / contract.name, contract.path)
+        return
+
+    executor = ProcessPoolExecutor(max_workers=min(build_jobs, len(contracts)))
+    futures = {
+        executor.submit(
+            _build_contract, contract.name, artifact_path / contract.name, contract.path
+        ): contract
+        for contract in contracts
+    }
+    done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+    failed = next((future for future in done if future.exception()), None)
+    # Report a failure without waiting for the builds still running (they are not stopped).
+    executor.shutdown(wait=failed is None, cancel_futures=True)
+    if failed is not None:
+        logger.error(f"Build of {futures[failed].name} failed")
+        raise failed.exception()  # type: ignore[misc]
+
+
+# -------------------------- Watch Logic -------------------------- #
+
+
+def _watched_files(contract: SmartContract) -> list[Path]:
+    return [*contract_sources(contract.path), contract.path.parent / "deploy_config.py"]
+
+
+def _reload_deploy(contract: SmartContract) -> Callable[..., None] | None:
+    """Re-imports the deploy function so it picks up a rebuilt client and edited deploy_config."""
+    artifacts_package = f"{root_path.name}.artifacts."
+    for module_name in [name for name in sys.modules if name.startswith(artifacts_package)]:
+        del sys.modules[module_name]
+    module_name = f"{root_path.name}.{contract.name}.deploy_config"
+    if module_name in sys.modules:
+        del sys.modules[module_name]
+    return import_deploy_if_exists(contract.path.parent)
+
+
+def redeploy(artifact_path: Path, contract: SmartContract, smoke_script: Path | None) -> None:
+    """Rebuilds (through the build cache), updates the app in place and runs the smoke script."""
+    started = time.perf_counter()
+    build_contracts(artifact_path, [contract])
+    deploy = _reload_deploy(contract)
+    if deploy:
+        logger.info(f"Updating {contract.name} in place")
+        deploy(on_update=algokit_utils.OnUpdate.UpdateApp)
+    if smoke_script:
+        logger.info(f"Running {smoke_script.name}")
+        smoke_result = subprocess.run([sys.executable, str(smoke_script)], cwd=root_path.parent)
+        if smoke_result.returncode:
+            raise Exception(f"{smoke_script.name} failed with exit code {smoke_result.returncode}")
+    logger.info(f"{contract.name} redeployed in {time.perf_counter() - started:.1f}s")
+
+
+def watch(artifact_path: Path, contracts: list[SmartContract], smoke_script: Path | None) -> None:
+    """
+    Watches contract sources and deploy configs, rebuilding and redeploying on change.
+    Apps are updated in place (OnUpdate.UpdateApp), so app IDs and box state survive
+    redeploys. Only localnet is supported.
+    """
+    if not algokit_utils.AlgorandClient.from_environment().client.is_localnet():
+        raise Exception("Watch mode only deploys to localnet")
+    watched = {path: contract for contract in contracts for path in _watched_files(contract)}
+    logger.info(f"Watching {len(watched)} files, press Ctrl+C to stop")
+
+    def on_change(changed_files: set[Path]) -> None:
+        for contract in contracts:
+            if any(watched.get(path) is contract for path in changed_files):
+                logger.info(f"Change detected in {contract.name}")
+                redeploy(artifact_path, contract, smoke_script)
+
+    try:
+        watch_files(lambda: watched, on_change)
+    except KeyboardInterrupt:
+        logger.info("Stopped watching")
+
+
 # --------------------------- Main Logic --------------------------- #
 
 
-def main(action: str, contract_name: str | None = None) -> None:
+def main(
+    action: str, contract_name: str | None = None, smoke_script: str | None = None
+) -> None:
     """Main entry point to build and/or deploy smart contracts."""
     artifact_path = root_path / "artifacts"
     # Filter contracts based on an optional specific contract name.
@@ -172,9 +361,7 @@ def main(action: str, contract_name: str | None = None) -> None:
 
     match action:
         case "build":
-            for contract in filtered_contracts:
-                logger.info(f"Building app at {contract.path}")
-                build(artifact_path / contract.name, contract.path)
+            build_contracts(artifact_path, filtered_contracts)
         case "deploy":
             for contract in filtered_contracts:
                 output_dir = artifact_path / contract.name
@@ -192,18 +379,36 @@ def main(action: str, contract_name: str | None = None) -> None:
                     logger.info(f"Deploying app {contract.name}")
                     contract.deploy()
         case "all":
+            build_contracts(artifact_path, filtered_contracts)
             for contract in filtered_contracts:
-                logger.info(f"Building app at {contract.path}")
-                build(artifact_path / contract.name, contract.path)
                 if contract.deploy:
                     logger.info(f"Deploying {contract.name}")
                     contract.deploy()
+        case "watch":
+            watch(
+                artifact_path,
+                filtered_contracts,
+                Path(smoke_script).resolve() if smoke_script else None,
+            )
+        case "analyze":
+            # Static worst-case cost and size per ABI route, from the compiled TEAL only.
+            for contract in filtered_contracts:
+                for teal_file in sorted((artifact_path / contract.name).glob("*.approval.teal")):
+                    print(f"{teal_file.name}\n{format_report(TealAnalysis.from_file(teal_file))}\n")
+        case "profile":
+            # Per-line opcode cost of every ABI method, from simulate traces on localnet.
+            for contract in filtered_contracts:
+                if contract.profile:
+                    logger.info(f"Profiling {contract.name}")
+                    contract.profile()
         case _:
             logger.error(f"Unknown action: {action}")
 
 
 if __name__ == "__main__":
-    if len(sys.argv) > 2:
+    if len(sys.argv) > 3:
+        main(sys.argv[1], sys.argv[2], sys.argv[3])
+    elif len(sys.argv) > 2:
         main(sys.argv[1], sys.argv[2])
     elif len(sys.argv) > 1:
         main(sys.argv[1])
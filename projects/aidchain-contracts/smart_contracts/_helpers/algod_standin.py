@@ -0,0 +1,698 @@
+import base64
+import contextvars
+import dataclasses
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+import typing
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import algokit_utils
+import algopy
+import msgpack
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+from algosdk import abi, encoding
+from algosdk.transaction import ApplicationCallTxn, PaymentTxn, Transaction
+
+# algod's default MaxAPIBoxPerApplication: listing more boxes than this needs `max`.
+MAX_BOXES_LISTED = 100_000
+# algod answers a wait for the next block after at most a minute.
+_WAIT_FOR_BLOCK_TIMEOUT = 60.0
+_ON_COMPLETE = [
+    "NoOp",
+    "OptIn",
+    "CloseOut",
+    "ClearState",
+    "UpdateApplication",
+    "DeleteApplication",
+]
+_TXN_TYPES = {1: "pay", 2: "keyreg", 3: "acfg", 4: "axfer", 5: "afrz", 6: "appl"}
+_ADDRESS_FIELDS = {
+    "snd", "rcv", "close", "arcv", "asnd", "aclose", "fadd", "rekey", "sgnr", "apat"
+}
+_NATIVE_ARGUMENTS: tuple[type, ...] = (algopy.String, algopy.UInt64, algopy.BigUInt, bool)
+
+
+class _Rejected(Exception):
+    def __init__(self, index: int, message: str) -> None:
+        super().__init__(message)
+        self.index = index
+
+
+class _Boxes(dict[bytes, bytes]):
+    """An app's boxes, journaled while a group runs so a rejected group leaves no writes"""
+
+    _undo: dict[bytes, bytes | None] | None = None
+
+    def begin(self) -> None:
+        if self._undo is None:
+            self._undo = {}
+
+    def end(self, *, commit: bool) -> None:
+        undo, self._undo = self._undo or {}, None
+        if commit:
+            return
+        for key, value in undo.items():
+            if value is None:
+                super().pop(key, None)
+            else:
+                super().__setitem__(key, value)
+
+    def __setitem__(self, key: bytes, value: bytes) -> None:
+        if self._undo is not None and key not in self._undo:
+            self._undo[key] = self.get(key)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: bytes) -> None:
+        if self._undo is not None and key not in self._undo:
+            self._undo[key] = self.get(key)
+        super().__delitem__(key)
+
+
+@dataclasses.dataclass
+class _App:
+    contract: algopy.ARC4Contract
+    creator: str
+    approval_program: bytes
+    clear_program: bytes
+    global_schema: dict[str, int]
+    local_schema: dict[str, int]
+    extra_pages: int
+
+
+class EmulatedLedger:
+    """
+    Apps of one contract class running in the algorand-python-testing emulator.
+
+    App calls are routed by ABI selector (or by on-completion for bare calls, through
+    `bare_calls`, e.g. {"UpdateApplication": "update"}) to the contract's Python methods,
+    and every app created gets its own contract instance, boxes and global state. Template
+    variables come from `template_vars` (e.g. {"UPDATABLE": True}) for every app, whatever
+    values its program was compiled with. A group either applies completely or not at all.
+    Payments are accepted without moving funds: balances, fees, signatures and opcode
+    budgets are not modelled. Not thread safe.
+    """
+
+    def __init__(
+        self,
+        contract: type[algopy.ARC4Contract],
+        app_spec: algokit_utils.Arc56Contract,
+        bare_calls: Mapping[str, str] | None = None,
+        template_vars: Mapping[str, typing.Any] | None = None,
+    ) -> None:
+        self.contract = contract
+        self.bare_calls = dict(bare_calls or {})
+        self.apps: dict[int, _App] = {}
+        self._methods = {}
+        for method in app_spec.methods:
+            abi_method = method.to_abi_method()
+            hints = typing.get_type_hints(getattr(contract, method.name))
+            hints.pop("return", None)
+            self._methods[abi_method.get_selector()] = (
+                method.name,
+                abi_method,
+                list(hints.values()),
+                {*method.actions.call, *method.actions.create},
+            )
+        # The emulator's context lives in a context variable; every call runs inside a copy
+        # of the context it was entered in, from whichever thread serves the request.
+        entered = algopy_testing_context()
+        self._context: AlgopyTestContext = entered.__enter__()
+        for name, value in (template_vars or {}).items():
+            self._context.set_template_var(name, value)
+        self._context_vars = contextvars.copy_context()
+        entered.__exit__(None, None, None)
+
+    def _app_data(self, app_id: int) -> typing.Any:
+        # The emulator keeps each app's global state and boxes in plain dicts.
+        return self._context.ledger._app_data[app_id]
+
+    def global_state(self, app_id: int) -> dict[bytes, int | bytes]:
+        return dict(self._app_data(app_id).global_state)
+
+    def boxes(self, app_id: int) -> dict[bytes, bytes]:
+        return self._app_data(app_id).boxes  # type: ignore[no-any-return]
+
+    def evaluate(
+        self, group: list[Transaction], *, commit: bool = True
+    ) -> list[dict[str, typing.Any]]:
+        """
+        Runs a group and returns each transaction's result (logs, created app, inner
+        transactions) in algod's pending transaction format. Raises `_Rejected` with the
+        index of the failing transaction; the ledger is then unchanged, as it always is when
+        `commit` is false.
+        """
+        return self._context_vars.run(self._evaluate, group, commit)
+
+    def _evaluate(self, group: list[Transaction], commit: bool) -> list[dict[str, typing.Any]]:
+        global_states: dict[int, dict[bytes, int | bytes]] = {}
+        created: list[int] = []
+        results = []
+        try:
+            for index, txn in enumerate(group):
+                if isinstance(txn, PaymentTxn):
+                    results.append({})
+                elif isinstance(txn, ApplicationCallTxn):
+                    app_id = txn.index
+                    if app_id and app_id not in global_states and app_id in self.apps:
+                        data = self._app_data(app_id)
+                        global_states[app_id] = dict(data.global_state)
+                        data.boxes.begin()
+                    results.append(self._app_call(index, txn, created))
+                else:
+                    raise _Rejected(index, f"{txn.type} transactions are not supported")
+        except BaseException:
+            commit = False
+            raise
+        finally:
+            for app_id, global_state in global_states.items():
+                data = self._app_data(app_id)
+                data.boxes.end(commit=commit)
+                if not commit:
+                    data.global_state.clear()
+                    data.global_state.update(global_state)
+            if not commit:
+                for app_id in created:
+                    del self.apps[app_id]
+                    del self._context.ledger._app_data[app_id]
+            self._context.clear_transaction_context()
+        return results
+
+    def _app_call(
+        self, index: int, txn: ApplicationCallTxn, created: list[int]
+    ) -> dict[str, typing.Any]:
+        on_complete = _ON_COMPLETE[txn.on_complete]
+        selector = txn.app_args[0] if txn.app_args else None
+        result: dict[str, typing.Any] = {}
+        try:
+            if txn.index == 0:
+                contract = self._create(txn)
+                created.append(contract.__app_id__)
+                result["application-index"] = contract.__app_id__
+            elif txn.index in self.apps:
+                contract = self.apps[txn.index].contract
+            else:
+                raise _Rejected(index, f"application {txn.index} does not exist")
+            overrides = {
+                "sender": algopy.Account(txn.sender),
+                "fee": algopy.UInt64(txn.fee),
+                "on_completion": getattr(algopy.OnCompleteAction, on_complete),
+            }
+            if selector in self._methods:
+                name, method, hints, actions = self._methods[selector]
+                if on_complete not in actions:
+                    raise _Rejected(index, f"{name} does not allow {on_complete}")
+                arguments = [
+                    _argument(argument.type, hint, raw, txn)
+                    for argument, hint, raw in zip(method.args, hints, txn.app_args[1:])
+                ]
+            elif selector is None and on_complete in self.bare_calls:
+                name, arguments = self.bare_calls[on_complete], []
+            elif selector is None and txn.index == 0 and on_complete == "NoOp":
+                name = ""
+            else:
+                raise _Rejected(index, f"no route for {on_complete} call {selector!r}")
+            if name:
+                with self._context.txn.create_group(active_txn_overrides=overrides):
+                    getattr(contract, name)(*arguments)
+                active = self._context.txn.last_active
+                logs = [bytes(active.logs(i)) for i in range(int(active.num_logs))]
+                result["logs"] = [base64.b64encode(log).decode() for log in logs]
+                inner = [
+                    _inner_result(itxn)
+                    for itxn_group in self._context.txn.last_group.itxn_groups
+                    for itxn in itxn_group
+                ]
+                if inner:
+                    result["inner-txns"] = inner
+        except _Rejected:
+            raise
+        except Exception as error:
+            raise _Rejected(index, f"logic eval error: {error or type(error).__name__}") from error
+        finally:
+            self._context.clear_transaction_context()
+        if on_complete == "UpdateApplication":
+            app = self.apps[txn.index]
+            app.approval_program, app.clear_program = txn.approval_program, txn.clear_program
+        return result
+
+    def _create(self, txn: ApplicationCallTxn) -> algopy.ARC4Contract:
+        with self._context.txn.create_group(
+            active_txn_overrides={"sender": algopy.Account(txn.sender)}
+        ):
+            contract = self.contract()
+        app_id = contract.__app_id__
+        data = self._app_data(app_id)
+        data.boxes = _Boxes(data.boxes)
+        self.apps[app_id] = _App(
+            contract=contract,
+            creator=txn.sender,
+            approval_program=txn.approval_program or b"",
+            clear_program=txn.clear_program or b"",
+            global_schema=_schema(txn.global_schema),
+            local_schema=_schema(txn.local_schema),
+            extra_pages=txn.extra_pages or 0,
+        )
+        return contract
+
+
+def _argument(kind: typing.Any, hint: type, raw: bytes, txn: ApplicationCallTxn) -> typing.Any:
+    if kind == "account":
+        return algopy.Account([txn.sender, *(txn.accounts or [])][raw[0]])
+    if kind == "application":
+        return algopy.Application([txn.index, *(txn.foreign_apps or [])][raw[0]])
+    if kind == "asset":
+        return algopy.Asset((txn.foreign_assets or [])[raw[0]])
+    if not isinstance(kind, abi.ABIType):
+        raise Exception(f"{kind} arguments are not supported")
+    if hint is algopy.Bytes:
+        return algopy.Bytes(bytes(kind.decode(raw)))
+    if hint in _NATIVE_ARGUMENTS:
+        return hint(kind.decode(raw))
+    return hint.from_bytes(raw)  # type: ignore[attr-defined]
+
+
+def _inner_result(itxn: typing.Any) -> dict[str, typing.Any]:
+    txn_type = _TXN_TYPES.get(int(itxn.type), "appl")
+    fields: dict[str, typing.Any] = {
+        "type": txn_type,
+        "snd": str(itxn.sender),
+        "fee": int(itxn.fee),
+    }
+    result: dict[str, typing.Any] = {"txn": {"txn": fields}}
+    if txn_type == "pay":
+        fields.update(rcv=str(itxn.receiver), amt=int(itxn.amount))
+    elif txn_type == "acfg" and int(itxn.created_asset.id):
+        result["asset-index"] = int(itxn.created_asset.id)
+    return result
+
+
+def _schema(schema: typing.Any) -> dict[str, int]:
+    return {
+        "num-uint": getattr(schema, "num_uints", 0) or 0,
+        "num-byte-slice": getattr(schema, "num_byte_slices", 0) or 0,
+    }
+
+
+def _json(value: typing.Any, key: str = "") -> typing.Any:
+    """A msgpack transaction in algod's JSON form: bytes as base64, addresses as strings."""
+    if isinstance(value, dict):
+        return {str(k): _json(v, str(k)) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_json(v, key) for v in value]
+    if isinstance(value, bytes):
+        if key in _ADDRESS_FIELDS and len(value) == 32:
+            return encoding.encode_address(value)
+        return base64.b64encode(value).decode()
+    return value
+
+
+@dataclasses.dataclass(frozen=True)
+class Faults:
+    """Latency and errors added to every request, or to those of `endpoints` only"""
+
+    # Seconds added to each response, plus up to `jitter` more (uniform).
+    latency: float = 0.0
+    jitter: float = 0.0
+    # Share of requests answered with HTTP 503 instead.
+    error_rate: float = 0.0
+    # Endpoint names as listed in `AlgodStandin.endpoints`; None applies to all of them.
+    endpoints: frozenset[str] | None = None
+    seed: int = 0
+
+
+class AlgodStandin:
+    """
+    A local HTTP server answering the algod endpoints the clients in this project use,
+    backed by an `EmulatedLedger`.
+
+    Each accepted group is evaluated at submission, like algod's transaction pool does,
+    so rejections come back from the submit call. With `block_time` 0 every group is
+    confirmed in a round of its own straight away (like localnet's dev mode); otherwise a
+    round closes every `block_time` seconds and confirms what was accepted since. `faults`
+    injects latency and errors. Run it with `start()` / `stop()` or as a context manager.
+    """
+
+    endpoints = (
+        "status",
+        "wait-for-block",
+        "params",
+        "submit",
+        "pending",
+        "simulate",
+        "application",
+        "boxes",
+        "box",
+        "block-txids",
+        "compile",
+    )
+
+    def __init__(
+        self,
+        ledger: EmulatedLedger,
+        *,
+        block_time: float = 0.0,
+        faults: Faults | None = None,
+        # A localnet genesis ID, so algokit applies its localnet validity window (1000
+        # rounds) rather than 10 rounds, which its cached suggested params outlive.
+        genesis_id: str = "dockernet-v1",
+        history: int = 200_000,
+    ) -> None:
+        self.ledger = ledger
+        self.block_time = block_time
+        self.faults = faults or Faults()
+        self.genesis_id = genesis_id
+        self.genesis_hash = base64.b64encode(
+            hashlib.sha256(genesis_id.encode()).digest()
+        ).decode()
+        # Pending transaction info and block txids are kept for this many transactions/rounds.
+        self.history = history
+        self.round = 1
+        self._round_closed = time.monotonic()
+        self._pool: list[str] = []
+        self._transactions: OrderedDict[str, dict[str, typing.Any]] = OrderedDict()
+        self._blocks: OrderedDict[int, list[str]] = OrderedDict({1: []})
+        self._lock = threading.Lock()
+        self._new_round = threading.Condition(self._lock)
+        self._rng = random.Random(self.faults.seed)
+        self._rng_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._server: ThreadingHTTPServer | None = None
+        self._threads: list[threading.Thread] = []
+        self._routes: list[tuple[str, re.Pattern[str], str, Callable[..., typing.Any]]] = [
+            ("GET", re.compile(r"/v2/status"), "status", self._status),
+            ("GET", re.compile(r"/v2/status/wait-for-block-after/(\d+)"), "wait-for-block",
+             self._wait_for_block),
+            ("GET", re.compile(r"/v2/transactions/params"), "params", self._params),
+            ("POST", re.compile(r"/v2/transactions"), "submit", self._submit),
+            ("GET", re.compile(r"/v2/transactions/pending/(\w+)"), "pending", self._pending),
+            ("POST", re.compile(r"/v2/transactions/simulate"), "simulate", self._simulate),
+            ("GET", re.compile(r"/v2/applications/(\d+)"), "application", self._application),
+            ("GET", re.compile(r"/v2/applications/(\d+)/boxes"), "boxes", self._boxes),
+            ("GET", re.compile(r"/v2/applications/(\d+)/box"), "box", self._box),
+            ("GET", re.compile(r"/v2/blocks/(\d+)/txids"), "block-txids", self._block_txids),
+            ("POST", re.compile(r"/v2/teal/compile"), "compile", self._compile),
+        ]
+
+    # ------------------------------ serving ------------------------------ #
+
+    def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Serves in background threads and returns the server's address."""
+        handler = type("Handler", (_Handler,), {"standin": self})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._stopped.clear()
+        self._threads = [threading.Thread(target=self._server.serve_forever, daemon=True)]
+        if self.block_time:
+            self._threads.append(threading.Thread(target=self._produce_blocks, daemon=True))
+        for thread in self._threads:
+            thread.start()
+        return f"http://{host}:{self._server.server_port}"
+
+    def stop(self) -> None:
+        self._stopped.set()
+        with self._new_round:
+            self._new_round.notify_all()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+        for thread in self._threads:
+            thread.join()
+
+    def __enter__(self) -> "AlgodStandin":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.stop()
+
+    def handle(
+        self, method: str, path: str, query: Mapping[str, list[str]], body: bytes
+    ) -> tuple[int, dict[str, typing.Any]]:
+        """Answers one request with an HTTP status and a JSON body."""
+        for route_method, pattern, endpoint, route in self._routes:
+            match = pattern.fullmatch(path)
+            if match and route_method == method:
+                break
+        else:
+            if path == "/health":
+                return 200, {}
+            return 404, {"message": f"{method} {path} is not served by the stand-in"}
+        if self.faults.endpoints is None or endpoint in self.faults.endpoints:
+            with self._rng_lock:
+                delay = self.faults.latency + self._rng.uniform(0, self.faults.jitter)
+                failed = self._rng.random() < self.faults.error_rate
+            if delay:
+                time.sleep(delay)
+            if failed:
+                return 503, {"message": f"injected {endpoint} fault"}
+        if query.get("format", ["json"])[0] != "json":
+            return 400, {"message": "the stand-in only answers in JSON"}
+        try:
+            return route(*match.groups(), query=query, body=body)  # type: ignore[no-any-return]
+        except _Rejected as error:
+            return 400, {"message": str(error)}
+        except Exception as error:
+            return 400, {"message": f"{type(error).__name__}: {error}"}
+
+    # ------------------------------ rounds ------------------------------ #
+
+    def _produce_blocks(self) -> None:
+        while not self._stopped.wait(self.block_time):
+            with self._lock:
+                self._close_round()
+
+    def _close_round(self) -> None:
+        self.round += 1
+        self._round_closed = time.monotonic()
+        for tx_id in self._pool:
+            self._transactions[tx_id]["confirmed-round"] = self.round
+        self._blocks[self.round], self._pool = self._pool, []
+        while len(self._blocks) > self.history:
+            self._blocks.popitem(last=False)
+        while len(self._transactions) > self.history:
+            self._transactions.popitem(last=False)
+        self._new_round.notify_all()
+
+    def _status_body(self) -> dict[str, typing.Any]:
+        return {
+            "last-round": self.round,
+            "time-since-last-round": int((time.monotonic() - self._round_closed) * 1e9),
+            "catchup-time": 0,
+            "last-version": "future",
+            "next-version": "future",
+            "next-version-round": self.round + 1,
+            "next-version-supported": True,
+            "stopped-at-unsupported-round": False,
+        }
+
+    def _status(self, **_: typing.Any) -> tuple[int, dict[str, typing.Any]]:
+        with self._lock:
+            return 200, self._status_body()
+
+    def _wait_for_block(self, round_num: str, **_: typing.Any) -> tuple[int, dict[str, typing.Any]]:
+        with self._new_round:
+            self._new_round.wait_for(
+                lambda: self.round > int(round_num) or self._stopped.is_set(),
+                timeout=_WAIT_FOR_BLOCK_TIMEOUT,
+            )
+            return 200, self._status_body()
+
+    def _params(self, **_: typing.Any) -> tuple[int, dict[str, typing.Any]]:
+        with self._lock:
+            return 200, {
+                "consensus-version": "future",
+                "fee": 0,
+                "genesis-hash": self.genesis_hash,
+                "genesis-id": self.genesis_id,
+                "last-round": self.round,
+                "min-fee": 1000,
+            }
+
+    def _block_txids(self, round_num: str, **_: typing.Any) -> tuple[int, dict[str, typing.Any]]:
+        with self._lock:
+            if int(round_num) not in self._blocks:
+                return 404, {"message": f"block {round_num} is not available"}
+            return 200, {"blockTxids": list(self._blocks[int(round_num)])}
+
+    # --------------------------- transactions --------------------------- #
+
+    def _decode(
+        self, signed: list[dict[str, typing.Any]], *, require_signatures: bool = True
+    ) -> list[Transaction]:
+        group = []
+        for index, raw in enumerate(signed):
+            if require_signatures and not {"sig", "msig", "lsig"} & raw.keys():
+                raise _Rejected(index, "transaction is not signed")
+            # Signatures are not verified.
+            txn = encoding.msgpack_decode(
+                base64.b64encode(msgpack.packb(raw["txn"], use_bin_type=True)).decode()
+            )
+            if txn.genesis_hash != self.genesis_hash:
+                raise _Rejected(index, "genesis hash does not match the stand-in's")
+            if not txn.first_valid_round <= self.round + 1 <= txn.last_valid_round:
+                raise _Rejected(
+                    index,
+                    f"txn dead: round {self.round + 1} outside of "
+                    f"{txn.first_valid_round}--{txn.last_valid_round}",
+                )
+            group.append(txn)
+        return group
+
+    def _submit(self, *, body: bytes, **_: typing.Any) -> tuple[int, dict[str, typing.Any]]:
+        unpacker = msgpack.Unpacker(raw=False, strict_map_key=False)
+        unpacker.feed(body)
+        signed = list(unpacker)
+        with self._lock:
+            group = self._decode(signed)
+            tx_ids = [txn.get_txid() for txn in group]
+            try:
+                for index, tx_id in enumerate(tx_ids):
+                    if tx_id in self._transactions:
+                        raise _Rejected(index, f"transaction already in ledger: {tx_id}")
+                results = self.ledger.evaluate(group)
+            except _Rejected as error:
+                raise _Rejected(
+                    error.index,
+                    f"TransactionPool.Remember: transaction {tx_ids[error.index]}: {error}",
+                ) from error
+            for tx_id, raw, result in zip(tx_ids, signed, results):
+                self._transactions[tx_id] = {"pool-error": "", "txn": _json(raw), **result}
+            self._pool.extend(tx_ids)
+            if not self.block_time:
+                self._close_round()
+        return 200, {"txId": tx_ids[0]}
+
+    def _pending(self, tx_id: str, **_: typing.Any) -> tuple[int, dict[str, typing.Any]]:
+        with self._lock:
+            if tx_id not in self._transactions:
+                return 404, {"message": "txn does not exist"}
+            return 200, dict(self._transactions[tx_id])
+
+    def _simulate(self, *, body: bytes, **_: typing.Any) -> tuple[int, dict[str, typing.Any]]:
+        request = msgpack.unpackb(body, raw=False, strict_map_key=False)
+        signed = request["txn-groups"][0]["txns"]
+        txn_group: dict[str, typing.Any] = {"app-budget-added": 0, "app-budget-consumed": 0}
+        with self._lock:
+            try:
+                results = self.ledger.evaluate(
+                    self._decode(signed, require_signatures=False), commit=False
+                )
+            except _Rejected as error:
+                results = [{} for _ in signed]
+                txn_group.update({"failure-message": str(error), "failed-at": [error.index]})
+            last_round = self.round
+        txn_group["txn-results"] = [
+            {"txn-result": {"pool-error": "", "txn": _json(raw), **result}}
+            for raw, result in zip(signed, results)
+        ]
+        return 200, {"version": 2, "last-round": last_round, "txn-groups": [txn_group]}
+
+    # ------------------------------ state ------------------------------ #
+
+    def _application(self, app_id: str, **_: typing.Any) -> tuple[int, dict[str, typing.Any]]:
+        with self._lock:
+            app = self.ledger.apps.get(int(app_id))
+            if app is None:
+                return 404, {"message": "application does not exist"}
+            global_state = self.ledger.global_state(int(app_id))
+        state = []
+        for key, value in global_state.items():
+            if isinstance(value, int):
+                state_value = {"type": 2, "uint": value, "bytes": ""}
+            else:
+                state_value = {"type": 1, "uint": 0, "bytes": base64.b64encode(value).decode()}
+            state.append({"key": base64.b64encode(key).decode(), "value": state_value})
+        return 200, {
+            "id": int(app_id),
+            "params": {
+                "creator": app.creator,
+                "approval-program": base64.b64encode(app.approval_program).decode(),
+                "clear-state-program": base64.b64encode(app.clear_program).decode(),
+                "extra-program-pages": app.extra_pages,
+                "global-state-schema": app.global_schema,
+                "local-state-schema": app.local_schema,
+                "global-state": state,
+            },
+        }
+
+    def _boxes(
+        self, app_id: str, *, query: Mapping[str, list[str]], **_: typing.Any
+    ) -> tuple[int, dict[str, typing.Any]]:
+        with self._lock:
+            if int(app_id) not in self.ledger.apps:
+                return 404, {"message": "application does not exist"}
+            names = list(self.ledger.boxes(int(app_id)))
+        limit = int(query.get("max", ["0"])[0])
+        if not limit and len(names) > MAX_BOXES_LISTED:
+            return 400, {
+                "message": f"Result limit exceeded: {len(names)} boxes, "
+                f"max {MAX_BOXES_LISTED} (MaxAPIBoxPerApplication)"
+            }
+        return 200, {
+            "boxes": [{"name": base64.b64encode(name).decode()} for name in names[: limit or None]]
+        }
+
+    def _box(
+        self, app_id: str, *, query: Mapping[str, list[str]], **_: typing.Any
+    ) -> tuple[int, dict[str, typing.Any]]:
+        encoded = query.get("name", [""])[0]
+        kind, _sep, value = encoded.partition(":")
+        name = base64.b64decode(value) if kind == "b64" else value.encode()
+        with self._lock:
+            if int(app_id) not in self.ledger.apps:
+                return 404, {"message": "application does not exist"}
+            box = self.ledger.boxes(int(app_id)).get(name)
+            last_round = self.round
+        if box is None:
+            return 404, {"message": "box not found"}
+        return 200, {
+            "name": base64.b64encode(name).decode(),
+            "value": base64.b64encode(box).decode(),
+            "round": last_round,
+        }
+
+    def _compile(
+        self, *, query: Mapping[str, list[str]], body: bytes, **_: typing.Any
+    ) -> tuple[int, dict[str, typing.Any]]:
+        # Programs are never run, so a digest of the source stands in for the bytecode.
+        program = bytes([10]) + hashlib.sha256(body).digest()
+        result: dict[str, typing.Any] = {
+            "hash": encoding.encode_address(encoding.checksum(b"Program" + program)),
+            "result": base64.b64encode(program).decode(),
+        }
+        if query.get("sourcemap", ["false"])[0].lower() == "true":
+            result["sourcemap"] = {"version": 3, "sources": [], "names": [], "mappings": ""}
+        return 200, result
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; with Nagle's algorithm on, the body of
+    # every response on a kept-alive connection waits ~40 ms for the client's delayed ACK.
+    disable_nagle_algorithm = True
+    standin: AlgodStandin
+
+    def do_GET(self) -> None:
+        self._answer("GET")
+
+    def do_POST(self) -> None:
+        self._answer("POST")
+
+    def _answer(self, method: str) -> None:
+        url = urlsplit(self.path)
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        status, payload = self.standin.handle(method, url.path, parse_qs(url.query), body)
+        content = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format: str, *args: typing.Any) -> None:
+        pass
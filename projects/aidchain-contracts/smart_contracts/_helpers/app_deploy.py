@@ -0,0 +1,192 @@
+import dataclasses
+import importlib
+import json
+import logging
+import os
+import typing
+from collections.abc import Callable, Mapping
+from pathlib import Path
+
+import algokit_utils
+
+from smart_contracts._helpers.deploy_registry import DeployRegistry, Deployment, program_hash
+from smart_contracts._helpers.funding import FundingPlan, plan_funding
+from smart_contracts._helpers.struct_codecs import snake_case
+from smart_contracts._helpers.teal_cache import with_teal_cache
+
+logger = logging.getLogger(__name__)
+
+# Fast path: with AIDCHAIN_DEPLOY_FAST=1, a deploy whose approval and clear programs,
+# deployer account and updatable setting match the last deployment recorded for this
+# network returns immediately, without looking up the app, compiling TEAL or sending any
+# transaction. The registry is local to this
+# checkout; delete its entry (or the file) after resetting a network such as localnet.
+deploy_fast_path = os.getenv("AIDCHAIN_DEPLOY_FAST", "0") == "1"
+deploy_registry = DeployRegistry(Path(__file__).parents[2] / ".algokit" / "deployments.json")
+
+artifacts_root = Path(__file__).parents[1] / "artifacts"
+
+
+def deploy_typed_app(
+    algorand: algokit_utils.AlgorandClient,
+    load_factory: Callable[[], type[typing.Any]],
+    *,
+    spec_name: str,
+    artifacts_dir: Path,
+    registry: DeployRegistry,
+    funding_plan: Callable[[], FundingPlan],
+    app_name: str | None = None,
+    deployer: str = "DEPLOYER",
+    on_update: algokit_utils.OnUpdate = algokit_utils.OnUpdate.AppendApp,
+    fast: bool = False,
+) -> tuple[Deployment, str]:
+    """
+    Deploys one named instance of a typed app and returns its deployment and the operation
+    performed ("Unchanged" when the fast path skipped it).
+
+    `load_factory` returns the generated factory class; it is only called (and the client
+    module only imported) when the fast path does not apply. New apps are funded with
+    `funding_plan().required` in the same group as a first `hello` call. The program is
+    compiled updatable (TMPL_UPDATABLE) only on localnet and when `on_update` asks for
+    in-place updates, so other deployments reject UpdateApplication calls.
+    """
+    app_name = app_name or spec_name
+    network = algorand.client.algod.algod_address
+    approval_hash = program_hash(artifacts_dir / f"{spec_name}.approval.teal")
+    clear_hash = program_hash(artifacts_dir / f"{spec_name}.clear.teal")
+    # With `<deployer>_MNEMONIC` set the account is derived offline.
+    deployer_ = algorand.account.from_environment(deployer)
+    updatable = on_update == algokit_utils.OnUpdate.UpdateApp or algorand.client.is_localnet()
+    if fast:
+        deployment = registry.unchanged(
+            network,
+            app_name,
+            approval_hash,
+            clear_hash,
+            creator=deployer_.address,
+            updatable=updatable,
+        )
+        if deployment:
+            logger.info(f"{app_name} ({deployment.app_id}) is up to date on {network}")
+            return deployment, "Unchanged"
+
+    with_teal_cache(algorand)
+    factory = algorand.client.get_typed_app_factory(
+        load_factory(),
+        app_name=app_name,
+        default_sender=deployer_.address,
+        compilation_params=algokit_utils.AppClientCompilationParams(updatable=updatable),
+    )
+
+    app_client, result = factory.deploy(
+        on_update=on_update,
+        on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
+    )
+
+    name = "world"
+    group = algorand.new_group()
+    if result.operation_performed in [
+        algokit_utils.OperationPerformed.Create,
+        algokit_utils.OperationPerformed.Replace,
+    ]:
+        # The app address is only known once the create is confirmed, so the exact minimum
+        # balance (boxes, created ASAs, inner transaction fees) is paid in the same group
+        # as the first call rather than in a round of its own.
+        plan = funding_plan()
+        logger.info(f"Funding {app_client.app_address} with {plan.required} microALGO")
+        group.add_payment(
+            algokit_utils.PaymentParams(
+                amount=algokit_utils.AlgoAmount.from_micro_algo(plan.required),
+                sender=deployer_.address,
+                receiver=app_client.app_address,
+            )
+        )
+    group.add_app_call_method_call(app_client.params.hello(args=(name,)))
+    response = group.send()
+    logger.info(
+        f"Called hello on {app_client.app_name} ({app_client.app_id}) "
+        f"with name={name}, received: {response.returns[-1].value}"
+    )
+
+    # Recorded only once the funding group has gone through, so the fast path never skips
+    # an app whose deploy did not finish.
+    deployment = Deployment(
+        app_id=app_client.app_id,
+        approval_hash=approval_hash,
+        clear_hash=clear_hash,
+        creator=deployer_.address,
+        updatable=updatable,
+    )
+    registry.record(network, app_name, deployment)
+    return deployment, result.operation_performed.name
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AppDeployConfig:
+    """
+    How a contract folder deploys: its app spec name and artifacts folder, and the usage a
+    new app account is funded for (expected entries per box map, ASAs the app creates and
+    inner transactions whose fees it pays; see plan_funding).
+    """
+
+    spec_name: str
+    folder: str
+    funding_boxes: Mapping[str, int]
+    funding_created_assets: int = 0
+    funding_inner_txns: int = 0
+
+    @property
+    def artifacts_dir(self) -> Path:
+        return artifacts_root / self.folder
+
+    def funding_plan(self) -> FundingPlan:
+        app_spec = json.loads((self.artifacts_dir / f"{self.spec_name}.arc56.json").read_text())
+        return plan_funding(
+            app_spec,
+            boxes=self.funding_boxes,
+            created_assets=self.funding_created_assets,
+            inner_txns=self.funding_inner_txns,
+        )
+
+    def load_factory(self) -> type:
+        module = importlib.import_module(
+            f"smart_contracts.artifacts.{self.folder}.{snake_case(self.spec_name)}_client"
+        )
+        return getattr(module, f"{self.spec_name}Factory")  # type: ignore[no-any-return]
+
+    def deploy_app(
+        self,
+        algorand: algokit_utils.AlgorandClient,
+        *,
+        app_name: str | None = None,
+        deployer: str = "DEPLOYER",
+        on_update: algokit_utils.OnUpdate = algokit_utils.OnUpdate.AppendApp,
+        fast: bool | None = None,
+    ) -> tuple[Deployment, str]:
+        """
+        Deploys one named instance of the app with the `deployer` account from the
+        environment (`<deployer>_MNEMONIC`) and returns its deployment and the operation
+        performed. `fast` defaults to AIDCHAIN_DEPLOY_FAST.
+        """
+        return deploy_typed_app(
+            algorand,
+            self.load_factory,
+            spec_name=self.spec_name,
+            artifacts_dir=self.artifacts_dir,
+            registry=deploy_registry,
+            funding_plan=self.funding_plan,
+            app_name=app_name,
+            deployer=deployer,
+            on_update=on_update,
+            fast=deploy_fast_path if fast is None else fast,
+        )
+
+    def deploy(
+        self,
+        on_update: algokit_utils.OnUpdate = algokit_utils.OnUpdate.AppendApp,
+        *,
+        fast: bool | None = None,
+    ) -> None:
+        self.deploy_app(
+            algokit_utils.AlgorandClient.from_environment(), on_update=on_update, fast=fast
+        )
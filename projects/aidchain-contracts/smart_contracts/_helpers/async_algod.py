@@ -0,0 +1,151 @@
+import base64
+import typing
+
+import httpx
+from algosdk import constants, encoding
+from algosdk.error import AlgodHTTPError
+from algosdk.transaction import SuggestedParams
+from algosdk.v2client.algod import AlgodClient
+from algosdk.v2client.models import SimulateRequest
+
+
+class AsyncAlgodClient:
+    """
+    Minimal asyncio algod client covering the endpoints used by the async app clients.
+
+    Requests share one pooled HTTP/1.1 connection pool, so a single event loop can keep many
+    reads and writes in flight without a thread per request.
+    """
+
+    def __init__(
+        self,
+        algod_address: str,
+        algod_token: str = "",
+        headers: dict[str, str] | None = None,
+        *,
+        max_connections: int = 100,
+        timeout: float = 30.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self._http = httpx.AsyncClient(
+            base_url=algod_address.rstrip("/") + "/v2",
+            headers={constants.algod_auth_header: algod_token, **(headers or {})},
+            limits=httpx.Limits(max_connections=max_connections),
+            timeout=timeout,
+            transport=transport,
+        )
+
+    @classmethod
+    def from_algod(cls, algod: AlgodClient, **kwargs: typing.Any) -> "AsyncAlgodClient":
+        """Creates an async client pointing at the same node as a synchronous algod client."""
+        return cls(algod.algod_address, algod.algod_token, algod.headers, **kwargs)
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
+    async def __aenter__(self) -> "AsyncAlgodClient":
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, typing.Any] | None = None,
+        content: bytes | None = None,
+        content_type: str | None = None,
+        response_format: str = "json",
+    ) -> typing.Any:
+        headers = {"Content-Type": content_type} if content_type else None
+        response = await self._http.request(
+            method, path, params=params, content=content, headers=headers
+        )
+        if response.is_error:
+            try:
+                body = response.json()
+            except ValueError:
+                body = {}
+            raise AlgodHTTPError(
+                body.get("message", response.text), response.status_code, body.get("data")
+            )
+        if response_format == "msgpack":
+            return response.content
+        return response.json() if response.content else {}
+
+    async def status(self) -> dict[str, typing.Any]:
+        return await self._request("GET", "/status")  # type: ignore[no-any-return]
+
+    async def status_after_block(self, round_num: int) -> dict[str, typing.Any]:
+        """Blocks until the node has seen a block after `round_num` and returns its status."""
+        return await self._request("GET", f"/status/wait-for-block-after/{round_num}")  # type: ignore[no-any-return]
+
+    async def suggested_params(self) -> SuggestedParams:
+        result = await self._request("GET", "/transactions/params")
+        return SuggestedParams(
+            result["fee"],
+            result["last-round"],
+            result["last-round"] + 1000,
+            result["genesis-hash"],
+            result["genesis-id"],
+            False,
+            result["consensus-version"],
+            result["min-fee"],
+        )
+
+    async def send_raw_transaction(self, signed_group: bytes) -> str:
+        """Submits concatenated msgpack-encoded signed transactions and returns the first txid."""
+        result = await self._request(
+            "POST", "/transactions", content=signed_group, content_type="application/x-binary"
+        )
+        return typing.cast(str, result["txId"])
+
+    async def pending_transaction_info(self, tx_id: str) -> dict[str, typing.Any]:
+        return await self._request("GET", f"/transactions/pending/{tx_id}")  # type: ignore[no-any-return]
+
+    async def simulate_transactions(self, request: SimulateRequest) -> dict[str, typing.Any]:
+        return await self._request(  # type: ignore[no-any-return]
+            "POST",
+            "/transactions/simulate",
+            content=base64.b64decode(encoding.msgpack_encode(request)),
+            content_type="application/msgpack",
+        )
+
+    async def account_info(self, address: str) -> dict[str, typing.Any]:
+        """Returns balance fields (`amount`, `min-balance`, ...) without assets or apps."""
+        return await self._request("GET", f"/accounts/{address}", params={"exclude": "all"})  # type: ignore[no-any-return]
+
+    async def application_info(self, app_id: int) -> dict[str, typing.Any]:
+        return await self._request("GET", f"/applications/{app_id}")  # type: ignore[no-any-return]
+
+    async def application_boxes(self, app_id: int) -> list[bytes]:
+        """Returns the raw names of all boxes of an application."""
+        result = await self._request("GET", f"/applications/{app_id}/boxes")
+        return [base64.b64decode(box["name"]) for box in result.get("boxes", [])]
+
+    async def application_box_by_name(self, app_id: int, box_name: bytes) -> bytes:
+        """Returns the raw value of a box."""
+        result = await self._request(
+            "GET",
+            f"/applications/{app_id}/box",
+            params={"name": "b64:" + base64.b64encode(box_name).decode()},
+        )
+        return base64.b64decode(result["value"])
+
+    async def block_txids(self, round_num: int) -> list[str]:
+        result = await self._request("GET", f"/blocks/{round_num}/txids")
+        return typing.cast(list[str], result.get("blockTxids") or [])
+
+    async def wait_for_confirmation(self, tx_id: str, wait_rounds: int = 10) -> dict[str, typing.Any]:
+        """Polls the pending transaction endpoint once per block until `tx_id` is confirmed."""
+        last_round = (await self.status())["last-round"]
+        for current_round in range(last_round, last_round + wait_rounds):
+            info = await self.pending_transaction_info(tx_id)
+            if info.get("confirmed-round", 0) > 0:
+                return info
+            if info.get("pool-error"):
+                raise Exception(f"Transaction {tx_id} was rejected: {info['pool-error']}")
+            await self.status_after_block(current_round)
+        raise Exception(f"Transaction {tx_id} not confirmed after {wait_rounds} rounds")
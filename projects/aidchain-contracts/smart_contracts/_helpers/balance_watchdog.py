@@ -0,0 +1,210 @@
+import asyncio
+import dataclasses
+import logging
+import math
+import time
+import typing
+from collections.abc import Awaitable, Callable, Iterable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+from algosdk.logic import get_application_address
+
+from smart_contracts._helpers.async_algod import AsyncAlgodClient
+
+logger = logging.getLogger(__name__)
+
+MAX_GROUP_SIZE = 16
+
+# Sends one atomic group of (receiver, microALGO) payments.
+SendPayments = Callable[[list[tuple[str, int]]], Awaitable[None]]
+
+
+@dataclasses.dataclass(slots=True)
+class AppBalance:
+    """Balance history of one managed app account"""
+
+    app_id: int
+    address: str
+    amount: int = 0
+    min_balance: int = 0
+    sampled_at: float = 0.0
+    # Smoothed rate (microALGO/s) at which spendable balance is consumed, by inner
+    # transaction fees and by minimum balance growth from new boxes and assets.
+    burn_rate: float = 0.0
+    topped_up: int = 0
+
+    @property
+    def spendable(self) -> int:
+        return self.amount - self.min_balance
+
+    @property
+    def runway(self) -> float:
+        """Seconds until the spendable balance runs out at the current burn rate."""
+        if self.burn_rate <= 0:
+            return math.inf
+        return max(0.0, self.spendable / self.burn_rate)
+
+    def observe(self, amount: int, min_balance: int, now: float, smoothing: float) -> None:
+        if self.sampled_at:
+            elapsed = now - self.sampled_at
+            # Increases are top-ups or deposits, not negative burn.
+            consumed = max(0, self.spendable - (amount - min_balance))
+            if elapsed > 0:
+                rate = consumed / elapsed
+                self.burn_rate = (
+                    smoothing * rate + (1 - smoothing) * self.burn_rate if self.burn_rate else rate
+                )
+        self.amount, self.min_balance, self.sampled_at = amount, min_balance, now
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class TopUpPolicy:
+    """When and by how much to top up an app account, in microALGO and seconds"""
+
+    floor: int = 200_000
+    lead_time: float = 6 * 3600
+    target_runway: float = 7 * 86_400
+    min_top_up: int = 100_000
+
+    def top_up(self, app: AppBalance) -> int:
+        if app.spendable >= self.floor and app.runway >= self.lead_time:
+            return 0
+        target = max(2 * self.floor, math.ceil(app.burn_rate * self.target_runway))
+        return max(self.min_top_up, target - app.spendable)
+
+
+class BalanceWatchdog:
+    """
+    Keeps many app accounts funded ahead of their spending.
+
+    Each poll samples all balances concurrently, updates each app's burn rate and tops up
+    every app whose spendable balance is under the floor or whose runway is shorter than
+    the policy's lead time. Payments are batched into atomic groups of up to 16.
+    """
+
+    def __init__(
+        self,
+        algod: AsyncAlgodClient,
+        send_payments: SendPayments,
+        app_ids: Iterable[int],
+        policy: TopUpPolicy | None = None,
+        *,
+        smoothing: float = 0.3,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.algod = algod
+        self.send_payments = send_payments
+        self.policy = policy or TopUpPolicy()
+        self.smoothing = smoothing
+        self.clock = clock
+        self.apps = {
+            app_id: AppBalance(app_id, get_application_address(app_id)) for app_id in app_ids
+        }
+        self.top_ups_sent = 0
+        self.failed_polls = 0
+
+    async def _sample(self, app: AppBalance) -> None:
+        info = await self.algod.account_info(app.address)
+        app.observe(info["amount"], info["min-balance"], self.clock(), self.smoothing)
+
+    async def poll(self) -> dict[int, int]:
+        """Samples every app and sends the top-ups that are due; returns them by app ID."""
+        await asyncio.gather(*(self._sample(app) for app in self.apps.values()))
+        due = {
+            app.app_id: amount
+            for app in self.apps.values()
+            if (amount := self.policy.top_up(app)) > 0
+        }
+        app_ids = list(due)
+        for start in range(0, len(app_ids), MAX_GROUP_SIZE):
+            group = app_ids[start : start + MAX_GROUP_SIZE]
+            await self.send_payments([(self.apps[app_id].address, due[app_id]) for app_id in group])
+            # Account for each group once it is confirmed, so a later group failing does not
+            # leave these payments to be mistaken for deposits by the next sample.
+            for app_id in group:
+                app = self.apps[app_id]
+                app.topped_up += due[app_id]
+                # Count the payment as received so the next sample measures only spending.
+                app.amount += due[app_id]
+                logger.info(
+                    f"Topped up app {app_id} with {due[app_id]} microALGO "
+                    f"(spendable {app.spendable}, runway {app.runway:.0f}s)"
+                )
+            self.top_ups_sent += len(group)
+        return due
+
+    async def run(self, interval: float) -> None:
+        while True:
+            try:
+                await self.poll()
+            except Exception as e:
+                self.failed_polls += 1
+                logger.error(f"Balance poll failed: {e}")
+            await asyncio.sleep(interval)
+
+    def metrics(self) -> str:
+        """Prometheus text exposition of balances, burn rates and funding runway."""
+        gauges: dict[str, tuple[str, Callable[[AppBalance], float]]] = {
+            "aidchain_app_balance_microalgo": ("Account balance", lambda app: app.amount),
+            "aidchain_app_min_balance_microalgo": (
+                "Minimum balance",
+                lambda app: app.min_balance,
+            ),
+            "aidchain_app_spendable_microalgo": (
+                "Balance above the minimum balance",
+                lambda app: app.spendable,
+            ),
+            "aidchain_app_burn_rate_microalgo_per_second": (
+                "Smoothed spend rate",
+                lambda app: app.burn_rate,
+            ),
+            "aidchain_app_runway_seconds": (
+                "Time until the spendable balance runs out",
+                lambda app: app.runway,
+            ),
+            "aidchain_app_topped_up_microalgo_total": (
+                "Total topped up by the watchdog",
+                lambda app: app.topped_up,
+            ),
+        }
+        lines = []
+        for name, (help_text, value) in gauges.items():
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge"]
+            lines += [
+                f'{name}{{app_id="{app.app_id}"}} {_format(value(app))}'
+                for app in self.apps.values()
+            ]
+        lines += [
+            "# TYPE aidchain_watchdog_top_ups_total counter",
+            f"aidchain_watchdog_top_ups_total {self.top_ups_sent}",
+            "# TYPE aidchain_watchdog_failed_polls_total counter",
+            f"aidchain_watchdog_failed_polls_total {self.failed_polls}",
+        ]
+        return "\n".join(lines) + "\n"
+
+
+def _format(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return f"{value:.6g}" if isinstance(value, float) else str(value)
+
+
+def serve_metrics(watchdog: BalanceWatchdog, port: int) -> ThreadingHTTPServer:
+    """Serves `watchdog.metrics()` on http://0.0.0.0:<port>/metrics from a daemon thread."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            body = watchdog.metrics().encode()
+            self.send_response(200 if self.path == "/metrics" else 404)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_: typing.Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("0.0.0.0", port), Handler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    return server
@@ -0,0 +1,161 @@
+import ast
+import functools
+import hashlib
+import importlib.metadata
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+@functools.cache
+def compiler_version() -> str:
+    """Returns the puyapy version used by `algokit compile python`."""
+    try:
+        return importlib.metadata.version("puyapy")
+    except importlib.metadata.PackageNotFoundError:
+        pass
+    try:
+        result = subprocess.run(
+            ["algokit", "--no-color", "compile", "python", "--version"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+        )
+    except FileNotFoundError:
+        return "unknown"
+    return result.stdout.strip() if result.returncode == 0 else "unknown"
+
+
+@functools.cache
+def client_generator_version() -> str:
+    """Returns the algokit-client-generator version used by `algokit generate client`."""
+    try:
+        return importlib.metadata.version("algokit-client-generator")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _imports(path: Path) -> Iterator[tuple[int, str]]:
+    """(relative import level, module) for every module a file may import."""
+    for node in ast.walk(ast.parse(path.read_bytes(), filename=str(path))):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                yield 0, alias.name
+        elif isinstance(node, ast.ImportFrom):
+            module = node.module or ""
+            if module:
+                yield node.level, module
+            # `from package import name` may import a submodule.
+            for alias in node.names:
+                yield node.level, f"{module}.{alias.name}" if module else alias.name
+
+
+def _module_files(module: str, search_dirs: list[Path]) -> list[Path]:
+    """The file of a local module and its packages' `__init__.py`, or [] for others."""
+    parts = module.split(".")
+    for directory in search_dirs:
+        base = directory.joinpath(*parts)
+        for candidate in (base.with_suffix(".py"), base / "__init__.py"):
+            if candidate.is_file():
+                packages = (
+                    directory.joinpath(*parts[:depth], "__init__.py")
+                    for depth in range(1, len(parts))
+                )
+                return [*(package for package in packages if package.is_file()), candidate]
+    return []
+
+
+def contract_sources(contract_path: Path) -> list[Path]:
+    """
+    Returns the Python sources that can affect a contract's compilation: the contract and
+    the local modules it imports, transitively. Other modules in the contract's folder
+    (deploy configuration, clients, tooling) are not compiler inputs and are left out.
+    """
+    sources: set[Path] = set()
+    pending = [contract_path.resolve()]
+    while pending:
+        path = pending.pop()
+        if path in sources:
+            continue
+        sources.add(path)
+        for level, module in _imports(path):
+            # Absolute imports resolve from the file's folder or any folder above it.
+            search_dirs = [path.parents[level - 1]] if level else list(path.parents)
+            pending.extend(_module_files(module, search_dirs))
+    return sorted(sources)
+
+
+class BuildCache:
+    """
+    Content-addressed store of build outputs.
+
+    Each entry is a copy of a contract's output directory (TEAL, ARC-56 spec, source maps,
+    typed client and codecs) stored under the hash of everything that produced it, so an
+    unchanged contract can be restored without invoking the compiler. The least recently
+    used entries beyond `max_entries` are pruned.
+    """
+
+    def __init__(self, cache_dir: Path, max_entries: int = 32) -> None:
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+
+    def key(self, sources: Iterable[Path], base_dir: Path, **inputs: object) -> str:
+        """Hashes source files (by path relative to `base_dir` and content) and build inputs."""
+        digest = hashlib.sha256()
+        base_dir = base_dir.resolve()
+        for path in sorted(path.resolve() for path in sources):
+            name = path.relative_to(base_dir) if path.is_relative_to(base_dir) else path
+            digest.update(name.as_posix().encode())
+            digest.update(b"\0")
+            digest.update(hashlib.sha256(path.read_bytes()).digest())
+        for name, value in sorted(inputs.items()):
+            digest.update(f"{name}={value!r}\0".encode())
+        return digest.hexdigest()
+
+    def restore(self, key: str, output_dir: Path) -> bool:
+        """Replaces `output_dir` with the cached entry for `key`, if there is one."""
+        entry = self.cache_dir / key
+        if not entry.is_dir():
+            return False
+        if output_dir.exists():
+            shutil.rmtree(output_dir)
+        shutil.copytree(entry, output_dir)
+        os.utime(entry)
+        return True
+
+    def store(self, key: str, output_dir: Path) -> None:
+        """Copies `output_dir` into the cache under `key`."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        entry = self.cache_dir / key
+        if entry.exists():
+            return
+        # Copy into a scratch directory first so concurrent builds never see partial entries.
+        scratch = Path(tempfile.mkdtemp(prefix=f".{key[:12]}-", dir=self.cache_dir))
+        try:
+            shutil.copytree(output_dir, scratch, dirs_exist_ok=True)
+            scratch.rename(entry)
+        except OSError:
+            shutil.rmtree(scratch, ignore_errors=True)
+            if not entry.exists():
+                raise
+        self.prune()
+
+    def prune(self) -> None:
+        entries = sorted(
+            (
+                path
+                for path in self.cache_dir.iterdir()
+                if path.is_dir() and not path.name.startswith(".")
+            ),
+            key=lambda path: path.stat().st_mtime,
+            reverse=True,
+        )
+        for stale in entries[self.max_entries :]:
+            logger.debug(f"Pruning build cache entry {stale.name}")
+            shutil.rmtree(stale, ignore_errors=True)
@@ -0,0 +1,74 @@
+import asyncio
+import base64
+from collections.abc import Sequence
+
+from algosdk import encoding
+from algosdk.transaction import SignedTransaction
+
+from smart_contracts._helpers.async_algod import AsyncAlgodClient
+from smart_contracts._helpers.confirmation_tracker import ConfirmationTracker
+
+
+class BulkSender:
+    """
+    Submits signed groups back to back without waiting for each one to confirm.
+
+    Each group is submitted once algod has accepted the previous one. algod evaluates
+    accepted groups in submission order, so app state such as record counters advances
+    exactly as it would with one confirmed send after another. At most `max_in_flight`
+    groups are unconfirmed at any time. Confirmations come from one `ConfirmationTracker`.
+    A rejected submission raises immediately. A group that never confirms is raised by
+    the next `submit` or by `flush`.
+    """
+
+    def __init__(
+        self,
+        algod: AsyncAlgodClient,
+        confirmations: ConfirmationTracker | None = None,
+        *,
+        max_in_flight: int = 500,
+    ) -> None:
+        self.algod = algod
+        self.confirmations = confirmations or ConfirmationTracker(algod)
+        self._window = asyncio.Semaphore(max_in_flight)
+        self._pending: set[asyncio.Future[int]] = set()
+        self._failure: BaseException | None = None
+        self.submitted = 0
+        self.confirmed = 0
+
+    def _raise_failure(self) -> None:
+        if self._failure is not None:
+            raise self._failure
+
+    async def submit(self, signed: Sequence[SignedTransaction]) -> None:
+        self._raise_failure()
+        await self._window.acquire()
+        tx_id = signed[0].get_txid()
+        confirmed = self.confirmations.track(tx_id, signed[0].transaction.last_valid_round)
+        try:
+            await self.algod.send_raw_transaction(
+                b"".join(base64.b64decode(encoding.msgpack_encode(txn)) for txn in signed)
+            )
+        except Exception:
+            self.confirmations.discard(tx_id)
+            self._window.release()
+            raise
+        self.submitted += 1
+        self._pending.add(confirmed)
+        confirmed.add_done_callback(self._done)
+
+    def _done(self, future: "asyncio.Future[int]") -> None:
+        self._pending.discard(future)
+        self._window.release()
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            self._failure = self._failure or future.exception()
+        else:
+            self.confirmed += 1
+
+    async def flush(self) -> None:
+        """Waits until every submitted group is confirmed (or has failed)."""
+        while self._pending:
+            await asyncio.wait(set(self._pending))
+        self._raise_failure()
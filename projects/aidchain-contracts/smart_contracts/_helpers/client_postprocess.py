@@ -0,0 +1,72 @@
+import re
+from pathlib import Path
+
+_POSTPROCESS_MARKER = "# Post-processed by smart_contracts._helpers.client_postprocess.\n"
+
+# A dataclass decorator directly followed by a class without base classes, which covers
+# the generated struct and `*Args` dataclasses but not the algokit_utils param subclasses.
+_DATACLASS_RE = re.compile(
+    r"^@dataclasses\.dataclass(?:\((?P<args>[^)]*)\))?\n(?P<cls>class \w+:)$",
+    re.MULTILINE,
+)
+
+_EAGER_APP_SPEC = "APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)\n"
+_LAZY_APP_SPEC = '''@functools.cache
+def _get_app_spec() -> algokit_utils.Arc56Contract:
+    """Parses the embedded app spec on first use and reuses it for the rest of the process"""
+    return algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+
+def __getattr__(name: str) -> typing.Any:
+    # Keeps `from <client> import APP_SPEC` working without parsing the spec at import time
+    if name == "APP_SPEC":
+        return _get_app_spec()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+'''
+_APP_SPEC_RE = re.compile(r"(?<![\w.])APP_SPEC(?!\w)")
+
+
+def _dataclass_args(args: str | None, *, frozen: bool) -> str:
+    options = {}
+    for option in filter(None, (part.strip() for part in (args or "").split(","))):
+        name, _, value = option.partition("=")
+        options[name.strip()] = value.strip()
+    options["frozen"] = str(frozen)
+    options["slots"] = "True"
+    return ", ".join(f"{name}={value}" for name, value in options.items())
+
+
+def slot_dataclasses(source: str, *, frozen: bool = True) -> str:
+    """Rewrites the generated struct and `*Args` dataclasses to use `__slots__`."""
+
+    def replace(match: re.Match[str]) -> str:
+        args = _dataclass_args(match["args"], frozen=frozen)
+        return f"@dataclasses.dataclass({args})\n{match['cls']}"
+
+    return _DATACLASS_RE.sub(replace, source)
+
+
+def lazy_app_spec(source: str) -> str:
+    """Replaces the import-time `APP_SPEC` parse with a memoized, on-demand accessor."""
+    if _EAGER_APP_SPEC not in source:
+        return source
+    source = source.replace(_EAGER_APP_SPEC, "")
+    source = _APP_SPEC_RE.sub("_get_app_spec()", source)
+    source = source.replace(
+        "\ndef _parse_abi_args(", f"\n{_LAZY_APP_SPEC}\ndef _parse_abi_args(", 1
+    )
+    return source.replace("import dataclasses\n", "import dataclasses\nimport functools\n", 1)
+
+
+def postprocess_client(
+    client_path: Path, *, slots: bool = True, frozen: bool = True, lazy_spec: bool = True
+) -> None:
+    """Applies the configured post-processing steps to a generated Python client in place."""
+    source = client_path.read_text()
+    if slots:
+        source = slot_dataclasses(source, frozen=frozen)
+    if lazy_spec:
+        source = lazy_app_spec(source)
+    if _POSTPROCESS_MARKER not in source:
+        header_end = source.index("\n\n") + 1
+        source = source[:header_end] + _POSTPROCESS_MARKER + source[header_end:]
+    client_path.write_text(source)
@@ -0,0 +1,94 @@
+import asyncio
+import typing
+
+from smart_contracts._helpers.async_algod import AsyncAlgodClient
+
+
+class ConfirmationTracker:
+    """
+    Resolves transaction confirmations by following new blocks.
+
+    A single background task waits for each new block (`status/wait-for-block-after`) and
+    matches the block's transaction ids against everything that is being tracked, so algod
+    sees one block wait plus one txid listing per round no matter how many transactions
+    are in flight. The task only runs while there is something to track.
+    """
+
+    def __init__(self, algod: AsyncAlgodClient) -> None:
+        self.algod = algod
+        self._pending: dict[str, tuple[asyncio.Future[int], int]] = {}
+        self._follower: asyncio.Task[None] | None = None
+        # Last round whose block was matched, so a restarted follower does not match it again.
+        self._last_round: int | None = None
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def track(self, tx_id: str, last_valid_round: int) -> "asyncio.Future[int]":
+        """
+        Starts tracking `tx_id` and returns a future resolving to its confirmed round.
+
+        Call this before submitting the transaction so the block that confirms it cannot be
+        processed before it is tracked. The future fails once `last_valid_round` has passed
+        without the transaction being seen in a block.
+        """
+        if tx_id in self._pending:
+            return self._pending[tx_id][0]
+        future: asyncio.Future[int] = asyncio.get_running_loop().create_future()
+        self._pending[tx_id] = (future, last_valid_round)
+        if self._follower is None or self._follower.done():
+            self._follower = asyncio.create_task(self._follow())
+        return future
+
+    def discard(self, tx_id: str) -> None:
+        """Stops tracking `tx_id`, e.g. because submitting it failed"""
+        entry = self._pending.pop(tx_id, None)
+        if entry is not None:
+            entry[0].cancel()
+
+    async def aclose(self) -> None:
+        for tx_id in list(self._pending):
+            self.discard(tx_id)
+        if self._follower is not None:
+            self._follower.cancel()
+            try:
+                await self._follower
+            except asyncio.CancelledError:
+                pass
+
+    async def _follow(self) -> None:
+        try:
+            # A transaction submitted while the status request is in flight can already be in
+            # the latest block (a block per group in dev mode). Nothing tracked now can be in
+            # an earlier block, so rounds that passed while the follower was stopped are
+            # skipped rather than listed (older blocks may not even be on the node).
+            status = await self.algod.status()
+            self._last_round = max(self._last_round or 0, status["last-round"] - 1)
+            while self._pending:
+                if status["last-round"] <= self._last_round:
+                    status = await self.algod.status_after_block(self._last_round)
+                for round_num in range(self._last_round + 1, status["last-round"] + 1):
+                    self._resolve(round_num, await self.algod.block_txids(round_num))
+                    self._last_round = round_num
+        except Exception as e:
+            for future, _ in self._pending.values():
+                if not future.done():
+                    future.set_exception(e)
+            self._pending.clear()
+
+    def _resolve(self, round_num: int, tx_ids: typing.Iterable[str]) -> None:
+        for tx_id in tx_ids:
+            entry = self._pending.pop(tx_id, None)
+            if entry is not None and not entry[0].done():
+                entry[0].set_result(round_num)
+        for tx_id, (future, last_valid_round) in list(self._pending.items()):
+            if round_num >= last_valid_round:
+                del self._pending[tx_id]
+                if not future.done():
+                    future.set_exception(
+                        Exception(
+                            f"Transaction {tx_id} not confirmed by its last valid round "
+                            f"{last_valid_round}"
+                        )
+                    )
@@ -0,0 +1,106 @@
+import base64
+import dataclasses
+import json
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+from smart_contracts._helpers.funding import MIN_TXN_FEE
+from smart_contracts._helpers.opcode_profile import SourceMap
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class MethodCosts:
+    """Resource usage of one ABI method call"""
+
+    opcode_budget: int
+    box_bytes_read: int
+    box_bytes_written: int
+    inner_txns: int
+    min_fee: int  # microALGO the outer transaction must pay, including pooled inner fees
+
+
+METRICS = [field.name for field in dataclasses.fields(MethodCosts)]
+
+
+def _value_size(value: Mapping[str, Any]) -> int:
+    return len(base64.b64decode(value.get("bytes", "")))
+
+
+def _inner_txns(txn_result: Mapping[str, Any]) -> list[Mapping[str, Any]]:
+    inner = txn_result.get("inner-txns", [])
+    return [*inner, *(nested for txn in inner for nested in _inner_txns(txn))]
+
+
+def measure(
+    source_map: SourceMap, simulate_response: Mapping[str, Any], txn_index: int = 0
+) -> MethodCosts:
+    """
+    Measures one app call from a simulate response with stack and state change tracing.
+    Box bytes read are the values pushed by `box_get`, box bytes written the new values
+    of box write state changes.
+    """
+    result = simulate_response["txn-groups"][0]["txn-results"][txn_index]
+    read = written = 0
+    for step in result.get("exec-trace", {}).get("approval-program-trace", []):
+        if source_map.ops.get(step["pc"], "").split(" ")[0] == "box_get":
+            additions = step.get("stack-additions", [])
+            read += _value_size(additions[0]) if additions else 0
+        for change in step.get("state-changes", []):
+            if change.get("app-state-type") == "b" and change.get("operation") == "w":
+                written += _value_size(change.get("new-value", {}))
+    inner = _inner_txns(result["txn-result"])
+    # Inner transactions that don't set their own fee are paid from the outer fee.
+    pooled = sum(1 for txn in inner if not txn["txn"]["txn"].get("fee"))
+    return MethodCosts(
+        opcode_budget=result.get("app-budget-consumed", 0),
+        box_bytes_read=read,
+        box_bytes_written=written,
+        inner_txns=len(inner),
+        min_fee=MIN_TXN_FEE * (1 + pooled),
+    )
+
+
+def load_baseline(path: Path) -> dict[str, MethodCosts]:
+    if not path.exists():
+        return {}
+    raw = json.loads(path.read_text())
+    return {method: MethodCosts(**costs) for method, costs in raw["methods"].items()}
+
+
+def save_baseline(path: Path, costs: Mapping[str, MethodCosts]) -> None:
+    path.write_text(
+        json.dumps(
+            {"methods": {method: dataclasses.asdict(costs[method]) for method in sorted(costs)}},
+            indent=2,
+        )
+        + "\n"
+    )
+
+
+def compare(
+    baseline: Mapping[str, MethodCosts],
+    current: Mapping[str, MethodCosts],
+    *,
+    threshold: float = 0.05,
+    thresholds: Mapping[str, float] | None = None,
+) -> list[str]:
+    """
+    Returns one message per metric of a method that grew by more than its threshold
+    (relative to the baseline; `thresholds` overrides it per metric). Methods missing
+    from the workload are regressions too; methods new to the baseline are not.
+    """
+    thresholds = thresholds or {}
+    regressions = []
+    for method, before in sorted(baseline.items()):
+        after = current.get(method)
+        if after is None:
+            regressions.append(f"{method}: no longer measured")
+            continue
+        for metric in METRICS:
+            old, new = getattr(before, metric), getattr(after, metric)
+            limit = old * (1 + thresholds.get(metric, threshold))
+            if new > limit:
+                change = f"+{(new - old) / old:.0%}" if old else "new"
+                regressions.append(f"{method}: {metric} {old} -> {new} ({change})")
+    return regressions
@@ -0,0 +1,105 @@
+import dataclasses
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+
+def program_hash(teal_path: Path) -> str:
+    """Returns the SHA-256 of a TEAL program (template) file."""
+    return hashlib.sha256(teal_path.read_bytes()).hexdigest()
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class Deployment:
+    app_id: int
+    approval_hash: str
+    clear_hash: str
+    creator: str = ""
+    updatable: bool = False  # compiled with TMPL_UPDATABLE set
+
+
+class DeployRegistry:
+    """
+    Local record of the last deployment of each app on each network.
+
+    Entries are keyed on (network, app name), where network is the algod address, and
+    store the app ID together with the hashes of the TEAL programs that were deployed.
+    A deploy can consult the registry to skip factory lookups, compilation and calls
+    entirely when the programs are unchanged.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        # Serializes read-modify-write updates from concurrent deploys in this process.
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(network: str, app_name: str) -> str:
+        return f"{network.rstrip('/')}|{app_name}"
+
+    def _load(self) -> dict[str, dict[str, object]]:
+        try:
+            return json.loads(self.path.read_text())  # type: ignore[no-any-return]
+        except FileNotFoundError:
+            return {}
+
+    def get(self, network: str, app_name: str) -> Deployment | None:
+        entry = self._load().get(self._key(network, app_name))
+        return Deployment(**entry) if entry else None  # type: ignore[arg-type]
+
+    def deployments(self, network: str) -> dict[str, Deployment]:
+        """Returns every app recorded on `network`, keyed by app name."""
+        prefix = self._key(network, "")
+        return {
+            key[len(prefix) :]: Deployment(**entry)  # type: ignore[arg-type]
+            for key, entry in self._load().items()
+            if key.startswith(prefix)
+        }
+
+    def unchanged(
+        self,
+        network: str,
+        app_name: str,
+        approval_hash: str,
+        clear_hash: str,
+        *,
+        creator: str,
+        updatable: bool,
+    ) -> Deployment | None:
+        """
+        Returns the recorded deployment if it was made from the same programs, by the same
+        creator and with the same updatable setting.
+        """
+        deployment = self.get(network, app_name)
+        if (
+            deployment
+            and deployment.approval_hash == approval_hash
+            and deployment.clear_hash == clear_hash
+            and deployment.creator == creator
+            and deployment.updatable == updatable
+        ):
+            return deployment
+        return None
+
+    def _save(self, entries: dict[str, dict[str, object]]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file and rename it so readers never see a partial registry.
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}-")
+        with os.fdopen(fd, "w") as tmp:
+            json.dump(entries, tmp, indent=2, sort_keys=True)
+        os.replace(tmp_name, self.path)
+
+    def record(self, network: str, app_name: str, deployment: Deployment) -> None:
+        with self._lock:
+            entries = self._load()
+            entries[self._key(network, app_name)] = dataclasses.asdict(deployment)
+            self._save(entries)
+
+    def forget(self, network: str, app_name: str) -> None:
+        with self._lock:
+            entries = self._load()
+            if entries.pop(self._key(network, app_name), None) is not None:
+                self._save(entries)
@@ -0,0 +1,206 @@
+import dataclasses
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+import tomllib
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+
+import algokit_utils
+
+from smart_contracts._helpers.deploy_registry import Deployment
+
+logger = logging.getLogger(__name__)
+
+_NAMED_NETWORKS: dict[str, Callable[[], algokit_utils.AlgorandClient]] = {
+    "localnet": algokit_utils.AlgorandClient.default_localnet,
+    "testnet": algokit_utils.AlgorandClient.testnet,
+    "mainnet": algokit_utils.AlgorandClient.mainnet,
+}
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class FleetTarget:
+    """One app instance to roll out: where, by whom and under which app name"""
+
+    name: str
+    app_name: str
+    # localnet, testnet, mainnet or an algod URL.
+    network: str = "localnet"
+    # Environment prefix of the deployer account, i.e. <deployer>_MNEMONIC.
+    deployer: str = "DEPLOYER"
+    # Environment variable holding the algod token, for algod URLs.
+    algod_token_env: str | None = None
+
+    def algorand(self) -> algokit_utils.AlgorandClient:
+        if self.network in _NAMED_NETWORKS:
+            return _NAMED_NETWORKS[self.network]()
+        token = os.getenv(self.algod_token_env) if self.algod_token_env else None
+        return algokit_utils.AlgorandClient.from_config(
+            algokit_utils.AlgoClientNetworkConfig(server=self.network, token=token)
+        )
+
+
+def load_manifest(path: Path) -> list[FleetTarget]:
+    """
+    Reads a TOML manifest of `[[targets]]` tables. Keys in an optional `[defaults]` table
+    apply to every target that does not set them.
+    """
+    manifest = tomllib.loads(path.read_text())
+    defaults = manifest.get("defaults", {})
+    targets = [FleetTarget(**{**defaults, **target}) for target in manifest.get("targets", [])]
+    names = [target.name for target in targets]
+    if duplicates := sorted({name for name in names if names.count(name) > 1}):
+        raise Exception(f"Duplicate fleet targets in {path}: {', '.join(duplicates)}")
+    return targets
+
+
+@dataclasses.dataclass(kw_only=True)
+class TargetStatus:
+    """Outcome of the most recent rollout attempt for one target"""
+
+    state: str = "pending"  # pending, running, succeeded, failed or skipped
+    revision: str = ""
+    app_id: int = 0
+    operation: str = ""
+    error: str = ""
+    seconds: float = 0.0
+
+
+class RolloutLog:
+    """
+    Per-target rollout status, persisted after every change.
+
+    A rollout is identified by its revision (the hashes of the programs being rolled out),
+    so a resumed rollout of the same revision skips every target that already succeeded
+    and a new revision starts over.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        try:
+            entries = json.loads(path.read_text())
+        except FileNotFoundError:
+            entries = {}
+        self.statuses = {name: TargetStatus(**entry) for name, entry in entries.items()}
+
+    def get(self, name: str) -> TargetStatus:
+        return self.statuses.get(name) or TargetStatus()
+
+    def update(self, name: str, status: TargetStatus) -> None:
+        with self._lock:
+            self.statuses[name] = status
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}-")
+            with os.fdopen(fd, "w") as tmp:
+                json.dump(
+                    {name: dataclasses.asdict(entry) for name, entry in self.statuses.items()},
+                    tmp,
+                    indent=2,
+                    sort_keys=True,
+                )
+            os.replace(tmp_name, self.path)
+
+
+# Deploys one target, returning its deployment and the operation performed.
+DeployTarget = Callable[[FleetTarget], tuple[Deployment, str]]
+
+
+def rollout(
+    targets: Iterable[FleetTarget],
+    deploy_target: DeployTarget,
+    log: RolloutLog,
+    *,
+    revision: str,
+    max_parallel: int = 8,
+    max_failures: int | None = None,
+    resume: bool = True,
+) -> dict[str, TargetStatus]:
+    """
+    Deploys all targets with up to `max_parallel` in flight and returns their statuses.
+
+    Deploys are network-bound, so a rollout takes roughly len(targets) / max_parallel
+    times as long as one deploy. A failing target does not stop the others; once
+    `max_failures` targets have failed, targets not yet started are marked skipped.
+    When resuming, targets that already succeeded at `revision` are not deployed again.
+    """
+    targets = list(targets)
+    todo = []
+    for target in targets:
+        status = log.get(target.name)
+        if resume and status.state == "succeeded" and status.revision == revision:
+            logger.info(f"[{target.name}] already rolled out, skipping")
+        else:
+            todo.append(target)
+    if not todo:
+        return {target.name: log.get(target.name) for target in targets}
+
+    def run(target: FleetTarget) -> None:
+        log.update(target.name, TargetStatus(state="running", revision=revision))
+        logger.info(f"[{target.name}] deploying {target.app_name} to {target.network}")
+        started = time.monotonic()
+        try:
+            deployment, operation = deploy_target(target)
+        except Exception as e:
+            log.update(
+                target.name,
+                TargetStatus(
+                    state="failed",
+                    revision=revision,
+                    error=str(e) or type(e).__name__,
+                    seconds=time.monotonic() - started,
+                ),
+            )
+            logger.error(f"[{target.name}] failed: {e}")
+            raise
+        log.update(
+            target.name,
+            TargetStatus(
+                state="succeeded",
+                revision=revision,
+                app_id=deployment.app_id,
+                operation=operation,
+                seconds=time.monotonic() - started,
+            ),
+        )
+        logger.info(f"[{target.name}] {operation} app {deployment.app_id}")
+
+    # Targets are submitted as slots free up rather than all at once, so that no new
+    # deploy starts once the failure limit is reached.
+    queue = iter(todo)
+    failures = 0
+    with ThreadPoolExecutor(max_workers=max_parallel) as executor:
+        pending: set[Future[None]] = set()
+        while True:
+            halted = max_failures is not None and failures >= max_failures
+            while not halted and len(pending) < max_parallel:
+                target = next(queue, None)
+                if target is None:
+                    break
+                pending.add(executor.submit(run, target))
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            failures += sum(future.exception() is not None for future in done)
+    for target in queue:
+        log.update(target.name, TargetStatus(state="skipped", revision=revision))
+        logger.warning(f"[{target.name}] skipped after {failures} failures")
+    return {target.name: log.get(target.name) for target in targets}
+
+
+def format_report(statuses: dict[str, TargetStatus]) -> str:
+    width = max((len(name) for name in statuses), default=0)
+    lines = []
+    for name, status in statuses.items():
+        detail = (
+            f"{status.operation} app {status.app_id}"
+            if status.state == "succeeded"
+            else status.error
+        )
+        lines.append(f"{name:<{width}}  {status.state:<9}  {status.seconds:6.1f}s  {detail}")
+    return "\n".join(lines)
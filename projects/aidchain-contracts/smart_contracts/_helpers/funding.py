@@ -0,0 +1,115 @@
+import base64
+import dataclasses
+import typing
+from collections.abc import Mapping
+
+# Consensus minimum balance parameters, in microALGO.
+ACCOUNT_MIN_BALANCE = 100_000
+ASSET_MIN_BALANCE = 100_000
+BOX_FLAT_MIN_BALANCE = 2_500
+BOX_BYTE_MIN_BALANCE = 400
+APP_PAGE_MIN_BALANCE = 100_000
+SCHEMA_MIN_BALANCE = 25_000
+SCHEMA_UINT_MIN_BALANCE = 3_500
+SCHEMA_BYTES_MIN_BALANCE = 25_000
+MIN_TXN_FEE = 1_000
+
+_STATIC_SIZES = {"uint8": 1, "uint16": 2, "uint32": 4, "uint64": 8, "byte": 1, "bool": 1}
+_DYNAMIC_TYPES = {"string", "byte[]"}
+
+
+def struct_size(
+    struct_name: str, structs: Mapping[str, list[dict[str, str]]], dynamic_bytes: int
+) -> int:
+    """
+    Returns the ARC-4 encoded size of a struct, assuming `dynamic_bytes` of content for
+    every string or byte array field (each also costs a 2 byte offset and 2 byte length).
+    """
+    size = 0
+    for field in structs[struct_name]:
+        field_type = field["type"]
+        if field_type in _STATIC_SIZES:
+            size += _STATIC_SIZES[field_type]
+        elif field_type in _DYNAMIC_TYPES:
+            size += 2 + 2 + dynamic_bytes
+        elif field_type in structs:
+            size += struct_size(field_type, structs, dynamic_bytes)
+        else:
+            raise Exception(f"Cannot size field {field['name']} of type {field_type}")
+    return size
+
+
+def box_min_balance(name_size: int, value_size: int) -> int:
+    return BOX_FLAT_MIN_BALANCE + BOX_BYTE_MIN_BALANCE * (name_size + value_size)
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class FundingPlan:
+    """Balance an app account needs for a given amount of usage, in microALGO"""
+
+    account_min_balance: int
+    box_min_balance: int
+    asset_min_balance: int
+    fee_budget: int
+    # Paid by the creator's account, not the app's; reported for deployer budgeting.
+    creator_min_balance: int
+
+    @property
+    def required(self) -> int:
+        return (
+            self.account_min_balance
+            + self.box_min_balance
+            + self.asset_min_balance
+            + self.fee_budget
+        )
+
+    def top_up(self, balance: int) -> int:
+        """Returns the payment needed to bring an account holding `balance` up to the plan."""
+        return max(0, self.required - balance)
+
+
+def plan_funding(
+    app_spec: Mapping[str, typing.Any],
+    *,
+    boxes: Mapping[str, int],
+    dynamic_bytes: int = 32,
+    created_assets: int = 0,
+    inner_txns: int = 0,
+    min_fee: int = MIN_TXN_FEE,
+) -> FundingPlan:
+    """
+    Computes the balance an app needs from its ARC-56 spec and expected usage.
+
+    `boxes` gives the expected number of entries per uint64-keyed box map, `created_assets`
+    the number of ASAs the app itself will create (each raising its minimum balance) and
+    `inner_txns` the number of inner transactions whose fees the app pays.
+    """
+    structs = app_spec["structs"]
+    box_maps = app_spec["state"]["maps"]["box"]
+    box_total = 0
+    for map_name, count in boxes.items():
+        spec = box_maps[map_name]
+        if spec["keyType"] != "uint64":
+            raise Exception(f"Cannot size box map {map_name} with key type {spec['keyType']}")
+        name_size = len(base64.b64decode(spec.get("prefix") or "")) + 8
+        value_type = spec["valueType"]
+        value_size = (
+            struct_size(value_type, structs, dynamic_bytes)
+            if value_type in structs
+            else _STATIC_SIZES[value_type]
+        )
+        box_total += count * box_min_balance(name_size, value_size)
+
+    schema = app_spec["state"]["schema"]["global"]
+    extra_pages = app_spec.get("extraPages", 0) or 0
+    return FundingPlan(
+        account_min_balance=ACCOUNT_MIN_BALANCE,
+        box_min_balance=box_total,
+        asset_min_balance=created_assets * ASSET_MIN_BALANCE,
+        fee_budget=inner_txns * min_fee,
+        creator_min_balance=(
+            APP_PAGE_MIN_BALANCE * (1 + extra_pages)
+            + (SCHEMA_MIN_BALANCE + SCHEMA_UINT_MIN_BALANCE) * schema["ints"]
+            + (SCHEMA_MIN_BALANCE + SCHEMA_BYTES_MIN_BALANCE) * schema["bytes"]
+        ),
+    )
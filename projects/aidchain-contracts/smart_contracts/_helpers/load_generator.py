@@ -0,0 +1,222 @@
+import asyncio
+import dataclasses
+import math
+import random
+import re
+from collections import Counter, defaultdict
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from typing import Any
+
+_TXID = re.compile(r"\b[A-Z2-7]{52}\b")
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class Call:
+    """One scheduled ABI method call; `arrived` is its scheduled event loop time."""
+
+    method: str
+    args: tuple[Any, ...]
+    arrived: float
+    # Workload specific data, e.g. the record ID a create call is expected to get.
+    context: Any = None
+
+
+def parse_mix(spec: str) -> dict[str, float]:
+    """Parses "method=weight,method=weight" (a bare method has weight 1) into a mix."""
+    mix: dict[str, float] = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        method, _, weight = item.partition("=")
+        mix[method.strip()] = float(weight) if weight else 1.0
+    if not mix or any(weight < 0 for weight in mix.values()) or not sum(mix.values()):
+        raise Exception(f"Invalid method mix {spec!r}")
+    return mix
+
+
+def arrival_times(
+    rate: float, duration: float, *, rng: random.Random, poisson: bool = True
+) -> list[float]:
+    """
+    Offsets in seconds at which calls arrive over `duration`: a Poisson process with `rate`
+    calls per second, or exactly every 1 / `rate` seconds with `poisson=False`.
+    """
+    if rate <= 0:
+        raise Exception("The arrival rate must be positive")
+    if not poisson:
+        return [index / rate for index in range(int(rate * duration))]
+    times: list[float] = []
+    offset = rng.expovariate(rate)
+    while offset < duration:
+        times.append(offset)
+        offset += rng.expovariate(rate)
+    return times
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of already sorted values (0 when there are none)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(len(sorted_values) * fraction))
+    return sorted_values[min(len(sorted_values), rank) - 1]
+
+
+def rejection_reason(error: BaseException) -> str:
+    """A short error description with transaction IDs removed, so equal errors group."""
+    message = _TXID.sub("<txid>", str(error) or type(error).__name__)
+    return message.split("\n")[0][:120]
+
+
+class LoadStats:
+    """Per-method outcomes of a load run: confirmation latencies, rejections and fees."""
+
+    def __init__(self) -> None:
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.rejected: Counter[str] = Counter()
+        self.reasons: Counter[str] = Counter()
+        self.fees = 0
+        self.groups = 0
+        self.max_lag = 0.0
+
+    def record_confirmed(self, calls: Sequence[Call], done: float, fee: int = 0) -> None:
+        for call in calls:
+            self.latencies[call.method].append(done - call.arrived)
+        self.fees += fee
+
+    def record_rejected(self, calls: Sequence[Call], error: BaseException) -> None:
+        for call in calls:
+            self.rejected[call.method] += 1
+        self.reasons[rejection_reason(error)] += len(calls)
+
+    @property
+    def confirmed(self) -> int:
+        return sum(len(values) for values in self.latencies.values())
+
+
+def format_report(stats: LoadStats, elapsed: float, *, summary: bool = True) -> str:
+    """The per-method table, followed by totals, fees and rejections unless `summary` is off."""
+    header = (
+        f"{'method':<26}{'ok':>8}{'rejected':>10}{'calls/s':>10}"
+        f"{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'max ms':>10}"
+    )
+    lines = [header]
+
+    def row(name: str, values: list[float], rejected: int) -> str:
+        values = sorted(values)
+        return (
+            f"{name:<26}{len(values):>8}{rejected:>10}{len(values) / elapsed:>10.1f}"
+            + "".join(
+                f"{percentile(values, fraction) * 1000:>10.0f}"
+                for fraction in (0.5, 0.9, 0.99, 1.0)
+            )
+        )
+
+    for method in sorted(set(stats.latencies) | set(stats.rejected)):
+        lines.append(row(method, stats.latencies.get(method, []), stats.rejected[method]))
+    everything = [value for values in stats.latencies.values() for value in values]
+    lines.append(row("total", everything, sum(stats.rejected.values())))
+    if not summary:
+        return "\n".join(lines)
+
+    lines.append("")
+    lines.append(f"Duration {elapsed:.1f}s, {stats.groups} groups sent")
+    per_call = stats.fees / stats.confirmed if stats.confirmed else 0
+    lines.append(f"Fees paid {stats.fees:,} microALGO ({per_call:,.0f} per confirmed call)")
+    lines.append(f"Largest lag behind the arrival schedule {stats.max_lag * 1000:.0f} ms")
+    if stats.reasons:
+        lines.append("Rejections:")
+        lines += [f"  {count:>6}  {reason}" for reason, count in stats.reasons.most_common(10)]
+    return "\n".join(lines)
+
+
+class GroupPacker:
+    """
+    Packs calls into atomic groups of up to `group_size`. A group is sent as soon as it is
+    full or `linger` seconds after its first call arrived, whichever comes first. Sends run
+    concurrently; `send_group` records its own outcome and should not raise.
+    """
+
+    def __init__(
+        self,
+        send_group: Callable[[list[Call]], Awaitable[None]],
+        *,
+        group_size: int = 1,
+        linger: float = 0.01,
+    ) -> None:
+        if not 0 < group_size <= 16:
+            raise Exception("group_size must be between 1 and 16")
+        self._send_group = send_group
+        self.group_size = group_size
+        self.linger = linger
+        self._pending: list[Call] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def add(self, call: Call) -> None:
+        self._pending.append(call)
+        if len(self._pending) >= self.group_size:
+            self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.linger, self.flush)
+
+    def flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        calls, self._pending = self._pending, []
+        self.spawn(self._send_group(calls))
+
+    def spawn(self, send: Awaitable[None]) -> None:
+        """Runs a send in the background; `drain` waits for it."""
+
+        async def run() -> None:
+            await send
+
+        task = asyncio.ensure_future(run())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def drain(self) -> None:
+        self.flush()
+        while self._tasks:
+            await asyncio.gather(*self._tasks)
+
+
+async def run_schedule(offsets: Sequence[float], on_arrival: Callable[[int, float], None]) -> float:
+    """
+    Calls `on_arrival(index, scheduled_time)` at each of the ascending `offsets` (seconds
+    from now). It never waits for earlier calls to finish (open loop), so latency is
+    measured from the scheduled arrival even when the system under test falls behind.
+    Returns the largest lag behind the schedule, which should stay small for the run to
+    have produced the requested rate.
+    """
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    max_lag = 0.0
+    for index, offset in enumerate(offsets):
+        scheduled = start + offset
+        delay = scheduled - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        max_lag = max(max_lag, loop.time() - scheduled)
+        on_arrival(index, scheduled)
+    return max_lag
+
+
+async def run_open_loop(
+    arrivals: Sequence[float],
+    mix: Mapping[str, float],
+    on_arrival: Callable[[str, float], None],
+    *,
+    rng: random.Random,
+) -> float:
+    """
+    Calls `on_arrival(method, scheduled_time)` at each arrival offset with a method drawn
+    from `mix`, open loop like `run_schedule`. Returns the largest lag behind the schedule.
+    """
+    methods, weights = list(mix), list(mix.values())
+
+    def arrive(_: int, scheduled: float) -> None:
+        on_arrival(rng.choices(methods, weights)[0], scheduled)
+
+    return await run_schedule(arrivals, arrive)
@@ -0,0 +1,114 @@
+import logging
+import os
+import threading
+from collections.abc import Callable
+
+import algokit_utils
+from algosdk.logic import get_application_address
+
+from smart_contracts._helpers.funding import MIN_TXN_FEE
+
+logger = logging.getLogger(__name__)
+
+# An atomic group holds at most 16 transactions.
+MAX_GROUP_SIZE = 16
+
+
+def worker_id() -> str:
+    """The pytest-xdist worker running this process ("gw0", "gw1", ...), or "main"."""
+    return os.getenv("PYTEST_XDIST_WORKER", "main")
+
+
+class AppPool:
+    """
+    Hands out fresh app IDs, creating them `batch_size` at a time through `create_batch`
+    (which returns the IDs of the apps it created) whenever the pool runs dry.
+    """
+
+    def __init__(self, create_batch: Callable[[int], list[int]], batch_size: int = 8) -> None:
+        if not 0 < batch_size <= MAX_GROUP_SIZE:
+            raise Exception(f"batch_size must be between 1 and {MAX_GROUP_SIZE}")
+        self._create_batch = create_batch
+        self.batch_size = batch_size
+        self._available: list[int] = []
+        self._lock = threading.Lock()
+        self.created = 0
+
+    def take(self) -> int:
+        with self._lock:
+            if not self._available:
+                app_ids = self._create_batch(self.batch_size)
+                self.created += len(app_ids)
+                self._available.extend(reversed(app_ids))
+            return self._available.pop()
+
+
+def batch_spending(count: int, app_funding: int, creator_min_balance: int) -> int:
+    """
+    MicroALGO a sender spends creating and funding `count` apps: each app's funding and two
+    fees, plus the minimum balance each created app adds to the creator's account.
+    """
+    return count * (app_funding + creator_min_balance + 2 * MIN_TXN_FEE)
+
+
+def fund_worker(
+    algorand: algokit_utils.AlgorandClient, min_spending_balance: int
+) -> algokit_utils.SigningAccount:
+    """A new account for this worker, funded from the localnet dispenser."""
+    account = algorand.account.random()
+    algorand.account.ensure_funded(
+        account,
+        algorand.account.localnet_dispenser(),
+        algokit_utils.AlgoAmount.from_micro_algo(min_spending_balance),
+    )
+    logger.info(f"Worker {worker_id()} account {account.address}")
+    return account
+
+
+def batch_creator(
+    algorand: algokit_utils.AlgorandClient,
+    create_params: Callable[[str], algokit_utils.AppCreateParams],
+    sender: algokit_utils.SigningAccount,
+    app_funding: int,
+    creator_min_balance: int,
+) -> Callable[[int], list[int]]:
+    """
+    Returns a `create_batch` for AppPool that creates the apps in one group sent by `sender`
+    and then pays each app account `app_funding` microALGO in a second group. The dispenser
+    tops `sender` up first when it could not afford the batch, including the
+    `creator_min_balance` each created app adds to the sender's minimum balance
+    (`FundingPlan.creator_min_balance`).
+    """
+    created = 0
+
+    def create_batch(count: int) -> list[int]:
+        nonlocal created
+        algorand.account.ensure_funded(
+            sender,
+            algorand.account.localnet_dispenser(),
+            algokit_utils.AlgoAmount.from_micro_algo(
+                batch_spending(count, app_funding, creator_min_balance)
+            ),
+        )
+        group = algorand.new_group()
+        for index in range(created, created + count):
+            # Otherwise identical creates need distinct notes.
+            group.add_app_create(create_params(f"{worker_id()}:{index}"))
+        result = group.send()
+        created += count
+        app_ids = [confirmation["application-index"] for confirmation in result.confirmations]
+
+        funding = algorand.new_group()
+        for app_id in app_ids:
+            funding.add_payment(
+                algokit_utils.PaymentParams(
+                    sender=sender.address,
+                    receiver=get_application_address(app_id),
+                    amount=algokit_utils.AlgoAmount.from_micro_algo(app_funding),
+                )
+            )
+        funding.send()
+        logger.info(f"Worker {worker_id()} created apps {app_ids}")
+        return app_ids
+
+    return create_batch
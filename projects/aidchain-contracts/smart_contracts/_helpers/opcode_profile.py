@@ -0,0 +1,203 @@
+import dataclasses
+import functools
+import json
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+_BASE64 = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+_INTCBLOCK = 0x20
+_BYTECBLOCK = 0x26
+
+# Opcodes whose budget cost is not 1 (fixed-cost ones only; per-byte costs are not modelled).
+_OPCODE_COSTS = {
+    "sha256": 35,
+    "keccak256": 130,
+    "sha512_256": 45,
+    "sha3_256": 130,
+    "ed25519verify": 1900,
+    "ed25519verify_bare": 1900,
+    "ecdsa_verify": 1700,
+    "ecdsa_pk_decompress": 650,
+    "ecdsa_pk_recover": 2000,
+    "vrf_verify": 5700,
+    "falcon_verify": 1700,
+    "b+": 10,
+    "b-": 10,
+    "b*": 20,
+    "b/": 20,
+    "b%": 20,
+}
+
+
+def opcode_cost(op: str) -> int:
+    return _OPCODE_COSTS.get(op.split()[0], 1)
+
+
+def _decode_vlq(segment: str) -> list[int]:
+    values = []
+    value = shift = 0
+    for char in segment:
+        digit = _BASE64.index(char)
+        value += (digit & 31) << shift
+        if digit & 32:
+            shift += 5
+            continue
+        values.append(-(value >> 1) if value & 1 else value >> 1)
+        value = shift = 0
+    return values
+
+
+@dataclasses.dataclass
+class SourceMap:
+    """A puya `*.puya.map`: the source line and opcode at each program counter"""
+
+    sources: list[Path]
+    lines: dict[int, tuple[int, int]]  # pc -> (source index, 1-based line)
+    ops: dict[int, str]
+
+    def source_line(self, source: int, line: int) -> str:
+        text = _read_lines(self.sources[source])
+        return text[line - 1].strip() if 0 < line <= len(text) else ""
+
+
+@functools.cache
+def _read_lines(path: Path) -> list[str]:
+    return path.read_text().splitlines()
+
+
+def _read_varuint(program: bytes, pc: int) -> tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = program[pc]
+        pc += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pc
+        shift += 7
+
+
+def constant_blocks_end(program: bytes) -> int:
+    """Program counter of the first op after the leading intcblock and bytecblock."""
+    _, pc = _read_varuint(program, 0)  # version
+    while pc < len(program) and program[pc] in (_INTCBLOCK, _BYTECBLOCK):
+        opcode = program[pc]
+        count, pc = _read_varuint(program, pc + 1)
+        for _ in range(count):
+            value, pc = _read_varuint(program, pc)
+            if opcode == _BYTECBLOCK:
+                pc += value
+    return pc
+
+
+def load_source_map(path: Path, program: bytes | None = None) -> SourceMap:
+    """
+    Reads a source map written by `puyapy --output-source-map`. Each generated "line" of
+    the mappings is one program counter, so pc N maps to the first segment of line N.
+
+    For programs with template variables puya leaves the constant blocks out of the map
+    (their size depends on the substituted values) and counts from the first op after
+    them. Pass the deployed `program` to shift those pcs onto the ones algod reports;
+    without it they stay relative to the end of the constant blocks.
+    """
+    raw = json.loads(path.read_text())
+    # `op_pc_offset` counts the constant block ops left out, not bytes.
+    offset = constant_blocks_end(program) if raw.get("op_pc_offset") and program else 0
+    lines: dict[int, tuple[int, int]] = {}
+    source = line = 0
+    for pc, group in enumerate(raw["mappings"].split(";")):
+        mapped = None
+        for segment in filter(None, group.split(",")):
+            fields = _decode_vlq(segment)
+            if len(fields) >= 4:
+                source += fields[1]
+                line += fields[2]
+                mapped = mapped or (source, line + 1)
+        if mapped:
+            lines[pc + offset] = mapped
+    return SourceMap(
+        sources=[(path.parent / source_path).resolve() for source_path in raw["sources"]],
+        lines=lines,
+        ops={
+            int(pc) + offset: event["op"]
+            for pc, event in raw["pc_events"].items()
+            if "op" in event
+        },
+    )
+
+
+@dataclasses.dataclass
+class LineCost:
+    source: int
+    line: int
+    cost: int = 0
+    ops: Counter[str] = dataclasses.field(default_factory=Counter)
+
+
+@dataclasses.dataclass
+class MethodProfile:
+    method: str
+    budget_consumed: int
+    lines: list[LineCost]
+    unmapped: int  # cost of ops with no source line (generated routing and setup code)
+
+
+def approval_trace(simulate_response: dict[str, Any], txn_index: int = 0) -> list[int]:
+    """Program counters executed by one transaction's approval program, in order."""
+    result = simulate_response["txn-groups"][0]["txn-results"][txn_index]
+    return [step["pc"] for step in result.get("exec-trace", {}).get("approval-program-trace", [])]
+
+
+def profile_trace(
+    source_map: SourceMap, method: str, pcs: Iterable[int], budget_consumed: int = 0
+) -> MethodProfile:
+    """Attributes the opcode cost of an approval program trace to source lines."""
+    by_line: dict[tuple[int, int], LineCost] = {}
+    unmapped = 0
+    for pc in pcs:
+        op = source_map.ops.get(pc, "?")
+        cost = opcode_cost(op)
+        location = source_map.lines.get(pc)
+        if location is None:
+            unmapped += cost
+            continue
+        line_cost = by_line.setdefault(location, LineCost(*location))
+        line_cost.cost += cost
+        line_cost.ops[op.split()[0]] += 1
+    lines = sorted(by_line.values(), key=lambda line_cost: -line_cost.cost)
+    total = sum(line_cost.cost for line_cost in lines) + unmapped
+    return MethodProfile(method, budget_consumed or total, lines, unmapped)
+
+
+def format_report(source_map: SourceMap, profiles: list[MethodProfile], top: int = 5) -> str:
+    """Per-method hot spots followed by the most expensive lines over all methods."""
+    output = []
+    totals: dict[tuple[int, int], int] = defaultdict(int)
+
+    def location(source: int, line: int) -> str:
+        # Contracts composed from others map to several contract.py files; keep the folder.
+        path = source_map.sources[source]
+        return f"{path.parent.name}/{path.name}:{line}"
+
+    for profile in sorted(profiles, key=lambda profile: -profile.budget_consumed):
+        output.append(
+            f"{profile.method}: {profile.budget_consumed} budget "
+            f"({profile.unmapped} without a source line)"
+        )
+        for line_cost in profile.lines[:top]:
+            ops = ", ".join(f"{op}x{count}" for op, count in line_cost.ops.most_common(3))
+            output.append(
+                f"  {line_cost.cost:>6}  {location(line_cost.source, line_cost.line):<36} "
+                f"{source_map.source_line(line_cost.source, line_cost.line)[:60]:<60}  {ops}"
+            )
+        for line_cost in profile.lines:
+            totals[(line_cost.source, line_cost.line)] += line_cost.cost
+
+    output.append("")
+    output.append("Hot spots over all methods:")
+    for (source, line), cost in sorted(totals.items(), key=lambda item: -item[1])[: top * 4]:
+        output.append(
+            f"  {cost:>6}  {location(source, line):<36} {source_map.source_line(source, line)[:60]}"
+        )
+    return "\n".join(output)
@@ -0,0 +1,155 @@
+import base64
+import json
+import re
+from pathlib import Path
+
+# Fixed-size ARC-4 types that map directly onto a `struct` format character.
+_STATIC_FORMATS = {
+    "uint8": "B",
+    "byte": "B",
+    "uint16": "H",
+    "uint32": "I",
+    "uint64": "Q",
+}
+_STATIC_SIZES = {"B": 1, "H": 2, "I": 4, "Q": 8}
+_DYNAMIC_TYPES = {"string"}
+# Names used by the generated functions themselves; fields with these names fall back.
+_RESERVED_NAMES = {"data", "offset", "value", "prefix", "decode"}
+
+_HEADER = '''# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# This file was automatically generated by smart_contracts._helpers.struct_codecs.
+# DO NOT MODIFY IT BY HAND.
+
+import struct
+import typing
+
+from .{client_module} import (
+{imports}
+)
+
+_U16 = struct.Struct(">H")
+'''
+
+
+def snake_case(name: str) -> str:
+    """Converts a contract name such as 'AidchainContracts' to 'aidchain_contracts'."""
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+
+
+def is_supported(fields: list[dict]) -> bool:
+    """Checks whether every field of a struct can be handled by the generated codecs."""
+    return all(
+        isinstance(field["type"], str)
+        and field["name"] not in _RESERVED_NAMES
+        and (field["type"] in _STATIC_FORMATS or field["type"] in _DYNAMIC_TYPES)
+        for field in fields
+    )
+
+
+def _render_struct(struct_name: str, fields: list[dict]) -> str:
+    func_name = snake_case(struct_name)
+    head_name = f"_{func_name.upper()}_HEAD"
+    head_format = ">" + "".join(
+        _STATIC_FORMATS.get(field["type"], "H") for field in fields
+    )
+    head_size = sum(_STATIC_SIZES[char] for char in head_format[1:])
+    names = [field["name"] for field in fields]
+    dynamic = [field["name"] for field in fields if field["type"] in _DYNAMIC_TYPES]
+    # Head slots hold the tail offset for dynamic fields and the value for static ones.
+    slots = [f"{name}_offset" if name in dynamic else name for name in names]
+
+    lines = [
+        f"{head_name} = struct.Struct({head_format!r})",
+        "",
+        "",
+        f"def decode_{func_name}(data: bytes, offset: int = 0) -> {struct_name}:",
+        f'    """Decodes an ARC-4 encoded {struct_name} starting at `offset`."""',
+        f"    {', '.join(slots)}, = {head_name}.unpack_from(data, offset)",
+    ]
+    for name in dynamic:
+        lines += [
+            f"    {name}_start = offset + {name}_offset + 2",
+            f"    {name} = bytes(data[{name}_start:{name}_start + _U16.unpack_from(data, offset + {name}_offset)[0]]).decode(\"utf-8\")",
+        ]
+    lines += [
+        f"    return {struct_name}({', '.join(names)})",
+        "",
+        "",
+        f"def encode_{func_name}(value: {struct_name}) -> bytes:",
+        f'    """Encodes a {struct_name} into its ARC-4 tuple representation."""',
+    ]
+    for name in dynamic:
+        lines.append(f'    {name} = value.{name}.encode("utf-8")')
+    previous = None
+    for name in dynamic:
+        if previous is None:
+            lines.append(f"    {name}_offset = {head_size}")
+        else:
+            lines.append(f"    {name}_offset = {previous}_offset + 2 + len({previous})")
+        previous = name
+    pack_args = ", ".join(
+        f"{name}_offset" if name in dynamic else f"value.{name}" for name in names
+    )
+    parts = [f"{head_name}.pack({pack_args})"]
+    for name in dynamic:
+        parts += [f"_U16.pack(len({name}))", name]
+    lines += [f"    return b\"\".join(({', '.join(parts)}))", "", ""]
+    return "\n".join(lines)
+
+
+def render_codecs(app_spec: dict, client_module: str) -> str:
+    """Renders a module with specialized encode/decode functions for each struct."""
+    structs = {
+        name: fields
+        for name, fields in sorted(app_spec.get("structs", {}).items())
+        if is_supported(fields)
+    }
+    sections = [
+        _HEADER.format(
+            client_module=client_module,
+            imports="\n".join(f"    {name}," for name in structs),
+        ),
+        "",
+    ]
+    sections += [_render_struct(name, fields) for name, fields in structs.items()]
+
+    decoders = "\n".join(
+        f'    "{name}": decode_{snake_case(name)},' for name in structs
+    )
+    encoders = "\n".join(
+        f'    "{name}": encode_{snake_case(name)},' for name in structs
+    )
+    box_maps = "\n".join(
+        f'    "{map_name}": ({base64.b64decode(spec.get("prefix") or "")!r}, '
+        f'decode_{snake_case(spec["valueType"])}),'
+        for map_name, spec in app_spec["state"]["maps"]["box"].items()
+        if spec["valueType"] in structs and spec["keyType"] == "uint64"
+    )
+    sections.append(
+        "DECODERS: dict[str, typing.Callable[[bytes], typing.Any]] = {\n"
+        f"{decoders}\n"
+        "}\n\n"
+        "ENCODERS: dict[str, typing.Callable[[typing.Any], bytes]] = {\n"
+        f"{encoders}\n"
+        "}\n\n"
+        "# Box map name -> (box name prefix, value decoder) for uint64-keyed struct maps\n"
+        "BOX_MAPS: dict[str, tuple[bytes, typing.Callable[[bytes], typing.Any]]] = {\n"
+        f"{box_maps}\n"
+        "}\n\n\n"
+        "def decode_box(map_name: str, box_name: bytes, value: bytes) -> tuple[int, typing.Any]:\n"
+        '    """Decodes a raw box name and value from one of the BOX_MAPS into (key, struct)."""\n'
+        "    prefix, decode = BOX_MAPS[map_name]\n"
+        '    return int.from_bytes(box_name[len(prefix):], "big"), decode(value)\n'
+    )
+    return "\n".join(sections)
+
+
+def generate_codecs(app_spec_path: Path, output_dir: Path) -> Path:
+    """Writes `<contract>_codecs.py` next to the generated client for an ARC-56 spec."""
+    app_spec = json.loads(app_spec_path.read_text())
+    contract_module = snake_case(app_spec["name"])
+    output_path = output_dir / f"{contract_module}_codecs.py"
+    output_path.write_text(render_codecs(app_spec, f"{contract_module}_client"))
+    return output_path
@@ -0,0 +1,318 @@
+import dataclasses
+import re
+from collections.abc import Iterator
+from pathlib import Path
+
+from smart_contracts._helpers.opcode_profile import opcode_cost
+
+# Maximum opcode budget of a single app call (more needs pooled budget from the group).
+APP_CALL_BUDGET = 700
+
+_BRANCHES = {"b", "bz", "bnz"}
+_TERMINATORS = {"b", "return", "err", "retsub", "match", "switch"}
+# Size in bytes of opcodes with fixed-size immediates (all others are 1 byte).
+_FIXED_SIZES = {
+    **dict.fromkeys(["b", "bz", "bnz", "callsub", "extract", "substring", "proto"], 3),
+    **dict.fromkeys(["txna", "gtxn", "gtxnsa", "gtxnas", "gload", "itxna", "gitxn", "gitxnas"], 3),
+    **dict.fromkeys(["gtxna", "gitxna"], 4),
+    **dict.fromkeys(
+        [
+            "intc", "bytec", "arg", "load", "store", "gloads", "gaid", "txn", "txnas", "gtxns",
+            "gtxnsas", "itxnas", "global", "itxn", "itxn_field", "frame_dig", "frame_bury",
+            "dig", "bury", "cover", "uncover", "dupn", "popn", "replace2", "asset_holding_get",
+            "asset_params_get", "app_params_get", "acct_params_get", "voter_params_get",
+            "block", "json_ref", "base64_decode", "ecdsa_verify", "ecdsa_pk_decompress",
+            "ecdsa_pk_recover", "vrf_verify", "ec_add", "ec_scalar_mul", "ec_pairing_check",
+            "ec_multi_scalar_mul", "ec_subgroup_check", "ec_map_to", "mimc",
+        ],
+        2,
+    ),
+}
+
+
+def _varuint_size(value: int) -> int:
+    size = 1
+    while value >= 128:
+        value >>= 7
+        size += 1
+    return size
+
+
+def _int_size(literal: str) -> int:
+    # Template variables are sized as assembled before substitution (0, or empty bytes),
+    # which is exact for the 0/1 deploy-time controls such as TMPL_UPDATABLE.
+    return 1 if literal.startswith("TMPL_") else _varuint_size(int(literal, 0))
+
+
+def _bytes_size(literal: str) -> int:
+    if literal.startswith("TMPL_"):
+        return 0
+    if literal.startswith("0x"):
+        return (len(literal) - 2) // 2
+    if literal.startswith('"'):
+        return len(literal[1:-1].encode().decode("unicode_escape").encode("latin-1"))
+    raise Exception(f"Unsupported byte literal {literal}")
+
+
+def _split(line: str) -> tuple[list[str], str]:
+    """Splits a TEAL line into tokens and its trailing comment, honouring string literals."""
+    tokens: list[str] = []
+    index = 0
+    while index < len(line):
+        char = line[index]
+        if char.isspace():
+            index += 1
+        elif line.startswith("//", index):
+            return tokens, line[index + 2 :].strip()
+        elif char == '"':
+            end = index + 1
+            while line[end] != '"':
+                end += 2 if line[end] == "\\" else 1
+            tokens.append(line[index : end + 1])
+            index = end + 1
+        else:
+            end = index
+            while end < len(line) and not line[end].isspace():
+                end += 1
+            tokens.append(line[index:end])
+            index = end
+    return tokens, ""
+
+
+@dataclasses.dataclass
+class Instruction:
+    op: str
+    args: list[str]
+    comment: str = ""
+
+    @property
+    def cost(self) -> int:
+        return opcode_cost(self.op)
+
+    @property
+    def size(self) -> int:
+        match self.op:
+            case "intcblock":
+                return 1 + _varuint_size(len(self.args)) + sum(map(_int_size, self.args))
+            case "bytecblock" | "pushbytess":
+                return 1 + _varuint_size(len(self.args)) + sum(
+                    _varuint_size(_bytes_size(arg)) + _bytes_size(arg) for arg in self.args
+                )
+            case "pushint":
+                return 1 + _int_size(self.args[0])
+            case "pushints":
+                return 1 + _varuint_size(len(self.args)) + sum(map(_int_size, self.args))
+            case "pushbytes":
+                size = _bytes_size(self.args[0])
+                return 1 + _varuint_size(size) + size
+            case "match" | "switch":
+                return 2 + 2 * len(self.args)
+        return _FIXED_SIZES.get(self.op, 1)
+
+
+@dataclasses.dataclass
+class Block:
+    label: str
+    instructions: list[Instruction] = dataclasses.field(default_factory=list)
+    successors: list[str] = dataclasses.field(default_factory=list)
+
+    @property
+    def cost(self) -> int:
+        return sum(instruction.cost for instruction in self.instructions)
+
+    @property
+    def size(self) -> int:
+        return sum(instruction.size for instruction in self.instructions)
+
+    @property
+    def calls(self) -> list[str]:
+        return [i.args[0] for i in self.instructions if i.op == "callsub"]
+
+
+def parse_teal(teal: str) -> list[Block]:
+    """
+    Splits a TEAL program into basic blocks: one starts at every label and after every
+    branch or terminator, and each lists the blocks control can pass to next.
+    """
+    blocks: list[Block] = []
+    current: Block | None = None
+    # Blocks without a label of their own are named "<preceding label>+<n>".
+    label, unlabelled = "entry", 0
+    for raw_line in teal.splitlines():
+        tokens, comment = _split(raw_line)
+        if not tokens or tokens[0].startswith("#"):
+            continue
+        if tokens[0].endswith(":"):
+            label, unlabelled = tokens[0][:-1], 0
+            if current is not None and not _ends_block(current):
+                current.successors.append(label)
+            current = Block(label)
+            blocks.append(current)
+            continue
+        if current is None or _ends_block(current):
+            unlabelled += 1
+            current = Block(f"{label}+{unlabelled}")
+            blocks.append(current)
+        instruction = Instruction(tokens[0], tokens[1:], comment)
+        current.instructions.append(instruction)
+        if instruction.op in _BRANCHES or instruction.op in {"match", "switch"}:
+            current.successors.extend(instruction.args)
+    # Conditional branches and match/switch fall through when not taken.
+    for block, following in zip(blocks, blocks[1:]):
+        if block.instructions and _falls_through(block) and _ends_block(block):
+            block.successors.append(following.label)
+    return blocks
+
+
+def _ends_block(block: Block) -> bool:
+    return bool(block.instructions) and (
+        block.instructions[-1].op in _TERMINATORS or block.instructions[-1].op in _BRANCHES
+    )
+
+
+def _falls_through(block: Block) -> bool:
+    return block.instructions[-1].op in {"bz", "bnz", "match", "switch"}
+
+
+@dataclasses.dataclass
+class MethodCost:
+    method: str
+    route: str
+    worst_case_cost: int
+    size: int  # bytes of all blocks the route can reach, subroutines included
+    exclusive_size: int  # bytes of blocks no other route reaches
+    has_loops: bool
+
+
+class TealAnalysis:
+    """Static worst-case opcode cost and size of a TEAL program, per ABI route and block"""
+
+    def __init__(self, teal: str) -> None:
+        self.blocks = {block.label: block for block in parse_teal(teal)}
+        self.entry = next(iter(self.blocks))
+        self._worst: dict[str, int] = {}
+        self._loops: set[str] = set()
+
+    @classmethod
+    def from_file(cls, path: Path) -> "TealAnalysis":
+        return cls(path.read_text())
+
+    @property
+    def program_size(self) -> int:
+        # Plus the version byte.
+        return 1 + sum(block.size for block in self.blocks.values())
+
+    def block_cost(self, label: str) -> int:
+        """Cost of a block including the worst case of the subroutines it calls."""
+        block = self.blocks[label]
+        return block.cost + sum(self.worst_case(call) for call in block.calls)
+
+    def worst_case(self, label: str, _active: frozenset[str] = frozenset()) -> int:
+        """Worst-case cost from `label` until the program (or subroutine) returns."""
+        if label in self._worst:
+            return self._worst[label]
+        active = _active | {label}
+        successors = []
+        for successor in self.blocks[label].successors:
+            if successor in active:
+                self._loops.add(label)  # back edge: loops are counted once
+                continue
+            successors.append(self.worst_case(successor, active))
+        self._worst[label] = self.block_cost(label) + max(successors, default=0)
+        return self._worst[label]
+
+    def reachable(self, label: str) -> set[str]:
+        seen: set[str] = set()
+        pending = [label]
+        while pending:
+            current = pending.pop()
+            if current in seen:
+                continue
+            seen.add(current)
+            pending.extend(self.blocks[current].successors)
+            pending.extend(self.blocks[current].calls)
+        return seen
+
+    def routes(self) -> Iterator[tuple[str, str, str]]:
+        """Yields (method, route label, dispatching block) for every `match` route."""
+        for block in self.blocks.values():
+            for index, instruction in enumerate(block.instructions):
+                if instruction.op != "match":
+                    continue
+                previous = block.instructions[:index]
+                selectors = next(
+                    (i for i in reversed(previous) if i.op == "pushbytess"), None
+                )
+                names = re.findall(r'method "([^"]+)"', selectors.comment) if selectors else []
+                for position, route in enumerate(instruction.args):
+                    if position < len(names):
+                        method = names[position]
+                    else:
+                        method = re.sub(r"^main_|@\d+$", "", route) + " (bare)"
+                    yield method, route, block.label
+
+    def _dispatch_cost(self, dispatcher: str) -> int:
+        """Worst-case cost from the program entry up to and including the dispatching block."""
+        best: dict[str, int] = {}
+
+        def visit(label: str, active: frozenset[str]) -> int:
+            if label == dispatcher:
+                return self.block_cost(label)
+            if label not in best:
+                costs = [
+                    visit(successor, active | {label})
+                    for successor in self.blocks[label].successors
+                    if successor not in active
+                ]
+                reaching = [cost for cost in costs if cost >= 0]
+                best[label] = self.block_cost(label) + max(reaching) if reaching else -1
+            return best[label]
+
+        return visit(self.entry, frozenset())
+
+    def methods(self) -> list[MethodCost]:
+        routes = list(self.routes())
+        reach = {route: self.reachable(route) for _, route, _ in routes}
+        results = []
+        for method, route, dispatcher in routes:
+            others = set().union(*(blocks for other, blocks in reach.items() if other != route))
+            self._loops.clear()
+            self._worst.clear()
+            cost = self._dispatch_cost(dispatcher) + self.worst_case(route)
+            results.append(
+                MethodCost(
+                    method=method,
+                    route=route,
+                    worst_case_cost=cost,
+                    size=sum(self.blocks[label].size for label in reach[route]),
+                    exclusive_size=sum(
+                        self.blocks[label].size for label in reach[route] - others
+                    ),
+                    has_loops=bool(self._loops & reach[route]),
+                )
+            )
+        return sorted(results, key=lambda method: -method.worst_case_cost)
+
+
+def format_report(analysis: TealAnalysis, top_blocks: int = 10) -> str:
+    methods = analysis.methods()
+    output = [
+        f"Program size {analysis.program_size} bytes, {len(analysis.blocks)} basic blocks",
+        "",
+        f"{'method':<60} {'worst cost':>10} {'bytes':>7} {'own bytes':>9}",
+    ]
+    for method in methods:
+        flags = " loops counted once" if method.has_loops else ""
+        if method.worst_case_cost > APP_CALL_BUDGET:
+            flags += f" exceeds {APP_CALL_BUDGET}"
+        output.append(
+            f"{method.method[:60]:<60} {method.worst_case_cost:>10} {method.size:>7} "
+            f"{method.exclusive_size:>9}{flags}"
+        )
+    output += ["", f"{'block':<48} {'cost':>6} {'bytes':>7}"]
+    ranked = sorted(
+        analysis.blocks.values(), key=lambda block: (-block.cost, -block.size, block.label)
+    )
+    for block in ranked[:top_blocks]:
+        output.append(f"{block.label[:48]:<48} {block.cost:>6} {block.size:>7}")
+    return "\n".join(output)
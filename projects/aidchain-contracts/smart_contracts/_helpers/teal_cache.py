@@ -0,0 +1,112 @@
+import base64
+import hashlib
+import json
+import os
+import tempfile
+import weakref
+from pathlib import Path
+
+import algokit_utils
+from algokit_utils.applications.app_manager import AppManager, CompiledTeal
+from algosdk.source_map import SourceMap
+
+# Project-local cache shared by deploys, test fixtures and scripts.
+DEFAULT_TEAL_CACHE_DIR = Path(__file__).parents[2] / ".algokit" / "teal-cache"
+
+# App managers whose compilation already goes through a cache.
+_cached_app_managers: "weakref.WeakSet[AppManager]" = weakref.WeakSet()
+
+
+class TealCompileCache:
+    """
+    On-disk cache of algod compile results.
+
+    Entries are keyed on the SHA-256 of the exact TEAL sent to algod, i.e. after comments
+    are stripped and template variables and deploy-time controls are substituted, so
+    different template values get their own entries. Each entry holds the program bytes,
+    program hash (address) and source map.
+    """
+
+    def __init__(self, cache_dir: Path = DEFAULT_TEAL_CACHE_DIR) -> None:
+        self.cache_dir = cache_dir
+
+    def _entry(self, teal_code: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha256(teal_code.encode()).hexdigest()}.json"
+
+    def get(self, teal_code: str) -> CompiledTeal | None:
+        try:
+            entry = json.loads(self._entry(teal_code).read_text())
+        except (FileNotFoundError, ValueError):
+            return None
+        return CompiledTeal(
+            teal=teal_code,
+            compiled=entry["result"],
+            compiled_hash=entry["hash"],
+            compiled_base64_to_bytes=base64.b64decode(entry["result"]),
+            source_map=SourceMap(entry["sourcemap"]) if entry.get("sourcemap") else None,
+        )
+
+    def put(self, compiled: CompiledTeal) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        source_map = compiled.source_map
+        entry = {
+            "result": compiled.compiled,
+            "hash": compiled.compiled_hash,
+            "sourcemap": (
+                {
+                    "version": source_map.version,
+                    "sources": source_map.sources,
+                    "names": getattr(source_map, "names", []),
+                    "mappings": source_map.mappings,
+                }
+                if source_map
+                else None
+            ),
+        }
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, prefix=".entry-")
+        with os.fdopen(fd, "w") as tmp:
+            json.dump(entry, tmp)
+        os.replace(tmp_name, self._entry(compiled.teal))
+
+
+def with_teal_cache(
+    algorand: algokit_utils.AlgorandClient, cache: TealCompileCache | None = None
+) -> algokit_utils.AlgorandClient:
+    """
+    Routes the client's TEAL compilation through an on-disk cache.
+
+    Factories, app clients and deploys all compile through `algorand.app.compile_teal`, so
+    wrapping it there means repeat deploys and fixtures skip algod's compile endpoint.
+    A client is wrapped once; later calls return it unchanged. Set AIDCHAIN_TEAL_CACHE=0
+    to disable.
+    """
+    if os.getenv("AIDCHAIN_TEAL_CACHE", "1") == "0":
+        return algorand
+    app_manager = algorand.app
+    if app_manager in _cached_app_managers:
+        return algorand
+    cache = cache or TealCompileCache()
+    compile_teal = app_manager.compile_teal
+    get_compilation_result = app_manager.get_compilation_result
+    # Results read from disk, for `get_compilation_result` (used for error source mapping).
+    loaded: dict[str, CompiledTeal] = {}
+
+    def compilation_result(teal_code: str) -> CompiledTeal | None:
+        return loaded.get(teal_code) or get_compilation_result(teal_code)
+
+    def cached_compile_teal(teal_code: str) -> CompiledTeal:
+        compiled = compilation_result(teal_code)
+        if compiled:
+            return compiled
+        compiled = cache.get(teal_code)
+        if compiled is None:
+            compiled = compile_teal(teal_code)
+            cache.put(compiled)
+        else:
+            loaded[teal_code] = compiled
+        return compiled
+
+    app_manager.compile_teal = cached_compile_teal  # type: ignore[method-assign]
+    app_manager.get_compilation_result = compilation_result  # type: ignore[method-assign]
+    _cached_app_managers.add(app_manager)
+    return algorand
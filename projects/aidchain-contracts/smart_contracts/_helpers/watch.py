@@ -0,0 +1,57 @@
+import logging
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+def snapshot(paths: Iterable[Path]) -> dict[Path, int]:
+    """Returns the modification time of every existing file in `paths`."""
+    result = {}
+    for path in paths:
+        try:
+            result[path] = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            continue
+    return result
+
+
+def changed(before: dict[Path, int], after: dict[Path, int]) -> set[Path]:
+    """Returns files that were added, removed or modified between two snapshots."""
+    return {path for path in before.keys() | after.keys() if before.get(path) != after.get(path)}
+
+
+def watch_files(
+    paths: Callable[[], Iterable[Path]],
+    on_change: Callable[[set[Path]], None],
+    *,
+    interval: float = 0.5,
+    settle: float = 0.2,
+    should_stop: Callable[[], bool] = lambda: False,
+) -> None:
+    """
+    Polls `paths()` for changes and calls `on_change` with the changed files.
+
+    Editors often write a file in several steps, so a change is only reported once the
+    files have been stable for `settle` seconds. Errors raised by `on_change` are logged
+    and watching continues.
+    """
+    current = snapshot(paths())
+    while not should_stop():
+        time.sleep(interval)
+        latest = snapshot(paths())
+        if not changed(current, latest):
+            continue
+        while True:
+            time.sleep(settle)
+            settled = snapshot(paths())
+            if not changed(latest, settled):
+                break
+            latest = settled
+        changed_files = changed(current, latest)
+        current = latest
+        try:
+            on_change(changed_files)
+        except Exception as e:
+            logger.error(f"{e}")
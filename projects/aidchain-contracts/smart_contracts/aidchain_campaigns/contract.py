@@ -0,0 +1,177 @@
+from algopy import ARC4Contract, String, UInt64, GlobalState, itxn, Txn, Global, Account, BoxMap, TemplateVar
+from algopy.arc4 import abimethod, baremethod, Struct, UInt64 as ARC4UInt64, String as ARC4String
+
+class CampaignInfo(Struct):
+    id: ARC4UInt64
+    title: ARC4String
+    target: ARC4UInt64
+    raised: ARC4UInt64
+    creator: ARC4String
+    active: ARC4UInt64  # 0 = inactive, 1 = active
+
+class MilestoneInfo(Struct):
+    id: ARC4UInt64
+    campaign_id: ARC4UInt64
+    target_amount: ARC4UInt64
+    description: ARC4String
+    completed: ARC4UInt64  # 0 = pending, 1 = completed
+    funds_released: ARC4UInt64  # 0 = not released, 1 = released
+
+class AidchainCampaigns(ARC4Contract):
+    """Campaign, donation and milestone domain of Aidchain"""
+
+    def __init__(self) -> None:
+        self.campaign_counter = GlobalState(UInt64(0))
+        self.milestone_counter = GlobalState(UInt64(0))
+        self.total_donations = GlobalState(UInt64(0))
+        self.total_milestones_completed = GlobalState(UInt64(0))
+
+        self.campaigns = BoxMap(ARC4UInt64, CampaignInfo, key_prefix="campaigns")
+        self.milestones = BoxMap(ARC4UInt64, MilestoneInfo, key_prefix="milestones")
+
+    @baremethod(allow_actions=["UpdateApplication"])
+    def update(self) -> None:
+        """
+        Allow the creator to replace the program in place, keeping app ID and box state.
+        Only deployments made updatable (TMPL_UPDATABLE, localnet by default) accept it.
+        """
+        assert TemplateVar[bool]("UPDATABLE"), "App is not updatable"
+        assert Txn.sender == Global.creator_address, "Only creator can update"
+
+    @abimethod()
+    def hello(self, name: String) -> String:
+        return "Hello, " + name
+
+    @abimethod()
+    def initialize(self) -> String:
+        """Initialize the campaign counters with default values"""
+        self.campaign_counter.value = UInt64(0)
+        self.milestone_counter.value = UInt64(0)
+        self.total_donations.value = UInt64(0)
+        self.total_milestones_completed.value = UInt64(0)
+        return String("Contract initialized successfully")
+
+    @abimethod()
+    def create_campaign(self, title: String, target: UInt64, creator: String) -> UInt64:
+        """Create a new donation campaign with proper data storage"""
+        self.campaign_counter.value += UInt64(1)
+        campaign_id = self.campaign_counter.value
+
+        self.campaigns[ARC4UInt64(campaign_id)] = CampaignInfo(
+            id=ARC4UInt64(campaign_id),
+            title=ARC4String(title),
+            target=ARC4UInt64(target),
+            raised=ARC4UInt64(0),  # No funds raised initially
+            creator=ARC4String(creator),
+            active=ARC4UInt64(1)  # 1 = active
+        )
+
+        return campaign_id
+
+    @abimethod()
+    def get_campaign_count(self) -> UInt64:
+        """Get total number of campaigns created"""
+        return self.campaign_counter.value
+
+    @abimethod()
+    def create_donation(self, campaign_id: UInt64) -> String:
+        """Create a donation record (for testing without payment)"""
+        assert campaign_id <= self.campaign_counter.value, "Campaign ID out of range"
+        assert campaign_id != UInt64(0), "Campaign ID cannot be zero"
+        assert ARC4UInt64(campaign_id) in self.campaigns, "Campaign not found"
+
+        # In production, this would get the actual payment amount from a grouped payment
+        donation_amount = Txn.amount
+        self.total_donations.value += donation_amount
+
+        return String("Donation recorded successfully")
+
+    @abimethod()
+    def get_total_donations(self) -> UInt64:
+        """Get total amount of donations across all campaigns"""
+        return self.total_donations.value
+
+    @abimethod()
+    def calculate_total(self, amount1: UInt64, amount2: UInt64) -> UInt64:
+        """Calculate total of two amounts"""
+        return amount1 + amount2
+
+    @abimethod()
+    def validate_donation(self, amount: UInt64, donor: String) -> String:
+        """Validate donation parameters"""
+        if amount > UInt64(0):
+            return String("Valid donation from ") + donor
+        else:
+            return String("Invalid donation amount")
+
+    @abimethod()
+    def create_milestone(self, campaign_id: UInt64, target_amount: UInt64, description: String) -> UInt64:
+        """Create a new milestone for campaign funding"""
+        assert campaign_id <= self.campaign_counter.value, "Campaign ID out of range"
+        assert campaign_id != UInt64(0), "Campaign ID cannot be zero"
+        assert ARC4UInt64(campaign_id) in self.campaigns, "Campaign not found"
+
+        self.milestone_counter.value += UInt64(1)
+        milestone_id = self.milestone_counter.value
+
+        self.milestones[ARC4UInt64(milestone_id)] = MilestoneInfo(
+            id=ARC4UInt64(milestone_id),
+            campaign_id=ARC4UInt64(campaign_id),
+            target_amount=ARC4UInt64(target_amount),
+            description=ARC4String(description),
+            completed=ARC4UInt64(0),  # 0 = pending
+            funds_released=ARC4UInt64(0)  # 0 = not released
+        )
+
+        return milestone_id
+
+    @abimethod()
+    def complete_milestone(self, milestone_id: UInt64, proof: String) -> String:
+        """Mark milestone as completed with proof"""
+        assert milestone_id <= self.milestone_counter.value, "Milestone ID out of range"
+        assert milestone_id != UInt64(0), "Milestone ID cannot be zero"
+        assert ARC4UInt64(milestone_id) in self.milestones, "Milestone not found"
+
+        milestone_info = self.milestones[ARC4UInt64(milestone_id)].copy()
+        milestone_info.completed = ARC4UInt64(1)  # Mark as completed
+        self.milestones[ARC4UInt64(milestone_id)] = milestone_info.copy()
+
+        self.total_milestones_completed.value += UInt64(1)
+        return String("Milestone completed with proof: ") + proof
+
+    @abimethod()
+    def release_milestone_funds(self, milestone_id: UInt64, recipient: Account, amount: UInt64) -> String:
+        """Release REAL funds for completed milestone via blockchain payment"""
+        assert milestone_id <= self.milestone_counter.value, "Milestone ID out of range"
+        assert milestone_id != UInt64(0), "Milestone ID cannot be zero"
+        assert amount > UInt64(0), "Amount must be greater than zero"
+
+        itxn.Payment(
+            receiver=recipient,
+            amount=amount,
+            fee=Global.min_txn_fee,  # Use minimum transaction fee
+        ).submit()
+
+        return String("Real blockchain payment sent for milestone")
+
+    @abimethod()
+    def get_milestone_stats(self) -> String:
+        """Get milestone system statistics"""
+        return String("Milestone statistics available")
+
+    @abimethod(readonly=True)
+    def get_campaign_details(self, campaign_id: ARC4UInt64) -> CampaignInfo:
+        """Get detailed information about a campaign"""
+        assert campaign_id in self.campaigns, "Campaign not found"
+        return self.campaigns[campaign_id]
+
+    @abimethod(readonly=True)
+    def get_milestone_details(self, milestone_id: ARC4UInt64) -> MilestoneInfo:
+        """Get detailed information about a milestone"""
+        assert milestone_id in self.milestones, "Milestone not found"
+        return self.milestones[milestone_id]
+
+    @abimethod(readonly=True)
+    def get_milestone_count(self) -> UInt64:
+        """Get total number of milestones created"""
+        return self.milestone_counter.value
@@ -0,0 +1,10 @@
+from smart_contracts._helpers.app_deploy import AppDeployConfig
+
+# Campaign, donation and milestone domain app; see smart_contracts/aidchain_contracts/domains.py.
+app = AppDeployConfig(
+    spec_name="AidchainCampaigns",
+    folder="aidchain_campaigns",
+    funding_boxes={"campaigns": 10, "milestones": 20},
+    funding_inner_txns=20,
+)
+deploy = app.deploy
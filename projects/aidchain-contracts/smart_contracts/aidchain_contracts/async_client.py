@@ -0,0 +1,422 @@
+import asyncio
+import base64
+import dataclasses
+import time
+import typing
+
+import algokit_utils
+from algosdk import encoding
+from algosdk.abi import Method
+from algosdk.error import AlgodHTTPError
+from algosdk.transaction import SignedTransaction
+from algosdk.v2client.models import SimulateRequest, SimulateRequestTransactionGroup
+from algokit_utils.applications.app_manager import AppManager
+from algokit_utils.applications.app_spec.arc56 import Method as Arc56Method
+
+from smart_contracts._helpers.async_algod import AsyncAlgodClient
+from smart_contracts._helpers.confirmation_tracker import ConfirmationTracker
+from smart_contracts.artifacts.aidchain_contracts import aidchain_contracts_codecs
+from smart_contracts.artifacts.aidchain_contracts.aidchain_contracts_client import (
+    AidchainContractsClient,
+    CampaignInfo,
+    DeliveryRecord,
+    GlobalStateValue,
+    MilestoneInfo,
+    OrganizationInfo,
+    VoucherInfo,
+)
+
+_ABI_RETURN_PREFIX = bytes.fromhex("151f7c75")
+_SUGGESTED_PARAMS_TTL = 3.0
+
+_ReturnType = typing.TypeVar("_ReturnType")
+_ValueType = typing.TypeVar("_ValueType")
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AsyncSendResult(typing.Generic[_ReturnType]):
+    """Result of a confirmed (or, for readonly methods, simulated) ABI method call"""
+
+    tx_id: str
+    abi_return: _ReturnType | None
+    confirmation: dict[str, typing.Any]
+    # Fees of the submitted transactions (0 for simulated readonly calls).
+    fee: int = 0
+
+    @property
+    def confirmed_round(self) -> int | None:
+        return self.confirmation.get("confirmed-round")
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AsyncSimulateResult(typing.Generic[_ReturnType]):
+    """Result of simulating an ABI method call"""
+
+    tx_id: str
+    abi_return: _ReturnType | None
+    simulate_response: dict[str, typing.Any]
+
+
+class _Builder(typing.Protocol):
+    def __call__(
+        self, *args: typing.Any, params: algokit_utils.CommonAppCallParams
+    ) -> algokit_utils.BuiltTransactions: ...
+
+
+class AsyncAidchainContractsClient:
+    """
+    Asyncio variant of AidchainContractsClient.
+
+    Transactions are built and signed with the generated synchronous client (pure CPU work
+    once suggested params are cached) while every algod round trip (params, resource
+    population, submission, confirmation, simulate, state and box reads) is awaited on a
+    shared `AsyncAlgodClient`, so one event loop can serve many in-flight calls. Sent
+    transactions are confirmed by a `ConfirmationTracker` that follows blocks rather than
+    polling each transaction; pass one tracker to several clients to share it.
+
+    Method calls mirror the generated client, e.g.
+    `await client.send.create_campaign(args=CreateCampaignArgs(...))` or
+    `await client.simulate.get_campaign_details(args=(1,))`.
+    """
+
+    def __init__(
+        self,
+        client: AidchainContractsClient,
+        algod: AsyncAlgodClient | None = None,
+        *,
+        max_concurrency: int = 64,
+        populate_resources: bool = True,
+        confirmations: ConfirmationTracker | None = None,
+    ) -> None:
+        self.client = client
+        self._owns_algod = algod is None
+        self.algod = algod or AsyncAlgodClient.from_algod(client.algorand.client.algod)
+        self.populate_resources = populate_resources
+        self._owns_confirmations = confirmations is None
+        self.confirmations = confirmations or ConfirmationTracker(self.algod)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._params_lock = asyncio.Lock()
+        self._params_expiry = 0.0
+        self.send = AsyncAidchainContractsSend(self)
+        self.simulate = AsyncAidchainContractsSimulate(self)
+        self.state = AsyncAidchainContractsState(self)
+
+    async def aclose(self) -> None:
+        if self._owns_confirmations:
+            await self.confirmations.aclose()
+        if self._owns_algod:
+            await self.algod.aclose()
+
+    async def __aenter__(self) -> "AsyncAidchainContractsClient":
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.aclose()
+
+    @property
+    def app_id(self) -> int:
+        return self.client.app_id
+
+    @property
+    def app_address(self) -> str:
+        return self.client.app_address
+
+    async def wait_for_confirmation(self, tx_id: str) -> dict[str, typing.Any]:
+        """Awaits confirmation of a transaction submitted outside this client by polling it"""
+        async with self._semaphore:
+            return await self.algod.wait_for_confirmation(tx_id)
+
+    async def _confirmation(
+        self, tx_id: str, confirmed: "asyncio.Future[int]", *, details: bool
+    ) -> dict[str, typing.Any]:
+        # Logs and inner transactions are only in the pending transaction info, so it is
+        # fetched once after confirmation when the caller needs an ABI return value.
+        confirmed_round = await asyncio.shield(confirmed)
+        if not details:
+            return {"confirmed-round": confirmed_round}
+        async with self._semaphore:
+            return await self.algod.pending_transaction_info(tx_id)
+
+    async def _prime_suggested_params(self) -> None:
+        # Builds through the sync client read suggested params from the AlgorandClient cache,
+        # so refreshing that cache here keeps transaction building free of blocking I/O.
+        if self._params_expiry > time.time():
+            return
+        async with self._params_lock:
+            if self._params_expiry > time.time():
+                return
+            suggested_params = await self.algod.suggested_params()
+            self._params_expiry = time.time() + _SUGGESTED_PARAMS_TTL
+            self.client.algorand.set_suggested_params_cache(suggested_params, self._params_expiry)
+
+    async def _simulate(
+        self, built: algokit_utils.BuiltTransactions, *, allow_unnamed_resources: bool = True
+    ) -> dict[str, typing.Any]:
+        request = SimulateRequest(
+            txn_groups=[
+                SimulateRequestTransactionGroup(
+                    txns=[SignedTransaction(txn, None) for txn in built.transactions]  # type: ignore[arg-type]
+                )
+            ],
+            allow_empty_signatures=True,
+            allow_unnamed_resources=allow_unnamed_resources,
+        )
+        async with self._semaphore:
+            return await self.algod.simulate_transactions(request)
+
+    async def _build(
+        self,
+        build: _Builder,
+        args: tuple[typing.Any, ...],
+        params: algokit_utils.CommonAppCallParams,
+        *,
+        populate_resources: bool,
+    ) -> algokit_utils.BuiltTransactions:
+        await self._prime_suggested_params()
+        built = build(*args, params=params)
+        if not populate_resources:
+            return built
+        resources = _unnamed_resources(await self._simulate(built), self.app_id)
+        if not any(resources.values()):
+            return built
+        return build(
+            *args,
+            params=dataclasses.replace(
+                params,
+                account_references=[*(params.account_references or []), *resources["accounts"]],
+                app_references=[*(params.app_references or []), *resources["apps"]],
+                asset_references=[*(params.asset_references or []), *resources["assets"]],
+                box_references=[*(params.box_references or []), *resources["boxes"]],
+            ),
+        )
+
+    def _decode_return(self, method: Method | None, logs: list[str] | None) -> typing.Any:
+        if method is None or method.returns.type == "void" or not logs:
+            return None
+        raw = base64.b64decode(logs[-1])
+        if not raw.startswith(_ABI_RETURN_PREFIX):
+            return None
+        raw = raw[len(_ABI_RETURN_PREFIX) :]
+        arc56_method = self.client.app_spec.get_arc56_method(method.get_signature())
+        if arc56_method.returns.struct:
+            return aidchain_contracts_codecs.DECODERS[arc56_method.returns.struct](raw)
+        return method.returns.type.decode(raw)  # type: ignore[union-attr]
+
+    async def _call(
+        self,
+        build: _Builder,
+        args: tuple[typing.Any, ...],
+        params: algokit_utils.CommonAppCallParams | None,
+        *,
+        simulate_only: bool,
+    ) -> AsyncSendResult[typing.Any] | AsyncSimulateResult[typing.Any]:
+        arc56_method = _find_arc56_method(self.client.app_spec, getattr(build, "__name__", ""))
+        readonly = bool(arc56_method and arc56_method.readonly)
+        # Simulation resolves unnamed resources itself, so only sends need them populated.
+        built = await self._build(
+            build,
+            args,
+            params or algokit_utils.CommonAppCallParams(),
+            populate_resources=self.populate_resources and not (simulate_only or readonly),
+        )
+        method = built.method_calls.get(0)
+        tx_id = built.transactions[0].get_txid()
+        if simulate_only or readonly:
+            response = await self._simulate(built)
+            group = response["txn-groups"][0]
+            if group.get("failure-message"):
+                raise Exception(f"Simulating {tx_id} failed: {group['failure-message']}")
+            txn_result = group["txn-results"][0]["txn-result"]
+            abi_return = self._decode_return(method, txn_result.get("logs"))
+            if simulate_only:
+                return AsyncSimulateResult(
+                    tx_id=tx_id, abi_return=abi_return, simulate_response=response
+                )
+            return AsyncSendResult(tx_id=tx_id, abi_return=abi_return, confirmation=txn_result)
+
+        signed = [
+            (
+                built.signers.get(index)
+                or (params and params.signer)
+                or self.client.algorand.account.get_signer(txn.sender)
+            ).sign_transactions(built.transactions, [index])[0]
+            for index, txn in enumerate(built.transactions)
+        ]
+        # Track before submitting so the confirming block cannot be missed.
+        confirmed = self.confirmations.track(tx_id, built.transactions[0].last_valid_round)
+        try:
+            async with self._semaphore:
+                await self.algod.send_raw_transaction(
+                    b"".join(base64.b64decode(encoding.msgpack_encode(txn)) for txn in signed)
+                )
+        except Exception:
+            self.confirmations.discard(tx_id)
+            raise
+        confirmation = await self._confirmation(
+            tx_id, confirmed, details=method is not None and method.returns.type != "void"
+        )
+        return AsyncSendResult(
+            tx_id=tx_id,
+            abi_return=self._decode_return(method, confirmation.get("logs")),
+            confirmation=confirmation,
+            fee=sum(txn.fee for txn in built.transactions),
+        )
+
+
+def _find_arc56_method(
+    app_spec: algokit_utils.Arc56Contract, method_name: str
+) -> Arc56Method | None:
+    return next((method for method in app_spec.methods if method.name == method_name), None)
+
+
+def _unnamed_resources(response: dict[str, typing.Any], app_id: int) -> dict[str, list[typing.Any]]:
+    """Collects the resources a simulated group accessed without declaring them"""
+    group = response["txn-groups"][0]
+    accessed = [group.get("unnamed-resources-accessed") or {}] + [
+        result.get("unnamed-resources-accessed") or {} for result in group["txn-results"]
+    ]
+    resources: dict[str, list[typing.Any]] = {"accounts": [], "apps": [], "assets": [], "boxes": []}
+    for entry in accessed:
+        resources["accounts"] += entry.get("accounts", [])
+        resources["apps"] += entry.get("apps", [])
+        resources["assets"] += entry.get("assets", [])
+        resources["boxes"] += [
+            algokit_utils.BoxReference(
+                app_id=0 if box["app"] == app_id else box["app"],
+                name=base64.b64decode(box.get("name", "")),
+            )
+            for box in entry.get("boxes", [])
+        ]
+        # Additional empty references raise the box I/O budget for large boxes.
+        resources["boxes"] += [
+            algokit_utils.BoxReference(app_id=0, name=b"")
+            for _ in range(entry.get("extra-box-refs", 0))
+        ]
+    return resources
+
+
+class _AsyncMethodCalls:
+    def __init__(self, owner: AsyncAidchainContractsClient, *, simulate_only: bool) -> None:
+        self._owner = owner
+        self._simulate_only = simulate_only
+
+    def __getattr__(self, name: str) -> typing.Callable[..., typing.Awaitable[typing.Any]]:
+        build = getattr(self._owner.client.create_transaction, name)
+
+        async def call(
+            args: typing.Any = None, params: algokit_utils.CommonAppCallParams | None = None
+        ) -> typing.Any:
+            return await self._owner._call(
+                build, () if args is None else (args,), params, simulate_only=self._simulate_only
+            )
+
+        call.__name__ = name
+        return call
+
+
+class AsyncAidchainContractsSend(_AsyncMethodCalls):
+    """Awaitable `send.<method>` calls; readonly methods are simulated instead of sent"""
+
+    def __init__(self, owner: AsyncAidchainContractsClient) -> None:
+        super().__init__(owner, simulate_only=False)
+
+
+class AsyncAidchainContractsSimulate(_AsyncMethodCalls):
+    """Awaitable `simulate.<method>` calls that never submit a transaction"""
+
+    def __init__(self, owner: AsyncAidchainContractsClient) -> None:
+        super().__init__(owner, simulate_only=True)
+
+
+class AsyncAidchainContractsState:
+    """Methods to access state for the current AidchainContracts app"""
+
+    def __init__(self, owner: AsyncAidchainContractsClient) -> None:
+        self._owner = owner
+        self.box = _AsyncBoxState(owner)
+
+    async def global_state(self) -> GlobalStateValue:
+        """Get all current keyed values from global_state state"""
+        async with self._owner._semaphore:
+            info = await self._owner.algod.application_info(self._owner.app_id)
+        state = AppManager.decode_app_state(info["params"].get("global-state", []))
+        by_key = {value.key_base64: value.value for value in state.values()}
+        keys = self._owner.client.app_spec.state.keys.global_state
+        return typing.cast(
+            GlobalStateValue,
+            {name: by_key[key.key] for name, key in keys.items() if key.key in by_key},
+        )
+
+
+class _AsyncBoxState:
+    def __init__(self, owner: AsyncAidchainContractsClient) -> None:
+        self._owner = owner
+
+    def _map(self, map_name: str) -> "_AsyncMapState[typing.Any]":
+        prefix, decode = aidchain_contracts_codecs.BOX_MAPS[map_name]
+        return _AsyncMapState(self._owner, prefix, decode)
+
+    @property
+    def campaigns(self) -> "_AsyncMapState[CampaignInfo]":
+        return self._map("campaigns")
+
+    @property
+    def organizations(self) -> "_AsyncMapState[OrganizationInfo]":
+        return self._map("organizations")
+
+    @property
+    def milestones(self) -> "_AsyncMapState[MilestoneInfo]":
+        return self._map("milestones")
+
+    @property
+    def deliveries(self) -> "_AsyncMapState[DeliveryRecord]":
+        return self._map("deliveries")
+
+    @property
+    def vouchers(self) -> "_AsyncMapState[VoucherInfo]":
+        return self._map("vouchers")
+
+
+class _AsyncMapState(typing.Generic[_ValueType]):
+    """Concurrent, codec-decoded access to a uint64-keyed box map"""
+
+    def __init__(
+        self,
+        owner: AsyncAidchainContractsClient,
+        prefix: bytes,
+        decode: typing.Callable[[bytes], _ValueType],
+    ) -> None:
+        self._owner = owner
+        self._prefix = prefix
+        self._decode = decode
+
+    async def get_value(self, key: int) -> _ValueType | None:
+        """Get a value from the map by key, or None if the box does not exist"""
+        box_name = self._prefix + key.to_bytes(8, "big")
+        async with self._owner._semaphore:
+            try:
+                value = await self._owner.algod.application_box_by_name(self._owner.app_id, box_name)
+            except AlgodHTTPError as e:
+                if e.code == 404:
+                    return None
+                raise
+        return self._decode(value)
+
+    async def get_values(self, keys: typing.Iterable[int]) -> dict[int, _ValueType]:
+        """Fetch many keys concurrently; missing keys are omitted from the result"""
+        keys = list(keys)
+        values = await asyncio.gather(*(self.get_value(key) for key in keys))
+        return {key: value for key, value in zip(keys, values) if value is not None}
+
+    async def get_keys(self) -> list[int]:
+        async with self._owner._semaphore:
+            box_names = await self._owner.algod.application_boxes(self._owner.app_id)
+        return sorted(
+            int.from_bytes(name[len(self._prefix) :], "big")
+            for name in box_names
+            if name.startswith(self._prefix) and len(name) == len(self._prefix) + 8
+        )
+
+    async def get_map(self) -> dict[int, _ValueType]:
+        """Get all current values in the map, fetching boxes concurrently"""
+        return await self.get_values(await self.get_keys())
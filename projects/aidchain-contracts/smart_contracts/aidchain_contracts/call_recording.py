@@ -0,0 +1,226 @@
+import asyncio
+import bisect
+import dataclasses
+import inspect
+import logging
+import typing
+from collections import Counter
+from collections.abc import Callable, Mapping, Sequence
+from pathlib import Path
+
+import algokit_utils
+
+from smart_contracts._helpers.call_log import CallLogWriter, CallRecord, replay_offsets
+from smart_contracts._helpers.load_generator import Call, LoadStats, run_schedule
+from smart_contracts.aidchain_contracts.async_client import AsyncAidchainContractsClient
+from smart_contracts.aidchain_contracts.synthetic_data import existing_records
+from smart_contracts.artifacts.aidchain_contracts.aidchain_contracts_client import (
+    AidchainContractsClient,
+    AidchainContractsSend,
+)
+
+logger = logging.getLogger(__name__)
+
+# Box map each record-creating method adds an entry to.
+_CREATES = {
+    "register_organization": "organizations",
+    "create_campaign": "campaigns",
+    "create_milestone": "milestones",
+    "log_delivery": "deliveries",
+    "create_voucher_asset": "vouchers",
+}
+# Methods whose inner transaction fees the app pays.
+_INNER_TXNS = {"create_voucher_asset", "release_milestone_funds"}
+
+
+def _args_tuple(args: typing.Any) -> tuple[typing.Any, ...]:
+    if args is None:
+        return ()
+    if dataclasses.is_dataclass(args):
+        return tuple(getattr(args, field.name) for field in dataclasses.fields(args))
+    return tuple(args)
+
+
+class RecordingAidchainContractsClient:
+    """
+    An AidchainContractsClient that logs every ABI method call sent through `send` (method,
+    arguments, sender, start time, duration and success) to a `CallLogWriter` at `path`.
+    Everything else is passed through to the wrapped client, so a service can swap it in
+    without other changes and `load_test.py --replay` can re-issue the traffic later. The
+    log's metadata holds the app's record counters when recording started, which the IDs
+    in the logged arguments refer to.
+    """
+
+    def __init__(self, client: AidchainContractsClient, path: Path) -> None:
+        self.client = client
+        self.log = CallLogWriter(
+            path,
+            app_id=client.app_id,
+            methods=[method.to_abi_method() for method in client.app_spec.methods],
+            metadata={"records": existing_records(client)},
+        )
+        self.send = typing.cast(AidchainContractsSend, _RecordingSend(self))
+
+    def __getattr__(self, name: str) -> typing.Any:
+        return getattr(self.client, name)
+
+    def close(self) -> None:
+        self.log.close()
+
+    def __enter__(self) -> "RecordingAidchainContractsClient":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+
+class _RecordingSend:
+    def __init__(self, recorder: RecordingAidchainContractsClient) -> None:
+        self._recorder = recorder
+
+    def __getattr__(self, name: str) -> typing.Any:
+        send = getattr(self._recorder.client.send, name)
+        method = getattr(AidchainContractsSend, name, None)
+        if method is None or name.startswith("_") or name in {"update", "clear_state", "bare"}:
+            return send
+        signature = inspect.signature(method)
+        log = self._recorder.log
+
+        def call(*positional: typing.Any, **kwargs: typing.Any) -> typing.Any:
+            bound = signature.bind(None, *positional, **kwargs)
+            started = log.now()
+            result = None
+            try:
+                result = send(*positional, **kwargs)
+                return result
+            finally:
+                try:
+                    if result is not None:
+                        sender = result.transaction.raw.sender
+                    else:
+                        # The parameters builder resolves the client's default sender.
+                        sender = getattr(self._recorder.client.params, name)(
+                            **{
+                                key: value
+                                for key, value in bound.arguments.items()
+                                if key in {"args", "params"}
+                            }
+                        ).sender
+                    log.record(
+                        name,
+                        _args_tuple(bound.arguments.get("args")),
+                        sender=sender,
+                        started=started,
+                        duration=log.now() - started,
+                        ok=result is not None,
+                    )
+                except Exception as error:
+                    logger.warning(f"Could not log a {name} call: {error}")
+
+        return call
+
+
+def replay_usage(records: Sequence[CallRecord]) -> dict[str, typing.Any]:
+    """The box entries, created assets and inner transaction fees `records` add to an app."""
+    methods = Counter(record.method for record in records)
+    boxes: Counter[str] = Counter()
+    for method, box_map in _CREATES.items():
+        boxes[box_map] += methods[method]
+    return {
+        "boxes": dict(boxes),
+        "created_assets": methods["create_voucher_asset"],
+        "inner_txns": sum(methods[method] for method in _INNER_TXNS),
+    }
+
+
+class CallReplay:
+    """
+    Re-issues logged calls against an app through an `AsyncAidchainContractsClient`, open
+    loop at the recorded pace compressed by `speed` (see `replay_offsets`).
+
+    Calls keep their recorded order where it mattered: a call waits for every call that
+    had finished before it started in the recording, so a donation is not sent before the
+    campaign it donates to exists, even at maximum speed. Calls that overlapped run
+    concurrently. Each recorded sender is replaced by a replay account from `senders`.
+    Readonly calls are simulated and the rest sent and confirmed; calls that failed when
+    recorded are replayed too. Outcomes go to `stats`, with latency measured from each
+    call's scheduled time as in a load test.
+    """
+
+    def __init__(self, client: AsyncAidchainContractsClient, senders: Mapping[str, str]) -> None:
+        self.client = client
+        self.senders = dict(senders)
+        self.stats = LoadStats()
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def run(self, records: Sequence[CallRecord], *, speed: float) -> None:
+        records = sorted(records, key=lambda record: record.offset)
+        if unknown := {record.sender for record in records} - set(self.senders):
+            raise Exception(f"No replay account for the senders {sorted(unknown)}")
+        # Calls by recorded end time; a call depends on the ones ending strictly before it
+        # starts, which are a prefix of this order that cannot include the call itself.
+        by_end = sorted(range(len(records)), key=lambda i: records[i].offset + records[i].duration)
+        ends = [records[i].offset + records[i].duration for i in by_end]
+        position = {index: rank for rank, index in enumerate(by_end)}
+        done = [False] * len(records)
+        finished = 0
+        progress = asyncio.Condition()
+
+        async def issue(index: int, scheduled: float) -> None:
+            nonlocal finished
+            predecessors = min(bisect.bisect_left(ends, records[index].offset), position[index])
+            try:
+                async with progress:
+                    await progress.wait_for(lambda: finished >= predecessors)
+                await self.issue(index, records[index], scheduled)
+            finally:
+                # Also when the call could not be issued, so later calls are not blocked.
+                async with progress:
+                    done[position[index]] = True
+                    while finished < len(done) and done[finished]:
+                        finished += 1
+                    progress.notify_all()
+
+        def arrive(index: int, scheduled: float) -> None:
+            task = asyncio.ensure_future(issue(index, scheduled))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+        self.stats.max_lag = await run_schedule(replay_offsets(records, speed), arrive)
+        while self._tasks:
+            await asyncio.gather(*self._tasks)
+
+    async def issue(self, index: int, record: CallRecord, scheduled: float) -> None:
+        """Sends (or simulates) one logged call and records its outcome."""
+        loop = asyncio.get_running_loop()
+        call = Call(method=record.method, args=record.args, arrived=scheduled, context=record)
+        send: Callable[..., typing.Awaitable[typing.Any]] = getattr(
+            self.client.send, record.method
+        )
+        try:
+            result = await send(
+                args=record.args or None,
+                params=algokit_utils.CommonAppCallParams(
+                    sender=self.senders[record.sender],
+                    # Repeated calls with equal arguments must not share a txid.
+                    note=f"replay:{index}".encode(),
+                ),
+            )
+        except Exception as error:
+            self.stats.record_rejected([call], error)
+            return
+        if result.fee:
+            self.stats.groups += 1
+        self.stats.record_confirmed([call], loop.time(), result.fee)
+
+
+def recorded_stats(records: Sequence[CallRecord]) -> LoadStats:
+    """The recorded calls' durations and failures, to compare with a replay's report."""
+    stats = LoadStats()
+    for record in records:
+        call = Call(method=record.method, args=record.args, arrived=0.0)
+        if record.ok:
+            stats.record_confirmed([call], record.duration)
+        else:
+            stats.record_rejected([call], Exception("failed when recorded"))
+    return stats
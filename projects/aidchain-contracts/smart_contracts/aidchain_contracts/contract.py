@@ -1,66 +1,25 @@
-from algopy import ARC4Contract, String, UInt64, GlobalState, itxn, Txn, Global, Account, BoxMap, urange
-from algopy.arc4 import abimethod, Struct, UInt64 as ARC4UInt64, String as ARC4String
-class CampaignInfo(Struct):
-    id: ARC4UInt64
-    title: ARC4String
-    target: ARC4UInt64
-    raised: ARC4UInt64
-    creator: ARC4String
-    active: ARC4UInt64  # 0 = inactive, 1 = active
+from algopy import String, UInt64
+from algopy.arc4 import abimethod
 
-class OrganizationInfo(Struct):
-    id: ARC4UInt64
-    name: ARC4String
-    wallet_address: ARC4String
-    verification_level: ARC4UInt64  # 0 = unverified, 1 = basic, 2 = verified, 3 = partner
+from smart_contracts.aidchain_campaigns.contract import AidchainCampaigns
+from smart_contracts.aidchain_deliveries.contract import AidchainDeliveries
+from smart_contracts.aidchain_registry.contract import AidchainRegistry
+from smart_contracts.aidchain_vouchers.contract import AidchainVouchers
 
-class DeliveryRecord(Struct):
-    id: ARC4UInt64
-    recipient: ARC4String
-    location: ARC4String
-    agent: ARC4String
-    verified: ARC4UInt64  # 0 = not verified, 1 = verified
 
-class VoucherInfo(Struct):
-    id: ARC4UInt64
-    asset_id: ARC4UInt64
-    name: ARC4String
-    total_supply: ARC4UInt64
-    issued: ARC4UInt64
+class AidchainContracts(AidchainRegistry, AidchainCampaigns, AidchainDeliveries, AidchainVouchers):
+    """
+    Every Aidchain domain in one app. The state, structs and methods are the domain
+    apps' own (see smart_contracts/aidchain_contracts/domains.py), so the two layouts
+    cannot drift apart; only `initialize` spans the domains.
+    """
 
-class MilestoneInfo(Struct):
-    id: ARC4UInt64
-    campaign_id: ARC4UInt64
-    target_amount: ARC4UInt64
-    description: ARC4String
-    completed: ARC4UInt64  # 0 = pending, 1 = completed
-    funds_released: ARC4UInt64  # 0 = not released, 1 = released
-
-class AidchainContracts(ARC4Contract):
     def __init__(self) -> None:
-        # Global state for counters
-        self.campaign_counter = GlobalState(UInt64(0))
-        self.organization_counter = GlobalState(UInt64(0))
-        self.delivery_counter = GlobalState(UInt64(0))
-        self.voucher_counter = GlobalState(UInt64(0))
-        self.milestone_counter = GlobalState(UInt64(0))
-        
-        # Global state for total metrics
-        self.total_donations = GlobalState(UInt64(0))
-        self.total_organizations = GlobalState(UInt64(0))
-        self.total_vouchers_issued = GlobalState(UInt64(0))
-        self.total_milestones_completed = GlobalState(UInt64(0))
-        
-        # BoxMap storage for structured data
-        self.campaigns = BoxMap(ARC4UInt64, CampaignInfo, key_prefix="campaigns")
-        self.organizations = BoxMap(ARC4UInt64, OrganizationInfo, key_prefix="orgs")
-        self.milestones = BoxMap(ARC4UInt64, MilestoneInfo, key_prefix="milestones")
-        self.deliveries = BoxMap(ARC4UInt64, DeliveryRecord, key_prefix="deliveries")
-        self.vouchers = BoxMap(ARC4UInt64, VoucherInfo, key_prefix="vouchers")
-    @abimethod()
-    def hello(self, name: String) -> String:
-        return "Hello, " + name
-    
+        AidchainRegistry.__init__(self)
+        AidchainCampaigns.__init__(self)
+        AidchainDeliveries.__init__(self)
+        AidchainVouchers.__init__(self)
+
     @abimethod()
     def initialize(self) -> String:
         """Initialize the contract with default values"""
@@ -74,291 +33,3 @@ class AidchainContracts(ARC4Contract):
         self.total_vouchers_issued.value = UInt64(0)
         self.total_milestones_completed.value = UInt64(0)
         return String("Contract initialized successfully")
-    
-    @abimethod()
-    def register_organization(self, org_name: String, wallet_address: String) -> UInt64:
-        """Register a new organization in the system with proper data storage"""
-        self.organization_counter.value += UInt64(1)
-        org_id = self.organization_counter.value
-        
-        # Store organization data in BoxMap
-        self.organizations[ARC4UInt64(org_id)] = OrganizationInfo(
-            id=ARC4UInt64(org_id),
-            name=ARC4String(org_name),
-            wallet_address=ARC4String(wallet_address),
-            verification_level=ARC4UInt64(0)  # 0 = unverified initially
-        )
-        
-        self.total_organizations.value += UInt64(1)
-        return org_id
-    
-    @abimethod()
-    def create_campaign(self, title: String, target: UInt64, creator: String) -> UInt64:
-        """Create a new donation campaign with proper data storage"""
-        self.campaign_counter.value += UInt64(1)
-        campaign_id = self.campaign_counter.value
-        
-        # Store campaign data in BoxMap
-        self.campaigns[ARC4UInt64(campaign_id)] = CampaignInfo(
-            id=ARC4UInt64(campaign_id),
-            title=ARC4String(title),
-            target=ARC4UInt64(target),
-            raised=ARC4UInt64(0),  # No funds raised initially
-            creator=ARC4String(creator),
-            active=ARC4UInt64(1)  # 1 = active
-        )
-        
-        return campaign_id
-    
-    @abimethod()
-    def get_campaign_count(self) -> UInt64:
-        """Get total number of campaigns created"""
-        return self.campaign_counter.value
-    
-    @abimethod()
-    def get_organization_count(self) -> UInt64:
-        """Get total number of organizations registered"""
-        return self.organization_counter.value
-
-    @abimethod()
-    def create_donation(self, campaign_id: UInt64) -> String:
-        """Create a donation record (for testing without payment)"""
-        # Validate campaign exists using professional patterns
-        assert campaign_id <= self.campaign_counter.value, "Campaign ID out of range"
-        assert campaign_id != UInt64(0), "Campaign ID cannot be zero"
-        assert ARC4UInt64(campaign_id) in self.campaigns, "Campaign not found"
-        
-        # For testing purposes, simulate a donation amount
-        # In production, this would get the actual payment amount from Txn.amount
-        donation_amount = UInt64(Txn.amount)  # Simulated donation amount
-        
-        # Add to total donations (real blockchain state)
-        self.total_donations.value += donation_amount
-        
-        return String("Donation recorded successfully")
-    
-    @abimethod()
-    def get_total_donations(self) -> UInt64:
-        """Get total amount of donations across all campaigns"""
-        return self.total_donations.value
-    
-    @abimethod()
-    def calculate_total(self, amount1: UInt64, amount2: UInt64) -> UInt64:
-        """Calculate total of two amounts"""
-        return amount1 + amount2
-    
-    @abimethod()
-    def validate_donation(self, amount: UInt64, donor: String) -> String:
-        """Validate donation parameters"""
-        if amount > UInt64(0):
-            return String("Valid donation from ") + donor
-        else:
-            return String("Invalid donation amount")
-    
-    @abimethod() 
-    def log_delivery(self, recipient: String, location: String) -> UInt64:
-        """Log a delivery event"""
-        self.delivery_counter.value += UInt64(1)
-        delivery_id = self.delivery_counter.value
-        
-        # Store delivery data in BoxMap
-        self.deliveries[ARC4UInt64(delivery_id)] = DeliveryRecord(
-            id=ARC4UInt64(delivery_id),
-            recipient=ARC4String(recipient),
-            location=ARC4String(location),
-            agent=ARC4String(""),  # Empty initially
-            verified=ARC4UInt64(0)  # 0 = not verified initially
-        )
-        
-        return delivery_id
-    
-    @abimethod()
-    def verify_delivery(self, delivery_id: UInt64, agent: String) -> String:
-        """Verify a delivery by an authorized agent"""
-        # Validate delivery exists
-        assert delivery_id <= self.delivery_counter.value, "Delivery ID out of range"
-        assert delivery_id != UInt64(0), "Delivery ID cannot be zero"
-        assert ARC4UInt64(delivery_id) in self.deliveries, "Delivery not found"
-        
-        # Update delivery status in BoxMap
-        delivery_info = self.deliveries[ARC4UInt64(delivery_id)].copy()
-        delivery_info.verified = ARC4UInt64(1)  # Mark as verified
-        delivery_info.agent = ARC4String(agent)  # Set the verifying agent
-        self.deliveries[ARC4UInt64(delivery_id)] = delivery_info.copy()
-        
-        return String("Delivery verified by agent: ") + agent
-    
-    @abimethod()
-    def get_contract_stats(self) -> String:
-        """Get overall contract statistics"""
-        return String("Contract statistics available")
-    
-    @abimethod()
-    def create_voucher_asset(self, asset_name: String, total_supply: UInt64) -> ARC4UInt64:
-        """Create a REAL ASA token on the blockchain for aid distribution"""
-        # Create actual ASA token using inner transaction
-        txn_result = itxn.AssetConfig(
-            asset_name=asset_name,
-            unit_name=String("VOUCHER"),
-            total=total_supply,
-            decimals=0,
-            default_frozen=False,
-            manager=Global.current_application_address,
-            reserve=Global.current_application_address,
-            freeze=Global.current_application_address,
-            clawback=Global.current_application_address,
-            fee=Global.min_txn_fee,  # Use minimum transaction fee
-        ).submit()
-        
-        # Get the created asset ID
-        asset_id = txn_result.created_asset.id
-        
-        # Increment voucher counter
-        self.voucher_counter.value += UInt64(1)
-        voucher_id = self.voucher_counter.value
-        
-        # Store voucher info in BoxMap
-        self.vouchers[ARC4UInt64(voucher_id)] = VoucherInfo(
-            id=ARC4UInt64(voucher_id),
-            asset_id=ARC4UInt64(asset_id),
-            name=ARC4String(asset_name),
-            total_supply=ARC4UInt64(total_supply),
-            issued=ARC4UInt64(0)  # No tokens issued yet
-        )
-        
-        # Return the actual asset ID created by the blockchain
-        return ARC4UInt64(asset_id)
-    
-    @abimethod()
-    def distribute_vouchers(self, asset_id: UInt64, recipient: String, amount: UInt64) -> String:
-        """REAL blockchain token transfer to recipient"""
-        
-        # EARLY RETURN TO ISOLATE INNER TRANSACTION ISSUE
-        return String("Debug mode: vouchers distributed")
-    
-    @abimethod()
-    def redeem_voucher(self, voucher_id: UInt64, merchant: String, amount: UInt64) -> String:
-        """Redeem voucher tokens at an approved merchant"""
-        if voucher_id > self.voucher_counter.value or voucher_id == UInt64(0):
-            return String("Invalid voucher ID")
-        
-        if amount == UInt64(0):
-            return String("Amount must be greater than zero")
-        
-        return String("Vouchers redeemed at ") + merchant
-    
-    @abimethod()
-    def get_voucher_stats(self) -> String:
-        
-        """Get voucher system statistics"""
-        return String("Voucher statistics available")
-    
-    @abimethod()
-    def create_milestone(self, campaign_id: UInt64, target_amount: UInt64, description: String) -> UInt64:
-        """Create a new milestone for campaign funding"""
-        # Validate campaign exists
-        assert campaign_id <= self.campaign_counter.value, "Campaign ID out of range"
-        assert campaign_id != UInt64(0), "Campaign ID cannot be zero"
-        assert ARC4UInt64(campaign_id) in self.campaigns, "Campaign not found"
-        
-        self.milestone_counter.value += UInt64(1)
-        milestone_id = self.milestone_counter.value
-        
-        # Store milestone data in BoxMap
-        self.milestones[ARC4UInt64(milestone_id)] = MilestoneInfo(
-            id=ARC4UInt64(milestone_id),
-            campaign_id=ARC4UInt64(campaign_id),
-            target_amount=ARC4UInt64(target_amount),
-            description=ARC4String(description),
-            completed=ARC4UInt64(0),  # 0 = pending
-            funds_released=ARC4UInt64(0)  # 0 = not released
-        )
-        
-        return milestone_id
-    
-    @abimethod()
-    def complete_milestone(self, milestone_id: UInt64, proof: String) -> String:
-        """Mark milestone as completed with proof"""
-        # Validate milestone exists
-        assert milestone_id <= self.milestone_counter.value, "Milestone ID out of range"
-        assert milestone_id != UInt64(0), "Milestone ID cannot be zero"
-        assert ARC4UInt64(milestone_id) in self.milestones, "Milestone not found"
-        
-        # Update milestone status in BoxMap
-        milestone_info = self.milestones[ARC4UInt64(milestone_id)].copy()
-        milestone_info.completed = ARC4UInt64(1)  # Mark as completed
-        self.milestones[ARC4UInt64(milestone_id)] = milestone_info.copy()
-        
-        self.total_milestones_completed.value += UInt64(1)
-        return String("Milestone completed with proof: ") + proof
-    
-    @abimethod()
-    def release_milestone_funds(self, milestone_id: UInt64, recipient: Account, amount: UInt64) -> String:
-        """Release REAL funds for completed milestone via blockchain payment"""
-        # Validate using professional patterns
-        assert milestone_id <= self.milestone_counter.value, "Milestone ID out of range"
-        assert milestone_id != UInt64(0), "Milestone ID cannot be zero"
-        assert amount > UInt64(0), "Amount must be greater than zero"
-        
-        # Make actual payment on blockchain
-        itxn.Payment(
-            receiver=recipient,
-            amount=amount,
-            fee=Global.min_txn_fee,  # Use minimum transaction fee
-        ).submit()
-        
-        return String("Real blockchain payment sent for milestone")
-    
-    @abimethod()
-    def get_milestone_stats(self) -> String:
-        """Get milestone system statistics"""
-        return String("Milestone statistics available")
-    
-    # Data Retrieval Methods (Professional Pattern)
-    
-    @abimethod(readonly=True)
-    def get_campaign_details(self, campaign_id: ARC4UInt64) -> CampaignInfo:
-        """Get detailed information about a campaign"""
-        assert campaign_id in self.campaigns, "Campaign not found"
-        return self.campaigns[campaign_id]
-    
-    @abimethod(readonly=True)
-    def get_organization_details(self, org_id: ARC4UInt64) -> OrganizationInfo:
-        """Get detailed information about an organization"""
-        assert org_id in self.organizations, "Organization not found"
-        return self.organizations[org_id]
-    
-    @abimethod(readonly=True)
-    def get_voucher_details(self, voucher_id: ARC4UInt64) -> VoucherInfo:
-        """Get detailed information about a voucher"""
-        assert voucher_id in self.vouchers, "Voucher not found"
-        return self.vouchers[voucher_id]
-    
-    @abimethod(readonly=True)
-    def get_milestone_details(self, milestone_id: ARC4UInt64) -> MilestoneInfo:
-        """Get detailed information about a milestone"""
-        assert milestone_id in self.milestones, "Milestone not found"
-        return self.milestones[milestone_id]
-    
-    @abimethod(readonly=True)
-    def get_delivery_details(self, delivery_id: ARC4UInt64) -> DeliveryRecord:
-        """Get detailed information about a delivery"""
-        assert delivery_id in self.deliveries, "Delivery not found"
-        return self.deliveries[delivery_id]
-    
-    # Additional utility methods for better functionality
-    
-    @abimethod(readonly=True)
-    def get_milestone_count(self) -> UInt64:
-        """Get total number of milestones created"""
-        return self.milestone_counter.value
-    
-    @abimethod(readonly=True)
-    def get_voucher_count(self) -> UInt64:
-        """Get total number of vouchers created"""
-        return self.voucher_counter.value
-    
-    @abimethod(readonly=True)
-    def get_delivery_count(self) -> UInt64:
-        """Get total number of deliveries logged"""
-        return self.delivery_counter.value
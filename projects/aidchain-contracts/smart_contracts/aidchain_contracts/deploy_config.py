@@ -1,45 +1,51 @@
-import logging
+import os
 
 import algokit_utils
 
-logger = logging.getLogger(__name__)
+from smart_contracts._helpers.app_deploy import AppDeployConfig
+
+APP_NAME = "AidchainContracts"
+
+# Usage a new app account is funded for: expected entries per box map, ASAs created by
+# create_voucher_asset, and inner transactions (asset configs and milestone payments)
+# whose fees the app pays. The exact minimum balance for this is paid on creation.
+app = AppDeployConfig(
+    spec_name=APP_NAME,
+    folder="aidchain_contracts",
+    funding_boxes={
+        "campaigns": 10,
+        "organizations": 10,
+        "milestones": 20,
+        "deliveries": 50,
+        "vouchers": 10,
+    },
+    funding_created_assets=5,
+    funding_inner_txns=25,
+)
+artifacts_dir = app.artifacts_dir
+funding_plan = app.funding_plan
+deploy_app = app.deploy_app
+
+# Sharded mode: with AIDCHAIN_SHARDS=N, deploy() deploys N instances named
+# "<APP_NAME>-shard-<k>" that split campaigns and other records between them by ID range.
+# Address them through ShardedAidchainContractsClient (sharding.py). Raising N later adds
+# shards; existing shards and IDs are unaffected.
+deploy_shards = int(os.getenv("AIDCHAIN_SHARDS", "0"))
+
+
+def shard_app_name(index: int, app_name: str = APP_NAME) -> str:
+    return f"{app_name}-shard-{index}"
 
 
 # define deployment behaviour based on supplied app spec
-def deploy() -> None:
-    from smart_contracts.artifacts.aidchain_contracts.aidchain_contracts_client import (
-        HelloArgs,
-        AidchainContractsFactory,
-    )
-
+def deploy(
+    on_update: algokit_utils.OnUpdate = algokit_utils.OnUpdate.AppendApp,
+    *,
+    fast: bool | None = None,
+) -> None:
     algorand = algokit_utils.AlgorandClient.from_environment()
-    deployer_ = algorand.account.from_environment("DEPLOYER")
-
-    factory = algorand.client.get_typed_app_factory(
-        AidchainContractsFactory, default_sender=deployer_.address
-    )
-
-    app_client, result = factory.deploy(
-        on_update=algokit_utils.OnUpdate.AppendApp,
-        on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
-    )
-
-    if result.operation_performed in [
-        algokit_utils.OperationPerformed.Create,
-        algokit_utils.OperationPerformed.Replace,
-    ]:
-        # Fund contract with enough Algos for inner transactions (ASA creation, payments)
-        algorand.send.payment(
-            algokit_utils.PaymentParams(
-                amount=algokit_utils.AlgoAmount(algo=10),  # 10 Algos for inner transaction fees
-                sender=deployer_.address,
-                receiver=app_client.app_address,
-            )
-        )
-
-    name = "world"
-    response = app_client.send.hello(args=HelloArgs(name=name))
-    logger.info(
-        f"Called hello on {app_client.app_name} ({app_client.app_id}) "
-        f"with name={name}, received: {response.abi_return}"
-    )
+    if not deploy_shards:
+        deploy_app(algorand, on_update=on_update, fast=fast)
+        return
+    for index in range(deploy_shards):
+        deploy_app(algorand, app_name=shard_app_name(index), on_update=on_update, fast=fast)
@@ -0,0 +1,180 @@
+import typing
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+import algokit_utils
+
+from smart_contracts._helpers.deploy_registry import DeployRegistry
+from smart_contracts.artifacts.aidchain_campaigns.aidchain_campaigns_client import (
+    AidchainCampaignsClient,
+)
+from smart_contracts.artifacts.aidchain_contracts.aidchain_contracts_client import (
+    AidchainContractsSend,
+    GlobalStateValue,
+)
+from smart_contracts.artifacts.aidchain_deliveries.aidchain_deliveries_client import (
+    AidchainDeliveriesClient,
+)
+from smart_contracts.artifacts.aidchain_registry.aidchain_registry_client import (
+    AidchainRegistryClient,
+)
+from smart_contracts.artifacts.aidchain_vouchers.aidchain_vouchers_client import (
+    AidchainVouchersClient,
+)
+
+# Domain apps by facade attribute, and the app name each is deployed under.
+DOMAIN_APPS = {
+    "registry": "AidchainRegistry",
+    "campaigns": "AidchainCampaigns",
+    "deliveries": "AidchainDeliveries",
+    "vouchers": "AidchainVouchers",
+}
+# Methods every domain app has: where the facade sends them.
+_SHARED_METHODS = {"hello": "registry", "initialize": "all"}
+_BOX_MAPS = {
+    "organizations": "registry",
+    "campaigns": "campaigns",
+    "milestones": "campaigns",
+    "deliveries": "deliveries",
+    "vouchers": "vouchers",
+}
+
+
+class AidchainDomainsClient:
+    """
+    Facade with the AidchainContractsClient API over the split domain apps.
+
+    Organizations live in the registry app, campaigns, donations and milestones in the
+    campaigns app, deliveries in the delivery ledger and vouchers in the vouchers app.
+    Each ABI method exists in exactly one of them, so `send`, `params` and
+    `create_transaction` route every call by method name; `params` results can be
+    combined into one atomic group across apps. `initialize` resets every app (its
+    `params` / `create_transaction` return one entry per app).
+    `state.global_state.get_all()` merges the apps' counters, which are disjoint.
+    Returned structs are the domain clients' dataclasses, with the same fields.
+    """
+
+    def __init__(
+        self,
+        registry: AidchainRegistryClient,
+        campaigns: AidchainCampaignsClient,
+        deliveries: AidchainDeliveriesClient,
+        vouchers: AidchainVouchersClient,
+    ) -> None:
+        self.registry = registry
+        self.campaigns = campaigns
+        self.deliveries = deliveries
+        self.vouchers = vouchers
+        self.send = typing.cast(AidchainContractsSend, _DomainRouter(self, "send"))
+        self.params = _DomainRouter(self, "params")
+        self.create_transaction = _DomainRouter(self, "create_transaction")
+        self.state = DomainState(self)
+
+    @classmethod
+    def from_registry(
+        cls,
+        algorand: algokit_utils.AlgorandClient,
+        registry: DeployRegistry,
+        *,
+        default_sender: str | None = None,
+    ) -> "AidchainDomainsClient":
+        """Creates a facade over the domain apps recorded by deploys to this network."""
+        deployments = registry.deployments(algorand.client.algod.algod_address)
+        if missing := [name for name in DOMAIN_APPS.values() if name not in deployments]:
+            raise Exception(f"Domain apps not deployed to this network: {', '.join(missing)}")
+        clients = {
+            "registry": AidchainRegistryClient,
+            "campaigns": AidchainCampaignsClient,
+            "deliveries": AidchainDeliveriesClient,
+            "vouchers": AidchainVouchersClient,
+        }
+        return cls(
+            **{
+                domain: algorand.client.get_typed_app_client_by_id(
+                    client_class,
+                    app_id=deployments[DOMAIN_APPS[domain]].app_id,
+                    default_sender=default_sender,
+                )
+                for domain, client_class in clients.items()
+            }
+        )
+
+    @property
+    def domains(self) -> dict[str, typing.Any]:
+        return {domain: getattr(self, domain) for domain in DOMAIN_APPS}
+
+    @property
+    def app_ids(self) -> dict[str, int]:
+        return {domain: client.app_id for domain, client in self.domains.items()}
+
+    def owner(self, method: str) -> str:
+        """Returns the domain whose app implements `method`."""
+        if method in _SHARED_METHODS:
+            return _SHARED_METHODS[method]
+        for domain, client in self.domains.items():
+            if hasattr(type(client.send), method):
+                return domain
+        raise AttributeError(f"No Aidchain domain app implements {method}")
+
+    def map_domains(self, call: Callable[[typing.Any], typing.Any]) -> dict[str, typing.Any]:
+        with ThreadPoolExecutor(max_workers=len(DOMAIN_APPS)) as executor:
+            futures = {
+                domain: executor.submit(call, client) for domain, client in self.domains.items()
+            }
+            return {domain: future.result() for domain, future in futures.items()}
+
+
+class _DomainRouter:
+    def __init__(self, facade: AidchainDomainsClient, accessor: str) -> None:
+        self._facade = facade
+        self._accessor = accessor
+
+    def __getattr__(self, method: str) -> Callable[..., typing.Any]:
+        if method.startswith("_") or method in {"update", "clear_state"}:
+            raise AttributeError(method)
+        domain = self._facade.owner(method)
+
+        def call(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+            if domain == "all":
+                results = self._facade.map_domains(
+                    lambda client: getattr(getattr(client, self._accessor), method)(
+                        *args, **kwargs
+                    )
+                )
+                # One result for sends; params/transactions for every app, to be grouped.
+                return results["registry"] if self._accessor == "send" else list(results.values())
+            client = getattr(self._facade, domain)
+            return getattr(getattr(client, self._accessor), method)(*args, **kwargs)
+
+        return call
+
+
+class DomainState:
+    """Global state and box maps of all domain apps"""
+
+    def __init__(self, facade: AidchainDomainsClient) -> None:
+        self.global_state = _DomainGlobalState(facade)
+        self.box = _DomainBoxState(facade)
+
+
+class _DomainGlobalState:
+    def __init__(self, facade: AidchainDomainsClient) -> None:
+        self._facade = facade
+
+    def get_all(self) -> GlobalStateValue:
+        merged: dict[str, int] = {}
+        for state in self._facade.map_domains(
+            lambda client: client.state.global_state.get_all()
+        ).values():
+            merged.update(state)
+        return typing.cast(GlobalStateValue, merged)
+
+
+class _DomainBoxState:
+    def __init__(self, facade: AidchainDomainsClient) -> None:
+        self._facade = facade
+
+    def __getattr__(self, map_name: str) -> typing.Any:
+        if map_name not in _BOX_MAPS:
+            raise AttributeError(map_name)
+        return getattr(getattr(self._facade, _BOX_MAPS[map_name]).state.box, map_name)
@@ -0,0 +1,119 @@
+import asyncio
+import dataclasses
+import time
+import typing
+from collections.abc import Callable, Iterable, Mapping
+
+from algokit_utils.applications.app_manager import AppManager
+
+from smart_contracts._helpers.async_algod import AsyncAlgodClient
+from smart_contracts._helpers.deploy_registry import Deployment
+from smart_contracts.aidchain_contracts.deploy_config import APP_NAME
+from smart_contracts.artifacts.aidchain_contracts import aidchain_contracts_client
+from smart_contracts.artifacts.aidchain_contracts.aidchain_contracts_client import (
+    GlobalStateValue,
+)
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class FleetSnapshot:
+    """Global state of many AidchainContracts apps and its fleet-wide totals"""
+
+    per_app: dict[int, GlobalStateValue]
+    # Sum of every counter over the apps that could be read.
+    totals: dict[str, int]
+    # Apps whose state could not be read (e.g. deleted), with the error.
+    unavailable: dict[int, str]
+
+
+def decode_global_state(info: dict[str, typing.Any]) -> GlobalStateValue:
+    """Decodes the global state of an algod application info response."""
+    state = AppManager.decode_app_state(info["params"].get("global-state", []))
+    by_key = {value.key_base64: value.value for value in state.values()}
+    keys = aidchain_contracts_client.APP_SPEC.state.keys.global_state
+    return typing.cast(
+        GlobalStateValue,
+        {name: by_key[key.key] for name, key in keys.items() if key.key in by_key},
+    )
+
+
+def fleet_app_ids(deployments: Mapping[str, Deployment]) -> list[int]:
+    """
+    IDs of the AidchainContracts instances among a network's recorded deployments: the app,
+    its shards ("<APP_NAME>-shard-<k>") and fleet instances named "<APP_NAME>-<target>".
+    The domain apps (AidchainRegistry, ...) keep their counters under the same keys and
+    are left out, so no record is counted twice.
+    """
+    return sorted(
+        deployment.app_id
+        for name, deployment in deployments.items()
+        if name == APP_NAME or name.startswith(f"{APP_NAME}-")
+    )
+
+
+class FleetStats:
+    """
+    Aggregates AidchainContracts global state counters across many app instances.
+
+    State for all apps is fetched concurrently over one pooled `AsyncAlgodClient`, with
+    at most `max_concurrency` requests in flight. Each app's state is cached for `ttl`
+    seconds and concurrent requests for the same app share one fetch, so a dashboard
+    polled by several viewers costs one algod request per app per TTL.
+    """
+
+    def __init__(
+        self,
+        algod: AsyncAlgodClient,
+        *,
+        ttl: float = 5.0,
+        max_concurrency: int = 32,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.algod = algod
+        self.ttl = ttl
+        self.clock = clock
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._cache: dict[int, tuple[float, asyncio.Future[GlobalStateValue]]] = {}
+
+    async def _fetch(self, app_id: int) -> GlobalStateValue:
+        async with self._semaphore:
+            info = await self.algod.application_info(app_id)
+        return decode_global_state(info)
+
+    async def app_state(self, app_id: int) -> GlobalStateValue:
+        cached = self._cache.get(app_id)
+        if cached is None or cached[0] <= self.clock():
+            future = asyncio.ensure_future(self._fetch(app_id))
+            self._cache[app_id] = (self.clock() + self.ttl, future)
+        else:
+            future = cached[1]
+        try:
+            return await asyncio.shield(future)
+        except Exception:
+            # Failures are not cached; the next request retries.
+            if self._cache.get(app_id, (0, None))[1] is future:
+                del self._cache[app_id]
+            raise
+
+    def invalidate(self, app_id: int | None = None) -> None:
+        if app_id is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(app_id, None)
+
+    async def snapshot(self, app_ids: Iterable[int]) -> FleetSnapshot:
+        app_ids = list(dict.fromkeys(app_ids))
+        results = await asyncio.gather(
+            *(self.app_state(app_id) for app_id in app_ids), return_exceptions=True
+        )
+        per_app: dict[int, GlobalStateValue] = {}
+        unavailable: dict[int, str] = {}
+        totals: dict[str, int] = {}
+        for app_id, result in zip(app_ids, results):
+            if isinstance(result, BaseException):
+                unavailable[app_id] = str(result) or type(result).__name__
+                continue
+            per_app[app_id] = result
+            for name, value in result.items():
+                totals[name] = totals.get(name, 0) + typing.cast(int, value)
+        return FleetSnapshot(per_app=per_app, totals=totals, unavailable=unavailable)
@@ -0,0 +1,304 @@
+import asyncio
+import base64
+import dataclasses
+import random
+import time
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any
+
+import algokit_utils
+from algosdk import encoding
+from algosdk.transaction import SignedTransaction, assign_group_id
+from algosdk.v2client.models import SimulateRequest, SimulateRequestTransactionGroup
+
+from smart_contracts._helpers.async_algod import AsyncAlgodClient
+from smart_contracts._helpers.confirmation_tracker import ConfirmationTracker
+from smart_contracts._helpers.load_generator import Call, GroupPacker, LoadStats
+from smart_contracts.artifacts.aidchain_contracts.aidchain_contracts_client import (
+    AidchainContractsClient,
+)
+
+_SUGGESTED_PARAMS_TTL = 3.0
+
+# Relative weights of the calls a load run sends when no mix is given: mostly donations and
+# deliveries, some new records and a share of readonly getters (simulated, not sent).
+default_mix = {
+    "register_organization": 1,
+    "create_campaign": 1,
+    "create_donation": 4,
+    "log_delivery": 3,
+    "verify_delivery": 3,
+    "get_campaign_details": 1,
+    "get_delivery_details": 1,
+    "get_delivery_count": 1,
+}
+
+
+@dataclasses.dataclass(kw_only=True)
+class RecordIds:
+    """
+    IDs of one record kind (a box map keyed by its counter) during a load run.
+
+    The app numbers new records from its counter in confirmation order, which is not known
+    when a create is built, so each create is given the ID it is expected to get plus box
+    references for `slack` IDs on either side. Calls on existing records use IDs that are
+    known to be confirmed.
+    """
+
+    prefix: bytes
+    next_id: int = 1
+    existing: int = 0
+
+    def reserve(self) -> int:
+        record_id = self.next_id
+        self.next_id += 1
+        return record_id
+
+    def confirm(self) -> None:
+        self.existing += 1
+
+    def release(self) -> None:
+        """A create was rejected, so later creates get one ID less than reserved."""
+        self.next_id -= 1
+
+    def box_name(self, record_id: int) -> bytes:
+        return self.prefix + record_id.to_bytes(8, "big")
+
+    def window(self, record_id: int, slack: int) -> list[bytes]:
+        return [
+            self.box_name(candidate)
+            for candidate in range(max(1, record_id - slack), record_id + slack + 1)
+        ]
+
+    def pick(self, rng: random.Random) -> int:
+        if not self.existing:
+            raise Exception(f"No {self.prefix.decode()} records to call yet")
+        return rng.randint(1, self.existing)
+
+
+# Box map prefixes of the records the workload creates.
+_RECORDS = {"organizations": b"orgs", "campaigns": b"campaigns", "deliveries": b"deliveries"}
+# Methods that create a record of each kind.
+_CREATES = {
+    "register_organization": "organizations",
+    "create_campaign": "campaigns",
+    "log_delivery": "deliveries",
+}
+
+_ArgsBuilder = Callable[[random.Random, Mapping[str, RecordIds], str], tuple[Any, ...]]
+# Arguments per supported method; `sender` is the address sending the call.
+_ARGS: dict[str, _ArgsBuilder] = {
+    "register_organization": lambda rng, ids, sender: (f"Org {rng.randrange(10**6)}", sender),
+    "create_campaign": lambda rng, ids, sender: ("Load campaign", 10_000, "load"),
+    "create_donation": lambda rng, ids, sender: (ids["campaigns"].pick(rng),),
+    "log_delivery": lambda rng, ids, sender: (f"Family {rng.randrange(10**6)}", "Camp B"),
+    "verify_delivery": lambda rng, ids, sender: (ids["deliveries"].pick(rng), "load-agent"),
+    "calculate_total": lambda rng, ids, sender: (rng.randrange(10**6), rng.randrange(10**6)),
+    "validate_donation": lambda rng, ids, sender: (rng.randrange(10**6), "donor"),
+    "get_campaign_details": lambda rng, ids, sender: (ids["campaigns"].pick(rng),),
+    "get_organization_details": lambda rng, ids, sender: (ids["organizations"].pick(rng),),
+    "get_delivery_details": lambda rng, ids, sender: (ids["deliveries"].pick(rng),),
+    **{
+        method: lambda rng, ids, sender: ()
+        for method in (
+            "get_campaign_count",
+            "get_organization_count",
+            "get_delivery_count",
+            "get_total_donations",
+            "get_contract_stats",
+        )
+    },
+}
+# Record kind whose ID is the first argument of methods that read or update an existing record.
+_READS = {
+    "create_donation": "campaigns",
+    "verify_delivery": "deliveries",
+}
+
+supported_methods = sorted(_ARGS)
+
+
+def expected_records(mix: Mapping[str, float], calls: int) -> dict[str, int]:
+    """Records of each kind a run of `calls` calls drawn from `mix` is expected to create."""
+    total = sum(mix.values())
+    expected = {kind: 0 for kind in _RECORDS}
+    for method, kind in _CREATES.items():
+        expected[kind] += round(calls * mix.get(method, 0) / total)
+    return expected
+
+
+class AidchainLoad:
+    """
+    Drives a method mix against one AidchainContracts app through a `GroupPacker`.
+
+    State-changing calls are packed into atomic groups, signed by `senders` in turn, sent
+    through the shared async algod connection and confirmed by a block-following
+    `ConfirmationTracker`. Box references are set up front (see `RecordIds`), so a send
+    costs one algod request rather than a simulate plus a send. Readonly calls are
+    simulated individually. Outcomes go to `stats`.
+    """
+
+    def __init__(
+        self,
+        client: AidchainContractsClient,
+        algod: AsyncAlgodClient,
+        senders: Sequence[str],
+        *,
+        rng: random.Random,
+        group_size: int = 1,
+        linger: float = 0.01,
+        box_slack: int = 3,
+    ) -> None:
+        if not senders:
+            raise Exception("At least one sender is needed")
+        if not 0 <= box_slack <= 3:
+            # A transaction references at most 8 resources, the window takes 2 * slack + 1.
+            raise Exception("box_slack must be between 0 and 3")
+        self.client = client
+        self.algod = algod
+        self.senders = list(senders)
+        self.rng = rng
+        self.box_slack = box_slack
+        self.ids = {kind: RecordIds(prefix=prefix) for kind, prefix in _RECORDS.items()}
+        self.readonly = {method.name for method in client.app_spec.methods if method.readonly}
+        self.stats = LoadStats()
+        self.confirmations = ConfirmationTracker(algod)
+        self.packer = GroupPacker(self.send_group, group_size=group_size, linger=linger)
+        self._sequence = 0
+        self._params_lock = asyncio.Lock()
+        self._params_expiry = 0.0
+
+    def seed(self, existing: Mapping[str, int]) -> None:
+        """Records the number of records of each kind the app already holds."""
+        for kind, count in existing.items():
+            self.ids[kind].existing = count
+            self.ids[kind].next_id = count + 1
+
+    def arrive(self, method: str, arrived: float) -> None:
+        """Schedules one call of `method` that arrived at loop time `arrived`."""
+        if method not in _ARGS:
+            raise Exception(f"Unsupported method {method}, choose from {supported_methods}")
+        sender = self.senders[self._sequence % len(self.senders)]
+        self._sequence += 1
+        call = Call(
+            method=method,
+            args=_ARGS[method](self.rng, self.ids, sender),
+            arrived=arrived,
+            context=self.ids[_CREATES[method]].reserve() if method in _CREATES else None,
+        )
+        if method in self.readonly:
+            self.packer.spawn(self.simulate(call))
+        else:
+            self.packer.add(call)
+
+    async def drain(self) -> None:
+        await self.packer.drain()
+        await self.confirmations.aclose()
+
+    def _box_references(self, call: Call) -> list[algokit_utils.BoxReference]:
+        if call.method in _CREATES:
+            names = self.ids[_CREATES[call.method]].window(call.context, self.box_slack)
+        elif call.method in _READS:
+            names = [self.ids[_READS[call.method]].box_name(call.args[0])]
+        else:
+            names = []
+        return [algokit_utils.BoxReference(app_id=0, name=name) for name in names]
+
+    async def _prime_suggested_params(self) -> None:
+        # Keeps transaction building free of blocking algod requests (see async_client.py).
+        if self._params_expiry > time.time():
+            return
+        async with self._params_lock:
+            if self._params_expiry > time.time():
+                return
+            suggested_params = await self.algod.suggested_params()
+            self._params_expiry = time.time() + _SUGGESTED_PARAMS_TTL
+            self.client.algorand.set_suggested_params_cache(suggested_params, self._params_expiry)
+
+    def _build(self, calls: Sequence[Call], sender: str) -> list[Any]:
+        composer = self.client.algorand.new_group()
+        for call in calls:
+            self._sequence += 1
+            composer.add_app_call_method_call(
+                _method_call(
+                    getattr(self.client.params, call.method),
+                    call.args,
+                    algokit_utils.CommonAppCallParams(
+                        sender=sender,
+                        # Repeated calls with equal arguments must not share a txid.
+                        note=f"load:{self._sequence}".encode(),
+                        box_references=self._box_references(call),
+                    ),
+                )
+            )
+        transactions = composer.build_transactions().transactions
+        if len(transactions) > 1:
+            transactions = assign_group_id(transactions)
+        signer = self.client.algorand.account.get_signer(sender)
+        return signer.sign_transactions(transactions, list(range(len(transactions))))
+
+    async def send_group(self, calls: list[Call]) -> None:
+        """Sends `calls` as one atomic group and records the outcome of every call in it."""
+        loop = asyncio.get_running_loop()
+        sender = self.senders[self.stats.groups % len(self.senders)]
+        self.stats.groups += 1
+        try:
+            await self._prime_suggested_params()
+            signed = self._build(calls, sender)
+            tx_id = signed[0].get_txid()
+            confirmed = self.confirmations.track(tx_id, signed[0].transaction.last_valid_round)
+            try:
+                await self.algod.send_raw_transaction(
+                    b"".join(base64.b64decode(encoding.msgpack_encode(txn)) for txn in signed)
+                )
+            except Exception:
+                self.confirmations.discard(tx_id)
+                raise
+            await confirmed
+        except Exception as error:
+            for call in calls:
+                if call.method in _CREATES:
+                    self.ids[_CREATES[call.method]].release()
+            self.stats.record_rejected(calls, error)
+            return
+        for call in calls:
+            if call.method in _CREATES:
+                self.ids[_CREATES[call.method]].confirm()
+        self.stats.record_confirmed(
+            calls, loop.time(), sum(txn.transaction.fee for txn in signed)
+        )
+
+    async def simulate(self, call: Call) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            await self._prime_suggested_params()
+            built = _method_call(
+                getattr(self.client.create_transaction, call.method),
+                call.args,
+                algokit_utils.CommonAppCallParams(sender=self.senders[0]),
+            )
+            unsigned = [
+                SignedTransaction(txn, None)  # type: ignore[arg-type]
+                for txn in built.transactions
+            ]
+            response = await self.algod.simulate_transactions(
+                SimulateRequest(
+                    txn_groups=[SimulateRequestTransactionGroup(txns=unsigned)],
+                    allow_empty_signatures=True,
+                    allow_unnamed_resources=True,
+                )
+            )
+            failure = response["txn-groups"][0].get("failure-message")
+            if failure:
+                raise Exception(failure)
+        except Exception as error:
+            self.stats.record_rejected([call], error)
+            return
+        self.stats.record_confirmed([call], loop.time())
+
+
+def _method_call(
+    builder: Callable[..., Any], args: tuple[Any, ...], params: algokit_utils.CommonAppCallParams
+) -> Any:
+    # Generated builders of methods without arguments take no `args`.
+    return builder(args=args, params=params) if args else builder(params=params)
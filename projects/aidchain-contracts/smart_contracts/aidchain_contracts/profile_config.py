@@ -0,0 +1,129 @@
+import logging
+from collections.abc import Iterator
+from typing import Any
+
+import algokit_utils
+from algosdk.v2client.models import SimulateTraceConfig
+
+from smart_contracts._helpers.opcode_profile import (
+    MethodProfile,
+    SourceMap,
+    approval_trace,
+    format_report,
+    load_source_map,
+    profile_trace,
+)
+from smart_contracts.aidchain_contracts.deploy_config import APP_NAME, artifacts_dir, funding_plan
+
+logger = logging.getLogger(__name__)
+
+# Extra balance for the payments made by release_milestone_funds while profiling.
+profile_payout = 1_000
+
+
+def profile_calls(recipient: str) -> list[tuple[str, tuple[Any, ...]]]:
+    """Every ABI method with sample arguments, ordered so each call finds the records it reads."""
+    return [
+        ("hello", ("world",)),
+        ("initialize", ()),
+        ("register_organization", ("Red Cross", recipient)),
+        ("create_campaign", ("Flood relief", 10_000, "Red Cross")),
+        ("create_donation", (1,)),
+        ("calculate_total", (1_000, 2_000)),
+        ("validate_donation", (500, "donor")),
+        ("log_delivery", ("Family 12", "Camp B")),
+        ("verify_delivery", (1, "agent-7")),
+        ("create_voucher_asset", ("Food voucher", 1_000)),
+        ("distribute_vouchers", (1, recipient, 10)),
+        ("redeem_voucher", (1, "Market", 5)),
+        ("create_milestone", (1, 5_000, "Phase 1")),
+        ("complete_milestone", (1, "ipfs://proof")),
+        ("release_milestone_funds", (1, recipient, profile_payout)),
+        ("get_campaign_count", ()),
+        ("get_organization_count", ()),
+        ("get_total_donations", ()),
+        ("get_contract_stats", ()),
+        ("get_voucher_stats", ()),
+        ("get_milestone_stats", ()),
+        ("get_campaign_details", (1,)),
+        ("get_organization_details", (1,)),
+        ("get_voucher_details", (1,)),
+        ("get_milestone_details", (1,)),
+        ("get_delivery_details", (1,)),
+        ("get_milestone_count", ()),
+        ("get_voucher_count", ()),
+        ("get_delivery_count", ()),
+    ]
+
+
+def traced_workload() -> tuple[SourceMap, Iterator[tuple[str, dict[str, Any]]]]:
+    """
+    Creates a throwaway app on localnet and returns the source map aligned with its
+    deployed program, and an iterator over each call of `profile_calls` with its simulate
+    response (execution trace with stack and state changes). Each call is sent after it is
+    simulated, so later calls see the records earlier ones created.
+    """
+    # Imported here so a stale or missing client does not break building the contract.
+    from smart_contracts.artifacts.aidchain_contracts.aidchain_contracts_client import (
+        AidchainContractsFactory,
+    )
+
+    algorand = algokit_utils.AlgorandClient.from_environment()
+    if not algorand.client.is_localnet():
+        raise Exception("Profiling creates a throwaway app and only runs on localnet")
+    deployer = algorand.account.from_environment("DEPLOYER")
+    factory = algorand.client.get_typed_app_factory(
+        AidchainContractsFactory,
+        app_name=f"{APP_NAME}-profile",
+        default_sender=deployer.address,
+        compilation_params=algokit_utils.AppClientCompilationParams(updatable=False),
+    )
+    app_client, _ = factory.send.create.bare()
+    algorand.send.payment(
+        algokit_utils.PaymentParams(
+            sender=deployer.address,
+            receiver=app_client.app_address,
+            amount=algokit_utils.AlgoAmount.from_micro_algo(
+                funding_plan().required + profile_payout
+            ),
+        )
+    )
+    # The map leaves out the templated constant blocks; the deployed program sizes them.
+    source_map = load_source_map(
+        artifacts_dir / f"{APP_NAME}.approval.puya.map",
+        algorand.app.get_by_id(app_client.app_id).approval_program,
+    )
+
+    def calls() -> Iterator[tuple[str, dict[str, Any]]]:
+        for method, args in profile_calls(deployer.address):
+            result = (
+                algorand.new_group()
+                .add_app_call_method_call(getattr(app_client.params, method)(args=args))
+                .simulate(
+                    exec_trace_config=SimulateTraceConfig(
+                        enable=True, stack_change=True, state_change=True
+                    ),
+                    allow_unnamed_resources=True,
+                    skip_signatures=True,
+                )
+            )
+            yield method, result.simulate_response
+            getattr(app_client.send, method)(args=args)
+
+    return source_map, calls()
+
+
+def profile(top: int = 5) -> None:
+    """
+    Runs every ABI method through simulate with execution tracing (`traced_workload`),
+    attributes each executed opcode to its contract.py line through the puya source map
+    and prints a per-method and overall hot-spot report.
+    """
+    source_map, workload = traced_workload()
+    profiles: list[MethodProfile] = []
+    for method, response in workload:
+        budget = response["txn-groups"][0]["txn-results"][0].get("app-budget-consumed", 0)
+        profiles.append(profile_trace(source_map, method, approval_trace(response), budget))
+        logger.debug(f"Profiled {method}: {budget} budget")
+
+    print(format_report(source_map, profiles, top=top))
@@ -0,0 +1,303 @@
+import dataclasses
+import inspect
+import itertools
+import typing
+import zlib
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+
+import algokit_utils
+
+from smart_contracts._helpers.deploy_registry import DeployRegistry
+from smart_contracts.aidchain_contracts.deploy_config import APP_NAME, shard_app_name
+from smart_contracts.artifacts.aidchain_contracts.aidchain_contracts_client import (
+    AidchainContractsClient,
+    AidchainContractsSend,
+    GlobalStateValue,
+)
+
+# Every shard owns a fixed range of IDs for campaigns, milestones, organizations,
+# deliveries and vouchers: shard k maps its local ID n to the global ID k * stride + n.
+# Ranges never move, so shards can be added without renumbering anything.
+SHARD_ID_STRIDE = 1 << 40
+
+# Methods whose first argument is an ID, and which kind of ID it is. Milestones are
+# created on the shard of their campaign.
+_ROUTED_BY_ID = {
+    "create_donation": "campaign",
+    "create_milestone": "campaign",
+    "get_campaign_details": "campaign",
+    "complete_milestone": "milestone",
+    "release_milestone_funds": "milestone",
+    "get_milestone_details": "milestone",
+    "verify_delivery": "delivery",
+    "get_delivery_details": "delivery",
+    "redeem_voucher": "voucher",
+    "get_voucher_details": "voucher",
+    "get_organization_details": "organization",
+}
+# Methods that create a record on a shard chosen by the placement policy, and the
+# argument that hash placement keys on.
+_PLACED = {
+    "create_campaign": 2,  # creator
+    "register_organization": 0,  # org_name
+    "log_delivery": 0,  # recipient
+    "create_voucher_asset": 0,  # asset_name
+}
+# Methods returning a shard-local ID.
+_RETURNS_LOCAL_ID = {
+    "create_campaign",
+    "register_organization",
+    "log_delivery",
+    "create_milestone",
+}
+# Counters that are summed over all shards.
+_SUMMED = {
+    "get_campaign_count",
+    "get_organization_count",
+    "get_total_donations",
+    "get_milestone_count",
+    "get_voucher_count",
+    "get_delivery_count",
+}
+_BROADCAST = {"initialize"}
+# Struct fields holding shard-local IDs.
+_STRUCT_ID_FIELDS = {
+    "CampaignInfo": ("id",),
+    "MilestoneInfo": ("id", "campaign_id"),
+    "OrganizationInfo": ("id",),
+    "DeliveryRecord": ("id",),
+    "VoucherInfo": ("id",),
+}
+
+
+def global_id(shard: int, local_id: int) -> int:
+    if not 0 < local_id < SHARD_ID_STRIDE:
+        raise Exception(f"Local ID {local_id} is outside the shard ID range")
+    return shard * SHARD_ID_STRIDE + local_id
+
+
+def locate(id_: int) -> tuple[int, int]:
+    """Returns the shard index and shard-local ID of a global ID."""
+    return divmod(id_, SHARD_ID_STRIDE)
+
+
+def _args_tuple(args: typing.Any) -> tuple[typing.Any, ...]:
+    if dataclasses.is_dataclass(args):
+        return tuple(getattr(args, field.name) for field in dataclasses.fields(args))
+    return tuple(args)
+
+
+def _globalize(shard: int, value: typing.Any) -> typing.Any:
+    """Rewrites the shard-local IDs in a returned struct to global IDs."""
+    fields = _STRUCT_ID_FIELDS.get(type(value).__name__)
+    if not fields or not dataclasses.is_dataclass(value):
+        return value
+    return dataclasses.replace(
+        value,  # type: ignore[type-var]
+        **{name: global_id(shard, getattr(value, name)) for name in fields},
+    )
+
+
+class ShardedAidchainContractsClient:
+    """
+    Routes AidchainContracts calls over several app instances (shards).
+
+    Exposes the `send` and `state` API of AidchainContractsClient with global IDs:
+    - calls taking a campaign, milestone, delivery, voucher or organization ID go to the
+      shard owning that ID (see SHARD_ID_STRIDE) with the shard-local ID;
+    - creates go to a writable shard chosen by `placement`: "round_robin", or "hash" to
+      co-locate related records (e.g. the campaigns of one creator);
+    - count and total getters, global state and box maps are read from all shards
+      concurrently and merged;
+    - returned IDs and ID fields in returned structs are global.
+
+    Capacity grows by deploying another shard and adding it with a new index. Shards
+    left out of `writable` keep serving their records but take no new ones.
+    """
+
+    def __init__(
+        self,
+        shards: Mapping[int, AidchainContractsClient],
+        *,
+        writable: Iterable[int] | None = None,
+        placement: typing.Literal["round_robin", "hash"] = "round_robin",
+        max_workers: int = 16,
+    ) -> None:
+        if not shards:
+            raise Exception("A sharded client needs at least one shard")
+        self.shards = dict(sorted(shards.items()))
+        self.writable = sorted(self.shards if writable is None else writable)
+        if unknown := set(self.writable) - set(self.shards):
+            raise Exception(f"Unknown writable shards: {sorted(unknown)}")
+        self.placement = placement
+        self._next_shard = itertools.cycle(self.writable)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.send = typing.cast(AidchainContractsSend, _ShardedSend(self))
+        self.state = ShardedState(self)
+
+    @classmethod
+    def from_registry(
+        cls,
+        algorand: algokit_utils.AlgorandClient,
+        registry: DeployRegistry,
+        *,
+        app_name: str = APP_NAME,
+        default_sender: str | None = None,
+        **kwargs: typing.Any,
+    ) -> "ShardedAidchainContractsClient":
+        """Creates a client over the shards recorded by sharded deploys to this network."""
+        prefix = shard_app_name(0, app_name).removesuffix("0")
+        deployments = registry.deployments(algorand.client.algod.algod_address)
+        shards = {
+            int(name.removeprefix(prefix)): algorand.client.get_typed_app_client_by_id(
+                AidchainContractsClient, app_id=deployment.app_id, default_sender=default_sender
+            )
+            for name, deployment in deployments.items()
+            if name.startswith(prefix) and name.removeprefix(prefix).isdigit()
+        }
+        return cls(shards, **kwargs)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+
+    def place(self, method: str, args: tuple[typing.Any, ...]) -> int:
+        """Returns the shard a record created by `method` with `args` is stored on."""
+        if not self.writable:
+            raise Exception(f"No writable shards to create records with {method} on")
+        if self.placement == "hash":
+            key = str(args[_PLACED[method]]).encode()
+            return self.writable[zlib.crc32(key) % len(self.writable)]
+        return next(self._next_shard)
+
+    def shard_of_asset(self, asset_id: int) -> int:
+        """Returns the shard whose app created a voucher asset."""
+        creator = next(iter(self.shards.values())).algorand.asset.get_by_id(asset_id).creator
+        for index, client in self.shards.items():
+            if client.app_address == creator:
+                return index
+        raise Exception(f"Asset {asset_id} was not created by any shard")
+
+    def map_shards(
+        self, call: Callable[[AidchainContractsClient], typing.Any]
+    ) -> dict[int, typing.Any]:
+        """Runs `call` against every shard concurrently and returns the results by shard."""
+        futures = {
+            index: self._executor.submit(call, client) for index, client in self.shards.items()
+        }
+        return {index: future.result() for index, future in futures.items()}
+
+
+class _ShardedSend:
+    def __init__(self, router: ShardedAidchainContractsClient) -> None:
+        self._router = router
+
+    def __getattr__(self, name: str) -> Callable[..., typing.Any]:
+        method = getattr(AidchainContractsSend, name, None)
+        if method is None or name.startswith("_") or name in {"update", "clear_state"}:
+            raise AttributeError(f"{name} cannot be sent through the shard router")
+        takes_args = "args" in inspect.signature(method).parameters
+        router = self._router
+
+        def call(*positional: typing.Any, **kwargs: typing.Any) -> typing.Any:
+            args: tuple[typing.Any, ...] = ()
+            if takes_args:
+                args = _args_tuple(kwargs.pop("args") if "args" in kwargs else positional[0])
+                positional = positional[1:]
+
+            def send(
+                client: AidchainContractsClient, args: tuple[typing.Any, ...]
+            ) -> typing.Any:
+                if takes_args:
+                    return getattr(client.send, name)(args, *positional, **kwargs)
+                return getattr(client.send, name)(*positional, **kwargs)
+
+            if name in _SUMMED or name in _BROADCAST:
+                results = router.map_shards(lambda client: send(client, args))
+                first = results[next(iter(results))]
+                if name in _BROADCAST:
+                    return first
+                total = sum(result.abi_return for result in results.values())
+                return dataclasses.replace(first, abi_return=total)
+
+            if name in _ROUTED_BY_ID:
+                shard, local_id = locate(args[0])
+                if shard not in router.shards:
+                    raise Exception(
+                        f"{_ROUTED_BY_ID[name]} {args[0]} belongs to unknown shard {shard}"
+                    )
+                args = (local_id, *args[1:])
+            elif name == "distribute_vouchers":
+                shard = router.shard_of_asset(args[0])
+            elif name in _PLACED:
+                shard = router.place(name, args)
+            else:
+                # Stateless methods can be answered by any shard.
+                shard = router.writable[0] if router.writable else next(iter(router.shards))
+
+            result = send(router.shards[shard], args)
+            if name in _RETURNS_LOCAL_ID:
+                return dataclasses.replace(result, abi_return=global_id(shard, result.abi_return))
+            if dataclasses.is_dataclass(result.abi_return):
+                return dataclasses.replace(result, abi_return=_globalize(shard, result.abi_return))
+            return result
+
+        return call
+
+
+class ShardedState:
+    """Global state and box maps merged over all shards"""
+
+    def __init__(self, router: ShardedAidchainContractsClient) -> None:
+        self.global_state = _ShardedGlobalState(router)
+        self.box = _ShardedBoxState(router)
+
+
+class _ShardedGlobalState:
+    def __init__(self, router: ShardedAidchainContractsClient) -> None:
+        self._router = router
+
+    def get_all(self) -> GlobalStateValue:
+        """Sum of every global state counter over all shards."""
+        totals: dict[str, int] = {}
+        for state in self._router.map_shards(
+            lambda client: client.state.global_state.get_all()
+        ).values():
+            for name, value in state.items():
+                totals[name] = totals.get(name, 0) + value
+        return typing.cast(GlobalStateValue, totals)
+
+
+class _ShardedBoxState:
+    def __init__(self, router: ShardedAidchainContractsClient) -> None:
+        self._router = router
+
+    def __getattr__(self, map_name: str) -> "_ShardedMapState":
+        if map_name not in {"campaigns", "organizations", "milestones", "deliveries", "vouchers"}:
+            raise AttributeError(map_name)
+        return _ShardedMapState(self._router, map_name)
+
+
+class _ShardedMapState:
+    def __init__(self, router: ShardedAidchainContractsClient, map_name: str) -> None:
+        self._router = router
+        self._map_name = map_name
+
+    def get_map(self) -> dict[int, typing.Any]:
+        """All entries of the map on every shard, keyed by global ID."""
+        maps = self._router.map_shards(
+            lambda client: getattr(client.state.box, self._map_name).get_map()
+        )
+        return {
+            global_id(shard, key): _globalize(shard, value)
+            for shard, entries in maps.items()
+            for key, value in entries.items()
+        }
+
+    def get_value(self, key: int) -> typing.Any | None:
+        shard, local_id = locate(key)
+        client = self._router.shards.get(shard)
+        if client is None:
+            return None
+        value = getattr(client.state.box, self._map_name).get_value(local_id)
+        return None if value is None else _globalize(shard, value)
@@ -0,0 +1,76 @@
+from algopy import ARC4Contract, String, UInt64, GlobalState, Txn, Global, BoxMap, TemplateVar
+from algopy.arc4 import abimethod, baremethod, Struct, UInt64 as ARC4UInt64, String as ARC4String
+
+class DeliveryRecord(Struct):
+    id: ARC4UInt64
+    recipient: ARC4String
+    location: ARC4String
+    agent: ARC4String
+    verified: ARC4UInt64  # 0 = not verified, 1 = verified
+
+class AidchainDeliveries(ARC4Contract):
+    """Delivery ledger domain of Aidchain"""
+
+    def __init__(self) -> None:
+        self.delivery_counter = GlobalState(UInt64(0))
+        self.deliveries = BoxMap(ARC4UInt64, DeliveryRecord, key_prefix="deliveries")
+
+    @baremethod(allow_actions=["UpdateApplication"])
+    def update(self) -> None:
+        """
+        Allow the creator to replace the program in place, keeping app ID and box state.
+        Only deployments made updatable (TMPL_UPDATABLE, localnet by default) accept it.
+        """
+        assert TemplateVar[bool]("UPDATABLE"), "App is not updatable"
+        assert Txn.sender == Global.creator_address, "Only creator can update"
+
+    @abimethod()
+    def hello(self, name: String) -> String:
+        return "Hello, " + name
+
+    @abimethod()
+    def initialize(self) -> String:
+        """Initialize the delivery ledger with default values"""
+        self.delivery_counter.value = UInt64(0)
+        return String("Contract initialized successfully")
+
+    @abimethod()
+    def log_delivery(self, recipient: String, location: String) -> UInt64:
+        """Log a delivery event"""
+        self.delivery_counter.value += UInt64(1)
+        delivery_id = self.delivery_counter.value
+
+        self.deliveries[ARC4UInt64(delivery_id)] = DeliveryRecord(
+            id=ARC4UInt64(delivery_id),
+            recipient=ARC4String(recipient),
+            location=ARC4String(location),
+            agent=ARC4String(""),  # Empty initially
+            verified=ARC4UInt64(0)  # 0 = not verified initially
+        )
+
+        return delivery_id
+
+    @abimethod()
+    def verify_delivery(self, delivery_id: UInt64, agent: String) -> String:
+        """Verify a delivery by an authorized agent"""
+        assert delivery_id <= self.delivery_counter.value, "Delivery ID out of range"
+        assert delivery_id != UInt64(0), "Delivery ID cannot be zero"
+        assert ARC4UInt64(delivery_id) in self.deliveries, "Delivery not found"
+
+        delivery_info = self.deliveries[ARC4UInt64(delivery_id)].copy()
+        delivery_info.verified = ARC4UInt64(1)  # Mark as verified
+        delivery_info.agent = ARC4String(agent)  # Set the verifying agent
+        self.deliveries[ARC4UInt64(delivery_id)] = delivery_info.copy()
+
+        return String("Delivery verified by agent: ") + agent
+
+    @abimethod(readonly=True)
+    def get_delivery_details(self, delivery_id: ARC4UInt64) -> DeliveryRecord:
+        """Get detailed information about a delivery"""
+        assert delivery_id in self.deliveries, "Delivery not found"
+        return self.deliveries[delivery_id]
+
+    @abimethod(readonly=True)
+    def get_delivery_count(self) -> UInt64:
+        """Get total number of deliveries logged"""
+        return self.delivery_counter.value
@@ -0,0 +1,9 @@
+from smart_contracts._helpers.app_deploy import AppDeployConfig
+
+# Delivery ledger domain app; see smart_contracts/aidchain_contracts/domains.py.
+app = AppDeployConfig(
+    spec_name="AidchainDeliveries",
+    folder="aidchain_deliveries",
+    funding_boxes={"deliveries": 50},
+)
+deploy = app.deploy
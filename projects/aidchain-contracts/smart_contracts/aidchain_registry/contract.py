@@ -0,0 +1,68 @@
+from algopy import ARC4Contract, String, UInt64, GlobalState, Txn, Global, BoxMap, TemplateVar
+from algopy.arc4 import abimethod, baremethod, Struct, UInt64 as ARC4UInt64, String as ARC4String
+
+class OrganizationInfo(Struct):
+    id: ARC4UInt64
+    name: ARC4String
+    wallet_address: ARC4String
+    verification_level: ARC4UInt64  # 0 = unverified, 1 = basic, 2 = verified, 3 = partner
+
+class AidchainRegistry(ARC4Contract):
+    """Organization registry domain of Aidchain"""
+
+    def __init__(self) -> None:
+        self.organization_counter = GlobalState(UInt64(0))
+        self.total_organizations = GlobalState(UInt64(0))
+        self.organizations = BoxMap(ARC4UInt64, OrganizationInfo, key_prefix="orgs")
+
+    @baremethod(allow_actions=["UpdateApplication"])
+    def update(self) -> None:
+        """
+        Allow the creator to replace the program in place, keeping app ID and box state.
+        Only deployments made updatable (TMPL_UPDATABLE, localnet by default) accept it.
+        """
+        assert TemplateVar[bool]("UPDATABLE"), "App is not updatable"
+        assert Txn.sender == Global.creator_address, "Only creator can update"
+
+    @abimethod()
+    def hello(self, name: String) -> String:
+        return "Hello, " + name
+
+    @abimethod()
+    def initialize(self) -> String:
+        """Initialize the registry with default values"""
+        self.organization_counter.value = UInt64(0)
+        self.total_organizations.value = UInt64(0)
+        return String("Contract initialized successfully")
+
+    @abimethod()
+    def register_organization(self, org_name: String, wallet_address: String) -> UInt64:
+        """Register a new organization in the system with proper data storage"""
+        self.organization_counter.value += UInt64(1)
+        org_id = self.organization_counter.value
+
+        self.organizations[ARC4UInt64(org_id)] = OrganizationInfo(
+            id=ARC4UInt64(org_id),
+            name=ARC4String(org_name),
+            wallet_address=ARC4String(wallet_address),
+            verification_level=ARC4UInt64(0)  # 0 = unverified initially
+        )
+
+        self.total_organizations.value += UInt64(1)
+        return org_id
+
+    @abimethod()
+    def get_organization_count(self) -> UInt64:
+        """Get total number of organizations registered"""
+        return self.organization_counter.value
+
+    @abimethod()
+    def get_contract_stats(self) -> String:
+        """Get overall contract statistics"""
+        return String("Contract statistics available")
+
+    @abimethod(readonly=True)
+    def get_organization_details(self, org_id: ARC4UInt64) -> OrganizationInfo:
+        """Get detailed information about an organization"""
+        assert org_id in self.organizations, "Organization not found"
+        return self.organizations[org_id]
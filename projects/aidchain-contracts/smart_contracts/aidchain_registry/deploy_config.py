@@ -0,0 +1,9 @@
+from smart_contracts._helpers.app_deploy import AppDeployConfig
+
+# Organization registry domain app; see smart_contracts/aidchain_contracts/domains.py.
+app = AppDeployConfig(
+    spec_name="AidchainRegistry",
+    folder="aidchain_registry",
+    funding_boxes={"organizations": 10},
+)
+deploy = app.deploy
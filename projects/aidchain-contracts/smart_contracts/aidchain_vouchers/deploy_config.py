@@ -0,0 +1,11 @@
+from smart_contracts._helpers.app_deploy import AppDeployConfig
+
+# Voucher domain app; see smart_contracts/aidchain_contracts/domains.py.
+app = AppDeployConfig(
+    spec_name="AidchainVouchers",
+    folder="aidchain_vouchers",
+    funding_boxes={"vouchers": 10},
+    funding_created_assets=5,
+    funding_inner_txns=5,
+)
+deploy = app.deploy
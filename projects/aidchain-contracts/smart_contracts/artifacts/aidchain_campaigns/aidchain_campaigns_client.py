@@ -0,0 +1,2213 @@
+# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^3.0.0
+# Post-processed by smart_contracts._helpers.client_postprocess.
+
+# common
+import dataclasses
+import functools
+import typing
+# core algosdk
+import algosdk
+from algosdk.transaction import OnComplete
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.source_map import SourceMap
+from algosdk.transaction import Transaction
+from algosdk.v2client.models import SimulateTraceConfig
+# utils
+import algokit_utils
+from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
+
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": ["UpdateApplication"], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "name"}], "name": "hello", "returns": {"type": "string"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "initialize", "returns": {"type": "string"}, "desc": "Initialize the campaign counters with default values", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "title"}, {"type": "uint64", "name": "target"}, {"type": "string", "name": "creator"}], "name": "create_campaign", "returns": {"type": "uint64"}, "desc": "Create a new donation campaign with proper data storage", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_campaign_count", "returns": {"type": "uint64"}, "desc": "Get total number of campaigns created", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "campaign_id"}], "name": "create_donation", "returns": {"type": "string"}, "desc": "Create a donation record (for testing without payment)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_total_donations", "returns": {"type": "uint64"}, "desc": "Get total amount of donations across all campaigns", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "amount1"}, {"type": "uint64", "name": "amount2"}], "name": "calculate_total", "returns": {"type": "uint64"}, "desc": "Calculate total of two amounts", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "amount"}, {"type": "string", "name": "donor"}], "name": "validate_donation", "returns": {"type": "string"}, "desc": "Validate donation parameters", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "campaign_id"}, {"type": "uint64", "name": "target_amount"}, {"type": "string", "name": "description"}], "name": "create_milestone", "returns": {"type": "uint64"}, "desc": "Create a new milestone for campaign funding", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "milestone_id"}, {"type": "string", "name": "proof"}], "name": "complete_milestone", "returns": {"type": "string"}, "desc": "Mark milestone as completed with proof", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "milestone_id"}, {"type": "account", "name": "recipient"}, {"type": "uint64", "name": "amount"}], "name": "release_milestone_funds", "returns": {"type": "string"}, "desc": "Release REAL funds for completed milestone via blockchain payment", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_milestone_stats", "returns": {"type": "string"}, "desc": "Get milestone system statistics", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "campaign_id"}], "name": "get_campaign_details", "returns": {"type": "(uint64,string,uint64,uint64,string,uint64)", "struct": "CampaignInfo"}, "desc": "Get detailed information about a campaign", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "milestone_id"}], "name": "get_milestone_details", "returns": {"type": "(uint64,uint64,uint64,string,uint64,uint64)", "struct": "MilestoneInfo"}, "desc": "Get detailed information about a milestone", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_milestone_count", "returns": {"type": "uint64"}, "desc": "Get total number of milestones created", "events": [], "readonly": true, "recommendations": {}}], "name": "AidchainCampaigns", "state": {"keys": {"box": {}, "global": {"campaign_counter": {"key": "Y2FtcGFpZ25fY291bnRlcg==", "keyType": "AVMString", "valueType": "AVMUint64"}, "milestone_counter": {"key": "bWlsZXN0b25lX2NvdW50ZXI=", "keyType": "AVMString", "valueType": "AVMUint64"}, "total_donations": {"key": "dG90YWxfZG9uYXRpb25z", "keyType": "AVMString", "valueType": "AVMUint64"}, "total_milestones_completed": {"key": "dG90YWxfbWlsZXN0b25lc19jb21wbGV0ZWQ=", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"campaigns": {"keyType": "uint64", "valueType": "CampaignInfo", "prefix": "Y2FtcGFpZ25z"}, "milestones": {"keyType": "uint64", "valueType": "MilestoneInfo", "prefix": "bWlsZXN0b25lcw=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 4}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"CampaignInfo": [{"name": "id", "type": "uint64"}, {"name": "title", "type": "string"}, {"name": "target", "type": "uint64"}, {"name": "raised", "type": "uint64"}, {"name": "creator", "type": "string"}, {"name": "active", "type": "uint64"}], "MilestoneInfo": [{"name": "id", "type": "uint64"}, {"name": "campaign_id", "type": "uint64"}, {"name": "target_amount", "type": "uint64"}, {"name": "description", "type": "string"}, {"name": "completed", "type": "uint64"}, {"name": "funds_released", "type": "uint64"}]}, "byteCode": {"approval": "CiADAAEAJgkEFR98dRBjYW1wYWlnbl9jb3VudGVyEW1pbGVzdG9uZV9jb3VudGVyD3RvdGFsX2RvbmF0aW9ucxp0b3RhbF9taWxlc3RvbmVzX2NvbXBsZXRlZAljYW1wYWlnbnMIAAAAAAAAAAAKbWlsZXN0b25lcwgAAAAAAAAAATEYQAANKSJnKiJnKyJnJwQiZzEbQQIQgg8EAr7OEQSJetGnBE/m/VYEE8EFuQT/URVTBJ/WyXgEzboSlwRBX2QeBHMkhWcEhO6uYwTD3ppSBAbUFMoEX1LfXwS/VO02BPN8+e02GgCODwGCAWoBSQE4ARwBCwDyANAAsQCPAGkAOQAmABMAAiJDMRkURDEYRIgD+RYoTFCwI0MxGRREMRhENhoBiAPVKExQsCNDMRkURDEYRDYaAYgDsihMULAjQzEZFEQxGESAJBUffHUAHk1pbGVzdG9uZSBzdGF0aXN0aWNzIGF2YWlsYWJsZbAjQzEZFEQxGEQ2GgEXNhoCF8AcNhoDF4gDFUkVFlcGAkxQKExQsCNDMRkURDEYRDYaARc2GgJXAgCIApxJFRZXBgJMUChMULAjQzEZFEQxGEQ2GgEXNhoCFzYaA1cCAIgCIxYoTFCwI0MxGRREMRhENhoBFzYaAlcCAIgBzEkVFlcGAkxQKExQsCNDMRkURDEYRDYaARc2GgIXiAGjFihMULAjQzEZFEQxGESIAY0WKExQsCNDMRkURDEYRDYaAReIATRJFRZXBgJMUChMULAjQzEZFEQxGESIARcWKExQsCNDMRkURDEYRDYaAVcCADYaAhc2GgNXAgCIAKMWKExQsCNDMRkURDEYRIgAYUkVFlcGAkxQKExQsCNDMRkURDEYRDYaAVcCAIgAM0kVFlcGAkxQKExQsCNDgQQiMRmOAgAJAANC/lIxGBREI0MxGESIAAIjQyREMQAyCRJEiYoBAYAHSGVsbG8sIIv/UIkpImcqImcrImcnBCJngCFDb250cmFjdCBpbml0aWFsaXplZCBzdWNjZXNzZnVsbHmJigMBIillRCMIKUsBZ0kWi/0VFlcGAov9UIv+Fov/FRZXBgKL/1BLA4ACACRQSwMVgSQITE8DUCcGUEwWVwYCUCcIUE8CUExQJwVPAlBJvEhMv4kiKWVEiYoBASIpZUSL/w9Ei/9Ei/8WJwVMUL1FAUQxCCIrZUQIK0xngB5Eb25hdGlvbiByZWNvcmRlZCBzdWNjZXNzZnVsbHmJIitlRImKAgGL/ov/CImKAgGL/kEAGoAUVmFsaWQgZG9uYXRpb24gZnJvbSCL/1CJgBdJbnZhbGlkIGRvbmF0aW9uIGFtb3VudImKAwEiKWVEi/0PRIv9RIv9FicFSwFQvUUBRCIqZUQjCCpLAWdJFov+Fov/FRZXBgKL/1BLAk8FUE8CUIACACpQJwZQJwZQTFAnB08CUEm8SEy/iYoCASIqZUSL/g9Ei/5Ei/4WJwdMUEm9RQFESb5EJwhcGksBvEi/IicEZUQjCCcETGeAIE1pbGVzdG9uZSBjb21wbGV0ZWQgd2l0aCBwcm9vZjogi/9QiYoDASIqZUSL/Q9Ei/1Ei/9EsTIAi/+yCIv+sgcjshCyAbOAKlJlYWwgYmxvY2tjaGFpbiBwYXltZW50IHNlbnQgZm9yIG1pbGVzdG9uZYmKAQEnBYv/UEm9RQFEvkSJigEBJweL/1BJvUUBRL5EiSIqZUSJ", "clear": "CoEBQw=="}, "desc": "Campaign, donation and milestone domain of Aidchain", "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMuYWlkY2hhaW5fY2FtcGFpZ25zLmNvbnRyYWN0LkFpZGNoYWluQ2FtcGFpZ25zLl9fYWxnb3B5X2VudHJ5cG9pbnRfd2l0aF9pbml0KCkgLT4gdWludDY0OgptYWluOgogICAgaW50Y2Jsb2NrIDAgMSBUTVBMX1VQREFUQUJMRQogICAgYnl0ZWNibG9jayAweDE1MWY3Yzc1ICJjYW1wYWlnbl9jb3VudGVyIiAibWlsZXN0b25lX2NvdW50ZXIiICJ0b3RhbF9kb25hdGlvbnMiICJ0b3RhbF9taWxlc3RvbmVzX2NvbXBsZXRlZCIgImNhbXBhaWducyIgMHgwMDAwMDAwMDAwMDAwMDAwICJtaWxlc3RvbmVzIiAweDAwMDAwMDAwMDAwMDAwMDEKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MjQKICAgIC8vIHNlbGYuY2FtcGFpZ25fY291bnRlciA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSkKICAgIGJ5dGVjXzEgLy8gImNhbXBhaWduX2NvdW50ZXIiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MjUKICAgIC8vIHNlbGYubWlsZXN0b25lX2NvdW50ZXIgPSBHbG9iYWxTdGF0ZShVSW50NjQoMCkpCiAgICBieXRlY18yIC8vICJtaWxlc3RvbmVfY291bnRlciIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToyNgogICAgLy8gc2VsZi50b3RhbF9kb25hdGlvbnMgPSBHbG9iYWxTdGF0ZShVSW50NjQoMCkpCiAgICBieXRlY18zIC8vICJ0b3RhbF9kb25hdGlvbnMiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MjcKICAgIC8vIHNlbGYudG90YWxfbWlsZXN0b25lc19jb21wbGV0ZWQgPSBHbG9iYWxTdGF0ZShVSW50NjQoMCkpCiAgICBieXRlYyA0IC8vICJ0b3RhbF9taWxlc3RvbmVzX2NvbXBsZXRlZCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAoKbWFpbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjIwCiAgICAvLyBjbGFzcyBBaWRjaGFpbkNhbXBhaWducyhBUkM0Q29udHJhY3QpOgogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IG1haW5fYmFyZV9yb3V0aW5nQDIwCiAgICBwdXNoYnl0ZXNzIDB4MDJiZWNlMTEgMHg4OTdhZDFhNyAweDRmZTZmZDU2IDB4MTNjMTA1YjkgMHhmZjUxMTU1MyAweDlmZDZjOTc4IDB4Y2RiYTEyOTcgMHg0MTVmNjQxZSAweDczMjQ4NTY3IDB4ODRlZWFlNjMgMHhjM2RlOWE1MiAweDA2ZDQxNGNhIDB4NWY1MmRmNWYgMHhiZjU0ZWQzNiAweGYzN2NmOWVkIC8vIG1ldGhvZCAiaGVsbG8oc3RyaW5nKXN0cmluZyIsIG1ldGhvZCAiaW5pdGlhbGl6ZSgpc3RyaW5nIiwgbWV0aG9kICJjcmVhdGVfY2FtcGFpZ24oc3RyaW5nLHVpbnQ2NCxzdHJpbmcpdWludDY0IiwgbWV0aG9kICJnZXRfY2FtcGFpZ25fY291bnQoKXVpbnQ2NCIsIG1ldGhvZCAiY3JlYXRlX2RvbmF0aW9uKHVpbnQ2NClzdHJpbmciLCBtZXRob2QgImdldF90b3RhbF9kb25hdGlvbnMoKXVpbnQ2NCIsIG1ldGhvZCAiY2FsY3VsYXRlX3RvdGFsKHVpbnQ2NCx1aW50NjQpdWludDY0IiwgbWV0aG9kICJ2YWxpZGF0ZV9kb25hdGlvbih1aW50NjQsc3RyaW5nKXN0cmluZyIsIG1ldGhvZCAiY3JlYXRlX21pbGVzdG9uZSh1aW50NjQsdWludDY0LHN0cmluZyl1aW50NjQiLCBtZXRob2QgImNvbXBsZXRlX21pbGVzdG9uZSh1aW50NjQsc3RyaW5nKXN0cmluZyIsIG1ldGhvZCAicmVsZWFzZV9taWxlc3RvbmVfZnVuZHModWludDY0LGFjY291bnQsdWludDY0KXN0cmluZyIsIG1ldGhvZCAiZ2V0X21pbGVzdG9uZV9zdGF0cygpc3RyaW5nIiwgbWV0aG9kICJnZXRfY2FtcGFpZ25fZGV0YWlscyh1aW50NjQpKHVpbnQ2NCxzdHJpbmcsdWludDY0LHVpbnQ2NCxzdHJpbmcsdWludDY0KSIsIG1ldGhvZCAiZ2V0X21pbGVzdG9uZV9kZXRhaWxzKHVpbnQ2NCkodWludDY0LHVpbnQ2NCx1aW50NjQsc3RyaW5nLHVpbnQ2NCx1aW50NjQpIiwgbWV0aG9kICJnZXRfbWlsZXN0b25lX2NvdW50KCl1aW50NjQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX2hlbGxvX3JvdXRlQDUgbWFpbl9pbml0aWFsaXplX3JvdXRlQDYgbWFpbl9jcmVhdGVfY2FtcGFpZ25fcm91dGVANyBtYWluX2dldF9jYW1wYWlnbl9jb3VudF9yb3V0ZUA4IG1haW5fY3JlYXRlX2RvbmF0aW9uX3JvdXRlQDkgbWFpbl9nZXRfdG90YWxfZG9uYXRpb25zX3JvdXRlQDEwIG1haW5fY2FsY3VsYXRlX3RvdGFsX3JvdXRlQDExIG1haW5fdmFsaWRhdGVfZG9uYXRpb25fcm91dGVAMTIgbWFpbl9jcmVhdGVfbWlsZXN0b25lX3JvdXRlQDEzIG1haW5fY29tcGxldGVfbWlsZXN0b25lX3JvdXRlQDE0IG1haW5fcmVsZWFzZV9taWxlc3RvbmVfZnVuZHNfcm91dGVAMTUgbWFpbl9nZXRfbWlsZXN0b25lX3N0YXRzX3JvdXRlQDE2IG1haW5fZ2V0X2NhbXBhaWduX2RldGFpbHNfcm91dGVAMTcgbWFpbl9nZXRfbWlsZXN0b25lX2RldGFpbHNfcm91dGVAMTggbWFpbl9nZXRfbWlsZXN0b25lX2NvdW50X3JvdXRlQDE5CgptYWluX2FmdGVyX2lmX2Vsc2VAMjM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjIwCiAgICAvLyBjbGFzcyBBaWRjaGFpbkNhbXBhaWducyhBUkM0Q29udHJhY3QpOgogICAgaW50Y18wIC8vIDAKICAgIHJldHVybgoKbWFpbl9nZXRfbWlsZXN0b25lX2NvdW50X3JvdXRlQDE5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxNzQKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBnZXRfbWlsZXN0b25lX2NvdW50CiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9taWxlc3RvbmVfZGV0YWlsc19yb3V0ZUAxODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MTY4CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MjAKICAgIC8vIGNsYXNzIEFpZGNoYWluQ2FtcGFpZ25zKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjE2OAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfbWlsZXN0b25lX2RldGFpbHMKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X2NhbXBhaWduX2RldGFpbHNfcm91dGVAMTc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjE2MgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjIwCiAgICAvLyBjbGFzcyBBaWRjaGFpbkNhbXBhaWducyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxNjIKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X2NhbXBhaWduX2RldGFpbHMKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X21pbGVzdG9uZV9zdGF0c19yb3V0ZUAxNjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MTU3CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgcHVzaGJ5dGVzIDB4MTUxZjdjNzUwMDFlNGQ2OTZjNjU3Mzc0NmY2ZTY1MjA3Mzc0NjE3NDY5NzM3NDY5NjM3MzIwNjE3NjYxNjk2YzYxNjI2YzY1CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fcmVsZWFzZV9taWxlc3RvbmVfZnVuZHNfcm91dGVAMTU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjE0MgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MjAKICAgIC8vIGNsYXNzIEFpZGNoYWluQ2FtcGFpZ25zKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICB0eG5hcyBBY2NvdW50cwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxNDIKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiByZWxlYXNlX21pbGVzdG9uZV9mdW5kcwogICAgZHVwCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fY29tcGxldGVfbWlsZXN0b25lX3JvdXRlQDE0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxMjgKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjIwCiAgICAvLyBjbGFzcyBBaWRjaGFpbkNhbXBhaWducyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZXh0cmFjdCAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MTI4CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgY29tcGxldGVfbWlsZXN0b25lCiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9jcmVhdGVfbWlsZXN0b25lX3JvdXRlQDEzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxMDcKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjIwCiAgICAvLyBjbGFzcyBBaWRjaGFpbkNhbXBhaWducyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZXh0cmFjdCAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MTA3CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgY3JlYXRlX21pbGVzdG9uZQogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl92YWxpZGF0ZV9kb25hdGlvbl9yb3V0ZUAxMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6OTkKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjIwCiAgICAvLyBjbGFzcyBBaWRjaGFpbkNhbXBhaWducyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZXh0cmFjdCAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6OTkKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiB2YWxpZGF0ZV9kb25hdGlvbgogICAgZHVwCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fY2FsY3VsYXRlX3RvdGFsX3JvdXRlQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weTo5NAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MjAKICAgIC8vIGNsYXNzIEFpZGNoYWluQ2FtcGFpZ25zKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5Ojk0CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgY2FsY3VsYXRlX3RvdGFsCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF90b3RhbF9kb25hdGlvbnNfcm91dGVAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5Ojg5CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBnZXRfdG90YWxfZG9uYXRpb25zCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2NyZWF0ZV9kb25hdGlvbl9yb3V0ZUA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weTo3NgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MjAKICAgIC8vIGNsYXNzIEFpZGNoYWluQ2FtcGFpZ25zKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5Ojc2CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgY3JlYXRlX2RvbmF0aW9uCiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfY2FtcGFpZ25fY291bnRfcm91dGVAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6NzEKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGdldF9jYW1wYWlnbl9jb3VudAogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9jcmVhdGVfY2FtcGFpZ25fcm91dGVANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6NTQKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjIwCiAgICAvLyBjbGFzcyBBaWRjaGFpbkNhbXBhaWducyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjU0CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgY3JlYXRlX2NhbXBhaWduCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2luaXRpYWxpemVfcm91dGVANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6NDUKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGluaXRpYWxpemUKICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2hlbGxvX3JvdXRlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjQxCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToyMAogICAgLy8gY2xhc3MgQWlkY2hhaW5DYW1wYWlnbnMoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjQxCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgaGVsbG8KICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2JhcmVfcm91dGluZ0AyMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MjAKICAgIC8vIGNsYXNzIEFpZGNoYWluQ2FtcGFpZ25zKEFSQzRDb250cmFjdCk6CiAgICBwdXNoaW50IDQgLy8gNAogICAgaW50Y18wIC8vIDAKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIG1hdGNoIG1haW5fdXBkYXRlQDIxIG1haW5fX19hbGdvcHlfZGVmYXVsdF9jcmVhdGVAMjIKICAgIGIgbWFpbl9hZnRlcl9pZl9lbHNlQDIzCgptYWluX19fYWxnb3B5X2RlZmF1bHRfY3JlYXRlQDIyOgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICEKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gY3JlYXRpbmcKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fdXBkYXRlQDIxOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weTozMgogICAgLy8gQGJhcmVtZXRob2QoYWxsb3dfYWN0aW9ucz1bIlVwZGF0ZUFwcGxpY2F0aW9uIl0pCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgdXBkYXRlCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFpZGNoYWluX2NhbXBhaWducy5jb250cmFjdC5BaWRjaGFpbkNhbXBhaWducy51cGRhdGUoKSAtPiB2b2lkOgp1cGRhdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjM4CiAgICAvLyBhc3NlcnQgVGVtcGxhdGVWYXJbYm9vbF0oIlVQREFUQUJMRSIpLCAiQXBwIGlzIG5vdCB1cGRhdGFibGUiCiAgICBpbnRjXzIgLy8gVE1QTF9VUERBVEFCTEUKICAgIGFzc2VydCAvLyBBcHAgaXMgbm90IHVwZGF0YWJsZQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weTozOQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywgIk9ubHkgY3JlYXRvciBjYW4gdXBkYXRlIgogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIE9ubHkgY3JlYXRvciBjYW4gdXBkYXRlCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWlkY2hhaW5fY2FtcGFpZ25zLmNvbnRyYWN0LkFpZGNoYWluQ2FtcGFpZ25zLmhlbGxvKG5hbWU6IGJ5dGVzKSAtPiBieXRlczoKaGVsbG86CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjQxLTQyCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBoZWxsbyhzZWxmLCBuYW1lOiBTdHJpbmcpIC0+IFN0cmluZzoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weTo0MwogICAgLy8gcmV0dXJuICJIZWxsbywgIiArIG5hbWUKICAgIHB1c2hieXRlcyAiSGVsbG8sICIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWlkY2hhaW5fY2FtcGFpZ25zLmNvbnRyYWN0LkFpZGNoYWluQ2FtcGFpZ25zLmluaXRpYWxpemUoKSAtPiBieXRlczoKaW5pdGlhbGl6ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6NDgKICAgIC8vIHNlbGYuY2FtcGFpZ25fY291bnRlci52YWx1ZSA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMSAvLyAiY2FtcGFpZ25fY291bnRlciIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weTo0OQogICAgLy8gc2VsZi5taWxlc3RvbmVfY291bnRlci52YWx1ZSA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMiAvLyAibWlsZXN0b25lX2NvdW50ZXIiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6NTAKICAgIC8vIHNlbGYudG90YWxfZG9uYXRpb25zLnZhbHVlID0gVUludDY0KDApCiAgICBieXRlY18zIC8vICJ0b3RhbF9kb25hdGlvbnMiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6NTEKICAgIC8vIHNlbGYudG90YWxfbWlsZXN0b25lc19jb21wbGV0ZWQudmFsdWUgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDQgLy8gInRvdGFsX21pbGVzdG9uZXNfY29tcGxldGVkIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjUyCiAgICAvLyByZXR1cm4gU3RyaW5nKCJDb250cmFjdCBpbml0aWFsaXplZCBzdWNjZXNzZnVsbHkiKQogICAgcHVzaGJ5dGVzICJDb250cmFjdCBpbml0aWFsaXplZCBzdWNjZXNzZnVsbHkiCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWlkY2hhaW5fY2FtcGFpZ25zLmNvbnRyYWN0LkFpZGNoYWluQ2FtcGFpZ25zLmNyZWF0ZV9jYW1wYWlnbih0aXRsZTogYnl0ZXMsIHRhcmdldDogdWludDY0LCBjcmVhdG9yOiBieXRlcykgLT4gdWludDY0OgpjcmVhdGVfY2FtcGFpZ246CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjU0LTU1CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBjcmVhdGVfY2FtcGFpZ24oc2VsZiwgdGl0bGU6IFN0cmluZywgdGFyZ2V0OiBVSW50NjQsIGNyZWF0b3I6IFN0cmluZykgLT4gVUludDY0OgogICAgcHJvdG8gMyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjU3CiAgICAvLyBzZWxmLmNhbXBhaWduX2NvdW50ZXIudmFsdWUgKz0gVUludDY0KDEpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiY2FtcGFpZ25fY291bnRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jYW1wYWlnbl9jb3VudGVyIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjXzEgLy8gImNhbXBhaWduX2NvdW50ZXIiCiAgICBkaWcgMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6NjEKICAgIC8vIGlkPUFSQzRVSW50NjQoY2FtcGFpZ25faWQpLAogICAgZHVwCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjYyCiAgICAvLyB0aXRsZT1BUkM0U3RyaW5nKHRpdGxlKSwKICAgIGZyYW1lX2RpZyAtMwogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgZnJhbWVfZGlnIC0zCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6NjMKICAgIC8vIHRhcmdldD1BUkM0VUludDY0KHRhcmdldCksCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6NjUKICAgIC8vIGNyZWF0b3I9QVJDNFN0cmluZyhjcmVhdG9yKSwKICAgIGZyYW1lX2RpZyAtMQogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6NjAtNjcKICAgIC8vIHNlbGYuY2FtcGFpZ25zW0FSQzRVSW50NjQoY2FtcGFpZ25faWQpXSA9IENhbXBhaWduSW5mbygKICAgIC8vICAgICBpZD1BUkM0VUludDY0KGNhbXBhaWduX2lkKSwKICAgIC8vICAgICB0aXRsZT1BUkM0U3RyaW5nKHRpdGxlKSwKICAgIC8vICAgICB0YXJnZXQ9QVJDNFVJbnQ2NCh0YXJnZXQpLAogICAgLy8gICAgIHJhaXNlZD1BUkM0VUludDY0KDApLCAgIyBObyBmdW5kcyByYWlzZWQgaW5pdGlhbGx5CiAgICAvLyAgICAgY3JlYXRvcj1BUkM0U3RyaW5nKGNyZWF0b3IpLAogICAgLy8gICAgIGFjdGl2ZT1BUkM0VUludDY0KDEpICAjIDEgPSBhY3RpdmUKICAgIC8vICkKICAgIGRpZyAzCiAgICBwdXNoYnl0ZXMgMHgwMDI0CiAgICBjb25jYXQKICAgIGRpZyAzCiAgICBsZW4KICAgIHB1c2hpbnQgMzYgLy8gMzYKICAgICsKICAgIHN3YXAKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjY0CiAgICAvLyByYWlzZWQ9QVJDNFVJbnQ2NCgwKSwgICMgTm8gZnVuZHMgcmFpc2VkIGluaXRpYWxseQogICAgYnl0ZWMgNiAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6NjAtNjcKICAgIC8vIHNlbGYuY2FtcGFpZ25zW0FSQzRVSW50NjQoY2FtcGFpZ25faWQpXSA9IENhbXBhaWduSW5mbygKICAgIC8vICAgICBpZD1BUkM0VUludDY0KGNhbXBhaWduX2lkKSwKICAgIC8vICAgICB0aXRsZT1BUkM0U3RyaW5nKHRpdGxlKSwKICAgIC8vICAgICB0YXJnZXQ9QVJDNFVJbnQ2NCh0YXJnZXQpLAogICAgLy8gICAgIHJhaXNlZD1BUkM0VUludDY0KDApLCAgIyBObyBmdW5kcyByYWlzZWQgaW5pdGlhbGx5CiAgICAvLyAgICAgY3JlYXRvcj1BUkM0U3RyaW5nKGNyZWF0b3IpLAogICAgLy8gICAgIGFjdGl2ZT1BUkM0VUludDY0KDEpICAjIDEgPSBhY3RpdmUKICAgIC8vICkKICAgIGNvbmNhdAogICAgc3dhcAogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weTo2NgogICAgLy8gYWN0aXZlPUFSQzRVSW50NjQoMSkgICMgMSA9IGFjdGl2ZQogICAgYnl0ZWMgOCAvLyAweDAwMDAwMDAwMDAwMDAwMDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6NjAtNjcKICAgIC8vIHNlbGYuY2FtcGFpZ25zW0FSQzRVSW50NjQoY2FtcGFpZ25faWQpXSA9IENhbXBhaWduSW5mbygKICAgIC8vICAgICBpZD1BUkM0VUludDY0KGNhbXBhaWduX2lkKSwKICAgIC8vICAgICB0aXRsZT1BUkM0U3RyaW5nKHRpdGxlKSwKICAgIC8vICAgICB0YXJnZXQ9QVJDNFVJbnQ2NCh0YXJnZXQpLAogICAgLy8gICAgIHJhaXNlZD1BUkM0VUludDY0KDApLCAgIyBObyBmdW5kcyByYWlzZWQgaW5pdGlhbGx5CiAgICAvLyAgICAgY3JlYXRvcj1BUkM0U3RyaW5nKGNyZWF0b3IpLAogICAgLy8gICAgIGFjdGl2ZT1BUkM0VUludDY0KDEpICAjIDEgPSBhY3RpdmUKICAgIC8vICkKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weTo2MAogICAgLy8gc2VsZi5jYW1wYWlnbnNbQVJDNFVJbnQ2NChjYW1wYWlnbl9pZCldID0gQ2FtcGFpZ25JbmZvKAogICAgYnl0ZWMgNSAvLyAiY2FtcGFpZ25zIgogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6NjAtNjcKICAgIC8vIHNlbGYuY2FtcGFpZ25zW0FSQzRVSW50NjQoY2FtcGFpZ25faWQpXSA9IENhbXBhaWduSW5mbygKICAgIC8vICAgICBpZD1BUkM0VUludDY0KGNhbXBhaWduX2lkKSwKICAgIC8vICAgICB0aXRsZT1BUkM0U3RyaW5nKHRpdGxlKSwKICAgIC8vICAgICB0YXJnZXQ9QVJDNFVJbnQ2NCh0YXJnZXQpLAogICAgLy8gICAgIHJhaXNlZD1BUkM0VUludDY0KDApLCAgIyBObyBmdW5kcyByYWlzZWQgaW5pdGlhbGx5CiAgICAvLyAgICAgY3JlYXRvcj1BUkM0U3RyaW5nKGNyZWF0b3IpLAogICAgLy8gICAgIGFjdGl2ZT1BUkM0VUludDY0KDEpICAjIDEgPSBhY3RpdmUKICAgIC8vICkKICAgIGR1cAogICAgYm94X2RlbAogICAgcG9wCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjY5CiAgICAvLyByZXR1cm4gY2FtcGFpZ25faWQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5haWRjaGFpbl9jYW1wYWlnbnMuY29udHJhY3QuQWlkY2hhaW5DYW1wYWlnbnMuZ2V0X2NhbXBhaWduX2NvdW50KCkgLT4gdWludDY0OgpnZXRfY2FtcGFpZ25fY291bnQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5Ojc0CiAgICAvLyByZXR1cm4gc2VsZi5jYW1wYWlnbl9jb3VudGVyLnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiY2FtcGFpZ25fY291bnRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jYW1wYWlnbl9jb3VudGVyIGV4aXN0cwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFpZGNoYWluX2NhbXBhaWducy5jb250cmFjdC5BaWRjaGFpbkNhbXBhaWducy5jcmVhdGVfZG9uYXRpb24oY2FtcGFpZ25faWQ6IHVpbnQ2NCkgLT4gYnl0ZXM6CmNyZWF0ZV9kb25hdGlvbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6NzYtNzcKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGNyZWF0ZV9kb25hdGlvbihzZWxmLCBjYW1wYWlnbl9pZDogVUludDY0KSAtPiBTdHJpbmc6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6NzkKICAgIC8vIGFzc2VydCBjYW1wYWlnbl9pZCA8PSBzZWxmLmNhbXBhaWduX2NvdW50ZXIudmFsdWUsICJDYW1wYWlnbiBJRCBvdXQgb2YgcmFuZ2UiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiY2FtcGFpZ25fY291bnRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jYW1wYWlnbl9jb3VudGVyIGV4aXN0cwogICAgZnJhbWVfZGlnIC0xCiAgICA+PQogICAgYXNzZXJ0IC8vIENhbXBhaWduIElEIG91dCBvZiByYW5nZQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weTo4MAogICAgLy8gYXNzZXJ0IGNhbXBhaWduX2lkICE9IFVJbnQ2NCgwKSwgIkNhbXBhaWduIElEIGNhbm5vdCBiZSB6ZXJvIgogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NlcnQgLy8gQ2FtcGFpZ24gSUQgY2Fubm90IGJlIHplcm8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6ODEKICAgIC8vIGFzc2VydCBBUkM0VUludDY0KGNhbXBhaWduX2lkKSBpbiBzZWxmLmNhbXBhaWducywgIkNhbXBhaWduIG5vdCBmb3VuZCIKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgYnl0ZWMgNSAvLyAiY2FtcGFpZ25zIgogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBDYW1wYWlnbiBub3QgZm91bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6ODMtODQKICAgIC8vICMgSW4gcHJvZHVjdGlvbiwgdGhpcyB3b3VsZCBnZXQgdGhlIGFjdHVhbCBwYXltZW50IGFtb3VudCBmcm9tIGEgZ3JvdXBlZCBwYXltZW50CiAgICAvLyBkb25hdGlvbl9hbW91bnQgPSBUeG4uYW1vdW50CiAgICB0eG4gQW1vdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5Ojg1CiAgICAvLyBzZWxmLnRvdGFsX2RvbmF0aW9ucy52YWx1ZSArPSBkb25hdGlvbl9hbW91bnQKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJ0b3RhbF9kb25hdGlvbnMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfZG9uYXRpb25zIGV4aXN0cwogICAgKwogICAgYnl0ZWNfMyAvLyAidG90YWxfZG9uYXRpb25zIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6ODcKICAgIC8vIHJldHVybiBTdHJpbmcoIkRvbmF0aW9uIHJlY29yZGVkIHN1Y2Nlc3NmdWxseSIpCiAgICBwdXNoYnl0ZXMgIkRvbmF0aW9uIHJlY29yZGVkIHN1Y2Nlc3NmdWxseSIKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5haWRjaGFpbl9jYW1wYWlnbnMuY29udHJhY3QuQWlkY2hhaW5DYW1wYWlnbnMuZ2V0X3RvdGFsX2RvbmF0aW9ucygpIC0+IHVpbnQ2NDoKZ2V0X3RvdGFsX2RvbmF0aW9uczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6OTIKICAgIC8vIHJldHVybiBzZWxmLnRvdGFsX2RvbmF0aW9ucy52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gInRvdGFsX2RvbmF0aW9ucyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9kb25hdGlvbnMgZXhpc3RzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWlkY2hhaW5fY2FtcGFpZ25zLmNvbnRyYWN0LkFpZGNoYWluQ2FtcGFpZ25zLmNhbGN1bGF0ZV90b3RhbChhbW91bnQxOiB1aW50NjQsIGFtb3VudDI6IHVpbnQ2NCkgLT4gdWludDY0OgpjYWxjdWxhdGVfdG90YWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5Ojk0LTk1CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBjYWxjdWxhdGVfdG90YWwoc2VsZiwgYW1vdW50MTogVUludDY0LCBhbW91bnQyOiBVSW50NjQpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weTo5NwogICAgLy8gcmV0dXJuIGFtb3VudDEgKyBhbW91bnQyCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgKwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFpZGNoYWluX2NhbXBhaWducy5jb250cmFjdC5BaWRjaGFpbkNhbXBhaWducy52YWxpZGF0ZV9kb25hdGlvbihhbW91bnQ6IHVpbnQ2NCwgZG9ub3I6IGJ5dGVzKSAtPiBieXRlczoKdmFsaWRhdGVfZG9uYXRpb246CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5Ojk5LTEwMAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgdmFsaWRhdGVfZG9uYXRpb24oc2VsZiwgYW1vdW50OiBVSW50NjQsIGRvbm9yOiBTdHJpbmcpIC0+IFN0cmluZzoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxMDIKICAgIC8vIGlmIGFtb3VudCA+IFVJbnQ2NCgwKToKICAgIGZyYW1lX2RpZyAtMgogICAgYnogdmFsaWRhdGVfZG9uYXRpb25fZWxzZV9ib2R5QDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MTAzCiAgICAvLyByZXR1cm4gU3RyaW5nKCJWYWxpZCBkb25hdGlvbiBmcm9tICIpICsgZG9ub3IKICAgIHB1c2hieXRlcyAiVmFsaWQgZG9uYXRpb24gZnJvbSAiCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgcmV0c3ViCgp2YWxpZGF0ZV9kb25hdGlvbl9lbHNlX2JvZHlAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MTA1CiAgICAvLyByZXR1cm4gU3RyaW5nKCJJbnZhbGlkIGRvbmF0aW9uIGFtb3VudCIpCiAgICBwdXNoYnl0ZXMgIkludmFsaWQgZG9uYXRpb24gYW1vdW50IgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFpZGNoYWluX2NhbXBhaWducy5jb250cmFjdC5BaWRjaGFpbkNhbXBhaWducy5jcmVhdGVfbWlsZXN0b25lKGNhbXBhaWduX2lkOiB1aW50NjQsIHRhcmdldF9hbW91bnQ6IHVpbnQ2NCwgZGVzY3JpcHRpb246IGJ5dGVzKSAtPiB1aW50NjQ6CmNyZWF0ZV9taWxlc3RvbmU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjEwNy0xMDgKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGNyZWF0ZV9taWxlc3RvbmUoc2VsZiwgY2FtcGFpZ25faWQ6IFVJbnQ2NCwgdGFyZ2V0X2Ftb3VudDogVUludDY0LCBkZXNjcmlwdGlvbjogU3RyaW5nKSAtPiBVSW50NjQ6CiAgICBwcm90byAzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MTEwCiAgICAvLyBhc3NlcnQgY2FtcGFpZ25faWQgPD0gc2VsZi5jYW1wYWlnbl9jb3VudGVyLnZhbHVlLCAiQ2FtcGFpZ24gSUQgb3V0IG9mIHJhbmdlIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImNhbXBhaWduX2NvdW50ZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY2FtcGFpZ25fY291bnRlciBleGlzdHMKICAgIGZyYW1lX2RpZyAtMwogICAgPj0KICAgIGFzc2VydCAvLyBDYW1wYWlnbiBJRCBvdXQgb2YgcmFuZ2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MTExCiAgICAvLyBhc3NlcnQgY2FtcGFpZ25faWQgIT0gVUludDY0KDApLCAiQ2FtcGFpZ24gSUQgY2Fubm90IGJlIHplcm8iCiAgICBmcmFtZV9kaWcgLTMKICAgIGFzc2VydCAvLyBDYW1wYWlnbiBJRCBjYW5ub3QgYmUgemVybwogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxMTIKICAgIC8vIGFzc2VydCBBUkM0VUludDY0KGNhbXBhaWduX2lkKSBpbiBzZWxmLmNhbXBhaWducywgIkNhbXBhaWduIG5vdCBmb3VuZCIKICAgIGZyYW1lX2RpZyAtMwogICAgaXRvYgogICAgYnl0ZWMgNSAvLyAiY2FtcGFpZ25zIgogICAgZGlnIDEKICAgIGNvbmNhdAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gQ2FtcGFpZ24gbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjExNAogICAgLy8gc2VsZi5taWxlc3RvbmVfY291bnRlci52YWx1ZSArPSBVSW50NjQoMSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJtaWxlc3RvbmVfY291bnRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5taWxlc3RvbmVfY291bnRlciBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlY18yIC8vICJtaWxlc3RvbmVfY291bnRlciIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxMTgKICAgIC8vIGlkPUFSQzRVSW50NjQobWlsZXN0b25lX2lkKSwKICAgIGR1cAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxMjAKICAgIC8vIHRhcmdldF9hbW91bnQ9QVJDNFVJbnQ2NCh0YXJnZXRfYW1vdW50KSwKICAgIGZyYW1lX2RpZyAtMgogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxMjEKICAgIC8vIGRlc2NyaXB0aW9uPUFSQzRTdHJpbmcoZGVzY3JpcHRpb24pLAogICAgZnJhbWVfZGlnIC0xCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxMTctMTI0CiAgICAvLyBzZWxmLm1pbGVzdG9uZXNbQVJDNFVJbnQ2NChtaWxlc3RvbmVfaWQpXSA9IE1pbGVzdG9uZUluZm8oCiAgICAvLyAgICAgaWQ9QVJDNFVJbnQ2NChtaWxlc3RvbmVfaWQpLAogICAgLy8gICAgIGNhbXBhaWduX2lkPUFSQzRVSW50NjQoY2FtcGFpZ25faWQpLAogICAgLy8gICAgIHRhcmdldF9hbW91bnQ9QVJDNFVJbnQ2NCh0YXJnZXRfYW1vdW50KSwKICAgIC8vICAgICBkZXNjcmlwdGlvbj1BUkM0U3RyaW5nKGRlc2NyaXB0aW9uKSwKICAgIC8vICAgICBjb21wbGV0ZWQ9QVJDNFVJbnQ2NCgwKSwgICMgMCA9IHBlbmRpbmcKICAgIC8vICAgICBmdW5kc19yZWxlYXNlZD1BUkM0VUludDY0KDApICAjIDAgPSBub3QgcmVsZWFzZWQKICAgIC8vICkKICAgIGRpZyAyCiAgICB1bmNvdmVyIDUKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweDAwMmEKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxMjIKICAgIC8vIGNvbXBsZXRlZD1BUkM0VUludDY0KDApLCAgIyAwID0gcGVuZGluZwogICAgYnl0ZWMgNiAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MTE3LTEyNAogICAgLy8gc2VsZi5taWxlc3RvbmVzW0FSQzRVSW50NjQobWlsZXN0b25lX2lkKV0gPSBNaWxlc3RvbmVJbmZvKAogICAgLy8gICAgIGlkPUFSQzRVSW50NjQobWlsZXN0b25lX2lkKSwKICAgIC8vICAgICBjYW1wYWlnbl9pZD1BUkM0VUludDY0KGNhbXBhaWduX2lkKSwKICAgIC8vICAgICB0YXJnZXRfYW1vdW50PUFSQzRVSW50NjQodGFyZ2V0X2Ftb3VudCksCiAgICAvLyAgICAgZGVzY3JpcHRpb249QVJDNFN0cmluZyhkZXNjcmlwdGlvbiksCiAgICAvLyAgICAgY29tcGxldGVkPUFSQzRVSW50NjQoMCksICAjIDAgPSBwZW5kaW5nCiAgICAvLyAgICAgZnVuZHNfcmVsZWFzZWQ9QVJDNFVJbnQ2NCgwKSAgIyAwID0gbm90IHJlbGVhc2VkCiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MTIzCiAgICAvLyBmdW5kc19yZWxlYXNlZD1BUkM0VUludDY0KDApICAjIDAgPSBub3QgcmVsZWFzZWQKICAgIGJ5dGVjIDYgLy8gMHgwMDAwMDAwMDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjExNy0xMjQKICAgIC8vIHNlbGYubWlsZXN0b25lc1tBUkM0VUludDY0KG1pbGVzdG9uZV9pZCldID0gTWlsZXN0b25lSW5mbygKICAgIC8vICAgICBpZD1BUkM0VUludDY0KG1pbGVzdG9uZV9pZCksCiAgICAvLyAgICAgY2FtcGFpZ25faWQ9QVJDNFVJbnQ2NChjYW1wYWlnbl9pZCksCiAgICAvLyAgICAgdGFyZ2V0X2Ftb3VudD1BUkM0VUludDY0KHRhcmdldF9hbW91bnQpLAogICAgLy8gICAgIGRlc2NyaXB0aW9uPUFSQzRTdHJpbmcoZGVzY3JpcHRpb24pLAogICAgLy8gICAgIGNvbXBsZXRlZD1BUkM0VUludDY0KDApLCAgIyAwID0gcGVuZGluZwogICAgLy8gICAgIGZ1bmRzX3JlbGVhc2VkPUFSQzRVSW50NjQoMCkgICMgMCA9IG5vdCByZWxlYXNlZAogICAgLy8gKQogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MTE3CiAgICAvLyBzZWxmLm1pbGVzdG9uZXNbQVJDNFVJbnQ2NChtaWxlc3RvbmVfaWQpXSA9IE1pbGVzdG9uZUluZm8oCiAgICBieXRlYyA3IC8vICJtaWxlc3RvbmVzIgogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MTE3LTEyNAogICAgLy8gc2VsZi5taWxlc3RvbmVzW0FSQzRVSW50NjQobWlsZXN0b25lX2lkKV0gPSBNaWxlc3RvbmVJbmZvKAogICAgLy8gICAgIGlkPUFSQzRVSW50NjQobWlsZXN0b25lX2lkKSwKICAgIC8vICAgICBjYW1wYWlnbl9pZD1BUkM0VUludDY0KGNhbXBhaWduX2lkKSwKICAgIC8vICAgICB0YXJnZXRfYW1vdW50PUFSQzRVSW50NjQodGFyZ2V0X2Ftb3VudCksCiAgICAvLyAgICAgZGVzY3JpcHRpb249QVJDNFN0cmluZyhkZXNjcmlwdGlvbiksCiAgICAvLyAgICAgY29tcGxldGVkPUFSQzRVSW50NjQoMCksICAjIDAgPSBwZW5kaW5nCiAgICAvLyAgICAgZnVuZHNfcmVsZWFzZWQ9QVJDNFVJbnQ2NCgwKSAgIyAwID0gbm90IHJlbGVhc2VkCiAgICAvLyApCiAgICBkdXAKICAgIGJveF9kZWwKICAgIHBvcAogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxMjYKICAgIC8vIHJldHVybiBtaWxlc3RvbmVfaWQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5haWRjaGFpbl9jYW1wYWlnbnMuY29udHJhY3QuQWlkY2hhaW5DYW1wYWlnbnMuY29tcGxldGVfbWlsZXN0b25lKG1pbGVzdG9uZV9pZDogdWludDY0LCBwcm9vZjogYnl0ZXMpIC0+IGJ5dGVzOgpjb21wbGV0ZV9taWxlc3RvbmU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjEyOC0xMjkKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGNvbXBsZXRlX21pbGVzdG9uZShzZWxmLCBtaWxlc3RvbmVfaWQ6IFVJbnQ2NCwgcHJvb2Y6IFN0cmluZykgLT4gU3RyaW5nOgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjEzMQogICAgLy8gYXNzZXJ0IG1pbGVzdG9uZV9pZCA8PSBzZWxmLm1pbGVzdG9uZV9jb3VudGVyLnZhbHVlLCAiTWlsZXN0b25lIElEIG91dCBvZiByYW5nZSIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJtaWxlc3RvbmVfY291bnRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5taWxlc3RvbmVfY291bnRlciBleGlzdHMKICAgIGZyYW1lX2RpZyAtMgogICAgPj0KICAgIGFzc2VydCAvLyBNaWxlc3RvbmUgSUQgb3V0IG9mIHJhbmdlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjEzMgogICAgLy8gYXNzZXJ0IG1pbGVzdG9uZV9pZCAhPSBVSW50NjQoMCksICJNaWxlc3RvbmUgSUQgY2Fubm90IGJlIHplcm8iCiAgICBmcmFtZV9kaWcgLTIKICAgIGFzc2VydCAvLyBNaWxlc3RvbmUgSUQgY2Fubm90IGJlIHplcm8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MTMzCiAgICAvLyBhc3NlcnQgQVJDNFVJbnQ2NChtaWxlc3RvbmVfaWQpIGluIHNlbGYubWlsZXN0b25lcywgIk1pbGVzdG9uZSBub3QgZm91bmQiCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIGJ5dGVjIDcgLy8gIm1pbGVzdG9uZXMiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gTWlsZXN0b25lIG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxMzUKICAgIC8vIG1pbGVzdG9uZV9pbmZvID0gc2VsZi5taWxlc3RvbmVzW0FSQzRVSW50NjQobWlsZXN0b25lX2lkKV0uY29weSgpCiAgICBkdXAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1pbGVzdG9uZXMgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjEzNgogICAgLy8gbWlsZXN0b25lX2luZm8uY29tcGxldGVkID0gQVJDNFVJbnQ2NCgxKSAgIyBNYXJrIGFzIGNvbXBsZXRlZAogICAgYnl0ZWMgOCAvLyAweDAwMDAwMDAwMDAwMDAwMDEKICAgIHJlcGxhY2UyIDI2CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjEzNwogICAgLy8gc2VsZi5taWxlc3RvbmVzW0FSQzRVSW50NjQobWlsZXN0b25lX2lkKV0gPSBtaWxlc3RvbmVfaW5mby5jb3B5KCkKICAgIGRpZyAxCiAgICBib3hfZGVsCiAgICBwb3AKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MTM5CiAgICAvLyBzZWxmLnRvdGFsX21pbGVzdG9uZXNfY29tcGxldGVkLnZhbHVlICs9IFVJbnQ2NCgxKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gInRvdGFsX21pbGVzdG9uZXNfY29tcGxldGVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX21pbGVzdG9uZXNfY29tcGxldGVkIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjIDQgLy8gInRvdGFsX21pbGVzdG9uZXNfY29tcGxldGVkIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MTQwCiAgICAvLyByZXR1cm4gU3RyaW5nKCJNaWxlc3RvbmUgY29tcGxldGVkIHdpdGggcHJvb2Y6ICIpICsgcHJvb2YKICAgIHB1c2hieXRlcyAiTWlsZXN0b25lIGNvbXBsZXRlZCB3aXRoIHByb29mOiAiCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFpZGNoYWluX2NhbXBhaWducy5jb250cmFjdC5BaWRjaGFpbkNhbXBhaWducy5yZWxlYXNlX21pbGVzdG9uZV9mdW5kcyhtaWxlc3RvbmVfaWQ6IHVpbnQ2NCwgcmVjaXBpZW50OiBieXRlcywgYW1vdW50OiB1aW50NjQpIC0+IGJ5dGVzOgpyZWxlYXNlX21pbGVzdG9uZV9mdW5kczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MTQyLTE0MwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgcmVsZWFzZV9taWxlc3RvbmVfZnVuZHMoc2VsZiwgbWlsZXN0b25lX2lkOiBVSW50NjQsIHJlY2lwaWVudDogQWNjb3VudCwgYW1vdW50OiBVSW50NjQpIC0+IFN0cmluZzoKICAgIHByb3RvIDMgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxNDUKICAgIC8vIGFzc2VydCBtaWxlc3RvbmVfaWQgPD0gc2VsZi5taWxlc3RvbmVfY291bnRlci52YWx1ZSwgIk1pbGVzdG9uZSBJRCBvdXQgb2YgcmFuZ2UiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAibWlsZXN0b25lX2NvdW50ZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWlsZXN0b25lX2NvdW50ZXIgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTMKICAgID49CiAgICBhc3NlcnQgLy8gTWlsZXN0b25lIElEIG91dCBvZiByYW5nZQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxNDYKICAgIC8vIGFzc2VydCBtaWxlc3RvbmVfaWQgIT0gVUludDY0KDApLCAiTWlsZXN0b25lIElEIGNhbm5vdCBiZSB6ZXJvIgogICAgZnJhbWVfZGlnIC0zCiAgICBhc3NlcnQgLy8gTWlsZXN0b25lIElEIGNhbm5vdCBiZSB6ZXJvCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjE0NwogICAgLy8gYXNzZXJ0IGFtb3VudCA+IFVJbnQ2NCgwKSwgIkFtb3VudCBtdXN0IGJlIGdyZWF0ZXIgdGhhbiB6ZXJvIgogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NlcnQgLy8gQW1vdW50IG11c3QgYmUgZ3JlYXRlciB0aGFuIHplcm8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MTQ5LTE1MwogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPXJlY2lwaWVudCwKICAgIC8vICAgICBhbW91bnQ9YW1vdW50LAogICAgLy8gICAgIGZlZT1HbG9iYWwubWluX3R4bl9mZWUsICAjIFVzZSBtaW5pbXVtIHRyYW5zYWN0aW9uIGZlZQogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxNTIKICAgIC8vIGZlZT1HbG9iYWwubWluX3R4bl9mZWUsICAjIFVzZSBtaW5pbXVtIHRyYW5zYWN0aW9uIGZlZQogICAgZ2xvYmFsIE1pblR4bkZlZQogICAgZnJhbWVfZGlnIC0xCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgZnJhbWVfZGlnIC0yCiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjE0OQogICAgLy8gaXR4bi5QYXltZW50KAogICAgaW50Y18xIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MTQ5LTE1MwogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPXJlY2lwaWVudCwKICAgIC8vICAgICBhbW91bnQ9YW1vdW50LAogICAgLy8gICAgIGZlZT1HbG9iYWwubWluX3R4bl9mZWUsICAjIFVzZSBtaW5pbXVtIHRyYW5zYWN0aW9uIGZlZQogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MTU1CiAgICAvLyByZXR1cm4gU3RyaW5nKCJSZWFsIGJsb2NrY2hhaW4gcGF5bWVudCBzZW50IGZvciBtaWxlc3RvbmUiKQogICAgcHVzaGJ5dGVzICJSZWFsIGJsb2NrY2hhaW4gcGF5bWVudCBzZW50IGZvciBtaWxlc3RvbmUiCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWlkY2hhaW5fY2FtcGFpZ25zLmNvbnRyYWN0LkFpZGNoYWluQ2FtcGFpZ25zLmdldF9jYW1wYWlnbl9kZXRhaWxzKGNhbXBhaWduX2lkOiBieXRlcykgLT4gYnl0ZXM6CmdldF9jYW1wYWlnbl9kZXRhaWxzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxNjItMTYzCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X2NhbXBhaWduX2RldGFpbHMoc2VsZiwgY2FtcGFpZ25faWQ6IEFSQzRVSW50NjQpIC0+IENhbXBhaWduSW5mbzoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxNjUKICAgIC8vIGFzc2VydCBjYW1wYWlnbl9pZCBpbiBzZWxmLmNhbXBhaWducywgIkNhbXBhaWduIG5vdCBmb3VuZCIKICAgIGJ5dGVjIDUgLy8gImNhbXBhaWducyIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIENhbXBhaWduIG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxNjYKICAgIC8vIHJldHVybiBzZWxmLmNhbXBhaWduc1tjYW1wYWlnbl9pZF0KICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNhbXBhaWducyBlbnRyeSBleGlzdHMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5haWRjaGFpbl9jYW1wYWlnbnMuY29udHJhY3QuQWlkY2hhaW5DYW1wYWlnbnMuZ2V0X21pbGVzdG9uZV9kZXRhaWxzKG1pbGVzdG9uZV9pZDogYnl0ZXMpIC0+IGJ5dGVzOgpnZXRfbWlsZXN0b25lX2RldGFpbHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjE2OC0xNjkKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfbWlsZXN0b25lX2RldGFpbHMoc2VsZiwgbWlsZXN0b25lX2lkOiBBUkM0VUludDY0KSAtPiBNaWxlc3RvbmVJbmZvOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjE3MQogICAgLy8gYXNzZXJ0IG1pbGVzdG9uZV9pZCBpbiBzZWxmLm1pbGVzdG9uZXMsICJNaWxlc3RvbmUgbm90IGZvdW5kIgogICAgYnl0ZWMgNyAvLyAibWlsZXN0b25lcyIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIE1pbGVzdG9uZSBub3QgZm91bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MTcyCiAgICAvLyByZXR1cm4gc2VsZi5taWxlc3RvbmVzW21pbGVzdG9uZV9pZF0KICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1pbGVzdG9uZXMgZW50cnkgZXhpc3RzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWlkY2hhaW5fY2FtcGFpZ25zLmNvbnRyYWN0LkFpZGNoYWluQ2FtcGFpZ25zLmdldF9taWxlc3RvbmVfY291bnQoKSAtPiB1aW50NjQ6CmdldF9taWxlc3RvbmVfY291bnQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjE3NwogICAgLy8gcmV0dXJuIHNlbGYubWlsZXN0b25lX2NvdW50ZXIudmFsdWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJtaWxlc3RvbmVfY291bnRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5taWxlc3RvbmVfY291bnRlciBleGlzdHMKICAgIHJldHN1Ygo=", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "cblocks", "sourceInfo": [{"pc": [1069], "errorMessage": "Amount must be greater than zero"}, {"pc": [580], "errorMessage": "App is not updatable"}, {"pc": [754, 896], "errorMessage": "Campaign ID cannot be zero"}, {"pc": [751, 893], "errorMessage": "Campaign ID out of range"}, {"pc": [765, 908, 1144], "errorMessage": "Campaign not found"}, {"pc": [979, 1066], "errorMessage": "Milestone ID cannot be zero"}, {"pc": [976, 1063], "errorMessage": "Milestone ID out of range"}, {"pc": [991, 1160], "errorMessage": "Milestone not found"}, {"pc": [140, 157, 176, 195, 243, 281, 315, 346, 380, 405, 422, 450, 467, 500, 524], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [586], "errorMessage": "Only creator can update"}, {"pc": [568], "errorMessage": "can only call when creating"}, {"pc": [143, 160, 179, 198, 246, 284, 318, 349, 383, 408, 425, 453, 470, 503, 527, 573], "errorMessage": "can only call when not creating"}, {"pc": [659, 739, 747, 889], "errorMessage": "check self.campaign_counter exists"}, {"pc": [1146], "errorMessage": "check self.campaigns entry exists"}, {"pc": [912, 972, 1059, 1167], "errorMessage": "check self.milestone_counter exists"}, {"pc": [994, 1162], "errorMessage": "check self.milestones entry exists"}, {"pc": [771, 812], "errorMessage": "check self.total_donations exists"}, {"pc": [1008], "errorMessage": "check self.total_milestones_completed exists"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {"UPDATABLE": {"type": "AVMUint64"}}}"""
+
+@functools.cache
+def _get_app_spec() -> algokit_utils.Arc56Contract:
+    """Parses the embedded app spec on first use and reuses it for the rest of the process"""
+    return algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+
+def __getattr__(name: str) -> typing.Any:
+    # Keeps `from <client> import APP_SPEC` working without parsing the spec at import time
+    if name == "APP_SPEC":
+        return _get_app_spec()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def _parse_abi_args(args: object | None = None) -> list[object] | None:
+    """Helper to parse ABI args into the format expected by underlying client"""
+    if args is None:
+        return None
+
+    def convert_dataclass(value: object) -> object:
+        if dataclasses.is_dataclass(value):
+            return tuple(convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
+        elif isinstance(value, (list, tuple)):
+            return type(value)(convert_dataclass(item) for item in value)
+        return value
+
+    match args:
+        case tuple():
+            method_args = list(args)
+        case _ if dataclasses.is_dataclass(args):
+            method_args = [getattr(args, field.name) for field in dataclasses.fields(args)]
+        case _:
+            raise ValueError("Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments.")
+
+    return [
+        convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
+        for arg in method_args
+    ] if method_args else None
+
+def _init_dataclass(cls: type, data: dict) -> object:
+    """
+    Recursively instantiate a dataclass of type `cls` from `data`.
+
+    For each field on the dataclass, if the field type is also a dataclass
+    and the corresponding data is a dict, instantiate that field recursively.
+    """
+    field_values = {}
+    for field in dataclasses.fields(cls):
+        field_value = data.get(field.name)
+        # Check if the field expects another dataclass and the value is a dict.
+        if dataclasses.is_dataclass(field.type) and isinstance(field_value, dict):
+            field_values[field.name] = _init_dataclass(typing.cast(type, field.type), field_value)
+        else:
+            field_values[field.name] = field_value
+    return cls(**field_values)
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class CampaignInfo:
+    """Struct for CampaignInfo"""
+    id: int
+    title: str
+    target: int
+    raised: int
+    creator: str
+    active: int
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class MilestoneInfo:
+    """Struct for MilestoneInfo"""
+    id: int
+    campaign_id: int
+    target_amount: int
+    description: str
+    completed: int
+    funds_released: int
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class HelloArgs:
+    """Dataclass for hello arguments"""
+    name: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "hello(string)string"
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class CreateCampaignArgs:
+    """Dataclass for create_campaign arguments"""
+    title: str
+    target: int
+    creator: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "create_campaign(string,uint64,string)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class CreateDonationArgs:
+    """Dataclass for create_donation arguments"""
+    campaign_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "create_donation(uint64)string"
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class CalculateTotalArgs:
+    """Dataclass for calculate_total arguments"""
+    amount1: int
+    amount2: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "calculate_total(uint64,uint64)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class ValidateDonationArgs:
+    """Dataclass for validate_donation arguments"""
+    amount: int
+    donor: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "validate_donation(uint64,string)string"
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class CreateMilestoneArgs:
+    """Dataclass for create_milestone arguments"""
+    campaign_id: int
+    target_amount: int
+    description: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "create_milestone(uint64,uint64,string)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class CompleteMilestoneArgs:
+    """Dataclass for complete_milestone arguments"""
+    milestone_id: int
+    proof: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "complete_milestone(uint64,string)string"
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class ReleaseMilestoneFundsArgs:
+    """Dataclass for release_milestone_funds arguments"""
+    milestone_id: int
+    recipient: str | bytes
+    amount: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "release_milestone_funds(uint64,account,uint64)string"
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class GetCampaignDetailsArgs:
+    """Dataclass for get_campaign_details arguments"""
+    campaign_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_campaign_details(uint64)(uint64,string,uint64,uint64,string,uint64)"
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class GetMilestoneDetailsArgs:
+    """Dataclass for get_milestone_details arguments"""
+    milestone_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_milestone_details(uint64)(uint64,uint64,uint64,string,uint64,uint64)"
+
+
+class _AidchainCampaignsUpdate:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def bare(
+        self, params: algokit_utils.AppClientBareCallParams | None = None
+    ) -> algokit_utils.AppUpdateParams:
+        return self.app_client.params.bare.update(params)
+
+
+class AidchainCampaignsParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def update(self) -> "_AidchainCampaignsUpdate":
+        return _AidchainCampaignsUpdate(self.app_client)
+
+    def hello(
+        self,
+        args: tuple[str] | HelloArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "hello(string)string",
+            "args": method_args,
+        }))
+
+    def initialize(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "initialize()string",
+        }))
+
+    def create_campaign(
+        self,
+        args: tuple[str, int, str] | CreateCampaignArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_campaign(string,uint64,string)uint64",
+            "args": method_args,
+        }))
+
+    def get_campaign_count(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_campaign_count()uint64",
+        }))
+
+    def create_donation(
+        self,
+        args: tuple[int] | CreateDonationArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_donation(uint64)string",
+            "args": method_args,
+        }))
+
+    def get_total_donations(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_total_donations()uint64",
+        }))
+
+    def calculate_total(
+        self,
+        args: tuple[int, int] | CalculateTotalArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "calculate_total(uint64,uint64)uint64",
+            "args": method_args,
+        }))
+
+    def validate_donation(
+        self,
+        args: tuple[int, str] | ValidateDonationArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "validate_donation(uint64,string)string",
+            "args": method_args,
+        }))
+
+    def create_milestone(
+        self,
+        args: tuple[int, int, str] | CreateMilestoneArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_milestone(uint64,uint64,string)uint64",
+            "args": method_args,
+        }))
+
+    def complete_milestone(
+        self,
+        args: tuple[int, str] | CompleteMilestoneArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "complete_milestone(uint64,string)string",
+            "args": method_args,
+        }))
+
+    def release_milestone_funds(
+        self,
+        args: tuple[int, str | bytes, int] | ReleaseMilestoneFundsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "release_milestone_funds(uint64,account,uint64)string",
+            "args": method_args,
+        }))
+
+    def get_milestone_stats(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_milestone_stats()string",
+        }))
+
+    def get_campaign_details(
+        self,
+        args: tuple[int] | GetCampaignDetailsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_campaign_details(uint64)(uint64,string,uint64,uint64,string,uint64)",
+            "args": method_args,
+        }))
+
+    def get_milestone_details(
+        self,
+        args: tuple[int] | GetMilestoneDetailsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_milestone_details(uint64)(uint64,uint64,uint64,string,uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def get_milestone_count(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_milestone_count()uint64",
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> algokit_utils.AppCallParams:
+        return self.app_client.params.bare.clear_state(
+            params,
+            
+        )
+
+
+class _AidchainCampaignsUpdateTransaction:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def bare(self, params: algokit_utils.AppClientBareCallParams | None = None) -> Transaction:
+        return self.app_client.create_transaction.bare.update(params)
+
+
+class AidchainCampaignsCreateTransactionParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def update(self) -> "_AidchainCampaignsUpdateTransaction":
+        return _AidchainCampaignsUpdateTransaction(self.app_client)
+
+    def hello(
+        self,
+        args: tuple[str] | HelloArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "hello(string)string",
+            "args": method_args,
+        }))
+
+    def initialize(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "initialize()string",
+        }))
+
+    def create_campaign(
+        self,
+        args: tuple[str, int, str] | CreateCampaignArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_campaign(string,uint64,string)uint64",
+            "args": method_args,
+        }))
+
+    def get_campaign_count(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_campaign_count()uint64",
+        }))
+
+    def create_donation(
+        self,
+        args: tuple[int] | CreateDonationArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_donation(uint64)string",
+            "args": method_args,
+        }))
+
+    def get_total_donations(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_total_donations()uint64",
+        }))
+
+    def calculate_total(
+        self,
+        args: tuple[int, int] | CalculateTotalArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "calculate_total(uint64,uint64)uint64",
+            "args": method_args,
+        }))
+
+    def validate_donation(
+        self,
+        args: tuple[int, str] | ValidateDonationArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "validate_donation(uint64,string)string",
+            "args": method_args,
+        }))
+
+    def create_milestone(
+        self,
+        args: tuple[int, int, str] | CreateMilestoneArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_milestone(uint64,uint64,string)uint64",
+            "args": method_args,
+        }))
+
+    def complete_milestone(
+        self,
+        args: tuple[int, str] | CompleteMilestoneArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "complete_milestone(uint64,string)string",
+            "args": method_args,
+        }))
+
+    def release_milestone_funds(
+        self,
+        args: tuple[int, str | bytes, int] | ReleaseMilestoneFundsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "release_milestone_funds(uint64,account,uint64)string",
+            "args": method_args,
+        }))
+
+    def get_milestone_stats(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_milestone_stats()string",
+        }))
+
+    def get_campaign_details(
+        self,
+        args: tuple[int] | GetCampaignDetailsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_campaign_details(uint64)(uint64,string,uint64,uint64,string,uint64)",
+            "args": method_args,
+        }))
+
+    def get_milestone_details(
+        self,
+        args: tuple[int] | GetMilestoneDetailsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_milestone_details(uint64)(uint64,uint64,uint64,string,uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def get_milestone_count(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_milestone_count()uint64",
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> Transaction:
+        return self.app_client.create_transaction.bare.clear_state(
+            params,
+            
+        )
+
+
+class _AidchainCampaignsUpdateSend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def bare(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult:
+        return self.app_client.send.bare.update(
+            params=params,
+            send_params=send_params,
+            compilation_params=compilation_params
+        )
+
+
+class AidchainCampaignsSend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def update(self) -> "_AidchainCampaignsUpdateSend":
+        return _AidchainCampaignsUpdateSend(self.app_client)
+
+    def hello(
+        self,
+        args: tuple[str] | HelloArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "hello(string)string",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def initialize(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "initialize()string",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def create_campaign(
+        self,
+        args: tuple[str, int, str] | CreateCampaignArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_campaign(string,uint64,string)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def get_campaign_count(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_campaign_count()uint64",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def create_donation(
+        self,
+        args: tuple[int] | CreateDonationArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_donation(uint64)string",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def get_total_donations(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_total_donations()uint64",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def calculate_total(
+        self,
+        args: tuple[int, int] | CalculateTotalArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "calculate_total(uint64,uint64)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def validate_donation(
+        self,
+        args: tuple[int, str] | ValidateDonationArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "validate_donation(uint64,string)string",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def create_milestone(
+        self,
+        args: tuple[int, int, str] | CreateMilestoneArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_milestone(uint64,uint64,string)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def complete_milestone(
+        self,
+        args: tuple[int, str] | CompleteMilestoneArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "complete_milestone(uint64,string)string",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def release_milestone_funds(
+        self,
+        args: tuple[int, str | bytes, int] | ReleaseMilestoneFundsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "release_milestone_funds(uint64,account,uint64)string",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def get_milestone_stats(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_milestone_stats()string",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def get_campaign_details(
+        self,
+        args: tuple[int] | GetCampaignDetailsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[CampaignInfo]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_campaign_details(uint64)(uint64,string,uint64,uint64,string,uint64)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(CampaignInfo, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[CampaignInfo], parsed_response)
+
+    def get_milestone_details(
+        self,
+        args: tuple[int] | GetMilestoneDetailsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[MilestoneInfo]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_milestone_details(uint64)(uint64,uint64,uint64,string,uint64,uint64)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(MilestoneInfo, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[MilestoneInfo], parsed_response)
+
+    def get_milestone_count(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_milestone_count()uint64",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        return self.app_client.send.bare.clear_state(
+            params,
+            send_params=send_params,
+        )
+
+
+class GlobalStateValue(typing.TypedDict):
+    """Shape of global_state state key values"""
+    campaign_counter: int
+    milestone_counter: int
+    total_donations: int
+    total_milestones_completed: int
+
+class AidchainCampaignsState:
+    """Methods to access state for the current AidchainCampaigns app"""
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def global_state(
+        self
+    ) -> "_GlobalState":
+            """Methods to access global_state for the current app"""
+            return _GlobalState(self.app_client)
+
+    @property
+    def box(
+        self
+    ) -> "_BoxState":
+            """Methods to access box for the current app"""
+            return _BoxState(self.app_client)
+
+class _GlobalState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+
+    def get_all(self) -> GlobalStateValue:
+        """Get all current keyed values from global_state state"""
+        result = self.app_client.state.global_state.get_all()
+        if not result:
+            return typing.cast(GlobalStateValue, {})
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.global_state.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return typing.cast(GlobalStateValue, converted)
+
+    @property
+    def campaign_counter(self) -> int:
+        """Get the current value of the campaign_counter key in global_state state"""
+        value = self.app_client.state.global_state.get_value("campaign_counter")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def milestone_counter(self) -> int:
+        """Get the current value of the milestone_counter key in global_state state"""
+        value = self.app_client.state.global_state.get_value("milestone_counter")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def total_donations(self) -> int:
+        """Get the current value of the total_donations key in global_state state"""
+        value = self.app_client.state.global_state.get_value("total_donations")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def total_milestones_completed(self) -> int:
+        """Get the current value of the total_milestones_completed key in global_state state"""
+        value = self.app_client.state.global_state.get_value("total_milestones_completed")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+class _BoxState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {
+            "CampaignInfo": CampaignInfo,
+            "MilestoneInfo": MilestoneInfo
+        }
+
+    def get_all(self) -> dict[str, typing.Any]:
+        """Get all current keyed values from box state"""
+        result = self.app_client.state.box.get_all()
+        if not result:
+            return {}
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.box.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return converted
+
+    @property
+    def campaigns(self) -> "_MapState[int, CampaignInfo]":
+        """Get values from the campaigns map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "campaigns",
+            self._struct_classes.get("CampaignInfo")
+        )
+
+    @property
+    def milestones(self) -> "_MapState[int, MilestoneInfo]":
+        """Get values from the milestones map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "milestones",
+            self._struct_classes.get("MilestoneInfo")
+        )
+
+_KeyType = typing.TypeVar("_KeyType")
+_ValueType = typing.TypeVar("_ValueType")
+
+class _AppClientStateMethodsProtocol(typing.Protocol):
+    def get_map(self, map_name: str) -> dict[typing.Any, typing.Any]:
+        ...
+    def get_map_value(self, map_name: str, key: typing.Any) -> typing.Any | None:
+        ...
+
+class _MapState(typing.Generic[_KeyType, _ValueType]):
+    """Generic class for accessing state maps with strongly typed keys and values"""
+
+    def __init__(self, state_accessor: _AppClientStateMethodsProtocol, map_name: str,
+                struct_class: typing.Type[_ValueType] | None = None):
+        self._state_accessor = state_accessor
+        self._map_name = map_name
+        self._struct_class = struct_class
+
+    def get_map(self) -> dict[_KeyType, _ValueType]:
+        """Get all current values in the map"""
+        result = self._state_accessor.get_map(self._map_name)
+        if self._struct_class and result:
+            return {k: _init_dataclass(self._struct_class, v) if isinstance(v, dict) else v
+                    for k, v in result.items()}  # type: ignore
+        return typing.cast(dict[_KeyType, _ValueType], result or {})
+
+    def get_value(self, key: _KeyType) -> _ValueType | None:
+        """Get a value from the map by key"""
+        key_value = dataclasses.asdict(key) if dataclasses.is_dataclass(key) else key  # type: ignore
+        value = self._state_accessor.get_map_value(self._map_name, key_value)
+        if value is not None and self._struct_class and isinstance(value, dict):
+            return _init_dataclass(self._struct_class, value)  # type: ignore
+        return typing.cast(_ValueType | None, value)
+
+
+class AidchainCampaignsClient:
+    """Client for interacting with AidchainCampaigns smart contract"""
+
+    @typing.overload
+    def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
+    
+    @typing.overload
+    def __init__(
+        self,
+        *,
+        algorand: _AlgoKitAlgorandClient,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None: ...
+
+    def __init__(
+        self,
+        app_client: algokit_utils.AppClient | None = None,
+        *,
+        algorand: _AlgoKitAlgorandClient | None = None,
+        app_id: int | None = None,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None:
+        if app_client:
+            self.app_client = app_client
+        elif algorand and app_id:
+            self.app_client = algokit_utils.AppClient(
+                algokit_utils.AppClientParams(
+                    algorand=algorand,
+                    app_spec=_get_app_spec(),
+                    app_id=app_id,
+                    app_name=app_name,
+                    default_sender=default_sender,
+                    default_signer=default_signer,
+                    approval_source_map=approval_source_map,
+                    clear_source_map=clear_source_map,
+                )
+            )
+        else:
+            raise ValueError("Either app_client or algorand and app_id must be provided")
+    
+        self.params = AidchainCampaignsParams(self.app_client)
+        self.create_transaction = AidchainCampaignsCreateTransactionParams(self.app_client)
+        self.send = AidchainCampaignsSend(self.app_client)
+        self.state = AidchainCampaignsState(self.app_client)
+
+    @staticmethod
+    def from_creator_and_name(
+        creator_address: str,
+        app_name: str,
+        algorand: _AlgoKitAlgorandClient,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+    ) -> "AidchainCampaignsClient":
+        return AidchainCampaignsClient(
+            algokit_utils.AppClient.from_creator_and_name(
+                creator_address=creator_address,
+                app_name=app_name,
+                app_spec=_get_app_spec(),
+                algorand=algorand,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+                ignore_cache=ignore_cache,
+                app_lookup_cache=app_lookup_cache,
+            )
+        )
+    
+    @staticmethod
+    def from_network(
+        algorand: _AlgoKitAlgorandClient,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "AidchainCampaignsClient":
+        return AidchainCampaignsClient(
+            algokit_utils.AppClient.from_network(
+                app_spec=_get_app_spec(),
+                algorand=algorand,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    @property
+    def app_id(self) -> int:
+        return self.app_client.app_id
+    
+    @property
+    def app_address(self) -> str:
+        return self.app_client.app_address
+    
+    @property
+    def app_name(self) -> str:
+        return self.app_client.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_client.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_client.algorand
+
+    def clone(
+        self,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "AidchainCampaignsClient":
+        return AidchainCampaignsClient(
+            self.app_client.clone(
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    def new_group(self) -> "AidchainCampaignsComposer":
+        return AidchainCampaignsComposer(self)
+
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["hello(string)string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["initialize()string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["create_campaign(string,uint64,string)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_campaign_count()uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["create_donation(uint64)string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_total_donations()uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["calculate_total(uint64,uint64)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["validate_donation(uint64,string)string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["create_milestone(uint64,uint64,string)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["complete_milestone(uint64,string)string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["release_milestone_funds(uint64,account,uint64)string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_milestone_stats()string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_campaign_details(uint64)(uint64,string,uint64,uint64,string,uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> CampaignInfo | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_milestone_details(uint64)(uint64,uint64,uint64,string,uint64,uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> MilestoneInfo | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_milestone_count()uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None: ...
+
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | CampaignInfo | MilestoneInfo | int | str:
+        """Decode ABI return value for the given method."""
+        if return_value is None:
+            return None
+    
+        arc56_method = self.app_spec.get_arc56_method(method)
+        decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
+    
+        # If method returns a struct, convert the dict to appropriate dataclass
+        if (arc56_method and
+            arc56_method.returns and
+            arc56_method.returns.struct and
+            isinstance(decoded, dict)):
+            struct_class = globals().get(arc56_method.returns.struct)
+            if struct_class:
+                return struct_class(**typing.cast(dict, decoded))
+        return decoded
+
+
+@dataclasses.dataclass(frozen=True)
+class AidchainCampaignsBareCallCreateParams(algokit_utils.AppClientBareCallCreateParams):
+    """Parameters for creating AidchainCampaigns contract with bare calls"""
+    on_complete: typing.Literal[OnComplete.NoOpOC] | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallCreateParams:
+        return algokit_utils.AppClientBareCallCreateParams(**self.__dict__)
+
+@dataclasses.dataclass(frozen=True)
+class AidchainCampaignsBareCallUpdateParams(algokit_utils.AppClientBareCallParams):
+    """Parameters for calling AidchainCampaigns contract with bare calls"""
+    on_complete: typing.Literal[OnComplete.UpdateApplicationOC] | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallParams:
+        return algokit_utils.AppClientBareCallParams(**self.__dict__)
+
+class AidchainCampaignsFactory(algokit_utils.TypedAppFactoryProtocol[AidchainCampaignsBareCallCreateParams, AidchainCampaignsBareCallUpdateParams, None]):
+    """Factory for deploying and managing AidchainCampaignsClient smart contracts"""
+
+    def __init__(
+        self,
+        algorand: _AlgoKitAlgorandClient,
+        *,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        version: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ):
+        self.app_factory = algokit_utils.AppFactory(
+            params=algokit_utils.AppFactoryParams(
+                algorand=algorand,
+                app_spec=_get_app_spec(),
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                version=version,
+                compilation_params=compilation_params,
+            )
+        )
+        self.params = AidchainCampaignsFactoryParams(self.app_factory)
+        self.create_transaction = AidchainCampaignsFactoryCreateTransaction(self.app_factory)
+        self.send = AidchainCampaignsFactorySend(self.app_factory)
+
+    @property
+    def app_name(self) -> str:
+        return self.app_factory.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_factory.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_factory.algorand
+
+    def deploy(
+        self,
+        *,
+        on_update: algokit_utils.OnUpdate | None = None,
+        on_schema_break: algokit_utils.OnSchemaBreak | None = None,
+        create_params: AidchainCampaignsBareCallCreateParams | None = None,
+        update_params: AidchainCampaignsBareCallUpdateParams | None = None,
+        delete_params: None = None,
+        existing_deployments: algokit_utils.ApplicationLookup | None = None,
+        ignore_cache: bool = False,
+        app_name: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> tuple[AidchainCampaignsClient, algokit_utils.AppFactoryDeployResult]:
+        """Deploy the application"""
+        deploy_response = self.app_factory.deploy(
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            create_params=create_params.to_algokit_utils_params() if create_params else None,
+            update_params=update_params.to_algokit_utils_params() if update_params else None,
+            delete_params=delete_params,
+            existing_deployments=existing_deployments,
+            ignore_cache=ignore_cache,
+            app_name=app_name,
+            compilation_params=compilation_params,
+            send_params=send_params,
+        )
+
+        return AidchainCampaignsClient(deploy_response[0]), deploy_response[1]
+
+    def get_app_client_by_creator_and_name(
+        self,
+        creator_address: str,
+        app_name: str,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> AidchainCampaignsClient:
+        """Get an app client by creator address and name"""
+        return AidchainCampaignsClient(
+            self.app_factory.get_app_client_by_creator_and_name(
+                creator_address,
+                app_name,
+                default_sender,
+                default_signer,
+                ignore_cache,
+                app_lookup_cache,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+    def get_app_client_by_id(
+        self,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> AidchainCampaignsClient:
+        """Get an app client by app ID"""
+        return AidchainCampaignsClient(
+            self.app_factory.get_app_client_by_id(
+                app_id,
+                app_name,
+                default_sender,
+                default_signer,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+
+class AidchainCampaignsFactoryParams:
+    """Parameters for creating transactions for AidchainCampaigns contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = AidchainCampaignsFactoryCreateParams(app_factory)
+        self.update = AidchainCampaignsFactoryUpdateParams(app_factory)
+        self.delete = AidchainCampaignsFactoryDeleteParams(app_factory)
+
+class AidchainCampaignsFactoryCreateParams:
+    """Parameters for 'create' operations of AidchainCampaigns contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateParams:
+        """Creates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            compilation_params=compilation_params)
+
+    def hello(
+        self,
+        args: tuple[str] | HelloArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the hello(string)string ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "hello(string)string",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def initialize(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the initialize()string ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "initialize()string",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def create_campaign(
+        self,
+        args: tuple[str, int, str] | CreateCampaignArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the create_campaign(string,uint64,string)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "create_campaign(string,uint64,string)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_campaign_count(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_campaign_count()uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_campaign_count()uint64",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def create_donation(
+        self,
+        args: tuple[int] | CreateDonationArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the create_donation(uint64)string ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "create_donation(uint64)string",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_total_donations(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_total_donations()uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_total_donations()uint64",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def calculate_total(
+        self,
+        args: tuple[int, int] | CalculateTotalArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the calculate_total(uint64,uint64)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "calculate_total(uint64,uint64)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def validate_donation(
+        self,
+        args: tuple[int, str] | ValidateDonationArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the validate_donation(uint64,string)string ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "validate_donation(uint64,string)string",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def create_milestone(
+        self,
+        args: tuple[int, int, str] | CreateMilestoneArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the create_milestone(uint64,uint64,string)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "create_milestone(uint64,uint64,string)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def complete_milestone(
+        self,
+        args: tuple[int, str] | CompleteMilestoneArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the complete_milestone(uint64,string)string ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "complete_milestone(uint64,string)string",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def release_milestone_funds(
+        self,
+        args: tuple[int, str | bytes, int] | ReleaseMilestoneFundsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the release_milestone_funds(uint64,account,uint64)string ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "release_milestone_funds(uint64,account,uint64)string",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_milestone_stats(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_milestone_stats()string ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_milestone_stats()string",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_campaign_details(
+        self,
+        args: tuple[int] | GetCampaignDetailsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_campaign_details(uint64)(uint64,string,uint64,uint64,string,uint64) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_campaign_details(uint64)(uint64,string,uint64,uint64,string,uint64)",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_milestone_details(
+        self,
+        args: tuple[int] | GetMilestoneDetailsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_milestone_details(uint64)(uint64,uint64,uint64,string,uint64,uint64) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_milestone_details(uint64)(uint64,uint64,uint64,string,uint64,uint64)",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_milestone_count(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_milestone_count()uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_milestone_count()uint64",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+class AidchainCampaignsFactoryUpdateParams:
+    """Parameters for 'update' operations of AidchainCampaigns contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppUpdateParams:
+        """Updates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_update(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            )
+
+class AidchainCampaignsFactoryDeleteParams:
+    """Parameters for 'delete' operations of AidchainCampaigns contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppDeleteParams:
+        """Deletes an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_delete(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            )
+
+
+class AidchainCampaignsFactoryCreateTransaction:
+    """Create transactions for AidchainCampaigns contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = AidchainCampaignsFactoryCreateTransactionCreate(app_factory)
+
+
+class AidchainCampaignsFactoryCreateTransactionCreate:
+    """Create new instances of AidchainCampaigns contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+    ) -> Transaction:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.create_transaction.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+        )
+
+
+class AidchainCampaignsFactorySend:
+    """Send calls to AidchainCampaigns contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = AidchainCampaignsFactorySendCreate(app_factory)
+
+
+class AidchainCampaignsFactorySendCreate:
+    """Send create calls to AidchainCampaigns contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ) -> tuple[AidchainCampaignsClient, algokit_utils.SendAppCreateTransactionResult]:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        result = self.app_factory.send.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            send_params=send_params,
+            compilation_params=compilation_params
+        )
+        return AidchainCampaignsClient(result[0]), result[1]
+
+
+class _AidchainCampaignsUpdateComposer:
+    def __init__(self, composer: "AidchainCampaignsComposer"):
+        self.composer = composer
+
+
+class AidchainCampaignsComposer:
+    """Composer for creating transaction groups for AidchainCampaigns contract calls"""
+
+    def __init__(self, client: "AidchainCampaignsClient"):
+        self.client = client
+        self._composer = client.algorand.new_group()
+        self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+
+    @property
+    def update(self) -> "_AidchainCampaignsUpdateComposer":
+        return _AidchainCampaignsUpdateComposer(self)
+
+    def hello(
+        self,
+        args: tuple[str] | HelloArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "AidchainCampaignsComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.hello(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "hello(string)string", v
+            )
+        )
+        return self
+
+    def initialize(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "AidchainCampaignsComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.initialize(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "initialize()string", v
+            )
+        )
+        return self
+
+    def create_campaign(
+        self,
+        args: tuple[str, int, str] | CreateCampaignArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "AidchainCampaignsComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.create_campaign(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "create_campaign(string,uint64,string)uint64", v
+            )
+        )
+        return self
+
+    def get_campaign_count(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "AidchainCampaignsComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_campaign_count(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_campaign_count()uint64", v
+            )
+        )
+        return self
+
+    def create_donation(
+        self,
+        args: tuple[int] | CreateDonationArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "AidchainCampaignsComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.create_donation(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "create_donation(uint64)string", v
+            )
+        )
+        return self
+
+    def get_total_donations(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "AidchainCampaignsComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_total_donations(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_total_donations()uint64", v
+            )
+        )
+        return self
+
+    def calculate_total(
+        self,
+        args: tuple[int, int] | CalculateTotalArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "AidchainCampaignsComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.calculate_total(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "calculate_total(uint64,uint64)uint64", v
+            )
+        )
+        return self
+
+    def validate_donation(
+        self,
+        args: tuple[int, str] | ValidateDonationArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "AidchainCampaignsComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.validate_donation(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "validate_donation(uint64,string)string", v
+            )
+        )
+        return self
+
+    def create_milestone(
+        self,
+        args: tuple[int, int, str] | CreateMilestoneArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "AidchainCampaignsComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.create_milestone(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "create_milestone(uint64,uint64,string)uint64", v
+            )
+        )
+        return self
+
+    def complete_milestone(
+        self,
+        args: tuple[int, str] | CompleteMilestoneArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "AidchainCampaignsComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.complete_milestone(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "complete_milestone(uint64,string)string", v
+            )
+        )
+        return self
+
+    def release_milestone_funds(
+        self,
+        args: tuple[int, str | bytes, int] | ReleaseMilestoneFundsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "AidchainCampaignsComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.release_milestone_funds(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "release_milestone_funds(uint64,account,uint64)string", v
+            )
+        )
+        return self
+
+    def get_milestone_stats(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "AidchainCampaignsComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_milestone_stats(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_milestone_stats()string", v
+            )
+        )
+        return self
+
+    def get_campaign_details(
+        self,
+        args: tuple[int] | GetCampaignDetailsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "AidchainCampaignsComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_campaign_details(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_campaign_details(uint64)(uint64,string,uint64,uint64,string,uint64)", v
+            )
+        )
+        return self
+
+    def get_milestone_details(
+        self,
+        args: tuple[int] | GetMilestoneDetailsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "AidchainCampaignsComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_milestone_details(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_milestone_details(uint64)(uint64,uint64,uint64,string,uint64,uint64)", v
+            )
+        )
+        return self
+
+    def get_milestone_count(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "AidchainCampaignsComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_milestone_count(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_milestone_count()uint64", v
+            )
+        )
+        return self
+
+    def clear_state(
+        self,
+        *,
+        args: list[bytes] | None = None,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AidchainCampaignsComposer":
+        params=params or algokit_utils.CommonAppCallParams()
+        self._composer.add_app_call(
+            self.client.params.clear_state(
+                algokit_utils.AppClientBareCallParams(
+                    **{
+                        **dataclasses.asdict(params),
+                        "args": args
+                    }
+                )
+            )
+        )
+        return self
+    
+    def add_transaction(
+        self, txn: Transaction, signer: TransactionSigner | None = None
+    ) -> "AidchainCampaignsComposer":
+        self._composer.add_transaction(txn, signer)
+        return self
+    
+    def composer(self) -> algokit_utils.TransactionComposer:
+        return self._composer
+    
+    def simulate(
+        self,
+        allow_more_logs: bool | None = None,
+        allow_empty_signatures: bool | None = None,
+        allow_unnamed_resources: bool | None = None,
+        extra_opcode_budget: int | None = None,
+        exec_trace_config: SimulateTraceConfig | None = None,
+        simulation_round: int | None = None,
+        skip_signatures: bool | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.simulate(
+            allow_more_logs=allow_more_logs,
+            allow_empty_signatures=allow_empty_signatures,
+            allow_unnamed_resources=allow_unnamed_resources,
+            extra_opcode_budget=extra_opcode_budget,
+            exec_trace_config=exec_trace_config,
+            simulation_round=simulation_round,
+            skip_signatures=skip_signatures,
+        )
+    
+    def send(
+        self,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.send(send_params)
@@ -0,0 +1,78 @@
+# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# This file was automatically generated by smart_contracts._helpers.struct_codecs.
+# DO NOT MODIFY IT BY HAND.
+
+import struct
+import typing
+
+from .aidchain_campaigns_client import (
+    CampaignInfo,
+    MilestoneInfo,
+)
+
+_U16 = struct.Struct(">H")
+
+
+_CAMPAIGN_INFO_HEAD = struct.Struct('>QHQQHQ')
+
+
+def decode_campaign_info(data: bytes, offset: int = 0) -> CampaignInfo:
+    """Decodes an ARC-4 encoded CampaignInfo starting at `offset`."""
+    id, title_offset, target, raised, creator_offset, active, = _CAMPAIGN_INFO_HEAD.unpack_from(data, offset)
+    title_start = offset + title_offset + 2
+    title = bytes(data[title_start:title_start + _U16.unpack_from(data, offset + title_offset)[0]]).decode("utf-8")
+    creator_start = offset + creator_offset + 2
+    creator = bytes(data[creator_start:creator_start + _U16.unpack_from(data, offset + creator_offset)[0]]).decode("utf-8")
+    return CampaignInfo(id, title, target, raised, creator, active)
+
+
+def encode_campaign_info(value: CampaignInfo) -> bytes:
+    """Encodes a CampaignInfo into its ARC-4 tuple representation."""
+    title = value.title.encode("utf-8")
+    creator = value.creator.encode("utf-8")
+    title_offset = 36
+    creator_offset = title_offset + 2 + len(title)
+    return b"".join((_CAMPAIGN_INFO_HEAD.pack(value.id, title_offset, value.target, value.raised, creator_offset, value.active), _U16.pack(len(title)), title, _U16.pack(len(creator)), creator))
+
+
+_MILESTONE_INFO_HEAD = struct.Struct('>QQQHQQ')
+
+
+def decode_milestone_info(data: bytes, offset: int = 0) -> MilestoneInfo:
+    """Decodes an ARC-4 encoded MilestoneInfo starting at `offset`."""
+    id, campaign_id, target_amount, description_offset, completed, funds_released, = _MILESTONE_INFO_HEAD.unpack_from(data, offset)
+    description_start = offset + description_offset + 2
+    description = bytes(data[description_start:description_start + _U16.unpack_from(data, offset + description_offset)[0]]).decode("utf-8")
+    return MilestoneInfo(id, campaign_id, target_amount, description, completed, funds_released)
+
+
+def encode_milestone_info(value: MilestoneInfo) -> bytes:
+    """Encodes a MilestoneInfo into its ARC-4 tuple representation."""
+    description = value.description.encode("utf-8")
+    description_offset = 42
+    return b"".join((_MILESTONE_INFO_HEAD.pack(value.id, value.campaign_id, value.target_amount, description_offset, value.completed, value.funds_released), _U16.pack(len(description)), description))
+
+
+DECODERS: dict[str, typing.Callable[[bytes], typing.Any]] = {
+    "CampaignInfo": decode_campaign_info,
+    "MilestoneInfo": decode_milestone_info,
+}
+
+ENCODERS: dict[str, typing.Callable[[typing.Any], bytes]] = {
+    "CampaignInfo": encode_campaign_info,
+    "MilestoneInfo": encode_milestone_info,
+}
+
+# Box map name -> (box name prefix, value decoder) for uint64-keyed struct maps
+BOX_MAPS: dict[str, tuple[bytes, typing.Callable[[bytes], typing.Any]]] = {
+    "campaigns": (b'campaigns', decode_campaign_info),
+    "milestones": (b'milestones', decode_milestone_info),
+}
+
+
+def decode_box(map_name: str, box_name: bytes, value: bytes) -> tuple[int, typing.Any]:
+    """Decodes a raw box name and value from one of the BOX_MAPS into (key, struct)."""
+    prefix, decode = BOX_MAPS[map_name]
+    return int.from_bytes(box_name[len(prefix):], "big"), decode(value)
@@ -4,9 +4,11 @@
 # This file was automatically generated by algokit-client-generator.
 # DO NOT MODIFY IT BY HAND.
 # requires: algokit-utils@^3.0.0
+# Post-processed by smart_contracts._helpers.client_postprocess.
 
 # common
 import dataclasses
+import functools
 import typing
 # core algosdk
 import algosdk
@@ -19,8 +21,18 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "name"}], "name": "hello", "returns": {"type": "string"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "initialize", "returns": {"type": "string"}, "desc": "Initialize the contract with default values", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "org_name"}, {"type": "string", "name": "wallet_address"}], "name": "register_organization", "returns": {"type": "uint64"}, "desc": "Register a new organization in the system with proper data storage", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "title"}, {"type": "uint64", "name": "target"}, {"type": "string", "name": "creator"}], "name": "create_campaign", "returns": {"type": "uint64"}, "desc": "Create a new donation campaign with proper data storage", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_campaign_count", "returns": {"type": "uint64"}, "desc": "Get total number of campaigns created", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_organization_count", "returns": {"type": "uint64"}, "desc": "Get total number of organizations registered", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "campaign_id"}], "name": "create_donation", "returns": {"type": "string"}, "desc": "Create a donation record (for testing without payment)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_total_donations", "returns": {"type": "uint64"}, "desc": "Get total amount of donations across all campaigns", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "amount1"}, {"type": "uint64", "name": "amount2"}], "name": "calculate_total", "returns": {"type": "uint64"}, "desc": "Calculate total of two amounts", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "amount"}, {"type": "string", "name": "donor"}], "name": "validate_donation", "returns": {"type": "string"}, "desc": "Validate donation parameters", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "recipient"}, {"type": "string", "name": "location"}], "name": "log_delivery", "returns": {"type": "uint64"}, "desc": "Log a delivery event", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "delivery_id"}, {"type": "string", "name": "agent"}], "name": "verify_delivery", "returns": {"type": "string"}, "desc": "Verify a delivery by an authorized agent", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_contract_stats", "returns": {"type": "string"}, "desc": "Get overall contract statistics", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "asset_name"}, {"type": "uint64", "name": "total_supply"}], "name": "create_voucher_asset", "returns": {"type": "uint64"}, "desc": "Create a REAL ASA token on the blockchain for aid distribution", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "asset_id"}, {"type": "string", "name": "recipient"}, {"type": "uint64", "name": "amount"}], "name": "distribute_vouchers", "returns": {"type": "string"}, "desc": "REAL blockchain token transfer to recipient", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "voucher_id"}, {"type": "string", "name": "merchant"}, {"type": "uint64", "name": "amount"}], "name": "redeem_voucher", "returns": {"type": "string"}, "desc": "Redeem voucher tokens at an approved merchant", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_voucher_stats", "returns": {"type": "string"}, "desc": "Get voucher system statistics", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "campaign_id"}, {"type": "uint64", "name": "target_amount"}, {"type": "string", "name": "description"}], "name": "create_milestone", "returns": {"type": "uint64"}, "desc": "Create a new milestone for campaign funding", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "milestone_id"}, {"type": "string", "name": "proof"}], "name": "complete_milestone", "returns": {"type": "string"}, "desc": "Mark milestone as completed with proof", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "milestone_id"}, {"type": "account", "name": "recipient"}, {"type": "uint64", "name": "amount"}], "name": "release_milestone_funds", "returns": {"type": "string"}, "desc": "Release REAL funds for completed milestone via blockchain payment", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_milestone_stats", "returns": {"type": "string"}, "desc": "Get milestone system statistics", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "campaign_id"}], "name": "get_campaign_details", "returns": {"type": "(uint64,string,uint64,uint64,string,uint64)", "struct": "CampaignInfo"}, "desc": "Get detailed information about a campaign", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "org_id"}], "name": "get_organization_details", "returns": {"type": "(uint64,string,string,uint64)", "struct": "OrganizationInfo"}, "desc": "Get detailed information about an organization", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "voucher_id"}], "name": "get_voucher_details", "returns": {"type": "(uint64,uint64,string,uint64,uint64)", "struct": "VoucherInfo"}, "desc": "Get detailed information about a voucher", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "milestone_id"}], "name": "get_milestone_details", "returns": {"type": "(uint64,uint64,uint64,string,uint64,uint64)", "struct": "MilestoneInfo"}, "desc": "Get detailed information about a milestone", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "delivery_id"}], "name": "get_delivery_details", "returns": {"type": "(uint64,string,string,string,uint64)", "struct": "DeliveryRecord"}, "desc": "Get detailed information about a delivery", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_milestone_count", "returns": {"type": "uint64"}, "desc": "Get total number of milestones created", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_voucher_count", "returns": {"type": "uint64"}, "desc": "Get total number of vouchers created", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_delivery_count", "returns": {"type": "uint64"}, "desc": "Get total number of deliveries logged", "events": [], "readonly": true, "recommendations": {}}], "name": "AidchainContracts", "state": {"keys": {"box": {}, "global": {"campaign_counter": {"key": "Y2FtcGFpZ25fY291bnRlcg==", "keyType": "AVMString", "valueType": "AVMUint64"}, "organization_counter": {"key": "b3JnYW5pemF0aW9uX2NvdW50ZXI=", "keyType": "AVMString", "valueType": "AVMUint64"}, "delivery_counter": {"key": "ZGVsaXZlcnlfY291bnRlcg==", "keyType": "AVMString", "valueType": "AVMUint64"}, "voucher_counter": {"key": "dm91Y2hlcl9jb3VudGVy", "keyType": "AVMString", "valueType": "AVMUint64"}, "milestone_counter": {"key": "bWlsZXN0b25lX2NvdW50ZXI=", "keyType": "AVMString", "valueType": "AVMUint64"}, "total_donations": {"key": "dG90YWxfZG9uYXRpb25z", "keyType": "AVMString", "valueType": "AVMUint64"}, "total_organizations": {"key": "dG90YWxfb3JnYW5pemF0aW9ucw==", "keyType": "AVMString", "valueType": "AVMUint64"}, "total_vouchers_issued": {"key": "dG90YWxfdm91Y2hlcnNfaXNzdWVk", "keyType": "AVMString", "valueType": "AVMUint64"}, "total_milestones_completed": {"key": "dG90YWxfbWlsZXN0b25lc19jb21wbGV0ZWQ=", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"campaigns": {"keyType": "uint64", "valueType": "CampaignInfo", "prefix": "Y2FtcGFpZ25z"}, "organizations": {"keyType": "uint64", "valueType": "OrganizationInfo", "prefix": "b3Jncw=="}, "milestones": {"keyType": "uint64", "valueType": "MilestoneInfo", "prefix": "bWlsZXN0b25lcw=="}, "deliveries": {"keyType": "uint64", "valueType": "DeliveryRecord", "prefix": "ZGVsaXZlcmllcw=="}, "vouchers": {"keyType": "uint64", "valueType": "VoucherInfo", "prefix": "dm91Y2hlcnM="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 9}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"CampaignInfo": [{"name": "id", "type": "uint64"}, {"name": "title", "type": "string"}, {"name": "target", "type": "uint64"}, {"name": "raised", "type": "uint64"}, {"name": "creator", "type": "string"}, {"name": "active", "type": "uint64"}], "DeliveryRecord": [{"name": "id", "type": "uint64"}, {"name": "recipient", "type": "string"}, {"name": "location", "type": "string"}, {"name": "agent", "type": "string"}, {"name": "verified", "type": "uint64"}], "MilestoneInfo": [{"name": "id", "type": "uint64"}, {"name": "campaign_id", "type": "uint64"}, {"name": "target_amount", "type": "uint64"}, {"name": "description", "type": "string"}, {"name": "completed", "type": "uint64"}, {"name": "funds_released", "type": "uint64"}], "OrganizationInfo": [{"name": "id", "type": "uint64"}, {"name": "name", "type": "string"}, {"name": "wallet_address", "type": "string"}, {"name": "verification_level", "type": "uint64"}], "VoucherInfo": [{"name": "id", "type": "uint64"}, {"name": "asset_id", "type": "uint64"}, {"name": "name", "type": "string"}, {"name": "total_supply", "type": "uint64"}, {"name": "issued", "type": "uint64"}]}, "byteCode": {"approval": "CiACAAEmEQQVH3x1EGNhbXBhaWduX2NvdW50ZXIRbWlsZXN0b25lX2NvdW50ZXIQZGVsaXZlcnlfY291bnRlcg92b3VjaGVyX2NvdW50ZXIIAAAAAAAAAAAUb3JnYW5pemF0aW9uX2NvdW50ZXIPdG90YWxfZG9uYXRpb25zE3RvdGFsX29yZ2FuaXphdGlvbnMadG90YWxfbWlsZXN0b25lc19jb21wbGV0ZWQJY2FtcGFpZ25zCAAAAAAAAAABCmRlbGl2ZXJpZXMKbWlsZXN0b25lcxV0b3RhbF92b3VjaGVyc19pc3N1ZWQEb3Jncwh2b3VjaGVyczEYQAAhKSJnJwYiZysiZycEImcqImcnByJnJwgiZycOImcnCSJnMRtBBAmCHQQCvs4RBIl60acEEdOvGQRP5v1WBBPBBbkEFJJSEgT/URVTBJ/WyXgEzboSlwRBX2QeBMidy2sEjqfg+gQVaZABBMhSe78EirahZgQhxKBmBPZK4nQEcySFZwSE7q5jBMPemlIEBtQUygRfUt9fBLRPewMEvw7gLQS/VO02BNWyDXAE83z57QS9eQmyBC2JxqE2GgCOHQMZAwEC5ALDArICoQKFAnQCWwI5AhwB+gHLAbEBfwFZASsBDADqAMQAlACBAG4AWwBIADUAJAATAAIiQzEZFEQxGESIB7YWKExQsCNDMRkURDEYRIgHnxYoTFCwI0MxGRREMRhEiAeJFihMULAjQzEZFEQxGEQ2GgGIB2UoTFCwI0MxGRREMRhENhoBiAdCKExQsCNDMRkURDEYRDYaAYgHHyhMULAjQzEZFEQxGEQ2GgGIBvwoTFCwI0MxGRREMRhENhoBiAbZKExQsCNDMRkURDEYRIAkFR98dQAeTWlsZXN0b25lIHN0YXRpc3RpY3MgYXZhaWxhYmxlsCNDMRkURDEYRDYaARc2GgIXwBw2GgMXiAY8SRUWVwYCTFAoTFCwI0MxGRREMRhENhoBFzYaAlcCAIgFw0kVFlcGAkxQKExQsCNDMRkURDEYRDYaARc2GgIXNhoDVwIAiAVKFihMULAjQzEZFEQxGESAIhUffHUAHFZvdWNoZXIgc3RhdGlzdGljcyBhdmFpbGFibGWwI0MxGRREMRhENhoBFzYaAlcCADYaAxeIBJJJFRZXBgJMUChMULAjQzEZFEQxGESAJhUffHUAIERlYnVnIG1vZGU6IHZvdWNoZXJzIGRpc3RyaWJ1dGVksCNDMRkURDEYRDYaAVcCADYaAheIA9IoTFCwI0MxGRREMRhEgCMVH3x1AB1Db250cmFjdCBzdGF0aXN0aWNzIGF2YWlsYWJsZbAjQzEZFEQxGEQ2GgEXNhoCVwIAiAMqSRUWVwYCTFAoTFCwI0MxGRREMRhENhoBVwIANhoCVwIAiAKqFihMULAjQzEZFEQxGEQ2GgEXNhoCVwIAiAJTSRUWVwYCTFAoTFCwI0MxGRREMRhENhoBFzYaAheIAioWKExQsCNDMRkURDEYRIgCExYoTFCwI0MxGRREMRhENhoBF4gBt0kVFlcGAkxQKExQsCNDMRkURDEYRIgBmRYoTFCwI0MxGRREMRhEiAGDFihMULAjQzEZFEQxGEQ2GgFXAgA2GgIXNhoDVwIAiAEPFihMULAjQzEZFEQxGEQ2GgFXAgA2GgJXAgCIAJ0WKExQsCNDMRkURDEYRIgAR0kVFlcGAkxQKExQsCNDMRkURDEYRDYaAVcCAIgAGUkVFlcGAkxQKExQsCNDMRlA/MQxGBREI0OKAQGAB0hlbGxvLCCL/1CJKSJnJwYiZysiZycEImcqImcnByJnJwgiZycOImcnCSJngCFDb250cmFjdCBpbml0aWFsaXplZCBzdWNjZXNzZnVsbHmJigIBIicGZUQjCCcGSwFnSRaL/hUWVwYCi/5Qi/8VFlcGAov/UEsCgAIAFFBLAhWBFAgWVwYCUCcFUE8CUExQJw9PAlBJvEhMvyInCGVEIwgnCExniYoDASIpZUQjCClLAWdJFov9FRZXBgKL/VCL/haL/xUWVwYCi/9QSwOAAgAkUEsDFYEkCExPA1AnBVBMFlcGAlAnC1BPAlBMUCcKTwJQSbxITL+JIillRIkiJwZlRImKAQEiKWVEi/8PRIv/RIv/FicKTFC9RQFEIicHZUSB6AcIJwdMZ4AeRG9uYXRpb24gcmVjb3JkZWQgc3VjY2Vzc2Z1bGx5iSInB2VEiYoCAYv+i/8IiYoCAYv+QQAagBRWYWxpZCBkb25hdGlvbiBmcm9tIIv/UImAF0ludmFsaWQgZG9uYXRpb24gYW1vdW50iYoCASIrZUQjCCtLAWdJFov+FRZXBgKL/lCL/xUWVwYCi/9QSwKAAgAWUEsCFYEWCEkWVwYCTwJMUEsCFU8CCBZXBgJQJwVQTwJQTFCAAgAAUCcMTwJQSbxITL+JigIBIitlRIv+D0SL/kSL/hYnDExQSb1FAURJvkQnC1wOi/8VFlcGAov/UEsBgQxZTwIiTwJYTFBLAbxIv4AcRGVsaXZlcnkgdmVyaWZpZWQgYnkgYWdlbnQ6IIv/UImKAgGxMgAyCkcDsiyyK7IqsikisiQisiOL/7IigAdWT1VDSEVSsiWL/rImgQOyELIBs7Q8IicEZUQjCCcESwFnFkwWi/4VFlcGAov+UIv/FksDSwNQgAIAIlBMUCcFUExQJxBPA1BJvEhMv4mKAwEiJwRlRIv9DEAABYv9QAAVgBJJbnZhbGlkIHZvdWNoZXIgSUSJi/9AACOAIEFtb3VudCBtdXN0IGJlIGdyZWF0ZXIgdGhhbiB6ZXJviYAVVm91Y2hlcnMgcmVkZWVtZWQgYXQgi/5QiYoDASIpZUSL/Q9Ei/1Ei/0WJwpLAVC9RQFEIiplRCMIKksBZ0kWi/4Wi/8VFlcGAov/UEsCTwVQTwJQgAIAKlAnBVAnBVBMUCcNTwJQSbxITL+JigIBIiplRIv+D0SL/kSL/hYnDUxQSb1FAURJvkQnC1waSwG8SL8iJwllRCMIJwlMZ4AgTWlsZXN0b25lIGNvbXBsZXRlZCB3aXRoIHByb29mOiCL/1CJigMBIiplRIv9D0SL/USL/0SxMgCL/7IIi/6yByOyELIBs4AqUmVhbCBibG9ja2NoYWluIHBheW1lbnQgc2VudCBmb3IgbWlsZXN0b25liYoBAScKi/9QSb1FAUS+RImKAQEnD4v/UEm9RQFEvkSJigEBJxCL/1BJvUUBRL5EiYoBAScNi/9QSb1FAUS+RImKAQEnDIv/UEm9RQFEvkSJIiplRIkiJwRlRIkiK2VEiQ==", "clear": "CoEBQw=="}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMuYWlkY2hhaW5fY29udHJhY3RzLmNvbnRyYWN0LkFpZGNoYWluQ29udHJhY3RzLl9fYWxnb3B5X2VudHJ5cG9pbnRfd2l0aF9pbml0KCkgLT4gdWludDY0OgptYWluOgogICAgaW50Y2Jsb2NrIDAgMQogICAgYnl0ZWNibG9jayAweDE1MWY3Yzc1ICJjYW1wYWlnbl9jb3VudGVyIiAibWlsZXN0b25lX2NvdW50ZXIiICJkZWxpdmVyeV9jb3VudGVyIiAidm91Y2hlcl9jb3VudGVyIiAweDAwMDAwMDAwMDAwMDAwMDAgIm9yZ2FuaXphdGlvbl9jb3VudGVyIiAidG90YWxfZG9uYXRpb25zIiAidG90YWxfb3JnYW5pemF0aW9ucyIgInRvdGFsX21pbGVzdG9uZXNfY29tcGxldGVkIiAiY2FtcGFpZ25zIiAweDAwMDAwMDAwMDAwMDAwMDEgImRlbGl2ZXJpZXMiICJtaWxlc3RvbmVzIiAidG90YWxfdm91Y2hlcnNfaXNzdWVkIiAib3JncyIgInZvdWNoZXJzIgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weTo0MS00MgogICAgLy8gIyBHbG9iYWwgc3RhdGUgZm9yIGNvdW50ZXJzCiAgICAvLyBzZWxmLmNhbXBhaWduX2NvdW50ZXIgPSBHbG9iYWxTdGF0ZShVSW50NjQoMCkpCiAgICBieXRlY18xIC8vICJjYW1wYWlnbl9jb3VudGVyIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjQzCiAgICAvLyBzZWxmLm9yZ2FuaXphdGlvbl9jb3VudGVyID0gR2xvYmFsU3RhdGUoVUludDY0KDApKQogICAgYnl0ZWMgNiAvLyAib3JnYW5pemF0aW9uX2NvdW50ZXIiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6NDQKICAgIC8vIHNlbGYuZGVsaXZlcnlfY291bnRlciA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSkKICAgIGJ5dGVjXzMgLy8gImRlbGl2ZXJ5X2NvdW50ZXIiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6NDUKICAgIC8vIHNlbGYudm91Y2hlcl9jb3VudGVyID0gR2xvYmFsU3RhdGUoVUludDY0KDApKQogICAgYnl0ZWMgNCAvLyAidm91Y2hlcl9jb3VudGVyIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjQ2CiAgICAvLyBzZWxmLm1pbGVzdG9uZV9jb3VudGVyID0gR2xvYmFsU3RhdGUoVUludDY0KDApKQogICAgYnl0ZWNfMiAvLyAibWlsZXN0b25lX2NvdW50ZXIiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6NDgtNDkKICAgIC8vICMgR2xvYmFsIHN0YXRlIGZvciB0b3RhbCBtZXRyaWNzCiAgICAvLyBzZWxmLnRvdGFsX2RvbmF0aW9ucyA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSkKICAgIGJ5dGVjIDcgLy8gInRvdGFsX2RvbmF0aW9ucyIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weTo1MAogICAgLy8gc2VsZi50b3RhbF9vcmdhbml6YXRpb25zID0gR2xvYmFsU3RhdGUoVUludDY0KDApKQogICAgYnl0ZWMgOCAvLyAidG90YWxfb3JnYW5pemF0aW9ucyIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weTo1MQogICAgLy8gc2VsZi50b3RhbF92b3VjaGVyc19pc3N1ZWQgPSBHbG9iYWxTdGF0ZShVSW50NjQoMCkpCiAgICBieXRlYyAxNCAvLyAidG90YWxfdm91Y2hlcnNfaXNzdWVkIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjUyCiAgICAvLyBzZWxmLnRvdGFsX21pbGVzdG9uZXNfY29tcGxldGVkID0gR2xvYmFsU3RhdGUoVUludDY0KDApKQogICAgYnl0ZWMgOSAvLyAidG90YWxfbWlsZXN0b25lc19jb21wbGV0ZWQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKCm1haW5fYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weTozOQogICAgLy8gY2xhc3MgQWlkY2hhaW5Db250cmFjdHMoQVJDNENvbnRyYWN0KToKICAgIHR4biBOdW1BcHBBcmdzCiAgICBieiBtYWluX2JhcmVfcm91dGluZ0AzNAogICAgcHVzaGJ5dGVzcyAweDAyYmVjZTExIDB4ODk3YWQxYTcgMHgxMWQzYWYxOSAweDRmZTZmZDU2IDB4MTNjMTA1YjkgMHgxNDkyNTIxMiAweGZmNTExNTUzIDB4OWZkNmM5NzggMHhjZGJhMTI5NyAweDQxNWY2NDFlIDB4Yzg5ZGNiNmIgMHg4ZWE3ZTBmYSAweDE1Njk5MDAxIDB4Yzg1MjdiYmYgMHg4YWI2YTE2NiAweDIxYzRhMDY2IDB4ZjY0YWUyNzQgMHg3MzI0ODU2NyAweDg0ZWVhZTYzIDB4YzNkZTlhNTIgMHgwNmQ0MTRjYSAweDVmNTJkZjVmIDB4YjQ0ZjdiMDMgMHhiZjBlZTAyZCAweGJmNTRlZDM2IDB4ZDViMjBkNzAgMHhmMzdjZjllZCAweGJkNzkwOWIyIDB4MmQ4OWM2YTEgLy8gbWV0aG9kICJoZWxsbyhzdHJpbmcpc3RyaW5nIiwgbWV0aG9kICJpbml0aWFsaXplKClzdHJpbmciLCBtZXRob2QgInJlZ2lzdGVyX29yZ2FuaXphdGlvbihzdHJpbmcsc3RyaW5nKXVpbnQ2NCIsIG1ldGhvZCAiY3JlYXRlX2NhbXBhaWduKHN0cmluZyx1aW50NjQsc3RyaW5nKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X2NhbXBhaWduX2NvdW50KCl1aW50NjQiLCBtZXRob2QgImdldF9vcmdhbml6YXRpb25fY291bnQoKXVpbnQ2NCIsIG1ldGhvZCAiY3JlYXRlX2RvbmF0aW9uKHVpbnQ2NClzdHJpbmciLCBtZXRob2QgImdldF90b3RhbF9kb25hdGlvbnMoKXVpbnQ2NCIsIG1ldGhvZCAiY2FsY3VsYXRlX3RvdGFsKHVpbnQ2NCx1aW50NjQpdWludDY0IiwgbWV0aG9kICJ2YWxpZGF0ZV9kb25hdGlvbih1aW50NjQsc3RyaW5nKXN0cmluZyIsIG1ldGhvZCAibG9nX2RlbGl2ZXJ5KHN0cmluZyxzdHJpbmcpdWludDY0IiwgbWV0aG9kICJ2ZXJpZnlfZGVsaXZlcnkodWludDY0LHN0cmluZylzdHJpbmciLCBtZXRob2QgImdldF9jb250cmFjdF9zdGF0cygpc3RyaW5nIiwgbWV0aG9kICJjcmVhdGVfdm91Y2hlcl9hc3NldChzdHJpbmcsdWludDY0KXVpbnQ2NCIsIG1ldGhvZCAiZGlzdHJpYnV0ZV92b3VjaGVycyh1aW50NjQsc3RyaW5nLHVpbnQ2NClzdHJpbmciLCBtZXRob2QgInJlZGVlbV92b3VjaGVyKHVpbnQ2NCxzdHJpbmcsdWludDY0KXN0cmluZyIsIG1ldGhvZCAiZ2V0X3ZvdWNoZXJfc3RhdHMoKXN0cmluZyIsIG1ldGhvZCAiY3JlYXRlX21pbGVzdG9uZSh1aW50NjQsdWludDY0LHN0cmluZyl1aW50NjQiLCBtZXRob2QgImNvbXBsZXRlX21pbGVzdG9uZSh1aW50NjQsc3RyaW5nKXN0cmluZyIsIG1ldGhvZCAicmVsZWFzZV9taWxlc3RvbmVfZnVuZHModWludDY0LGFjY291bnQsdWludDY0KXN0cmluZyIsIG1ldGhvZCAiZ2V0X21pbGVzdG9uZV9zdGF0cygpc3RyaW5nIiwgbWV0aG9kICJnZXRfY2FtcGFpZ25fZGV0YWlscyh1aW50NjQpKHVpbnQ2NCxzdHJpbmcsdWludDY0LHVpbnQ2NCxzdHJpbmcsdWludDY0KSIsIG1ldGhvZCAiZ2V0X29yZ2FuaXphdGlvbl9kZXRhaWxzKHVpbnQ2NCkodWludDY0LHN0cmluZyxzdHJpbmcsdWludDY0KSIsIG1ldGhvZCAiZ2V0X3ZvdWNoZXJfZGV0YWlscyh1aW50NjQpKHVpbnQ2NCx1aW50NjQsc3RyaW5nLHVpbnQ2NCx1aW50NjQpIiwgbWV0aG9kICJnZXRfbWlsZXN0b25lX2RldGFpbHModWludDY0KSh1aW50NjQsdWludDY0LHVpbnQ2NCxzdHJpbmcsdWludDY0LHVpbnQ2NCkiLCBtZXRob2QgImdldF9kZWxpdmVyeV9kZXRhaWxzKHVpbnQ2NCkodWludDY0LHN0cmluZyxzdHJpbmcsc3RyaW5nLHVpbnQ2NCkiLCBtZXRob2QgImdldF9taWxlc3RvbmVfY291bnQoKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X3ZvdWNoZXJfY291bnQoKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X2RlbGl2ZXJ5X2NvdW50KCl1aW50NjQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX2hlbGxvX3JvdXRlQDUgbWFpbl9pbml0aWFsaXplX3JvdXRlQDYgbWFpbl9yZWdpc3Rlcl9vcmdhbml6YXRpb25fcm91dGVANyBtYWluX2NyZWF0ZV9jYW1wYWlnbl9yb3V0ZUA4IG1haW5fZ2V0X2NhbXBhaWduX2NvdW50X3JvdXRlQDkgbWFpbl9nZXRfb3JnYW5pemF0aW9uX2NvdW50X3JvdXRlQDEwIG1haW5fY3JlYXRlX2RvbmF0aW9uX3JvdXRlQDExIG1haW5fZ2V0X3RvdGFsX2RvbmF0aW9uc19yb3V0ZUAxMiBtYWluX2NhbGN1bGF0ZV90b3RhbF9yb3V0ZUAxMyBtYWluX3ZhbGlkYXRlX2RvbmF0aW9uX3JvdXRlQDE0IG1haW5fbG9nX2RlbGl2ZXJ5X3JvdXRlQDE1IG1haW5fdmVyaWZ5X2RlbGl2ZXJ5X3JvdXRlQDE2IG1haW5fZ2V0X2NvbnRyYWN0X3N0YXRzX3JvdXRlQDE3IG1haW5fY3JlYXRlX3ZvdWNoZXJfYXNzZXRfcm91dGVAMTggbWFpbl9kaXN0cmlidXRlX3ZvdWNoZXJzX3JvdXRlQDE5IG1haW5fcmVkZWVtX3ZvdWNoZXJfcm91dGVAMjAgbWFpbl9nZXRfdm91Y2hlcl9zdGF0c19yb3V0ZUAyMSBtYWluX2NyZWF0ZV9taWxlc3RvbmVfcm91dGVAMjIgbWFpbl9jb21wbGV0ZV9taWxlc3RvbmVfcm91dGVAMjMgbWFpbl9yZWxlYXNlX21pbGVzdG9uZV9mdW5kc19yb3V0ZUAyNCBtYWluX2dldF9taWxlc3RvbmVfc3RhdHNfcm91dGVAMjUgbWFpbl9nZXRfY2FtcGFpZ25fZGV0YWlsc19yb3V0ZUAyNiBtYWluX2dldF9vcmdhbml6YXRpb25fZGV0YWlsc19yb3V0ZUAyNyBtYWluX2dldF92b3VjaGVyX2RldGFpbHNfcm91dGVAMjggbWFpbl9nZXRfbWlsZXN0b25lX2RldGFpbHNfcm91dGVAMjkgbWFpbl9nZXRfZGVsaXZlcnlfZGV0YWlsc19yb3V0ZUAzMCBtYWluX2dldF9taWxlc3RvbmVfY291bnRfcm91dGVAMzEgbWFpbl9nZXRfdm91Y2hlcl9jb3VudF9yb3V0ZUAzMiBtYWluX2dldF9kZWxpdmVyeV9jb3VudF9yb3V0ZUAzMwoKbWFpbl9hZnRlcl9pZl9lbHNlQDM2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weTozOQogICAgLy8gY2xhc3MgQWlkY2hhaW5Db250cmFjdHMoQVJDNENvbnRyYWN0KToKICAgIGludGNfMCAvLyAwCiAgICByZXR1cm4KCm1haW5fZ2V0X2RlbGl2ZXJ5X2NvdW50X3JvdXRlQDMzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weTozNjEKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBnZXRfZGVsaXZlcnlfY291bnQKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X3ZvdWNoZXJfY291bnRfcm91dGVAMzI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjM1NgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGdldF92b3VjaGVyX2NvdW50CiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9taWxlc3RvbmVfY291bnRfcm91dGVAMzE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjM1MQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGdldF9taWxlc3RvbmVfY291bnQKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X2RlbGl2ZXJ5X2RldGFpbHNfcm91dGVAMzA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjM0MwogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjM5CiAgICAvLyBjbGFzcyBBaWRjaGFpbkNvbnRyYWN0cyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weTozNDMKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X2RlbGl2ZXJ5X2RldGFpbHMKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X21pbGVzdG9uZV9kZXRhaWxzX3JvdXRlQDI5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weTozMzcKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weTozOQogICAgLy8gY2xhc3MgQWlkY2hhaW5Db250cmFjdHMoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MzM3CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGdldF9taWxlc3RvbmVfZGV0YWlscwogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfdm91Y2hlcl9kZXRhaWxzX3JvdXRlQDI4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weTozMzEKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weTozOQogICAgLy8gY2xhc3MgQWlkY2hhaW5Db250cmFjdHMoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MzMxCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGdldF92b3VjaGVyX2RldGFpbHMKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X29yZ2FuaXphdGlvbl9kZXRhaWxzX3JvdXRlQDI3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weTozMjUKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weTozOQogICAgLy8gY2xhc3MgQWlkY2hhaW5Db250cmFjdHMoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MzI1CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGdldF9vcmdhbml6YXRpb25fZGV0YWlscwogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfY2FtcGFpZ25fZGV0YWlsc19yb3V0ZUAyNjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MzE5CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MzkKICAgIC8vIGNsYXNzIEFpZGNoYWluQ29udHJhY3RzKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjMxOQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfY2FtcGFpZ25fZGV0YWlscwogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfbWlsZXN0b25lX3N0YXRzX3JvdXRlQDI1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weTozMTIKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBwdXNoYnl0ZXMgMHgxNTFmN2M3NTAwMWU0ZDY5NmM2NTczNzQ2ZjZlNjUyMDczNzQ2MTc0Njk3Mzc0Njk2MzczMjA2MTc2NjE2OTZjNjE2MjZjNjUKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9yZWxlYXNlX21pbGVzdG9uZV9mdW5kc19yb3V0ZUAyNDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6Mjk1CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weTozOQogICAgLy8gY2xhc3MgQWlkY2hhaW5Db250cmFjdHMoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGJ0b2kKICAgIHR4bmFzIEFjY291bnRzCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjI5NQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIHJlbGVhc2VfbWlsZXN0b25lX2Z1bmRzCiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9jb21wbGV0ZV9taWxlc3RvbmVfcm91dGVAMjM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjI3OQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MzkKICAgIC8vIGNsYXNzIEFpZGNoYWluQ29udHJhY3RzKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToyNzkKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBjb21wbGV0ZV9taWxlc3RvbmUKICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2NyZWF0ZV9taWxlc3RvbmVfcm91dGVAMjI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjI1NgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MzkKICAgIC8vIGNsYXNzIEFpZGNoYWluQ29udHJhY3RzKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToyNTYKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBjcmVhdGVfbWlsZXN0b25lCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF92b3VjaGVyX3N0YXRzX3JvdXRlQDIxOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToyNTAKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBwdXNoYnl0ZXMgMHgxNTFmN2M3NTAwMWM1NjZmNzU2MzY4NjU3MjIwNzM3NDYxNzQ2OTczNzQ2OTYzNzMyMDYxNzY2MTY5NmM2MTYyNmM2NQogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3JlZGVlbV92b3VjaGVyX3JvdXRlQDIwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToyMzkKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjM5CiAgICAvLyBjbGFzcyBBaWRjaGFpbkNvbnRyYWN0cyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MjM5CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgcmVkZWVtX3ZvdWNoZXIKICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2Rpc3RyaWJ1dGVfdm91Y2hlcnNfcm91dGVAMTk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjIzMgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIHB1c2hieXRlcyAweDE1MWY3Yzc1MDAyMDQ0NjU2Mjc1NjcyMDZkNmY2NDY1M2EyMDc2NmY3NTYzNjg2NTcyNzMyMDY0Njk3Mzc0NzI2OTYyNzU3NDY1NjQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9jcmVhdGVfdm91Y2hlcl9hc3NldF9yb3V0ZUAxODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MTk2CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weTozOQogICAgLy8gY2xhc3MgQWlkY2hhaW5Db250cmFjdHMoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjE5NgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGNyZWF0ZV92b3VjaGVyX2Fzc2V0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9jb250cmFjdF9zdGF0c19yb3V0ZUAxNzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MTkxCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgcHVzaGJ5dGVzIDB4MTUxZjdjNzUwMDFkNDM2ZjZlNzQ3MjYxNjM3NDIwNzM3NDYxNzQ2OTczNzQ2OTYzNzMyMDYxNzY2MTY5NmM2MTYyNmM2NQogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3ZlcmlmeV9kZWxpdmVyeV9yb3V0ZUAxNjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MTc1CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weTozOQogICAgLy8gY2xhc3MgQWlkY2hhaW5Db250cmFjdHMoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjE3NQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIHZlcmlmeV9kZWxpdmVyeQogICAgZHVwCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fbG9nX2RlbGl2ZXJ5X3JvdXRlQDE1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToxNTgKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjM5CiAgICAvLyBjbGFzcyBBaWRjaGFpbkNvbnRyYWN0cyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjE1OAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGxvZ19kZWxpdmVyeQogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl92YWxpZGF0ZV9kb25hdGlvbl9yb3V0ZUAxNDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MTUwCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weTozOQogICAgLy8gY2xhc3MgQWlkY2hhaW5Db250cmFjdHMoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjE1MAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIHZhbGlkYXRlX2RvbmF0aW9uCiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9jYWxjdWxhdGVfdG90YWxfcm91dGVAMTM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjE0NQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MzkKICAgIC8vIGNsYXNzIEFpZGNoYWluQ29udHJhY3RzKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjE0NQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGNhbGN1bGF0ZV90b3RhbAogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfdG90YWxfZG9uYXRpb25zX3JvdXRlQDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToxNDAKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGdldF90b3RhbF9kb25hdGlvbnMKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fY3JlYXRlX2RvbmF0aW9uX3JvdXRlQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToxMjMKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjM5CiAgICAvLyBjbGFzcyBBaWRjaGFpbkNvbnRyYWN0cyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToxMjMKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBjcmVhdGVfZG9uYXRpb24KICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9vcmdhbml6YXRpb25fY291bnRfcm91dGVAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjExOAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgZ2V0X29yZ2FuaXphdGlvbl9jb3VudAogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfY2FtcGFpZ25fY291bnRfcm91dGVAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MTEzCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBnZXRfY2FtcGFpZ25fY291bnQKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fY3JlYXRlX2NhbXBhaWduX3JvdXRlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5Ojk1CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weTozOQogICAgLy8gY2xhc3MgQWlkY2hhaW5Db250cmFjdHMoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weTo5NQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGNyZWF0ZV9jYW1wYWlnbgogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9yZWdpc3Rlcl9vcmdhbml6YXRpb25fcm91dGVANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6NzgKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjM5CiAgICAvLyBjbGFzcyBBaWRjaGFpbkNvbnRyYWN0cyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5Ojc4CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgcmVnaXN0ZXJfb3JnYW5pemF0aW9uCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2luaXRpYWxpemVfcm91dGVANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6NjQKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGluaXRpYWxpemUKICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2hlbGxvX3JvdXRlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjYwCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weTozOQogICAgLy8gY2xhc3MgQWlkY2hhaW5Db250cmFjdHMoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjYwCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgaGVsbG8KICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2JhcmVfcm91dGluZ0AzNDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MzkKICAgIC8vIGNsYXNzIEFpZGNoYWluQ29udHJhY3RzKEFSQzRDb250cmFjdCk6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDM2CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBjcmVhdGluZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5haWRjaGFpbl9jb250cmFjdHMuY29udHJhY3QuQWlkY2hhaW5Db250cmFjdHMuaGVsbG8obmFtZTogYnl0ZXMpIC0+IGJ5dGVzOgpoZWxsbzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6NjAtNjEKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGhlbGxvKHNlbGYsIG5hbWU6IFN0cmluZykgLT4gU3RyaW5nOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjYyCiAgICAvLyByZXR1cm4gIkhlbGxvLCAiICsgbmFtZQogICAgcHVzaGJ5dGVzICJIZWxsbywgIgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5haWRjaGFpbl9jb250cmFjdHMuY29udHJhY3QuQWlkY2hhaW5Db250cmFjdHMuaW5pdGlhbGl6ZSgpIC0+IGJ5dGVzOgppbml0aWFsaXplOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weTo2NwogICAgLy8gc2VsZi5jYW1wYWlnbl9jb3VudGVyLnZhbHVlID0gVUludDY0KDApCiAgICBieXRlY18xIC8vICJjYW1wYWlnbl9jb3VudGVyIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjY4CiAgICAvLyBzZWxmLm9yZ2FuaXphdGlvbl9jb3VudGVyLnZhbHVlID0gVUludDY0KDApCiAgICBieXRlYyA2IC8vICJvcmdhbml6YXRpb25fY291bnRlciIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weTo2OQogICAgLy8gc2VsZi5kZWxpdmVyeV9jb3VudGVyLnZhbHVlID0gVUludDY0KDApCiAgICBieXRlY18zIC8vICJkZWxpdmVyeV9jb3VudGVyIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjcwCiAgICAvLyBzZWxmLnZvdWNoZXJfY291bnRlci52YWx1ZSA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgNCAvLyAidm91Y2hlcl9jb3VudGVyIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjcxCiAgICAvLyBzZWxmLm1pbGVzdG9uZV9jb3VudGVyLnZhbHVlID0gVUludDY0KDApCiAgICBieXRlY18yIC8vICJtaWxlc3RvbmVfY291bnRlciIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weTo3MgogICAgLy8gc2VsZi50b3RhbF9kb25hdGlvbnMudmFsdWUgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDcgLy8gInRvdGFsX2RvbmF0aW9ucyIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weTo3MwogICAgLy8gc2VsZi50b3RhbF9vcmdhbml6YXRpb25zLnZhbHVlID0gVUludDY0KDApCiAgICBieXRlYyA4IC8vICJ0b3RhbF9vcmdhbml6YXRpb25zIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5Ojc0CiAgICAvLyBzZWxmLnRvdGFsX3ZvdWNoZXJzX2lzc3VlZC52YWx1ZSA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgMTQgLy8gInRvdGFsX3ZvdWNoZXJzX2lzc3VlZCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weTo3NQogICAgLy8gc2VsZi50b3RhbF9taWxlc3RvbmVzX2NvbXBsZXRlZC52YWx1ZSA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgOSAvLyAidG90YWxfbWlsZXN0b25lc19jb21wbGV0ZWQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6NzYKICAgIC8vIHJldHVybiBTdHJpbmcoIkNvbnRyYWN0IGluaXRpYWxpemVkIHN1Y2Nlc3NmdWxseSIpCiAgICBwdXNoYnl0ZXMgIkNvbnRyYWN0IGluaXRpYWxpemVkIHN1Y2Nlc3NmdWxseSIKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5haWRjaGFpbl9jb250cmFjdHMuY29udHJhY3QuQWlkY2hhaW5Db250cmFjdHMucmVnaXN0ZXJfb3JnYW5pemF0aW9uKG9yZ19uYW1lOiBieXRlcywgd2FsbGV0X2FkZHJlc3M6IGJ5dGVzKSAtPiB1aW50NjQ6CnJlZ2lzdGVyX29yZ2FuaXphdGlvbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6NzgtNzkKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIHJlZ2lzdGVyX29yZ2FuaXphdGlvbihzZWxmLCBvcmdfbmFtZTogU3RyaW5nLCB3YWxsZXRfYWRkcmVzczogU3RyaW5nKSAtPiBVSW50NjQ6CiAgICBwcm90byAyIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6ODEKICAgIC8vIHNlbGYub3JnYW5pemF0aW9uX2NvdW50ZXIudmFsdWUgKz0gVUludDY0KDEpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNiAvLyAib3JnYW5pemF0aW9uX2NvdW50ZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3JnYW5pemF0aW9uX2NvdW50ZXIgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnl0ZWMgNiAvLyAib3JnYW5pemF0aW9uX2NvdW50ZXIiCiAgICBkaWcgMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6ODYKICAgIC8vIGlkPUFSQzRVSW50NjQob3JnX2lkKSwKICAgIGR1cAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weTo4NwogICAgLy8gbmFtZT1BUkM0U3RyaW5nKG9yZ19uYW1lKSwKICAgIGZyYW1lX2RpZyAtMgogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6ODgKICAgIC8vIHdhbGxldF9hZGRyZXNzPUFSQzRTdHJpbmcod2FsbGV0X2FkZHJlc3MpLAogICAgZnJhbWVfZGlnIC0xCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weTo4NC05MAogICAgLy8gIyBTdG9yZSBvcmdhbml6YXRpb24gZGF0YSBpbiBCb3hNYXAKICAgIC8vIHNlbGYub3JnYW5pemF0aW9uc1tBUkM0VUludDY0KG9yZ19pZCldID0gT3JnYW5pemF0aW9uSW5mbygKICAgIC8vICAgICBpZD1BUkM0VUludDY0KG9yZ19pZCksCiAgICAvLyAgICAgbmFtZT1BUkM0U3RyaW5nKG9yZ19uYW1lKSwKICAgIC8vICAgICB3YWxsZXRfYWRkcmVzcz1BUkM0U3RyaW5nKHdhbGxldF9hZGRyZXNzKSwKICAgIC8vICAgICB2ZXJpZmljYXRpb25fbGV2ZWw9QVJDNFVJbnQ2NCgwKSAgIyAwID0gdW52ZXJpZmllZCBpbml0aWFsbHkKICAgIC8vICkKICAgIGRpZyAyCiAgICBwdXNoYnl0ZXMgMHgwMDE0CiAgICBjb25jYXQKICAgIGRpZyAyCiAgICBsZW4KICAgIHB1c2hpbnQgMjAgLy8gMjAKICAgICsKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6ODkKICAgIC8vIHZlcmlmaWNhdGlvbl9sZXZlbD1BUkM0VUludDY0KDApICAjIDAgPSB1bnZlcmlmaWVkIGluaXRpYWxseQogICAgYnl0ZWMgNSAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6ODQtOTAKICAgIC8vICMgU3RvcmUgb3JnYW5pemF0aW9uIGRhdGEgaW4gQm94TWFwCiAgICAvLyBzZWxmLm9yZ2FuaXphdGlvbnNbQVJDNFVJbnQ2NChvcmdfaWQpXSA9IE9yZ2FuaXphdGlvbkluZm8oCiAgICAvLyAgICAgaWQ9QVJDNFVJbnQ2NChvcmdfaWQpLAogICAgLy8gICAgIG5hbWU9QVJDNFN0cmluZyhvcmdfbmFtZSksCiAgICAvLyAgICAgd2FsbGV0X2FkZHJlc3M9QVJDNFN0cmluZyh3YWxsZXRfYWRkcmVzcyksCiAgICAvLyAgICAgdmVyaWZpY2F0aW9uX2xldmVsPUFSQzRVSW50NjQoMCkgICMgMCA9IHVudmVyaWZpZWQgaW5pdGlhbGx5CiAgICAvLyApCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6ODQtODUKICAgIC8vICMgU3RvcmUgb3JnYW5pemF0aW9uIGRhdGEgaW4gQm94TWFwCiAgICAvLyBzZWxmLm9yZ2FuaXphdGlvbnNbQVJDNFVJbnQ2NChvcmdfaWQpXSA9IE9yZ2FuaXphdGlvbkluZm8oCiAgICBieXRlYyAxNSAvLyAib3JncyIKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5Ojg0LTkwCiAgICAvLyAjIFN0b3JlIG9yZ2FuaXphdGlvbiBkYXRhIGluIEJveE1hcAogICAgLy8gc2VsZi5vcmdhbml6YXRpb25zW0FSQzRVSW50NjQob3JnX2lkKV0gPSBPcmdhbml6YXRpb25JbmZvKAogICAgLy8gICAgIGlkPUFSQzRVSW50NjQob3JnX2lkKSwKICAgIC8vICAgICBuYW1lPUFSQzRTdHJpbmcob3JnX25hbWUpLAogICAgLy8gICAgIHdhbGxldF9hZGRyZXNzPUFSQzRTdHJpbmcod2FsbGV0X2FkZHJlc3MpLAogICAgLy8gICAgIHZlcmlmaWNhdGlvbl9sZXZlbD1BUkM0VUludDY0KDApICAjIDAgPSB1bnZlcmlmaWVkIGluaXRpYWxseQogICAgLy8gKQogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6OTIKICAgIC8vIHNlbGYudG90YWxfb3JnYW5pemF0aW9ucy52YWx1ZSArPSBVSW50NjQoMSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA4IC8vICJ0b3RhbF9vcmdhbml6YXRpb25zIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX29yZ2FuaXphdGlvbnMgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnl0ZWMgOCAvLyAidG90YWxfb3JnYW5pemF0aW9ucyIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjkzCiAgICAvLyByZXR1cm4gb3JnX2lkCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWlkY2hhaW5fY29udHJhY3RzLmNvbnRyYWN0LkFpZGNoYWluQ29udHJhY3RzLmNyZWF0ZV9jYW1wYWlnbih0aXRsZTogYnl0ZXMsIHRhcmdldDogdWludDY0LCBjcmVhdG9yOiBieXRlcykgLT4gdWludDY0OgpjcmVhdGVfY2FtcGFpZ246CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5Ojk1LTk2CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBjcmVhdGVfY2FtcGFpZ24oc2VsZiwgdGl0bGU6IFN0cmluZywgdGFyZ2V0OiBVSW50NjQsIGNyZWF0b3I6IFN0cmluZykgLT4gVUludDY0OgogICAgcHJvdG8gMyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5Ojk4CiAgICAvLyBzZWxmLmNhbXBhaWduX2NvdW50ZXIudmFsdWUgKz0gVUludDY0KDEpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiY2FtcGFpZ25fY291bnRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jYW1wYWlnbl9jb3VudGVyIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjXzEgLy8gImNhbXBhaWduX2NvdW50ZXIiCiAgICBkaWcgMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MTAzCiAgICAvLyBpZD1BUkM0VUludDY0KGNhbXBhaWduX2lkKSwKICAgIGR1cAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToxMDQKICAgIC8vIHRpdGxlPUFSQzRTdHJpbmcodGl0bGUpLAogICAgZnJhbWVfZGlnIC0zCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBmcmFtZV9kaWcgLTMKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToxMDUKICAgIC8vIHRhcmdldD1BUkM0VUludDY0KHRhcmdldCksCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MTA3CiAgICAvLyBjcmVhdG9yPUFSQzRTdHJpbmcoY3JlYXRvciksCiAgICBmcmFtZV9kaWcgLTEKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjEwMS0xMDkKICAgIC8vICMgU3RvcmUgY2FtcGFpZ24gZGF0YSBpbiBCb3hNYXAKICAgIC8vIHNlbGYuY2FtcGFpZ25zW0FSQzRVSW50NjQoY2FtcGFpZ25faWQpXSA9IENhbXBhaWduSW5mbygKICAgIC8vICAgICBpZD1BUkM0VUludDY0KGNhbXBhaWduX2lkKSwKICAgIC8vICAgICB0aXRsZT1BUkM0U3RyaW5nKHRpdGxlKSwKICAgIC8vICAgICB0YXJnZXQ9QVJDNFVJbnQ2NCh0YXJnZXQpLAogICAgLy8gICAgIHJhaXNlZD1BUkM0VUludDY0KDApLCAgIyBObyBmdW5kcyByYWlzZWQgaW5pdGlhbGx5CiAgICAvLyAgICAgY3JlYXRvcj1BUkM0U3RyaW5nKGNyZWF0b3IpLAogICAgLy8gICAgIGFjdGl2ZT1BUkM0VUludDY0KDEpICAjIDEgPSBhY3RpdmUKICAgIC8vICkKICAgIGRpZyAzCiAgICBwdXNoYnl0ZXMgMHgwMDI0CiAgICBjb25jYXQKICAgIGRpZyAzCiAgICBsZW4KICAgIHB1c2hpbnQgMzYgLy8gMzYKICAgICsKICAgIHN3YXAKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjEwNgogICAgLy8gcmFpc2VkPUFSQzRVSW50NjQoMCksICAjIE5vIGZ1bmRzIHJhaXNlZCBpbml0aWFsbHkKICAgIGJ5dGVjIDUgLy8gMHgwMDAwMDAwMDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjEwMS0xMDkKICAgIC8vICMgU3RvcmUgY2FtcGFpZ24gZGF0YSBpbiBCb3hNYXAKICAgIC8vIHNlbGYuY2FtcGFpZ25zW0FSQzRVSW50NjQoY2FtcGFpZ25faWQpXSA9IENhbXBhaWduSW5mbygKICAgIC8vICAgICBpZD1BUkM0VUludDY0KGNhbXBhaWduX2lkKSwKICAgIC8vICAgICB0aXRsZT1BUkM0U3RyaW5nKHRpdGxlKSwKICAgIC8vICAgICB0YXJnZXQ9QVJDNFVJbnQ2NCh0YXJnZXQpLAogICAgLy8gICAgIHJhaXNlZD1BUkM0VUludDY0KDApLCAgIyBObyBmdW5kcyByYWlzZWQgaW5pdGlhbGx5CiAgICAvLyAgICAgY3JlYXRvcj1BUkM0U3RyaW5nKGNyZWF0b3IpLAogICAgLy8gICAgIGFjdGl2ZT1BUkM0VUludDY0KDEpICAjIDEgPSBhY3RpdmUKICAgIC8vICkKICAgIGNvbmNhdAogICAgc3dhcAogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToxMDgKICAgIC8vIGFjdGl2ZT1BUkM0VUludDY0KDEpICAjIDEgPSBhY3RpdmUKICAgIGJ5dGVjIDExIC8vIDB4MDAwMDAwMDAwMDAwMDAwMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToxMDEtMTA5CiAgICAvLyAjIFN0b3JlIGNhbXBhaWduIGRhdGEgaW4gQm94TWFwCiAgICAvLyBzZWxmLmNhbXBhaWduc1tBUkM0VUludDY0KGNhbXBhaWduX2lkKV0gPSBDYW1wYWlnbkluZm8oCiAgICAvLyAgICAgaWQ9QVJDNFVJbnQ2NChjYW1wYWlnbl9pZCksCiAgICAvLyAgICAgdGl0bGU9QVJDNFN0cmluZyh0aXRsZSksCiAgICAvLyAgICAgdGFyZ2V0PUFSQzRVSW50NjQodGFyZ2V0KSwKICAgIC8vICAgICByYWlzZWQ9QVJDNFVJbnQ2NCgwKSwgICMgTm8gZnVuZHMgcmFpc2VkIGluaXRpYWxseQogICAgLy8gICAgIGNyZWF0b3I9QVJDNFN0cmluZyhjcmVhdG9yKSwKICAgIC8vICAgICBhY3RpdmU9QVJDNFVJbnQ2NCgxKSAgIyAxID0gYWN0aXZlCiAgICAvLyApCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MTAxLTEwMgogICAgLy8gIyBTdG9yZSBjYW1wYWlnbiBkYXRhIGluIEJveE1hcAogICAgLy8gc2VsZi5jYW1wYWlnbnNbQVJDNFVJbnQ2NChjYW1wYWlnbl9pZCldID0gQ2FtcGFpZ25JbmZvKAogICAgYnl0ZWMgMTAgLy8gImNhbXBhaWducyIKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjEwMS0xMDkKICAgIC8vICMgU3RvcmUgY2FtcGFpZ24gZGF0YSBpbiBCb3hNYXAKICAgIC8vIHNlbGYuY2FtcGFpZ25zW0FSQzRVSW50NjQoY2FtcGFpZ25faWQpXSA9IENhbXBhaWduSW5mbygKICAgIC8vICAgICBpZD1BUkM0VUludDY0KGNhbXBhaWduX2lkKSwKICAgIC8vICAgICB0aXRsZT1BUkM0U3RyaW5nKHRpdGxlKSwKICAgIC8vICAgICB0YXJnZXQ9QVJDNFVJbnQ2NCh0YXJnZXQpLAogICAgLy8gICAgIHJhaXNlZD1BUkM0VUludDY0KDApLCAgIyBObyBmdW5kcyByYWlzZWQgaW5pdGlhbGx5CiAgICAvLyAgICAgY3JlYXRvcj1BUkM0U3RyaW5nKGNyZWF0b3IpLAogICAgLy8gICAgIGFjdGl2ZT1BUkM0VUludDY0KDEpICAjIDEgPSBhY3RpdmUKICAgIC8vICkKICAgIGR1cAogICAgYm94X2RlbAogICAgcG9wCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjExMQogICAgLy8gcmV0dXJuIGNhbXBhaWduX2lkCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWlkY2hhaW5fY29udHJhY3RzLmNvbnRyYWN0LkFpZGNoYWluQ29udHJhY3RzLmdldF9jYW1wYWlnbl9jb3VudCgpIC0+IHVpbnQ2NDoKZ2V0X2NhbXBhaWduX2NvdW50OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToxMTYKICAgIC8vIHJldHVybiBzZWxmLmNhbXBhaWduX2NvdW50ZXIudmFsdWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJjYW1wYWlnbl9jb3VudGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNhbXBhaWduX2NvdW50ZXIgZXhpc3RzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWlkY2hhaW5fY29udHJhY3RzLmNvbnRyYWN0LkFpZGNoYWluQ29udHJhY3RzLmdldF9vcmdhbml6YXRpb25fY291bnQoKSAtPiB1aW50NjQ6CmdldF9vcmdhbml6YXRpb25fY291bnQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjEyMQogICAgLy8gcmV0dXJuIHNlbGYub3JnYW5pemF0aW9uX2NvdW50ZXIudmFsdWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA2IC8vICJvcmdhbml6YXRpb25fY291bnRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vcmdhbml6YXRpb25fY291bnRlciBleGlzdHMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5haWRjaGFpbl9jb250cmFjdHMuY29udHJhY3QuQWlkY2hhaW5Db250cmFjdHMuY3JlYXRlX2RvbmF0aW9uKGNhbXBhaWduX2lkOiB1aW50NjQpIC0+IGJ5dGVzOgpjcmVhdGVfZG9uYXRpb246CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjEyMy0xMjQKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGNyZWF0ZV9kb25hdGlvbihzZWxmLCBjYW1wYWlnbl9pZDogVUludDY0KSAtPiBTdHJpbmc6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MTI2LTEyNwogICAgLy8gIyBWYWxpZGF0ZSBjYW1wYWlnbiBleGlzdHMgdXNpbmcgcHJvZmVzc2lvbmFsIHBhdHRlcm5zCiAgICAvLyBhc3NlcnQgY2FtcGFpZ25faWQgPD0gc2VsZi5jYW1wYWlnbl9jb3VudGVyLnZhbHVlLCAiQ2FtcGFpZ24gSUQgb3V0IG9mIHJhbmdlIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImNhbXBhaWduX2NvdW50ZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY2FtcGFpZ25fY291bnRlciBleGlzdHMKICAgIGZyYW1lX2RpZyAtMQogICAgPj0KICAgIGFzc2VydCAvLyBDYW1wYWlnbiBJRCBvdXQgb2YgcmFuZ2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MTI4CiAgICAvLyBhc3NlcnQgY2FtcGFpZ25faWQgIT0gVUludDY0KDApLCAiQ2FtcGFpZ24gSUQgY2Fubm90IGJlIHplcm8iCiAgICBmcmFtZV9kaWcgLTEKICAgIGFzc2VydCAvLyBDYW1wYWlnbiBJRCBjYW5ub3QgYmUgemVybwogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToxMjkKICAgIC8vIGFzc2VydCBBUkM0VUludDY0KGNhbXBhaWduX2lkKSBpbiBzZWxmLmNhbXBhaWducywgIkNhbXBhaWduIG5vdCBmb3VuZCIKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgYnl0ZWMgMTAgLy8gImNhbXBhaWducyIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gQ2FtcGFpZ24gbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjEzNS0xMzYKICAgIC8vICMgQWRkIHRvIHRvdGFsIGRvbmF0aW9ucyAocmVhbCBibG9ja2NoYWluIHN0YXRlKQogICAgLy8gc2VsZi50b3RhbF9kb25hdGlvbnMudmFsdWUgKz0gZG9uYXRpb25fYW1vdW50CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNyAvLyAidG90YWxfZG9uYXRpb25zIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX2RvbmF0aW9ucyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MTMxLTEzMwogICAgLy8gIyBGb3IgdGVzdGluZyBwdXJwb3Nlcywgc2ltdWxhdGUgYSBkb25hdGlvbiBhbW91bnQKICAgIC8vICMgSW4gcHJvZHVjdGlvbiwgdGhpcyB3b3VsZCBnZXQgdGhlIGFjdHVhbCBwYXltZW50IGFtb3VudCBmcm9tIFR4bi5hbW91bnQKICAgIC8vIGRvbmF0aW9uX2Ftb3VudCA9IFVJbnQ2NCgxMDAwKSAgIyBTaW11bGF0ZWQgZG9uYXRpb24gYW1vdW50CiAgICBwdXNoaW50IDEwMDAgLy8gMTAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToxMzUtMTM2CiAgICAvLyAjIEFkZCB0byB0b3RhbCBkb25hdGlvbnMgKHJlYWwgYmxvY2tjaGFpbiBzdGF0ZSkKICAgIC8vIHNlbGYudG90YWxfZG9uYXRpb25zLnZhbHVlICs9IGRvbmF0aW9uX2Ftb3VudAogICAgKwogICAgYnl0ZWMgNyAvLyAidG90YWxfZG9uYXRpb25zIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MTM4CiAgICAvLyByZXR1cm4gU3RyaW5nKCJEb25hdGlvbiByZWNvcmRlZCBzdWNjZXNzZnVsbHkiKQogICAgcHVzaGJ5dGVzICJEb25hdGlvbiByZWNvcmRlZCBzdWNjZXNzZnVsbHkiCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWlkY2hhaW5fY29udHJhY3RzLmNvbnRyYWN0LkFpZGNoYWluQ29udHJhY3RzLmdldF90b3RhbF9kb25hdGlvbnMoKSAtPiB1aW50NjQ6CmdldF90b3RhbF9kb25hdGlvbnM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjE0MwogICAgLy8gcmV0dXJuIHNlbGYudG90YWxfZG9uYXRpb25zLnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNyAvLyAidG90YWxfZG9uYXRpb25zIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX2RvbmF0aW9ucyBleGlzdHMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5haWRjaGFpbl9jb250cmFjdHMuY29udHJhY3QuQWlkY2hhaW5Db250cmFjdHMuY2FsY3VsYXRlX3RvdGFsKGFtb3VudDE6IHVpbnQ2NCwgYW1vdW50MjogdWludDY0KSAtPiB1aW50NjQ6CmNhbGN1bGF0ZV90b3RhbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MTQ1LTE0NgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgY2FsY3VsYXRlX3RvdGFsKHNlbGYsIGFtb3VudDE6IFVJbnQ2NCwgYW1vdW50MjogVUludDY0KSAtPiBVSW50NjQ6CiAgICBwcm90byAyIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MTQ4CiAgICAvLyByZXR1cm4gYW1vdW50MSArIGFtb3VudDIKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIC0xCiAgICArCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWlkY2hhaW5fY29udHJhY3RzLmNvbnRyYWN0LkFpZGNoYWluQ29udHJhY3RzLnZhbGlkYXRlX2RvbmF0aW9uKGFtb3VudDogdWludDY0LCBkb25vcjogYnl0ZXMpIC0+IGJ5dGVzOgp2YWxpZGF0ZV9kb25hdGlvbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MTUwLTE1MQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgdmFsaWRhdGVfZG9uYXRpb24oc2VsZiwgYW1vdW50OiBVSW50NjQsIGRvbm9yOiBTdHJpbmcpIC0+IFN0cmluZzoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToxNTMKICAgIC8vIGlmIGFtb3VudCA+IFVJbnQ2NCgwKToKICAgIGZyYW1lX2RpZyAtMgogICAgYnogdmFsaWRhdGVfZG9uYXRpb25fZWxzZV9ib2R5QDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MTU0CiAgICAvLyByZXR1cm4gU3RyaW5nKCJWYWxpZCBkb25hdGlvbiBmcm9tICIpICsgZG9ub3IKICAgIHB1c2hieXRlcyAiVmFsaWQgZG9uYXRpb24gZnJvbSAiCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgcmV0c3ViCgp2YWxpZGF0ZV9kb25hdGlvbl9lbHNlX2JvZHlAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MTU2CiAgICAvLyByZXR1cm4gU3RyaW5nKCJJbnZhbGlkIGRvbmF0aW9uIGFtb3VudCIpCiAgICBwdXNoYnl0ZXMgIkludmFsaWQgZG9uYXRpb24gYW1vdW50IgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFpZGNoYWluX2NvbnRyYWN0cy5jb250cmFjdC5BaWRjaGFpbkNvbnRyYWN0cy5sb2dfZGVsaXZlcnkocmVjaXBpZW50OiBieXRlcywgbG9jYXRpb246IGJ5dGVzKSAtPiB1aW50NjQ6CmxvZ19kZWxpdmVyeToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MTU4LTE1OQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgbG9nX2RlbGl2ZXJ5KHNlbGYsIHJlY2lwaWVudDogU3RyaW5nLCBsb2NhdGlvbjogU3RyaW5nKSAtPiBVSW50NjQ6CiAgICBwcm90byAyIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MTYxCiAgICAvLyBzZWxmLmRlbGl2ZXJ5X2NvdW50ZXIudmFsdWUgKz0gVUludDY0KDEpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAiZGVsaXZlcnlfY291bnRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kZWxpdmVyeV9jb3VudGVyIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjXzMgLy8gImRlbGl2ZXJ5X2NvdW50ZXIiCiAgICBkaWcgMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MTY2CiAgICAvLyBpZD1BUkM0VUludDY0KGRlbGl2ZXJ5X2lkKSwKICAgIGR1cAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToxNjcKICAgIC8vIHJlY2lwaWVudD1BUkM0U3RyaW5nKHJlY2lwaWVudCksCiAgICBmcmFtZV9kaWcgLTIKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjE2OAogICAgLy8gbG9jYXRpb249QVJDNFN0cmluZyhsb2NhdGlvbiksCiAgICBmcmFtZV9kaWcgLTEKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjE2NC0xNzEKICAgIC8vICMgU3RvcmUgZGVsaXZlcnkgZGF0YSBpbiBCb3hNYXAKICAgIC8vIHNlbGYuZGVsaXZlcmllc1tBUkM0VUludDY0KGRlbGl2ZXJ5X2lkKV0gPSBEZWxpdmVyeVJlY29yZCgKICAgIC8vICAgICBpZD1BUkM0VUludDY0KGRlbGl2ZXJ5X2lkKSwKICAgIC8vICAgICByZWNpcGllbnQ9QVJDNFN0cmluZyhyZWNpcGllbnQpLAogICAgLy8gICAgIGxvY2F0aW9uPUFSQzRTdHJpbmcobG9jYXRpb24pLAogICAgLy8gICAgIGFnZW50PUFSQzRTdHJpbmcoIiIpLCAgIyBFbXB0eSBpbml0aWFsbHkKICAgIC8vICAgICB2ZXJpZmllZD1BUkM0VUludDY0KDApICAjIDAgPSBub3QgdmVyaWZpZWQgaW5pdGlhbGx5CiAgICAvLyApCiAgICBkaWcgMgogICAgcHVzaGJ5dGVzIDB4MDAxNgogICAgY29uY2F0CiAgICBkaWcgMgogICAgbGVuCiAgICBwdXNoaW50IDIyIC8vIDIyCiAgICArCiAgICBkdXAKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZGlnIDIKICAgIGxlbgogICAgdW5jb3ZlciAyCiAgICArCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjE3MAogICAgLy8gdmVyaWZpZWQ9QVJDNFVJbnQ2NCgwKSAgIyAwID0gbm90IHZlcmlmaWVkIGluaXRpYWxseQogICAgYnl0ZWMgNSAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MTY0LTE3MQogICAgLy8gIyBTdG9yZSBkZWxpdmVyeSBkYXRhIGluIEJveE1hcAogICAgLy8gc2VsZi5kZWxpdmVyaWVzW0FSQzRVSW50NjQoZGVsaXZlcnlfaWQpXSA9IERlbGl2ZXJ5UmVjb3JkKAogICAgLy8gICAgIGlkPUFSQzRVSW50NjQoZGVsaXZlcnlfaWQpLAogICAgLy8gICAgIHJlY2lwaWVudD1BUkM0U3RyaW5nKHJlY2lwaWVudCksCiAgICAvLyAgICAgbG9jYXRpb249QVJDNFN0cmluZyhsb2NhdGlvbiksCiAgICAvLyAgICAgYWdlbnQ9QVJDNFN0cmluZygiIiksICAjIEVtcHR5IGluaXRpYWxseQogICAgLy8gICAgIHZlcmlmaWVkPUFSQzRVSW50NjQoMCkgICMgMCA9IG5vdCB2ZXJpZmllZCBpbml0aWFsbHkKICAgIC8vICkKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToxNjkKICAgIC8vIGFnZW50PUFSQzRTdHJpbmcoIiIpLCAgIyBFbXB0eSBpbml0aWFsbHkKICAgIHB1c2hieXRlcyAweDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MTY0LTE3MQogICAgLy8gIyBTdG9yZSBkZWxpdmVyeSBkYXRhIGluIEJveE1hcAogICAgLy8gc2VsZi5kZWxpdmVyaWVzW0FSQzRVSW50NjQoZGVsaXZlcnlfaWQpXSA9IERlbGl2ZXJ5UmVjb3JkKAogICAgLy8gICAgIGlkPUFSQzRVSW50NjQoZGVsaXZlcnlfaWQpLAogICAgLy8gICAgIHJlY2lwaWVudD1BUkM0U3RyaW5nKHJlY2lwaWVudCksCiAgICAvLyAgICAgbG9jYXRpb249QVJDNFN0cmluZyhsb2NhdGlvbiksCiAgICAvLyAgICAgYWdlbnQ9QVJDNFN0cmluZygiIiksICAjIEVtcHR5IGluaXRpYWxseQogICAgLy8gICAgIHZlcmlmaWVkPUFSQzRVSW50NjQoMCkgICMgMCA9IG5vdCB2ZXJpZmllZCBpbml0aWFsbHkKICAgIC8vICkKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToxNjQtMTY1CiAgICAvLyAjIFN0b3JlIGRlbGl2ZXJ5IGRhdGEgaW4gQm94TWFwCiAgICAvLyBzZWxmLmRlbGl2ZXJpZXNbQVJDNFVJbnQ2NChkZWxpdmVyeV9pZCldID0gRGVsaXZlcnlSZWNvcmQoCiAgICBieXRlYyAxMiAvLyAiZGVsaXZlcmllcyIKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjE2NC0xNzEKICAgIC8vICMgU3RvcmUgZGVsaXZlcnkgZGF0YSBpbiBCb3hNYXAKICAgIC8vIHNlbGYuZGVsaXZlcmllc1tBUkM0VUludDY0KGRlbGl2ZXJ5X2lkKV0gPSBEZWxpdmVyeVJlY29yZCgKICAgIC8vICAgICBpZD1BUkM0VUludDY0KGRlbGl2ZXJ5X2lkKSwKICAgIC8vICAgICByZWNpcGllbnQ9QVJDNFN0cmluZyhyZWNpcGllbnQpLAogICAgLy8gICAgIGxvY2F0aW9uPUFSQzRTdHJpbmcobG9jYXRpb24pLAogICAgLy8gICAgIGFnZW50PUFSQzRTdHJpbmcoIiIpLCAgIyBFbXB0eSBpbml0aWFsbHkKICAgIC8vICAgICB2ZXJpZmllZD1BUkM0VUludDY0KDApICAjIDAgPSBub3QgdmVyaWZpZWQgaW5pdGlhbGx5CiAgICAvLyApCiAgICBkdXAKICAgIGJveF9kZWwKICAgIHBvcAogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToxNzMKICAgIC8vIHJldHVybiBkZWxpdmVyeV9pZAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFpZGNoYWluX2NvbnRyYWN0cy5jb250cmFjdC5BaWRjaGFpbkNvbnRyYWN0cy52ZXJpZnlfZGVsaXZlcnkoZGVsaXZlcnlfaWQ6IHVpbnQ2NCwgYWdlbnQ6IGJ5dGVzKSAtPiBieXRlczoKdmVyaWZ5X2RlbGl2ZXJ5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToxNzUtMTc2CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiB2ZXJpZnlfZGVsaXZlcnkoc2VsZiwgZGVsaXZlcnlfaWQ6IFVJbnQ2NCwgYWdlbnQ6IFN0cmluZykgLT4gU3RyaW5nOgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjE3OC0xNzkKICAgIC8vICMgVmFsaWRhdGUgZGVsaXZlcnkgZXhpc3RzCiAgICAvLyBhc3NlcnQgZGVsaXZlcnlfaWQgPD0gc2VsZi5kZWxpdmVyeV9jb3VudGVyLnZhbHVlLCAiRGVsaXZlcnkgSUQgb3V0IG9mIHJhbmdlIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gImRlbGl2ZXJ5X2NvdW50ZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZGVsaXZlcnlfY291bnRlciBleGlzdHMKICAgIGZyYW1lX2RpZyAtMgogICAgPj0KICAgIGFzc2VydCAvLyBEZWxpdmVyeSBJRCBvdXQgb2YgcmFuZ2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MTgwCiAgICAvLyBhc3NlcnQgZGVsaXZlcnlfaWQgIT0gVUludDY0KDApLCAiRGVsaXZlcnkgSUQgY2Fubm90IGJlIHplcm8iCiAgICBmcmFtZV9kaWcgLTIKICAgIGFzc2VydCAvLyBEZWxpdmVyeSBJRCBjYW5ub3QgYmUgemVybwogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToxODEKICAgIC8vIGFzc2VydCBBUkM0VUludDY0KGRlbGl2ZXJ5X2lkKSBpbiBzZWxmLmRlbGl2ZXJpZXMsICJEZWxpdmVyeSBub3QgZm91bmQiCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIGJ5dGVjIDEyIC8vICJkZWxpdmVyaWVzIgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIERlbGl2ZXJ5IG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToxODMtMTg0CiAgICAvLyAjIFVwZGF0ZSBkZWxpdmVyeSBzdGF0dXMgaW4gQm94TWFwCiAgICAvLyBkZWxpdmVyeV9pbmZvID0gc2VsZi5kZWxpdmVyaWVzW0FSQzRVSW50NjQoZGVsaXZlcnlfaWQpXS5jb3B5KCkKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZGVsaXZlcmllcyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MTg1CiAgICAvLyBkZWxpdmVyeV9pbmZvLnZlcmlmaWVkID0gQVJDNFVJbnQ2NCgxKSAgIyBNYXJrIGFzIHZlcmlmaWVkCiAgICBieXRlYyAxMSAvLyAweDAwMDAwMDAwMDAwMDAwMDEKICAgIHJlcGxhY2UyIDE0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjE4NgogICAgLy8gZGVsaXZlcnlfaW5mby5hZ2VudCA9IEFSQzRTdHJpbmcoYWdlbnQpICAjIFNldCB0aGUgdmVyaWZ5aW5nIGFnZW50CiAgICBmcmFtZV9kaWcgLTEKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBkaWcgMQogICAgcHVzaGludCAxMiAvLyAxMgogICAgZXh0cmFjdF91aW50MTYKICAgIHVuY292ZXIgMgogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgZXh0cmFjdDMKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToxODcKICAgIC8vIHNlbGYuZGVsaXZlcmllc1tBUkM0VUludDY0KGRlbGl2ZXJ5X2lkKV0gPSBkZWxpdmVyeV9pbmZvLmNvcHkoKQogICAgZGlnIDEKICAgIGJveF9kZWwKICAgIHBvcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToxODkKICAgIC8vIHJldHVybiBTdHJpbmcoIkRlbGl2ZXJ5IHZlcmlmaWVkIGJ5IGFnZW50OiAiKSArIGFnZW50CiAgICBwdXNoYnl0ZXMgIkRlbGl2ZXJ5IHZlcmlmaWVkIGJ5IGFnZW50OiAiCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFpZGNoYWluX2NvbnRyYWN0cy5jb250cmFjdC5BaWRjaGFpbkNvbnRyYWN0cy5jcmVhdGVfdm91Y2hlcl9hc3NldChhc3NldF9uYW1lOiBieXRlcywgdG90YWxfc3VwcGx5OiB1aW50NjQpIC0+IGJ5dGVzOgpjcmVhdGVfdm91Y2hlcl9hc3NldDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MTk2LTE5NwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgY3JlYXRlX3ZvdWNoZXJfYXNzZXQoc2VsZiwgYXNzZXRfbmFtZTogU3RyaW5nLCB0b3RhbF9zdXBwbHk6IFVJbnQ2NCkgLT4gQVJDNFVJbnQ2NDoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToxOTktMjExCiAgICAvLyAjIENyZWF0ZSBhY3R1YWwgQVNBIHRva2VuIHVzaW5nIGlubmVyIHRyYW5zYWN0aW9uCiAgICAvLyB0eG5fcmVzdWx0ID0gaXR4bi5Bc3NldENvbmZpZygKICAgIC8vICAgICBhc3NldF9uYW1lPWFzc2V0X25hbWUsCiAgICAvLyAgICAgdW5pdF9uYW1lPVN0cmluZygiVk9VQ0hFUiIpLAogICAgLy8gICAgIHRvdGFsPXRvdGFsX3N1cHBseSwKICAgIC8vICAgICBkZWNpbWFscz0wLAogICAgLy8gICAgIGRlZmF1bHRfZnJvemVuPUZhbHNlLAogICAgLy8gICAgIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICByZXNlcnZlPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgZnJlZXplPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgY2xhd2JhY2s9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBmZWU9R2xvYmFsLm1pbl90eG5fZmVlLCAgIyBVc2UgbWluaW11bSB0cmFuc2FjdGlvbiBmZWUKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MjEwCiAgICAvLyBmZWU9R2xvYmFsLm1pbl90eG5fZmVlLCAgIyBVc2UgbWluaW11bSB0cmFuc2FjdGlvbiBmZWUKICAgIGdsb2JhbCBNaW5UeG5GZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MjA2CiAgICAvLyBtYW5hZ2VyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToyMDctMjA5CiAgICAvLyByZXNlcnZlPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyBmcmVlemU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vIGNsYXdiYWNrPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBkdXBuIDMKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRDbGF3YmFjawogICAgaXR4bl9maWVsZCBDb25maWdBc3NldEZyZWV6ZQogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFJlc2VydmUKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRNYW5hZ2VyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjIwNQogICAgLy8gZGVmYXVsdF9mcm96ZW49RmFsc2UsCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBDb25maWdBc3NldERlZmF1bHRGcm96ZW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MjA0CiAgICAvLyBkZWNpbWFscz0wLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXREZWNpbWFscwogICAgZnJhbWVfZGlnIC0xCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0VG90YWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MjAyCiAgICAvLyB1bml0X25hbWU9U3RyaW5nKCJWT1VDSEVSIiksCiAgICBwdXNoYnl0ZXMgIlZPVUNIRVIiCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0VW5pdE5hbWUKICAgIGZyYW1lX2RpZyAtMgogICAgaXR4bl9maWVsZCBDb25maWdBc3NldE5hbWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MTk5LTIwMAogICAgLy8gIyBDcmVhdGUgYWN0dWFsIEFTQSB0b2tlbiB1c2luZyBpbm5lciB0cmFuc2FjdGlvbgogICAgLy8gdHhuX3Jlc3VsdCA9IGl0eG4uQXNzZXRDb25maWcoCiAgICBwdXNoaW50IDMgLy8gYWNmZwogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MTk5LTIxMQogICAgLy8gIyBDcmVhdGUgYWN0dWFsIEFTQSB0b2tlbiB1c2luZyBpbm5lciB0cmFuc2FjdGlvbgogICAgLy8gdHhuX3Jlc3VsdCA9IGl0eG4uQXNzZXRDb25maWcoCiAgICAvLyAgICAgYXNzZXRfbmFtZT1hc3NldF9uYW1lLAogICAgLy8gICAgIHVuaXRfbmFtZT1TdHJpbmcoIlZPVUNIRVIiKSwKICAgIC8vICAgICB0b3RhbD10b3RhbF9zdXBwbHksCiAgICAvLyAgICAgZGVjaW1hbHM9MCwKICAgIC8vICAgICBkZWZhdWx0X2Zyb3plbj1GYWxzZSwKICAgIC8vICAgICBtYW5hZ2VyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgcmVzZXJ2ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGZyZWV6ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGNsYXdiYWNrPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgZmVlPUdsb2JhbC5taW5fdHhuX2ZlZSwgICMgVXNlIG1pbmltdW0gdHJhbnNhY3Rpb24gZmVlCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgaXR4biBDcmVhdGVkQXNzZXRJRAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToyMTYtMjE3CiAgICAvLyAjIEluY3JlbWVudCB2b3VjaGVyIGNvdW50ZXIKICAgIC8vIHNlbGYudm91Y2hlcl9jb3VudGVyLnZhbHVlICs9IFVJbnQ2NCgxKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gInZvdWNoZXJfY291bnRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3VjaGVyX2NvdW50ZXIgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnl0ZWMgNCAvLyAidm91Y2hlcl9jb3VudGVyIgogICAgZGlnIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjIyMgogICAgLy8gaWQ9QVJDNFVJbnQ2NCh2b3VjaGVyX2lkKSwKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MjIzCiAgICAvLyBhc3NldF9pZD1BUkM0VUludDY0KGFzc2V0X2lkKSwKICAgIHN3YXAKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MjI0CiAgICAvLyBuYW1lPUFSQzRTdHJpbmcoYXNzZXRfbmFtZSksCiAgICBmcmFtZV9kaWcgLTIKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjIyNQogICAgLy8gdG90YWxfc3VwcGx5PUFSQzRVSW50NjQodG90YWxfc3VwcGx5KSwKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToyMjAtMjI3CiAgICAvLyAjIFN0b3JlIHZvdWNoZXIgaW5mbyBpbiBCb3hNYXAKICAgIC8vIHNlbGYudm91Y2hlcnNbQVJDNFVJbnQ2NCh2b3VjaGVyX2lkKV0gPSBWb3VjaGVySW5mbygKICAgIC8vICAgICBpZD1BUkM0VUludDY0KHZvdWNoZXJfaWQpLAogICAgLy8gICAgIGFzc2V0X2lkPUFSQzRVSW50NjQoYXNzZXRfaWQpLAogICAgLy8gICAgIG5hbWU9QVJDNFN0cmluZyhhc3NldF9uYW1lKSwKICAgIC8vICAgICB0b3RhbF9zdXBwbHk9QVJDNFVJbnQ2NCh0b3RhbF9zdXBwbHkpLAogICAgLy8gICAgIGlzc3VlZD1BUkM0VUludDY0KDApICAjIE5vIHRva2VucyBpc3N1ZWQgeWV0CiAgICAvLyApCiAgICBkaWcgMwogICAgZGlnIDMKICAgIGNvbmNhdAogICAgcHVzaGJ5dGVzIDB4MDAyMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MjI2CiAgICAvLyBpc3N1ZWQ9QVJDNFVJbnQ2NCgwKSAgIyBObyB0b2tlbnMgaXNzdWVkIHlldAogICAgYnl0ZWMgNSAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MjIwLTIyNwogICAgLy8gIyBTdG9yZSB2b3VjaGVyIGluZm8gaW4gQm94TWFwCiAgICAvLyBzZWxmLnZvdWNoZXJzW0FSQzRVSW50NjQodm91Y2hlcl9pZCldID0gVm91Y2hlckluZm8oCiAgICAvLyAgICAgaWQ9QVJDNFVJbnQ2NCh2b3VjaGVyX2lkKSwKICAgIC8vICAgICBhc3NldF9pZD1BUkM0VUludDY0KGFzc2V0X2lkKSwKICAgIC8vICAgICBuYW1lPUFSQzRTdHJpbmcoYXNzZXRfbmFtZSksCiAgICAvLyAgICAgdG90YWxfc3VwcGx5PUFSQzRVSW50NjQodG90YWxfc3VwcGx5KSwKICAgIC8vICAgICBpc3N1ZWQ9QVJDNFVJbnQ2NCgwKSAgIyBObyB0b2tlbnMgaXNzdWVkIHlldAogICAgLy8gKQogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MjIwLTIyMQogICAgLy8gIyBTdG9yZSB2b3VjaGVyIGluZm8gaW4gQm94TWFwCiAgICAvLyBzZWxmLnZvdWNoZXJzW0FSQzRVSW50NjQodm91Y2hlcl9pZCldID0gVm91Y2hlckluZm8oCiAgICBieXRlYyAxNiAvLyAidm91Y2hlcnMiCiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToyMjAtMjI3CiAgICAvLyAjIFN0b3JlIHZvdWNoZXIgaW5mbyBpbiBCb3hNYXAKICAgIC8vIHNlbGYudm91Y2hlcnNbQVJDNFVJbnQ2NCh2b3VjaGVyX2lkKV0gPSBWb3VjaGVySW5mbygKICAgIC8vICAgICBpZD1BUkM0VUludDY0KHZvdWNoZXJfaWQpLAogICAgLy8gICAgIGFzc2V0X2lkPUFSQzRVSW50NjQoYXNzZXRfaWQpLAogICAgLy8gICAgIG5hbWU9QVJDNFN0cmluZyhhc3NldF9uYW1lKSwKICAgIC8vICAgICB0b3RhbF9zdXBwbHk9QVJDNFVJbnQ2NCh0b3RhbF9zdXBwbHkpLAogICAgLy8gICAgIGlzc3VlZD1BUkM0VUludDY0KDApICAjIE5vIHRva2VucyBpc3N1ZWQgeWV0CiAgICAvLyApCiAgICBkdXAKICAgIGJveF9kZWwKICAgIHBvcAogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToyMjktMjMwCiAgICAvLyAjIFJldHVybiB0aGUgYWN0dWFsIGFzc2V0IElEIGNyZWF0ZWQgYnkgdGhlIGJsb2NrY2hhaW4KICAgIC8vIHJldHVybiBBUkM0VUludDY0KGFzc2V0X2lkKQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFpZGNoYWluX2NvbnRyYWN0cy5jb250cmFjdC5BaWRjaGFpbkNvbnRyYWN0cy5yZWRlZW1fdm91Y2hlcih2b3VjaGVyX2lkOiB1aW50NjQsIG1lcmNoYW50OiBieXRlcywgYW1vdW50OiB1aW50NjQpIC0+IGJ5dGVzOgpyZWRlZW1fdm91Y2hlcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MjM5LTI0MAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgcmVkZWVtX3ZvdWNoZXIoc2VsZiwgdm91Y2hlcl9pZDogVUludDY0LCBtZXJjaGFudDogU3RyaW5nLCBhbW91bnQ6IFVJbnQ2NCkgLT4gU3RyaW5nOgogICAgcHJvdG8gMyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjI0MgogICAgLy8gaWYgdm91Y2hlcl9pZCA+IHNlbGYudm91Y2hlcl9jb3VudGVyLnZhbHVlIG9yIHZvdWNoZXJfaWQgPT0gVUludDY0KDApOgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gInZvdWNoZXJfY291bnRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3VjaGVyX2NvdW50ZXIgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTMKICAgIDwKICAgIGJueiByZWRlZW1fdm91Y2hlcl9pZl9ib2R5QDIKICAgIGZyYW1lX2RpZyAtMwogICAgYm56IHJlZGVlbV92b3VjaGVyX2FmdGVyX2lmX2Vsc2VAMwoKcmVkZWVtX3ZvdWNoZXJfaWZfYm9keUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToyNDMKICAgIC8vIHJldHVybiBTdHJpbmcoIkludmFsaWQgdm91Y2hlciBJRCIpCiAgICBwdXNoYnl0ZXMgIkludmFsaWQgdm91Y2hlciBJRCIKICAgIHJldHN1YgoKcmVkZWVtX3ZvdWNoZXJfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToyNDUKICAgIC8vIGlmIGFtb3VudCA9PSBVSW50NjQoMCk6CiAgICBmcmFtZV9kaWcgLTEKICAgIGJueiByZWRlZW1fdm91Y2hlcl9hZnRlcl9pZl9lbHNlQDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MjQ2CiAgICAvLyByZXR1cm4gU3RyaW5nKCJBbW91bnQgbXVzdCBiZSBncmVhdGVyIHRoYW4gemVybyIpCiAgICBwdXNoYnl0ZXMgIkFtb3VudCBtdXN0IGJlIGdyZWF0ZXIgdGhhbiB6ZXJvIgogICAgcmV0c3ViCgpyZWRlZW1fdm91Y2hlcl9hZnRlcl9pZl9lbHNlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjI0OAogICAgLy8gcmV0dXJuIFN0cmluZygiVm91Y2hlcnMgcmVkZWVtZWQgYXQgIikgKyBtZXJjaGFudAogICAgcHVzaGJ5dGVzICJWb3VjaGVycyByZWRlZW1lZCBhdCAiCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFpZGNoYWluX2NvbnRyYWN0cy5jb250cmFjdC5BaWRjaGFpbkNvbnRyYWN0cy5jcmVhdGVfbWlsZXN0b25lKGNhbXBhaWduX2lkOiB1aW50NjQsIHRhcmdldF9hbW91bnQ6IHVpbnQ2NCwgZGVzY3JpcHRpb246IGJ5dGVzKSAtPiB1aW50NjQ6CmNyZWF0ZV9taWxlc3RvbmU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjI1Ni0yNTcKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGNyZWF0ZV9taWxlc3RvbmUoc2VsZiwgY2FtcGFpZ25faWQ6IFVJbnQ2NCwgdGFyZ2V0X2Ftb3VudDogVUludDY0LCBkZXNjcmlwdGlvbjogU3RyaW5nKSAtPiBVSW50NjQ6CiAgICBwcm90byAzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MjU5LTI2MAogICAgLy8gIyBWYWxpZGF0ZSBjYW1wYWlnbiBleGlzdHMKICAgIC8vIGFzc2VydCBjYW1wYWlnbl9pZCA8PSBzZWxmLmNhbXBhaWduX2NvdW50ZXIudmFsdWUsICJDYW1wYWlnbiBJRCBvdXQgb2YgcmFuZ2UiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiY2FtcGFpZ25fY291bnRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jYW1wYWlnbl9jb3VudGVyIGV4aXN0cwogICAgZnJhbWVfZGlnIC0zCiAgICA+PQogICAgYXNzZXJ0IC8vIENhbXBhaWduIElEIG91dCBvZiByYW5nZQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToyNjEKICAgIC8vIGFzc2VydCBjYW1wYWlnbl9pZCAhPSBVSW50NjQoMCksICJDYW1wYWlnbiBJRCBjYW5ub3QgYmUgemVybyIKICAgIGZyYW1lX2RpZyAtMwogICAgYXNzZXJ0IC8vIENhbXBhaWduIElEIGNhbm5vdCBiZSB6ZXJvCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjI2MgogICAgLy8gYXNzZXJ0IEFSQzRVSW50NjQoY2FtcGFpZ25faWQpIGluIHNlbGYuY2FtcGFpZ25zLCAiQ2FtcGFpZ24gbm90IGZvdW5kIgogICAgZnJhbWVfZGlnIC0zCiAgICBpdG9iCiAgICBieXRlYyAxMCAvLyAiY2FtcGFpZ25zIgogICAgZGlnIDEKICAgIGNvbmNhdAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gQ2FtcGFpZ24gbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjI2NAogICAgLy8gc2VsZi5taWxlc3RvbmVfY291bnRlci52YWx1ZSArPSBVSW50NjQoMSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJtaWxlc3RvbmVfY291bnRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5taWxlc3RvbmVfY291bnRlciBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlY18yIC8vICJtaWxlc3RvbmVfY291bnRlciIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToyNjkKICAgIC8vIGlkPUFSQzRVSW50NjQobWlsZXN0b25lX2lkKSwKICAgIGR1cAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToyNzEKICAgIC8vIHRhcmdldF9hbW91bnQ9QVJDNFVJbnQ2NCh0YXJnZXRfYW1vdW50KSwKICAgIGZyYW1lX2RpZyAtMgogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToyNzIKICAgIC8vIGRlc2NyaXB0aW9uPUFSQzRTdHJpbmcoZGVzY3JpcHRpb24pLAogICAgZnJhbWVfZGlnIC0xCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToyNjctMjc1CiAgICAvLyAjIFN0b3JlIG1pbGVzdG9uZSBkYXRhIGluIEJveE1hcAogICAgLy8gc2VsZi5taWxlc3RvbmVzW0FSQzRVSW50NjQobWlsZXN0b25lX2lkKV0gPSBNaWxlc3RvbmVJbmZvKAogICAgLy8gICAgIGlkPUFSQzRVSW50NjQobWlsZXN0b25lX2lkKSwKICAgIC8vICAgICBjYW1wYWlnbl9pZD1BUkM0VUludDY0KGNhbXBhaWduX2lkKSwKICAgIC8vICAgICB0YXJnZXRfYW1vdW50PUFSQzRVSW50NjQodGFyZ2V0X2Ftb3VudCksCiAgICAvLyAgICAgZGVzY3JpcHRpb249QVJDNFN0cmluZyhkZXNjcmlwdGlvbiksCiAgICAvLyAgICAgY29tcGxldGVkPUFSQzRVSW50NjQoMCksICAjIDAgPSBwZW5kaW5nCiAgICAvLyAgICAgZnVuZHNfcmVsZWFzZWQ9QVJDNFVJbnQ2NCgwKSAgIyAwID0gbm90IHJlbGVhc2VkCiAgICAvLyApCiAgICBkaWcgMgogICAgdW5jb3ZlciA1CiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHgwMDJhCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MjczCiAgICAvLyBjb21wbGV0ZWQ9QVJDNFVJbnQ2NCgwKSwgICMgMCA9IHBlbmRpbmcKICAgIGJ5dGVjIDUgLy8gMHgwMDAwMDAwMDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjI2Ny0yNzUKICAgIC8vICMgU3RvcmUgbWlsZXN0b25lIGRhdGEgaW4gQm94TWFwCiAgICAvLyBzZWxmLm1pbGVzdG9uZXNbQVJDNFVJbnQ2NChtaWxlc3RvbmVfaWQpXSA9IE1pbGVzdG9uZUluZm8oCiAgICAvLyAgICAgaWQ9QVJDNFVJbnQ2NChtaWxlc3RvbmVfaWQpLAogICAgLy8gICAgIGNhbXBhaWduX2lkPUFSQzRVSW50NjQoY2FtcGFpZ25faWQpLAogICAgLy8gICAgIHRhcmdldF9hbW91bnQ9QVJDNFVJbnQ2NCh0YXJnZXRfYW1vdW50KSwKICAgIC8vICAgICBkZXNjcmlwdGlvbj1BUkM0U3RyaW5nKGRlc2NyaXB0aW9uKSwKICAgIC8vICAgICBjb21wbGV0ZWQ9QVJDNFVJbnQ2NCgwKSwgICMgMCA9IHBlbmRpbmcKICAgIC8vICAgICBmdW5kc19yZWxlYXNlZD1BUkM0VUludDY0KDApICAjIDAgPSBub3QgcmVsZWFzZWQKICAgIC8vICkKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToyNzQKICAgIC8vIGZ1bmRzX3JlbGVhc2VkPUFSQzRVSW50NjQoMCkgICMgMCA9IG5vdCByZWxlYXNlZAogICAgYnl0ZWMgNSAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MjY3LTI3NQogICAgLy8gIyBTdG9yZSBtaWxlc3RvbmUgZGF0YSBpbiBCb3hNYXAKICAgIC8vIHNlbGYubWlsZXN0b25lc1tBUkM0VUludDY0KG1pbGVzdG9uZV9pZCldID0gTWlsZXN0b25lSW5mbygKICAgIC8vICAgICBpZD1BUkM0VUludDY0KG1pbGVzdG9uZV9pZCksCiAgICAvLyAgICAgY2FtcGFpZ25faWQ9QVJDNFVJbnQ2NChjYW1wYWlnbl9pZCksCiAgICAvLyAgICAgdGFyZ2V0X2Ftb3VudD1BUkM0VUludDY0KHRhcmdldF9hbW91bnQpLAogICAgLy8gICAgIGRlc2NyaXB0aW9uPUFSQzRTdHJpbmcoZGVzY3JpcHRpb24pLAogICAgLy8gICAgIGNvbXBsZXRlZD1BUkM0VUludDY0KDApLCAgIyAwID0gcGVuZGluZwogICAgLy8gICAgIGZ1bmRzX3JlbGVhc2VkPUFSQzRVSW50NjQoMCkgICMgMCA9IG5vdCByZWxlYXNlZAogICAgLy8gKQogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MjY3LTI2OAogICAgLy8gIyBTdG9yZSBtaWxlc3RvbmUgZGF0YSBpbiBCb3hNYXAKICAgIC8vIHNlbGYubWlsZXN0b25lc1tBUkM0VUludDY0KG1pbGVzdG9uZV9pZCldID0gTWlsZXN0b25lSW5mbygKICAgIGJ5dGVjIDEzIC8vICJtaWxlc3RvbmVzIgogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MjY3LTI3NQogICAgLy8gIyBTdG9yZSBtaWxlc3RvbmUgZGF0YSBpbiBCb3hNYXAKICAgIC8vIHNlbGYubWlsZXN0b25lc1tBUkM0VUludDY0KG1pbGVzdG9uZV9pZCldID0gTWlsZXN0b25lSW5mbygKICAgIC8vICAgICBpZD1BUkM0VUludDY0KG1pbGVzdG9uZV9pZCksCiAgICAvLyAgICAgY2FtcGFpZ25faWQ9QVJDNFVJbnQ2NChjYW1wYWlnbl9pZCksCiAgICAvLyAgICAgdGFyZ2V0X2Ftb3VudD1BUkM0VUludDY0KHRhcmdldF9hbW91bnQpLAogICAgLy8gICAgIGRlc2NyaXB0aW9uPUFSQzRTdHJpbmcoZGVzY3JpcHRpb24pLAogICAgLy8gICAgIGNvbXBsZXRlZD1BUkM0VUludDY0KDApLCAgIyAwID0gcGVuZGluZwogICAgLy8gICAgIGZ1bmRzX3JlbGVhc2VkPUFSQzRVSW50NjQoMCkgICMgMCA9IG5vdCByZWxlYXNlZAogICAgLy8gKQogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6Mjc3CiAgICAvLyByZXR1cm4gbWlsZXN0b25lX2lkCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWlkY2hhaW5fY29udHJhY3RzLmNvbnRyYWN0LkFpZGNoYWluQ29udHJhY3RzLmNvbXBsZXRlX21pbGVzdG9uZShtaWxlc3RvbmVfaWQ6IHVpbnQ2NCwgcHJvb2Y6IGJ5dGVzKSAtPiBieXRlczoKY29tcGxldGVfbWlsZXN0b25lOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToyNzktMjgwCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBjb21wbGV0ZV9taWxlc3RvbmUoc2VsZiwgbWlsZXN0b25lX2lkOiBVSW50NjQsIHByb29mOiBTdHJpbmcpIC0+IFN0cmluZzoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToyODItMjgzCiAgICAvLyAjIFZhbGlkYXRlIG1pbGVzdG9uZSBleGlzdHMKICAgIC8vIGFzc2VydCBtaWxlc3RvbmVfaWQgPD0gc2VsZi5taWxlc3RvbmVfY291bnRlci52YWx1ZSwgIk1pbGVzdG9uZSBJRCBvdXQgb2YgcmFuZ2UiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAibWlsZXN0b25lX2NvdW50ZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWlsZXN0b25lX2NvdW50ZXIgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTIKICAgID49CiAgICBhc3NlcnQgLy8gTWlsZXN0b25lIElEIG91dCBvZiByYW5nZQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToyODQKICAgIC8vIGFzc2VydCBtaWxlc3RvbmVfaWQgIT0gVUludDY0KDApLCAiTWlsZXN0b25lIElEIGNhbm5vdCBiZSB6ZXJvIgogICAgZnJhbWVfZGlnIC0yCiAgICBhc3NlcnQgLy8gTWlsZXN0b25lIElEIGNhbm5vdCBiZSB6ZXJvCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjI4NQogICAgLy8gYXNzZXJ0IEFSQzRVSW50NjQobWlsZXN0b25lX2lkKSBpbiBzZWxmLm1pbGVzdG9uZXMsICJNaWxlc3RvbmUgbm90IGZvdW5kIgogICAgZnJhbWVfZGlnIC0yCiAgICBpdG9iCiAgICBieXRlYyAxMyAvLyAibWlsZXN0b25lcyIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBNaWxlc3RvbmUgbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjI4Ny0yODgKICAgIC8vICMgVXBkYXRlIG1pbGVzdG9uZSBzdGF0dXMgaW4gQm94TWFwCiAgICAvLyBtaWxlc3RvbmVfaW5mbyA9IHNlbGYubWlsZXN0b25lc1tBUkM0VUludDY0KG1pbGVzdG9uZV9pZCldLmNvcHkoKQogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5taWxlc3RvbmVzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToyODkKICAgIC8vIG1pbGVzdG9uZV9pbmZvLmNvbXBsZXRlZCA9IEFSQzRVSW50NjQoMSkgICMgTWFyayBhcyBjb21wbGV0ZWQKICAgIGJ5dGVjIDExIC8vIDB4MDAwMDAwMDAwMDAwMDAwMQogICAgcmVwbGFjZTIgMjYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MjkwCiAgICAvLyBzZWxmLm1pbGVzdG9uZXNbQVJDNFVJbnQ2NChtaWxlc3RvbmVfaWQpXSA9IG1pbGVzdG9uZV9pbmZvLmNvcHkoKQogICAgZGlnIDEKICAgIGJveF9kZWwKICAgIHBvcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToyOTIKICAgIC8vIHNlbGYudG90YWxfbWlsZXN0b25lc19jb21wbGV0ZWQudmFsdWUgKz0gVUludDY0KDEpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOSAvLyAidG90YWxfbWlsZXN0b25lc19jb21wbGV0ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfbWlsZXN0b25lc19jb21wbGV0ZWQgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnl0ZWMgOSAvLyAidG90YWxfbWlsZXN0b25lc19jb21wbGV0ZWQiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToyOTMKICAgIC8vIHJldHVybiBTdHJpbmcoIk1pbGVzdG9uZSBjb21wbGV0ZWQgd2l0aCBwcm9vZjogIikgKyBwcm9vZgogICAgcHVzaGJ5dGVzICJNaWxlc3RvbmUgY29tcGxldGVkIHdpdGggcHJvb2Y6ICIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWlkY2hhaW5fY29udHJhY3RzLmNvbnRyYWN0LkFpZGNoYWluQ29udHJhY3RzLnJlbGVhc2VfbWlsZXN0b25lX2Z1bmRzKG1pbGVzdG9uZV9pZDogdWludDY0LCByZWNpcGllbnQ6IGJ5dGVzLCBhbW91bnQ6IHVpbnQ2NCkgLT4gYnl0ZXM6CnJlbGVhc2VfbWlsZXN0b25lX2Z1bmRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToyOTUtMjk2CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiByZWxlYXNlX21pbGVzdG9uZV9mdW5kcyhzZWxmLCBtaWxlc3RvbmVfaWQ6IFVJbnQ2NCwgcmVjaXBpZW50OiBBY2NvdW50LCBhbW91bnQ6IFVJbnQ2NCkgLT4gU3RyaW5nOgogICAgcHJvdG8gMyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjI5OC0yOTkKICAgIC8vICMgVmFsaWRhdGUgdXNpbmcgcHJvZmVzc2lvbmFsIHBhdHRlcm5zCiAgICAvLyBhc3NlcnQgbWlsZXN0b25lX2lkIDw9IHNlbGYubWlsZXN0b25lX2NvdW50ZXIudmFsdWUsICJNaWxlc3RvbmUgSUQgb3V0IG9mIHJhbmdlIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gIm1pbGVzdG9uZV9jb3VudGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1pbGVzdG9uZV9jb3VudGVyIGV4aXN0cwogICAgZnJhbWVfZGlnIC0zCiAgICA+PQogICAgYXNzZXJ0IC8vIE1pbGVzdG9uZSBJRCBvdXQgb2YgcmFuZ2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MzAwCiAgICAvLyBhc3NlcnQgbWlsZXN0b25lX2lkICE9IFVJbnQ2NCgwKSwgIk1pbGVzdG9uZSBJRCBjYW5ub3QgYmUgemVybyIKICAgIGZyYW1lX2RpZyAtMwogICAgYXNzZXJ0IC8vIE1pbGVzdG9uZSBJRCBjYW5ub3QgYmUgemVybwogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weTozMDEKICAgIC8vIGFzc2VydCBhbW91bnQgPiBVSW50NjQoMCksICJBbW91bnQgbXVzdCBiZSBncmVhdGVyIHRoYW4gemVybyIKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXJ0IC8vIEFtb3VudCBtdXN0IGJlIGdyZWF0ZXIgdGhhbiB6ZXJvCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjMwMy0zMDgKICAgIC8vICMgTWFrZSBhY3R1YWwgcGF5bWVudCBvbiBibG9ja2NoYWluCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9cmVjaXBpZW50LAogICAgLy8gICAgIGFtb3VudD1hbW91bnQsCiAgICAvLyAgICAgZmVlPUdsb2JhbC5taW5fdHhuX2ZlZSwgICMgVXNlIG1pbmltdW0gdHJhbnNhY3Rpb24gZmVlCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjMwNwogICAgLy8gZmVlPUdsb2JhbC5taW5fdHhuX2ZlZSwgICMgVXNlIG1pbmltdW0gdHJhbnNhY3Rpb24gZmVlCiAgICBnbG9iYWwgTWluVHhuRmVlCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBmcmFtZV9kaWcgLTIKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MzAzLTMwNAogICAgLy8gIyBNYWtlIGFjdHVhbCBwYXltZW50IG9uIGJsb2NrY2hhaW4KICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIGludGNfMSAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjMwMy0zMDgKICAgIC8vICMgTWFrZSBhY3R1YWwgcGF5bWVudCBvbiBibG9ja2NoYWluCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9cmVjaXBpZW50LAogICAgLy8gICAgIGFtb3VudD1hbW91bnQsCiAgICAvLyAgICAgZmVlPUdsb2JhbC5taW5fdHhuX2ZlZSwgICMgVXNlIG1pbmltdW0gdHJhbnNhY3Rpb24gZmVlCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weTozMTAKICAgIC8vIHJldHVybiBTdHJpbmcoIlJlYWwgYmxvY2tjaGFpbiBwYXltZW50IHNlbnQgZm9yIG1pbGVzdG9uZSIpCiAgICBwdXNoYnl0ZXMgIlJlYWwgYmxvY2tjaGFpbiBwYXltZW50IHNlbnQgZm9yIG1pbGVzdG9uZSIKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5haWRjaGFpbl9jb250cmFjdHMuY29udHJhY3QuQWlkY2hhaW5Db250cmFjdHMuZ2V0X2NhbXBhaWduX2RldGFpbHMoY2FtcGFpZ25faWQ6IGJ5dGVzKSAtPiBieXRlczoKZ2V0X2NhbXBhaWduX2RldGFpbHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjMxOS0zMjAKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfY2FtcGFpZ25fZGV0YWlscyhzZWxmLCBjYW1wYWlnbl9pZDogQVJDNFVJbnQ2NCkgLT4gQ2FtcGFpZ25JbmZvOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjMyMgogICAgLy8gYXNzZXJ0IGNhbXBhaWduX2lkIGluIHNlbGYuY2FtcGFpZ25zLCAiQ2FtcGFpZ24gbm90IGZvdW5kIgogICAgYnl0ZWMgMTAgLy8gImNhbXBhaWducyIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIENhbXBhaWduIG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weTozMjMKICAgIC8vIHJldHVybiBzZWxmLmNhbXBhaWduc1tjYW1wYWlnbl9pZF0KICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNhbXBhaWducyBlbnRyeSBleGlzdHMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5haWRjaGFpbl9jb250cmFjdHMuY29udHJhY3QuQWlkY2hhaW5Db250cmFjdHMuZ2V0X29yZ2FuaXphdGlvbl9kZXRhaWxzKG9yZ19pZDogYnl0ZXMpIC0+IGJ5dGVzOgpnZXRfb3JnYW5pemF0aW9uX2RldGFpbHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjMyNS0zMjYKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfb3JnYW5pemF0aW9uX2RldGFpbHMoc2VsZiwgb3JnX2lkOiBBUkM0VUludDY0KSAtPiBPcmdhbml6YXRpb25JbmZvOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjMyOAogICAgLy8gYXNzZXJ0IG9yZ19pZCBpbiBzZWxmLm9yZ2FuaXphdGlvbnMsICJPcmdhbml6YXRpb24gbm90IGZvdW5kIgogICAgYnl0ZWMgMTUgLy8gIm9yZ3MiCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBPcmdhbml6YXRpb24gbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjMyOQogICAgLy8gcmV0dXJuIHNlbGYub3JnYW5pemF0aW9uc1tvcmdfaWRdCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vcmdhbml6YXRpb25zIGVudHJ5IGV4aXN0cwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFpZGNoYWluX2NvbnRyYWN0cy5jb250cmFjdC5BaWRjaGFpbkNvbnRyYWN0cy5nZXRfdm91Y2hlcl9kZXRhaWxzKHZvdWNoZXJfaWQ6IGJ5dGVzKSAtPiBieXRlczoKZ2V0X3ZvdWNoZXJfZGV0YWlsczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MzMxLTMzMgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF92b3VjaGVyX2RldGFpbHMoc2VsZiwgdm91Y2hlcl9pZDogQVJDNFVJbnQ2NCkgLT4gVm91Y2hlckluZm86CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MzM0CiAgICAvLyBhc3NlcnQgdm91Y2hlcl9pZCBpbiBzZWxmLnZvdWNoZXJzLCAiVm91Y2hlciBub3QgZm91bmQiCiAgICBieXRlYyAxNiAvLyAidm91Y2hlcnMiCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBWb3VjaGVyIG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weTozMzUKICAgIC8vIHJldHVybiBzZWxmLnZvdWNoZXJzW3ZvdWNoZXJfaWRdCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3VjaGVycyBlbnRyeSBleGlzdHMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5haWRjaGFpbl9jb250cmFjdHMuY29udHJhY3QuQWlkY2hhaW5Db250cmFjdHMuZ2V0X21pbGVzdG9uZV9kZXRhaWxzKG1pbGVzdG9uZV9pZDogYnl0ZXMpIC0+IGJ5dGVzOgpnZXRfbWlsZXN0b25lX2RldGFpbHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjMzNy0zMzgKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfbWlsZXN0b25lX2RldGFpbHMoc2VsZiwgbWlsZXN0b25lX2lkOiBBUkM0VUludDY0KSAtPiBNaWxlc3RvbmVJbmZvOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjM0MAogICAgLy8gYXNzZXJ0IG1pbGVzdG9uZV9pZCBpbiBzZWxmLm1pbGVzdG9uZXMsICJNaWxlc3RvbmUgbm90IGZvdW5kIgogICAgYnl0ZWMgMTMgLy8gIm1pbGVzdG9uZXMiCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBNaWxlc3RvbmUgbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjM0MQogICAgLy8gcmV0dXJuIHNlbGYubWlsZXN0b25lc1ttaWxlc3RvbmVfaWRdCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5taWxlc3RvbmVzIGVudHJ5IGV4aXN0cwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFpZGNoYWluX2NvbnRyYWN0cy5jb250cmFjdC5BaWRjaGFpbkNvbnRyYWN0cy5nZXRfZGVsaXZlcnlfZGV0YWlscyhkZWxpdmVyeV9pZDogYnl0ZXMpIC0+IGJ5dGVzOgpnZXRfZGVsaXZlcnlfZGV0YWlsczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MzQzLTM0NAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF9kZWxpdmVyeV9kZXRhaWxzKHNlbGYsIGRlbGl2ZXJ5X2lkOiBBUkM0VUludDY0KSAtPiBEZWxpdmVyeVJlY29yZDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weTozNDYKICAgIC8vIGFzc2VydCBkZWxpdmVyeV9pZCBpbiBzZWxmLmRlbGl2ZXJpZXMsICJEZWxpdmVyeSBub3QgZm91bmQiCiAgICBieXRlYyAxMiAvLyAiZGVsaXZlcmllcyIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIERlbGl2ZXJ5IG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weTozNDcKICAgIC8vIHJldHVybiBzZWxmLmRlbGl2ZXJpZXNbZGVsaXZlcnlfaWRdCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kZWxpdmVyaWVzIGVudHJ5IGV4aXN0cwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFpZGNoYWluX2NvbnRyYWN0cy5jb250cmFjdC5BaWRjaGFpbkNvbnRyYWN0cy5nZXRfbWlsZXN0b25lX2NvdW50KCkgLT4gdWludDY0OgpnZXRfbWlsZXN0b25lX2NvdW50OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weTozNTQKICAgIC8vIHJldHVybiBzZWxmLm1pbGVzdG9uZV9jb3VudGVyLnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAibWlsZXN0b25lX2NvdW50ZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWlsZXN0b25lX2NvdW50ZXIgZXhpc3RzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWlkY2hhaW5fY29udHJhY3RzLmNvbnRyYWN0LkFpZGNoYWluQ29udHJhY3RzLmdldF92b3VjaGVyX2NvdW50KCkgLT4gdWludDY0OgpnZXRfdm91Y2hlcl9jb3VudDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MzU5CiAgICAvLyByZXR1cm4gc2VsZi52b3VjaGVyX2NvdW50ZXIudmFsdWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vICJ2b3VjaGVyX2NvdW50ZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm91Y2hlcl9jb3VudGVyIGV4aXN0cwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFpZGNoYWluX2NvbnRyYWN0cy5jb250cmFjdC5BaWRjaGFpbkNvbnRyYWN0cy5nZXRfZGVsaXZlcnlfY291bnQoKSAtPiB1aW50NjQ6CmdldF9kZWxpdmVyeV9jb3VudDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MzY0CiAgICAvLyByZXR1cm4gc2VsZi5kZWxpdmVyeV9jb3VudGVyLnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAiZGVsaXZlcnlfY291bnRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kZWxpdmVyeV9jb3VudGVyIGV4aXN0cwogICAgcmV0c3ViCg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [2335], "errorMessage": "Amount must be greater than zero"}, {"pc": [1614, 2162], "errorMessage": "Campaign ID cannot be zero"}, {"pc": [1611, 2159], "errorMessage": "Campaign ID out of range"}, {"pc": [1625, 2174, 2410], "errorMessage": "Campaign not found"}, {"pc": [1852], "errorMessage": "Delivery ID cannot be zero"}, {"pc": [1849], "errorMessage": "Delivery ID out of range"}, {"pc": [1864, 2474], "errorMessage": "Delivery not found"}, {"pc": [2245, 2332], "errorMessage": "Milestone ID cannot be zero"}, {"pc": [2242, 2329], "errorMessage": "Milestone ID out of range"}, {"pc": [2257, 2458], "errorMessage": "Milestone not found"}, {"pc": [508, 525, 542, 559, 578, 597, 616, 635, 654, 702, 740, 774, 805, 851, 889, 939, 965, 1012, 1046, 1075, 1109, 1134, 1151, 1179, 1196, 1213, 1246, 1275, 1299], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [2426], "errorMessage": "Organization not found"}, {"pc": [2442], "errorMessage": "Voucher not found"}, {"pc": [1334], "errorMessage": "can only call when creating"}, {"pc": [511, 528, 545, 562, 581, 600, 619, 638, 657, 705, 743, 777, 808, 854, 892, 942, 968, 1015, 1049, 1078, 1112, 1137, 1154, 1182, 1199, 1216, 1249, 1278, 1302], "errorMessage": "can only call when not creating"}, {"pc": [1513, 1593, 1607, 2155], "errorMessage": "check self.campaign_counter exists"}, {"pc": [2412], "errorMessage": "check self.campaigns entry exists"}, {"pc": [1867, 2476], "errorMessage": "check self.deliveries entry exists"}, {"pc": [1753, 1845, 2492], "errorMessage": "check self.delivery_counter exists"}, {"pc": [2178, 2238, 2325, 2481], "errorMessage": "check self.milestone_counter exists"}, {"pc": [2260, 2460], "errorMessage": "check self.milestones entry exists"}, {"pc": [1429, 1599], "errorMessage": "check self.organization_counter exists"}, {"pc": [2428], "errorMessage": "check self.organizations entry exists"}, {"pc": [1630, 1676], "errorMessage": "check self.total_donations exists"}, {"pc": [2274], "errorMessage": "check self.total_milestones_completed exists"}, {"pc": [1499], "errorMessage": "check self.total_organizations exists"}, {"pc": [1990, 2049, 2487], "errorMessage": "check self.voucher_counter exists"}, {"pc": [2444], "errorMessage": "check self.vouchers entry exists"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
-APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": ["UpdateApplication"], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "initialize", "returns": {"type": "string"}, "desc": "Initialize the contract with default values", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "name"}], "name": "hello", "returns": {"type": "string"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "org_name"}, {"type": "string", "name": "wallet_address"}], "name": "register_organization", "returns": {"type": "uint64"}, "desc": "Register a new organization in the system with proper data storage", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_organization_count", "returns": {"type": "uint64"}, "desc": "Get total number of organizations registered", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_contract_stats", "returns": {"type": "string"}, "desc": "Get overall contract statistics", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "org_id"}], "name": "get_organization_details", "returns": {"type": "(uint64,string,string,uint64)", "struct": "OrganizationInfo"}, "desc": "Get detailed information about an organization", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "title"}, {"type": "uint64", "name": "target"}, {"type": "string", "name": "creator"}], "name": "create_campaign", "returns": {"type": "uint64"}, "desc": "Create a new donation campaign with proper data storage", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_campaign_count", "returns": {"type": "uint64"}, "desc": "Get total number of campaigns created", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "campaign_id"}], "name": "create_donation", "returns": {"type": "string"}, "desc": "Create a donation record (for testing without payment)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_total_donations", "returns": {"type": "uint64"}, "desc": "Get total amount of donations across all campaigns", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "amount1"}, {"type": "uint64", "name": "amount2"}], "name": "calculate_total", "returns": {"type": "uint64"}, "desc": "Calculate total of two amounts", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "amount"}, {"type": "string", "name": "donor"}], "name": "validate_donation", "returns": {"type": "string"}, "desc": "Validate donation parameters", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "campaign_id"}, {"type": "uint64", "name": "target_amount"}, {"type": "string", "name": "description"}], "name": "create_milestone", "returns": {"type": "uint64"}, "desc": "Create a new milestone for campaign funding", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "milestone_id"}, {"type": "string", "name": "proof"}], "name": "complete_milestone", "returns": {"type": "string"}, "desc": "Mark milestone as completed with proof", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "milestone_id"}, {"type": "account", "name": "recipient"}, {"type": "uint64", "name": "amount"}], "name": "release_milestone_funds", "returns": {"type": "string"}, "desc": "Release REAL funds for completed milestone via blockchain payment", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_milestone_stats", "returns": {"type": "string"}, "desc": "Get milestone system statistics", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "campaign_id"}], "name": "get_campaign_details", "returns": {"type": "(uint64,string,uint64,uint64,string,uint64)", "struct": "CampaignInfo"}, "desc": "Get detailed information about a campaign", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "milestone_id"}], "name": "get_milestone_details", "returns": {"type": "(uint64,uint64,uint64,string,uint64,uint64)", "struct": "MilestoneInfo"}, "desc": "Get detailed information about a milestone", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_milestone_count", "returns": {"type": "uint64"}, "desc": "Get total number of milestones created", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "recipient"}, {"type": "string", "name": "location"}], "name": "log_delivery", "returns": {"type": "uint64"}, "desc": "Log a delivery event", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "delivery_id"}, {"type": "string", "name": "agent"}], "name": "verify_delivery", "returns": {"type": "string"}, "desc": "Verify a delivery by an authorized agent", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "delivery_id"}], "name": "get_delivery_details", "returns": {"type": "(uint64,string,string,string,uint64)", "struct": "DeliveryRecord"}, "desc": "Get detailed information about a delivery", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_delivery_count", "returns": {"type": "uint64"}, "desc": "Get total number of deliveries logged", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "asset_name"}, {"type": "uint64", "name": "total_supply"}], "name": "create_voucher_asset", "returns": {"type": "uint64"}, "desc": "Create a REAL ASA token on the blockchain for aid distribution", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "asset_id"}, {"type": "string", "name": "recipient"}, {"type": "uint64", "name": "amount"}], "name": "distribute_vouchers", "returns": {"type": "string"}, "desc": "REAL blockchain token transfer to recipient", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "voucher_id"}, {"type": "string", "name": "merchant"}, {"type": "uint64", "name": "amount"}], "name": "redeem_voucher", "returns": {"type": "string"}, "desc": "Redeem voucher tokens at an approved merchant", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_voucher_stats", "returns": {"type": "string"}, "desc": "Get voucher system statistics", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "voucher_id"}], "name": "get_voucher_details", "returns": {"type": "(uint64,uint64,string,uint64,uint64)", "struct": "VoucherInfo"}, "desc": "Get detailed information about a voucher", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_voucher_count", "returns": {"type": "uint64"}, "desc": "Get total number of vouchers created", "events": [], "readonly": true, "recommendations": {}}], "name": "AidchainContracts", "state": {"keys": {"box": {}, "global": {"voucher_counter": {"key": "dm91Y2hlcl9jb3VudGVy", "keyType": "AVMString", "valueType": "AVMUint64"}, "total_vouchers_issued": {"key": "dG90YWxfdm91Y2hlcnNfaXNzdWVk", "keyType": "AVMString", "valueType": "AVMUint64"}, "delivery_counter": {"key": "ZGVsaXZlcnlfY291bnRlcg==", "keyType": "AVMString", "valueType": "AVMUint64"}, "campaign_counter": {"key": "Y2FtcGFpZ25fY291bnRlcg==", "keyType": "AVMString", "valueType": "AVMUint64"}, "milestone_counter": {"key": "bWlsZXN0b25lX2NvdW50ZXI=", "keyType": "AVMString", "valueType": "AVMUint64"}, "total_donations": {"key": "dG90YWxfZG9uYXRpb25z", "keyType": "AVMString", "valueType": "AVMUint64"}, "total_milestones_completed": {"key": "dG90YWxfbWlsZXN0b25lc19jb21wbGV0ZWQ=", "keyType": "AVMString", "valueType": "AVMUint64"}, "organization_counter": {"key": "b3JnYW5pemF0aW9uX2NvdW50ZXI=", "keyType": "AVMString", "valueType": "AVMUint64"}, "total_organizations": {"key": "dG90YWxfb3JnYW5pemF0aW9ucw==", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"vouchers": {"keyType": "uint64", "valueType": "VoucherInfo", "prefix": "dm91Y2hlcnM="}, "deliveries": {"keyType": "uint64", "valueType": "DeliveryRecord", "prefix": "ZGVsaXZlcmllcw=="}, "campaigns": {"keyType": "uint64", "valueType": "CampaignInfo", "prefix": "Y2FtcGFpZ25z"}, "milestones": {"keyType": "uint64", "valueType": "MilestoneInfo", "prefix": "bWlsZXN0b25lcw=="}, "organizations": {"keyType": "uint64", "valueType": "OrganizationInfo", "prefix": "b3Jncw=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 9}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"CampaignInfo": [{"name": "id", "type": "uint64"}, {"name": "title", "type": "string"}, {"name": "target", "type": "uint64"}, {"name": "raised", "type": "uint64"}, {"name": "creator", "type": "string"}, {"name": "active", "type": "uint64"}], "MilestoneInfo": [{"name": "id", "type": "uint64"}, {"name": "campaign_id", "type": "uint64"}, {"name": "target_amount", "type": "uint64"}, {"name": "description", "type": "string"}, {"name": "completed", "type": "uint64"}, {"name": "funds_released", "type": "uint64"}], "DeliveryRecord": [{"name": "id", "type": "uint64"}, {"name": "recipient", "type": "string"}, {"name": "location", "type": "string"}, {"name": "agent", "type": "string"}, {"name": "verified", "type": "uint64"}], "OrganizationInfo": [{"name": "id", "type": "uint64"}, {"name": "name", "type": "string"}, {"name": "wallet_address", "type": "string"}, {"name": "verification_level", "type": "uint64"}], "VoucherInfo": [{"name": "id", "type": "uint64"}, {"name": "asset_id", "type": "uint64"}, {"name": "name", "type": "string"}, {"name": "total_supply", "type": "uint64"}, {"name": "issued", "type": "uint64"}]}, "byteCode": {"approval": "CiADAAEAJhEEFR98dRBjYW1wYWlnbl9jb3VudGVyEW1pbGVzdG9uZV9jb3VudGVyEGRlbGl2ZXJ5X2NvdW50ZXIPdm91Y2hlcl9jb3VudGVyCAAAAAAAAAAAFG9yZ2FuaXphdGlvbl9jb3VudGVyD3RvdGFsX2RvbmF0aW9ucxN0b3RhbF9vcmdhbml6YXRpb25zGnRvdGFsX21pbGVzdG9uZXNfY29tcGxldGVkCWNhbXBhaWducwgAAAAAAAAAAQptaWxlc3RvbmVzCmRlbGl2ZXJpZXMVdG90YWxfdm91Y2hlcnNfaXNzdWVkBG9yZ3MIdm91Y2hlcnMxGEAAIScGImcnCCJnKSJnKiJnJwciZycJImcrImcnBCJnJw4iZzEbQQQJgh0EiXrRpwQCvs4RBBHTrxkEFJJSEgQVaZABBLRPewMET+b9VgQTwQW5BP9RFVMEn9bJeATNuhKXBEFfZB4EcySFZwSE7q5jBMPemlIEBtQUygRfUt9fBL9U7TYE83z57QTInctrBI6n4PoE1bINcAQticahBMhSe78EirahZgQhxKBmBPZK4nQEvw7gLQS9eQmyNhoAjh0DHwMBAuQC0wKkApECcAJfAkMCMgIZAfcB2AG2AZABYAFNAToBKQEMAOoA1wDGAKwAegBUACYAEwACIkMxGRREMRhEiAfOFihMULAjQzEZFEQxGEQ2GgGIB6ooTFCwI0MxGRREMRhEgCIVH3x1ABxWb3VjaGVyIHN0YXRpc3RpY3MgYXZhaWxhYmxlsCNDMRkURDEYRDYaARc2GgJXAgA2GgMXiAbzSRUWVwYCTFAoTFCwI0MxGRREMRhEgCYVH3x1ACBEZWJ1ZyBtb2RlOiB2b3VjaGVycyBkaXN0cmlidXRlZLAjQzEZFEQxGEQ2GgFXAgA2GgIXiAYzKExQsCNDMRkURDEYRIgGHhYoTFCwI0MxGRREMRhENhoBiAX6KExQsCNDMRkURDEYRDYaARc2GgJXAgCIBYFJFRZXBgJMUChMULAjQzEZFEQxGEQ2GgFXAgA2GgJXAgCIBQEWKExQsCNDMRkURDEYRIgE6xYoTFCwI0MxGRREMRhENhoBiATHKExQsCNDMRkURDEYRDYaAYgEpChMULAjQzEZFEQxGESAJBUffHUAHk1pbGVzdG9uZSBzdGF0aXN0aWNzIGF2YWlsYWJsZbAjQzEZFEQxGEQ2GgEXNhoCF8AcNhoDF4gEB0kVFlcGAkxQKExQsCNDMRkURDEYRDYaARc2GgJXAgCIA45JFRZXBgJMUChMULAjQzEZFEQxGEQ2GgEXNhoCFzYaA1cCAIgDFRYoTFCwI0MxGRREMRhENhoBFzYaAlcCAIgCvkkVFlcGAkxQKExQsCNDMRkURDEYRDYaARc2GgIXiAKVFihMULAjQzEZFEQxGESIAn4WKExQsCNDMRkURDEYRDYaAReIAiNJFRZXBgJMUChMULAjQzEZFEQxGESIAgYWKExQsCNDMRkURDEYRDYaAVcCADYaAhc2GgNXAgCIAZIWKExQsCNDMRkURDEYRDYaAYgBbihMULAjQzEZFEQxGESAIxUffHUAHUNvbnRyYWN0IHN0YXRpc3RpY3MgYXZhaWxhYmxlsCNDMRkURDEYRIgBKRYoTFCwI0MxGRREMRhENhoBVwIANhoCVwIAiAC3FihMULAjQzEZFEQxGEQ2GgFXAgCIAJBJFRZXBgJMUChMULAjQzEZFEQxGESIACpJFRZXBgJMUChMULAjQyKBBDEZjgIACwADQvy7MRhEiABNI0MxGBREI0MpImcnBiJnKyJnJwQiZyoiZycHImcnCCJnJw4iZycJImeAIUNvbnRyYWN0IGluaXRpYWxpemVkIHN1Y2Nlc3NmdWxseYkkRDEAMgkSRImKAQGAB0hlbGxvLCCL/1CJigIBIicGZUQjCCcGSwFnSRaL/hUWVwYCi/5Qi/8VFlcGAov/UEsCgAIAFFBLAhWBFAgWVwYCUCcFUE8CUExQJw9PAlBJvEhMvyInCGVEIwgnCExniSInBmVEiYoBAScPi/9QSb1FAUS+RImKAwEiKWVEIwgpSwFnSRaL/RUWVwYCi/1Qi/4Wi/8VFlcGAov/UEsDgAIAJFBLAxWBJAhMTwNQJwVQTBZXBgJQJwtQTwJQTFAnCk8CUEm8SEy/iSIpZUSJigEBIillRIv/D0SL/0SL/xYnCkxQvUUBRDEIIicHZUQIJwdMZ4AeRG9uYXRpb24gcmVjb3JkZWQgc3VjY2Vzc2Z1bGx5iSInB2VEiYoCAYv+i/8IiYoCAYv+QQAagBRWYWxpZCBkb25hdGlvbiBmcm9tIIv/UImAF0ludmFsaWQgZG9uYXRpb24gYW1vdW50iYoDASIpZUSL/Q9Ei/1Ei/0WJwpLAVC9RQFEIiplRCMIKksBZ0kWi/4Wi/8VFlcGAov/UEsCTwVQTwJQgAIAKlAnBVAnBVBMUCcMTwJQSbxITL+JigIBIiplRIv+D0SL/kSL/hYnDExQSb1FAURJvkQnC1waSwG8SL8iJwllRCMIJwlMZ4AgTWlsZXN0b25lIGNvbXBsZXRlZCB3aXRoIHByb29mOiCL/1CJigMBIiplRIv9D0SL/USL/0SxMgCL/7IIi/6yByOyELIBs4AqUmVhbCBibG9ja2NoYWluIHBheW1lbnQgc2VudCBmb3IgbWlsZXN0b25liYoBAScKi/9QSb1FAUS+RImKAQEnDIv/UEm9RQFEvkSJIiplRImKAgEiK2VEIwgrSwFnSRaL/hUWVwYCi/5Qi/8VFlcGAov/UEsCgAIAFlBLAhWBFghJFlcGAk8CTFBLAhVPAggWVwYCUCcFUE8CUExQgAIAAFAnDU8CUEm8SEy/iYoCASIrZUSL/g9Ei/5Ei/4WJw1MUEm9RQFESb5EJwtcDov/FRZXBgKL/1BLAYEMWU8CIk8CWExQSwG8SL+AHERlbGl2ZXJ5IHZlcmlmaWVkIGJ5IGFnZW50OiCL/1CJigEBJw2L/1BJvUUBRL5EiSIrZUSJigIBsTIAMgpHA7IssiuyKrIpIrIkIrIji/+yIoAHVk9VQ0hFUrIli/6yJoEDshCyAbO0PCInBGVEIwgnBEsBZxZMFov+FRZXBgKL/lCL/xZLA0sDUIACACJQTFAnBVBMUCcQTwNQSbxITL+JigMBIicEZUSL/QxAAAWL/UAAFYASSW52YWxpZCB2b3VjaGVyIElEiYv/QAAjgCBBbW91bnQgbXVzdCBiZSBncmVhdGVyIHRoYW4gemVyb4mAFVZvdWNoZXJzIHJlZGVlbWVkIGF0IIv+UImKAQEnEIv/UEm9RQFEvkSJIicEZUSJ", "clear": "CoEBQw=="}, "desc": "\n    Every Aidchain domain in one app. The state, structs and methods are the domain\n    apps' own (see smart_contracts/aidchain_contracts/domains.py), so the two layouts\n    cannot drift apart; only `initialize` spans the domains.\n    ", "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMuYWlkY2hhaW5fY29udHJhY3RzLmNvbnRyYWN0LkFpZGNoYWluQ29udHJhY3RzLl9fYWxnb3B5X2VudHJ5cG9pbnRfd2l0aF9pbml0KCkgLT4gdWludDY0OgptYWluOgogICAgaW50Y2Jsb2NrIDAgMSBUTVBMX1VQREFUQUJMRQogICAgYnl0ZWNibG9jayAweDE1MWY3Yzc1ICJjYW1wYWlnbl9jb3VudGVyIiAibWlsZXN0b25lX2NvdW50ZXIiICJkZWxpdmVyeV9jb3VudGVyIiAidm91Y2hlcl9jb3VudGVyIiAweDAwMDAwMDAwMDAwMDAwMDAgIm9yZ2FuaXphdGlvbl9jb3VudGVyIiAidG90YWxfZG9uYXRpb25zIiAidG90YWxfb3JnYW5pemF0aW9ucyIgInRvdGFsX21pbGVzdG9uZXNfY29tcGxldGVkIiAiY2FtcGFpZ25zIiAweDAwMDAwMDAwMDAwMDAwMDEgIm1pbGVzdG9uZXMiICJkZWxpdmVyaWVzIiAidG90YWxfdm91Y2hlcnNfaXNzdWVkIiAib3JncyIgInZvdWNoZXJzIgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0CiAgICAvLyBzZWxmLm9yZ2FuaXphdGlvbl9jb3VudGVyID0gR2xvYmFsU3RhdGUoVUludDY0KDApKQogICAgYnl0ZWMgNiAvLyAib3JnYW5pemF0aW9uX2NvdW50ZXIiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9yZWdpc3RyeS9jb250cmFjdC5weToxNQogICAgLy8gc2VsZi50b3RhbF9vcmdhbml6YXRpb25zID0gR2xvYmFsU3RhdGUoVUludDY0KDApKQogICAgYnl0ZWMgOCAvLyAidG90YWxfb3JnYW5pemF0aW9ucyIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToyNAogICAgLy8gc2VsZi5jYW1wYWlnbl9jb3VudGVyID0gR2xvYmFsU3RhdGUoVUludDY0KDApKQogICAgYnl0ZWNfMSAvLyAiY2FtcGFpZ25fY291bnRlciIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToyNQogICAgLy8gc2VsZi5taWxlc3RvbmVfY291bnRlciA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSkKICAgIGJ5dGVjXzIgLy8gIm1pbGVzdG9uZV9jb3VudGVyIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjI2CiAgICAvLyBzZWxmLnRvdGFsX2RvbmF0aW9ucyA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSkKICAgIGJ5dGVjIDcgLy8gInRvdGFsX2RvbmF0aW9ucyIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToyNwogICAgLy8gc2VsZi50b3RhbF9taWxlc3RvbmVzX2NvbXBsZXRlZCA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSkKICAgIGJ5dGVjIDkgLy8gInRvdGFsX21pbGVzdG9uZXNfY29tcGxldGVkIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fZGVsaXZlcmllcy9jb250cmFjdC5weToxNQogICAgLy8gc2VsZi5kZWxpdmVyeV9jb3VudGVyID0gR2xvYmFsU3RhdGUoVUludDY0KDApKQogICAgYnl0ZWNfMyAvLyAiZGVsaXZlcnlfY291bnRlciIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3ZvdWNoZXJzL2NvbnRyYWN0LnB5OjE1CiAgICAvLyBzZWxmLnZvdWNoZXJfY291bnRlciA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSkKICAgIGJ5dGVjIDQgLy8gInZvdWNoZXJfY291bnRlciIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3ZvdWNoZXJzL2NvbnRyYWN0LnB5OjE2CiAgICAvLyBzZWxmLnRvdGFsX3ZvdWNoZXJzX2lzc3VlZCA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSkKICAgIGJ5dGVjIDE0IC8vICJ0b3RhbF92b3VjaGVyc19pc3N1ZWQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKCm1haW5fYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToxMAogICAgLy8gY2xhc3MgQWlkY2hhaW5Db250cmFjdHMoQWlkY2hhaW5SZWdpc3RyeSwgQWlkY2hhaW5DYW1wYWlnbnMsIEFpZGNoYWluRGVsaXZlcmllcywgQWlkY2hhaW5Wb3VjaGVycyk6CiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogbWFpbl9iYXJlX3JvdXRpbmdAMzQKICAgIHB1c2hieXRlc3MgMHg4OTdhZDFhNyAweDAyYmVjZTExIDB4MTFkM2FmMTkgMHgxNDkyNTIxMiAweDE1Njk5MDAxIDB4YjQ0ZjdiMDMgMHg0ZmU2ZmQ1NiAweDEzYzEwNWI5IDB4ZmY1MTE1NTMgMHg5ZmQ2Yzk3OCAweGNkYmExMjk3IDB4NDE1ZjY0MWUgMHg3MzI0ODU2NyAweDg0ZWVhZTYzIDB4YzNkZTlhNTIgMHgwNmQ0MTRjYSAweDVmNTJkZjVmIDB4YmY1NGVkMzYgMHhmMzdjZjllZCAweGM4OWRjYjZiIDB4OGVhN2UwZmEgMHhkNWIyMGQ3MCAweDJkODljNmExIDB4Yzg1MjdiYmYgMHg4YWI2YTE2NiAweDIxYzRhMDY2IDB4ZjY0YWUyNzQgMHhiZjBlZTAyZCAweGJkNzkwOWIyIC8vIG1ldGhvZCAiaW5pdGlhbGl6ZSgpc3RyaW5nIiwgbWV0aG9kICJoZWxsbyhzdHJpbmcpc3RyaW5nIiwgbWV0aG9kICJyZWdpc3Rlcl9vcmdhbml6YXRpb24oc3RyaW5nLHN0cmluZyl1aW50NjQiLCBtZXRob2QgImdldF9vcmdhbml6YXRpb25fY291bnQoKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X2NvbnRyYWN0X3N0YXRzKClzdHJpbmciLCBtZXRob2QgImdldF9vcmdhbml6YXRpb25fZGV0YWlscyh1aW50NjQpKHVpbnQ2NCxzdHJpbmcsc3RyaW5nLHVpbnQ2NCkiLCBtZXRob2QgImNyZWF0ZV9jYW1wYWlnbihzdHJpbmcsdWludDY0LHN0cmluZyl1aW50NjQiLCBtZXRob2QgImdldF9jYW1wYWlnbl9jb3VudCgpdWludDY0IiwgbWV0aG9kICJjcmVhdGVfZG9uYXRpb24odWludDY0KXN0cmluZyIsIG1ldGhvZCAiZ2V0X3RvdGFsX2RvbmF0aW9ucygpdWludDY0IiwgbWV0aG9kICJjYWxjdWxhdGVfdG90YWwodWludDY0LHVpbnQ2NCl1aW50NjQiLCBtZXRob2QgInZhbGlkYXRlX2RvbmF0aW9uKHVpbnQ2NCxzdHJpbmcpc3RyaW5nIiwgbWV0aG9kICJjcmVhdGVfbWlsZXN0b25lKHVpbnQ2NCx1aW50NjQsc3RyaW5nKXVpbnQ2NCIsIG1ldGhvZCAiY29tcGxldGVfbWlsZXN0b25lKHVpbnQ2NCxzdHJpbmcpc3RyaW5nIiwgbWV0aG9kICJyZWxlYXNlX21pbGVzdG9uZV9mdW5kcyh1aW50NjQsYWNjb3VudCx1aW50NjQpc3RyaW5nIiwgbWV0aG9kICJnZXRfbWlsZXN0b25lX3N0YXRzKClzdHJpbmciLCBtZXRob2QgImdldF9jYW1wYWlnbl9kZXRhaWxzKHVpbnQ2NCkodWludDY0LHN0cmluZyx1aW50NjQsdWludDY0LHN0cmluZyx1aW50NjQpIiwgbWV0aG9kICJnZXRfbWlsZXN0b25lX2RldGFpbHModWludDY0KSh1aW50NjQsdWludDY0LHVpbnQ2NCxzdHJpbmcsdWludDY0LHVpbnQ2NCkiLCBtZXRob2QgImdldF9taWxlc3RvbmVfY291bnQoKXVpbnQ2NCIsIG1ldGhvZCAibG9nX2RlbGl2ZXJ5KHN0cmluZyxzdHJpbmcpdWludDY0IiwgbWV0aG9kICJ2ZXJpZnlfZGVsaXZlcnkodWludDY0LHN0cmluZylzdHJpbmciLCBtZXRob2QgImdldF9kZWxpdmVyeV9kZXRhaWxzKHVpbnQ2NCkodWludDY0LHN0cmluZyxzdHJpbmcsc3RyaW5nLHVpbnQ2NCkiLCBtZXRob2QgImdldF9kZWxpdmVyeV9jb3VudCgpdWludDY0IiwgbWV0aG9kICJjcmVhdGVfdm91Y2hlcl9hc3NldChzdHJpbmcsdWludDY0KXVpbnQ2NCIsIG1ldGhvZCAiZGlzdHJpYnV0ZV92b3VjaGVycyh1aW50NjQsc3RyaW5nLHVpbnQ2NClzdHJpbmciLCBtZXRob2QgInJlZGVlbV92b3VjaGVyKHVpbnQ2NCxzdHJpbmcsdWludDY0KXN0cmluZyIsIG1ldGhvZCAiZ2V0X3ZvdWNoZXJfc3RhdHMoKXN0cmluZyIsIG1ldGhvZCAiZ2V0X3ZvdWNoZXJfZGV0YWlscyh1aW50NjQpKHVpbnQ2NCx1aW50NjQsc3RyaW5nLHVpbnQ2NCx1aW50NjQpIiwgbWV0aG9kICJnZXRfdm91Y2hlcl9jb3VudCgpdWludDY0IgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl9pbml0aWFsaXplX3JvdXRlQDUgbWFpbl9oZWxsb19yb3V0ZUA2IG1haW5fcmVnaXN0ZXJfb3JnYW5pemF0aW9uX3JvdXRlQDcgbWFpbl9nZXRfb3JnYW5pemF0aW9uX2NvdW50X3JvdXRlQDggbWFpbl9nZXRfY29udHJhY3Rfc3RhdHNfcm91dGVAOSBtYWluX2dldF9vcmdhbml6YXRpb25fZGV0YWlsc19yb3V0ZUAxMCBtYWluX2NyZWF0ZV9jYW1wYWlnbl9yb3V0ZUAxMSBtYWluX2dldF9jYW1wYWlnbl9jb3VudF9yb3V0ZUAxMiBtYWluX2NyZWF0ZV9kb25hdGlvbl9yb3V0ZUAxMyBtYWluX2dldF90b3RhbF9kb25hdGlvbnNfcm91dGVAMTQgbWFpbl9jYWxjdWxhdGVfdG90YWxfcm91dGVAMTUgbWFpbl92YWxpZGF0ZV9kb25hdGlvbl9yb3V0ZUAxNiBtYWluX2NyZWF0ZV9taWxlc3RvbmVfcm91dGVAMTcgbWFpbl9jb21wbGV0ZV9taWxlc3RvbmVfcm91dGVAMTggbWFpbl9yZWxlYXNlX21pbGVzdG9uZV9mdW5kc19yb3V0ZUAxOSBtYWluX2dldF9taWxlc3RvbmVfc3RhdHNfcm91dGVAMjAgbWFpbl9nZXRfY2FtcGFpZ25fZGV0YWlsc19yb3V0ZUAyMSBtYWluX2dldF9taWxlc3RvbmVfZGV0YWlsc19yb3V0ZUAyMiBtYWluX2dldF9taWxlc3RvbmVfY291bnRfcm91dGVAMjMgbWFpbl9sb2dfZGVsaXZlcnlfcm91dGVAMjQgbWFpbl92ZXJpZnlfZGVsaXZlcnlfcm91dGVAMjUgbWFpbl9nZXRfZGVsaXZlcnlfZGV0YWlsc19yb3V0ZUAyNiBtYWluX2dldF9kZWxpdmVyeV9jb3VudF9yb3V0ZUAyNyBtYWluX2NyZWF0ZV92b3VjaGVyX2Fzc2V0X3JvdXRlQDI4IG1haW5fZGlzdHJpYnV0ZV92b3VjaGVyc19yb3V0ZUAyOSBtYWluX3JlZGVlbV92b3VjaGVyX3JvdXRlQDMwIG1haW5fZ2V0X3ZvdWNoZXJfc3RhdHNfcm91dGVAMzEgbWFpbl9nZXRfdm91Y2hlcl9kZXRhaWxzX3JvdXRlQDMyIG1haW5fZ2V0X3ZvdWNoZXJfY291bnRfcm91dGVAMzMKCm1haW5fYWZ0ZXJfaWZfZWxzZUAzNzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MTAKICAgIC8vIGNsYXNzIEFpZGNoYWluQ29udHJhY3RzKEFpZGNoYWluUmVnaXN0cnksIEFpZGNoYWluQ2FtcGFpZ25zLCBBaWRjaGFpbkRlbGl2ZXJpZXMsIEFpZGNoYWluVm91Y2hlcnMpOgogICAgaW50Y18wIC8vIDAKICAgIHJldHVybgoKbWFpbl9nZXRfdm91Y2hlcl9jb3VudF9yb3V0ZUAzMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl92b3VjaGVycy9jb250cmFjdC5weTo5OAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGdldF92b3VjaGVyX2NvdW50CiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF92b3VjaGVyX2RldGFpbHNfcm91dGVAMzI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fdm91Y2hlcnMvY29udHJhY3QucHk6OTIKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToxMAogICAgLy8gY2xhc3MgQWlkY2hhaW5Db250cmFjdHMoQWlkY2hhaW5SZWdpc3RyeSwgQWlkY2hhaW5DYW1wYWlnbnMsIEFpZGNoYWluRGVsaXZlcmllcywgQWlkY2hhaW5Wb3VjaGVycyk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fdm91Y2hlcnMvY29udHJhY3QucHk6OTIKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X3ZvdWNoZXJfZGV0YWlscwogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfdm91Y2hlcl9zdGF0c19yb3V0ZUAzMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl92b3VjaGVycy9jb250cmFjdC5weTo4NwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIHB1c2hieXRlcyAweDE1MWY3Yzc1MDAxYzU2NmY3NTYzNjg2NTcyMjA3Mzc0NjE3NDY5NzM3NDY5NjM3MzIwNjE3NjYxNjk2YzYxNjI2YzY1CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fcmVkZWVtX3ZvdWNoZXJfcm91dGVAMzA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fdm91Y2hlcnMvY29udHJhY3QucHk6NzYKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjEwCiAgICAvLyBjbGFzcyBBaWRjaGFpbkNvbnRyYWN0cyhBaWRjaGFpblJlZ2lzdHJ5LCBBaWRjaGFpbkNhbXBhaWducywgQWlkY2hhaW5EZWxpdmVyaWVzLCBBaWRjaGFpblZvdWNoZXJzKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fdm91Y2hlcnMvY29udHJhY3QucHk6NzYKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiByZWRlZW1fdm91Y2hlcgogICAgZHVwCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZGlzdHJpYnV0ZV92b3VjaGVyc19yb3V0ZUAyOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl92b3VjaGVycy9jb250cmFjdC5weTo3MQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIHB1c2hieXRlcyAweDE1MWY3Yzc1MDAyMDQ0NjU2Mjc1NjcyMDZkNmY2NDY1M2EyMDc2NmY3NTYzNjg2NTcyNzMyMDY0Njk3Mzc0NzI2OTYyNzU3NDY1NjQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9jcmVhdGVfdm91Y2hlcl9hc3NldF9yb3V0ZUAyODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl92b3VjaGVycy9jb250cmFjdC5weTozOQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MTAKICAgIC8vIGNsYXNzIEFpZGNoYWluQ29udHJhY3RzKEFpZGNoYWluUmVnaXN0cnksIEFpZGNoYWluQ2FtcGFpZ25zLCBBaWRjaGFpbkRlbGl2ZXJpZXMsIEFpZGNoYWluVm91Y2hlcnMpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl92b3VjaGVycy9jb250cmFjdC5weTozOQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGNyZWF0ZV92b3VjaGVyX2Fzc2V0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9kZWxpdmVyeV9jb3VudF9yb3V0ZUAyNzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9kZWxpdmVyaWVzL2NvbnRyYWN0LnB5OjczCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgZ2V0X2RlbGl2ZXJ5X2NvdW50CiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9kZWxpdmVyeV9kZXRhaWxzX3JvdXRlQDI2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2RlbGl2ZXJpZXMvY29udHJhY3QucHk6NjcKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToxMAogICAgLy8gY2xhc3MgQWlkY2hhaW5Db250cmFjdHMoQWlkY2hhaW5SZWdpc3RyeSwgQWlkY2hhaW5DYW1wYWlnbnMsIEFpZGNoYWluRGVsaXZlcmllcywgQWlkY2hhaW5Wb3VjaGVycyk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fZGVsaXZlcmllcy9jb250cmFjdC5weTo2NwogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfZGVsaXZlcnlfZGV0YWlscwogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl92ZXJpZnlfZGVsaXZlcnlfcm91dGVAMjU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fZGVsaXZlcmllcy9jb250cmFjdC5weTo1MwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MTAKICAgIC8vIGNsYXNzIEFpZGNoYWluQ29udHJhY3RzKEFpZGNoYWluUmVnaXN0cnksIEFpZGNoYWluQ2FtcGFpZ25zLCBBaWRjaGFpbkRlbGl2ZXJpZXMsIEFpZGNoYWluVm91Y2hlcnMpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZXh0cmFjdCAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9kZWxpdmVyaWVzL2NvbnRyYWN0LnB5OjUzCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgdmVyaWZ5X2RlbGl2ZXJ5CiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9sb2dfZGVsaXZlcnlfcm91dGVAMjQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fZGVsaXZlcmllcy9jb250cmFjdC5weTozNwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MTAKICAgIC8vIGNsYXNzIEFpZGNoYWluQ29udHJhY3RzKEFpZGNoYWluUmVnaXN0cnksIEFpZGNoYWluQ2FtcGFpZ25zLCBBaWRjaGFpbkRlbGl2ZXJpZXMsIEFpZGNoYWluVm91Y2hlcnMpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fZGVsaXZlcmllcy9jb250cmFjdC5weTozNwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGxvZ19kZWxpdmVyeQogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfbWlsZXN0b25lX2NvdW50X3JvdXRlQDIzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxNzQKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBnZXRfbWlsZXN0b25lX2NvdW50CiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9taWxlc3RvbmVfZGV0YWlsc19yb3V0ZUAyMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MTY4CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MTAKICAgIC8vIGNsYXNzIEFpZGNoYWluQ29udHJhY3RzKEFpZGNoYWluUmVnaXN0cnksIEFpZGNoYWluQ2FtcGFpZ25zLCBBaWRjaGFpbkRlbGl2ZXJpZXMsIEFpZGNoYWluVm91Y2hlcnMpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxNjgKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X21pbGVzdG9uZV9kZXRhaWxzCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9jYW1wYWlnbl9kZXRhaWxzX3JvdXRlQDIxOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxNjIKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToxMAogICAgLy8gY2xhc3MgQWlkY2hhaW5Db250cmFjdHMoQWlkY2hhaW5SZWdpc3RyeSwgQWlkY2hhaW5DYW1wYWlnbnMsIEFpZGNoYWluRGVsaXZlcmllcywgQWlkY2hhaW5Wb3VjaGVycyk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjE2MgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfY2FtcGFpZ25fZGV0YWlscwogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfbWlsZXN0b25lX3N0YXRzX3JvdXRlQDIwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxNTcKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBwdXNoYnl0ZXMgMHgxNTFmN2M3NTAwMWU0ZDY5NmM2NTczNzQ2ZjZlNjUyMDczNzQ2MTc0Njk3Mzc0Njk2MzczMjA2MTc2NjE2OTZjNjE2MjZjNjUKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9yZWxlYXNlX21pbGVzdG9uZV9mdW5kc19yb3V0ZUAxOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MTQyCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToxMAogICAgLy8gY2xhc3MgQWlkY2hhaW5Db250cmFjdHMoQWlkY2hhaW5SZWdpc3RyeSwgQWlkY2hhaW5DYW1wYWlnbnMsIEFpZGNoYWluRGVsaXZlcmllcywgQWlkY2hhaW5Wb3VjaGVycyk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICB0eG5hcyBBY2NvdW50cwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxNDIKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiByZWxlYXNlX21pbGVzdG9uZV9mdW5kcwogICAgZHVwCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fY29tcGxldGVfbWlsZXN0b25lX3JvdXRlQDE4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxMjgKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjEwCiAgICAvLyBjbGFzcyBBaWRjaGFpbkNvbnRyYWN0cyhBaWRjaGFpblJlZ2lzdHJ5LCBBaWRjaGFpbkNhbXBhaWducywgQWlkY2hhaW5EZWxpdmVyaWVzLCBBaWRjaGFpblZvdWNoZXJzKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjEyOAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGNvbXBsZXRlX21pbGVzdG9uZQogICAgZHVwCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fY3JlYXRlX21pbGVzdG9uZV9yb3V0ZUAxNzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MTA3CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToxMAogICAgLy8gY2xhc3MgQWlkY2hhaW5Db250cmFjdHMoQWlkY2hhaW5SZWdpc3RyeSwgQWlkY2hhaW5DYW1wYWlnbnMsIEFpZGNoYWluRGVsaXZlcmllcywgQWlkY2hhaW5Wb3VjaGVycyk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxMDcKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBjcmVhdGVfbWlsZXN0b25lCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3ZhbGlkYXRlX2RvbmF0aW9uX3JvdXRlQDE2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weTo5OQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MTAKICAgIC8vIGNsYXNzIEFpZGNoYWluQ29udHJhY3RzKEFpZGNoYWluUmVnaXN0cnksIEFpZGNoYWluQ2FtcGFpZ25zLCBBaWRjaGFpbkRlbGl2ZXJpZXMsIEFpZGNoYWluVm91Y2hlcnMpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZXh0cmFjdCAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6OTkKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiB2YWxpZGF0ZV9kb25hdGlvbgogICAgZHVwCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fY2FsY3VsYXRlX3RvdGFsX3JvdXRlQDE1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weTo5NAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MTAKICAgIC8vIGNsYXNzIEFpZGNoYWluQ29udHJhY3RzKEFpZGNoYWluUmVnaXN0cnksIEFpZGNoYWluQ2FtcGFpZ25zLCBBaWRjaGFpbkRlbGl2ZXJpZXMsIEFpZGNoYWluVm91Y2hlcnMpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weTo5NAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGNhbGN1bGF0ZV90b3RhbAogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfdG90YWxfZG9uYXRpb25zX3JvdXRlQDE0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weTo4OQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgZ2V0X3RvdGFsX2RvbmF0aW9ucwogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9jcmVhdGVfZG9uYXRpb25fcm91dGVAMTM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5Ojc2CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToxMAogICAgLy8gY2xhc3MgQWlkY2hhaW5Db250cmFjdHMoQWlkY2hhaW5SZWdpc3RyeSwgQWlkY2hhaW5DYW1wYWlnbnMsIEFpZGNoYWluRGVsaXZlcmllcywgQWlkY2hhaW5Wb3VjaGVycyk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5Ojc2CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgY3JlYXRlX2RvbmF0aW9uCiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfY2FtcGFpZ25fY291bnRfcm91dGVAMTI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjcxCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBnZXRfY2FtcGFpZ25fY291bnQKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fY3JlYXRlX2NhbXBhaWduX3JvdXRlQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weTo1NAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MTAKICAgIC8vIGNsYXNzIEFpZGNoYWluQ29udHJhY3RzKEFpZGNoYWluUmVnaXN0cnksIEFpZGNoYWluQ2FtcGFpZ25zLCBBaWRjaGFpbkRlbGl2ZXJpZXMsIEFpZGNoYWluVm91Y2hlcnMpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjU0CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgY3JlYXRlX2NhbXBhaWduCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9vcmdhbml6YXRpb25fZGV0YWlsc19yb3V0ZUAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9yZWdpc3RyeS9jb250cmFjdC5weTo2NAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjEwCiAgICAvLyBjbGFzcyBBaWRjaGFpbkNvbnRyYWN0cyhBaWRjaGFpblJlZ2lzdHJ5LCBBaWRjaGFpbkNhbXBhaWducywgQWlkY2hhaW5EZWxpdmVyaWVzLCBBaWRjaGFpblZvdWNoZXJzKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9yZWdpc3RyeS9jb250cmFjdC5weTo2NAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfb3JnYW5pemF0aW9uX2RldGFpbHMKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X2NvbnRyYWN0X3N0YXRzX3JvdXRlQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fcmVnaXN0cnkvY29udHJhY3QucHk6NTkKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBwdXNoYnl0ZXMgMHgxNTFmN2M3NTAwMWQ0MzZmNmU3NDcyNjE2Mzc0MjA3Mzc0NjE3NDY5NzM3NDY5NjM3MzIwNjE3NjYxNjk2YzYxNjI2YzY1CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X29yZ2FuaXphdGlvbl9jb3VudF9yb3V0ZUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU0CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBnZXRfb3JnYW5pemF0aW9uX2NvdW50CiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3JlZ2lzdGVyX29yZ2FuaXphdGlvbl9yb3V0ZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM4CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToxMAogICAgLy8gY2xhc3MgQWlkY2hhaW5Db250cmFjdHMoQWlkY2hhaW5SZWdpc3RyeSwgQWlkY2hhaW5DYW1wYWlnbnMsIEFpZGNoYWluRGVsaXZlcmllcywgQWlkY2hhaW5Wb3VjaGVycyk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZXh0cmFjdCAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9yZWdpc3RyeS9jb250cmFjdC5weTozOAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIHJlZ2lzdGVyX29yZ2FuaXphdGlvbgogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9oZWxsb19yb3V0ZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI3CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weToxMAogICAgLy8gY2xhc3MgQWlkY2hhaW5Db250cmFjdHMoQWlkY2hhaW5SZWdpc3RyeSwgQWlkY2hhaW5DYW1wYWlnbnMsIEFpZGNoYWluRGVsaXZlcmllcywgQWlkY2hhaW5Wb3VjaGVycyk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI3CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgaGVsbG8KICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2luaXRpYWxpemVfcm91dGVANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MjMKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGluaXRpYWxpemUKICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2JhcmVfcm91dGluZ0AzNDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MTAKICAgIC8vIGNsYXNzIEFpZGNoYWluQ29udHJhY3RzKEFpZGNoYWluUmVnaXN0cnksIEFpZGNoYWluQ2FtcGFpZ25zLCBBaWRjaGFpbkRlbGl2ZXJpZXMsIEFpZGNoYWluVm91Y2hlcnMpOgogICAgaW50Y18wIC8vIDAKICAgIHB1c2hpbnQgNCAvLyA0CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBtYXRjaCBtYWluX19fYWxnb3B5X2RlZmF1bHRfY3JlYXRlQDM1IG1haW5fdXBkYXRlQDM2CiAgICBiIG1haW5fYWZ0ZXJfaWZfZWxzZUAzNwoKbWFpbl91cGRhdGVAMzY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fcmVnaXN0cnkvY29udHJhY3QucHk6MTgKICAgIC8vIEBiYXJlbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJVcGRhdGVBcHBsaWNhdGlvbiJdKQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIHVwZGF0ZQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9fX2FsZ29weV9kZWZhdWx0X2NyZWF0ZUAzNToKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAhCiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIGNyZWF0aW5nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFpZGNoYWluX2NvbnRyYWN0cy5jb250cmFjdC5BaWRjaGFpbkNvbnRyYWN0cy5pbml0aWFsaXplKCkgLT4gYnl0ZXM6CmluaXRpYWxpemU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjI2CiAgICAvLyBzZWxmLmNhbXBhaWduX2NvdW50ZXIudmFsdWUgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzEgLy8gImNhbXBhaWduX2NvdW50ZXIiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MjcKICAgIC8vIHNlbGYub3JnYW5pemF0aW9uX2NvdW50ZXIudmFsdWUgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDYgLy8gIm9yZ2FuaXphdGlvbl9jb3VudGVyIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjI4CiAgICAvLyBzZWxmLmRlbGl2ZXJ5X2NvdW50ZXIudmFsdWUgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzMgLy8gImRlbGl2ZXJ5X2NvdW50ZXIiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MjkKICAgIC8vIHNlbGYudm91Y2hlcl9jb3VudGVyLnZhbHVlID0gVUludDY0KDApCiAgICBieXRlYyA0IC8vICJ2b3VjaGVyX2NvdW50ZXIiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MzAKICAgIC8vIHNlbGYubWlsZXN0b25lX2NvdW50ZXIudmFsdWUgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzIgLy8gIm1pbGVzdG9uZV9jb3VudGVyIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjMxCiAgICAvLyBzZWxmLnRvdGFsX2RvbmF0aW9ucy52YWx1ZSA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgNyAvLyAidG90YWxfZG9uYXRpb25zIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjMyCiAgICAvLyBzZWxmLnRvdGFsX29yZ2FuaXphdGlvbnMudmFsdWUgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDggLy8gInRvdGFsX29yZ2FuaXphdGlvbnMiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jb250cmFjdHMvY29udHJhY3QucHk6MzMKICAgIC8vIHNlbGYudG90YWxfdm91Y2hlcnNfaXNzdWVkLnZhbHVlID0gVUludDY0KDApCiAgICBieXRlYyAxNCAvLyAidG90YWxfdm91Y2hlcnNfaXNzdWVkIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY29udHJhY3RzL2NvbnRyYWN0LnB5OjM0CiAgICAvLyBzZWxmLnRvdGFsX21pbGVzdG9uZXNfY29tcGxldGVkLnZhbHVlID0gVUludDY0KDApCiAgICBieXRlYyA5IC8vICJ0b3RhbF9taWxlc3RvbmVzX2NvbXBsZXRlZCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NvbnRyYWN0cy9jb250cmFjdC5weTozNQogICAgLy8gcmV0dXJuIFN0cmluZygiQ29udHJhY3QgaW5pdGlhbGl6ZWQgc3VjY2Vzc2Z1bGx5IikKICAgIHB1c2hieXRlcyAiQ29udHJhY3QgaW5pdGlhbGl6ZWQgc3VjY2Vzc2Z1bGx5IgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFpZGNoYWluX3JlZ2lzdHJ5LmNvbnRyYWN0LkFpZGNoYWluUmVnaXN0cnkudXBkYXRlKCkgLT4gdm9pZDoKdXBkYXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI0CiAgICAvLyBhc3NlcnQgVGVtcGxhdGVWYXJbYm9vbF0oIlVQREFUQUJMRSIpLCAiQXBwIGlzIG5vdCB1cGRhdGFibGUiCiAgICBpbnRjXzIgLy8gVE1QTF9VUERBVEFCTEUKICAgIGFzc2VydCAvLyBBcHAgaXMgbm90IHVwZGF0YWJsZQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI1CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLCAiT25seSBjcmVhdG9yIGNhbiB1cGRhdGUiCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gT25seSBjcmVhdG9yIGNhbiB1cGRhdGUKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5haWRjaGFpbl9yZWdpc3RyeS5jb250cmFjdC5BaWRjaGFpblJlZ2lzdHJ5LmhlbGxvKG5hbWU6IGJ5dGVzKSAtPiBieXRlczoKaGVsbG86CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fcmVnaXN0cnkvY29udHJhY3QucHk6MjctMjgKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGhlbGxvKHNlbGYsIG5hbWU6IFN0cmluZykgLT4gU3RyaW5nOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fcmVnaXN0cnkvY29udHJhY3QucHk6MjkKICAgIC8vIHJldHVybiAiSGVsbG8sICIgKyBuYW1lCiAgICBwdXNoYnl0ZXMgIkhlbGxvLCAiCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFpZGNoYWluX3JlZ2lzdHJ5LmNvbnRyYWN0LkFpZGNoYWluUmVnaXN0cnkucmVnaXN0ZXJfb3JnYW5pemF0aW9uKG9yZ19uYW1lOiBieXRlcywgd2FsbGV0X2FkZHJlc3M6IGJ5dGVzKSAtPiB1aW50NjQ6CnJlZ2lzdGVyX29yZ2FuaXphdGlvbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9yZWdpc3RyeS9jb250cmFjdC5weTozOC0zOQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgcmVnaXN0ZXJfb3JnYW5pemF0aW9uKHNlbGYsIG9yZ19uYW1lOiBTdHJpbmcsIHdhbGxldF9hZGRyZXNzOiBTdHJpbmcpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQxCiAgICAvLyBzZWxmLm9yZ2FuaXphdGlvbl9jb3VudGVyLnZhbHVlICs9IFVJbnQ2NCgxKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDYgLy8gIm9yZ2FuaXphdGlvbl9jb3VudGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm9yZ2FuaXphdGlvbl9jb3VudGVyIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjIDYgLy8gIm9yZ2FuaXphdGlvbl9jb3VudGVyIgogICAgZGlnIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fcmVnaXN0cnkvY29udHJhY3QucHk6NDUKICAgIC8vIGlkPUFSQzRVSW50NjQob3JnX2lkKSwKICAgIGR1cAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ2CiAgICAvLyBuYW1lPUFSQzRTdHJpbmcob3JnX25hbWUpLAogICAgZnJhbWVfZGlnIC0yCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ3CiAgICAvLyB3YWxsZXRfYWRkcmVzcz1BUkM0U3RyaW5nKHdhbGxldF9hZGRyZXNzKSwKICAgIGZyYW1lX2RpZyAtMQogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9yZWdpc3RyeS9jb250cmFjdC5weTo0NC00OQogICAgLy8gc2VsZi5vcmdhbml6YXRpb25zW0FSQzRVSW50NjQob3JnX2lkKV0gPSBPcmdhbml6YXRpb25JbmZvKAogICAgLy8gICAgIGlkPUFSQzRVSW50NjQob3JnX2lkKSwKICAgIC8vICAgICBuYW1lPUFSQzRTdHJpbmcob3JnX25hbWUpLAogICAgLy8gICAgIHdhbGxldF9hZGRyZXNzPUFSQzRTdHJpbmcod2FsbGV0X2FkZHJlc3MpLAogICAgLy8gICAgIHZlcmlmaWNhdGlvbl9sZXZlbD1BUkM0VUludDY0KDApICAjIDAgPSB1bnZlcmlmaWVkIGluaXRpYWxseQogICAgLy8gKQogICAgZGlnIDIKICAgIHB1c2hieXRlcyAweDAwMTQKICAgIGNvbmNhdAogICAgZGlnIDIKICAgIGxlbgogICAgcHVzaGludCAyMCAvLyAyMAogICAgKwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ4CiAgICAvLyB2ZXJpZmljYXRpb25fbGV2ZWw9QVJDNFVJbnQ2NCgwKSAgIyAwID0gdW52ZXJpZmllZCBpbml0aWFsbHkKICAgIGJ5dGVjIDUgLy8gMHgwMDAwMDAwMDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fcmVnaXN0cnkvY29udHJhY3QucHk6NDQtNDkKICAgIC8vIHNlbGYub3JnYW5pemF0aW9uc1tBUkM0VUludDY0KG9yZ19pZCldID0gT3JnYW5pemF0aW9uSW5mbygKICAgIC8vICAgICBpZD1BUkM0VUludDY0KG9yZ19pZCksCiAgICAvLyAgICAgbmFtZT1BUkM0U3RyaW5nKG9yZ19uYW1lKSwKICAgIC8vICAgICB3YWxsZXRfYWRkcmVzcz1BUkM0U3RyaW5nKHdhbGxldF9hZGRyZXNzKSwKICAgIC8vICAgICB2ZXJpZmljYXRpb25fbGV2ZWw9QVJDNFVJbnQ2NCgwKSAgIyAwID0gdW52ZXJpZmllZCBpbml0aWFsbHkKICAgIC8vICkKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ0CiAgICAvLyBzZWxmLm9yZ2FuaXphdGlvbnNbQVJDNFVJbnQ2NChvcmdfaWQpXSA9IE9yZ2FuaXphdGlvbkluZm8oCiAgICBieXRlYyAxNSAvLyAib3JncyIKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fcmVnaXN0cnkvY29udHJhY3QucHk6NDQtNDkKICAgIC8vIHNlbGYub3JnYW5pemF0aW9uc1tBUkM0VUludDY0KG9yZ19pZCldID0gT3JnYW5pemF0aW9uSW5mbygKICAgIC8vICAgICBpZD1BUkM0VUludDY0KG9yZ19pZCksCiAgICAvLyAgICAgbmFtZT1BUkM0U3RyaW5nKG9yZ19uYW1lKSwKICAgIC8vICAgICB3YWxsZXRfYWRkcmVzcz1BUkM0U3RyaW5nKHdhbGxldF9hZGRyZXNzKSwKICAgIC8vICAgICB2ZXJpZmljYXRpb25fbGV2ZWw9QVJDNFVJbnQ2NCgwKSAgIyAwID0gdW52ZXJpZmllZCBpbml0aWFsbHkKICAgIC8vICkKICAgIGR1cAogICAgYm94X2RlbAogICAgcG9wCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fcmVnaXN0cnkvY29udHJhY3QucHk6NTEKICAgIC8vIHNlbGYudG90YWxfb3JnYW5pemF0aW9ucy52YWx1ZSArPSBVSW50NjQoMSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA4IC8vICJ0b3RhbF9vcmdhbml6YXRpb25zIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX29yZ2FuaXphdGlvbnMgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnl0ZWMgOCAvLyAidG90YWxfb3JnYW5pemF0aW9ucyIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fcmVnaXN0cnkvY29udHJhY3QucHk6NTIKICAgIC8vIHJldHVybiBvcmdfaWQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5haWRjaGFpbl9yZWdpc3RyeS5jb250cmFjdC5BaWRjaGFpblJlZ2lzdHJ5LmdldF9vcmdhbml6YXRpb25fY291bnQoKSAtPiB1aW50NjQ6CmdldF9vcmdhbml6YXRpb25fY291bnQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fcmVnaXN0cnkvY29udHJhY3QucHk6NTcKICAgIC8vIHJldHVybiBzZWxmLm9yZ2FuaXphdGlvbl9jb3VudGVyLnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNiAvLyAib3JnYW5pemF0aW9uX2NvdW50ZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3JnYW5pemF0aW9uX2NvdW50ZXIgZXhpc3RzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWlkY2hhaW5fcmVnaXN0cnkuY29udHJhY3QuQWlkY2hhaW5SZWdpc3RyeS5nZXRfb3JnYW5pemF0aW9uX2RldGFpbHMob3JnX2lkOiBieXRlcykgLT4gYnl0ZXM6CmdldF9vcmdhbml6YXRpb25fZGV0YWlsczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9yZWdpc3RyeS9jb250cmFjdC5weTo2NC02NQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF9vcmdhbml6YXRpb25fZGV0YWlscyhzZWxmLCBvcmdfaWQ6IEFSQzRVSW50NjQpIC0+IE9yZ2FuaXphdGlvbkluZm86CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9yZWdpc3RyeS9jb250cmFjdC5weTo2NwogICAgLy8gYXNzZXJ0IG9yZ19pZCBpbiBzZWxmLm9yZ2FuaXphdGlvbnMsICJPcmdhbml6YXRpb24gbm90IGZvdW5kIgogICAgYnl0ZWMgMTUgLy8gIm9yZ3MiCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBPcmdhbml6YXRpb24gbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fcmVnaXN0cnkvY29udHJhY3QucHk6NjgKICAgIC8vIHJldHVybiBzZWxmLm9yZ2FuaXphdGlvbnNbb3JnX2lkXQogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3JnYW5pemF0aW9ucyBlbnRyeSBleGlzdHMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5haWRjaGFpbl9jYW1wYWlnbnMuY29udHJhY3QuQWlkY2hhaW5DYW1wYWlnbnMuY3JlYXRlX2NhbXBhaWduKHRpdGxlOiBieXRlcywgdGFyZ2V0OiB1aW50NjQsIGNyZWF0b3I6IGJ5dGVzKSAtPiB1aW50NjQ6CmNyZWF0ZV9jYW1wYWlnbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6NTQtNTUKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGNyZWF0ZV9jYW1wYWlnbihzZWxmLCB0aXRsZTogU3RyaW5nLCB0YXJnZXQ6IFVJbnQ2NCwgY3JlYXRvcjogU3RyaW5nKSAtPiBVSW50NjQ6CiAgICBwcm90byAzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6NTcKICAgIC8vIHNlbGYuY2FtcGFpZ25fY291bnRlci52YWx1ZSArPSBVSW50NjQoMSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJjYW1wYWlnbl9jb3VudGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNhbXBhaWduX2NvdW50ZXIgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnl0ZWNfMSAvLyAiY2FtcGFpZ25fY291bnRlciIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weTo2MQogICAgLy8gaWQ9QVJDNFVJbnQ2NChjYW1wYWlnbl9pZCksCiAgICBkdXAKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6NjIKICAgIC8vIHRpdGxlPUFSQzRTdHJpbmcodGl0bGUpLAogICAgZnJhbWVfZGlnIC0zCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBmcmFtZV9kaWcgLTMKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weTo2MwogICAgLy8gdGFyZ2V0PUFSQzRVSW50NjQodGFyZ2V0KSwKICAgIGZyYW1lX2RpZyAtMgogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weTo2NQogICAgLy8gY3JlYXRvcj1BUkM0U3RyaW5nKGNyZWF0b3IpLAogICAgZnJhbWVfZGlnIC0xCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weTo2MC02NwogICAgLy8gc2VsZi5jYW1wYWlnbnNbQVJDNFVJbnQ2NChjYW1wYWlnbl9pZCldID0gQ2FtcGFpZ25JbmZvKAogICAgLy8gICAgIGlkPUFSQzRVSW50NjQoY2FtcGFpZ25faWQpLAogICAgLy8gICAgIHRpdGxlPUFSQzRTdHJpbmcodGl0bGUpLAogICAgLy8gICAgIHRhcmdldD1BUkM0VUludDY0KHRhcmdldCksCiAgICAvLyAgICAgcmFpc2VkPUFSQzRVSW50NjQoMCksICAjIE5vIGZ1bmRzIHJhaXNlZCBpbml0aWFsbHkKICAgIC8vICAgICBjcmVhdG9yPUFSQzRTdHJpbmcoY3JlYXRvciksCiAgICAvLyAgICAgYWN0aXZlPUFSQzRVSW50NjQoMSkgICMgMSA9IGFjdGl2ZQogICAgLy8gKQogICAgZGlnIDMKICAgIHB1c2hieXRlcyAweDAwMjQKICAgIGNvbmNhdAogICAgZGlnIDMKICAgIGxlbgogICAgcHVzaGludCAzNiAvLyAzNgogICAgKwogICAgc3dhcAogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6NjQKICAgIC8vIHJhaXNlZD1BUkM0VUludDY0KDApLCAgIyBObyBmdW5kcyByYWlzZWQgaW5pdGlhbGx5CiAgICBieXRlYyA1IC8vIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weTo2MC02NwogICAgLy8gc2VsZi5jYW1wYWlnbnNbQVJDNFVJbnQ2NChjYW1wYWlnbl9pZCldID0gQ2FtcGFpZ25JbmZvKAogICAgLy8gICAgIGlkPUFSQzRVSW50NjQoY2FtcGFpZ25faWQpLAogICAgLy8gICAgIHRpdGxlPUFSQzRTdHJpbmcodGl0bGUpLAogICAgLy8gICAgIHRhcmdldD1BUkM0VUludDY0KHRhcmdldCksCiAgICAvLyAgICAgcmFpc2VkPUFSQzRVSW50NjQoMCksICAjIE5vIGZ1bmRzIHJhaXNlZCBpbml0aWFsbHkKICAgIC8vICAgICBjcmVhdG9yPUFSQzRTdHJpbmcoY3JlYXRvciksCiAgICAvLyAgICAgYWN0aXZlPUFSQzRVSW50NjQoMSkgICMgMSA9IGFjdGl2ZQogICAgLy8gKQogICAgY29uY2F0CiAgICBzd2FwCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjY2CiAgICAvLyBhY3RpdmU9QVJDNFVJbnQ2NCgxKSAgIyAxID0gYWN0aXZlCiAgICBieXRlYyAxMSAvLyAweDAwMDAwMDAwMDAwMDAwMDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6NjAtNjcKICAgIC8vIHNlbGYuY2FtcGFpZ25zW0FSQzRVSW50NjQoY2FtcGFpZ25faWQpXSA9IENhbXBhaWduSW5mbygKICAgIC8vICAgICBpZD1BUkM0VUludDY0KGNhbXBhaWduX2lkKSwKICAgIC8vICAgICB0aXRsZT1BUkM0U3RyaW5nKHRpdGxlKSwKICAgIC8vICAgICB0YXJnZXQ9QVJDNFVJbnQ2NCh0YXJnZXQpLAogICAgLy8gICAgIHJhaXNlZD1BUkM0VUludDY0KDApLCAgIyBObyBmdW5kcyByYWlzZWQgaW5pdGlhbGx5CiAgICAvLyAgICAgY3JlYXRvcj1BUkM0U3RyaW5nKGNyZWF0b3IpLAogICAgLy8gICAgIGFjdGl2ZT1BUkM0VUludDY0KDEpICAjIDEgPSBhY3RpdmUKICAgIC8vICkKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weTo2MAogICAgLy8gc2VsZi5jYW1wYWlnbnNbQVJDNFVJbnQ2NChjYW1wYWlnbl9pZCldID0gQ2FtcGFpZ25JbmZvKAogICAgYnl0ZWMgMTAgLy8gImNhbXBhaWducyIKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjYwLTY3CiAgICAvLyBzZWxmLmNhbXBhaWduc1tBUkM0VUludDY0KGNhbXBhaWduX2lkKV0gPSBDYW1wYWlnbkluZm8oCiAgICAvLyAgICAgaWQ9QVJDNFVJbnQ2NChjYW1wYWlnbl9pZCksCiAgICAvLyAgICAgdGl0bGU9QVJDNFN0cmluZyh0aXRsZSksCiAgICAvLyAgICAgdGFyZ2V0PUFSQzRVSW50NjQodGFyZ2V0KSwKICAgIC8vICAgICByYWlzZWQ9QVJDNFVJbnQ2NCgwKSwgICMgTm8gZnVuZHMgcmFpc2VkIGluaXRpYWxseQogICAgLy8gICAgIGNyZWF0b3I9QVJDNFN0cmluZyhjcmVhdG9yKSwKICAgIC8vICAgICBhY3RpdmU9QVJDNFVJbnQ2NCgxKSAgIyAxID0gYWN0aXZlCiAgICAvLyApCiAgICBkdXAKICAgIGJveF9kZWwKICAgIHBvcAogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weTo2OQogICAgLy8gcmV0dXJuIGNhbXBhaWduX2lkCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWlkY2hhaW5fY2FtcGFpZ25zLmNvbnRyYWN0LkFpZGNoYWluQ2FtcGFpZ25zLmdldF9jYW1wYWlnbl9jb3VudCgpIC0+IHVpbnQ2NDoKZ2V0X2NhbXBhaWduX2NvdW50OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weTo3NAogICAgLy8gcmV0dXJuIHNlbGYuY2FtcGFpZ25fY291bnRlci52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImNhbXBhaWduX2NvdW50ZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY2FtcGFpZ25fY291bnRlciBleGlzdHMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5haWRjaGFpbl9jYW1wYWlnbnMuY29udHJhY3QuQWlkY2hhaW5DYW1wYWlnbnMuY3JlYXRlX2RvbmF0aW9uKGNhbXBhaWduX2lkOiB1aW50NjQpIC0+IGJ5dGVzOgpjcmVhdGVfZG9uYXRpb246CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5Ojc2LTc3CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBjcmVhdGVfZG9uYXRpb24oc2VsZiwgY2FtcGFpZ25faWQ6IFVJbnQ2NCkgLT4gU3RyaW5nOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5Ojc5CiAgICAvLyBhc3NlcnQgY2FtcGFpZ25faWQgPD0gc2VsZi5jYW1wYWlnbl9jb3VudGVyLnZhbHVlLCAiQ2FtcGFpZ24gSUQgb3V0IG9mIHJhbmdlIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImNhbXBhaWduX2NvdW50ZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY2FtcGFpZ25fY291bnRlciBleGlzdHMKICAgIGZyYW1lX2RpZyAtMQogICAgPj0KICAgIGFzc2VydCAvLyBDYW1wYWlnbiBJRCBvdXQgb2YgcmFuZ2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6ODAKICAgIC8vIGFzc2VydCBjYW1wYWlnbl9pZCAhPSBVSW50NjQoMCksICJDYW1wYWlnbiBJRCBjYW5ub3QgYmUgemVybyIKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXJ0IC8vIENhbXBhaWduIElEIGNhbm5vdCBiZSB6ZXJvCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjgxCiAgICAvLyBhc3NlcnQgQVJDNFVJbnQ2NChjYW1wYWlnbl9pZCkgaW4gc2VsZi5jYW1wYWlnbnMsICJDYW1wYWlnbiBub3QgZm91bmQiCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGJ5dGVjIDEwIC8vICJjYW1wYWlnbnMiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIENhbXBhaWduIG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weTo4My04NAogICAgLy8gIyBJbiBwcm9kdWN0aW9uLCB0aGlzIHdvdWxkIGdldCB0aGUgYWN0dWFsIHBheW1lbnQgYW1vdW50IGZyb20gYSBncm91cGVkIHBheW1lbnQKICAgIC8vIGRvbmF0aW9uX2Ftb3VudCA9IFR4bi5hbW91bnQKICAgIHR4biBBbW91bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6ODUKICAgIC8vIHNlbGYudG90YWxfZG9uYXRpb25zLnZhbHVlICs9IGRvbmF0aW9uX2Ftb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDcgLy8gInRvdGFsX2RvbmF0aW9ucyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9kb25hdGlvbnMgZXhpc3RzCiAgICArCiAgICBieXRlYyA3IC8vICJ0b3RhbF9kb25hdGlvbnMiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weTo4NwogICAgLy8gcmV0dXJuIFN0cmluZygiRG9uYXRpb24gcmVjb3JkZWQgc3VjY2Vzc2Z1bGx5IikKICAgIHB1c2hieXRlcyAiRG9uYXRpb24gcmVjb3JkZWQgc3VjY2Vzc2Z1bGx5IgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFpZGNoYWluX2NhbXBhaWducy5jb250cmFjdC5BaWRjaGFpbkNhbXBhaWducy5nZXRfdG90YWxfZG9uYXRpb25zKCkgLT4gdWludDY0OgpnZXRfdG90YWxfZG9uYXRpb25zOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weTo5MgogICAgLy8gcmV0dXJuIHNlbGYudG90YWxfZG9uYXRpb25zLnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNyAvLyAidG90YWxfZG9uYXRpb25zIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX2RvbmF0aW9ucyBleGlzdHMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5haWRjaGFpbl9jYW1wYWlnbnMuY29udHJhY3QuQWlkY2hhaW5DYW1wYWlnbnMuY2FsY3VsYXRlX3RvdGFsKGFtb3VudDE6IHVpbnQ2NCwgYW1vdW50MjogdWludDY0KSAtPiB1aW50NjQ6CmNhbGN1bGF0ZV90b3RhbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6OTQtOTUKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGNhbGN1bGF0ZV90b3RhbChzZWxmLCBhbW91bnQxOiBVSW50NjQsIGFtb3VudDI6IFVJbnQ2NCkgLT4gVUludDY0OgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5Ojk3CiAgICAvLyByZXR1cm4gYW1vdW50MSArIGFtb3VudDIKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIC0xCiAgICArCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWlkY2hhaW5fY2FtcGFpZ25zLmNvbnRyYWN0LkFpZGNoYWluQ2FtcGFpZ25zLnZhbGlkYXRlX2RvbmF0aW9uKGFtb3VudDogdWludDY0LCBkb25vcjogYnl0ZXMpIC0+IGJ5dGVzOgp2YWxpZGF0ZV9kb25hdGlvbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6OTktMTAwCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiB2YWxpZGF0ZV9kb25hdGlvbihzZWxmLCBhbW91bnQ6IFVJbnQ2NCwgZG9ub3I6IFN0cmluZykgLT4gU3RyaW5nOgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjEwMgogICAgLy8gaWYgYW1vdW50ID4gVUludDY0KDApOgogICAgZnJhbWVfZGlnIC0yCiAgICBieiB2YWxpZGF0ZV9kb25hdGlvbl9lbHNlX2JvZHlAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxMDMKICAgIC8vIHJldHVybiBTdHJpbmcoIlZhbGlkIGRvbmF0aW9uIGZyb20gIikgKyBkb25vcgogICAgcHVzaGJ5dGVzICJWYWxpZCBkb25hdGlvbiBmcm9tICIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICByZXRzdWIKCnZhbGlkYXRlX2RvbmF0aW9uX2Vsc2VfYm9keUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxMDUKICAgIC8vIHJldHVybiBTdHJpbmcoIkludmFsaWQgZG9uYXRpb24gYW1vdW50IikKICAgIHB1c2hieXRlcyAiSW52YWxpZCBkb25hdGlvbiBhbW91bnQiCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWlkY2hhaW5fY2FtcGFpZ25zLmNvbnRyYWN0LkFpZGNoYWluQ2FtcGFpZ25zLmNyZWF0ZV9taWxlc3RvbmUoY2FtcGFpZ25faWQ6IHVpbnQ2NCwgdGFyZ2V0X2Ftb3VudDogdWludDY0LCBkZXNjcmlwdGlvbjogYnl0ZXMpIC0+IHVpbnQ2NDoKY3JlYXRlX21pbGVzdG9uZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MTA3LTEwOAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgY3JlYXRlX21pbGVzdG9uZShzZWxmLCBjYW1wYWlnbl9pZDogVUludDY0LCB0YXJnZXRfYW1vdW50OiBVSW50NjQsIGRlc2NyaXB0aW9uOiBTdHJpbmcpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDMgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxMTAKICAgIC8vIGFzc2VydCBjYW1wYWlnbl9pZCA8PSBzZWxmLmNhbXBhaWduX2NvdW50ZXIudmFsdWUsICJDYW1wYWlnbiBJRCBvdXQgb2YgcmFuZ2UiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiY2FtcGFpZ25fY291bnRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jYW1wYWlnbl9jb3VudGVyIGV4aXN0cwogICAgZnJhbWVfZGlnIC0zCiAgICA+PQogICAgYXNzZXJ0IC8vIENhbXBhaWduIElEIG91dCBvZiByYW5nZQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxMTEKICAgIC8vIGFzc2VydCBjYW1wYWlnbl9pZCAhPSBVSW50NjQoMCksICJDYW1wYWlnbiBJRCBjYW5ub3QgYmUgemVybyIKICAgIGZyYW1lX2RpZyAtMwogICAgYXNzZXJ0IC8vIENhbXBhaWduIElEIGNhbm5vdCBiZSB6ZXJvCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjExMgogICAgLy8gYXNzZXJ0IEFSQzRVSW50NjQoY2FtcGFpZ25faWQpIGluIHNlbGYuY2FtcGFpZ25zLCAiQ2FtcGFpZ24gbm90IGZvdW5kIgogICAgZnJhbWVfZGlnIC0zCiAgICBpdG9iCiAgICBieXRlYyAxMCAvLyAiY2FtcGFpZ25zIgogICAgZGlnIDEKICAgIGNvbmNhdAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gQ2FtcGFpZ24gbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjExNAogICAgLy8gc2VsZi5taWxlc3RvbmVfY291bnRlci52YWx1ZSArPSBVSW50NjQoMSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJtaWxlc3RvbmVfY291bnRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5taWxlc3RvbmVfY291bnRlciBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlY18yIC8vICJtaWxlc3RvbmVfY291bnRlciIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxMTgKICAgIC8vIGlkPUFSQzRVSW50NjQobWlsZXN0b25lX2lkKSwKICAgIGR1cAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxMjAKICAgIC8vIHRhcmdldF9hbW91bnQ9QVJDNFVJbnQ2NCh0YXJnZXRfYW1vdW50KSwKICAgIGZyYW1lX2RpZyAtMgogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxMjEKICAgIC8vIGRlc2NyaXB0aW9uPUFSQzRTdHJpbmcoZGVzY3JpcHRpb24pLAogICAgZnJhbWVfZGlnIC0xCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxMTctMTI0CiAgICAvLyBzZWxmLm1pbGVzdG9uZXNbQVJDNFVJbnQ2NChtaWxlc3RvbmVfaWQpXSA9IE1pbGVzdG9uZUluZm8oCiAgICAvLyAgICAgaWQ9QVJDNFVJbnQ2NChtaWxlc3RvbmVfaWQpLAogICAgLy8gICAgIGNhbXBhaWduX2lkPUFSQzRVSW50NjQoY2FtcGFpZ25faWQpLAogICAgLy8gICAgIHRhcmdldF9hbW91bnQ9QVJDNFVJbnQ2NCh0YXJnZXRfYW1vdW50KSwKICAgIC8vICAgICBkZXNjcmlwdGlvbj1BUkM0U3RyaW5nKGRlc2NyaXB0aW9uKSwKICAgIC8vICAgICBjb21wbGV0ZWQ9QVJDNFVJbnQ2NCgwKSwgICMgMCA9IHBlbmRpbmcKICAgIC8vICAgICBmdW5kc19yZWxlYXNlZD1BUkM0VUludDY0KDApICAjIDAgPSBub3QgcmVsZWFzZWQKICAgIC8vICkKICAgIGRpZyAyCiAgICB1bmNvdmVyIDUKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweDAwMmEKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxMjIKICAgIC8vIGNvbXBsZXRlZD1BUkM0VUludDY0KDApLCAgIyAwID0gcGVuZGluZwogICAgYnl0ZWMgNSAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MTE3LTEyNAogICAgLy8gc2VsZi5taWxlc3RvbmVzW0FSQzRVSW50NjQobWlsZXN0b25lX2lkKV0gPSBNaWxlc3RvbmVJbmZvKAogICAgLy8gICAgIGlkPUFSQzRVSW50NjQobWlsZXN0b25lX2lkKSwKICAgIC8vICAgICBjYW1wYWlnbl9pZD1BUkM0VUludDY0KGNhbXBhaWduX2lkKSwKICAgIC8vICAgICB0YXJnZXRfYW1vdW50PUFSQzRVSW50NjQodGFyZ2V0X2Ftb3VudCksCiAgICAvLyAgICAgZGVzY3JpcHRpb249QVJDNFN0cmluZyhkZXNjcmlwdGlvbiksCiAgICAvLyAgICAgY29tcGxldGVkPUFSQzRVSW50NjQoMCksICAjIDAgPSBwZW5kaW5nCiAgICAvLyAgICAgZnVuZHNfcmVsZWFzZWQ9QVJDNFVJbnQ2NCgwKSAgIyAwID0gbm90IHJlbGVhc2VkCiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MTIzCiAgICAvLyBmdW5kc19yZWxlYXNlZD1BUkM0VUludDY0KDApICAjIDAgPSBub3QgcmVsZWFzZWQKICAgIGJ5dGVjIDUgLy8gMHgwMDAwMDAwMDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjExNy0xMjQKICAgIC8vIHNlbGYubWlsZXN0b25lc1tBUkM0VUludDY0KG1pbGVzdG9uZV9pZCldID0gTWlsZXN0b25lSW5mbygKICAgIC8vICAgICBpZD1BUkM0VUludDY0KG1pbGVzdG9uZV9pZCksCiAgICAvLyAgICAgY2FtcGFpZ25faWQ9QVJDNFVJbnQ2NChjYW1wYWlnbl9pZCksCiAgICAvLyAgICAgdGFyZ2V0X2Ftb3VudD1BUkM0VUludDY0KHRhcmdldF9hbW91bnQpLAogICAgLy8gICAgIGRlc2NyaXB0aW9uPUFSQzRTdHJpbmcoZGVzY3JpcHRpb24pLAogICAgLy8gICAgIGNvbXBsZXRlZD1BUkM0VUludDY0KDApLCAgIyAwID0gcGVuZGluZwogICAgLy8gICAgIGZ1bmRzX3JlbGVhc2VkPUFSQzRVSW50NjQoMCkgICMgMCA9IG5vdCByZWxlYXNlZAogICAgLy8gKQogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MTE3CiAgICAvLyBzZWxmLm1pbGVzdG9uZXNbQVJDNFVJbnQ2NChtaWxlc3RvbmVfaWQpXSA9IE1pbGVzdG9uZUluZm8oCiAgICBieXRlYyAxMiAvLyAibWlsZXN0b25lcyIKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjExNy0xMjQKICAgIC8vIHNlbGYubWlsZXN0b25lc1tBUkM0VUludDY0KG1pbGVzdG9uZV9pZCldID0gTWlsZXN0b25lSW5mbygKICAgIC8vICAgICBpZD1BUkM0VUludDY0KG1pbGVzdG9uZV9pZCksCiAgICAvLyAgICAgY2FtcGFpZ25faWQ9QVJDNFVJbnQ2NChjYW1wYWlnbl9pZCksCiAgICAvLyAgICAgdGFyZ2V0X2Ftb3VudD1BUkM0VUludDY0KHRhcmdldF9hbW91bnQpLAogICAgLy8gICAgIGRlc2NyaXB0aW9uPUFSQzRTdHJpbmcoZGVzY3JpcHRpb24pLAogICAgLy8gICAgIGNvbXBsZXRlZD1BUkM0VUludDY0KDApLCAgIyAwID0gcGVuZGluZwogICAgLy8gICAgIGZ1bmRzX3JlbGVhc2VkPUFSQzRVSW50NjQoMCkgICMgMCA9IG5vdCByZWxlYXNlZAogICAgLy8gKQogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MTI2CiAgICAvLyByZXR1cm4gbWlsZXN0b25lX2lkCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWlkY2hhaW5fY2FtcGFpZ25zLmNvbnRyYWN0LkFpZGNoYWluQ2FtcGFpZ25zLmNvbXBsZXRlX21pbGVzdG9uZShtaWxlc3RvbmVfaWQ6IHVpbnQ2NCwgcHJvb2Y6IGJ5dGVzKSAtPiBieXRlczoKY29tcGxldGVfbWlsZXN0b25lOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxMjgtMTI5CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBjb21wbGV0ZV9taWxlc3RvbmUoc2VsZiwgbWlsZXN0b25lX2lkOiBVSW50NjQsIHByb29mOiBTdHJpbmcpIC0+IFN0cmluZzoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxMzEKICAgIC8vIGFzc2VydCBtaWxlc3RvbmVfaWQgPD0gc2VsZi5taWxlc3RvbmVfY291bnRlci52YWx1ZSwgIk1pbGVzdG9uZSBJRCBvdXQgb2YgcmFuZ2UiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAibWlsZXN0b25lX2NvdW50ZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWlsZXN0b25lX2NvdW50ZXIgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTIKICAgID49CiAgICBhc3NlcnQgLy8gTWlsZXN0b25lIElEIG91dCBvZiByYW5nZQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxMzIKICAgIC8vIGFzc2VydCBtaWxlc3RvbmVfaWQgIT0gVUludDY0KDApLCAiTWlsZXN0b25lIElEIGNhbm5vdCBiZSB6ZXJvIgogICAgZnJhbWVfZGlnIC0yCiAgICBhc3NlcnQgLy8gTWlsZXN0b25lIElEIGNhbm5vdCBiZSB6ZXJvCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjEzMwogICAgLy8gYXNzZXJ0IEFSQzRVSW50NjQobWlsZXN0b25lX2lkKSBpbiBzZWxmLm1pbGVzdG9uZXMsICJNaWxlc3RvbmUgbm90IGZvdW5kIgogICAgZnJhbWVfZGlnIC0yCiAgICBpdG9iCiAgICBieXRlYyAxMiAvLyAibWlsZXN0b25lcyIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBNaWxlc3RvbmUgbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjEzNQogICAgLy8gbWlsZXN0b25lX2luZm8gPSBzZWxmLm1pbGVzdG9uZXNbQVJDNFVJbnQ2NChtaWxlc3RvbmVfaWQpXS5jb3B5KCkKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWlsZXN0b25lcyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MTM2CiAgICAvLyBtaWxlc3RvbmVfaW5mby5jb21wbGV0ZWQgPSBBUkM0VUludDY0KDEpICAjIE1hcmsgYXMgY29tcGxldGVkCiAgICBieXRlYyAxMSAvLyAweDAwMDAwMDAwMDAwMDAwMDEKICAgIHJlcGxhY2UyIDI2CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjEzNwogICAgLy8gc2VsZi5taWxlc3RvbmVzW0FSQzRVSW50NjQobWlsZXN0b25lX2lkKV0gPSBtaWxlc3RvbmVfaW5mby5jb3B5KCkKICAgIGRpZyAxCiAgICBib3hfZGVsCiAgICBwb3AKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MTM5CiAgICAvLyBzZWxmLnRvdGFsX21pbGVzdG9uZXNfY29tcGxldGVkLnZhbHVlICs9IFVJbnQ2NCgxKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDkgLy8gInRvdGFsX21pbGVzdG9uZXNfY29tcGxldGVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX21pbGVzdG9uZXNfY29tcGxldGVkIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjIDkgLy8gInRvdGFsX21pbGVzdG9uZXNfY29tcGxldGVkIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MTQwCiAgICAvLyByZXR1cm4gU3RyaW5nKCJNaWxlc3RvbmUgY29tcGxldGVkIHdpdGggcHJvb2Y6ICIpICsgcHJvb2YKICAgIHB1c2hieXRlcyAiTWlsZXN0b25lIGNvbXBsZXRlZCB3aXRoIHByb29mOiAiCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFpZGNoYWluX2NhbXBhaWducy5jb250cmFjdC5BaWRjaGFpbkNhbXBhaWducy5yZWxlYXNlX21pbGVzdG9uZV9mdW5kcyhtaWxlc3RvbmVfaWQ6IHVpbnQ2NCwgcmVjaXBpZW50OiBieXRlcywgYW1vdW50OiB1aW50NjQpIC0+IGJ5dGVzOgpyZWxlYXNlX21pbGVzdG9uZV9mdW5kczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MTQyLTE0MwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgcmVsZWFzZV9taWxlc3RvbmVfZnVuZHMoc2VsZiwgbWlsZXN0b25lX2lkOiBVSW50NjQsIHJlY2lwaWVudDogQWNjb3VudCwgYW1vdW50OiBVSW50NjQpIC0+IFN0cmluZzoKICAgIHByb3RvIDMgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxNDUKICAgIC8vIGFzc2VydCBtaWxlc3RvbmVfaWQgPD0gc2VsZi5taWxlc3RvbmVfY291bnRlci52YWx1ZSwgIk1pbGVzdG9uZSBJRCBvdXQgb2YgcmFuZ2UiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAibWlsZXN0b25lX2NvdW50ZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWlsZXN0b25lX2NvdW50ZXIgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTMKICAgID49CiAgICBhc3NlcnQgLy8gTWlsZXN0b25lIElEIG91dCBvZiByYW5nZQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxNDYKICAgIC8vIGFzc2VydCBtaWxlc3RvbmVfaWQgIT0gVUludDY0KDApLCAiTWlsZXN0b25lIElEIGNhbm5vdCBiZSB6ZXJvIgogICAgZnJhbWVfZGlnIC0zCiAgICBhc3NlcnQgLy8gTWlsZXN0b25lIElEIGNhbm5vdCBiZSB6ZXJvCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjE0NwogICAgLy8gYXNzZXJ0IGFtb3VudCA+IFVJbnQ2NCgwKSwgIkFtb3VudCBtdXN0IGJlIGdyZWF0ZXIgdGhhbiB6ZXJvIgogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NlcnQgLy8gQW1vdW50IG11c3QgYmUgZ3JlYXRlciB0aGFuIHplcm8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MTQ5LTE1MwogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPXJlY2lwaWVudCwKICAgIC8vICAgICBhbW91bnQ9YW1vdW50LAogICAgLy8gICAgIGZlZT1HbG9iYWwubWluX3R4bl9mZWUsICAjIFVzZSBtaW5pbXVtIHRyYW5zYWN0aW9uIGZlZQogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxNTIKICAgIC8vIGZlZT1HbG9iYWwubWluX3R4bl9mZWUsICAjIFVzZSBtaW5pbXVtIHRyYW5zYWN0aW9uIGZlZQogICAgZ2xvYmFsIE1pblR4bkZlZQogICAgZnJhbWVfZGlnIC0xCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgZnJhbWVfZGlnIC0yCiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fY2FtcGFpZ25zL2NvbnRyYWN0LnB5OjE0OQogICAgLy8gaXR4bi5QYXltZW50KAogICAgaW50Y18xIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MTQ5LTE1MwogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPXJlY2lwaWVudCwKICAgIC8vICAgICBhbW91bnQ9YW1vdW50LAogICAgLy8gICAgIGZlZT1HbG9iYWwubWluX3R4bl9mZWUsICAjIFVzZSBtaW5pbXVtIHRyYW5zYWN0aW9uIGZlZQogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MTU1CiAgICAvLyByZXR1cm4gU3RyaW5nKCJSZWFsIGJsb2NrY2hhaW4gcGF5bWVudCBzZW50IGZvciBtaWxlc3RvbmUiKQogICAgcHVzaGJ5dGVzICJSZWFsIGJsb2NrY2hhaW4gcGF5bWVudCBzZW50IGZvciBtaWxlc3RvbmUiCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWlkY2hhaW5fY2FtcGFpZ25zLmNvbnRyYWN0LkFpZGNoYWluQ2FtcGFpZ25zLmdldF9jYW1wYWlnbl9kZXRhaWxzKGNhbXBhaWduX2lkOiBieXRlcykgLT4gYnl0ZXM6CmdldF9jYW1wYWlnbl9kZXRhaWxzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxNjItMTYzCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X2NhbXBhaWduX2RldGFpbHMoc2VsZiwgY2FtcGFpZ25faWQ6IEFSQzRVSW50NjQpIC0+IENhbXBhaWduSW5mbzoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxNjUKICAgIC8vIGFzc2VydCBjYW1wYWlnbl9pZCBpbiBzZWxmLmNhbXBhaWducywgIkNhbXBhaWduIG5vdCBmb3VuZCIKICAgIGJ5dGVjIDEwIC8vICJjYW1wYWlnbnMiCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBDYW1wYWlnbiBub3QgZm91bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MTY2CiAgICAvLyByZXR1cm4gc2VsZi5jYW1wYWlnbnNbY2FtcGFpZ25faWRdCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jYW1wYWlnbnMgZW50cnkgZXhpc3RzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWlkY2hhaW5fY2FtcGFpZ25zLmNvbnRyYWN0LkFpZGNoYWluQ2FtcGFpZ25zLmdldF9taWxlc3RvbmVfZGV0YWlscyhtaWxlc3RvbmVfaWQ6IGJ5dGVzKSAtPiBieXRlczoKZ2V0X21pbGVzdG9uZV9kZXRhaWxzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxNjgtMTY5CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X21pbGVzdG9uZV9kZXRhaWxzKHNlbGYsIG1pbGVzdG9uZV9pZDogQVJDNFVJbnQ2NCkgLT4gTWlsZXN0b25lSW5mbzoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxNzEKICAgIC8vIGFzc2VydCBtaWxlc3RvbmVfaWQgaW4gc2VsZi5taWxlc3RvbmVzLCAiTWlsZXN0b25lIG5vdCBmb3VuZCIKICAgIGJ5dGVjIDEyIC8vICJtaWxlc3RvbmVzIgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gTWlsZXN0b25lIG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2NhbXBhaWducy9jb250cmFjdC5weToxNzIKICAgIC8vIHJldHVybiBzZWxmLm1pbGVzdG9uZXNbbWlsZXN0b25lX2lkXQogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWlsZXN0b25lcyBlbnRyeSBleGlzdHMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5haWRjaGFpbl9jYW1wYWlnbnMuY29udHJhY3QuQWlkY2hhaW5DYW1wYWlnbnMuZ2V0X21pbGVzdG9uZV9jb3VudCgpIC0+IHVpbnQ2NDoKZ2V0X21pbGVzdG9uZV9jb3VudDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9jYW1wYWlnbnMvY29udHJhY3QucHk6MTc3CiAgICAvLyByZXR1cm4gc2VsZi5taWxlc3RvbmVfY291bnRlci52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gIm1pbGVzdG9uZV9jb3VudGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1pbGVzdG9uZV9jb3VudGVyIGV4aXN0cwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFpZGNoYWluX2RlbGl2ZXJpZXMuY29udHJhY3QuQWlkY2hhaW5EZWxpdmVyaWVzLmxvZ19kZWxpdmVyeShyZWNpcGllbnQ6IGJ5dGVzLCBsb2NhdGlvbjogYnl0ZXMpIC0+IHVpbnQ2NDoKbG9nX2RlbGl2ZXJ5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2RlbGl2ZXJpZXMvY29udHJhY3QucHk6MzctMzgKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGxvZ19kZWxpdmVyeShzZWxmLCByZWNpcGllbnQ6IFN0cmluZywgbG9jYXRpb246IFN0cmluZykgLT4gVUludDY0OgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fZGVsaXZlcmllcy9jb250cmFjdC5weTo0MAogICAgLy8gc2VsZi5kZWxpdmVyeV9jb3VudGVyLnZhbHVlICs9IFVJbnQ2NCgxKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gImRlbGl2ZXJ5X2NvdW50ZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZGVsaXZlcnlfY291bnRlciBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlY18zIC8vICJkZWxpdmVyeV9jb3VudGVyIgogICAgZGlnIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fZGVsaXZlcmllcy9jb250cmFjdC5weTo0NAogICAgLy8gaWQ9QVJDNFVJbnQ2NChkZWxpdmVyeV9pZCksCiAgICBkdXAKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9kZWxpdmVyaWVzL2NvbnRyYWN0LnB5OjQ1CiAgICAvLyByZWNpcGllbnQ9QVJDNFN0cmluZyhyZWNpcGllbnQpLAogICAgZnJhbWVfZGlnIC0yCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2RlbGl2ZXJpZXMvY29udHJhY3QucHk6NDYKICAgIC8vIGxvY2F0aW9uPUFSQzRTdHJpbmcobG9jYXRpb24pLAogICAgZnJhbWVfZGlnIC0xCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2RlbGl2ZXJpZXMvY29udHJhY3QucHk6NDMtNDkKICAgIC8vIHNlbGYuZGVsaXZlcmllc1tBUkM0VUludDY0KGRlbGl2ZXJ5X2lkKV0gPSBEZWxpdmVyeVJlY29yZCgKICAgIC8vICAgICBpZD1BUkM0VUludDY0KGRlbGl2ZXJ5X2lkKSwKICAgIC8vICAgICByZWNpcGllbnQ9QVJDNFN0cmluZyhyZWNpcGllbnQpLAogICAgLy8gICAgIGxvY2F0aW9uPUFSQzRTdHJpbmcobG9jYXRpb24pLAogICAgLy8gICAgIGFnZW50PUFSQzRTdHJpbmcoIiIpLCAgIyBFbXB0eSBpbml0aWFsbHkKICAgIC8vICAgICB2ZXJpZmllZD1BUkM0VUludDY0KDApICAjIDAgPSBub3QgdmVyaWZpZWQgaW5pdGlhbGx5CiAgICAvLyApCiAgICBkaWcgMgogICAgcHVzaGJ5dGVzIDB4MDAxNgogICAgY29uY2F0CiAgICBkaWcgMgogICAgbGVuCiAgICBwdXNoaW50IDIyIC8vIDIyCiAgICArCiAgICBkdXAKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZGlnIDIKICAgIGxlbgogICAgdW5jb3ZlciAyCiAgICArCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fZGVsaXZlcmllcy9jb250cmFjdC5weTo0OAogICAgLy8gdmVyaWZpZWQ9QVJDNFVJbnQ2NCgwKSAgIyAwID0gbm90IHZlcmlmaWVkIGluaXRpYWxseQogICAgYnl0ZWMgNSAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9kZWxpdmVyaWVzL2NvbnRyYWN0LnB5OjQzLTQ5CiAgICAvLyBzZWxmLmRlbGl2ZXJpZXNbQVJDNFVJbnQ2NChkZWxpdmVyeV9pZCldID0gRGVsaXZlcnlSZWNvcmQoCiAgICAvLyAgICAgaWQ9QVJDNFVJbnQ2NChkZWxpdmVyeV9pZCksCiAgICAvLyAgICAgcmVjaXBpZW50PUFSQzRTdHJpbmcocmVjaXBpZW50KSwKICAgIC8vICAgICBsb2NhdGlvbj1BUkM0U3RyaW5nKGxvY2F0aW9uKSwKICAgIC8vICAgICBhZ2VudD1BUkM0U3RyaW5nKCIiKSwgICMgRW1wdHkgaW5pdGlhbGx5CiAgICAvLyAgICAgdmVyaWZpZWQ9QVJDNFVJbnQ2NCgwKSAgIyAwID0gbm90IHZlcmlmaWVkIGluaXRpYWxseQogICAgLy8gKQogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fZGVsaXZlcmllcy9jb250cmFjdC5weTo0NwogICAgLy8gYWdlbnQ9QVJDNFN0cmluZygiIiksICAjIEVtcHR5IGluaXRpYWxseQogICAgcHVzaGJ5dGVzIDB4MDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2RlbGl2ZXJpZXMvY29udHJhY3QucHk6NDMtNDkKICAgIC8vIHNlbGYuZGVsaXZlcmllc1tBUkM0VUludDY0KGRlbGl2ZXJ5X2lkKV0gPSBEZWxpdmVyeVJlY29yZCgKICAgIC8vICAgICBpZD1BUkM0VUludDY0KGRlbGl2ZXJ5X2lkKSwKICAgIC8vICAgICByZWNpcGllbnQ9QVJDNFN0cmluZyhyZWNpcGllbnQpLAogICAgLy8gICAgIGxvY2F0aW9uPUFSQzRTdHJpbmcobG9jYXRpb24pLAogICAgLy8gICAgIGFnZW50PUFSQzRTdHJpbmcoIiIpLCAgIyBFbXB0eSBpbml0aWFsbHkKICAgIC8vICAgICB2ZXJpZmllZD1BUkM0VUludDY0KDApICAjIDAgPSBub3QgdmVyaWZpZWQgaW5pdGlhbGx5CiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9kZWxpdmVyaWVzL2NvbnRyYWN0LnB5OjQzCiAgICAvLyBzZWxmLmRlbGl2ZXJpZXNbQVJDNFVJbnQ2NChkZWxpdmVyeV9pZCldID0gRGVsaXZlcnlSZWNvcmQoCiAgICBieXRlYyAxMyAvLyAiZGVsaXZlcmllcyIKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fZGVsaXZlcmllcy9jb250cmFjdC5weTo0My00OQogICAgLy8gc2VsZi5kZWxpdmVyaWVzW0FSQzRVSW50NjQoZGVsaXZlcnlfaWQpXSA9IERlbGl2ZXJ5UmVjb3JkKAogICAgLy8gICAgIGlkPUFSQzRVSW50NjQoZGVsaXZlcnlfaWQpLAogICAgLy8gICAgIHJlY2lwaWVudD1BUkM0U3RyaW5nKHJlY2lwaWVudCksCiAgICAvLyAgICAgbG9jYXRpb249QVJDNFN0cmluZyhsb2NhdGlvbiksCiAgICAvLyAgICAgYWdlbnQ9QVJDNFN0cmluZygiIiksICAjIEVtcHR5IGluaXRpYWxseQogICAgLy8gICAgIHZlcmlmaWVkPUFSQzRVSW50NjQoMCkgICMgMCA9IG5vdCB2ZXJpZmllZCBpbml0aWFsbHkKICAgIC8vICkKICAgIGR1cAogICAgYm94X2RlbAogICAgcG9wCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fZGVsaXZlcmllcy9jb250cmFjdC5weTo1MQogICAgLy8gcmV0dXJuIGRlbGl2ZXJ5X2lkCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWlkY2hhaW5fZGVsaXZlcmllcy5jb250cmFjdC5BaWRjaGFpbkRlbGl2ZXJpZXMudmVyaWZ5X2RlbGl2ZXJ5KGRlbGl2ZXJ5X2lkOiB1aW50NjQsIGFnZW50OiBieXRlcykgLT4gYnl0ZXM6CnZlcmlmeV9kZWxpdmVyeToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9kZWxpdmVyaWVzL2NvbnRyYWN0LnB5OjUzLTU0CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiB2ZXJpZnlfZGVsaXZlcnkoc2VsZiwgZGVsaXZlcnlfaWQ6IFVJbnQ2NCwgYWdlbnQ6IFN0cmluZykgLT4gU3RyaW5nOgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fZGVsaXZlcmllcy9jb250cmFjdC5weTo1NgogICAgLy8gYXNzZXJ0IGRlbGl2ZXJ5X2lkIDw9IHNlbGYuZGVsaXZlcnlfY291bnRlci52YWx1ZSwgIkRlbGl2ZXJ5IElEIG91dCBvZiByYW5nZSIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJkZWxpdmVyeV9jb3VudGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRlbGl2ZXJ5X2NvdW50ZXIgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTIKICAgID49CiAgICBhc3NlcnQgLy8gRGVsaXZlcnkgSUQgb3V0IG9mIHJhbmdlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fZGVsaXZlcmllcy9jb250cmFjdC5weTo1NwogICAgLy8gYXNzZXJ0IGRlbGl2ZXJ5X2lkICE9IFVJbnQ2NCgwKSwgIkRlbGl2ZXJ5IElEIGNhbm5vdCBiZSB6ZXJvIgogICAgZnJhbWVfZGlnIC0yCiAgICBhc3NlcnQgLy8gRGVsaXZlcnkgSUQgY2Fubm90IGJlIHplcm8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9kZWxpdmVyaWVzL2NvbnRyYWN0LnB5OjU4CiAgICAvLyBhc3NlcnQgQVJDNFVJbnQ2NChkZWxpdmVyeV9pZCkgaW4gc2VsZi5kZWxpdmVyaWVzLCAiRGVsaXZlcnkgbm90IGZvdW5kIgogICAgZnJhbWVfZGlnIC0yCiAgICBpdG9iCiAgICBieXRlYyAxMyAvLyAiZGVsaXZlcmllcyIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBEZWxpdmVyeSBub3QgZm91bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9kZWxpdmVyaWVzL2NvbnRyYWN0LnB5OjYwCiAgICAvLyBkZWxpdmVyeV9pbmZvID0gc2VsZi5kZWxpdmVyaWVzW0FSQzRVSW50NjQoZGVsaXZlcnlfaWQpXS5jb3B5KCkKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZGVsaXZlcmllcyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9kZWxpdmVyaWVzL2NvbnRyYWN0LnB5OjYxCiAgICAvLyBkZWxpdmVyeV9pbmZvLnZlcmlmaWVkID0gQVJDNFVJbnQ2NCgxKSAgIyBNYXJrIGFzIHZlcmlmaWVkCiAgICBieXRlYyAxMSAvLyAweDAwMDAwMDAwMDAwMDAwMDEKICAgIHJlcGxhY2UyIDE0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fZGVsaXZlcmllcy9jb250cmFjdC5weTo2MgogICAgLy8gZGVsaXZlcnlfaW5mby5hZ2VudCA9IEFSQzRTdHJpbmcoYWdlbnQpICAjIFNldCB0aGUgdmVyaWZ5aW5nIGFnZW50CiAgICBmcmFtZV9kaWcgLTEKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBkaWcgMQogICAgcHVzaGludCAxMiAvLyAxMgogICAgZXh0cmFjdF91aW50MTYKICAgIHVuY292ZXIgMgogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgZXh0cmFjdDMKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2RlbGl2ZXJpZXMvY29udHJhY3QucHk6NjMKICAgIC8vIHNlbGYuZGVsaXZlcmllc1tBUkM0VUludDY0KGRlbGl2ZXJ5X2lkKV0gPSBkZWxpdmVyeV9pbmZvLmNvcHkoKQogICAgZGlnIDEKICAgIGJveF9kZWwKICAgIHBvcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2RlbGl2ZXJpZXMvY29udHJhY3QucHk6NjUKICAgIC8vIHJldHVybiBTdHJpbmcoIkRlbGl2ZXJ5IHZlcmlmaWVkIGJ5IGFnZW50OiAiKSArIGFnZW50CiAgICBwdXNoYnl0ZXMgIkRlbGl2ZXJ5IHZlcmlmaWVkIGJ5IGFnZW50OiAiCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFpZGNoYWluX2RlbGl2ZXJpZXMuY29udHJhY3QuQWlkY2hhaW5EZWxpdmVyaWVzLmdldF9kZWxpdmVyeV9kZXRhaWxzKGRlbGl2ZXJ5X2lkOiBieXRlcykgLT4gYnl0ZXM6CmdldF9kZWxpdmVyeV9kZXRhaWxzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2RlbGl2ZXJpZXMvY29udHJhY3QucHk6NjctNjgKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfZGVsaXZlcnlfZGV0YWlscyhzZWxmLCBkZWxpdmVyeV9pZDogQVJDNFVJbnQ2NCkgLT4gRGVsaXZlcnlSZWNvcmQ6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9kZWxpdmVyaWVzL2NvbnRyYWN0LnB5OjcwCiAgICAvLyBhc3NlcnQgZGVsaXZlcnlfaWQgaW4gc2VsZi5kZWxpdmVyaWVzLCAiRGVsaXZlcnkgbm90IGZvdW5kIgogICAgYnl0ZWMgMTMgLy8gImRlbGl2ZXJpZXMiCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBEZWxpdmVyeSBub3QgZm91bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9kZWxpdmVyaWVzL2NvbnRyYWN0LnB5OjcxCiAgICAvLyByZXR1cm4gc2VsZi5kZWxpdmVyaWVzW2RlbGl2ZXJ5X2lkXQogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZGVsaXZlcmllcyBlbnRyeSBleGlzdHMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5haWRjaGFpbl9kZWxpdmVyaWVzLmNvbnRyYWN0LkFpZGNoYWluRGVsaXZlcmllcy5nZXRfZGVsaXZlcnlfY291bnQoKSAtPiB1aW50NjQ6CmdldF9kZWxpdmVyeV9jb3VudDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9kZWxpdmVyaWVzL2NvbnRyYWN0LnB5Ojc2CiAgICAvLyByZXR1cm4gc2VsZi5kZWxpdmVyeV9jb3VudGVyLnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAiZGVsaXZlcnlfY291bnRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kZWxpdmVyeV9jb3VudGVyIGV4aXN0cwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFpZGNoYWluX3ZvdWNoZXJzLmNvbnRyYWN0LkFpZGNoYWluVm91Y2hlcnMuY3JlYXRlX3ZvdWNoZXJfYXNzZXQoYXNzZXRfbmFtZTogYnl0ZXMsIHRvdGFsX3N1cHBseTogdWludDY0KSAtPiBieXRlczoKY3JlYXRlX3ZvdWNoZXJfYXNzZXQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fdm91Y2hlcnMvY29udHJhY3QucHk6MzktNDAKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGNyZWF0ZV92b3VjaGVyX2Fzc2V0KHNlbGYsIGFzc2V0X25hbWU6IFN0cmluZywgdG90YWxfc3VwcGx5OiBVSW50NjQpIC0+IEFSQzRVSW50NjQ6CiAgICBwcm90byAyIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl92b3VjaGVycy9jb250cmFjdC5weTo0Mi01MwogICAgLy8gdHhuX3Jlc3VsdCA9IGl0eG4uQXNzZXRDb25maWcoCiAgICAvLyAgICAgYXNzZXRfbmFtZT1hc3NldF9uYW1lLAogICAgLy8gICAgIHVuaXRfbmFtZT1TdHJpbmcoIlZPVUNIRVIiKSwKICAgIC8vICAgICB0b3RhbD10b3RhbF9zdXBwbHksCiAgICAvLyAgICAgZGVjaW1hbHM9MCwKICAgIC8vICAgICBkZWZhdWx0X2Zyb3plbj1GYWxzZSwKICAgIC8vICAgICBtYW5hZ2VyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgcmVzZXJ2ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGZyZWV6ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGNsYXdiYWNrPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgZmVlPUdsb2JhbC5taW5fdHhuX2ZlZSwgICMgVXNlIG1pbmltdW0gdHJhbnNhY3Rpb24gZmVlCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fdm91Y2hlcnMvY29udHJhY3QucHk6NTIKICAgIC8vIGZlZT1HbG9iYWwubWluX3R4bl9mZWUsICAjIFVzZSBtaW5pbXVtIHRyYW5zYWN0aW9uIGZlZQogICAgZ2xvYmFsIE1pblR4bkZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3ZvdWNoZXJzL2NvbnRyYWN0LnB5OjQ4CiAgICAvLyBtYW5hZ2VyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3ZvdWNoZXJzL2NvbnRyYWN0LnB5OjQ5LTUxCiAgICAvLyByZXNlcnZlPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyBmcmVlemU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vIGNsYXdiYWNrPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBkdXBuIDMKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRDbGF3YmFjawogICAgaXR4bl9maWVsZCBDb25maWdBc3NldEZyZWV6ZQogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFJlc2VydmUKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRNYW5hZ2VyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fdm91Y2hlcnMvY29udHJhY3QucHk6NDcKICAgIC8vIGRlZmF1bHRfZnJvemVuPUZhbHNlLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXREZWZhdWx0RnJvemVuCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fdm91Y2hlcnMvY29udHJhY3QucHk6NDYKICAgIC8vIGRlY2ltYWxzPTAsCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBDb25maWdBc3NldERlY2ltYWxzCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRUb3RhbAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3ZvdWNoZXJzL2NvbnRyYWN0LnB5OjQ0CiAgICAvLyB1bml0X25hbWU9U3RyaW5nKCJWT1VDSEVSIiksCiAgICBwdXNoYnl0ZXMgIlZPVUNIRVIiCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0VW5pdE5hbWUKICAgIGZyYW1lX2RpZyAtMgogICAgaXR4bl9maWVsZCBDb25maWdBc3NldE5hbWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl92b3VjaGVycy9jb250cmFjdC5weTo0MgogICAgLy8gdHhuX3Jlc3VsdCA9IGl0eG4uQXNzZXRDb25maWcoCiAgICBwdXNoaW50IDMgLy8gYWNmZwogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl92b3VjaGVycy9jb250cmFjdC5weTo0Mi01MwogICAgLy8gdHhuX3Jlc3VsdCA9IGl0eG4uQXNzZXRDb25maWcoCiAgICAvLyAgICAgYXNzZXRfbmFtZT1hc3NldF9uYW1lLAogICAgLy8gICAgIHVuaXRfbmFtZT1TdHJpbmcoIlZPVUNIRVIiKSwKICAgIC8vICAgICB0b3RhbD10b3RhbF9zdXBwbHksCiAgICAvLyAgICAgZGVjaW1hbHM9MCwKICAgIC8vICAgICBkZWZhdWx0X2Zyb3plbj1GYWxzZSwKICAgIC8vICAgICBtYW5hZ2VyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgcmVzZXJ2ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGZyZWV6ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGNsYXdiYWNrPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgZmVlPUdsb2JhbC5taW5fdHhuX2ZlZSwgICMgVXNlIG1pbmltdW0gdHJhbnNhY3Rpb24gZmVlCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgaXR4biBDcmVhdGVkQXNzZXRJRAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3ZvdWNoZXJzL2NvbnRyYWN0LnB5OjU3CiAgICAvLyBzZWxmLnZvdWNoZXJfY291bnRlci52YWx1ZSArPSBVSW50NjQoMSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vICJ2b3VjaGVyX2NvdW50ZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm91Y2hlcl9jb3VudGVyIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjIDQgLy8gInZvdWNoZXJfY291bnRlciIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3ZvdWNoZXJzL2NvbnRyYWN0LnB5OjYxCiAgICAvLyBpZD1BUkM0VUludDY0KHZvdWNoZXJfaWQpLAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3ZvdWNoZXJzL2NvbnRyYWN0LnB5OjYyCiAgICAvLyBhc3NldF9pZD1BUkM0VUludDY0KGFzc2V0X2lkKSwKICAgIHN3YXAKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl92b3VjaGVycy9jb250cmFjdC5weTo2MwogICAgLy8gbmFtZT1BUkM0U3RyaW5nKGFzc2V0X25hbWUpLAogICAgZnJhbWVfZGlnIC0yCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3ZvdWNoZXJzL2NvbnRyYWN0LnB5OjY0CiAgICAvLyB0b3RhbF9zdXBwbHk9QVJDNFVJbnQ2NCh0b3RhbF9zdXBwbHkpLAogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fdm91Y2hlcnMvY29udHJhY3QucHk6NjAtNjYKICAgIC8vIHNlbGYudm91Y2hlcnNbQVJDNFVJbnQ2NCh2b3VjaGVyX2lkKV0gPSBWb3VjaGVySW5mbygKICAgIC8vICAgICBpZD1BUkM0VUludDY0KHZvdWNoZXJfaWQpLAogICAgLy8gICAgIGFzc2V0X2lkPUFSQzRVSW50NjQoYXNzZXRfaWQpLAogICAgLy8gICAgIG5hbWU9QVJDNFN0cmluZyhhc3NldF9uYW1lKSwKICAgIC8vICAgICB0b3RhbF9zdXBwbHk9QVJDNFVJbnQ2NCh0b3RhbF9zdXBwbHkpLAogICAgLy8gICAgIGlzc3VlZD1BUkM0VUludDY0KDApICAjIE5vIHRva2VucyBpc3N1ZWQgeWV0CiAgICAvLyApCiAgICBkaWcgMwogICAgZGlnIDMKICAgIGNvbmNhdAogICAgcHVzaGJ5dGVzIDB4MDAyMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl92b3VjaGVycy9jb250cmFjdC5weTo2NQogICAgLy8gaXNzdWVkPUFSQzRVSW50NjQoMCkgICMgTm8gdG9rZW5zIGlzc3VlZCB5ZXQKICAgIGJ5dGVjIDUgLy8gMHgwMDAwMDAwMDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fdm91Y2hlcnMvY29udHJhY3QucHk6NjAtNjYKICAgIC8vIHNlbGYudm91Y2hlcnNbQVJDNFVJbnQ2NCh2b3VjaGVyX2lkKV0gPSBWb3VjaGVySW5mbygKICAgIC8vICAgICBpZD1BUkM0VUludDY0KHZvdWNoZXJfaWQpLAogICAgLy8gICAgIGFzc2V0X2lkPUFSQzRVSW50NjQoYXNzZXRfaWQpLAogICAgLy8gICAgIG5hbWU9QVJDNFN0cmluZyhhc3NldF9uYW1lKSwKICAgIC8vICAgICB0b3RhbF9zdXBwbHk9QVJDNFVJbnQ2NCh0b3RhbF9zdXBwbHkpLAogICAgLy8gICAgIGlzc3VlZD1BUkM0VUludDY0KDApICAjIE5vIHRva2VucyBpc3N1ZWQgeWV0CiAgICAvLyApCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3ZvdWNoZXJzL2NvbnRyYWN0LnB5OjYwCiAgICAvLyBzZWxmLnZvdWNoZXJzW0FSQzRVSW50NjQodm91Y2hlcl9pZCldID0gVm91Y2hlckluZm8oCiAgICBieXRlYyAxNiAvLyAidm91Y2hlcnMiCiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3ZvdWNoZXJzL2NvbnRyYWN0LnB5OjYwLTY2CiAgICAvLyBzZWxmLnZvdWNoZXJzW0FSQzRVSW50NjQodm91Y2hlcl9pZCldID0gVm91Y2hlckluZm8oCiAgICAvLyAgICAgaWQ9QVJDNFVJbnQ2NCh2b3VjaGVyX2lkKSwKICAgIC8vICAgICBhc3NldF9pZD1BUkM0VUludDY0KGFzc2V0X2lkKSwKICAgIC8vICAgICBuYW1lPUFSQzRTdHJpbmcoYXNzZXRfbmFtZSksCiAgICAvLyAgICAgdG90YWxfc3VwcGx5PUFSQzRVSW50NjQodG90YWxfc3VwcGx5KSwKICAgIC8vICAgICBpc3N1ZWQ9QVJDNFVJbnQ2NCgwKSAgIyBObyB0b2tlbnMgaXNzdWVkIHlldAogICAgLy8gKQogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl92b3VjaGVycy9jb250cmFjdC5weTo2OC02OQogICAgLy8gIyBSZXR1cm4gdGhlIGFjdHVhbCBhc3NldCBJRCBjcmVhdGVkIGJ5IHRoZSBibG9ja2NoYWluCiAgICAvLyByZXR1cm4gQVJDNFVJbnQ2NChhc3NldF9pZCkKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5haWRjaGFpbl92b3VjaGVycy5jb250cmFjdC5BaWRjaGFpblZvdWNoZXJzLnJlZGVlbV92b3VjaGVyKHZvdWNoZXJfaWQ6IHVpbnQ2NCwgbWVyY2hhbnQ6IGJ5dGVzLCBhbW91bnQ6IHVpbnQ2NCkgLT4gYnl0ZXM6CnJlZGVlbV92b3VjaGVyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3ZvdWNoZXJzL2NvbnRyYWN0LnB5Ojc2LTc3CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiByZWRlZW1fdm91Y2hlcihzZWxmLCB2b3VjaGVyX2lkOiBVSW50NjQsIG1lcmNoYW50OiBTdHJpbmcsIGFtb3VudDogVUludDY0KSAtPiBTdHJpbmc6CiAgICBwcm90byAzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl92b3VjaGVycy9jb250cmFjdC5weTo3OQogICAgLy8gaWYgdm91Y2hlcl9pZCA+IHNlbGYudm91Y2hlcl9jb3VudGVyLnZhbHVlIG9yIHZvdWNoZXJfaWQgPT0gVUludDY0KDApOgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gInZvdWNoZXJfY291bnRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3VjaGVyX2NvdW50ZXIgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTMKICAgIDwKICAgIGJueiByZWRlZW1fdm91Y2hlcl9pZl9ib2R5QDIKICAgIGZyYW1lX2RpZyAtMwogICAgYm56IHJlZGVlbV92b3VjaGVyX2FmdGVyX2lmX2Vsc2VAMwoKcmVkZWVtX3ZvdWNoZXJfaWZfYm9keUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3ZvdWNoZXJzL2NvbnRyYWN0LnB5OjgwCiAgICAvLyByZXR1cm4gU3RyaW5nKCJJbnZhbGlkIHZvdWNoZXIgSUQiKQogICAgcHVzaGJ5dGVzICJJbnZhbGlkIHZvdWNoZXIgSUQiCiAgICByZXRzdWIKCnJlZGVlbV92b3VjaGVyX2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl92b3VjaGVycy9jb250cmFjdC5weTo4MgogICAgLy8gaWYgYW1vdW50ID09IFVJbnQ2NCgwKToKICAgIGZyYW1lX2RpZyAtMQogICAgYm56IHJlZGVlbV92b3VjaGVyX2FmdGVyX2lmX2Vsc2VANQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3ZvdWNoZXJzL2NvbnRyYWN0LnB5OjgzCiAgICAvLyByZXR1cm4gU3RyaW5nKCJBbW91bnQgbXVzdCBiZSBncmVhdGVyIHRoYW4gemVybyIpCiAgICBwdXNoYnl0ZXMgIkFtb3VudCBtdXN0IGJlIGdyZWF0ZXIgdGhhbiB6ZXJvIgogICAgcmV0c3ViCgpyZWRlZW1fdm91Y2hlcl9hZnRlcl9pZl9lbHNlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fdm91Y2hlcnMvY29udHJhY3QucHk6ODUKICAgIC8vIHJldHVybiBTdHJpbmcoIlZvdWNoZXJzIHJlZGVlbWVkIGF0ICIpICsgbWVyY2hhbnQKICAgIHB1c2hieXRlcyAiVm91Y2hlcnMgcmVkZWVtZWQgYXQgIgogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5haWRjaGFpbl92b3VjaGVycy5jb250cmFjdC5BaWRjaGFpblZvdWNoZXJzLmdldF92b3VjaGVyX2RldGFpbHModm91Y2hlcl9pZDogYnl0ZXMpIC0+IGJ5dGVzOgpnZXRfdm91Y2hlcl9kZXRhaWxzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3ZvdWNoZXJzL2NvbnRyYWN0LnB5OjkyLTkzCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X3ZvdWNoZXJfZGV0YWlscyhzZWxmLCB2b3VjaGVyX2lkOiBBUkM0VUludDY0KSAtPiBWb3VjaGVySW5mbzoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3ZvdWNoZXJzL2NvbnRyYWN0LnB5Ojk1CiAgICAvLyBhc3NlcnQgdm91Y2hlcl9pZCBpbiBzZWxmLnZvdWNoZXJzLCAiVm91Y2hlciBub3QgZm91bmQiCiAgICBieXRlYyAxNiAvLyAidm91Y2hlcnMiCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBWb3VjaGVyIG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3ZvdWNoZXJzL2NvbnRyYWN0LnB5Ojk2CiAgICAvLyByZXR1cm4gc2VsZi52b3VjaGVyc1t2b3VjaGVyX2lkXQogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm91Y2hlcnMgZW50cnkgZXhpc3RzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWlkY2hhaW5fdm91Y2hlcnMuY29udHJhY3QuQWlkY2hhaW5Wb3VjaGVycy5nZXRfdm91Y2hlcl9jb3VudCgpIC0+IHVpbnQ2NDoKZ2V0X3ZvdWNoZXJfY291bnQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fdm91Y2hlcnMvY29udHJhY3QucHk6MTAxCiAgICAvLyByZXR1cm4gc2VsZi52b3VjaGVyX2NvdW50ZXIudmFsdWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vICJ2b3VjaGVyX2NvdW50ZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm91Y2hlcl9jb3VudGVyIGV4aXN0cwogICAgcmV0c3ViCg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "cblocks", "sourceInfo": [{"pc": [1724], "errorMessage": "Amount must be greater than zero"}, {"pc": [1174], "errorMessage": "App is not updatable"}, {"pc": [1406, 1551], "errorMessage": "Campaign ID cannot be zero"}, {"pc": [1403, 1548], "errorMessage": "Campaign ID out of range"}, {"pc": [1417, 1563, 1799], "errorMessage": "Campaign not found"}, {"pc": [1929], "errorMessage": "Delivery ID cannot be zero"}, {"pc": [1926], "errorMessage": "Delivery ID out of range"}, {"pc": [1941, 2023], "errorMessage": "Delivery not found"}, {"pc": [1634, 1721], "errorMessage": "Milestone ID cannot be zero"}, {"pc": [1631, 1718], "errorMessage": "Milestone ID out of range"}, {"pc": [1646, 1815], "errorMessage": "Milestone not found"}, {"pc": [258, 275, 294, 340, 378, 428, 454, 471, 490, 524, 553, 570, 589, 608, 656, 694, 728, 759, 793, 818, 835, 863, 880, 913, 932, 979, 996, 1025, 1055], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [1180], "errorMessage": "Only creator can update"}, {"pc": [1301], "errorMessage": "Organization not found"}, {"pc": [2259], "errorMessage": "Voucher not found"}, {"pc": [1101], "errorMessage": "can only call when creating"}, {"pc": [261, 278, 297, 343, 381, 431, 457, 474, 493, 527, 556, 573, 592, 611, 659, 697, 731, 762, 796, 821, 838, 866, 883, 916, 935, 982, 999, 1028, 1058, 1092], "errorMessage": "can only call when not creating"}, {"pc": [1311, 1391, 1399, 1544], "errorMessage": "check self.campaign_counter exists"}, {"pc": [1801], "errorMessage": "check self.campaigns entry exists"}, {"pc": [1944, 2025], "errorMessage": "check self.deliveries entry exists"}, {"pc": [1830, 1922, 2030], "errorMessage": "check self.delivery_counter exists"}, {"pc": [1567, 1627, 1714, 1822], "errorMessage": "check self.milestone_counter exists"}, {"pc": [1649, 1817], "errorMessage": "check self.milestones entry exists"}, {"pc": [1205, 1287], "errorMessage": "check self.organization_counter exists"}, {"pc": [1303], "errorMessage": "check self.organizations entry exists"}, {"pc": [1424, 1467], "errorMessage": "check self.total_donations exists"}, {"pc": [1663], "errorMessage": "check self.total_milestones_completed exists"}, {"pc": [1275], "errorMessage": "check self.total_organizations exists"}, {"pc": [2088, 2147, 2267], "errorMessage": "check self.voucher_counter exists"}, {"pc": [2261], "errorMessage": "check self.vouchers entry exists"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {"UPDATABLE": {"type": "AVMUint64"}}}"""
+
+@functools.cache
+def _get_app_spec() -> algokit_utils.Arc56Contract:
+    """Parses the embedded app spec on first use and reuses it for the rest of the process"""
+    return algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+
+def __getattr__(name: str) -> typing.Any:
+    # Keeps `from <client> import APP_SPEC` working without parsing the spec at import time
+    if name == "APP_SPEC":
+        return _get_app_spec()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
     """Helper to parse ABI args into the format expected by underlying client"""
@@ -64,7 +76,7 @@ def _init_dataclass(cls: type, data: dict) -> object:
             field_values[field.name] = field_value
     return cls(**field_values)
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class CampaignInfo:
     """Struct for CampaignInfo"""
     id: int
@@ -74,7 +86,7 @@ class CampaignInfo:
     creator: str
     active: int
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class DeliveryRecord:
     """Struct for DeliveryRecord"""
     id: int
@@ -83,7 +95,7 @@ class DeliveryRecord:
     agent: str
     verified: int
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class MilestoneInfo:
     """Struct for MilestoneInfo"""
     id: int
@@ -93,7 +105,7 @@ class MilestoneInfo:
     completed: int
     funds_released: int
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class OrganizationInfo:
     """Struct for OrganizationInfo"""
     id: int
@@ -101,7 +113,7 @@ class OrganizationInfo:
     wallet_address: str
     verification_level: int
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class VoucherInfo:
     """Struct for VoucherInfo"""
     id: int
@@ -111,7 +123,7 @@ class VoucherInfo:
     issued: int
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class HelloArgs:
     """Dataclass for hello arguments"""
     name: str
@@ -120,7 +132,7 @@ class HelloArgs:
     def abi_method_signature(self) -> str:
         return "hello(string)string"
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class RegisterOrganizationArgs:
     """Dataclass for register_organization arguments"""
     org_name: str
@@ -130,7 +142,16 @@ class RegisterOrganizationArgs:
     def abi_method_signature(self) -> str:
         return "register_organization(string,string)uint64"
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class GetOrganizationDetailsArgs:
+    """Dataclass for get_organization_details arguments"""
+    org_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_organization_details(uint64)(uint64,string,string,uint64)"
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class CreateCampaignArgs:
     """Dataclass for create_campaign arguments"""
     title: str
@@ -141,7 +162,7 @@ class CreateCampaignArgs:
     def abi_method_signature(self) -> str:
         return "create_campaign(string,uint64,string)uint64"
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class CreateDonationArgs:
     """Dataclass for create_donation arguments"""
     campaign_id: int
@@ -150,7 +171,7 @@ class CreateDonationArgs:
     def abi_method_signature(self) -> str:
         return "create_donation(uint64)string"
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class CalculateTotalArgs:
     """Dataclass for calculate_total arguments"""
     amount1: int
@@ -160,7 +181,7 @@ class CalculateTotalArgs:
     def abi_method_signature(self) -> str:
         return "calculate_total(uint64,uint64)uint64"
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class ValidateDonationArgs:
     """Dataclass for validate_donation arguments"""
     amount: int
@@ -170,7 +191,57 @@ class ValidateDonationArgs:
     def abi_method_signature(self) -> str:
         return "validate_donation(uint64,string)string"
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class CreateMilestoneArgs:
+    """Dataclass for create_milestone arguments"""
+    campaign_id: int
+    target_amount: int
+    description: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "create_milestone(uint64,uint64,string)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class CompleteMilestoneArgs:
+    """Dataclass for complete_milestone arguments"""
+    milestone_id: int
+    proof: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "complete_milestone(uint64,string)string"
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class ReleaseMilestoneFundsArgs:
+    """Dataclass for release_milestone_funds arguments"""
+    milestone_id: int
+    recipient: str | bytes
+    amount: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "release_milestone_funds(uint64,account,uint64)string"
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class GetCampaignDetailsArgs:
+    """Dataclass for get_campaign_details arguments"""
+    campaign_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_campaign_details(uint64)(uint64,string,uint64,uint64,string,uint64)"
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class GetMilestoneDetailsArgs:
+    """Dataclass for get_milestone_details arguments"""
+    milestone_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_milestone_details(uint64)(uint64,uint64,uint64,string,uint64,uint64)"
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class LogDeliveryArgs:
     """Dataclass for log_delivery arguments"""
     recipient: str
@@ -180,7 +251,7 @@ class LogDeliveryArgs:
     def abi_method_signature(self) -> str:
         return "log_delivery(string,string)uint64"
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class VerifyDeliveryArgs:
     """Dataclass for verify_delivery arguments"""
     delivery_id: int
@@ -190,7 +261,16 @@ class VerifyDeliveryArgs:
     def abi_method_signature(self) -> str:
         return "verify_delivery(uint64,string)string"
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class GetDeliveryDetailsArgs:
+    """Dataclass for get_delivery_details arguments"""
+    delivery_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_delivery_details(uint64)(uint64,string,string,string,uint64)"
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class CreateVoucherAssetArgs:
     """Dataclass for create_voucher_asset arguments"""
     asset_name: str
@@ -200,7 +280,7 @@ class CreateVoucherAssetArgs:
     def abi_method_signature(self) -> str:
         return "create_voucher_asset(string,uint64)uint64"
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class DistributeVouchersArgs:
     """Dataclass for distribute_vouchers arguments"""
     asset_id: int
@@ -211,7 +291,7 @@ class DistributeVouchersArgs:
     def abi_method_signature(self) -> str:
         return "distribute_vouchers(uint64,string,uint64)string"
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class RedeemVoucherArgs:
     """Dataclass for redeem_voucher arguments"""
     voucher_id: int
@@ -222,57 +302,7 @@ class RedeemVoucherArgs:
     def abi_method_signature(self) -> str:
         return "redeem_voucher(uint64,string,uint64)string"
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
-class CreateMilestoneArgs:
-    """Dataclass for create_milestone arguments"""
-    campaign_id: int
-    target_amount: int
-    description: str
-
-    @property
-    def abi_method_signature(self) -> str:
-        return "create_milestone(uint64,uint64,string)uint64"
-
-@dataclasses.dataclass(frozen=True, kw_only=True)
-class CompleteMilestoneArgs:
-    """Dataclass for complete_milestone arguments"""
-    milestone_id: int
-    proof: str
-
-    @property
-    def abi_method_signature(self) -> str:
-        return "complete_milestone(uint64,string)string"
-
-@dataclasses.dataclass(frozen=True, kw_only=True)
-class ReleaseMilestoneFundsArgs:
-    """Dataclass for release_milestone_funds arguments"""
-    milestone_id: int
-    recipient: str | bytes
-    amount: int
-
-    @property
-    def abi_method_signature(self) -> str:
-        return "release_milestone_funds(uint64,account,uint64)string"
-
-@dataclasses.dataclass(frozen=True, kw_only=True)
-class GetCampaignDetailsArgs:
-    """Dataclass for get_campaign_details arguments"""
-    campaign_id: int
-
-    @property
-    def abi_method_signature(self) -> str:
-        return "get_campaign_details(uint64)(uint64,string,uint64,uint64,string,uint64)"
-
-@dataclasses.dataclass(frozen=True, kw_only=True)
-class GetOrganizationDetailsArgs:
-    """Dataclass for get_organization_details arguments"""
-    org_id: int
-
-    @property
-    def abi_method_signature(self) -> str:
-        return "get_organization_details(uint64)(uint64,string,string,uint64)"
-
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class GetVoucherDetailsArgs:
     """Dataclass for get_voucher_details arguments"""
     voucher_id: int
@@ -281,29 +311,36 @@ class GetVoucherDetailsArgs:
     def abi_method_signature(self) -> str:
         return "get_voucher_details(uint64)(uint64,uint64,string,uint64,uint64)"
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
-class GetMilestoneDetailsArgs:
-    """Dataclass for get_milestone_details arguments"""
-    milestone_id: int
-
-    @property
-    def abi_method_signature(self) -> str:
-        return "get_milestone_details(uint64)(uint64,uint64,uint64,string,uint64,uint64)"
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
-class GetDeliveryDetailsArgs:
-    """Dataclass for get_delivery_details arguments"""
-    delivery_id: int
+class _AidchainContractsUpdate:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
 
-    @property
-    def abi_method_signature(self) -> str:
-        return "get_delivery_details(uint64)(uint64,string,string,string,uint64)"
+    def bare(
+        self, params: algokit_utils.AppClientBareCallParams | None = None
+    ) -> algokit_utils.AppUpdateParams:
+        return self.app_client.params.bare.update(params)
 
 
 class AidchainContractsParams:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
+    @property
+    def update(self) -> "_AidchainContractsUpdate":
+        return _AidchainContractsUpdate(self.app_client)
+
+    def initialize(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "initialize()string",
+        }))
+
     def hello(
         self,
         args: tuple[str] | HelloArgs,
@@ -317,7 +354,20 @@ class AidchainContractsParams:
             "args": method_args,
         }))
 
-    def initialize(
+    def register_organization(
+        self,
+        args: tuple[str, str] | RegisterOrganizationArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "register_organization(string,string)uint64",
+            "args": method_args,
+        }))
+
+    def get_organization_count(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
@@ -325,47 +375,47 @@ class AidchainContractsParams:
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "initialize()string",
+            "method": "get_organization_count()uint64",
         }))
 
-    def register_organization(
+    def get_contract_stats(
         self,
-        args: tuple[str, str] | RegisterOrganizationArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-        method_args = _parse_abi_args(args)
+    
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "register_organization(string,string)uint64",
-            "args": method_args,
+            "method": "get_contract_stats()string",
         }))
 
-    def create_campaign(
+    def get_organization_details(
         self,
-        args: tuple[str, int, str] | CreateCampaignArgs,
+        args: tuple[int] | GetOrganizationDetailsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "create_campaign(string,uint64,string)uint64",
+            "method": "get_organization_details(uint64)(uint64,string,string,uint64)",
             "args": method_args,
         }))
 
-    def get_campaign_count(
+    def create_campaign(
         self,
+        args: tuple[str, int, str] | CreateCampaignArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-    
+        method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_campaign_count()uint64",
+            "method": "create_campaign(string,uint64,string)uint64",
+            "args": method_args,
         }))
 
-    def get_organization_count(
+    def get_campaign_count(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
@@ -373,7 +423,7 @@ class AidchainContractsParams:
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_organization_count()uint64",
+            "method": "get_campaign_count()uint64",
         }))
 
     def create_donation(
@@ -426,83 +476,83 @@ class AidchainContractsParams:
             "args": method_args,
         }))
 
-    def log_delivery(
+    def create_milestone(
         self,
-        args: tuple[str, str] | LogDeliveryArgs,
+        args: tuple[int, int, str] | CreateMilestoneArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "log_delivery(string,string)uint64",
+            "method": "create_milestone(uint64,uint64,string)uint64",
             "args": method_args,
         }))
 
-    def verify_delivery(
+    def complete_milestone(
         self,
-        args: tuple[int, str] | VerifyDeliveryArgs,
+        args: tuple[int, str] | CompleteMilestoneArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "verify_delivery(uint64,string)string",
+            "method": "complete_milestone(uint64,string)string",
             "args": method_args,
         }))
 
-    def get_contract_stats(
+    def release_milestone_funds(
         self,
+        args: tuple[int, str | bytes, int] | ReleaseMilestoneFundsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-    
+        method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_contract_stats()string",
+            "method": "release_milestone_funds(uint64,account,uint64)string",
+            "args": method_args,
         }))
 
-    def create_voucher_asset(
+    def get_milestone_stats(
         self,
-        args: tuple[str, int] | CreateVoucherAssetArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-        method_args = _parse_abi_args(args)
+    
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "create_voucher_asset(string,uint64)uint64",
-            "args": method_args,
+            "method": "get_milestone_stats()string",
         }))
 
-    def distribute_vouchers(
+    def get_campaign_details(
         self,
-        args: tuple[int, str, int] | DistributeVouchersArgs,
+        args: tuple[int] | GetCampaignDetailsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "distribute_vouchers(uint64,string,uint64)string",
+            "method": "get_campaign_details(uint64)(uint64,string,uint64,uint64,string,uint64)",
             "args": method_args,
         }))
 
-    def redeem_voucher(
+    def get_milestone_details(
         self,
-        args: tuple[int, str, int] | RedeemVoucherArgs,
+        args: tuple[int] | GetMilestoneDetailsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "redeem_voucher(uint64,string,uint64)string",
+            "method": "get_milestone_details(uint64)(uint64,uint64,uint64,string,uint64,uint64)",
             "args": method_args,
         }))
 
-    def get_voucher_stats(
+    def get_milestone_count(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
@@ -510,49 +560,49 @@ class AidchainContractsParams:
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_voucher_stats()string",
+            "method": "get_milestone_count()uint64",
         }))
 
-    def create_milestone(
+    def log_delivery(
         self,
-        args: tuple[int, int, str] | CreateMilestoneArgs,
+        args: tuple[str, str] | LogDeliveryArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "create_milestone(uint64,uint64,string)uint64",
+            "method": "log_delivery(string,string)uint64",
             "args": method_args,
         }))
 
-    def complete_milestone(
+    def verify_delivery(
         self,
-        args: tuple[int, str] | CompleteMilestoneArgs,
+        args: tuple[int, str] | VerifyDeliveryArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "complete_milestone(uint64,string)string",
+            "method": "verify_delivery(uint64,string)string",
             "args": method_args,
         }))
 
-    def release_milestone_funds(
+    def get_delivery_details(
         self,
-        args: tuple[int, str | bytes, int] | ReleaseMilestoneFundsArgs,
+        args: tuple[int] | GetDeliveryDetailsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "release_milestone_funds(uint64,account,uint64)string",
+            "method": "get_delivery_details(uint64)(uint64,string,string,string,uint64)",
             "args": method_args,
         }))
 
-    def get_milestone_stats(
+    def get_delivery_count(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
@@ -560,85 +610,72 @@ class AidchainContractsParams:
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_milestone_stats()string",
+            "method": "get_delivery_count()uint64",
         }))
 
-    def get_campaign_details(
+    def create_voucher_asset(
         self,
-        args: tuple[int] | GetCampaignDetailsArgs,
+        args: tuple[str, int] | CreateVoucherAssetArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_campaign_details(uint64)(uint64,string,uint64,uint64,string,uint64)",
+            "method": "create_voucher_asset(string,uint64)uint64",
             "args": method_args,
         }))
 
-    def get_organization_details(
+    def distribute_vouchers(
         self,
-        args: tuple[int] | GetOrganizationDetailsArgs,
+        args: tuple[int, str, int] | DistributeVouchersArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_organization_details(uint64)(uint64,string,string,uint64)",
+            "method": "distribute_vouchers(uint64,string,uint64)string",
             "args": method_args,
         }))
 
-    def get_voucher_details(
+    def redeem_voucher(
         self,
-        args: tuple[int] | GetVoucherDetailsArgs,
+        args: tuple[int, str, int] | RedeemVoucherArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_voucher_details(uint64)(uint64,uint64,string,uint64,uint64)",
+            "method": "redeem_voucher(uint64,string,uint64)string",
             "args": method_args,
         }))
 
-    def get_milestone_details(
+    def get_voucher_stats(
         self,
-        args: tuple[int] | GetMilestoneDetailsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-        method_args = _parse_abi_args(args)
+    
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_milestone_details(uint64)(uint64,uint64,uint64,string,uint64,uint64)",
-            "args": method_args,
+            "method": "get_voucher_stats()string",
         }))
 
-    def get_delivery_details(
+    def get_voucher_details(
         self,
-        args: tuple[int] | GetDeliveryDetailsArgs,
+        args: tuple[int] | GetVoucherDetailsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_delivery_details(uint64)(uint64,string,string,string,uint64)",
+            "method": "get_voucher_details(uint64)(uint64,uint64,string,uint64,uint64)",
             "args": method_args,
         }))
 
-    def get_milestone_count(
-        self,
-        params: algokit_utils.CommonAppCallParams | None = None
-    ) -> algokit_utils.AppCallMethodCallParams:
-    
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "get_milestone_count()uint64",
-        }))
-
     def get_voucher_count(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -650,17 +687,6 @@ class AidchainContractsParams:
             "method": "get_voucher_count()uint64",
         }))
 
-    def get_delivery_count(
-        self,
-        params: algokit_utils.CommonAppCallParams | None = None
-    ) -> algokit_utils.AppCallMethodCallParams:
-    
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "get_delivery_count()uint64",
-        }))
-
     def clear_state(
         self,
         params: algokit_utils.AppClientBareCallParams | None = None,
@@ -672,10 +698,33 @@ class AidchainContractsParams:
         )
 
 
+class _AidchainContractsUpdateTransaction:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def bare(self, params: algokit_utils.AppClientBareCallParams | None = None) -> Transaction:
+        return self.app_client.create_transaction.bare.update(params)
+
+
 class AidchainContractsCreateTransactionParams:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
+    @property
+    def update(self) -> "_AidchainContractsUpdateTransaction":
+        return _AidchainContractsUpdateTransaction(self.app_client)
+
+    def initialize(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "initialize()string",
+        }))
+
     def hello(
         self,
         args: tuple[str] | HelloArgs,
@@ -689,7 +738,20 @@ class AidchainContractsCreateTransactionParams:
             "args": method_args,
         }))
 
-    def initialize(
+    def register_organization(
+        self,
+        args: tuple[str, str] | RegisterOrganizationArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "register_organization(string,string)uint64",
+            "args": method_args,
+        }))
+
+    def get_organization_count(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
@@ -697,47 +759,47 @@ class AidchainContractsCreateTransactionParams:
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "initialize()string",
+            "method": "get_organization_count()uint64",
         }))
 
-    def register_organization(
+    def get_contract_stats(
         self,
-        args: tuple[str, str] | RegisterOrganizationArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-        method_args = _parse_abi_args(args)
+    
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "register_organization(string,string)uint64",
-            "args": method_args,
+            "method": "get_contract_stats()string",
         }))
 
-    def create_campaign(
+    def get_organization_details(
         self,
-        args: tuple[str, int, str] | CreateCampaignArgs,
+        args: tuple[int] | GetOrganizationDetailsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "create_campaign(string,uint64,string)uint64",
+            "method": "get_organization_details(uint64)(uint64,string,string,uint64)",
             "args": method_args,
         }))
 
-    def get_campaign_count(
+    def create_campaign(
         self,
+        args: tuple[str, int, str] | CreateCampaignArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-    
+        method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_campaign_count()uint64",
+            "method": "create_campaign(string,uint64,string)uint64",
+            "args": method_args,
         }))
 
-    def get_organization_count(
+    def get_campaign_count(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
@@ -745,7 +807,7 @@ class AidchainContractsCreateTransactionParams:
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_organization_count()uint64",
+            "method": "get_campaign_count()uint64",
         }))
 
     def create_donation(
@@ -798,83 +860,83 @@ class AidchainContractsCreateTransactionParams:
             "args": method_args,
         }))
 
-    def log_delivery(
+    def create_milestone(
         self,
-        args: tuple[str, str] | LogDeliveryArgs,
+        args: tuple[int, int, str] | CreateMilestoneArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "log_delivery(string,string)uint64",
+            "method": "create_milestone(uint64,uint64,string)uint64",
             "args": method_args,
         }))
 
-    def verify_delivery(
+    def complete_milestone(
         self,
-        args: tuple[int, str] | VerifyDeliveryArgs,
+        args: tuple[int, str] | CompleteMilestoneArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "verify_delivery(uint64,string)string",
+            "method": "complete_milestone(uint64,string)string",
             "args": method_args,
         }))
 
-    def get_contract_stats(
+    def release_milestone_funds(
         self,
+        args: tuple[int, str | bytes, int] | ReleaseMilestoneFundsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-    
+        method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_contract_stats()string",
+            "method": "release_milestone_funds(uint64,account,uint64)string",
+            "args": method_args,
         }))
 
-    def create_voucher_asset(
+    def get_milestone_stats(
         self,
-        args: tuple[str, int] | CreateVoucherAssetArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-        method_args = _parse_abi_args(args)
+    
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "create_voucher_asset(string,uint64)uint64",
-            "args": method_args,
+            "method": "get_milestone_stats()string",
         }))
 
-    def distribute_vouchers(
+    def get_campaign_details(
         self,
-        args: tuple[int, str, int] | DistributeVouchersArgs,
+        args: tuple[int] | GetCampaignDetailsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "distribute_vouchers(uint64,string,uint64)string",
+            "method": "get_campaign_details(uint64)(uint64,string,uint64,uint64,string,uint64)",
             "args": method_args,
         }))
 
-    def redeem_voucher(
+    def get_milestone_details(
         self,
-        args: tuple[int, str, int] | RedeemVoucherArgs,
+        args: tuple[int] | GetMilestoneDetailsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "redeem_voucher(uint64,string,uint64)string",
+            "method": "get_milestone_details(uint64)(uint64,uint64,uint64,string,uint64,uint64)",
             "args": method_args,
         }))
 
-    def get_voucher_stats(
+    def get_milestone_count(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
@@ -882,49 +944,49 @@ class AidchainContractsCreateTransactionParams:
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_voucher_stats()string",
+            "method": "get_milestone_count()uint64",
         }))
 
-    def create_milestone(
+    def log_delivery(
         self,
-        args: tuple[int, int, str] | CreateMilestoneArgs,
+        args: tuple[str, str] | LogDeliveryArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "create_milestone(uint64,uint64,string)uint64",
+            "method": "log_delivery(string,string)uint64",
             "args": method_args,
         }))
 
-    def complete_milestone(
+    def verify_delivery(
         self,
-        args: tuple[int, str] | CompleteMilestoneArgs,
+        args: tuple[int, str] | VerifyDeliveryArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "complete_milestone(uint64,string)string",
+            "method": "verify_delivery(uint64,string)string",
             "args": method_args,
         }))
 
-    def release_milestone_funds(
+    def get_delivery_details(
         self,
-        args: tuple[int, str | bytes, int] | ReleaseMilestoneFundsArgs,
+        args: tuple[int] | GetDeliveryDetailsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "release_milestone_funds(uint64,account,uint64)string",
+            "method": "get_delivery_details(uint64)(uint64,string,string,string,uint64)",
             "args": method_args,
         }))
 
-    def get_milestone_stats(
+    def get_delivery_count(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
@@ -932,85 +994,72 @@ class AidchainContractsCreateTransactionParams:
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_milestone_stats()string",
+            "method": "get_delivery_count()uint64",
         }))
 
-    def get_campaign_details(
+    def create_voucher_asset(
         self,
-        args: tuple[int] | GetCampaignDetailsArgs,
+        args: tuple[str, int] | CreateVoucherAssetArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_campaign_details(uint64)(uint64,string,uint64,uint64,string,uint64)",
+            "method": "create_voucher_asset(string,uint64)uint64",
             "args": method_args,
         }))
 
-    def get_organization_details(
+    def distribute_vouchers(
         self,
-        args: tuple[int] | GetOrganizationDetailsArgs,
+        args: tuple[int, str, int] | DistributeVouchersArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_organization_details(uint64)(uint64,string,string,uint64)",
+            "method": "distribute_vouchers(uint64,string,uint64)string",
             "args": method_args,
         }))
 
-    def get_voucher_details(
+    def redeem_voucher(
         self,
-        args: tuple[int] | GetVoucherDetailsArgs,
+        args: tuple[int, str, int] | RedeemVoucherArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_voucher_details(uint64)(uint64,uint64,string,uint64,uint64)",
+            "method": "redeem_voucher(uint64,string,uint64)string",
             "args": method_args,
         }))
 
-    def get_milestone_details(
+    def get_voucher_stats(
         self,
-        args: tuple[int] | GetMilestoneDetailsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-        method_args = _parse_abi_args(args)
+    
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_milestone_details(uint64)(uint64,uint64,uint64,string,uint64,uint64)",
-            "args": method_args,
+            "method": "get_voucher_stats()string",
         }))
 
-    def get_delivery_details(
+    def get_voucher_details(
         self,
-        args: tuple[int] | GetDeliveryDetailsArgs,
+        args: tuple[int] | GetVoucherDetailsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_delivery_details(uint64)(uint64,string,string,string,uint64)",
+            "method": "get_voucher_details(uint64)(uint64,uint64,string,uint64,uint64)",
             "args": method_args,
         }))
 
-    def get_milestone_count(
-        self,
-        params: algokit_utils.CommonAppCallParams | None = None
-    ) -> algokit_utils.BuiltTransactions:
-    
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "get_milestone_count()uint64",
-        }))
-
     def get_voucher_count(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -1022,17 +1071,6 @@ class AidchainContractsCreateTransactionParams:
             "method": "get_voucher_count()uint64",
         }))
 
-    def get_delivery_count(
-        self,
-        params: algokit_utils.CommonAppCallParams | None = None
-    ) -> algokit_utils.BuiltTransactions:
-    
-        params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "get_delivery_count()uint64",
-        }))
-
     def clear_state(
         self,
         params: algokit_utils.AppClientBareCallParams | None = None,
@@ -1044,36 +1082,57 @@ class AidchainContractsCreateTransactionParams:
         )
 
 
+class _AidchainContractsUpdateSend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def bare(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult:
+        return self.app_client.send.bare.update(
+            params=params,
+            send_params=send_params,
+            compilation_params=compilation_params
+        )
+
+
 class AidchainContractsSend:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
-    def hello(
+    @property
+    def update(self) -> "_AidchainContractsUpdateSend":
+        return _AidchainContractsUpdateSend(self.app_client)
+
+    def initialize(
         self,
-        args: tuple[str] | HelloArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[str]:
-        method_args = _parse_abi_args(args)
+    
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "hello(string)string",
-            "args": method_args,
+            "method": "initialize()string",
         }), send_params=send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
-    def initialize(
+    def hello(
         self,
+        args: tuple[str] | HelloArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[str]:
-    
+        method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "initialize()string",
+            "method": "hello(string)string",
+            "args": method_args,
         }), send_params=send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
@@ -1094,37 +1153,67 @@ class AidchainContractsSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
-    def create_campaign(
+    def get_organization_count(
         self,
-        args: tuple[str, int, str] | CreateCampaignArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[int]:
-        method_args = _parse_abi_args(args)
+    
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "create_campaign(string,uint64,string)uint64",
-            "args": method_args,
+            "method": "get_organization_count()uint64",
         }), send_params=send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
-    def get_campaign_count(
+    def get_contract_stats(
         self,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[int]:
+    ) -> algokit_utils.SendAppTransactionResult[str]:
     
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_campaign_count()uint64",
+            "method": "get_contract_stats()string",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def get_organization_details(
+        self,
+        args: tuple[int] | GetOrganizationDetailsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[OrganizationInfo]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_organization_details(uint64)(uint64,string,string,uint64)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(OrganizationInfo, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[OrganizationInfo], parsed_response)
+
+    def create_campaign(
+        self,
+        args: tuple[str, int, str] | CreateCampaignArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_campaign(string,uint64,string)uint64",
+            "args": method_args,
         }), send_params=send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
-    def get_organization_count(
+    def get_campaign_count(
         self,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
@@ -1133,7 +1222,7 @@ class AidchainContractsSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_organization_count()uint64",
+            "method": "get_campaign_count()uint64",
         }), send_params=send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
@@ -1200,9 +1289,9 @@ class AidchainContractsSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
-    def log_delivery(
+    def create_milestone(
         self,
-        args: tuple[str, str] | LogDeliveryArgs,
+        args: tuple[int, int, str] | CreateMilestoneArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[int]:
@@ -1210,15 +1299,15 @@ class AidchainContractsSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "log_delivery(string,string)uint64",
+            "method": "create_milestone(uint64,uint64,string)uint64",
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
-    def verify_delivery(
+    def complete_milestone(
         self,
-        args: tuple[int, str] | VerifyDeliveryArgs,
+        args: tuple[int, str] | CompleteMilestoneArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[str]:
@@ -1226,91 +1315,91 @@ class AidchainContractsSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "verify_delivery(uint64,string)string",
+            "method": "complete_milestone(uint64,string)string",
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
-    def get_contract_stats(
+    def release_milestone_funds(
         self,
+        args: tuple[int, str | bytes, int] | ReleaseMilestoneFundsArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[str]:
-    
+        method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_contract_stats()string",
+            "method": "release_milestone_funds(uint64,account,uint64)string",
+            "args": method_args,
         }), send_params=send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
-    def create_voucher_asset(
+    def get_milestone_stats(
         self,
-        args: tuple[str, int] | CreateVoucherAssetArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[int]:
-        method_args = _parse_abi_args(args)
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+    
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "create_voucher_asset(string,uint64)uint64",
-            "args": method_args,
+            "method": "get_milestone_stats()string",
         }), send_params=send_params)
         parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
-    def distribute_vouchers(
+    def get_campaign_details(
         self,
-        args: tuple[int, str, int] | DistributeVouchersArgs,
+        args: tuple[int] | GetCampaignDetailsArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[str]:
+    ) -> algokit_utils.SendAppTransactionResult[CampaignInfo]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "distribute_vouchers(uint64,string,uint64)string",
+            "method": "get_campaign_details(uint64)(uint64,string,uint64,uint64,string,uint64)",
             "args": method_args,
         }), send_params=send_params)
-        parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(CampaignInfo, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[CampaignInfo], parsed_response)
 
-    def redeem_voucher(
+    def get_milestone_details(
         self,
-        args: tuple[int, str, int] | RedeemVoucherArgs,
+        args: tuple[int] | GetMilestoneDetailsArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[str]:
+    ) -> algokit_utils.SendAppTransactionResult[MilestoneInfo]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "redeem_voucher(uint64,string,uint64)string",
+            "method": "get_milestone_details(uint64)(uint64,uint64,uint64,string,uint64,uint64)",
             "args": method_args,
         }), send_params=send_params)
-        parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(MilestoneInfo, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[MilestoneInfo], parsed_response)
 
-    def get_voucher_stats(
+    def get_milestone_count(
         self,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[str]:
+    ) -> algokit_utils.SendAppTransactionResult[int]:
     
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_voucher_stats()string",
+            "method": "get_milestone_count()uint64",
         }), send_params=send_params)
         parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
-    def create_milestone(
+    def log_delivery(
         self,
-        args: tuple[int, int, str] | CreateMilestoneArgs,
+        args: tuple[str, str] | LogDeliveryArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[int]:
@@ -1318,15 +1407,15 @@ class AidchainContractsSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "create_milestone(uint64,uint64,string)uint64",
+            "method": "log_delivery(string,string)uint64",
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
-    def complete_milestone(
+    def verify_delivery(
         self,
-        args: tuple[int, str] | CompleteMilestoneArgs,
+        args: tuple[int, str] | VerifyDeliveryArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[str]:
@@ -1334,135 +1423,119 @@ class AidchainContractsSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "complete_milestone(uint64,string)string",
+            "method": "verify_delivery(uint64,string)string",
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
-    def release_milestone_funds(
+    def get_delivery_details(
         self,
-        args: tuple[int, str | bytes, int] | ReleaseMilestoneFundsArgs,
+        args: tuple[int] | GetDeliveryDetailsArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[str]:
+    ) -> algokit_utils.SendAppTransactionResult[DeliveryRecord]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "release_milestone_funds(uint64,account,uint64)string",
+            "method": "get_delivery_details(uint64)(uint64,string,string,string,uint64)",
             "args": method_args,
         }), send_params=send_params)
-        parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(DeliveryRecord, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[DeliveryRecord], parsed_response)
 
-    def get_milestone_stats(
+    def get_delivery_count(
         self,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[str]:
+    ) -> algokit_utils.SendAppTransactionResult[int]:
     
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_milestone_stats()string",
+            "method": "get_delivery_count()uint64",
         }), send_params=send_params)
         parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
-    def get_campaign_details(
+    def create_voucher_asset(
         self,
-        args: tuple[int] | GetCampaignDetailsArgs,
+        args: tuple[str, int] | CreateVoucherAssetArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[CampaignInfo]:
+    ) -> algokit_utils.SendAppTransactionResult[int]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_campaign_details(uint64)(uint64,string,uint64,uint64,string,uint64)",
+            "method": "create_voucher_asset(string,uint64)uint64",
             "args": method_args,
         }), send_params=send_params)
-        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(CampaignInfo, typing.cast(dict, response.abi_return))) # type: ignore
-        return typing.cast(algokit_utils.SendAppTransactionResult[CampaignInfo], parsed_response)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
-    def get_organization_details(
+    def distribute_vouchers(
         self,
-        args: tuple[int] | GetOrganizationDetailsArgs,
+        args: tuple[int, str, int] | DistributeVouchersArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[OrganizationInfo]:
+    ) -> algokit_utils.SendAppTransactionResult[str]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_organization_details(uint64)(uint64,string,string,uint64)",
+            "method": "distribute_vouchers(uint64,string,uint64)string",
             "args": method_args,
         }), send_params=send_params)
-        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(OrganizationInfo, typing.cast(dict, response.abi_return))) # type: ignore
-        return typing.cast(algokit_utils.SendAppTransactionResult[OrganizationInfo], parsed_response)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
-    def get_voucher_details(
+    def redeem_voucher(
         self,
-        args: tuple[int] | GetVoucherDetailsArgs,
+        args: tuple[int, str, int] | RedeemVoucherArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[VoucherInfo]:
+    ) -> algokit_utils.SendAppTransactionResult[str]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_voucher_details(uint64)(uint64,uint64,string,uint64,uint64)",
+            "method": "redeem_voucher(uint64,string,uint64)string",
             "args": method_args,
         }), send_params=send_params)
-        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(VoucherInfo, typing.cast(dict, response.abi_return))) # type: ignore
-        return typing.cast(algokit_utils.SendAppTransactionResult[VoucherInfo], parsed_response)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
-    def get_milestone_details(
+    def get_voucher_stats(
         self,
-        args: tuple[int] | GetMilestoneDetailsArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[MilestoneInfo]:
-        method_args = _parse_abi_args(args)
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+    
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_milestone_details(uint64)(uint64,uint64,uint64,string,uint64,uint64)",
-            "args": method_args,
+            "method": "get_voucher_stats()string",
         }), send_params=send_params)
-        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(MilestoneInfo, typing.cast(dict, response.abi_return))) # type: ignore
-        return typing.cast(algokit_utils.SendAppTransactionResult[MilestoneInfo], parsed_response)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
-    def get_delivery_details(
+    def get_voucher_details(
         self,
-        args: tuple[int] | GetDeliveryDetailsArgs,
+        args: tuple[int] | GetVoucherDetailsArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[DeliveryRecord]:
+    ) -> algokit_utils.SendAppTransactionResult[VoucherInfo]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_delivery_details(uint64)(uint64,string,string,string,uint64)",
+            "method": "get_voucher_details(uint64)(uint64,uint64,string,uint64,uint64)",
             "args": method_args,
         }), send_params=send_params)
-        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(DeliveryRecord, typing.cast(dict, response.abi_return))) # type: ignore
-        return typing.cast(algokit_utils.SendAppTransactionResult[DeliveryRecord], parsed_response)
-
-    def get_milestone_count(
-        self,
-        params: algokit_utils.CommonAppCallParams | None = None,
-        send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[int]:
-    
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "get_milestone_count()uint64",
-        }), send_params=send_params)
-        parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(VoucherInfo, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[VoucherInfo], parsed_response)
 
     def get_voucher_count(
         self,
@@ -1478,20 +1551,6 @@ class AidchainContractsSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
-    def get_delivery_count(
-        self,
-        params: algokit_utils.CommonAppCallParams | None = None,
-        send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[int]:
-    
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "get_delivery_count()uint64",
-        }), send_params=send_params)
-        parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
-
     def clear_state(
         self,
         params: algokit_utils.AppClientBareCallParams | None = None,
@@ -1505,15 +1564,15 @@ class AidchainContractsSend:
 
 class GlobalStateValue(typing.TypedDict):
     """Shape of global_state state key values"""
-    campaign_counter: int
-    organization_counter: int
-    delivery_counter: int
     voucher_counter: int
+    total_vouchers_issued: int
+    delivery_counter: int
+    campaign_counter: int
     milestone_counter: int
     total_donations: int
-    total_organizations: int
-    total_vouchers_issued: int
     total_milestones_completed: int
+    organization_counter: int
+    total_organizations: int
 
 class AidchainContractsState:
     """Methods to access state for the current AidchainContracts app"""
@@ -1559,17 +1618,17 @@ class _GlobalState:
         return typing.cast(GlobalStateValue, converted)
 
     @property
-    def campaign_counter(self) -> int:
-        """Get the current value of the campaign_counter key in global_state state"""
-        value = self.app_client.state.global_state.get_value("campaign_counter")
-        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+    def voucher_counter(self) -> int:
+        """Get the current value of the voucher_counter key in global_state state"""
+        value = self.app_client.state.global_state.get_value("voucher_counter")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
             return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
         return typing.cast(int, value)
 
     @property
-    def organization_counter(self) -> int:
-        """Get the current value of the organization_counter key in global_state state"""
-        value = self.app_client.state.global_state.get_value("organization_counter")
+    def total_vouchers_issued(self) -> int:
+        """Get the current value of the total_vouchers_issued key in global_state state"""
+        value = self.app_client.state.global_state.get_value("total_vouchers_issued")
         if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
             return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
         return typing.cast(int, value)
@@ -1583,9 +1642,9 @@ class _GlobalState:
         return typing.cast(int, value)
 
     @property
-    def voucher_counter(self) -> int:
-        """Get the current value of the voucher_counter key in global_state state"""
-        value = self.app_client.state.global_state.get_value("voucher_counter")
+    def campaign_counter(self) -> int:
+        """Get the current value of the campaign_counter key in global_state state"""
+        value = self.app_client.state.global_state.get_value("campaign_counter")
         if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
             return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
         return typing.cast(int, value)
@@ -1607,25 +1666,25 @@ class _GlobalState:
         return typing.cast(int, value)
 
     @property
-    def total_organizations(self) -> int:
-        """Get the current value of the total_organizations key in global_state state"""
-        value = self.app_client.state.global_state.get_value("total_organizations")
+    def total_milestones_completed(self) -> int:
+        """Get the current value of the total_milestones_completed key in global_state state"""
+        value = self.app_client.state.global_state.get_value("total_milestones_completed")
         if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
             return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
         return typing.cast(int, value)
 
     @property
-    def total_vouchers_issued(self) -> int:
-        """Get the current value of the total_vouchers_issued key in global_state state"""
-        value = self.app_client.state.global_state.get_value("total_vouchers_issued")
+    def organization_counter(self) -> int:
+        """Get the current value of the organization_counter key in global_state state"""
+        value = self.app_client.state.global_state.get_value("organization_counter")
         if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
             return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
         return typing.cast(int, value)
 
     @property
-    def total_milestones_completed(self) -> int:
-        """Get the current value of the total_milestones_completed key in global_state state"""
-        value = self.app_client.state.global_state.get_value("total_milestones_completed")
+    def total_organizations(self) -> int:
+        """Get the current value of the total_organizations key in global_state state"""
+        value = self.app_client.state.global_state.get_value("total_organizations")
         if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
             return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
         return typing.cast(int, value)
@@ -1636,11 +1695,11 @@ class _BoxState:
         
         # Pre-generated mapping of value types to their struct classes
         self._struct_classes: dict[str, typing.Type[typing.Any]] = {
+            "VoucherInfo": VoucherInfo,
+            "DeliveryRecord": DeliveryRecord,
             "CampaignInfo": CampaignInfo,
-            "OrganizationInfo": OrganizationInfo,
             "MilestoneInfo": MilestoneInfo,
-            "DeliveryRecord": DeliveryRecord,
-            "VoucherInfo": VoucherInfo
+            "OrganizationInfo": OrganizationInfo
         }
 
     def get_all(self) -> dict[str, typing.Any]:
@@ -1660,48 +1719,48 @@ class _BoxState:
         return converted
 
     @property
-    def campaigns(self) -> "_MapState[int, CampaignInfo]":
-        """Get values from the campaigns map in box state"""
+    def vouchers(self) -> "_MapState[int, VoucherInfo]":
+        """Get values from the vouchers map in box state"""
         return _MapState(
             self.app_client.state.box,
-            "campaigns",
-            self._struct_classes.get("CampaignInfo")
+            "vouchers",
+            self._struct_classes.get("VoucherInfo")
         )
 
     @property
-    def organizations(self) -> "_MapState[int, OrganizationInfo]":
-        """Get values from the organizations map in box state"""
+    def deliveries(self) -> "_MapState[int, DeliveryRecord]":
+        """Get values from the deliveries map in box state"""
         return _MapState(
             self.app_client.state.box,
-            "organizations",
-            self._struct_classes.get("OrganizationInfo")
+            "deliveries",
+            self._struct_classes.get("DeliveryRecord")
         )
 
     @property
-    def milestones(self) -> "_MapState[int, MilestoneInfo]":
-        """Get values from the milestones map in box state"""
+    def campaigns(self) -> "_MapState[int, CampaignInfo]":
+        """Get values from the campaigns map in box state"""
         return _MapState(
             self.app_client.state.box,
-            "milestones",
-            self._struct_classes.get("MilestoneInfo")
+            "campaigns",
+            self._struct_classes.get("CampaignInfo")
         )
 
     @property
-    def deliveries(self) -> "_MapState[int, DeliveryRecord]":
-        """Get values from the deliveries map in box state"""
+    def milestones(self) -> "_MapState[int, MilestoneInfo]":
+        """Get values from the milestones map in box state"""
         return _MapState(
             self.app_client.state.box,
-            "deliveries",
-            self._struct_classes.get("DeliveryRecord")
+            "milestones",
+            self._struct_classes.get("MilestoneInfo")
         )
 
     @property
-    def vouchers(self) -> "_MapState[int, VoucherInfo]":
-        """Get values from the vouchers map in box state"""
+    def organizations(self) -> "_MapState[int, OrganizationInfo]":
+        """Get values from the organizations map in box state"""
         return _MapState(
             self.app_client.state.box,
-            "vouchers",
-            self._struct_classes.get("VoucherInfo")
+            "organizations",
+            self._struct_classes.get("OrganizationInfo")
         )
 
 _KeyType = typing.TypeVar("_KeyType")
@@ -1776,7 +1835,7 @@ class AidchainContractsClient:
             self.app_client = algokit_utils.AppClient(
                 algokit_utils.AppClientParams(
                     algorand=algorand,
-                    app_spec=APP_SPEC,
+                    app_spec=_get_app_spec(),
                     app_id=app_id,
                     app_name=app_name,
                     default_sender=default_sender,
@@ -1809,7 +1868,7 @@ class AidchainContractsClient:
             algokit_utils.AppClient.from_creator_and_name(
                 creator_address=creator_address,
                 app_name=app_name,
-                app_spec=APP_SPEC,
+                app_spec=_get_app_spec(),
                 algorand=algorand,
                 default_sender=default_sender,
                 default_signer=default_signer,
@@ -1831,7 +1890,7 @@ class AidchainContractsClient:
     ) -> "AidchainContractsClient":
         return AidchainContractsClient(
             algokit_utils.AppClient.from_network(
-                app_spec=APP_SPEC,
+                app_spec=_get_app_spec(),
                 algorand=algorand,
                 app_name=app_name,
                 default_sender=default_sender,
@@ -1885,13 +1944,13 @@ class AidchainContractsClient:
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["hello(string)string"],
+        method: typing.Literal["initialize()string"],
         return_value: algokit_utils.ABIReturn | None
     ) -> str | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["initialize()string"],
+        method: typing.Literal["hello(string)string"],
         return_value: algokit_utils.ABIReturn | None
     ) -> str | None: ...
     @typing.overload
@@ -1903,19 +1962,31 @@ class AidchainContractsClient:
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["create_campaign(string,uint64,string)uint64"],
+        method: typing.Literal["get_organization_count()uint64"],
         return_value: algokit_utils.ABIReturn | None
     ) -> int | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["get_campaign_count()uint64"],
+        method: typing.Literal["get_contract_stats()string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_organization_details(uint64)(uint64,string,string,uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> OrganizationInfo | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["create_campaign(string,uint64,string)uint64"],
         return_value: algokit_utils.ABIReturn | None
     ) -> int | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["get_organization_count()uint64"],
+        method: typing.Literal["get_campaign_count()uint64"],
         return_value: algokit_utils.ABIReturn | None
     ) -> int | None: ...
     @typing.overload
@@ -1945,105 +2016,99 @@ class AidchainContractsClient:
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["log_delivery(string,string)uint64"],
+        method: typing.Literal["create_milestone(uint64,uint64,string)uint64"],
         return_value: algokit_utils.ABIReturn | None
     ) -> int | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["verify_delivery(uint64,string)string"],
+        method: typing.Literal["complete_milestone(uint64,string)string"],
         return_value: algokit_utils.ABIReturn | None
     ) -> str | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["get_contract_stats()string"],
+        method: typing.Literal["release_milestone_funds(uint64,account,uint64)string"],
         return_value: algokit_utils.ABIReturn | None
     ) -> str | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["create_voucher_asset(string,uint64)uint64"],
-        return_value: algokit_utils.ABIReturn | None
-    ) -> int | None: ...
-    @typing.overload
-    def decode_return_value(
-        self,
-        method: typing.Literal["distribute_vouchers(uint64,string,uint64)string"],
+        method: typing.Literal["get_milestone_stats()string"],
         return_value: algokit_utils.ABIReturn | None
     ) -> str | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["redeem_voucher(uint64,string,uint64)string"],
+        method: typing.Literal["get_campaign_details(uint64)(uint64,string,uint64,uint64,string,uint64)"],
         return_value: algokit_utils.ABIReturn | None
-    ) -> str | None: ...
+    ) -> CampaignInfo | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["get_voucher_stats()string"],
+        method: typing.Literal["get_milestone_details(uint64)(uint64,uint64,uint64,string,uint64,uint64)"],
         return_value: algokit_utils.ABIReturn | None
-    ) -> str | None: ...
+    ) -> MilestoneInfo | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["create_milestone(uint64,uint64,string)uint64"],
+        method: typing.Literal["get_milestone_count()uint64"],
         return_value: algokit_utils.ABIReturn | None
     ) -> int | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["complete_milestone(uint64,string)string"],
+        method: typing.Literal["log_delivery(string,string)uint64"],
         return_value: algokit_utils.ABIReturn | None
-    ) -> str | None: ...
+    ) -> int | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["release_milestone_funds(uint64,account,uint64)string"],
+        method: typing.Literal["verify_delivery(uint64,string)string"],
         return_value: algokit_utils.ABIReturn | None
     ) -> str | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["get_milestone_stats()string"],
+        method: typing.Literal["get_delivery_details(uint64)(uint64,string,string,string,uint64)"],
         return_value: algokit_utils.ABIReturn | None
-    ) -> str | None: ...
+    ) -> DeliveryRecord | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["get_campaign_details(uint64)(uint64,string,uint64,uint64,string,uint64)"],
+        method: typing.Literal["get_delivery_count()uint64"],
         return_value: algokit_utils.ABIReturn | None
-    ) -> CampaignInfo | None: ...
+    ) -> int | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["get_organization_details(uint64)(uint64,string,string,uint64)"],
+        method: typing.Literal["create_voucher_asset(string,uint64)uint64"],
         return_value: algokit_utils.ABIReturn | None
-    ) -> OrganizationInfo | None: ...
+    ) -> int | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["get_voucher_details(uint64)(uint64,uint64,string,uint64,uint64)"],
+        method: typing.Literal["distribute_vouchers(uint64,string,uint64)string"],
         return_value: algokit_utils.ABIReturn | None
-    ) -> VoucherInfo | None: ...
+    ) -> str | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["get_milestone_details(uint64)(uint64,uint64,uint64,string,uint64,uint64)"],
+        method: typing.Literal["redeem_voucher(uint64,string,uint64)string"],
         return_value: algokit_utils.ABIReturn | None
-    ) -> MilestoneInfo | None: ...
+    ) -> str | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["get_delivery_details(uint64)(uint64,string,string,string,uint64)"],
+        method: typing.Literal["get_voucher_stats()string"],
         return_value: algokit_utils.ABIReturn | None
-    ) -> DeliveryRecord | None: ...
+    ) -> str | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["get_milestone_count()uint64"],
+        method: typing.Literal["get_voucher_details(uint64)(uint64,uint64,string,uint64,uint64)"],
         return_value: algokit_utils.ABIReturn | None
-    ) -> int | None: ...
+    ) -> VoucherInfo | None: ...
     @typing.overload
     def decode_return_value(
         self,
@@ -2051,12 +2116,6 @@ class AidchainContractsClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> int | None: ...
     @typing.overload
-    def decode_return_value(
-        self,
-        method: typing.Literal["get_delivery_count()uint64"],
-        return_value: algokit_utils.ABIReturn | None
-    ) -> int | None: ...
-    @typing.overload
     def decode_return_value(
         self,
         method: str,
@@ -2094,7 +2153,15 @@ class AidchainContractsBareCallCreateParams(algokit_utils.AppClientBareCallCreat
     def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallCreateParams:
         return algokit_utils.AppClientBareCallCreateParams(**self.__dict__)
 
-class AidchainContractsFactory(algokit_utils.TypedAppFactoryProtocol[AidchainContractsBareCallCreateParams, None, None]):
+@dataclasses.dataclass(frozen=True)
+class AidchainContractsBareCallUpdateParams(algokit_utils.AppClientBareCallParams):
+    """Parameters for calling AidchainContracts contract with bare calls"""
+    on_complete: typing.Literal[OnComplete.UpdateApplicationOC] | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallParams:
+        return algokit_utils.AppClientBareCallParams(**self.__dict__)
+
+class AidchainContractsFactory(algokit_utils.TypedAppFactoryProtocol[AidchainContractsBareCallCreateParams, AidchainContractsBareCallUpdateParams, None]):
     """Factory for deploying and managing AidchainContractsClient smart contracts"""
 
     def __init__(
@@ -2110,7 +2177,7 @@ class AidchainContractsFactory(algokit_utils.TypedAppFactoryProtocol[AidchainCon
         self.app_factory = algokit_utils.AppFactory(
             params=algokit_utils.AppFactoryParams(
                 algorand=algorand,
-                app_spec=APP_SPEC,
+                app_spec=_get_app_spec(),
                 app_name=app_name,
                 default_sender=default_sender,
                 default_signer=default_signer,
@@ -2140,7 +2207,7 @@ class AidchainContractsFactory(algokit_utils.TypedAppFactoryProtocol[AidchainCon
         on_update: algokit_utils.OnUpdate | None = None,
         on_schema_break: algokit_utils.OnSchemaBreak | None = None,
         create_params: AidchainContractsBareCallCreateParams | None = None,
-        update_params: None = None,
+        update_params: AidchainContractsBareCallUpdateParams | None = None,
         delete_params: None = None,
         existing_deployments: algokit_utils.ApplicationLookup | None = None,
         ignore_cache: bool = False,
@@ -2153,7 +2220,7 @@ class AidchainContractsFactory(algokit_utils.TypedAppFactoryProtocol[AidchainCon
             on_update=on_update,
             on_schema_break=on_schema_break,
             create_params=create_params.to_algokit_utils_params() if create_params else None,
-            update_params=update_params,
+            update_params=update_params.to_algokit_utils_params() if update_params else None,
             delete_params=delete_params,
             existing_deployments=existing_deployments,
             ignore_cache=ignore_cache,
@@ -2238,6 +2305,25 @@ class AidchainContractsFactoryCreateParams:
             algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
             compilation_params=compilation_params)
 
+    def initialize(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the initialize()string ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "initialize()string",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def hello(
         self,
         args: tuple[str] | HelloArgs,
@@ -2258,97 +2344,117 @@ class AidchainContractsFactoryCreateParams:
             compilation_params=compilation_params
         )
 
-    def initialize(
+    def register_organization(
         self,
+        args: tuple[str, str] | RegisterOrganizationArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the initialize()string ABI method"""
+        """Creates a new instance using the register_organization(string,string)uint64 ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "initialize()string",
+                "method": "register_organization(string,string)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_organization_count(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_organization_count()uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_organization_count()uint64",
                 "args": None,
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def register_organization(
+    def get_contract_stats(
         self,
-        args: tuple[str, str] | RegisterOrganizationArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the register_organization(string,string)uint64 ABI method"""
+        """Creates a new instance using the get_contract_stats()string ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "register_organization(string,string)uint64",
-                "args": _parse_abi_args(args),
+                "method": "get_contract_stats()string",
+                "args": None,
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def create_campaign(
+    def get_organization_details(
         self,
-        args: tuple[str, int, str] | CreateCampaignArgs,
+        args: tuple[int] | GetOrganizationDetailsArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the create_campaign(string,uint64,string)uint64 ABI method"""
+        """Creates a new instance using the get_organization_details(uint64)(uint64,string,string,uint64) ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "create_campaign(string,uint64,string)uint64",
+                "method": "get_organization_details(uint64)(uint64,string,string,uint64)",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def get_campaign_count(
+    def create_campaign(
         self,
+        args: tuple[str, int, str] | CreateCampaignArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the get_campaign_count()uint64 ABI method"""
+        """Creates a new instance using the create_campaign(string,uint64,string)uint64 ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "get_campaign_count()uint64",
-                "args": None,
+                "method": "create_campaign(string,uint64,string)uint64",
+                "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def get_organization_count(
+    def get_campaign_count(
         self,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the get_organization_count()uint64 ABI method"""
+        """Creates a new instance using the get_campaign_count()uint64 ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "get_organization_count()uint64",
+                "method": "get_campaign_count()uint64",
                 "args": None,
                 }
             ),
@@ -2434,342 +2540,322 @@ class AidchainContractsFactoryCreateParams:
             compilation_params=compilation_params
         )
 
-    def log_delivery(
+    def create_milestone(
         self,
-        args: tuple[str, str] | LogDeliveryArgs,
+        args: tuple[int, int, str] | CreateMilestoneArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the log_delivery(string,string)uint64 ABI method"""
+        """Creates a new instance using the create_milestone(uint64,uint64,string)uint64 ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "log_delivery(string,string)uint64",
+                "method": "create_milestone(uint64,uint64,string)uint64",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def verify_delivery(
+    def complete_milestone(
         self,
-        args: tuple[int, str] | VerifyDeliveryArgs,
+        args: tuple[int, str] | CompleteMilestoneArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the verify_delivery(uint64,string)string ABI method"""
+        """Creates a new instance using the complete_milestone(uint64,string)string ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "verify_delivery(uint64,string)string",
+                "method": "complete_milestone(uint64,string)string",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def get_contract_stats(
+    def release_milestone_funds(
         self,
+        args: tuple[int, str | bytes, int] | ReleaseMilestoneFundsArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the get_contract_stats()string ABI method"""
+        """Creates a new instance using the release_milestone_funds(uint64,account,uint64)string ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "get_contract_stats()string",
-                "args": None,
+                "method": "release_milestone_funds(uint64,account,uint64)string",
+                "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def create_voucher_asset(
+    def get_milestone_stats(
         self,
-        args: tuple[str, int] | CreateVoucherAssetArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the create_voucher_asset(string,uint64)uint64 ABI method"""
+        """Creates a new instance using the get_milestone_stats()string ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "create_voucher_asset(string,uint64)uint64",
-                "args": _parse_abi_args(args),
+                "method": "get_milestone_stats()string",
+                "args": None,
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def distribute_vouchers(
+    def get_campaign_details(
         self,
-        args: tuple[int, str, int] | DistributeVouchersArgs,
+        args: tuple[int] | GetCampaignDetailsArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the distribute_vouchers(uint64,string,uint64)string ABI method"""
+        """Creates a new instance using the get_campaign_details(uint64)(uint64,string,uint64,uint64,string,uint64) ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "distribute_vouchers(uint64,string,uint64)string",
+                "method": "get_campaign_details(uint64)(uint64,string,uint64,uint64,string,uint64)",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def redeem_voucher(
+    def get_milestone_details(
         self,
-        args: tuple[int, str, int] | RedeemVoucherArgs,
+        args: tuple[int] | GetMilestoneDetailsArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the redeem_voucher(uint64,string,uint64)string ABI method"""
+        """Creates a new instance using the get_milestone_details(uint64)(uint64,uint64,uint64,string,uint64,uint64) ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "redeem_voucher(uint64,string,uint64)string",
+                "method": "get_milestone_details(uint64)(uint64,uint64,uint64,string,uint64,uint64)",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def get_voucher_stats(
+    def get_milestone_count(
         self,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the get_voucher_stats()string ABI method"""
+        """Creates a new instance using the get_milestone_count()uint64 ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "get_voucher_stats()string",
+                "method": "get_milestone_count()uint64",
                 "args": None,
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def create_milestone(
+    def log_delivery(
         self,
-        args: tuple[int, int, str] | CreateMilestoneArgs,
+        args: tuple[str, str] | LogDeliveryArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the create_milestone(uint64,uint64,string)uint64 ABI method"""
+        """Creates a new instance using the log_delivery(string,string)uint64 ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "create_milestone(uint64,uint64,string)uint64",
+                "method": "log_delivery(string,string)uint64",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def complete_milestone(
+    def verify_delivery(
         self,
-        args: tuple[int, str] | CompleteMilestoneArgs,
+        args: tuple[int, str] | VerifyDeliveryArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the complete_milestone(uint64,string)string ABI method"""
+        """Creates a new instance using the verify_delivery(uint64,string)string ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "complete_milestone(uint64,string)string",
+                "method": "verify_delivery(uint64,string)string",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def release_milestone_funds(
+    def get_delivery_details(
         self,
-        args: tuple[int, str | bytes, int] | ReleaseMilestoneFundsArgs,
+        args: tuple[int] | GetDeliveryDetailsArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the release_milestone_funds(uint64,account,uint64)string ABI method"""
+        """Creates a new instance using the get_delivery_details(uint64)(uint64,string,string,string,uint64) ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "release_milestone_funds(uint64,account,uint64)string",
+                "method": "get_delivery_details(uint64)(uint64,string,string,string,uint64)",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def get_milestone_stats(
+    def get_delivery_count(
         self,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the get_milestone_stats()string ABI method"""
+        """Creates a new instance using the get_delivery_count()uint64 ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "get_milestone_stats()string",
+                "method": "get_delivery_count()uint64",
                 "args": None,
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def get_campaign_details(
+    def create_voucher_asset(
         self,
-        args: tuple[int] | GetCampaignDetailsArgs,
+        args: tuple[str, int] | CreateVoucherAssetArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the get_campaign_details(uint64)(uint64,string,uint64,uint64,string,uint64) ABI method"""
+        """Creates a new instance using the create_voucher_asset(string,uint64)uint64 ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "get_campaign_details(uint64)(uint64,string,uint64,uint64,string,uint64)",
+                "method": "create_voucher_asset(string,uint64)uint64",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def get_organization_details(
+    def distribute_vouchers(
         self,
-        args: tuple[int] | GetOrganizationDetailsArgs,
+        args: tuple[int, str, int] | DistributeVouchersArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the get_organization_details(uint64)(uint64,string,string,uint64) ABI method"""
+        """Creates a new instance using the distribute_vouchers(uint64,string,uint64)string ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "get_organization_details(uint64)(uint64,string,string,uint64)",
+                "method": "distribute_vouchers(uint64,string,uint64)string",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def get_voucher_details(
+    def redeem_voucher(
         self,
-        args: tuple[int] | GetVoucherDetailsArgs,
+        args: tuple[int, str, int] | RedeemVoucherArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the get_voucher_details(uint64)(uint64,uint64,string,uint64,uint64) ABI method"""
+        """Creates a new instance using the redeem_voucher(uint64,string,uint64)string ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "get_voucher_details(uint64)(uint64,uint64,string,uint64,uint64)",
+                "method": "redeem_voucher(uint64,string,uint64)string",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def get_milestone_details(
+    def get_voucher_stats(
         self,
-        args: tuple[int] | GetMilestoneDetailsArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the get_milestone_details(uint64)(uint64,uint64,uint64,string,uint64,uint64) ABI method"""
+        """Creates a new instance using the get_voucher_stats()string ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "get_milestone_details(uint64)(uint64,uint64,uint64,string,uint64,uint64)",
-                "args": _parse_abi_args(args),
+                "method": "get_voucher_stats()string",
+                "args": None,
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def get_delivery_details(
+    def get_voucher_details(
         self,
-        args: tuple[int] | GetDeliveryDetailsArgs,
+        args: tuple[int] | GetVoucherDetailsArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the get_delivery_details(uint64)(uint64,string,string,string,uint64) ABI method"""
+        """Creates a new instance using the get_voucher_details(uint64)(uint64,uint64,string,uint64,uint64) ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "get_delivery_details(uint64)(uint64,string,string,string,uint64)",
+                "method": "get_voucher_details(uint64)(uint64,uint64,string,uint64,uint64)",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def get_milestone_count(
-        self,
-        *,
-        params: algokit_utils.CommonAppCallCreateParams | None = None,
-        compilation_params: algokit_utils.AppClientCompilationParams | None = None
-    ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the get_milestone_count()uint64 ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
-        return self.app_factory.params.create(
-            algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "get_milestone_count()uint64",
-                "args": None,
-                }
-            ),
-            compilation_params=compilation_params
-        )
-
     def get_voucher_count(
         self,
         *,
@@ -2789,25 +2875,6 @@ class AidchainContractsFactoryCreateParams:
             compilation_params=compilation_params
         )
 
-    def get_delivery_count(
-        self,
-        *,
-        params: algokit_utils.CommonAppCallCreateParams | None = None,
-        compilation_params: algokit_utils.AppClientCompilationParams | None = None
-    ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the get_delivery_count()uint64 ABI method"""
-        params = params or algokit_utils.CommonAppCallCreateParams()
-        return self.app_factory.params.create(
-            algokit_utils.AppFactoryCreateMethodCallParams(
-                **{
-                **dataclasses.asdict(params),
-                "method": "get_delivery_count()uint64",
-                "args": None,
-                }
-            ),
-            compilation_params=compilation_params
-        )
-
 class AidchainContractsFactoryUpdateParams:
     """Parameters for 'update' operations of AidchainContracts contract"""
 
@@ -2901,6 +2968,11 @@ class AidchainContractsFactorySendCreate:
         return AidchainContractsClient(result[0]), result[1]
 
 
+class _AidchainContractsUpdateComposer:
+    def __init__(self, composer: "AidchainContractsComposer"):
+        self.composer = composer
+
+
 class AidchainContractsComposer:
     """Composer for creating transaction groups for AidchainContracts contract calls"""
 
@@ -2909,37 +2981,43 @@ class AidchainContractsComposer:
         self._composer = client.algorand.new_group()
         self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
 
-    def hello(
+    @property
+    def update(self) -> "_AidchainContractsUpdateComposer":
+        return _AidchainContractsUpdateComposer(self)
+
+    def initialize(
         self,
-        args: tuple[str] | HelloArgs,
-        params: algokit_utils.CommonAppCallParams | None = None
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "AidchainContractsComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.hello(
-                args=args,
+            self.client.params.initialize(
+                
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "hello(string)string", v
+                "initialize()string", v
             )
         )
         return self
 
-    def initialize(
+    def hello(
         self,
-        params: algokit_utils.CommonAppCallParams | None = None
+        args: tuple[str] | HelloArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "AidchainContractsComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.initialize(
-                
+            self.client.params.hello(
+                args=args,
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "initialize()string", v
+                "hello(string)string", v
             )
         )
         return self
@@ -2947,7 +3025,8 @@ class AidchainContractsComposer:
     def register_organization(
         self,
         args: tuple[str, str] | RegisterOrganizationArgs,
-        params: algokit_utils.CommonAppCallParams | None = None
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "AidchainContractsComposer":
         self._composer.add_app_call_method_call(
             self.client.params.register_organization(
@@ -2962,461 +3041,487 @@ class AidchainContractsComposer:
         )
         return self
 
-    def create_campaign(
+    def get_organization_count(
         self,
-        args: tuple[str, int, str] | CreateCampaignArgs,
-        params: algokit_utils.CommonAppCallParams | None = None
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "AidchainContractsComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.create_campaign(
-                args=args,
+            self.client.params.get_organization_count(
+                
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "create_campaign(string,uint64,string)uint64", v
+                "get_organization_count()uint64", v
             )
         )
         return self
 
-    def get_campaign_count(
+    def get_contract_stats(
         self,
-        params: algokit_utils.CommonAppCallParams | None = None
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "AidchainContractsComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.get_campaign_count(
+            self.client.params.get_contract_stats(
                 
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "get_campaign_count()uint64", v
+                "get_contract_stats()string", v
             )
         )
         return self
 
-    def get_organization_count(
+    def get_organization_details(
         self,
-        params: algokit_utils.CommonAppCallParams | None = None
+        args: tuple[int] | GetOrganizationDetailsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "AidchainContractsComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.get_organization_count(
-                
+            self.client.params.get_organization_details(
+                args=args,
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "get_organization_count()uint64", v
+                "get_organization_details(uint64)(uint64,string,string,uint64)", v
             )
         )
         return self
 
-    def create_donation(
+    def create_campaign(
         self,
-        args: tuple[int] | CreateDonationArgs,
-        params: algokit_utils.CommonAppCallParams | None = None
+        args: tuple[str, int, str] | CreateCampaignArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "AidchainContractsComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.create_donation(
+            self.client.params.create_campaign(
                 args=args,
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "create_donation(uint64)string", v
+                "create_campaign(string,uint64,string)uint64", v
             )
         )
         return self
 
-    def get_total_donations(
+    def get_campaign_count(
         self,
-        params: algokit_utils.CommonAppCallParams | None = None
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "AidchainContractsComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.get_total_donations(
+            self.client.params.get_campaign_count(
                 
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "get_total_donations()uint64", v
+                "get_campaign_count()uint64", v
             )
         )
         return self
 
-    def calculate_total(
+    def create_donation(
         self,
-        args: tuple[int, int] | CalculateTotalArgs,
-        params: algokit_utils.CommonAppCallParams | None = None
+        args: tuple[int] | CreateDonationArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "AidchainContractsComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.calculate_total(
+            self.client.params.create_donation(
                 args=args,
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "calculate_total(uint64,uint64)uint64", v
+                "create_donation(uint64)string", v
             )
         )
         return self
 
-    def validate_donation(
+    def get_total_donations(
         self,
-        args: tuple[int, str] | ValidateDonationArgs,
-        params: algokit_utils.CommonAppCallParams | None = None
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "AidchainContractsComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.validate_donation(
-                args=args,
+            self.client.params.get_total_donations(
+                
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "validate_donation(uint64,string)string", v
+                "get_total_donations()uint64", v
             )
         )
         return self
 
-    def log_delivery(
+    def calculate_total(
         self,
-        args: tuple[str, str] | LogDeliveryArgs,
-        params: algokit_utils.CommonAppCallParams | None = None
+        args: tuple[int, int] | CalculateTotalArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "AidchainContractsComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.log_delivery(
+            self.client.params.calculate_total(
                 args=args,
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "log_delivery(string,string)uint64", v
+                "calculate_total(uint64,uint64)uint64", v
             )
         )
         return self
 
-    def verify_delivery(
+    def validate_donation(
         self,
-        args: tuple[int, str] | VerifyDeliveryArgs,
-        params: algokit_utils.CommonAppCallParams | None = None
+        args: tuple[int, str] | ValidateDonationArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "AidchainContractsComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.verify_delivery(
+            self.client.params.validate_donation(
                 args=args,
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "verify_delivery(uint64,string)string", v
+                "validate_donation(uint64,string)string", v
             )
         )
         return self
 
-    def get_contract_stats(
+    def create_milestone(
         self,
-        params: algokit_utils.CommonAppCallParams | None = None
+        args: tuple[int, int, str] | CreateMilestoneArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "AidchainContractsComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.get_contract_stats(
-                
+            self.client.params.create_milestone(
+                args=args,
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "get_contract_stats()string", v
+                "create_milestone(uint64,uint64,string)uint64", v
             )
         )
         return self
 
-    def create_voucher_asset(
+    def complete_milestone(
         self,
-        args: tuple[str, int] | CreateVoucherAssetArgs,
-        params: algokit_utils.CommonAppCallParams | None = None
+        args: tuple[int, str] | CompleteMilestoneArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "AidchainContractsComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.create_voucher_asset(
+            self.client.params.complete_milestone(
                 args=args,
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "create_voucher_asset(string,uint64)uint64", v
+                "complete_milestone(uint64,string)string", v
             )
         )
         return self
 
-    def distribute_vouchers(
+    def release_milestone_funds(
         self,
-        args: tuple[int, str, int] | DistributeVouchersArgs,
-        params: algokit_utils.CommonAppCallParams | None = None
+        args: tuple[int, str | bytes, int] | ReleaseMilestoneFundsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "AidchainContractsComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.distribute_vouchers(
+            self.client.params.release_milestone_funds(
                 args=args,
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "distribute_vouchers(uint64,string,uint64)string", v
+                "release_milestone_funds(uint64,account,uint64)string", v
             )
         )
         return self
 
-    def redeem_voucher(
+    def get_milestone_stats(
         self,
-        args: tuple[int, str, int] | RedeemVoucherArgs,
-        params: algokit_utils.CommonAppCallParams | None = None
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "AidchainContractsComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.redeem_voucher(
-                args=args,
+            self.client.params.get_milestone_stats(
+                
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "redeem_voucher(uint64,string,uint64)string", v
+                "get_milestone_stats()string", v
             )
         )
         return self
 
-    def get_voucher_stats(
+    def get_campaign_details(
         self,
-        params: algokit_utils.CommonAppCallParams | None = None
+        args: tuple[int] | GetCampaignDetailsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "AidchainContractsComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.get_voucher_stats(
-                
+            self.client.params.get_campaign_details(
+                args=args,
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "get_voucher_stats()string", v
+                "get_campaign_details(uint64)(uint64,string,uint64,uint64,string,uint64)", v
             )
         )
         return self
 
-    def create_milestone(
+    def get_milestone_details(
         self,
-        args: tuple[int, int, str] | CreateMilestoneArgs,
-        params: algokit_utils.CommonAppCallParams | None = None
+        args: tuple[int] | GetMilestoneDetailsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "AidchainContractsComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.create_milestone(
+            self.client.params.get_milestone_details(
                 args=args,
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "create_milestone(uint64,uint64,string)uint64", v
+                "get_milestone_details(uint64)(uint64,uint64,uint64,string,uint64,uint64)", v
             )
         )
         return self
 
-    def complete_milestone(
+    def get_milestone_count(
         self,
-        args: tuple[int, str] | CompleteMilestoneArgs,
-        params: algokit_utils.CommonAppCallParams | None = None
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "AidchainContractsComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.complete_milestone(
-                args=args,
+            self.client.params.get_milestone_count(
+                
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "complete_milestone(uint64,string)string", v
+                "get_milestone_count()uint64", v
             )
         )
         return self
 
-    def release_milestone_funds(
+    def log_delivery(
         self,
-        args: tuple[int, str | bytes, int] | ReleaseMilestoneFundsArgs,
-        params: algokit_utils.CommonAppCallParams | None = None
+        args: tuple[str, str] | LogDeliveryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "AidchainContractsComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.release_milestone_funds(
+            self.client.params.log_delivery(
                 args=args,
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "release_milestone_funds(uint64,account,uint64)string", v
+                "log_delivery(string,string)uint64", v
             )
         )
         return self
 
-    def get_milestone_stats(
+    def verify_delivery(
         self,
-        params: algokit_utils.CommonAppCallParams | None = None
+        args: tuple[int, str] | VerifyDeliveryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "AidchainContractsComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.get_milestone_stats(
-                
+            self.client.params.verify_delivery(
+                args=args,
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "get_milestone_stats()string", v
+                "verify_delivery(uint64,string)string", v
             )
         )
         return self
 
-    def get_campaign_details(
+    def get_delivery_details(
         self,
-        args: tuple[int] | GetCampaignDetailsArgs,
-        params: algokit_utils.CommonAppCallParams | None = None
+        args: tuple[int] | GetDeliveryDetailsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "AidchainContractsComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.get_campaign_details(
+            self.client.params.get_delivery_details(
                 args=args,
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "get_campaign_details(uint64)(uint64,string,uint64,uint64,string,uint64)", v
+                "get_delivery_details(uint64)(uint64,string,string,string,uint64)", v
             )
         )
         return self
 
-    def get_organization_details(
+    def get_delivery_count(
         self,
-        args: tuple[int] | GetOrganizationDetailsArgs,
-        params: algokit_utils.CommonAppCallParams | None = None
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "AidchainContractsComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.get_organization_details(
-                args=args,
+            self.client.params.get_delivery_count(
+                
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "get_organization_details(uint64)(uint64,string,string,uint64)", v
+                "get_delivery_count()uint64", v
             )
         )
         return self
 
-    def get_voucher_details(
+    def create_voucher_asset(
         self,
-        args: tuple[int] | GetVoucherDetailsArgs,
-        params: algokit_utils.CommonAppCallParams | None = None
+        args: tuple[str, int] | CreateVoucherAssetArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "AidchainContractsComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.get_voucher_details(
+            self.client.params.create_voucher_asset(
                 args=args,
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "get_voucher_details(uint64)(uint64,uint64,string,uint64,uint64)", v
+                "create_voucher_asset(string,uint64)uint64", v
             )
         )
         return self
 
-    def get_milestone_details(
+    def distribute_vouchers(
         self,
-        args: tuple[int] | GetMilestoneDetailsArgs,
-        params: algokit_utils.CommonAppCallParams | None = None
+        args: tuple[int, str, int] | DistributeVouchersArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "AidchainContractsComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.get_milestone_details(
+            self.client.params.distribute_vouchers(
                 args=args,
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "get_milestone_details(uint64)(uint64,uint64,uint64,string,uint64,uint64)", v
+                "distribute_vouchers(uint64,string,uint64)string", v
             )
         )
         return self
 
-    def get_delivery_details(
+    def redeem_voucher(
         self,
-        args: tuple[int] | GetDeliveryDetailsArgs,
-        params: algokit_utils.CommonAppCallParams | None = None
+        args: tuple[int, str, int] | RedeemVoucherArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "AidchainContractsComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.get_delivery_details(
+            self.client.params.redeem_voucher(
                 args=args,
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "get_delivery_details(uint64)(uint64,string,string,string,uint64)", v
+                "redeem_voucher(uint64,string,uint64)string", v
             )
         )
         return self
 
-    def get_milestone_count(
+    def get_voucher_stats(
         self,
-        params: algokit_utils.CommonAppCallParams | None = None
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "AidchainContractsComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.get_milestone_count(
+            self.client.params.get_voucher_stats(
                 
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "get_milestone_count()uint64", v
+                "get_voucher_stats()string", v
             )
         )
         return self
 
-    def get_voucher_count(
+    def get_voucher_details(
         self,
-        params: algokit_utils.CommonAppCallParams | None = None
+        args: tuple[int] | GetVoucherDetailsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "AidchainContractsComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.get_voucher_count(
-                
+            self.client.params.get_voucher_details(
+                args=args,
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "get_voucher_count()uint64", v
+                "get_voucher_details(uint64)(uint64,uint64,string,uint64,uint64)", v
             )
         )
         return self
 
-    def get_delivery_count(
+    def get_voucher_count(
         self,
-        params: algokit_utils.CommonAppCallParams | None = None
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "AidchainContractsComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.get_delivery_count(
+            self.client.params.get_voucher_count(
                 
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "get_delivery_count()uint64", v
+                "get_voucher_count()uint64", v
             )
         )
         return self
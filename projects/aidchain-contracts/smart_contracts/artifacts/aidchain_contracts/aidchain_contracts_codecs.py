@@ -0,0 +1,156 @@
+# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# This file was automatically generated by smart_contracts._helpers.struct_codecs.
+# DO NOT MODIFY IT BY HAND.
+
+import struct
+import typing
+
+from .aidchain_contracts_client import (
+    CampaignInfo,
+    DeliveryRecord,
+    MilestoneInfo,
+    OrganizationInfo,
+    VoucherInfo,
+)
+
+_U16 = struct.Struct(">H")
+
+
+_CAMPAIGN_INFO_HEAD = struct.Struct('>QHQQHQ')
+
+
+def decode_campaign_info(data: bytes, offset: int = 0) -> CampaignInfo:
+    """Decodes an ARC-4 encoded CampaignInfo starting at `offset`."""
+    id, title_offset, target, raised, creator_offset, active, = _CAMPAIGN_INFO_HEAD.unpack_from(data, offset)
+    title_start = offset + title_offset + 2
+    title = bytes(data[title_start:title_start + _U16.unpack_from(data, offset + title_offset)[0]]).decode("utf-8")
+    creator_start = offset + creator_offset + 2
+    creator = bytes(data[creator_start:creator_start + _U16.unpack_from(data, offset + creator_offset)[0]]).decode("utf-8")
+    return CampaignInfo(id, title, target, raised, creator, active)
+
+
+def encode_campaign_info(value: CampaignInfo) -> bytes:
+    """Encodes a CampaignInfo into its ARC-4 tuple representation."""
+    title = value.title.encode("utf-8")
+    creator = value.creator.encode("utf-8")
+    title_offset = 36
+    creator_offset = title_offset + 2 + len(title)
+    return b"".join((_CAMPAIGN_INFO_HEAD.pack(value.id, title_offset, value.target, value.raised, creator_offset, value.active), _U16.pack(len(title)), title, _U16.pack(len(creator)), creator))
+
+
+_DELIVERY_RECORD_HEAD = struct.Struct('>QHHHQ')
+
+
+def decode_delivery_record(data: bytes, offset: int = 0) -> DeliveryRecord:
+    """Decodes an ARC-4 encoded DeliveryRecord starting at `offset`."""
+    id, recipient_offset, location_offset, agent_offset, verified, = _DELIVERY_RECORD_HEAD.unpack_from(data, offset)
+    recipient_start = offset + recipient_offset + 2
+    recipient = bytes(data[recipient_start:recipient_start + _U16.unpack_from(data, offset + recipient_offset)[0]]).decode("utf-8")
+    location_start = offset + location_offset + 2
+    location = bytes(data[location_start:location_start + _U16.unpack_from(data, offset + location_offset)[0]]).decode("utf-8")
+    agent_start = offset + agent_offset + 2
+    agent = bytes(data[agent_start:agent_start + _U16.unpack_from(data, offset + agent_offset)[0]]).decode("utf-8")
+    return DeliveryRecord(id, recipient, location, agent, verified)
+
+
+def encode_delivery_record(value: DeliveryRecord) -> bytes:
+    """Encodes a DeliveryRecord into its ARC-4 tuple representation."""
+    recipient = value.recipient.encode("utf-8")
+    location = value.location.encode("utf-8")
+    agent = value.agent.encode("utf-8")
+    recipient_offset = 22
+    location_offset = recipient_offset + 2 + len(recipient)
+    agent_offset = location_offset + 2 + len(location)
+    return b"".join((_DELIVERY_RECORD_HEAD.pack(value.id, recipient_offset, location_offset, agent_offset, value.verified), _U16.pack(len(recipient)), recipient, _U16.pack(len(location)), location, _U16.pack(len(agent)), agent))
+
+
+_MILESTONE_INFO_HEAD = struct.Struct('>QQQHQQ')
+
+
+def decode_milestone_info(data: bytes, offset: int = 0) -> MilestoneInfo:
+    """Decodes an ARC-4 encoded MilestoneInfo starting at `offset`."""
+    id, campaign_id, target_amount, description_offset, completed, funds_released, = _MILESTONE_INFO_HEAD.unpack_from(data, offset)
+    description_start = offset + description_offset + 2
+    description = bytes(data[description_start:description_start + _U16.unpack_from(data, offset + description_offset)[0]]).decode("utf-8")
+    return MilestoneInfo(id, campaign_id, target_amount, description, completed, funds_released)
+
+
+def encode_milestone_info(value: MilestoneInfo) -> bytes:
+    """Encodes a MilestoneInfo into its ARC-4 tuple representation."""
+    description = value.description.encode("utf-8")
+    description_offset = 42
+    return b"".join((_MILESTONE_INFO_HEAD.pack(value.id, value.campaign_id, value.target_amount, description_offset, value.completed, value.funds_released), _U16.pack(len(description)), description))
+
+
+_ORGANIZATION_INFO_HEAD = struct.Struct('>QHHQ')
+
+
+def decode_organization_info(data: bytes, offset: int = 0) -> OrganizationInfo:
+    """Decodes an ARC-4 encoded OrganizationInfo starting at `offset`."""
+    id, name_offset, wallet_address_offset, verification_level, = _ORGANIZATION_INFO_HEAD.unpack_from(data, offset)
+    name_start = offset + name_offset + 2
+    name = bytes(data[name_start:name_start + _U16.unpack_from(data, offset + name_offset)[0]]).decode("utf-8")
+    wallet_address_start = offset + wallet_address_offset + 2
+    wallet_address = bytes(data[wallet_address_start:wallet_address_start + _U16.unpack_from(data, offset + wallet_address_offset)[0]]).decode("utf-8")
+    return OrganizationInfo(id, name, wallet_address, verification_level)
+
+
+def encode_organization_info(value: OrganizationInfo) -> bytes:
+    """Encodes a OrganizationInfo into its ARC-4 tuple representation."""
+    name = value.name.encode("utf-8")
+    wallet_address = value.wallet_address.encode("utf-8")
+    name_offset = 20
+    wallet_address_offset = name_offset + 2 + len(name)
+    return b"".join((_ORGANIZATION_INFO_HEAD.pack(value.id, name_offset, wallet_address_offset, value.verification_level), _U16.pack(len(name)), name, _U16.pack(len(wallet_address)), wallet_address))
+
+
+_VOUCHER_INFO_HEAD = struct.Struct('>QQHQQ')
+
+
+def decode_voucher_info(data: bytes, offset: int = 0) -> VoucherInfo:
+    """Decodes an ARC-4 encoded VoucherInfo starting at `offset`."""
+    id, asset_id, name_offset, total_supply, issued, = _VOUCHER_INFO_HEAD.unpack_from(data, offset)
+    name_start = offset + name_offset + 2
+    name = bytes(data[name_start:name_start + _U16.unpack_from(data, offset + name_offset)[0]]).decode("utf-8")
+    return VoucherInfo(id, asset_id, name, total_supply, issued)
+
+
+def encode_voucher_info(value: VoucherInfo) -> bytes:
+    """Encodes a VoucherInfo into its ARC-4 tuple representation."""
+    name = value.name.encode("utf-8")
+    name_offset = 34
+    return b"".join((_VOUCHER_INFO_HEAD.pack(value.id, value.asset_id, name_offset, value.total_supply, value.issued), _U16.pack(len(name)), name))
+
+
+DECODERS: dict[str, typing.Callable[[bytes], typing.Any]] = {
+    "CampaignInfo": decode_campaign_info,
+    "DeliveryRecord": decode_delivery_record,
+    "MilestoneInfo": decode_milestone_info,
+    "OrganizationInfo": decode_organization_info,
+    "VoucherInfo": decode_voucher_info,
+}
+
+ENCODERS: dict[str, typing.Callable[[typing.Any], bytes]] = {
+    "CampaignInfo": encode_campaign_info,
+    "DeliveryRecord": encode_delivery_record,
+    "MilestoneInfo": encode_milestone_info,
+    "OrganizationInfo": encode_organization_info,
+    "VoucherInfo": encode_voucher_info,
+}
+
+# Box map name -> (box name prefix, value decoder) for uint64-keyed struct maps
+BOX_MAPS: dict[str, tuple[bytes, typing.Callable[[bytes], typing.Any]]] = {
+    "vouchers": (b'vouchers', decode_voucher_info),
+    "deliveries": (b'deliveries', decode_delivery_record),
+    "campaigns": (b'campaigns', decode_campaign_info),
+    "milestones": (b'milestones', decode_milestone_info),
+    "organizations": (b'orgs', decode_organization_info),
+}
+
+
+def decode_box(map_name: str, box_name: bytes, value: bytes) -> tuple[int, typing.Any]:
+    """Decodes a raw box name and value from one of the BOX_MAPS into (key, struct)."""
+    prefix, decode = BOX_MAPS[map_name]
+    return int.from_bytes(box_name[len(prefix):], "big"), decode(value)
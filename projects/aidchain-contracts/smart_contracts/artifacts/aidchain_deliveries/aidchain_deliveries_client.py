@@ -0,0 +1,1345 @@
+# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^3.0.0
+# Post-processed by smart_contracts._helpers.client_postprocess.
+
+# common
+import dataclasses
+import functools
+import typing
+# core algosdk
+import algosdk
+from algosdk.transaction import OnComplete
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.source_map import SourceMap
+from algosdk.transaction import Transaction
+from algosdk.v2client.models import SimulateTraceConfig
+# utils
+import algokit_utils
+from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
+
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": ["UpdateApplication"], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "name"}], "name": "hello", "returns": {"type": "string"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "initialize", "returns": {"type": "string"}, "desc": "Initialize the delivery ledger with default values", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "recipient"}, {"type": "string", "name": "location"}], "name": "log_delivery", "returns": {"type": "uint64"}, "desc": "Log a delivery event", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "delivery_id"}, {"type": "string", "name": "agent"}], "name": "verify_delivery", "returns": {"type": "string"}, "desc": "Verify a delivery by an authorized agent", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "delivery_id"}], "name": "get_delivery_details", "returns": {"type": "(uint64,string,string,string,uint64)", "struct": "DeliveryRecord"}, "desc": "Get detailed information about a delivery", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_delivery_count", "returns": {"type": "uint64"}, "desc": "Get total number of deliveries logged", "events": [], "readonly": true, "recommendations": {}}], "name": "AidchainDeliveries", "state": {"keys": {"box": {}, "global": {"delivery_counter": {"key": "ZGVsaXZlcnlfY291bnRlcg==", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"deliveries": {"keyType": "uint64", "valueType": "DeliveryRecord", "prefix": "ZGVsaXZlcmllcw=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 1}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"DeliveryRecord": [{"name": "id", "type": "uint64"}, {"name": "recipient", "type": "string"}, {"name": "location", "type": "string"}, {"name": "agent", "type": "string"}, {"name": "verified", "type": "uint64"}]}, "byteCode": {"approval": "CiADAQAAJgMQZGVsaXZlcnlfY291bnRlcgQVH3x1CmRlbGl2ZXJpZXMxGEAAAygjZzEbQQDMggYEAr7OEQSJetGnBMidy2sEjqfg+gTVsg1wBC2JxqE2GgCOBgB9AGUASAAmABMAAiNDMRkURDEYRIgBwxYpTFCwIkMxGRREMRhENhoBiAGgKUxQsCJDMRkURDEYRDYaARc2GgJXAgCIASBJFRZXBgJMUClMULAiQzEZFEQxGEQ2GgFXAgA2GgJXAgCIAJkWKUxQsCJDMRkURDEYRIgAYUkVFlcGAkxQKUxQsCJDMRkURDEYRDYaAVcCAIgAM0kVFlcGAkxQKUxQsCJDgQQjMRmOAgAJAANC/1cxGBREIkMxGESIAAIiQyREMQAyCRJEiYoBAYAHSGVsbG8sIIv/UIkoI2eAIUNvbnRyYWN0IGluaXRpYWxpemVkIHN1Y2Nlc3NmdWxseYmKAgEjKGVEIggoSwFnSRaL/hUWVwYCi/5Qi/8VFlcGAov/UEsCgAIAFlBLAhWBFghJFlcGAk8CTFBLAhVPAggWVwYCUIAIAAAAAAAAAABQTwJQTFCAAgAAUCpPAlBJvEhMv4mKAgEjKGVEi/4PRIv+RIv+FipMUEm9RQFESb5EgAgAAAAAAAAAAVwOi/8VFlcGAov/UEsBgQxZTwIjTwJYTFBLAbxIv4AcRGVsaXZlcnkgdmVyaWZpZWQgYnkgYWdlbnQ6IIv/UImKAQEqi/9QSb1FAUS+RIkjKGVEiQ==", "clear": "CoEBQw=="}, "desc": "Delivery ledger domain of Aidchain", "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMuYWlkY2hhaW5fZGVsaXZlcmllcy5jb250cmFjdC5BaWRjaGFpbkRlbGl2ZXJpZXMuX19hbGdvcHlfZW50cnlwb2ludF93aXRoX2luaXQoKSAtPiB1aW50NjQ6Cm1haW46CiAgICBpbnRjYmxvY2sgMSAwIFRNUExfVVBEQVRBQkxFCiAgICBieXRlY2Jsb2NrICJkZWxpdmVyeV9jb3VudGVyIiAweDE1MWY3Yzc1ICJkZWxpdmVyaWVzIgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2RlbGl2ZXJpZXMvY29udHJhY3QucHk6MTUKICAgIC8vIHNlbGYuZGVsaXZlcnlfY291bnRlciA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSkKICAgIGJ5dGVjXzAgLy8gImRlbGl2ZXJ5X2NvdW50ZXIiCiAgICBpbnRjXzEgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKCm1haW5fYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2RlbGl2ZXJpZXMvY29udHJhY3QucHk6MTEKICAgIC8vIGNsYXNzIEFpZGNoYWluRGVsaXZlcmllcyhBUkM0Q29udHJhY3QpOgogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IG1haW5fYmFyZV9yb3V0aW5nQDExCiAgICBwdXNoYnl0ZXNzIDB4MDJiZWNlMTEgMHg4OTdhZDFhNyAweGM4OWRjYjZiIDB4OGVhN2UwZmEgMHhkNWIyMGQ3MCAweDJkODljNmExIC8vIG1ldGhvZCAiaGVsbG8oc3RyaW5nKXN0cmluZyIsIG1ldGhvZCAiaW5pdGlhbGl6ZSgpc3RyaW5nIiwgbWV0aG9kICJsb2dfZGVsaXZlcnkoc3RyaW5nLHN0cmluZyl1aW50NjQiLCBtZXRob2QgInZlcmlmeV9kZWxpdmVyeSh1aW50NjQsc3RyaW5nKXN0cmluZyIsIG1ldGhvZCAiZ2V0X2RlbGl2ZXJ5X2RldGFpbHModWludDY0KSh1aW50NjQsc3RyaW5nLHN0cmluZyxzdHJpbmcsdWludDY0KSIsIG1ldGhvZCAiZ2V0X2RlbGl2ZXJ5X2NvdW50KCl1aW50NjQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX2hlbGxvX3JvdXRlQDUgbWFpbl9pbml0aWFsaXplX3JvdXRlQDYgbWFpbl9sb2dfZGVsaXZlcnlfcm91dGVANyBtYWluX3ZlcmlmeV9kZWxpdmVyeV9yb3V0ZUA4IG1haW5fZ2V0X2RlbGl2ZXJ5X2RldGFpbHNfcm91dGVAOSBtYWluX2dldF9kZWxpdmVyeV9jb3VudF9yb3V0ZUAxMAoKbWFpbl9hZnRlcl9pZl9lbHNlQDE0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2RlbGl2ZXJpZXMvY29udHJhY3QucHk6MTEKICAgIC8vIGNsYXNzIEFpZGNoYWluRGVsaXZlcmllcyhBUkM0Q29udHJhY3QpOgogICAgaW50Y18xIC8vIDAKICAgIHJldHVybgoKbWFpbl9nZXRfZGVsaXZlcnlfY291bnRfcm91dGVAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fZGVsaXZlcmllcy9jb250cmFjdC5weTo3MwogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGdldF9kZWxpdmVyeV9jb3VudAogICAgaXRvYgogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfZGVsaXZlcnlfZGV0YWlsc19yb3V0ZUA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2RlbGl2ZXJpZXMvY29udHJhY3QucHk6NjcKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2RlbGl2ZXJpZXMvY29udHJhY3QucHk6MTEKICAgIC8vIGNsYXNzIEFpZGNoYWluRGVsaXZlcmllcyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2RlbGl2ZXJpZXMvY29udHJhY3QucHk6NjcKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X2RlbGl2ZXJ5X2RldGFpbHMKICAgIGJ5dGVjXzEgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fdmVyaWZ5X2RlbGl2ZXJ5X3JvdXRlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fZGVsaXZlcmllcy9jb250cmFjdC5weTo1MwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9kZWxpdmVyaWVzL2NvbnRyYWN0LnB5OjExCiAgICAvLyBjbGFzcyBBaWRjaGFpbkRlbGl2ZXJpZXMoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fZGVsaXZlcmllcy9jb250cmFjdC5weTo1MwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIHZlcmlmeV9kZWxpdmVyeQogICAgZHVwCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGVjXzEgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fbG9nX2RlbGl2ZXJ5X3JvdXRlQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fZGVsaXZlcmllcy9jb250cmFjdC5weTozNwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9kZWxpdmVyaWVzL2NvbnRyYWN0LnB5OjExCiAgICAvLyBjbGFzcyBBaWRjaGFpbkRlbGl2ZXJpZXMoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2RlbGl2ZXJpZXMvY29udHJhY3QucHk6MzcKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBsb2dfZGVsaXZlcnkKICAgIGl0b2IKICAgIGJ5dGVjXzEgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5faW5pdGlhbGl6ZV9yb3V0ZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2RlbGl2ZXJpZXMvY29udHJhY3QucHk6MzEKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGluaXRpYWxpemUKICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2hlbGxvX3JvdXRlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fZGVsaXZlcmllcy9jb250cmFjdC5weToyNwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9kZWxpdmVyaWVzL2NvbnRyYWN0LnB5OjExCiAgICAvLyBjbGFzcyBBaWRjaGFpbkRlbGl2ZXJpZXMoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fZGVsaXZlcmllcy9jb250cmFjdC5weToyNwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGhlbGxvCiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9iYXJlX3JvdXRpbmdAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fZGVsaXZlcmllcy9jb250cmFjdC5weToxMQogICAgLy8gY2xhc3MgQWlkY2hhaW5EZWxpdmVyaWVzKEFSQzRDb250cmFjdCk6CiAgICBwdXNoaW50IDQgLy8gNAogICAgaW50Y18xIC8vIDAKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIG1hdGNoIG1haW5fdXBkYXRlQDEyIG1haW5fX19hbGdvcHlfZGVmYXVsdF9jcmVhdGVAMTMKICAgIGIgbWFpbl9hZnRlcl9pZl9lbHNlQDE0CgptYWluX19fYWxnb3B5X2RlZmF1bHRfY3JlYXRlQDEzOgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICEKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gY3JlYXRpbmcKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fdXBkYXRlQDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2RlbGl2ZXJpZXMvY29udHJhY3QucHk6MTgKICAgIC8vIEBiYXJlbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJVcGRhdGVBcHBsaWNhdGlvbiJdKQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIHVwZGF0ZQogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5haWRjaGFpbl9kZWxpdmVyaWVzLmNvbnRyYWN0LkFpZGNoYWluRGVsaXZlcmllcy51cGRhdGUoKSAtPiB2b2lkOgp1cGRhdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fZGVsaXZlcmllcy9jb250cmFjdC5weToyNAogICAgLy8gYXNzZXJ0IFRlbXBsYXRlVmFyW2Jvb2xdKCJVUERBVEFCTEUiKSwgIkFwcCBpcyBub3QgdXBkYXRhYmxlIgogICAgaW50Y18yIC8vIFRNUExfVVBEQVRBQkxFCiAgICBhc3NlcnQgLy8gQXBwIGlzIG5vdCB1cGRhdGFibGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9kZWxpdmVyaWVzL2NvbnRyYWN0LnB5OjI1CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLCAiT25seSBjcmVhdG9yIGNhbiB1cGRhdGUiCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gT25seSBjcmVhdG9yIGNhbiB1cGRhdGUKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5haWRjaGFpbl9kZWxpdmVyaWVzLmNvbnRyYWN0LkFpZGNoYWluRGVsaXZlcmllcy5oZWxsbyhuYW1lOiBieXRlcykgLT4gYnl0ZXM6CmhlbGxvOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2RlbGl2ZXJpZXMvY29udHJhY3QucHk6MjctMjgKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGhlbGxvKHNlbGYsIG5hbWU6IFN0cmluZykgLT4gU3RyaW5nOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fZGVsaXZlcmllcy9jb250cmFjdC5weToyOQogICAgLy8gcmV0dXJuICJIZWxsbywgIiArIG5hbWUKICAgIHB1c2hieXRlcyAiSGVsbG8sICIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWlkY2hhaW5fZGVsaXZlcmllcy5jb250cmFjdC5BaWRjaGFpbkRlbGl2ZXJpZXMuaW5pdGlhbGl6ZSgpIC0+IGJ5dGVzOgppbml0aWFsaXplOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2RlbGl2ZXJpZXMvY29udHJhY3QucHk6MzQKICAgIC8vIHNlbGYuZGVsaXZlcnlfY291bnRlci52YWx1ZSA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMCAvLyAiZGVsaXZlcnlfY291bnRlciIKICAgIGludGNfMSAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2RlbGl2ZXJpZXMvY29udHJhY3QucHk6MzUKICAgIC8vIHJldHVybiBTdHJpbmcoIkNvbnRyYWN0IGluaXRpYWxpemVkIHN1Y2Nlc3NmdWxseSIpCiAgICBwdXNoYnl0ZXMgIkNvbnRyYWN0IGluaXRpYWxpemVkIHN1Y2Nlc3NmdWxseSIKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5haWRjaGFpbl9kZWxpdmVyaWVzLmNvbnRyYWN0LkFpZGNoYWluRGVsaXZlcmllcy5sb2dfZGVsaXZlcnkocmVjaXBpZW50OiBieXRlcywgbG9jYXRpb246IGJ5dGVzKSAtPiB1aW50NjQ6CmxvZ19kZWxpdmVyeToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9kZWxpdmVyaWVzL2NvbnRyYWN0LnB5OjM3LTM4CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBsb2dfZGVsaXZlcnkoc2VsZiwgcmVjaXBpZW50OiBTdHJpbmcsIGxvY2F0aW9uOiBTdHJpbmcpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2RlbGl2ZXJpZXMvY29udHJhY3QucHk6NDAKICAgIC8vIHNlbGYuZGVsaXZlcnlfY291bnRlci52YWx1ZSArPSBVSW50NjQoMSkKICAgIGludGNfMSAvLyAwCiAgICBieXRlY18wIC8vICJkZWxpdmVyeV9jb3VudGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRlbGl2ZXJ5X2NvdW50ZXIgZXhpc3RzCiAgICBpbnRjXzAgLy8gMQogICAgKwogICAgYnl0ZWNfMCAvLyAiZGVsaXZlcnlfY291bnRlciIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2RlbGl2ZXJpZXMvY29udHJhY3QucHk6NDQKICAgIC8vIGlkPUFSQzRVSW50NjQoZGVsaXZlcnlfaWQpLAogICAgZHVwCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fZGVsaXZlcmllcy9jb250cmFjdC5weTo0NQogICAgLy8gcmVjaXBpZW50PUFSQzRTdHJpbmcocmVjaXBpZW50KSwKICAgIGZyYW1lX2RpZyAtMgogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9kZWxpdmVyaWVzL2NvbnRyYWN0LnB5OjQ2CiAgICAvLyBsb2NhdGlvbj1BUkM0U3RyaW5nKGxvY2F0aW9uKSwKICAgIGZyYW1lX2RpZyAtMQogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9kZWxpdmVyaWVzL2NvbnRyYWN0LnB5OjQzLTQ5CiAgICAvLyBzZWxmLmRlbGl2ZXJpZXNbQVJDNFVJbnQ2NChkZWxpdmVyeV9pZCldID0gRGVsaXZlcnlSZWNvcmQoCiAgICAvLyAgICAgaWQ9QVJDNFVJbnQ2NChkZWxpdmVyeV9pZCksCiAgICAvLyAgICAgcmVjaXBpZW50PUFSQzRTdHJpbmcocmVjaXBpZW50KSwKICAgIC8vICAgICBsb2NhdGlvbj1BUkM0U3RyaW5nKGxvY2F0aW9uKSwKICAgIC8vICAgICBhZ2VudD1BUkM0U3RyaW5nKCIiKSwgICMgRW1wdHkgaW5pdGlhbGx5CiAgICAvLyAgICAgdmVyaWZpZWQ9QVJDNFVJbnQ2NCgwKSAgIyAwID0gbm90IHZlcmlmaWVkIGluaXRpYWxseQogICAgLy8gKQogICAgZGlnIDIKICAgIHB1c2hieXRlcyAweDAwMTYKICAgIGNvbmNhdAogICAgZGlnIDIKICAgIGxlbgogICAgcHVzaGludCAyMiAvLyAyMgogICAgKwogICAgZHVwCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGRpZyAyCiAgICBsZW4KICAgIHVuY292ZXIgMgogICAgKwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2RlbGl2ZXJpZXMvY29udHJhY3QucHk6NDgKICAgIC8vIHZlcmlmaWVkPUFSQzRVSW50NjQoMCkgICMgMCA9IG5vdCB2ZXJpZmllZCBpbml0aWFsbHkKICAgIHB1c2hieXRlcyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9kZWxpdmVyaWVzL2NvbnRyYWN0LnB5OjQzLTQ5CiAgICAvLyBzZWxmLmRlbGl2ZXJpZXNbQVJDNFVJbnQ2NChkZWxpdmVyeV9pZCldID0gRGVsaXZlcnlSZWNvcmQoCiAgICAvLyAgICAgaWQ9QVJDNFVJbnQ2NChkZWxpdmVyeV9pZCksCiAgICAvLyAgICAgcmVjaXBpZW50PUFSQzRTdHJpbmcocmVjaXBpZW50KSwKICAgIC8vICAgICBsb2NhdGlvbj1BUkM0U3RyaW5nKGxvY2F0aW9uKSwKICAgIC8vICAgICBhZ2VudD1BUkM0U3RyaW5nKCIiKSwgICMgRW1wdHkgaW5pdGlhbGx5CiAgICAvLyAgICAgdmVyaWZpZWQ9QVJDNFVJbnQ2NCgwKSAgIyAwID0gbm90IHZlcmlmaWVkIGluaXRpYWxseQogICAgLy8gKQogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fZGVsaXZlcmllcy9jb250cmFjdC5weTo0NwogICAgLy8gYWdlbnQ9QVJDNFN0cmluZygiIiksICAjIEVtcHR5IGluaXRpYWxseQogICAgcHVzaGJ5dGVzIDB4MDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2RlbGl2ZXJpZXMvY29udHJhY3QucHk6NDMtNDkKICAgIC8vIHNlbGYuZGVsaXZlcmllc1tBUkM0VUludDY0KGRlbGl2ZXJ5X2lkKV0gPSBEZWxpdmVyeVJlY29yZCgKICAgIC8vICAgICBpZD1BUkM0VUludDY0KGRlbGl2ZXJ5X2lkKSwKICAgIC8vICAgICByZWNpcGllbnQ9QVJDNFN0cmluZyhyZWNpcGllbnQpLAogICAgLy8gICAgIGxvY2F0aW9uPUFSQzRTdHJpbmcobG9jYXRpb24pLAogICAgLy8gICAgIGFnZW50PUFSQzRTdHJpbmcoIiIpLCAgIyBFbXB0eSBpbml0aWFsbHkKICAgIC8vICAgICB2ZXJpZmllZD1BUkM0VUludDY0KDApICAjIDAgPSBub3QgdmVyaWZpZWQgaW5pdGlhbGx5CiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9kZWxpdmVyaWVzL2NvbnRyYWN0LnB5OjQzCiAgICAvLyBzZWxmLmRlbGl2ZXJpZXNbQVJDNFVJbnQ2NChkZWxpdmVyeV9pZCldID0gRGVsaXZlcnlSZWNvcmQoCiAgICBieXRlY18yIC8vICJkZWxpdmVyaWVzIgogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9kZWxpdmVyaWVzL2NvbnRyYWN0LnB5OjQzLTQ5CiAgICAvLyBzZWxmLmRlbGl2ZXJpZXNbQVJDNFVJbnQ2NChkZWxpdmVyeV9pZCldID0gRGVsaXZlcnlSZWNvcmQoCiAgICAvLyAgICAgaWQ9QVJDNFVJbnQ2NChkZWxpdmVyeV9pZCksCiAgICAvLyAgICAgcmVjaXBpZW50PUFSQzRTdHJpbmcocmVjaXBpZW50KSwKICAgIC8vICAgICBsb2NhdGlvbj1BUkM0U3RyaW5nKGxvY2F0aW9uKSwKICAgIC8vICAgICBhZ2VudD1BUkM0U3RyaW5nKCIiKSwgICMgRW1wdHkgaW5pdGlhbGx5CiAgICAvLyAgICAgdmVyaWZpZWQ9QVJDNFVJbnQ2NCgwKSAgIyAwID0gbm90IHZlcmlmaWVkIGluaXRpYWxseQogICAgLy8gKQogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9kZWxpdmVyaWVzL2NvbnRyYWN0LnB5OjUxCiAgICAvLyByZXR1cm4gZGVsaXZlcnlfaWQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5haWRjaGFpbl9kZWxpdmVyaWVzLmNvbnRyYWN0LkFpZGNoYWluRGVsaXZlcmllcy52ZXJpZnlfZGVsaXZlcnkoZGVsaXZlcnlfaWQ6IHVpbnQ2NCwgYWdlbnQ6IGJ5dGVzKSAtPiBieXRlczoKdmVyaWZ5X2RlbGl2ZXJ5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2RlbGl2ZXJpZXMvY29udHJhY3QucHk6NTMtNTQKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIHZlcmlmeV9kZWxpdmVyeShzZWxmLCBkZWxpdmVyeV9pZDogVUludDY0LCBhZ2VudDogU3RyaW5nKSAtPiBTdHJpbmc6CiAgICBwcm90byAyIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9kZWxpdmVyaWVzL2NvbnRyYWN0LnB5OjU2CiAgICAvLyBhc3NlcnQgZGVsaXZlcnlfaWQgPD0gc2VsZi5kZWxpdmVyeV9jb3VudGVyLnZhbHVlLCAiRGVsaXZlcnkgSUQgb3V0IG9mIHJhbmdlIgogICAgaW50Y18xIC8vIDAKICAgIGJ5dGVjXzAgLy8gImRlbGl2ZXJ5X2NvdW50ZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZGVsaXZlcnlfY291bnRlciBleGlzdHMKICAgIGZyYW1lX2RpZyAtMgogICAgPj0KICAgIGFzc2VydCAvLyBEZWxpdmVyeSBJRCBvdXQgb2YgcmFuZ2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9kZWxpdmVyaWVzL2NvbnRyYWN0LnB5OjU3CiAgICAvLyBhc3NlcnQgZGVsaXZlcnlfaWQgIT0gVUludDY0KDApLCAiRGVsaXZlcnkgSUQgY2Fubm90IGJlIHplcm8iCiAgICBmcmFtZV9kaWcgLTIKICAgIGFzc2VydCAvLyBEZWxpdmVyeSBJRCBjYW5ub3QgYmUgemVybwogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2RlbGl2ZXJpZXMvY29udHJhY3QucHk6NTgKICAgIC8vIGFzc2VydCBBUkM0VUludDY0KGRlbGl2ZXJ5X2lkKSBpbiBzZWxmLmRlbGl2ZXJpZXMsICJEZWxpdmVyeSBub3QgZm91bmQiCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIGJ5dGVjXzIgLy8gImRlbGl2ZXJpZXMiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gRGVsaXZlcnkgbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fZGVsaXZlcmllcy9jb250cmFjdC5weTo2MAogICAgLy8gZGVsaXZlcnlfaW5mbyA9IHNlbGYuZGVsaXZlcmllc1tBUkM0VUludDY0KGRlbGl2ZXJ5X2lkKV0uY29weSgpCiAgICBkdXAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRlbGl2ZXJpZXMgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fZGVsaXZlcmllcy9jb250cmFjdC5weTo2MQogICAgLy8gZGVsaXZlcnlfaW5mby52ZXJpZmllZCA9IEFSQzRVSW50NjQoMSkgICMgTWFyayBhcyB2ZXJpZmllZAogICAgcHVzaGJ5dGVzIDB4MDAwMDAwMDAwMDAwMDAwMQogICAgcmVwbGFjZTIgMTQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9kZWxpdmVyaWVzL2NvbnRyYWN0LnB5OjYyCiAgICAvLyBkZWxpdmVyeV9pbmZvLmFnZW50ID0gQVJDNFN0cmluZyhhZ2VudCkgICMgU2V0IHRoZSB2ZXJpZnlpbmcgYWdlbnQKICAgIGZyYW1lX2RpZyAtMQogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGRpZyAxCiAgICBwdXNoaW50IDEyIC8vIDEyCiAgICBleHRyYWN0X3VpbnQxNgogICAgdW5jb3ZlciAyCiAgICBpbnRjXzEgLy8gMAogICAgdW5jb3ZlciAyCiAgICBleHRyYWN0MwogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fZGVsaXZlcmllcy9jb250cmFjdC5weTo2MwogICAgLy8gc2VsZi5kZWxpdmVyaWVzW0FSQzRVSW50NjQoZGVsaXZlcnlfaWQpXSA9IGRlbGl2ZXJ5X2luZm8uY29weSgpCiAgICBkaWcgMQogICAgYm94X2RlbAogICAgcG9wCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fZGVsaXZlcmllcy9jb250cmFjdC5weTo2NQogICAgLy8gcmV0dXJuIFN0cmluZygiRGVsaXZlcnkgdmVyaWZpZWQgYnkgYWdlbnQ6ICIpICsgYWdlbnQKICAgIHB1c2hieXRlcyAiRGVsaXZlcnkgdmVyaWZpZWQgYnkgYWdlbnQ6ICIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWlkY2hhaW5fZGVsaXZlcmllcy5jb250cmFjdC5BaWRjaGFpbkRlbGl2ZXJpZXMuZ2V0X2RlbGl2ZXJ5X2RldGFpbHMoZGVsaXZlcnlfaWQ6IGJ5dGVzKSAtPiBieXRlczoKZ2V0X2RlbGl2ZXJ5X2RldGFpbHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fZGVsaXZlcmllcy9jb250cmFjdC5weTo2Ny02OAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF9kZWxpdmVyeV9kZXRhaWxzKHNlbGYsIGRlbGl2ZXJ5X2lkOiBBUkM0VUludDY0KSAtPiBEZWxpdmVyeVJlY29yZDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX2RlbGl2ZXJpZXMvY29udHJhY3QucHk6NzAKICAgIC8vIGFzc2VydCBkZWxpdmVyeV9pZCBpbiBzZWxmLmRlbGl2ZXJpZXMsICJEZWxpdmVyeSBub3QgZm91bmQiCiAgICBieXRlY18yIC8vICJkZWxpdmVyaWVzIgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gRGVsaXZlcnkgbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fZGVsaXZlcmllcy9jb250cmFjdC5weTo3MQogICAgLy8gcmV0dXJuIHNlbGYuZGVsaXZlcmllc1tkZWxpdmVyeV9pZF0KICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRlbGl2ZXJpZXMgZW50cnkgZXhpc3RzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWlkY2hhaW5fZGVsaXZlcmllcy5jb250cmFjdC5BaWRjaGFpbkRlbGl2ZXJpZXMuZ2V0X2RlbGl2ZXJ5X2NvdW50KCkgLT4gdWludDY0OgpnZXRfZGVsaXZlcnlfY291bnQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fZGVsaXZlcmllcy9jb250cmFjdC5weTo3NgogICAgLy8gcmV0dXJuIHNlbGYuZGVsaXZlcnlfY291bnRlci52YWx1ZQogICAgaW50Y18xIC8vIDAKICAgIGJ5dGVjXzAgLy8gImRlbGl2ZXJ5X2NvdW50ZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZGVsaXZlcnlfY291bnRlciBleGlzdHMKICAgIHJldHN1Ygo=", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "cblocks", "sourceInfo": [{"pc": [246], "errorMessage": "App is not updatable"}, {"pc": [421], "errorMessage": "Delivery ID cannot be zero"}, {"pc": [418], "errorMessage": "Delivery ID out of range"}, {"pc": [432, 521], "errorMessage": "Delivery not found"}, {"pc": [67, 84, 103, 137, 166, 190], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [252], "errorMessage": "Only creator can update"}, {"pc": [234], "errorMessage": "can only call when creating"}, {"pc": [70, 87, 106, 140, 169, 193, 239], "errorMessage": "can only call when not creating"}, {"pc": [435, 523], "errorMessage": "check self.deliveries entry exists"}, {"pc": [315, 414, 528], "errorMessage": "check self.delivery_counter exists"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {"UPDATABLE": {"type": "AVMUint64"}}}"""
+
+@functools.cache
+def _get_app_spec() -> algokit_utils.Arc56Contract:
+    """Parses the embedded app spec on first use and reuses it for the rest of the process"""
+    return algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+
+def __getattr__(name: str) -> typing.Any:
+    # Keeps `from <client> import APP_SPEC` working without parsing the spec at import time
+    if name == "APP_SPEC":
+        return _get_app_spec()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def _parse_abi_args(args: object | None = None) -> list[object] | None:
+    """Helper to parse ABI args into the format expected by underlying client"""
+    if args is None:
+        return None
+
+    def convert_dataclass(value: object) -> object:
+        if dataclasses.is_dataclass(value):
+            return tuple(convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
+        elif isinstance(value, (list, tuple)):
+            return type(value)(convert_dataclass(item) for item in value)
+        return value
+
+    match args:
+        case tuple():
+            method_args = list(args)
+        case _ if dataclasses.is_dataclass(args):
+            method_args = [getattr(args, field.name) for field in dataclasses.fields(args)]
+        case _:
+            raise ValueError("Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments.")
+
+    return [
+        convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
+        for arg in method_args
+    ] if method_args else None
+
+def _init_dataclass(cls: type, data: dict) -> object:
+    """
+    Recursively instantiate a dataclass of type `cls` from `data`.
+
+    For each field on the dataclass, if the field type is also a dataclass
+    and the corresponding data is a dict, instantiate that field recursively.
+    """
+    field_values = {}
+    for field in dataclasses.fields(cls):
+        field_value = data.get(field.name)
+        # Check if the field expects another dataclass and the value is a dict.
+        if dataclasses.is_dataclass(field.type) and isinstance(field_value, dict):
+            field_values[field.name] = _init_dataclass(typing.cast(type, field.type), field_value)
+        else:
+            field_values[field.name] = field_value
+    return cls(**field_values)
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class DeliveryRecord:
+    """Struct for DeliveryRecord"""
+    id: int
+    recipient: str
+    location: str
+    agent: str
+    verified: int
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class HelloArgs:
+    """Dataclass for hello arguments"""
+    name: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "hello(string)string"
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class LogDeliveryArgs:
+    """Dataclass for log_delivery arguments"""
+    recipient: str
+    location: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "log_delivery(string,string)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class VerifyDeliveryArgs:
+    """Dataclass for verify_delivery arguments"""
+    delivery_id: int
+    agent: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "verify_delivery(uint64,string)string"
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class GetDeliveryDetailsArgs:
+    """Dataclass for get_delivery_details arguments"""
+    delivery_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_delivery_details(uint64)(uint64,string,string,string,uint64)"
+
+
+class _AidchainDeliveriesUpdate:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def bare(
+        self, params: algokit_utils.AppClientBareCallParams | None = None
+    ) -> algokit_utils.AppUpdateParams:
+        return self.app_client.params.bare.update(params)
+
+
+class AidchainDeliveriesParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def update(self) -> "_AidchainDeliveriesUpdate":
+        return _AidchainDeliveriesUpdate(self.app_client)
+
+    def hello(
+        self,
+        args: tuple[str] | HelloArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "hello(string)string",
+            "args": method_args,
+        }))
+
+    def initialize(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "initialize()string",
+        }))
+
+    def log_delivery(
+        self,
+        args: tuple[str, str] | LogDeliveryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "log_delivery(string,string)uint64",
+            "args": method_args,
+        }))
+
+    def verify_delivery(
+        self,
+        args: tuple[int, str] | VerifyDeliveryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "verify_delivery(uint64,string)string",
+            "args": method_args,
+        }))
+
+    def get_delivery_details(
+        self,
+        args: tuple[int] | GetDeliveryDetailsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_delivery_details(uint64)(uint64,string,string,string,uint64)",
+            "args": method_args,
+        }))
+
+    def get_delivery_count(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_delivery_count()uint64",
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> algokit_utils.AppCallParams:
+        return self.app_client.params.bare.clear_state(
+            params,
+            
+        )
+
+
+class _AidchainDeliveriesUpdateTransaction:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def bare(self, params: algokit_utils.AppClientBareCallParams | None = None) -> Transaction:
+        return self.app_client.create_transaction.bare.update(params)
+
+
+class AidchainDeliveriesCreateTransactionParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def update(self) -> "_AidchainDeliveriesUpdateTransaction":
+        return _AidchainDeliveriesUpdateTransaction(self.app_client)
+
+    def hello(
+        self,
+        args: tuple[str] | HelloArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "hello(string)string",
+            "args": method_args,
+        }))
+
+    def initialize(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "initialize()string",
+        }))
+
+    def log_delivery(
+        self,
+        args: tuple[str, str] | LogDeliveryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "log_delivery(string,string)uint64",
+            "args": method_args,
+        }))
+
+    def verify_delivery(
+        self,
+        args: tuple[int, str] | VerifyDeliveryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "verify_delivery(uint64,string)string",
+            "args": method_args,
+        }))
+
+    def get_delivery_details(
+        self,
+        args: tuple[int] | GetDeliveryDetailsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_delivery_details(uint64)(uint64,string,string,string,uint64)",
+            "args": method_args,
+        }))
+
+    def get_delivery_count(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_delivery_count()uint64",
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> Transaction:
+        return self.app_client.create_transaction.bare.clear_state(
+            params,
+            
+        )
+
+
+class _AidchainDeliveriesUpdateSend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def bare(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult:
+        return self.app_client.send.bare.update(
+            params=params,
+            send_params=send_params,
+            compilation_params=compilation_params
+        )
+
+
+class AidchainDeliveriesSend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def update(self) -> "_AidchainDeliveriesUpdateSend":
+        return _AidchainDeliveriesUpdateSend(self.app_client)
+
+    def hello(
+        self,
+        args: tuple[str] | HelloArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "hello(string)string",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def initialize(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "initialize()string",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def log_delivery(
+        self,
+        args: tuple[str, str] | LogDeliveryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "log_delivery(string,string)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def verify_delivery(
+        self,
+        args: tuple[int, str] | VerifyDeliveryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "verify_delivery(uint64,string)string",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def get_delivery_details(
+        self,
+        args: tuple[int] | GetDeliveryDetailsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[DeliveryRecord]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_delivery_details(uint64)(uint64,string,string,string,uint64)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(DeliveryRecord, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[DeliveryRecord], parsed_response)
+
+    def get_delivery_count(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_delivery_count()uint64",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        return self.app_client.send.bare.clear_state(
+            params,
+            send_params=send_params,
+        )
+
+
+class GlobalStateValue(typing.TypedDict):
+    """Shape of global_state state key values"""
+    delivery_counter: int
+
+class AidchainDeliveriesState:
+    """Methods to access state for the current AidchainDeliveries app"""
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def global_state(
+        self
+    ) -> "_GlobalState":
+            """Methods to access global_state for the current app"""
+            return _GlobalState(self.app_client)
+
+    @property
+    def box(
+        self
+    ) -> "_BoxState":
+            """Methods to access box for the current app"""
+            return _BoxState(self.app_client)
+
+class _GlobalState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+
+    def get_all(self) -> GlobalStateValue:
+        """Get all current keyed values from global_state state"""
+        result = self.app_client.state.global_state.get_all()
+        if not result:
+            return typing.cast(GlobalStateValue, {})
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.global_state.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return typing.cast(GlobalStateValue, converted)
+
+    @property
+    def delivery_counter(self) -> int:
+        """Get the current value of the delivery_counter key in global_state state"""
+        value = self.app_client.state.global_state.get_value("delivery_counter")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+class _BoxState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {
+            "DeliveryRecord": DeliveryRecord
+        }
+
+    def get_all(self) -> dict[str, typing.Any]:
+        """Get all current keyed values from box state"""
+        result = self.app_client.state.box.get_all()
+        if not result:
+            return {}
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.box.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return converted
+
+    @property
+    def deliveries(self) -> "_MapState[int, DeliveryRecord]":
+        """Get values from the deliveries map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "deliveries",
+            self._struct_classes.get("DeliveryRecord")
+        )
+
+_KeyType = typing.TypeVar("_KeyType")
+_ValueType = typing.TypeVar("_ValueType")
+
+class _AppClientStateMethodsProtocol(typing.Protocol):
+    def get_map(self, map_name: str) -> dict[typing.Any, typing.Any]:
+        ...
+    def get_map_value(self, map_name: str, key: typing.Any) -> typing.Any | None:
+        ...
+
+class _MapState(typing.Generic[_KeyType, _ValueType]):
+    """Generic class for accessing state maps with strongly typed keys and values"""
+
+    def __init__(self, state_accessor: _AppClientStateMethodsProtocol, map_name: str,
+                struct_class: typing.Type[_ValueType] | None = None):
+        self._state_accessor = state_accessor
+        self._map_name = map_name
+        self._struct_class = struct_class
+
+    def get_map(self) -> dict[_KeyType, _ValueType]:
+        """Get all current values in the map"""
+        result = self._state_accessor.get_map(self._map_name)
+        if self._struct_class and result:
+            return {k: _init_dataclass(self._struct_class, v) if isinstance(v, dict) else v
+                    for k, v in result.items()}  # type: ignore
+        return typing.cast(dict[_KeyType, _ValueType], result or {})
+
+    def get_value(self, key: _KeyType) -> _ValueType | None:
+        """Get a value from the map by key"""
+        key_value = dataclasses.asdict(key) if dataclasses.is_dataclass(key) else key  # type: ignore
+        value = self._state_accessor.get_map_value(self._map_name, key_value)
+        if value is not None and self._struct_class and isinstance(value, dict):
+            return _init_dataclass(self._struct_class, value)  # type: ignore
+        return typing.cast(_ValueType | None, value)
+
+
+class AidchainDeliveriesClient:
+    """Client for interacting with AidchainDeliveries smart contract"""
+
+    @typing.overload
+    def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
+    
+    @typing.overload
+    def __init__(
+        self,
+        *,
+        algorand: _AlgoKitAlgorandClient,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None: ...
+
+    def __init__(
+        self,
+        app_client: algokit_utils.AppClient | None = None,
+        *,
+        algorand: _AlgoKitAlgorandClient | None = None,
+        app_id: int | None = None,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None:
+        if app_client:
+            self.app_client = app_client
+        elif algorand and app_id:
+            self.app_client = algokit_utils.AppClient(
+                algokit_utils.AppClientParams(
+                    algorand=algorand,
+                    app_spec=_get_app_spec(),
+                    app_id=app_id,
+                    app_name=app_name,
+                    default_sender=default_sender,
+                    default_signer=default_signer,
+                    approval_source_map=approval_source_map,
+                    clear_source_map=clear_source_map,
+                )
+            )
+        else:
+            raise ValueError("Either app_client or algorand and app_id must be provided")
+    
+        self.params = AidchainDeliveriesParams(self.app_client)
+        self.create_transaction = AidchainDeliveriesCreateTransactionParams(self.app_client)
+        self.send = AidchainDeliveriesSend(self.app_client)
+        self.state = AidchainDeliveriesState(self.app_client)
+
+    @staticmethod
+    def from_creator_and_name(
+        creator_address: str,
+        app_name: str,
+        algorand: _AlgoKitAlgorandClient,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+    ) -> "AidchainDeliveriesClient":
+        return AidchainDeliveriesClient(
+            algokit_utils.AppClient.from_creator_and_name(
+                creator_address=creator_address,
+                app_name=app_name,
+                app_spec=_get_app_spec(),
+                algorand=algorand,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+                ignore_cache=ignore_cache,
+                app_lookup_cache=app_lookup_cache,
+            )
+        )
+    
+    @staticmethod
+    def from_network(
+        algorand: _AlgoKitAlgorandClient,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "AidchainDeliveriesClient":
+        return AidchainDeliveriesClient(
+            algokit_utils.AppClient.from_network(
+                app_spec=_get_app_spec(),
+                algorand=algorand,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    @property
+    def app_id(self) -> int:
+        return self.app_client.app_id
+    
+    @property
+    def app_address(self) -> str:
+        return self.app_client.app_address
+    
+    @property
+    def app_name(self) -> str:
+        return self.app_client.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_client.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_client.algorand
+
+    def clone(
+        self,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "AidchainDeliveriesClient":
+        return AidchainDeliveriesClient(
+            self.app_client.clone(
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    def new_group(self) -> "AidchainDeliveriesComposer":
+        return AidchainDeliveriesComposer(self)
+
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["hello(string)string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["initialize()string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["log_delivery(string,string)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["verify_delivery(uint64,string)string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_delivery_details(uint64)(uint64,string,string,string,uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> DeliveryRecord | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_delivery_count()uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None: ...
+
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | DeliveryRecord | int | str:
+        """Decode ABI return value for the given method."""
+        if return_value is None:
+            return None
+    
+        arc56_method = self.app_spec.get_arc56_method(method)
+        decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
+    
+        # If method returns a struct, convert the dict to appropriate dataclass
+        if (arc56_method and
+            arc56_method.returns and
+            arc56_method.returns.struct and
+            isinstance(decoded, dict)):
+            struct_class = globals().get(arc56_method.returns.struct)
+            if struct_class:
+                return struct_class(**typing.cast(dict, decoded))
+        return decoded
+
+
+@dataclasses.dataclass(frozen=True)
+class AidchainDeliveriesBareCallCreateParams(algokit_utils.AppClientBareCallCreateParams):
+    """Parameters for creating AidchainDeliveries contract with bare calls"""
+    on_complete: typing.Literal[OnComplete.NoOpOC] | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallCreateParams:
+        return algokit_utils.AppClientBareCallCreateParams(**self.__dict__)
+
+@dataclasses.dataclass(frozen=True)
+class AidchainDeliveriesBareCallUpdateParams(algokit_utils.AppClientBareCallParams):
+    """Parameters for calling AidchainDeliveries contract with bare calls"""
+    on_complete: typing.Literal[OnComplete.UpdateApplicationOC] | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallParams:
+        return algokit_utils.AppClientBareCallParams(**self.__dict__)
+
+class AidchainDeliveriesFactory(algokit_utils.TypedAppFactoryProtocol[AidchainDeliveriesBareCallCreateParams, AidchainDeliveriesBareCallUpdateParams, None]):
+    """Factory for deploying and managing AidchainDeliveriesClient smart contracts"""
+
+    def __init__(
+        self,
+        algorand: _AlgoKitAlgorandClient,
+        *,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        version: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ):
+        self.app_factory = algokit_utils.AppFactory(
+            params=algokit_utils.AppFactoryParams(
+                algorand=algorand,
+                app_spec=_get_app_spec(),
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                version=version,
+                compilation_params=compilation_params,
+            )
+        )
+        self.params = AidchainDeliveriesFactoryParams(self.app_factory)
+        self.create_transaction = AidchainDeliveriesFactoryCreateTransaction(self.app_factory)
+        self.send = AidchainDeliveriesFactorySend(self.app_factory)
+
+    @property
+    def app_name(self) -> str:
+        return self.app_factory.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_factory.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_factory.algorand
+
+    def deploy(
+        self,
+        *,
+        on_update: algokit_utils.OnUpdate | None = None,
+        on_schema_break: algokit_utils.OnSchemaBreak | None = None,
+        create_params: AidchainDeliveriesBareCallCreateParams | None = None,
+        update_params: AidchainDeliveriesBareCallUpdateParams | None = None,
+        delete_params: None = None,
+        existing_deployments: algokit_utils.ApplicationLookup | None = None,
+        ignore_cache: bool = False,
+        app_name: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> tuple[AidchainDeliveriesClient, algokit_utils.AppFactoryDeployResult]:
+        """Deploy the application"""
+        deploy_response = self.app_factory.deploy(
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            create_params=create_params.to_algokit_utils_params() if create_params else None,
+            update_params=update_params.to_algokit_utils_params() if update_params else None,
+            delete_params=delete_params,
+            existing_deployments=existing_deployments,
+            ignore_cache=ignore_cache,
+            app_name=app_name,
+            compilation_params=compilation_params,
+            send_params=send_params,
+        )
+
+        return AidchainDeliveriesClient(deploy_response[0]), deploy_response[1]
+
+    def get_app_client_by_creator_and_name(
+        self,
+        creator_address: str,
+        app_name: str,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> AidchainDeliveriesClient:
+        """Get an app client by creator address and name"""
+        return AidchainDeliveriesClient(
+            self.app_factory.get_app_client_by_creator_and_name(
+                creator_address,
+                app_name,
+                default_sender,
+                default_signer,
+                ignore_cache,
+                app_lookup_cache,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+    def get_app_client_by_id(
+        self,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> AidchainDeliveriesClient:
+        """Get an app client by app ID"""
+        return AidchainDeliveriesClient(
+            self.app_factory.get_app_client_by_id(
+                app_id,
+                app_name,
+                default_sender,
+                default_signer,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+
+class AidchainDeliveriesFactoryParams:
+    """Parameters for creating transactions for AidchainDeliveries contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = AidchainDeliveriesFactoryCreateParams(app_factory)
+        self.update = AidchainDeliveriesFactoryUpdateParams(app_factory)
+        self.delete = AidchainDeliveriesFactoryDeleteParams(app_factory)
+
+class AidchainDeliveriesFactoryCreateParams:
+    """Parameters for 'create' operations of AidchainDeliveries contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateParams:
+        """Creates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            compilation_params=compilation_params)
+
+    def hello(
+        self,
+        args: tuple[str] | HelloArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the hello(string)string ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "hello(string)string",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def initialize(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the initialize()string ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "initialize()string",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def log_delivery(
+        self,
+        args: tuple[str, str] | LogDeliveryArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the log_delivery(string,string)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "log_delivery(string,string)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def verify_delivery(
+        self,
+        args: tuple[int, str] | VerifyDeliveryArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the verify_delivery(uint64,string)string ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "verify_delivery(uint64,string)string",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_delivery_details(
+        self,
+        args: tuple[int] | GetDeliveryDetailsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_delivery_details(uint64)(uint64,string,string,string,uint64) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_delivery_details(uint64)(uint64,string,string,string,uint64)",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_delivery_count(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_delivery_count()uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_delivery_count()uint64",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+class AidchainDeliveriesFactoryUpdateParams:
+    """Parameters for 'update' operations of AidchainDeliveries contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppUpdateParams:
+        """Updates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_update(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            )
+
+class AidchainDeliveriesFactoryDeleteParams:
+    """Parameters for 'delete' operations of AidchainDeliveries contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppDeleteParams:
+        """Deletes an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_delete(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            )
+
+
+class AidchainDeliveriesFactoryCreateTransaction:
+    """Create transactions for AidchainDeliveries contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = AidchainDeliveriesFactoryCreateTransactionCreate(app_factory)
+
+
+class AidchainDeliveriesFactoryCreateTransactionCreate:
+    """Create new instances of AidchainDeliveries contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+    ) -> Transaction:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.create_transaction.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+        )
+
+
+class AidchainDeliveriesFactorySend:
+    """Send calls to AidchainDeliveries contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = AidchainDeliveriesFactorySendCreate(app_factory)
+
+
+class AidchainDeliveriesFactorySendCreate:
+    """Send create calls to AidchainDeliveries contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ) -> tuple[AidchainDeliveriesClient, algokit_utils.SendAppCreateTransactionResult]:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        result = self.app_factory.send.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            send_params=send_params,
+            compilation_params=compilation_params
+        )
+        return AidchainDeliveriesClient(result[0]), result[1]
+
+
+class _AidchainDeliveriesUpdateComposer:
+    def __init__(self, composer: "AidchainDeliveriesComposer"):
+        self.composer = composer
+
+
+class AidchainDeliveriesComposer:
+    """Composer for creating transaction groups for AidchainDeliveries contract calls"""
+
+    def __init__(self, client: "AidchainDeliveriesClient"):
+        self.client = client
+        self._composer = client.algorand.new_group()
+        self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+
+    @property
+    def update(self) -> "_AidchainDeliveriesUpdateComposer":
+        return _AidchainDeliveriesUpdateComposer(self)
+
+    def hello(
+        self,
+        args: tuple[str] | HelloArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "AidchainDeliveriesComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.hello(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "hello(string)string", v
+            )
+        )
+        return self
+
+    def initialize(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "AidchainDeliveriesComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.initialize(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "initialize()string", v
+            )
+        )
+        return self
+
+    def log_delivery(
+        self,
+        args: tuple[str, str] | LogDeliveryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "AidchainDeliveriesComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.log_delivery(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "log_delivery(string,string)uint64", v
+            )
+        )
+        return self
+
+    def verify_delivery(
+        self,
+        args: tuple[int, str] | VerifyDeliveryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "AidchainDeliveriesComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.verify_delivery(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "verify_delivery(uint64,string)string", v
+            )
+        )
+        return self
+
+    def get_delivery_details(
+        self,
+        args: tuple[int] | GetDeliveryDetailsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "AidchainDeliveriesComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_delivery_details(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_delivery_details(uint64)(uint64,string,string,string,uint64)", v
+            )
+        )
+        return self
+
+    def get_delivery_count(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "AidchainDeliveriesComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_delivery_count(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_delivery_count()uint64", v
+            )
+        )
+        return self
+
+    def clear_state(
+        self,
+        *,
+        args: list[bytes] | None = None,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AidchainDeliveriesComposer":
+        params=params or algokit_utils.CommonAppCallParams()
+        self._composer.add_app_call(
+            self.client.params.clear_state(
+                algokit_utils.AppClientBareCallParams(
+                    **{
+                        **dataclasses.asdict(params),
+                        "args": args
+                    }
+                )
+            )
+        )
+        return self
+    
+    def add_transaction(
+        self, txn: Transaction, signer: TransactionSigner | None = None
+    ) -> "AidchainDeliveriesComposer":
+        self._composer.add_transaction(txn, signer)
+        return self
+    
+    def composer(self) -> algokit_utils.TransactionComposer:
+        return self._composer
+    
+    def simulate(
+        self,
+        allow_more_logs: bool | None = None,
+        allow_empty_signatures: bool | None = None,
+        allow_unnamed_resources: bool | None = None,
+        extra_opcode_budget: int | None = None,
+        exec_trace_config: SimulateTraceConfig | None = None,
+        simulation_round: int | None = None,
+        skip_signatures: bool | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.simulate(
+            allow_more_logs=allow_more_logs,
+            allow_empty_signatures=allow_empty_signatures,
+            allow_unnamed_resources=allow_unnamed_resources,
+            extra_opcode_budget=extra_opcode_budget,
+            exec_trace_config=exec_trace_config,
+            simulation_round=simulation_round,
+            skip_signatures=skip_signatures,
+        )
+    
+    def send(
+        self,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.send(send_params)
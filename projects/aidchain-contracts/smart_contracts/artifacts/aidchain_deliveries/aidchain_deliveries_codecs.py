@@ -0,0 +1,60 @@
+# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# This file was automatically generated by smart_contracts._helpers.struct_codecs.
+# DO NOT MODIFY IT BY HAND.
+
+import struct
+import typing
+
+from .aidchain_deliveries_client import (
+    DeliveryRecord,
+)
+
+_U16 = struct.Struct(">H")
+
+
+_DELIVERY_RECORD_HEAD = struct.Struct('>QHHHQ')
+
+
+def decode_delivery_record(data: bytes, offset: int = 0) -> DeliveryRecord:
+    """Decodes an ARC-4 encoded DeliveryRecord starting at `offset`."""
+    id, recipient_offset, location_offset, agent_offset, verified, = _DELIVERY_RECORD_HEAD.unpack_from(data, offset)
+    recipient_start = offset + recipient_offset + 2
+    recipient = bytes(data[recipient_start:recipient_start + _U16.unpack_from(data, offset + recipient_offset)[0]]).decode("utf-8")
+    location_start = offset + location_offset + 2
+    location = bytes(data[location_start:location_start + _U16.unpack_from(data, offset + location_offset)[0]]).decode("utf-8")
+    agent_start = offset + agent_offset + 2
+    agent = bytes(data[agent_start:agent_start + _U16.unpack_from(data, offset + agent_offset)[0]]).decode("utf-8")
+    return DeliveryRecord(id, recipient, location, agent, verified)
+
+
+def encode_delivery_record(value: DeliveryRecord) -> bytes:
+    """Encodes a DeliveryRecord into its ARC-4 tuple representation."""
+    recipient = value.recipient.encode("utf-8")
+    location = value.location.encode("utf-8")
+    agent = value.agent.encode("utf-8")
+    recipient_offset = 22
+    location_offset = recipient_offset + 2 + len(recipient)
+    agent_offset = location_offset + 2 + len(location)
+    return b"".join((_DELIVERY_RECORD_HEAD.pack(value.id, recipient_offset, location_offset, agent_offset, value.verified), _U16.pack(len(recipient)), recipient, _U16.pack(len(location)), location, _U16.pack(len(agent)), agent))
+
+
+DECODERS: dict[str, typing.Callable[[bytes], typing.Any]] = {
+    "DeliveryRecord": decode_delivery_record,
+}
+
+ENCODERS: dict[str, typing.Callable[[typing.Any], bytes]] = {
+    "DeliveryRecord": encode_delivery_record,
+}
+
+# Box map name -> (box name prefix, value decoder) for uint64-keyed struct maps
+BOX_MAPS: dict[str, tuple[bytes, typing.Callable[[bytes], typing.Any]]] = {
+    "deliveries": (b'deliveries', decode_delivery_record),
+}
+
+
+def decode_box(map_name: str, box_name: bytes, value: bytes) -> tuple[int, typing.Any]:
+    """Decodes a raw box name and value from one of the BOX_MAPS into (key, struct)."""
+    prefix, decode = BOX_MAPS[map_name]
+    return int.from_bytes(box_name[len(prefix):], "big"), decode(value)
@@ -0,0 +1,1335 @@
+# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^3.0.0
+# Post-processed by smart_contracts._helpers.client_postprocess.
+
+# common
+import dataclasses
+import functools
+import typing
+# core algosdk
+import algosdk
+from algosdk.transaction import OnComplete
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.source_map import SourceMap
+from algosdk.transaction import Transaction
+from algosdk.v2client.models import SimulateTraceConfig
+# utils
+import algokit_utils
+from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
+
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": ["UpdateApplication"], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "name"}], "name": "hello", "returns": {"type": "string"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "initialize", "returns": {"type": "string"}, "desc": "Initialize the registry with default values", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "org_name"}, {"type": "string", "name": "wallet_address"}], "name": "register_organization", "returns": {"type": "uint64"}, "desc": "Register a new organization in the system with proper data storage", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_organization_count", "returns": {"type": "uint64"}, "desc": "Get total number of organizations registered", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_contract_stats", "returns": {"type": "string"}, "desc": "Get overall contract statistics", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "org_id"}], "name": "get_organization_details", "returns": {"type": "(uint64,string,string,uint64)", "struct": "OrganizationInfo"}, "desc": "Get detailed information about an organization", "events": [], "readonly": true, "recommendations": {}}], "name": "AidchainRegistry", "state": {"keys": {"box": {}, "global": {"organization_counter": {"key": "b3JnYW5pemF0aW9uX2NvdW50ZXI=", "keyType": "AVMString", "valueType": "AVMUint64"}, "total_organizations": {"key": "dG90YWxfb3JnYW5pemF0aW9ucw==", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"organizations": {"keyType": "uint64", "valueType": "OrganizationInfo", "prefix": "b3Jncw=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 2}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"OrganizationInfo": [{"name": "id", "type": "uint64"}, {"name": "name", "type": "string"}, {"name": "wallet_address", "type": "string"}, {"name": "verification_level", "type": "uint64"}]}, "byteCode": {"approval": "CiADAQAAJgQUb3JnYW5pemF0aW9uX2NvdW50ZXIEFR98dRN0b3RhbF9vcmdhbml6YXRpb25zBG9yZ3MxGEAABigjZyojZzEbQQDZggYEAr7OEQSJetGnBBHTrxkEFJJSEgQVaZABBLRPewM2GgCOBgCKAHIAVQBEABUAAiNDMRkURDEYRDYaAYgBVSlMULAiQzEZFEQxGESAIxUffHUAHUNvbnRyYWN0IHN0YXRpc3RpY3MgYXZhaWxhYmxlsCJDMRkURDEYRIgBERYpTFCwIkMxGRREMRhENhoBVwIANhoCVwIAiACcFilMULAiQzEZFEQxGESIAGFJFRZXBgJMUClMULAiQzEZFEQxGEQ2GgFXAgCIADNJFRZXBgJMUClMULAiQ4EEIzEZjgIACQADQv9KMRgURCJDMRhEiAACIkMkRDEAMgkSRImKAQGAB0hlbGxvLCCL/1CJKCNnKiNngCFDb250cmFjdCBpbml0aWFsaXplZCBzdWNjZXNzZnVsbHmJigIBIyhlRCIIKEsBZ0kWi/4VFlcGAov+UIv/FRZXBgKL/1BLAoACABRQSwIVgRQIFlcGAlCACAAAAAAAAAAAUE8CUExQK08CUEm8SEy/IyplRCIIKkxniSMoZUSJigEBK4v/UEm9RQFEvkSJ", "clear": "CoEBQw=="}, "desc": "Organization registry domain of Aidchain", "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMuYWlkY2hhaW5fcmVnaXN0cnkuY29udHJhY3QuQWlkY2hhaW5SZWdpc3RyeS5fX2FsZ29weV9lbnRyeXBvaW50X3dpdGhfaW5pdCgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAxIDAgVE1QTF9VUERBVEFCTEUKICAgIGJ5dGVjYmxvY2sgIm9yZ2FuaXphdGlvbl9jb3VudGVyIiAweDE1MWY3Yzc1ICJ0b3RhbF9vcmdhbml6YXRpb25zIiAib3JncyIKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9yZWdpc3RyeS9jb250cmFjdC5weToxNAogICAgLy8gc2VsZi5vcmdhbml6YXRpb25fY291bnRlciA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSkKICAgIGJ5dGVjXzAgLy8gIm9yZ2FuaXphdGlvbl9jb3VudGVyIgogICAgaW50Y18xIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fcmVnaXN0cnkvY29udHJhY3QucHk6MTUKICAgIC8vIHNlbGYudG90YWxfb3JnYW5pemF0aW9ucyA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSkKICAgIGJ5dGVjXzIgLy8gInRvdGFsX29yZ2FuaXphdGlvbnMiCiAgICBpbnRjXzEgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKCm1haW5fYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwCiAgICAvLyBjbGFzcyBBaWRjaGFpblJlZ2lzdHJ5KEFSQzRDb250cmFjdCk6CiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogbWFpbl9iYXJlX3JvdXRpbmdAMTEKICAgIHB1c2hieXRlc3MgMHgwMmJlY2UxMSAweDg5N2FkMWE3IDB4MTFkM2FmMTkgMHgxNDkyNTIxMiAweDE1Njk5MDAxIDB4YjQ0ZjdiMDMgLy8gbWV0aG9kICJoZWxsbyhzdHJpbmcpc3RyaW5nIiwgbWV0aG9kICJpbml0aWFsaXplKClzdHJpbmciLCBtZXRob2QgInJlZ2lzdGVyX29yZ2FuaXphdGlvbihzdHJpbmcsc3RyaW5nKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X29yZ2FuaXphdGlvbl9jb3VudCgpdWludDY0IiwgbWV0aG9kICJnZXRfY29udHJhY3Rfc3RhdHMoKXN0cmluZyIsIG1ldGhvZCAiZ2V0X29yZ2FuaXphdGlvbl9kZXRhaWxzKHVpbnQ2NCkodWludDY0LHN0cmluZyxzdHJpbmcsdWludDY0KSIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIG1haW5faGVsbG9fcm91dGVANSBtYWluX2luaXRpYWxpemVfcm91dGVANiBtYWluX3JlZ2lzdGVyX29yZ2FuaXphdGlvbl9yb3V0ZUA3IG1haW5fZ2V0X29yZ2FuaXphdGlvbl9jb3VudF9yb3V0ZUA4IG1haW5fZ2V0X2NvbnRyYWN0X3N0YXRzX3JvdXRlQDkgbWFpbl9nZXRfb3JnYW5pemF0aW9uX2RldGFpbHNfcm91dGVAMTAKCm1haW5fYWZ0ZXJfaWZfZWxzZUAxNDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9yZWdpc3RyeS9jb250cmFjdC5weToxMAogICAgLy8gY2xhc3MgQWlkY2hhaW5SZWdpc3RyeShBUkM0Q29udHJhY3QpOgogICAgaW50Y18xIC8vIDAKICAgIHJldHVybgoKbWFpbl9nZXRfb3JnYW5pemF0aW9uX2RldGFpbHNfcm91dGVAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fcmVnaXN0cnkvY29udHJhY3QucHk6NjQKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwCiAgICAvLyBjbGFzcyBBaWRjaGFpblJlZ2lzdHJ5KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fcmVnaXN0cnkvY29udHJhY3QucHk6NjQKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X29yZ2FuaXphdGlvbl9kZXRhaWxzCiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9jb250cmFjdF9zdGF0c19yb3V0ZUA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU5CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgcHVzaGJ5dGVzIDB4MTUxZjdjNzUwMDFkNDM2ZjZlNzQ3MjYxNjM3NDIwNzM3NDYxNzQ2OTczNzQ2OTYzNzMyMDYxNzY2MTY5NmM2MTYyNmM2NQogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9vcmdhbml6YXRpb25fY291bnRfcm91dGVAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9yZWdpc3RyeS9jb250cmFjdC5weTo1NAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgZ2V0X29yZ2FuaXphdGlvbl9jb3VudAogICAgaXRvYgogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9yZWdpc3Rlcl9vcmdhbml6YXRpb25fcm91dGVANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9yZWdpc3RyeS9jb250cmFjdC5weTozOAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9yZWdpc3RyeS9jb250cmFjdC5weToxMAogICAgLy8gY2xhc3MgQWlkY2hhaW5SZWdpc3RyeShBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fcmVnaXN0cnkvY29udHJhY3QucHk6MzgKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiByZWdpc3Rlcl9vcmdhbml6YXRpb24KICAgIGl0b2IKICAgIGJ5dGVjXzEgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5faW5pdGlhbGl6ZV9yb3V0ZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMxCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBpbml0aWFsaXplCiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9oZWxsb19yb3V0ZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI3CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwCiAgICAvLyBjbGFzcyBBaWRjaGFpblJlZ2lzdHJ5KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI3CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgaGVsbG8KICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2JhcmVfcm91dGluZ0AxMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9yZWdpc3RyeS9jb250cmFjdC5weToxMAogICAgLy8gY2xhc3MgQWlkY2hhaW5SZWdpc3RyeShBUkM0Q29udHJhY3QpOgogICAgcHVzaGludCA0IC8vIDQKICAgIGludGNfMSAvLyAwCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBtYXRjaCBtYWluX3VwZGF0ZUAxMiBtYWluX19fYWxnb3B5X2RlZmF1bHRfY3JlYXRlQDEzCiAgICBiIG1haW5fYWZ0ZXJfaWZfZWxzZUAxNAoKbWFpbl9fX2FsZ29weV9kZWZhdWx0X2NyZWF0ZUAxMzoKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAhCiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIGNyZWF0aW5nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX3VwZGF0ZUAxMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9yZWdpc3RyeS9jb250cmFjdC5weToxOAogICAgLy8gQGJhcmVtZXRob2QoYWxsb3dfYWN0aW9ucz1bIlVwZGF0ZUFwcGxpY2F0aW9uIl0pCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgdXBkYXRlCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFpZGNoYWluX3JlZ2lzdHJ5LmNvbnRyYWN0LkFpZGNoYWluUmVnaXN0cnkudXBkYXRlKCkgLT4gdm9pZDoKdXBkYXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI0CiAgICAvLyBhc3NlcnQgVGVtcGxhdGVWYXJbYm9vbF0oIlVQREFUQUJMRSIpLCAiQXBwIGlzIG5vdCB1cGRhdGFibGUiCiAgICBpbnRjXzIgLy8gVE1QTF9VUERBVEFCTEUKICAgIGFzc2VydCAvLyBBcHAgaXMgbm90IHVwZGF0YWJsZQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI1CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLCAiT25seSBjcmVhdG9yIGNhbiB1cGRhdGUiCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gT25seSBjcmVhdG9yIGNhbiB1cGRhdGUKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5haWRjaGFpbl9yZWdpc3RyeS5jb250cmFjdC5BaWRjaGFpblJlZ2lzdHJ5LmhlbGxvKG5hbWU6IGJ5dGVzKSAtPiBieXRlczoKaGVsbG86CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fcmVnaXN0cnkvY29udHJhY3QucHk6MjctMjgKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGhlbGxvKHNlbGYsIG5hbWU6IFN0cmluZykgLT4gU3RyaW5nOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fcmVnaXN0cnkvY29udHJhY3QucHk6MjkKICAgIC8vIHJldHVybiAiSGVsbG8sICIgKyBuYW1lCiAgICBwdXNoYnl0ZXMgIkhlbGxvLCAiCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFpZGNoYWluX3JlZ2lzdHJ5LmNvbnRyYWN0LkFpZGNoYWluUmVnaXN0cnkuaW5pdGlhbGl6ZSgpIC0+IGJ5dGVzOgppbml0aWFsaXplOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM0CiAgICAvLyBzZWxmLm9yZ2FuaXphdGlvbl9jb3VudGVyLnZhbHVlID0gVUludDY0KDApCiAgICBieXRlY18wIC8vICJvcmdhbml6YXRpb25fY291bnRlciIKICAgIGludGNfMSAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM1CiAgICAvLyBzZWxmLnRvdGFsX29yZ2FuaXphdGlvbnMudmFsdWUgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzIgLy8gInRvdGFsX29yZ2FuaXphdGlvbnMiCiAgICBpbnRjXzEgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9yZWdpc3RyeS9jb250cmFjdC5weTozNgogICAgLy8gcmV0dXJuIFN0cmluZygiQ29udHJhY3QgaW5pdGlhbGl6ZWQgc3VjY2Vzc2Z1bGx5IikKICAgIHB1c2hieXRlcyAiQ29udHJhY3QgaW5pdGlhbGl6ZWQgc3VjY2Vzc2Z1bGx5IgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFpZGNoYWluX3JlZ2lzdHJ5LmNvbnRyYWN0LkFpZGNoYWluUmVnaXN0cnkucmVnaXN0ZXJfb3JnYW5pemF0aW9uKG9yZ19uYW1lOiBieXRlcywgd2FsbGV0X2FkZHJlc3M6IGJ5dGVzKSAtPiB1aW50NjQ6CnJlZ2lzdGVyX29yZ2FuaXphdGlvbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9yZWdpc3RyeS9jb250cmFjdC5weTozOC0zOQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgcmVnaXN0ZXJfb3JnYW5pemF0aW9uKHNlbGYsIG9yZ19uYW1lOiBTdHJpbmcsIHdhbGxldF9hZGRyZXNzOiBTdHJpbmcpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQxCiAgICAvLyBzZWxmLm9yZ2FuaXphdGlvbl9jb3VudGVyLnZhbHVlICs9IFVJbnQ2NCgxKQogICAgaW50Y18xIC8vIDAKICAgIGJ5dGVjXzAgLy8gIm9yZ2FuaXphdGlvbl9jb3VudGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm9yZ2FuaXphdGlvbl9jb3VudGVyIGV4aXN0cwogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGJ5dGVjXzAgLy8gIm9yZ2FuaXphdGlvbl9jb3VudGVyIgogICAgZGlnIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fcmVnaXN0cnkvY29udHJhY3QucHk6NDUKICAgIC8vIGlkPUFSQzRVSW50NjQob3JnX2lkKSwKICAgIGR1cAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ2CiAgICAvLyBuYW1lPUFSQzRTdHJpbmcob3JnX25hbWUpLAogICAgZnJhbWVfZGlnIC0yCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ3CiAgICAvLyB3YWxsZXRfYWRkcmVzcz1BUkM0U3RyaW5nKHdhbGxldF9hZGRyZXNzKSwKICAgIGZyYW1lX2RpZyAtMQogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9yZWdpc3RyeS9jb250cmFjdC5weTo0NC00OQogICAgLy8gc2VsZi5vcmdhbml6YXRpb25zW0FSQzRVSW50NjQob3JnX2lkKV0gPSBPcmdhbml6YXRpb25JbmZvKAogICAgLy8gICAgIGlkPUFSQzRVSW50NjQob3JnX2lkKSwKICAgIC8vICAgICBuYW1lPUFSQzRTdHJpbmcob3JnX25hbWUpLAogICAgLy8gICAgIHdhbGxldF9hZGRyZXNzPUFSQzRTdHJpbmcod2FsbGV0X2FkZHJlc3MpLAogICAgLy8gICAgIHZlcmlmaWNhdGlvbl9sZXZlbD1BUkM0VUludDY0KDApICAjIDAgPSB1bnZlcmlmaWVkIGluaXRpYWxseQogICAgLy8gKQogICAgZGlnIDIKICAgIHB1c2hieXRlcyAweDAwMTQKICAgIGNvbmNhdAogICAgZGlnIDIKICAgIGxlbgogICAgcHVzaGludCAyMCAvLyAyMAogICAgKwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ4CiAgICAvLyB2ZXJpZmljYXRpb25fbGV2ZWw9QVJDNFVJbnQ2NCgwKSAgIyAwID0gdW52ZXJpZmllZCBpbml0aWFsbHkKICAgIHB1c2hieXRlcyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl9yZWdpc3RyeS9jb250cmFjdC5weTo0NC00OQogICAgLy8gc2VsZi5vcmdhbml6YXRpb25zW0FSQzRVSW50NjQob3JnX2lkKV0gPSBPcmdhbml6YXRpb25JbmZvKAogICAgLy8gICAgIGlkPUFSQzRVSW50NjQob3JnX2lkKSwKICAgIC8vICAgICBuYW1lPUFSQzRTdHJpbmcob3JnX25hbWUpLAogICAgLy8gICAgIHdhbGxldF9hZGRyZXNzPUFSQzRTdHJpbmcod2FsbGV0X2FkZHJlc3MpLAogICAgLy8gICAgIHZlcmlmaWNhdGlvbl9sZXZlbD1BUkM0VUludDY0KDApICAjIDAgPSB1bnZlcmlmaWVkIGluaXRpYWxseQogICAgLy8gKQogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fcmVnaXN0cnkvY29udHJhY3QucHk6NDQKICAgIC8vIHNlbGYub3JnYW5pemF0aW9uc1tBUkM0VUludDY0KG9yZ19pZCldID0gT3JnYW5pemF0aW9uSW5mbygKICAgIGJ5dGVjXzMgLy8gIm9yZ3MiCiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ0LTQ5CiAgICAvLyBzZWxmLm9yZ2FuaXphdGlvbnNbQVJDNFVJbnQ2NChvcmdfaWQpXSA9IE9yZ2FuaXphdGlvbkluZm8oCiAgICAvLyAgICAgaWQ9QVJDNFVJbnQ2NChvcmdfaWQpLAogICAgLy8gICAgIG5hbWU9QVJDNFN0cmluZyhvcmdfbmFtZSksCiAgICAvLyAgICAgd2FsbGV0X2FkZHJlc3M9QVJDNFN0cmluZyh3YWxsZXRfYWRkcmVzcyksCiAgICAvLyAgICAgdmVyaWZpY2F0aW9uX2xldmVsPUFSQzRVSW50NjQoMCkgICMgMCA9IHVudmVyaWZpZWQgaW5pdGlhbGx5CiAgICAvLyApCiAgICBkdXAKICAgIGJveF9kZWwKICAgIHBvcAogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUxCiAgICAvLyBzZWxmLnRvdGFsX29yZ2FuaXphdGlvbnMudmFsdWUgKz0gVUludDY0KDEpCiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWNfMiAvLyAidG90YWxfb3JnYW5pemF0aW9ucyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9vcmdhbml6YXRpb25zIGV4aXN0cwogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGJ5dGVjXzIgLy8gInRvdGFsX29yZ2FuaXphdGlvbnMiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUyCiAgICAvLyByZXR1cm4gb3JnX2lkCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWlkY2hhaW5fcmVnaXN0cnkuY29udHJhY3QuQWlkY2hhaW5SZWdpc3RyeS5nZXRfb3JnYW5pemF0aW9uX2NvdW50KCkgLT4gdWludDY0OgpnZXRfb3JnYW5pemF0aW9uX2NvdW50OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU3CiAgICAvLyByZXR1cm4gc2VsZi5vcmdhbml6YXRpb25fY291bnRlci52YWx1ZQogICAgaW50Y18xIC8vIDAKICAgIGJ5dGVjXzAgLy8gIm9yZ2FuaXphdGlvbl9jb3VudGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm9yZ2FuaXphdGlvbl9jb3VudGVyIGV4aXN0cwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFpZGNoYWluX3JlZ2lzdHJ5LmNvbnRyYWN0LkFpZGNoYWluUmVnaXN0cnkuZ2V0X29yZ2FuaXphdGlvbl9kZXRhaWxzKG9yZ19pZDogYnl0ZXMpIC0+IGJ5dGVzOgpnZXRfb3JnYW5pemF0aW9uX2RldGFpbHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fcmVnaXN0cnkvY29udHJhY3QucHk6NjQtNjUKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfb3JnYW5pemF0aW9uX2RldGFpbHMoc2VsZiwgb3JnX2lkOiBBUkM0VUludDY0KSAtPiBPcmdhbml6YXRpb25JbmZvOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fcmVnaXN0cnkvY29udHJhY3QucHk6NjcKICAgIC8vIGFzc2VydCBvcmdfaWQgaW4gc2VsZi5vcmdhbml6YXRpb25zLCAiT3JnYW5pemF0aW9uIG5vdCBmb3VuZCIKICAgIGJ5dGVjXzMgLy8gIm9yZ3MiCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBPcmdhbml6YXRpb24gbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fcmVnaXN0cnkvY29udHJhY3QucHk6NjgKICAgIC8vIHJldHVybiBzZWxmLm9yZ2FuaXphdGlvbnNbb3JnX2lkXQogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3JnYW5pemF0aW9ucyBlbnRyeSBleGlzdHMKICAgIHJldHN1Ygo=", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "cblocks", "sourceInfo": [{"pc": [262], "errorMessage": "App is not updatable"}, {"pc": [70, 89, 136, 153, 182, 206], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [268], "errorMessage": "Only creator can update"}, {"pc": [432], "errorMessage": "Organization not found"}, {"pc": [250], "errorMessage": "can only call when creating"}, {"pc": [73, 92, 139, 156, 185, 209, 255], "errorMessage": "can only call when not creating"}, {"pc": [334, 419], "errorMessage": "check self.organization_counter exists"}, {"pc": [434], "errorMessage": "check self.organizations entry exists"}, {"pc": [409], "errorMessage": "check self.total_organizations exists"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {"UPDATABLE": {"type": "AVMUint64"}}}"""
+
+@functools.cache
+def _get_app_spec() -> algokit_utils.Arc56Contract:
+    """Parses the embedded app spec on first use and reuses it for the rest of the process"""
+    return algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+
+def __getattr__(name: str) -> typing.Any:
+    # Keeps `from <client> import APP_SPEC` working without parsing the spec at import time
+    if name == "APP_SPEC":
+        return _get_app_spec()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def _parse_abi_args(args: object | None = None) -> list[object] | None:
+    """Helper to parse ABI args into the format expected by underlying client"""
+    if args is None:
+        return None
+
+    def convert_dataclass(value: object) -> object:
+        if dataclasses.is_dataclass(value):
+            return tuple(convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
+        elif isinstance(value, (list, tuple)):
+            return type(value)(convert_dataclass(item) for item in value)
+        return value
+
+    match args:
+        case tuple():
+            method_args = list(args)
+        case _ if dataclasses.is_dataclass(args):
+            method_args = [getattr(args, field.name) for field in dataclasses.fields(args)]
+        case _:
+            raise ValueError("Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments.")
+
+    return [
+        convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
+        for arg in method_args
+    ] if method_args else None
+
+def _init_dataclass(cls: type, data: dict) -> object:
+    """
+    Recursively instantiate a dataclass of type `cls` from `data`.
+
+    For each field on the dataclass, if the field type is also a dataclass
+    and the corresponding data is a dict, instantiate that field recursively.
+    """
+    field_values = {}
+    for field in dataclasses.fields(cls):
+        field_value = data.get(field.name)
+        # Check if the field expects another dataclass and the value is a dict.
+        if dataclasses.is_dataclass(field.type) and isinstance(field_value, dict):
+            field_values[field.name] = _init_dataclass(typing.cast(type, field.type), field_value)
+        else:
+            field_values[field.name] = field_value
+    return cls(**field_values)
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class OrganizationInfo:
+    """Struct for OrganizationInfo"""
+    id: int
+    name: str
+    wallet_address: str
+    verification_level: int
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class HelloArgs:
+    """Dataclass for hello arguments"""
+    name: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "hello(string)string"
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class RegisterOrganizationArgs:
+    """Dataclass for register_organization arguments"""
+    org_name: str
+    wallet_address: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "register_organization(string,string)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class GetOrganizationDetailsArgs:
+    """Dataclass for get_organization_details arguments"""
+    org_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_organization_details(uint64)(uint64,string,string,uint64)"
+
+
+class _AidchainRegistryUpdate:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def bare(
+        self, params: algokit_utils.AppClientBareCallParams | None = None
+    ) -> algokit_utils.AppUpdateParams:
+        return self.app_client.params.bare.update(params)
+
+
+class AidchainRegistryParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def update(self) -> "_AidchainRegistryUpdate":
+        return _AidchainRegistryUpdate(self.app_client)
+
+    def hello(
+        self,
+        args: tuple[str] | HelloArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "hello(string)string",
+            "args": method_args,
+        }))
+
+    def initialize(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "initialize()string",
+        }))
+
+    def register_organization(
+        self,
+        args: tuple[str, str] | RegisterOrganizationArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "register_organization(string,string)uint64",
+            "args": method_args,
+        }))
+
+    def get_organization_count(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_organization_count()uint64",
+        }))
+
+    def get_contract_stats(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_contract_stats()string",
+        }))
+
+    def get_organization_details(
+        self,
+        args: tuple[int] | GetOrganizationDetailsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_organization_details(uint64)(uint64,string,string,uint64)",
+            "args": method_args,
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> algokit_utils.AppCallParams:
+        return self.app_client.params.bare.clear_state(
+            params,
+            
+        )
+
+
+class _AidchainRegistryUpdateTransaction:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def bare(self, params: algokit_utils.AppClientBareCallParams | None = None) -> Transaction:
+        return self.app_client.create_transaction.bare.update(params)
+
+
+class AidchainRegistryCreateTransactionParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def update(self) -> "_AidchainRegistryUpdateTransaction":
+        return _AidchainRegistryUpdateTransaction(self.app_client)
+
+    def hello(
+        self,
+        args: tuple[str] | HelloArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "hello(string)string",
+            "args": method_args,
+        }))
+
+    def initialize(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "initialize()string",
+        }))
+
+    def register_organization(
+        self,
+        args: tuple[str, str] | RegisterOrganizationArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "register_organization(string,string)uint64",
+            "args": method_args,
+        }))
+
+    def get_organization_count(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_organization_count()uint64",
+        }))
+
+    def get_contract_stats(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_contract_stats()string",
+        }))
+
+    def get_organization_details(
+        self,
+        args: tuple[int] | GetOrganizationDetailsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_organization_details(uint64)(uint64,string,string,uint64)",
+            "args": method_args,
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> Transaction:
+        return self.app_client.create_transaction.bare.clear_state(
+            params,
+            
+        )
+
+
+class _AidchainRegistryUpdateSend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def bare(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult:
+        return self.app_client.send.bare.update(
+            params=params,
+            send_params=send_params,
+            compilation_params=compilation_params
+        )
+
+
+class AidchainRegistrySend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def update(self) -> "_AidchainRegistryUpdateSend":
+        return _AidchainRegistryUpdateSend(self.app_client)
+
+    def hello(
+        self,
+        args: tuple[str] | HelloArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "hello(string)string",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def initialize(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "initialize()string",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def register_organization(
+        self,
+        args: tuple[str, str] | RegisterOrganizationArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "register_organization(string,string)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def get_organization_count(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_organization_count()uint64",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def get_contract_stats(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_contract_stats()string",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def get_organization_details(
+        self,
+        args: tuple[int] | GetOrganizationDetailsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[OrganizationInfo]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_organization_details(uint64)(uint64,string,string,uint64)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(OrganizationInfo, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[OrganizationInfo], parsed_response)
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        return self.app_client.send.bare.clear_state(
+            params,
+            send_params=send_params,
+        )
+
+
+class GlobalStateValue(typing.TypedDict):
+    """Shape of global_state state key values"""
+    organization_counter: int
+    total_organizations: int
+
+class AidchainRegistryState:
+    """Methods to access state for the current AidchainRegistry app"""
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def global_state(
+        self
+    ) -> "_GlobalState":
+            """Methods to access global_state for the current app"""
+            return _GlobalState(self.app_client)
+
+    @property
+    def box(
+        self
+    ) -> "_BoxState":
+            """Methods to access box for the current app"""
+            return _BoxState(self.app_client)
+
+class _GlobalState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+
+    def get_all(self) -> GlobalStateValue:
+        """Get all current keyed values from global_state state"""
+        result = self.app_client.state.global_state.get_all()
+        if not result:
+            return typing.cast(GlobalStateValue, {})
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.global_state.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return typing.cast(GlobalStateValue, converted)
+
+    @property
+    def organization_counter(self) -> int:
+        """Get the current value of the organization_counter key in global_state state"""
+        value = self.app_client.state.global_state.get_value("organization_counter")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def total_organizations(self) -> int:
+        """Get the current value of the total_organizations key in global_state state"""
+        value = self.app_client.state.global_state.get_value("total_organizations")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+class _BoxState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {
+            "OrganizationInfo": OrganizationInfo
+        }
+
+    def get_all(self) -> dict[str, typing.Any]:
+        """Get all current keyed values from box state"""
+        result = self.app_client.state.box.get_all()
+        if not result:
+            return {}
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.box.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return converted
+
+    @property
+    def organizations(self) -> "_MapState[int, OrganizationInfo]":
+        """Get values from the organizations map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "organizations",
+            self._struct_classes.get("OrganizationInfo")
+        )
+
+_KeyType = typing.TypeVar("_KeyType")
+_ValueType = typing.TypeVar("_ValueType")
+
+class _AppClientStateMethodsProtocol(typing.Protocol):
+    def get_map(self, map_name: str) -> dict[typing.Any, typing.Any]:
+        ...
+    def get_map_value(self, map_name: str, key: typing.Any) -> typing.Any | None:
+        ...
+
+class _MapState(typing.Generic[_KeyType, _ValueType]):
+    """Generic class for accessing state maps with strongly typed keys and values"""
+
+    def __init__(self, state_accessor: _AppClientStateMethodsProtocol, map_name: str,
+                struct_class: typing.Type[_ValueType] | None = None):
+        self._state_accessor = state_accessor
+        self._map_name = map_name
+        self._struct_class = struct_class
+
+    def get_map(self) -> dict[_KeyType, _ValueType]:
+        """Get all current values in the map"""
+        result = self._state_accessor.get_map(self._map_name)
+        if self._struct_class and result:
+            return {k: _init_dataclass(self._struct_class, v) if isinstance(v, dict) else v
+                    for k, v in result.items()}  # type: ignore
+        return typing.cast(dict[_KeyType, _ValueType], result or {})
+
+    def get_value(self, key: _KeyType) -> _ValueType | None:
+        """Get a value from the map by key"""
+        key_value = dataclasses.asdict(key) if dataclasses.is_dataclass(key) else key  # type: ignore
+        value = self._state_accessor.get_map_value(self._map_name, key_value)
+        if value is not None and self._struct_class and isinstance(value, dict):
+            return _init_dataclass(self._struct_class, value)  # type: ignore
+        return typing.cast(_ValueType | None, value)
+
+
+class AidchainRegistryClient:
+    """Client for interacting with AidchainRegistry smart contract"""
+
+    @typing.overload
+    def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
+    
+    @typing.overload
+    def __init__(
+        self,
+        *,
+        algorand: _AlgoKitAlgorandClient,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None: ...
+
+    def __init__(
+        self,
+        app_client: algokit_utils.AppClient | None = None,
+        *,
+        algorand: _AlgoKitAlgorandClient | None = None,
+        app_id: int | None = None,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None:
+        if app_client:
+            self.app_client = app_client
+        elif algorand and app_id:
+            self.app_client = algokit_utils.AppClient(
+                algokit_utils.AppClientParams(
+                    algorand=algorand,
+                    app_spec=_get_app_spec(),
+                    app_id=app_id,
+                    app_name=app_name,
+                    default_sender=default_sender,
+                    default_signer=default_signer,
+                    approval_source_map=approval_source_map,
+                    clear_source_map=clear_source_map,
+                )
+            )
+        else:
+            raise ValueError("Either app_client or algorand and app_id must be provided")
+    
+        self.params = AidchainRegistryParams(self.app_client)
+        self.create_transaction = AidchainRegistryCreateTransactionParams(self.app_client)
+        self.send = AidchainRegistrySend(self.app_client)
+        self.state = AidchainRegistryState(self.app_client)
+
+    @staticmethod
+    def from_creator_and_name(
+        creator_address: str,
+        app_name: str,
+        algorand: _AlgoKitAlgorandClient,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+    ) -> "AidchainRegistryClient":
+        return AidchainRegistryClient(
+            algokit_utils.AppClient.from_creator_and_name(
+                creator_address=creator_address,
+                app_name=app_name,
+                app_spec=_get_app_spec(),
+                algorand=algorand,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+                ignore_cache=ignore_cache,
+                app_lookup_cache=app_lookup_cache,
+            )
+        )
+    
+    @staticmethod
+    def from_network(
+        algorand: _AlgoKitAlgorandClient,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "AidchainRegistryClient":
+        return AidchainRegistryClient(
+            algokit_utils.AppClient.from_network(
+                app_spec=_get_app_spec(),
+                algorand=algorand,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    @property
+    def app_id(self) -> int:
+        return self.app_client.app_id
+    
+    @property
+    def app_address(self) -> str:
+        return self.app_client.app_address
+    
+    @property
+    def app_name(self) -> str:
+        return self.app_client.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_client.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_client.algorand
+
+    def clone(
+        self,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "AidchainRegistryClient":
+        return AidchainRegistryClient(
+            self.app_client.clone(
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    def new_group(self) -> "AidchainRegistryComposer":
+        return AidchainRegistryComposer(self)
+
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["hello(string)string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["initialize()string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["register_organization(string,string)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_organization_count()uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_contract_stats()string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_organization_details(uint64)(uint64,string,string,uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> OrganizationInfo | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None: ...
+
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | OrganizationInfo | int | str:
+        """Decode ABI return value for the given method."""
+        if return_value is None:
+            return None
+    
+        arc56_method = self.app_spec.get_arc56_method(method)
+        decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
+    
+        # If method returns a struct, convert the dict to appropriate dataclass
+        if (arc56_method and
+            arc56_method.returns and
+            arc56_method.returns.struct and
+            isinstance(decoded, dict)):
+            struct_class = globals().get(arc56_method.returns.struct)
+            if struct_class:
+                return struct_class(**typing.cast(dict, decoded))
+        return decoded
+
+
+@dataclasses.dataclass(frozen=True)
+class AidchainRegistryBareCallCreateParams(algokit_utils.AppClientBareCallCreateParams):
+    """Parameters for creating AidchainRegistry contract with bare calls"""
+    on_complete: typing.Literal[OnComplete.NoOpOC] | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallCreateParams:
+        return algokit_utils.AppClientBareCallCreateParams(**self.__dict__)
+
+@dataclasses.dataclass(frozen=True)
+class AidchainRegistryBareCallUpdateParams(algokit_utils.AppClientBareCallParams):
+    """Parameters for calling AidchainRegistry contract with bare calls"""
+    on_complete: typing.Literal[OnComplete.UpdateApplicationOC] | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallParams:
+        return algokit_utils.AppClientBareCallParams(**self.__dict__)
+
+class AidchainRegistryFactory(algokit_utils.TypedAppFactoryProtocol[AidchainRegistryBareCallCreateParams, AidchainRegistryBareCallUpdateParams, None]):
+    """Factory for deploying and managing AidchainRegistryClient smart contracts"""
+
+    def __init__(
+        self,
+        algorand: _AlgoKitAlgorandClient,
+        *,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        version: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ):
+        self.app_factory = algokit_utils.AppFactory(
+            params=algokit_utils.AppFactoryParams(
+                algorand=algorand,
+                app_spec=_get_app_spec(),
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                version=version,
+                compilation_params=compilation_params,
+            )
+        )
+        self.params = AidchainRegistryFactoryParams(self.app_factory)
+        self.create_transaction = AidchainRegistryFactoryCreateTransaction(self.app_factory)
+        self.send = AidchainRegistryFactorySend(self.app_factory)
+
+    @property
+    def app_name(self) -> str:
+        return self.app_factory.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_factory.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_factory.algorand
+
+    def deploy(
+        self,
+        *,
+        on_update: algokit_utils.OnUpdate | None = None,
+        on_schema_break: algokit_utils.OnSchemaBreak | None = None,
+        create_params: AidchainRegistryBareCallCreateParams | None = None,
+        update_params: AidchainRegistryBareCallUpdateParams | None = None,
+        delete_params: None = None,
+        existing_deployments: algokit_utils.ApplicationLookup | None = None,
+        ignore_cache: bool = False,
+        app_name: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> tuple[AidchainRegistryClient, algokit_utils.AppFactoryDeployResult]:
+        """Deploy the application"""
+        deploy_response = self.app_factory.deploy(
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            create_params=create_params.to_algokit_utils_params() if create_params else None,
+            update_params=update_params.to_algokit_utils_params() if update_params else None,
+            delete_params=delete_params,
+            existing_deployments=existing_deployments,
+            ignore_cache=ignore_cache,
+            app_name=app_name,
+            compilation_params=compilation_params,
+            send_params=send_params,
+        )
+
+        return AidchainRegistryClient(deploy_response[0]), deploy_response[1]
+
+    def get_app_client_by_creator_and_name(
+        self,
+        creator_address: str,
+        app_name: str,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> AidchainRegistryClient:
+        """Get an app client by creator address and name"""
+        return AidchainRegistryClient(
+            self.app_factory.get_app_client_by_creator_and_name(
+                creator_address,
+                app_name,
+                default_sender,
+                default_signer,
+                ignore_cache,
+                app_lookup_cache,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+    def get_app_client_by_id(
+        self,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> AidchainRegistryClient:
+        """Get an app client by app ID"""
+        return AidchainRegistryClient(
+            self.app_factory.get_app_client_by_id(
+                app_id,
+                app_name,
+                default_sender,
+                default_signer,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+
+class AidchainRegistryFactoryParams:
+    """Parameters for creating transactions for AidchainRegistry contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = AidchainRegistryFactoryCreateParams(app_factory)
+        self.update = AidchainRegistryFactoryUpdateParams(app_factory)
+        self.delete = AidchainRegistryFactoryDeleteParams(app_factory)
+
+class AidchainRegistryFactoryCreateParams:
+    """Parameters for 'create' operations of AidchainRegistry contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateParams:
+        """Creates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            compilation_params=compilation_params)
+
+    def hello(
+        self,
+        args: tuple[str] | HelloArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the hello(string)string ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "hello(string)string",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def initialize(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the initialize()string ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "initialize()string",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def register_organization(
+        self,
+        args: tuple[str, str] | RegisterOrganizationArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the register_organization(string,string)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "register_organization(string,string)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_organization_count(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_organization_count()uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_organization_count()uint64",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_contract_stats(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_contract_stats()string ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_contract_stats()string",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_organization_details(
+        self,
+        args: tuple[int] | GetOrganizationDetailsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_organization_details(uint64)(uint64,string,string,uint64) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_organization_details(uint64)(uint64,string,string,uint64)",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+class AidchainRegistryFactoryUpdateParams:
+    """Parameters for 'update' operations of AidchainRegistry contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppUpdateParams:
+        """Updates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_update(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            )
+
+class AidchainRegistryFactoryDeleteParams:
+    """Parameters for 'delete' operations of AidchainRegistry contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppDeleteParams:
+        """Deletes an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_delete(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            )
+
+
+class AidchainRegistryFactoryCreateTransaction:
+    """Create transactions for AidchainRegistry contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = AidchainRegistryFactoryCreateTransactionCreate(app_factory)
+
+
+class AidchainRegistryFactoryCreateTransactionCreate:
+    """Create new instances of AidchainRegistry contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+    ) -> Transaction:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.create_transaction.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+        )
+
+
+class AidchainRegistryFactorySend:
+    """Send calls to AidchainRegistry contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = AidchainRegistryFactorySendCreate(app_factory)
+
+
+class AidchainRegistryFactorySendCreate:
+    """Send create calls to AidchainRegistry contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ) -> tuple[AidchainRegistryClient, algokit_utils.SendAppCreateTransactionResult]:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        result = self.app_factory.send.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            send_params=send_params,
+            compilation_params=compilation_params
+        )
+        return AidchainRegistryClient(result[0]), result[1]
+
+
+class _AidchainRegistryUpdateComposer:
+    def __init__(self, composer: "AidchainRegistryComposer"):
+        self.composer = composer
+
+
+class AidchainRegistryComposer:
+    """Composer for creating transaction groups for AidchainRegistry contract calls"""
+
+    def __init__(self, client: "AidchainRegistryClient"):
+        self.client = client
+        self._composer = client.algorand.new_group()
+        self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+
+    @property
+    def update(self) -> "_AidchainRegistryUpdateComposer":
+        return _AidchainRegistryUpdateComposer(self)
+
+    def hello(
+        self,
+        args: tuple[str] | HelloArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "AidchainRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.hello(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "hello(string)string", v
+            )
+        )
+        return self
+
+    def initialize(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "AidchainRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.initialize(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "initialize()string", v
+            )
+        )
+        return self
+
+    def register_organization(
+        self,
+        args: tuple[str, str] | RegisterOrganizationArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "AidchainRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.register_organization(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "register_organization(string,string)uint64", v
+            )
+        )
+        return self
+
+    def get_organization_count(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "AidchainRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_organization_count(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_organization_count()uint64", v
+            )
+        )
+        return self
+
+    def get_contract_stats(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "AidchainRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_contract_stats(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_contract_stats()string", v
+            )
+        )
+        return self
+
+    def get_organization_details(
+        self,
+        args: tuple[int] | GetOrganizationDetailsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "AidchainRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_organization_details(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_organization_details(uint64)(uint64,string,string,uint64)", v
+            )
+        )
+        return self
+
+    def clear_state(
+        self,
+        *,
+        args: list[bytes] | None = None,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AidchainRegistryComposer":
+        params=params or algokit_utils.CommonAppCallParams()
+        self._composer.add_app_call(
+            self.client.params.clear_state(
+                algokit_utils.AppClientBareCallParams(
+                    **{
+                        **dataclasses.asdict(params),
+                        "args": args
+                    }
+                )
+            )
+        )
+        return self
+    
+    def add_transaction(
+        self, txn: Transaction, signer: TransactionSigner | None = None
+    ) -> "AidchainRegistryComposer":
+        self._composer.add_transaction(txn, signer)
+        return self
+    
+    def composer(self) -> algokit_utils.TransactionComposer:
+        return self._composer
+    
+    def simulate(
+        self,
+        allow_more_logs: bool | None = None,
+        allow_empty_signatures: bool | None = None,
+        allow_unnamed_resources: bool | None = None,
+        extra_opcode_budget: int | None = None,
+        exec_trace_config: SimulateTraceConfig | None = None,
+        simulation_round: int | None = None,
+        skip_signatures: bool | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.simulate(
+            allow_more_logs=allow_more_logs,
+            allow_empty_signatures=allow_empty_signatures,
+            allow_unnamed_resources=allow_unnamed_resources,
+            extra_opcode_budget=extra_opcode_budget,
+            exec_trace_config=exec_trace_config,
+            simulation_round=simulation_round,
+            skip_signatures=skip_signatures,
+        )
+    
+    def send(
+        self,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.send(send_params)
@@ -0,0 +1,56 @@
+# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# This file was automatically generated by smart_contracts._helpers.struct_codecs.
+# DO NOT MODIFY IT BY HAND.
+
+import struct
+import typing
+
+from .aidchain_registry_client import (
+    OrganizationInfo,
+)
+
+_U16 = struct.Struct(">H")
+
+
+_ORGANIZATION_INFO_HEAD = struct.Struct('>QHHQ')
+
+
+def decode_organization_info(data: bytes, offset: int = 0) -> OrganizationInfo:
+    """Decodes an ARC-4 encoded OrganizationInfo starting at `offset`."""
+    id, name_offset, wallet_address_offset, verification_level, = _ORGANIZATION_INFO_HEAD.unpack_from(data, offset)
+    name_start = offset + name_offset + 2
+    name = bytes(data[name_start:name_start + _U16.unpack_from(data, offset + name_offset)[0]]).decode("utf-8")
+    wallet_address_start = offset + wallet_address_offset + 2
+    wallet_address = bytes(data[wallet_address_start:wallet_address_start + _U16.unpack_from(data, offset + wallet_address_offset)[0]]).decode("utf-8")
+    return OrganizationInfo(id, name, wallet_address, verification_level)
+
+
+def encode_organization_info(value: OrganizationInfo) -> bytes:
+    """Encodes a OrganizationInfo into its ARC-4 tuple representation."""
+    name = value.name.encode("utf-8")
+    wallet_address = value.wallet_address.encode("utf-8")
+    name_offset = 20
+    wallet_address_offset = name_offset + 2 + len(name)
+    return b"".join((_ORGANIZATION_INFO_HEAD.pack(value.id, name_offset, wallet_address_offset, value.verification_level), _U16.pack(len(name)), name, _U16.pack(len(wallet_address)), wallet_address))
+
+
+DECODERS: dict[str, typing.Callable[[bytes], typing.Any]] = {
+    "OrganizationInfo": decode_organization_info,
+}
+
+ENCODERS: dict[str, typing.Callable[[typing.Any], bytes]] = {
+    "OrganizationInfo": encode_organization_info,
+}
+
+# Box map name -> (box name prefix, value decoder) for uint64-keyed struct maps
+BOX_MAPS: dict[str, tuple[bytes, typing.Callable[[bytes], typing.Any]]] = {
+    "organizations": (b'orgs', decode_organization_info),
+}
+
+
+def decode_box(map_name: str, box_name: bytes, value: bytes) -> tuple[int, typing.Any]:
+    """Decodes a raw box name and value from one of the BOX_MAPS into (key, struct)."""
+    prefix, decode = BOX_MAPS[map_name]
+    return int.from_bytes(box_name[len(prefix):], "big"), decode(value)
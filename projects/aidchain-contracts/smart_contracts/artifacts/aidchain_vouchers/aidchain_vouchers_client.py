@@ -0,0 +1,1532 @@
+# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^3.0.0
+# Post-processed by smart_contracts._helpers.client_postprocess.
+
+# common
+import dataclasses
+import functools
+import typing
+# core algosdk
+import algosdk
+from algosdk.transaction import OnComplete
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.source_map import SourceMap
+from algosdk.transaction import Transaction
+from algosdk.v2client.models import SimulateTraceConfig
+# utils
+import algokit_utils
+from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
+
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": ["UpdateApplication"], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "name"}], "name": "hello", "returns": {"type": "string"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "initialize", "returns": {"type": "string"}, "desc": "Initialize the voucher counters with default values", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "asset_name"}, {"type": "uint64", "name": "total_supply"}], "name": "create_voucher_asset", "returns": {"type": "uint64"}, "desc": "Create a REAL ASA token on the blockchain for aid distribution", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "asset_id"}, {"type": "string", "name": "recipient"}, {"type": "uint64", "name": "amount"}], "name": "distribute_vouchers", "returns": {"type": "string"}, "desc": "REAL blockchain token transfer to recipient", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "voucher_id"}, {"type": "string", "name": "merchant"}, {"type": "uint64", "name": "amount"}], "name": "redeem_voucher", "returns": {"type": "string"}, "desc": "Redeem voucher tokens at an approved merchant", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_voucher_stats", "returns": {"type": "string"}, "desc": "Get voucher system statistics", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "voucher_id"}], "name": "get_voucher_details", "returns": {"type": "(uint64,uint64,string,uint64,uint64)", "struct": "VoucherInfo"}, "desc": "Get detailed information about a voucher", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_voucher_count", "returns": {"type": "uint64"}, "desc": "Get total number of vouchers created", "events": [], "readonly": true, "recommendations": {}}], "name": "AidchainVouchers", "state": {"keys": {"box": {}, "global": {"voucher_counter": {"key": "dm91Y2hlcl9jb3VudGVy", "keyType": "AVMString", "valueType": "AVMUint64"}, "total_vouchers_issued": {"key": "dG90YWxfdm91Y2hlcnNfaXNzdWVk", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"vouchers": {"keyType": "uint64", "valueType": "VoucherInfo", "prefix": "dm91Y2hlcnM="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 2}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"VoucherInfo": [{"name": "id", "type": "uint64"}, {"name": "asset_id", "type": "uint64"}, {"name": "name", "type": "string"}, {"name": "total_supply", "type": "uint64"}, {"name": "issued", "type": "uint64"}]}, "byteCode": {"approval": "CiADAAEAJgQPdm91Y2hlcl9jb3VudGVyBBUffHUVdG90YWxfdm91Y2hlcnNfaXNzdWVkCHZvdWNoZXJzMRhAAAYoImcqImcxG0EBO4IIBAK+zhEEiXrRpwTIUnu/BIq2oWYEIcSgZgT2SuJ0BL8O4C0EvXkJsjYaAI4IAN4AxgCsAHoAVAAmABMAAiJDMRkURDEYRIgCORYpTFCwI0MxGRREMRhENhoBiAIWKUxQsCNDMRkURDEYRIAiFR98dQAcVm91Y2hlciBzdGF0aXN0aWNzIGF2YWlsYWJsZbAjQzEZFEQxGEQ2GgEXNhoCVwIANhoDF4gBYEkVFlcGAkxQKUxQsCNDMRkURDEYRIAmFR98dQAgRGVidWcgbW9kZTogdm91Y2hlcnMgZGlzdHJpYnV0ZWSwI0MxGRREMRhENhoBVwIANhoCF4gAmylMULAjQzEZFEQxGESIAGFJFRZXBgJMUClMULAjQzEZFEQxGEQ2GgFXAgCIADNJFRZXBgJMUClMULAjQ4EEIjEZjgIACQADQv72MRgURCNDMRhEiAACI0MkRDEAMgkSRImKAQGAB0hlbGxvLCCL/1CJKCJnKiJngCFDb250cmFjdCBpbml0aWFsaXplZCBzdWNjZXNzZnVsbHmJigIBsTIAMgpHA7IssiuyKrIpIrIkIrIji/+yIoAHVk9VQ0hFUrIli/6yJoEDshCyAbO0PCIoZUQjCChLAWcWTBaL/hUWVwYCi/5Qi/8WSwNLA1CAAgAiUExQgAgAAAAAAAAAAFBMUCtPA1BJvEhMv4mKAwEiKGVEi/0MQAAFi/1AABWAEkludmFsaWQgdm91Y2hlciBJRImL/0AAI4AgQW1vdW50IG11c3QgYmUgZ3JlYXRlciB0aGFuIHplcm+JgBVWb3VjaGVycyByZWRlZW1lZCBhdCCL/lCJigEBK4v/UEm9RQFEvkSJIihlRIk=", "clear": "CoEBQw=="}, "desc": "Voucher (ASA) domain of Aidchain", "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMuYWlkY2hhaW5fdm91Y2hlcnMuY29udHJhY3QuQWlkY2hhaW5Wb3VjaGVycy5fX2FsZ29weV9lbnRyeXBvaW50X3dpdGhfaW5pdCgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgVE1QTF9VUERBVEFCTEUKICAgIGJ5dGVjYmxvY2sgInZvdWNoZXJfY291bnRlciIgMHgxNTFmN2M3NSAidG90YWxfdm91Y2hlcnNfaXNzdWVkIiAidm91Y2hlcnMiCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYm56IG1haW5fYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fdm91Y2hlcnMvY29udHJhY3QucHk6MTUKICAgIC8vIHNlbGYudm91Y2hlcl9jb3VudGVyID0gR2xvYmFsU3RhdGUoVUludDY0KDApKQogICAgYnl0ZWNfMCAvLyAidm91Y2hlcl9jb3VudGVyIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fdm91Y2hlcnMvY29udHJhY3QucHk6MTYKICAgIC8vIHNlbGYudG90YWxfdm91Y2hlcnNfaXNzdWVkID0gR2xvYmFsU3RhdGUoVUludDY0KDApKQogICAgYnl0ZWNfMiAvLyAidG90YWxfdm91Y2hlcnNfaXNzdWVkIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CgptYWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl92b3VjaGVycy9jb250cmFjdC5weToxMQogICAgLy8gY2xhc3MgQWlkY2hhaW5Wb3VjaGVycyhBUkM0Q29udHJhY3QpOgogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IG1haW5fYmFyZV9yb3V0aW5nQDEzCiAgICBwdXNoYnl0ZXNzIDB4MDJiZWNlMTEgMHg4OTdhZDFhNyAweGM4NTI3YmJmIDB4OGFiNmExNjYgMHgyMWM0YTA2NiAweGY2NGFlMjc0IDB4YmYwZWUwMmQgMHhiZDc5MDliMiAvLyBtZXRob2QgImhlbGxvKHN0cmluZylzdHJpbmciLCBtZXRob2QgImluaXRpYWxpemUoKXN0cmluZyIsIG1ldGhvZCAiY3JlYXRlX3ZvdWNoZXJfYXNzZXQoc3RyaW5nLHVpbnQ2NCl1aW50NjQiLCBtZXRob2QgImRpc3RyaWJ1dGVfdm91Y2hlcnModWludDY0LHN0cmluZyx1aW50NjQpc3RyaW5nIiwgbWV0aG9kICJyZWRlZW1fdm91Y2hlcih1aW50NjQsc3RyaW5nLHVpbnQ2NClzdHJpbmciLCBtZXRob2QgImdldF92b3VjaGVyX3N0YXRzKClzdHJpbmciLCBtZXRob2QgImdldF92b3VjaGVyX2RldGFpbHModWludDY0KSh1aW50NjQsdWludDY0LHN0cmluZyx1aW50NjQsdWludDY0KSIsIG1ldGhvZCAiZ2V0X3ZvdWNoZXJfY291bnQoKXVpbnQ2NCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIG1haW5faGVsbG9fcm91dGVANSBtYWluX2luaXRpYWxpemVfcm91dGVANiBtYWluX2NyZWF0ZV92b3VjaGVyX2Fzc2V0X3JvdXRlQDcgbWFpbl9kaXN0cmlidXRlX3ZvdWNoZXJzX3JvdXRlQDggbWFpbl9yZWRlZW1fdm91Y2hlcl9yb3V0ZUA5IG1haW5fZ2V0X3ZvdWNoZXJfc3RhdHNfcm91dGVAMTAgbWFpbl9nZXRfdm91Y2hlcl9kZXRhaWxzX3JvdXRlQDExIG1haW5fZ2V0X3ZvdWNoZXJfY291bnRfcm91dGVAMTIKCm1haW5fYWZ0ZXJfaWZfZWxzZUAxNjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl92b3VjaGVycy9jb250cmFjdC5weToxMQogICAgLy8gY2xhc3MgQWlkY2hhaW5Wb3VjaGVycyhBUkM0Q29udHJhY3QpOgogICAgaW50Y18wIC8vIDAKICAgIHJldHVybgoKbWFpbl9nZXRfdm91Y2hlcl9jb3VudF9yb3V0ZUAxMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl92b3VjaGVycy9jb250cmFjdC5weTo5OAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGdldF92b3VjaGVyX2NvdW50CiAgICBpdG9iCiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF92b3VjaGVyX2RldGFpbHNfcm91dGVAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fdm91Y2hlcnMvY29udHJhY3QucHk6OTIKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3ZvdWNoZXJzL2NvbnRyYWN0LnB5OjExCiAgICAvLyBjbGFzcyBBaWRjaGFpblZvdWNoZXJzKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fdm91Y2hlcnMvY29udHJhY3QucHk6OTIKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X3ZvdWNoZXJfZGV0YWlscwogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfdm91Y2hlcl9zdGF0c19yb3V0ZUAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl92b3VjaGVycy9jb250cmFjdC5weTo4NwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIHB1c2hieXRlcyAweDE1MWY3Yzc1MDAxYzU2NmY3NTYzNjg2NTcyMjA3Mzc0NjE3NDY5NzM3NDY5NjM3MzIwNjE3NjYxNjk2YzYxNjI2YzY1CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fcmVkZWVtX3ZvdWNoZXJfcm91dGVAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl92b3VjaGVycy9jb250cmFjdC5weTo3NgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl92b3VjaGVycy9jb250cmFjdC5weToxMQogICAgLy8gY2xhc3MgQWlkY2hhaW5Wb3VjaGVycyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl92b3VjaGVycy9jb250cmFjdC5weTo3NgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIHJlZGVlbV92b3VjaGVyCiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9kaXN0cmlidXRlX3ZvdWNoZXJzX3JvdXRlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fdm91Y2hlcnMvY29udHJhY3QucHk6NzEKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBwdXNoYnl0ZXMgMHgxNTFmN2M3NTAwMjA0NDY1NjI3NTY3MjA2ZDZmNjQ2NTNhMjA3NjZmNzU2MzY4NjU3MjczMjA2NDY5NzM3NDcyNjk2Mjc1NzQ2NTY0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fY3JlYXRlX3ZvdWNoZXJfYXNzZXRfcm91dGVANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl92b3VjaGVycy9jb250cmFjdC5weTozOQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl92b3VjaGVycy9jb250cmFjdC5weToxMQogICAgLy8gY2xhc3MgQWlkY2hhaW5Wb3VjaGVycyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl92b3VjaGVycy9jb250cmFjdC5weTozOQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGNyZWF0ZV92b3VjaGVyX2Fzc2V0CiAgICBieXRlY18xIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2luaXRpYWxpemVfcm91dGVANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl92b3VjaGVycy9jb250cmFjdC5weTozMgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgaW5pdGlhbGl6ZQogICAgZHVwCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGVjXzEgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5faGVsbG9fcm91dGVANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl92b3VjaGVycy9jb250cmFjdC5weToyOAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl92b3VjaGVycy9jb250cmFjdC5weToxMQogICAgLy8gY2xhc3MgQWlkY2hhaW5Wb3VjaGVycyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZXh0cmFjdCAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl92b3VjaGVycy9jb250cmFjdC5weToyOAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGhlbGxvCiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9iYXJlX3JvdXRpbmdAMTM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fdm91Y2hlcnMvY29udHJhY3QucHk6MTEKICAgIC8vIGNsYXNzIEFpZGNoYWluVm91Y2hlcnMoQVJDNENvbnRyYWN0KToKICAgIHB1c2hpbnQgNCAvLyA0CiAgICBpbnRjXzAgLy8gMAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgbWF0Y2ggbWFpbl91cGRhdGVAMTQgbWFpbl9fX2FsZ29weV9kZWZhdWx0X2NyZWF0ZUAxNQogICAgYiBtYWluX2FmdGVyX2lmX2Vsc2VAMTYKCm1haW5fX19hbGdvcHlfZGVmYXVsdF9jcmVhdGVAMTU6CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBjcmVhdGluZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl91cGRhdGVAMTQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fdm91Y2hlcnMvY29udHJhY3QucHk6MTkKICAgIC8vIEBiYXJlbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJVcGRhdGVBcHBsaWNhdGlvbiJdKQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIHVwZGF0ZQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5haWRjaGFpbl92b3VjaGVycy5jb250cmFjdC5BaWRjaGFpblZvdWNoZXJzLnVwZGF0ZSgpIC0+IHZvaWQ6CnVwZGF0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl92b3VjaGVycy9jb250cmFjdC5weToyNQogICAgLy8gYXNzZXJ0IFRlbXBsYXRlVmFyW2Jvb2xdKCJVUERBVEFCTEUiKSwgIkFwcCBpcyBub3QgdXBkYXRhYmxlIgogICAgaW50Y18yIC8vIFRNUExfVVBEQVRBQkxFCiAgICBhc3NlcnQgLy8gQXBwIGlzIG5vdCB1cGRhdGFibGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl92b3VjaGVycy9jb250cmFjdC5weToyNgogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywgIk9ubHkgY3JlYXRvciBjYW4gdXBkYXRlIgogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIE9ubHkgY3JlYXRvciBjYW4gdXBkYXRlCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWlkY2hhaW5fdm91Y2hlcnMuY29udHJhY3QuQWlkY2hhaW5Wb3VjaGVycy5oZWxsbyhuYW1lOiBieXRlcykgLT4gYnl0ZXM6CmhlbGxvOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3ZvdWNoZXJzL2NvbnRyYWN0LnB5OjI4LTI5CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBoZWxsbyhzZWxmLCBuYW1lOiBTdHJpbmcpIC0+IFN0cmluZzoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3ZvdWNoZXJzL2NvbnRyYWN0LnB5OjMwCiAgICAvLyByZXR1cm4gIkhlbGxvLCAiICsgbmFtZQogICAgcHVzaGJ5dGVzICJIZWxsbywgIgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5haWRjaGFpbl92b3VjaGVycy5jb250cmFjdC5BaWRjaGFpblZvdWNoZXJzLmluaXRpYWxpemUoKSAtPiBieXRlczoKaW5pdGlhbGl6ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl92b3VjaGVycy9jb250cmFjdC5weTozNQogICAgLy8gc2VsZi52b3VjaGVyX2NvdW50ZXIudmFsdWUgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzAgLy8gInZvdWNoZXJfY291bnRlciIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3ZvdWNoZXJzL2NvbnRyYWN0LnB5OjM2CiAgICAvLyBzZWxmLnRvdGFsX3ZvdWNoZXJzX2lzc3VlZC52YWx1ZSA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMiAvLyAidG90YWxfdm91Y2hlcnNfaXNzdWVkIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fdm91Y2hlcnMvY29udHJhY3QucHk6MzcKICAgIC8vIHJldHVybiBTdHJpbmcoIkNvbnRyYWN0IGluaXRpYWxpemVkIHN1Y2Nlc3NmdWxseSIpCiAgICBwdXNoYnl0ZXMgIkNvbnRyYWN0IGluaXRpYWxpemVkIHN1Y2Nlc3NmdWxseSIKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5haWRjaGFpbl92b3VjaGVycy5jb250cmFjdC5BaWRjaGFpblZvdWNoZXJzLmNyZWF0ZV92b3VjaGVyX2Fzc2V0KGFzc2V0X25hbWU6IGJ5dGVzLCB0b3RhbF9zdXBwbHk6IHVpbnQ2NCkgLT4gYnl0ZXM6CmNyZWF0ZV92b3VjaGVyX2Fzc2V0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3ZvdWNoZXJzL2NvbnRyYWN0LnB5OjM5LTQwCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBjcmVhdGVfdm91Y2hlcl9hc3NldChzZWxmLCBhc3NldF9uYW1lOiBTdHJpbmcsIHRvdGFsX3N1cHBseTogVUludDY0KSAtPiBBUkM0VUludDY0OgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fdm91Y2hlcnMvY29udHJhY3QucHk6NDItNTMKICAgIC8vIHR4bl9yZXN1bHQgPSBpdHhuLkFzc2V0Q29uZmlnKAogICAgLy8gICAgIGFzc2V0X25hbWU9YXNzZXRfbmFtZSwKICAgIC8vICAgICB1bml0X25hbWU9U3RyaW5nKCJWT1VDSEVSIiksCiAgICAvLyAgICAgdG90YWw9dG90YWxfc3VwcGx5LAogICAgLy8gICAgIGRlY2ltYWxzPTAsCiAgICAvLyAgICAgZGVmYXVsdF9mcm96ZW49RmFsc2UsCiAgICAvLyAgICAgbWFuYWdlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIHJlc2VydmU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBmcmVlemU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBjbGF3YmFjaz1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGZlZT1HbG9iYWwubWluX3R4bl9mZWUsICAjIFVzZSBtaW5pbXVtIHRyYW5zYWN0aW9uIGZlZQogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3ZvdWNoZXJzL2NvbnRyYWN0LnB5OjUyCiAgICAvLyBmZWU9R2xvYmFsLm1pbl90eG5fZmVlLCAgIyBVc2UgbWluaW11bSB0cmFuc2FjdGlvbiBmZWUKICAgIGdsb2JhbCBNaW5UeG5GZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl92b3VjaGVycy9jb250cmFjdC5weTo0OAogICAgLy8gbWFuYWdlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl92b3VjaGVycy9jb250cmFjdC5weTo0OS01MQogICAgLy8gcmVzZXJ2ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gZnJlZXplPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyBjbGF3YmFjaz1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgZHVwbiAzCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0Q2xhd2JhY2sKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRGcmVlemUKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRSZXNlcnZlCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0TWFuYWdlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3ZvdWNoZXJzL2NvbnRyYWN0LnB5OjQ3CiAgICAvLyBkZWZhdWx0X2Zyb3plbj1GYWxzZSwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0RGVmYXVsdEZyb3plbgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3ZvdWNoZXJzL2NvbnRyYWN0LnB5OjQ2CiAgICAvLyBkZWNpbWFscz0wLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXREZWNpbWFscwogICAgZnJhbWVfZGlnIC0xCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0VG90YWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl92b3VjaGVycy9jb250cmFjdC5weTo0NAogICAgLy8gdW5pdF9uYW1lPVN0cmluZygiVk9VQ0hFUiIpLAogICAgcHVzaGJ5dGVzICJWT1VDSEVSIgogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFVuaXROYW1lCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXROYW1lCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fdm91Y2hlcnMvY29udHJhY3QucHk6NDIKICAgIC8vIHR4bl9yZXN1bHQgPSBpdHhuLkFzc2V0Q29uZmlnKAogICAgcHVzaGludCAzIC8vIGFjZmcKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fdm91Y2hlcnMvY29udHJhY3QucHk6NDItNTMKICAgIC8vIHR4bl9yZXN1bHQgPSBpdHhuLkFzc2V0Q29uZmlnKAogICAgLy8gICAgIGFzc2V0X25hbWU9YXNzZXRfbmFtZSwKICAgIC8vICAgICB1bml0X25hbWU9U3RyaW5nKCJWT1VDSEVSIiksCiAgICAvLyAgICAgdG90YWw9dG90YWxfc3VwcGx5LAogICAgLy8gICAgIGRlY2ltYWxzPTAsCiAgICAvLyAgICAgZGVmYXVsdF9mcm96ZW49RmFsc2UsCiAgICAvLyAgICAgbWFuYWdlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIHJlc2VydmU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBmcmVlemU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBjbGF3YmFjaz1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGZlZT1HbG9iYWwubWluX3R4bl9mZWUsICAjIFVzZSBtaW5pbXVtIHRyYW5zYWN0aW9uIGZlZQogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIGl0eG4gQ3JlYXRlZEFzc2V0SUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl92b3VjaGVycy9jb250cmFjdC5weTo1NwogICAgLy8gc2VsZi52b3VjaGVyX2NvdW50ZXIudmFsdWUgKz0gVUludDY0KDEpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAidm91Y2hlcl9jb3VudGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdWNoZXJfY291bnRlciBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlY18wIC8vICJ2b3VjaGVyX2NvdW50ZXIiCiAgICBkaWcgMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl92b3VjaGVycy9jb250cmFjdC5weTo2MQogICAgLy8gaWQ9QVJDNFVJbnQ2NCh2b3VjaGVyX2lkKSwKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl92b3VjaGVycy9jb250cmFjdC5weTo2MgogICAgLy8gYXNzZXRfaWQ9QVJDNFVJbnQ2NChhc3NldF9pZCksCiAgICBzd2FwCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fdm91Y2hlcnMvY29udHJhY3QucHk6NjMKICAgIC8vIG5hbWU9QVJDNFN0cmluZyhhc3NldF9uYW1lKSwKICAgIGZyYW1lX2RpZyAtMgogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl92b3VjaGVycy9jb250cmFjdC5weTo2NAogICAgLy8gdG90YWxfc3VwcGx5PUFSQzRVSW50NjQodG90YWxfc3VwcGx5KSwKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3ZvdWNoZXJzL2NvbnRyYWN0LnB5OjYwLTY2CiAgICAvLyBzZWxmLnZvdWNoZXJzW0FSQzRVSW50NjQodm91Y2hlcl9pZCldID0gVm91Y2hlckluZm8oCiAgICAvLyAgICAgaWQ9QVJDNFVJbnQ2NCh2b3VjaGVyX2lkKSwKICAgIC8vICAgICBhc3NldF9pZD1BUkM0VUludDY0KGFzc2V0X2lkKSwKICAgIC8vICAgICBuYW1lPUFSQzRTdHJpbmcoYXNzZXRfbmFtZSksCiAgICAvLyAgICAgdG90YWxfc3VwcGx5PUFSQzRVSW50NjQodG90YWxfc3VwcGx5KSwKICAgIC8vICAgICBpc3N1ZWQ9QVJDNFVJbnQ2NCgwKSAgIyBObyB0b2tlbnMgaXNzdWVkIHlldAogICAgLy8gKQogICAgZGlnIDMKICAgIGRpZyAzCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweDAwMjIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fdm91Y2hlcnMvY29udHJhY3QucHk6NjUKICAgIC8vIGlzc3VlZD1BUkM0VUludDY0KDApICAjIE5vIHRva2VucyBpc3N1ZWQgeWV0CiAgICBwdXNoYnl0ZXMgMHgwMDAwMDAwMDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fdm91Y2hlcnMvY29udHJhY3QucHk6NjAtNjYKICAgIC8vIHNlbGYudm91Y2hlcnNbQVJDNFVJbnQ2NCh2b3VjaGVyX2lkKV0gPSBWb3VjaGVySW5mbygKICAgIC8vICAgICBpZD1BUkM0VUludDY0KHZvdWNoZXJfaWQpLAogICAgLy8gICAgIGFzc2V0X2lkPUFSQzRVSW50NjQoYXNzZXRfaWQpLAogICAgLy8gICAgIG5hbWU9QVJDNFN0cmluZyhhc3NldF9uYW1lKSwKICAgIC8vICAgICB0b3RhbF9zdXBwbHk9QVJDNFVJbnQ2NCh0b3RhbF9zdXBwbHkpLAogICAgLy8gICAgIGlzc3VlZD1BUkM0VUludDY0KDApICAjIE5vIHRva2VucyBpc3N1ZWQgeWV0CiAgICAvLyApCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3ZvdWNoZXJzL2NvbnRyYWN0LnB5OjYwCiAgICAvLyBzZWxmLnZvdWNoZXJzW0FSQzRVSW50NjQodm91Y2hlcl9pZCldID0gVm91Y2hlckluZm8oCiAgICBieXRlY18zIC8vICJ2b3VjaGVycyIKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fdm91Y2hlcnMvY29udHJhY3QucHk6NjAtNjYKICAgIC8vIHNlbGYudm91Y2hlcnNbQVJDNFVJbnQ2NCh2b3VjaGVyX2lkKV0gPSBWb3VjaGVySW5mbygKICAgIC8vICAgICBpZD1BUkM0VUludDY0KHZvdWNoZXJfaWQpLAogICAgLy8gICAgIGFzc2V0X2lkPUFSQzRVSW50NjQoYXNzZXRfaWQpLAogICAgLy8gICAgIG5hbWU9QVJDNFN0cmluZyhhc3NldF9uYW1lKSwKICAgIC8vICAgICB0b3RhbF9zdXBwbHk9QVJDNFVJbnQ2NCh0b3RhbF9zdXBwbHkpLAogICAgLy8gICAgIGlzc3VlZD1BUkM0VUludDY0KDApICAjIE5vIHRva2VucyBpc3N1ZWQgeWV0CiAgICAvLyApCiAgICBkdXAKICAgIGJveF9kZWwKICAgIHBvcAogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3ZvdWNoZXJzL2NvbnRyYWN0LnB5OjY4LTY5CiAgICAvLyAjIFJldHVybiB0aGUgYWN0dWFsIGFzc2V0IElEIGNyZWF0ZWQgYnkgdGhlIGJsb2NrY2hhaW4KICAgIC8vIHJldHVybiBBUkM0VUludDY0KGFzc2V0X2lkKQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFpZGNoYWluX3ZvdWNoZXJzLmNvbnRyYWN0LkFpZGNoYWluVm91Y2hlcnMucmVkZWVtX3ZvdWNoZXIodm91Y2hlcl9pZDogdWludDY0LCBtZXJjaGFudDogYnl0ZXMsIGFtb3VudDogdWludDY0KSAtPiBieXRlczoKcmVkZWVtX3ZvdWNoZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fdm91Y2hlcnMvY29udHJhY3QucHk6NzYtNzcKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIHJlZGVlbV92b3VjaGVyKHNlbGYsIHZvdWNoZXJfaWQ6IFVJbnQ2NCwgbWVyY2hhbnQ6IFN0cmluZywgYW1vdW50OiBVSW50NjQpIC0+IFN0cmluZzoKICAgIHByb3RvIDMgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3ZvdWNoZXJzL2NvbnRyYWN0LnB5Ojc5CiAgICAvLyBpZiB2b3VjaGVyX2lkID4gc2VsZi52b3VjaGVyX2NvdW50ZXIudmFsdWUgb3Igdm91Y2hlcl9pZCA9PSBVSW50NjQoMCk6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAidm91Y2hlcl9jb3VudGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdWNoZXJfY291bnRlciBleGlzdHMKICAgIGZyYW1lX2RpZyAtMwogICAgPAogICAgYm56IHJlZGVlbV92b3VjaGVyX2lmX2JvZHlAMgogICAgZnJhbWVfZGlnIC0zCiAgICBibnogcmVkZWVtX3ZvdWNoZXJfYWZ0ZXJfaWZfZWxzZUAzCgpyZWRlZW1fdm91Y2hlcl9pZl9ib2R5QDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fdm91Y2hlcnMvY29udHJhY3QucHk6ODAKICAgIC8vIHJldHVybiBTdHJpbmcoIkludmFsaWQgdm91Y2hlciBJRCIpCiAgICBwdXNoYnl0ZXMgIkludmFsaWQgdm91Y2hlciBJRCIKICAgIHJldHN1YgoKcmVkZWVtX3ZvdWNoZXJfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3ZvdWNoZXJzL2NvbnRyYWN0LnB5OjgyCiAgICAvLyBpZiBhbW91bnQgPT0gVUludDY0KDApOgogICAgZnJhbWVfZGlnIC0xCiAgICBibnogcmVkZWVtX3ZvdWNoZXJfYWZ0ZXJfaWZfZWxzZUA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fdm91Y2hlcnMvY29udHJhY3QucHk6ODMKICAgIC8vIHJldHVybiBTdHJpbmcoIkFtb3VudCBtdXN0IGJlIGdyZWF0ZXIgdGhhbiB6ZXJvIikKICAgIHB1c2hieXRlcyAiQW1vdW50IG11c3QgYmUgZ3JlYXRlciB0aGFuIHplcm8iCiAgICByZXRzdWIKCnJlZGVlbV92b3VjaGVyX2FmdGVyX2lmX2Vsc2VANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl92b3VjaGVycy9jb250cmFjdC5weTo4NQogICAgLy8gcmV0dXJuIFN0cmluZygiVm91Y2hlcnMgcmVkZWVtZWQgYXQgIikgKyBtZXJjaGFudAogICAgcHVzaGJ5dGVzICJWb3VjaGVycyByZWRlZW1lZCBhdCAiCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFpZGNoYWluX3ZvdWNoZXJzLmNvbnRyYWN0LkFpZGNoYWluVm91Y2hlcnMuZ2V0X3ZvdWNoZXJfZGV0YWlscyh2b3VjaGVyX2lkOiBieXRlcykgLT4gYnl0ZXM6CmdldF92b3VjaGVyX2RldGFpbHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fdm91Y2hlcnMvY29udHJhY3QucHk6OTItOTMKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfdm91Y2hlcl9kZXRhaWxzKHNlbGYsIHZvdWNoZXJfaWQ6IEFSQzRVSW50NjQpIC0+IFZvdWNoZXJJbmZvOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWlkY2hhaW5fdm91Y2hlcnMvY29udHJhY3QucHk6OTUKICAgIC8vIGFzc2VydCB2b3VjaGVyX2lkIGluIHNlbGYudm91Y2hlcnMsICJWb3VjaGVyIG5vdCBmb3VuZCIKICAgIGJ5dGVjXzMgLy8gInZvdWNoZXJzIgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gVm91Y2hlciBub3QgZm91bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9haWRjaGFpbl92b3VjaGVycy9jb250cmFjdC5weTo5NgogICAgLy8gcmV0dXJuIHNlbGYudm91Y2hlcnNbdm91Y2hlcl9pZF0KICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdWNoZXJzIGVudHJ5IGV4aXN0cwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFpZGNoYWluX3ZvdWNoZXJzLmNvbnRyYWN0LkFpZGNoYWluVm91Y2hlcnMuZ2V0X3ZvdWNoZXJfY291bnQoKSAtPiB1aW50NjQ6CmdldF92b3VjaGVyX2NvdW50OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FpZGNoYWluX3ZvdWNoZXJzL2NvbnRyYWN0LnB5OjEwMQogICAgLy8gcmV0dXJuIHNlbGYudm91Y2hlcl9jb3VudGVyLnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAidm91Y2hlcl9jb3VudGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdWNoZXJfY291bnRlciBleGlzdHMKICAgIHJldHN1Ygo=", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "cblocks", "sourceInfo": [{"pc": [360], "errorMessage": "App is not updatable"}, {"pc": [84, 101, 120, 166, 204, 254, 280, 304], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [366], "errorMessage": "Only creator can update"}, {"pc": [656], "errorMessage": "Voucher not found"}, {"pc": [348], "errorMessage": "can only call when creating"}, {"pc": [87, 104, 123, 169, 207, 257, 283, 307, 353], "errorMessage": "can only call when not creating"}, {"pc": [481, 545, 663], "errorMessage": "check self.voucher_counter exists"}, {"pc": [658], "errorMessage": "check self.vouchers entry exists"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {"UPDATABLE": {"type": "AVMUint64"}}}"""
+
+@functools.cache
+def _get_app_spec() -> algokit_utils.Arc56Contract:
+    """Parses the embedded app spec on first use and reuses it for the rest of the process"""
+    return algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+
+def __getattr__(name: str) -> typing.Any:
+    # Keeps `from <client> import APP_SPEC` working without parsing the spec at import time
+    if name == "APP_SPEC":
+        return _get_app_spec()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def _parse_abi_args(args: object | None = None) -> list[object] | None:
+    """Helper to parse ABI args into the format expected by underlying client"""
+    if args is None:
+        return None
+
+    def convert_dataclass(value: object) -> object:
+        if dataclasses.is_dataclass(value):
+            return tuple(convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
+        elif isinstance(value, (list, tuple)):
+            return type(value)(convert_dataclass(item) for item in value)
+        return value
+
+    match args:
+        case tuple():
+            method_args = list(args)
+        case _ if dataclasses.is_dataclass(args):
+            method_args = [getattr(args, field.name) for field in dataclasses.fields(args)]
+        case _:
+            raise ValueError("Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments.")
+
+    return [
+        convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
+        for arg in method_args
+    ] if method_args else None
+
+def _init_dataclass(cls: type, data: dict) -> object:
+    """
+    Recursively instantiate a dataclass of type `cls` from `data`.
+
+    For each field on the dataclass, if the field type is also a dataclass
+    and the corresponding data is a dict, instantiate that field recursively.
+    """
+    field_values = {}
+    for field in dataclasses.fields(cls):
+        field_value = data.get(field.name)
+        # Check if the field expects another dataclass and the value is a dict.
+        if dataclasses.is_dataclass(field.type) and isinstance(field_value, dict):
+            field_values[field.name] = _init_dataclass(typing.cast(type, field.type), field_value)
+        else:
+            field_values[field.name] = field_value
+    return cls(**field_values)
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class VoucherInfo:
+    """Struct for VoucherInfo"""
+    id: int
+    asset_id: int
+    name: str
+    total_supply: int
+    issued: int
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class HelloArgs:
+    """Dataclass for hello arguments"""
+    name: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "hello(string)string"
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class CreateVoucherAssetArgs:
+    """Dataclass for create_voucher_asset arguments"""
+    asset_name: str
+    total_supply: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "create_voucher_asset(string,uint64)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class DistributeVouchersArgs:
+    """Dataclass for distribute_vouchers arguments"""
+    asset_id: int
+    recipient: str
+    amount: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "distribute_vouchers(uint64,string,uint64)string"
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class RedeemVoucherArgs:
+    """Dataclass for redeem_voucher arguments"""
+    voucher_id: int
+    merchant: str
+    amount: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "redeem_voucher(uint64,string,uint64)string"
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class GetVoucherDetailsArgs:
+    """Dataclass for get_voucher_details arguments"""
+    voucher_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_voucher_details(uint64)(uint64,uint64,string,uint64,uint64)"
+
+
+class _AidchainVouchersUpdate:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def bare(
+        self, params: algokit_utils.AppClientBareCallParams | None = None
+    ) -> algokit_utils.AppUpdateParams:
+        return self.app_client.params.bare.update(params)
+
+
+class AidchainVouchersParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def update(self) -> "_AidchainVouchersUpdate":
+        return _AidchainVouchersUpdate(self.app_client)
+
+    def hello(
+        self,
+        args: tuple[str] | HelloArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "hello(string)string",
+            "args": method_args,
+        }))
+
+    def initialize(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "initialize()string",
+        }))
+
+    def create_voucher_asset(
+        self,
+        args: tuple[str, int] | CreateVoucherAssetArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_voucher_asset(string,uint64)uint64",
+            "args": method_args,
+        }))
+
+    def distribute_vouchers(
+        self,
+        args: tuple[int, str, int] | DistributeVouchersArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "distribute_vouchers(uint64,string,uint64)string",
+            "args": method_args,
+        }))
+
+    def redeem_voucher(
+        self,
+        args: tuple[int, str, int] | RedeemVoucherArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "redeem_voucher(uint64,string,uint64)string",
+            "args": method_args,
+        }))
+
+    def get_voucher_stats(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_voucher_stats()string",
+        }))
+
+    def get_voucher_details(
+        self,
+        args: tuple[int] | GetVoucherDetailsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_voucher_details(uint64)(uint64,uint64,string,uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def get_voucher_count(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_voucher_count()uint64",
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> algokit_utils.AppCallParams:
+        return self.app_client.params.bare.clear_state(
+            params,
+            
+        )
+
+
+class _AidchainVouchersUpdateTransaction:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def bare(self, params: algokit_utils.AppClientBareCallParams | None = None) -> Transaction:
+        return self.app_client.create_transaction.bare.update(params)
+
+
+class AidchainVouchersCreateTransactionParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def update(self) -> "_AidchainVouchersUpdateTransaction":
+        return _AidchainVouchersUpdateTransaction(self.app_client)
+
+    def hello(
+        self,
+        args: tuple[str] | HelloArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "hello(string)string",
+            "args": method_args,
+        }))
+
+    def initialize(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "initialize()string",
+        }))
+
+    def create_voucher_asset(
+        self,
+        args: tuple[str, int] | CreateVoucherAssetArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_voucher_asset(string,uint64)uint64",
+            "args": method_args,
+        }))
+
+    def distribute_vouchers(
+        self,
+        args: tuple[int, str, int] | DistributeVouchersArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "distribute_vouchers(uint64,string,uint64)string",
+            "args": method_args,
+        }))
+
+    def redeem_voucher(
+        self,
+        args: tuple[int, str, int] | RedeemVoucherArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "redeem_voucher(uint64,string,uint64)string",
+            "args": method_args,
+        }))
+
+    def get_voucher_stats(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_voucher_stats()string",
+        }))
+
+    def get_voucher_details(
+        self,
+        args: tuple[int] | GetVoucherDetailsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_voucher_details(uint64)(uint64,uint64,string,uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def get_voucher_count(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_voucher_count()uint64",
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> Transaction:
+        return self.app_client.create_transaction.bare.clear_state(
+            params,
+            
+        )
+
+
+class _AidchainVouchersUpdateSend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def bare(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult:
+        return self.app_client.send.bare.update(
+            params=params,
+            send_params=send_params,
+            compilation_params=compilation_params
+        )
+
+
+class AidchainVouchersSend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def update(self) -> "_AidchainVouchersUpdateSend":
+        return _AidchainVouchersUpdateSend(self.app_client)
+
+    def hello(
+        self,
+        args: tuple[str] | HelloArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "hello(string)string",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def initialize(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "initialize()string",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def create_voucher_asset(
+        self,
+        args: tuple[str, int] | CreateVoucherAssetArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_voucher_asset(string,uint64)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def distribute_vouchers(
+        self,
+        args: tuple[int, str, int] | DistributeVouchersArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "distribute_vouchers(uint64,string,uint64)string",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def redeem_voucher(
+        self,
+        args: tuple[int, str, int] | RedeemVoucherArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "redeem_voucher(uint64,string,uint64)string",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def get_voucher_stats(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_voucher_stats()string",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def get_voucher_details(
+        self,
+        args: tuple[int] | GetVoucherDetailsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[VoucherInfo]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_voucher_details(uint64)(uint64,uint64,string,uint64,uint64)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(VoucherInfo, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[VoucherInfo], parsed_response)
+
+    def get_voucher_count(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_voucher_count()uint64",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        return self.app_client.send.bare.clear_state(
+            params,
+            send_params=send_params,
+        )
+
+
+class GlobalStateValue(typing.TypedDict):
+    """Shape of global_state state key values"""
+    voucher_counter: int
+    total_vouchers_issued: int
+
+class AidchainVouchersState:
+    """Methods to access state for the current AidchainVouchers app"""
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def global_state(
+        self
+    ) -> "_GlobalState":
+            """Methods to access global_state for the current app"""
+            return _GlobalState(self.app_client)
+
+    @property
+    def box(
+        self
+    ) -> "_BoxState":
+            """Methods to access box for the current app"""
+            return _BoxState(self.app_client)
+
+class _GlobalState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+
+    def get_all(self) -> GlobalStateValue:
+        """Get all current keyed values from global_state state"""
+        result = self.app_client.state.global_state.get_all()
+        if not result:
+            return typing.cast(GlobalStateValue, {})
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.global_state.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return typing.cast(GlobalStateValue, converted)
+
+    @property
+    def voucher_counter(self) -> int:
+        """Get the current value of the voucher_counter key in global_state state"""
+        value = self.app_client.state.global_state.get_value("voucher_counter")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def total_vouchers_issued(self) -> int:
+        """Get the current value of the total_vouchers_issued key in global_state state"""
+        value = self.app_client.state.global_state.get_value("total_vouchers_issued")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+class _BoxState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {
+            "VoucherInfo": VoucherInfo
+        }
+
+    def get_all(self) -> dict[str, typing.Any]:
+        """Get all current keyed values from box state"""
+        result = self.app_client.state.box.get_all()
+        if not result:
+            return {}
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.box.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return converted
+
+    @property
+    def vouchers(self) -> "_MapState[int, VoucherInfo]":
+        """Get values from the vouchers map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "vouchers",
+            self._struct_classes.get("VoucherInfo")
+        )
+
+_KeyType = typing.TypeVar("_KeyType")
+_ValueType = typing.TypeVar("_ValueType")
+
+class _AppClientStateMethodsProtocol(typing.Protocol):
+    def get_map(self, map_name: str) -> dict[typing.Any, typing.Any]:
+        ...
+    def get_map_value(self, map_name: str, key: typing.Any) -> typing.Any | None:
+        ...
+
+class _MapState(typing.Generic[_KeyType, _ValueType]):
+    """Generic class for accessing state maps with strongly typed keys and values"""
+
+    def __init__(self, state_accessor: _AppClientStateMethodsProtocol, map_name: str,
+                struct_class: typing.Type[_ValueType] | None = None):
+        self._state_accessor = state_accessor
+        self._map_name = map_name
+        self._struct_class = struct_class
+
+    def get_map(self) -> dict[_KeyType, _ValueType]:
+        """Get all current values in the map"""
+        result = self._state_accessor.get_map(self._map_name)
+        if self._struct_class and result:
+            return {k: _init_dataclass(self._struct_class, v) if isinstance(v, dict) else v
+                    for k, v in result.items()}  # type: ignore
+        return typing.cast(dict[_KeyType, _ValueType], result or {})
+
+    def get_value(self, key: _KeyType) -> _ValueType | None:
+        """Get a value from the map by key"""
+        key_value = dataclasses.asdict(key) if dataclasses.is_dataclass(key) else key  # type: ignore
+        value = self._state_accessor.get_map_value(self._map_name, key_value)
+        if value is not None and self._struct_class and isinstance(value, dict):
+            return _init_dataclass(self._struct_class, value)  # type: ignore
+        return typing.cast(_ValueType | None, value)
+
+
+class AidchainVouchersClient:
+    """Client for interacting with AidchainVouchers smart contract"""
+
+    @typing.overload
+    def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
+    
+    @typing.overload
+    def __init__(
+        self,
+        *,
+        algorand: _AlgoKitAlgorandClient,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None: ...
+
+    def __init__(
+        self,
+        app_client: algokit_utils.AppClient | None = None,
+        *,
+        algorand: _AlgoKitAlgorandClient | None = None,
+        app_id: int | None = None,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None:
+        if app_client:
+            self.app_client = app_client
+        elif algorand and app_id:
+            self.app_client = algokit_utils.AppClient(
+                algokit_utils.AppClientParams(
+                    algorand=algorand,
+                    app_spec=_get_app_spec(),
+                    app_id=app_id,
+                    app_name=app_name,
+                    default_sender=default_sender,
+                    default_signer=default_signer,
+                    approval_source_map=approval_source_map,
+                    clear_source_map=clear_source_map,
+                )
+            )
+        else:
+            raise ValueError("Either app_client or algorand and app_id must be provided")
+    
+        self.params = AidchainVouchersParams(self.app_client)
+        self.create_transaction = AidchainVouchersCreateTransactionParams(self.app_client)
+        self.send = AidchainVouchersSend(self.app_client)
+        self.state = AidchainVouchersState(self.app_client)
+
+    @staticmethod
+    def from_creator_and_name(
+        creator_address: str,
+        app_name: str,
+        algorand: _AlgoKitAlgorandClient,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+    ) -> "AidchainVouchersClient":
+        return AidchainVouchersClient(
+            algokit_utils.AppClient.from_creator_and_name(
+                creator_address=creator_address,
+                app_name=app_name,
+                app_spec=_get_app_spec(),
+                algorand=algorand,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+                ignore_cache=ignore_cache,
+                app_lookup_cache=app_lookup_cache,
+            )
+        )
+    
+    @staticmethod
+    def from_network(
+        algorand: _AlgoKitAlgorandClient,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "AidchainVouchersClient":
+        return AidchainVouchersClient(
+            algokit_utils.AppClient.from_network(
+                app_spec=_get_app_spec(),
+                algorand=algorand,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    @property
+    def app_id(self) -> int:
+        return self.app_client.app_id
+    
+    @property
+    def app_address(self) -> str:
+        return self.app_client.app_address
+    
+    @property
+    def app_name(self) -> str:
+        return self.app_client.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_client.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_client.algorand
+
+    def clone(
+        self,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "AidchainVouchersClient":
+        return AidchainVouchersClient(
+            self.app_client.clone(
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    def new_group(self) -> "AidchainVouchersComposer":
+        return AidchainVouchersComposer(self)
+
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["hello(string)string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["initialize()string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["create_voucher_asset(string,uint64)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["distribute_vouchers(uint64,string,uint64)string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["redeem_voucher(uint64,string,uint64)string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_voucher_stats()string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_voucher_details(uint64)(uint64,uint64,string,uint64,uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> VoucherInfo | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_voucher_count()uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None: ...
+
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | VoucherInfo | int | str:
+        """Decode ABI return value for the given method."""
+        if return_value is None:
+            return None
+    
+        arc56_method = self.app_spec.get_arc56_method(method)
+        decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
+    
+        # If method returns a struct, convert the dict to appropriate dataclass
+        if (arc56_method and
+            arc56_method.returns and
+            arc56_method.returns.struct and
+            isinstance(decoded, dict)):
+            struct_class = globals().get(arc56_method.returns.struct)
+            if struct_class:
+                return struct_class(**typing.cast(dict, decoded))
+        return decoded
+
+
+@dataclasses.dataclass(frozen=True)
+class AidchainVouchersBareCallCreateParams(algokit_utils.AppClientBareCallCreateParams):
+    """Parameters for creating AidchainVouchers contract with bare calls"""
+    on_complete: typing.Literal[OnComplete.NoOpOC] | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallCreateParams:
+        return algokit_utils.AppClientBareCallCreateParams(**self.__dict__)
+
+@dataclasses.dataclass(frozen=True)
+class AidchainVouchersBareCallUpdateParams(algokit_utils.AppClientBareCallParams):
+    """Parameters for calling AidchainVouchers contract with bare calls"""
+    on_complete: typing.Literal[OnComplete.UpdateApplicationOC] | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallParams:
+        return algokit_utils.AppClientBareCallParams(**self.__dict__)
+
+class AidchainVouchersFactory(algokit_utils.TypedAppFactoryProtocol[AidchainVouchersBareCallCreateParams, AidchainVouchersBareCallUpdateParams, None]):
+    """Factory for deploying and managing AidchainVouchersClient smart contracts"""
+
+    def __init__(
+        self,
+        algorand: _AlgoKitAlgorandClient,
+        *,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        version: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ):
+        self.app_factory = algokit_utils.AppFactory(
+            params=algokit_utils.AppFactoryParams(
+                algorand=algorand,
+                app_spec=_get_app_spec(),
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                version=version,
+                compilation_params=compilation_params,
+            )
+        )
+        self.params = AidchainVouchersFactoryParams(self.app_factory)
+        self.create_transaction = AidchainVouchersFactoryCreateTransaction(self.app_factory)
+        self.send = AidchainVouchersFactorySend(self.app_factory)
+
+    @property
+    def app_name(self) -> str:
+        return self.app_factory.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_factory.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_factory.algorand
+
+    def deploy(
+        self,
+        *,
+        on_update: algokit_utils.OnUpdate | None = None,
+        on_schema_break: algokit_utils.OnSchemaBreak | None = None,
+        create_params: AidchainVouchersBareCallCreateParams | None = None,
+        update_params: AidchainVouchersBareCallUpdateParams | None = None,
+        delete_params: None = None,
+        existing_deployments: algokit_utils.ApplicationLookup | None = None,
+        ignore_cache: bool = False,
+        app_name: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> tuple[AidchainVouchersClient, algokit_utils.AppFactoryDeployResult]:
+        """Deploy the application"""
+        deploy_response = self.app_factory.deploy(
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            create_params=create_params.to_algokit_utils_params() if create_params else None,
+            update_params=update_params.to_algokit_utils_params() if update_params else None,
+            delete_params=delete_params,
+            existing_deployments=existing_deployments,
+            ignore_cache=ignore_cache,
+            app_name=app_name,
+            compilation_params=compilation_params,
+            send_params=send_params,
+        )
+
+        return AidchainVouchersClient(deploy_response[0]), deploy_response[1]
+
+    def get_app_client_by_creator_and_name(
+        self,
+        creator_address: str,
+        app_name: str,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> AidchainVouchersClient:
+        """Get an app client by creator address and name"""
+        return AidchainVouchersClient(
+            self.app_factory.get_app_client_by_creator_and_name(
+                creator_address,
+                app_name,
+                default_sender,
+                default_signer,
+                ignore_cache,
+                app_lookup_cache,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+    def get_app_client_by_id(
+        self,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> AidchainVouchersClient:
+        """Get an app client by app ID"""
+        return AidchainVouchersClient(
+            self.app_factory.get_app_client_by_id(
+                app_id,
+                app_name,
+                default_sender,
+                default_signer,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+
+class AidchainVouchersFactoryParams:
+    """Parameters for creating transactions for AidchainVouchers contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = AidchainVouchersFactoryCreateParams(app_factory)
+        self.update = AidchainVouchersFactoryUpdateParams(app_factory)
+        self.delete = AidchainVouchersFactoryDeleteParams(app_factory)
+
+class AidchainVouchersFactoryCreateParams:
+    """Parameters for 'create' operations of AidchainVouchers contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateParams:
+        """Creates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            compilation_params=compilation_params)
+
+    def hello(
+        self,
+        args: tuple[str] | HelloArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the hello(string)string ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "hello(string)string",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def initialize(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the initialize()string ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "initialize()string",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def create_voucher_asset(
+        self,
+        args: tuple[str, int] | CreateVoucherAssetArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the create_voucher_asset(string,uint64)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "create_voucher_asset(string,uint64)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def distribute_vouchers(
+        self,
+        args: tuple[int, str, int] | DistributeVouchersArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the distribute_vouchers(uint64,string,uint64)string ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "distribute_vouchers(uint64,string,uint64)string",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def redeem_voucher(
+        self,
+        args: tuple[int, str, int] | RedeemVoucherArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the redeem_voucher(uint64,string,uint64)string ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "redeem_voucher(uint64,string,uint64)string",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_voucher_stats(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_voucher_stats()string ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_voucher_stats()string",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_voucher_details(
+        self,
+        args: tuple[int] | GetVoucherDetailsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_voucher_details(uint64)(uint64,uint64,string,uint64,uint64) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_voucher_details(uint64)(uint64,uint64,string,uint64,uint64)",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_voucher_count(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_voucher_count()uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_voucher_count()uint64",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+class AidchainVouchersFactoryUpdateParams:
+    """Parameters for 'update' operations of AidchainVouchers contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppUpdateParams:
+        """Updates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_update(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            )
+
+class AidchainVouchersFactoryDeleteParams:
+    """Parameters for 'delete' operations of AidchainVouchers contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppDeleteParams:
+        """Deletes an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_delete(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            )
+
+
+class AidchainVouchersFactoryCreateTransaction:
+    """Create transactions for AidchainVouchers contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = AidchainVouchersFactoryCreateTransactionCreate(app_factory)
+
+
+class AidchainVouchersFactoryCreateTransactionCreate:
+    """Create new instances of AidchainVouchers contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+    ) -> Transaction:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.create_transaction.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+        )
+
+
+class AidchainVouchersFactorySend:
+    """Send calls to AidchainVouchers contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = AidchainVouchersFactorySendCreate(app_factory)
+
+
+class AidchainVouchersFactorySendCreate:
+    """Send create calls to AidchainVouchers contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ) -> tuple[AidchainVouchersClient, algokit_utils.SendAppCreateTransactionResult]:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        result = self.app_factory.send.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            send_params=send_params,
+            compilation_params=compilation_params
+        )
+        return AidchainVouchersClient(result[0]), result[1]
+
+
+class _AidchainVouchersUpdateComposer:
+    def __init__(self, composer: "AidchainVouchersComposer"):
+        self.composer = composer
+
+
+class AidchainVouchersComposer:
+    """Composer for creating transaction groups for AidchainVouchers contract calls"""
+
+    def __init__(self, client: "AidchainVouchersClient"):
+        self.client = client
+        self._composer = client.algorand.new_group()
+        self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+
+    @property
+    def update(self) -> "_AidchainVouchersUpdateComposer":
+        return _AidchainVouchersUpdateComposer(self)
+
+    def hello(
+        self,
+        args: tuple[str] | HelloArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "AidchainVouchersComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.hello(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "hello(string)string", v
+            )
+        )
+        return self
+
+    def initialize(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "AidchainVouchersComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.initialize(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "initialize()string", v
+            )
+        )
+        return self
+
+    def create_voucher_asset(
+        self,
+        args: tuple[str, int] | CreateVoucherAssetArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "AidchainVouchersComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.create_voucher_asset(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "create_voucher_asset(string,uint64)uint64", v
+            )
+        )
+        return self
+
+    def distribute_vouchers(
+        self,
+        args: tuple[int, str, int] | DistributeVouchersArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "AidchainVouchersComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.distribute_vouchers(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "distribute_vouchers(uint64,string,uint64)string", v
+            )
+        )
+        return self
+
+    def redeem_voucher(
+        self,
+        args: tuple[int, str, int] | RedeemVoucherArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "AidchainVouchersComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.redeem_voucher(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "redeem_voucher(uint64,string,uint64)string", v
+            )
+        )
+        return self
+
+    def get_voucher_stats(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "AidchainVouchersComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_voucher_stats(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_voucher_stats()string", v
+            )
+        )
+        return self
+
+    def get_voucher_details(
+        self,
+        args: tuple[int] | GetVoucherDetailsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "AidchainVouchersComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_voucher_details(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_voucher_details(uint64)(uint64,uint64,string,uint64,uint64)", v
+            )
+        )
+        return self
+
+    def get_voucher_count(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "AidchainVouchersComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_voucher_count(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_voucher_count()uint64", v
+            )
+        )
+        return self
+
+    def clear_state(
+        self,
+        *,
+        args: list[bytes] | None = None,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AidchainVouchersComposer":
+        params=params or algokit_utils.CommonAppCallParams()
+        self._composer.add_app_call(
+            self.client.params.clear_state(
+                algokit_utils.AppClientBareCallParams(
+                    **{
+                        **dataclasses.asdict(params),
+                        "args": args
+                    }
+                )
+            )
+        )
+        return self
+    
+    def add_transaction(
+        self, txn: Transaction, signer: TransactionSigner | None = None
+    ) -> "AidchainVouchersComposer":
+        self._composer.add_transaction(txn, signer)
+        return self
+    
+    def composer(self) -> algokit_utils.TransactionComposer:
+        return self._composer
+    
+    def simulate(
+        self,
+        allow_more_logs: bool | None = None,
+        allow_empty_signatures: bool | None = None,
+        allow_unnamed_resources: bool | None = None,
+        extra_opcode_budget: int | None = None,
+        exec_trace_config: SimulateTraceConfig | None = None,
+        simulation_round: int | None = None,
+        skip_signatures: bool | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.simulate(
+            allow_more_logs=allow_more_logs,
+            allow_empty_signatures=allow_empty_signatures,
+            allow_unnamed_resources=allow_unnamed_resources,
+            extra_opcode_budget=extra_opcode_budget,
+            exec_trace_config=exec_trace_config,
+            simulation_round=simulation_round,
+            skip_signatures=skip_signatures,
+        )
+    
+    def send(
+        self,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.send(send_params)
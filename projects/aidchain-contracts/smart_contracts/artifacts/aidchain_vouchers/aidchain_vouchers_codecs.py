@@ -0,0 +1,52 @@
+# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# This file was automatically generated by smart_contracts._helpers.struct_codecs.
+# DO NOT MODIFY IT BY HAND.
+
+import struct
+import typing
+
+from .aidchain_vouchers_client import (
+    VoucherInfo,
+)
+
+_U16 = struct.Struct(">H")
+
+
+_VOUCHER_INFO_HEAD = struct.Struct('>QQHQQ')
+
+
+def decode_voucher_info(data: bytes, offset: int = 0) -> VoucherInfo:
+    """Decodes an ARC-4 encoded VoucherInfo starting at `offset`."""
+    id, asset_id, name_offset, total_supply, issued, = _VOUCHER_INFO_HEAD.unpack_from(data, offset)
+    name_start = offset + name_offset + 2
+    name = bytes(data[name_start:name_start + _U16.unpack_from(data, offset + name_offset)[0]]).decode("utf-8")
+    return VoucherInfo(id, asset_id, name, total_supply, issued)
+
+
+def encode_voucher_info(value: VoucherInfo) -> bytes:
+    """Encodes a VoucherInfo into its ARC-4 tuple representation."""
+    name = value.name.encode("utf-8")
+    name_offset = 34
+    return b"".join((_VOUCHER_INFO_HEAD.pack(value.id, value.asset_id, name_offset, value.total_supply, value.issued), _U16.pack(len(name)), name))
+
+
+DECODERS: dict[str, typing.Callable[[bytes], typing.Any]] = {
+    "VoucherInfo": decode_voucher_info,
+}
+
+ENCODERS: dict[str, typing.Callable[[typing.Any], bytes]] = {
+    "VoucherInfo": encode_voucher_info,
+}
+
+# Box map name -> (box name prefix, value decoder) for uint64-keyed struct maps
+BOX_MAPS: dict[str, tuple[bytes, typing.Callable[[bytes], typing.Any]]] = {
+    "vouchers": (b'vouchers', decode_voucher_info),
+}
+
+
+def decode_box(map_name: str, box_name: bytes, value: bytes) -> tuple[int, typing.Any]:
+    """Decodes a raw box name and value from one of the BOX_MAPS into (key, struct)."""
+    prefix, decode = BOX_MAPS[map_name]
+    return int.from_bytes(box_name[len(prefix):], "big"), decode(value)
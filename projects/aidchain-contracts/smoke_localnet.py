@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Localnet smoke test for AidchainContracts.
+
+Method logic and edge cases are covered in process by tests/test_contract_emulator.py.
+This script only checks what needs a real node: it deploys (or reuses) the app with the
+DEPLOYER account and round-trips one record per box map, creates a real voucher ASA and
+sends a milestone payment as an inner transaction. Exits non-zero on the first failure.
+
+Usage:
+    python smoke_localnet.py
+    python -m smart_contracts watch aidchain_contracts smoke_localnet.py
+"""
+
+import logging
+import sys
+
+import algokit_utils
+
+from smart_contracts.aidchain_contracts.deploy_config import deploy_app
+
+logger = logging.getLogger(__name__)
+
+# Paid into the app in the same group as release_milestone_funds, which pays it out again.
+payout = 1_000
+
+
+def check(condition: bool, message: str) -> None:
+    if not condition:
+        raise Exception(f"Smoke check failed: {message}")
+    logger.info(f"ok: {message}")
+
+
+def smoke() -> None:
+    from smart_contracts.artifacts.aidchain_contracts.aidchain_contracts_client import (
+        AidchainContractsClient,
+    )
+
+    algorand = algokit_utils.AlgorandClient.from_environment()
+    if not algorand.client.is_localnet():
+        raise Exception("The smoke test writes records and only runs on localnet")
+    deployer = algorand.account.from_environment("DEPLOYER")
+    deployment, operation = deploy_app(algorand)
+    app_client = algorand.client.get_typed_app_client_by_id(
+        AidchainContractsClient, app_id=deployment.app_id, default_sender=deployer.address
+    )
+    logger.info(f"Smoke testing {app_client.app_name} ({app_client.app_id}), {operation}")
+
+    check(app_client.send.hello(args=("smoke",)).abi_return == "Hello, smoke", "hello")
+
+    campaign_id = app_client.send.create_campaign(
+        args=("Smoke campaign", 10_000, "smoke")
+    ).abi_return
+    campaign = app_client.send.get_campaign_details(args=(campaign_id,)).abi_return
+    check(campaign is not None and campaign.title == "Smoke campaign", "campaign box")
+
+    delivery_id = app_client.send.log_delivery(args=("Family 12", "Camp B")).abi_return
+    app_client.send.verify_delivery(args=(delivery_id, "smoke-agent"))
+    delivery = app_client.send.get_delivery_details(args=(delivery_id,)).abi_return
+    check(delivery is not None and delivery.verified == 1, "delivery box update")
+
+    asset_id = app_client.send.create_voucher_asset(args=("Smoke voucher", 100)).abi_return
+    asset = algorand.asset.get_by_id(asset_id)
+    check(
+        asset.creator == app_client.app_address and asset.total == 100,
+        f"voucher ASA {asset_id} created by the app",
+    )
+
+    milestone_id = app_client.send.create_milestone(
+        args=(campaign_id, 5_000, "Smoke milestone")
+    ).abi_return
+    app_client.send.complete_milestone(args=(milestone_id, "smoke proof"))
+    result = (
+        algorand.new_group()
+        .add_payment(
+            algokit_utils.PaymentParams(
+                sender=deployer.address,
+                receiver=app_client.app_address,
+                amount=algokit_utils.AlgoAmount.from_micro_algo(payout),
+            )
+        )
+        .add_app_call_method_call(
+            app_client.params.release_milestone_funds(
+                args=(milestone_id, deployer.address, payout)
+            )
+        )
+        .send()
+    )
+    inner = result.confirmations[-1]["inner-txns"][0]["txn"]["txn"]
+    check(inner["type"] == "pay" and inner["amt"] == payout, "milestone payment")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    try:
+        smoke()
+    except Exception as error:
+        logger.error(error)
+        sys.exit(1)
@@ -1,284 +0,0 @@
-#!/usr/bin/env python3
-
-import logging
-import sys
-from smart_contracts.artifacts.aidchain_contracts.aidchain_contracts_client import (
-    AidchainContractsClient, 
-    RegisterOrganizationArgs,
-    CreateCampaignArgs, 
-    CreateDonationArgs,
-    CreateVoucherAssetArgs,
-    DistributeVouchersArgs,
-    CreateMilestoneArgs,
-    CompleteMilestoneArgs,
-    ReleaseMilestoneFundsArgs,
-    LogDeliveryArgs,
-    VerifyDeliveryArgs,
-    RedeemVoucherArgs
-)
-import algokit_utils
-
-def test_all_blockchain_transactions():
-    """Test ALL implemented blockchain transactions comprehensively"""
-    logging.basicConfig(level=logging.INFO)
-    logger = logging.getLogger(__name__)
-
-    # Track test results
-    test_results = {
-        "working": [],
-        "failing": [],
-        "missing": []
-    }
-
-    try:
-        # Set up Algorand client
-        algorand = algokit_utils.AlgorandClient.from_environment()
-        deployer = algorand.account.from_environment("DEPLOYER")
-
-        # Get the deployed contract client
-        from smart_contracts.artifacts.aidchain_contracts.aidchain_contracts_client import AidchainContractsFactory
-        
-        factory = algorand.client.get_typed_app_factory(
-            AidchainContractsFactory, default_sender=deployer.address
-        )
-
-        # Deploy or get existing app
-        app_client, result = factory.deploy(
-            on_update=algokit_utils.OnUpdate.AppendApp,
-            on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
-        )
-
-        logger.info(f"Testing ALL transactions on LocalNet - App ID: {app_client.app_id}")
-        logger.info(f"Contract address: {app_client.app_address}")
-
-        # Test 1: Initialize contract ✅ WORKING
-        logger.info("=== 1. Testing initialize() ===")
-        try:
-            result = app_client.send.initialize()
-            logger.info(f"✅ Initialize: {result.abi_return}")
-            test_results["working"].append("initialize()")
-        except Exception as e:
-            logger.error(f"❌ Initialize failed: {e}")
-            test_results["failing"].append(f"initialize(): {e}")
-
-        # Test 2: Register Organization ✅ WORKING  
-        logger.info("=== 2. Testing register_organization() ===")
-        try:
-            org_result = app_client.send.register_organization(
-                args=RegisterOrganizationArgs(
-                    org_name="Red Cross International",
-                    wallet_address=deployer.address
-                )
-            )
-            logger.info(f"✅ Organization ID: {org_result.abi_return}")
-            test_results["working"].append("register_organization()")
-        except Exception as e:
-            logger.error(f"❌ Register org failed: {e}")
-            test_results["failing"].append(f"register_organization(): {e}")
-
-        # Test 3: Create Campaign ✅ WORKING
-        logger.info("=== 3. Testing create_campaign() ===")
-        try:
-            campaign_result = app_client.send.create_campaign(
-                args=CreateCampaignArgs(
-                    title="Emergency Relief Fund",
-                    target=100000,
-                    creator="Red Cross"
-                )
-            )
-            logger.info(f"✅ Campaign ID: {campaign_result.abi_return}")
-            test_results["working"].append("create_campaign()")
-        except Exception as e:
-            logger.error(f"❌ Create campaign failed: {e}")
-            test_results["failing"].append(f"create_campaign(): {e}")
-
-        # Test 4: Create Donation (needs payment) ⚠️  PARTIAL
-        logger.info("=== 4. Testing create_donation() ===")
-        try:
-            donation_result = app_client.send.create_donation(
-                args=CreateDonationArgs(campaign_id=1)
-            )
-            logger.info(f"⚠️  Donation (no payment): {donation_result.abi_return}")
-            test_results["failing"].append("create_donation(): Needs payment transaction")
-        except Exception as e:
-            logger.error(f"❌ Donation failed: {e}")
-            test_results["failing"].append(f"create_donation(): {e}")
-
-        # Test 5: Real ASA Creation ✅ WORKING
-        logger.info("=== 5. Testing create_voucher_asset() ===")
-        created_asset_id = None
-        try:
-            voucher_result = app_client.send.create_voucher_asset(
-                args=CreateVoucherAssetArgs(
-                    asset_name="Food Aid Voucher",
-                    total_supply=50000
-                )
-            )
-            created_asset_id = voucher_result.abi_return  # Capture the actual returned asset ID
-            logger.info(f"✅ ASA Created with ID: {created_asset_id}")
-            test_results["working"].append("create_voucher_asset()")
-        except Exception as e:
-            logger.error(f"❌ ASA creation failed: {e}")
-            test_results["failing"].append(f"create_voucher_asset(): {e}")
-
-        # Test 6: Token Distribution ✅ WORKING
-        logger.info("=== 6. Testing distribute_vouchers() ===")
-        try:
-            # Use the actual asset ID returned from create_voucher_asset
-            if created_asset_id is not None:
-                distribute_result = app_client.send.distribute_vouchers(
-                    args=DistributeVouchersArgs(
-                        asset_id=created_asset_id,  # Use actual returned asset ID
-                        recipient=deployer.address,  # Use address string
-                        amount=100
-                    )
-                )
-            else:
-                # Fallback if asset creation failed
-                distribute_result = app_client.send.distribute_vouchers(
-                    args=DistributeVouchersArgs(
-                        asset_id=1,  # Fallback to hardcoded ID
-                        recipient=deployer.address,  # Use address string
-                        amount=100
-                    )
-                )
-            logger.info(f"✅ Tokens distributed: {distribute_result.abi_return}")
-            test_results["working"].append("distribute_vouchers()")
-        except Exception as e:
-            logger.error(f"❌ Token distribution failed: {e}")
-            test_results["failing"].append(f"distribute_vouchers(): {e}")
-
-        # Test 7: Milestone Creation ✅ WORKING
-        logger.info("=== 7. Testing create_milestone() ===")
-        try:
-            milestone_result = app_client.send.create_milestone(
-                args=CreateMilestoneArgs(
-                    campaign_id=1,
-                    target_amount=25000,
-                    description="Phase 1: Emergency supplies delivered"
-                )
-            )
-            logger.info(f"✅ Milestone ID: {milestone_result.abi_return}")
-            test_results["working"].append("create_milestone()")
-        except Exception as e:
-            logger.error(f"❌ Create milestone failed: {e}")
-            test_results["failing"].append(f"create_milestone(): {e}")
-
-        # Test 8: Complete Milestone ✅ WORKING
-        logger.info("=== 8. Testing complete_milestone() ===")
-        try:
-            complete_result = app_client.send.complete_milestone(
-                args=CompleteMilestoneArgs(
-                    milestone_id=1,
-                    proof="Photo evidence of supply delivery uploaded to IPFS: QmHash123"
-                )
-            )
-            logger.info(f"✅ Milestone completed: {complete_result.abi_return}")
-            test_results["working"].append("complete_milestone()")
-        except Exception as e:
-            logger.error(f"❌ Complete milestone failed: {e}")
-            test_results["failing"].append(f"complete_milestone(): {e}")
-
-        # Test 9: Release Milestone Funds ✅ WORKING
-        logger.info("=== 9. Testing release_milestone_funds() ===")
-        try:
-            release_result = app_client.send.release_milestone_funds(
-                args=ReleaseMilestoneFundsArgs(
-                    milestone_id=1,
-                    recipient=deployer.address,  # Use address string
-                    amount=25000
-                )
-            )
-            logger.info(f"✅ Funds released: {release_result.abi_return}")
-            test_results["working"].append("release_milestone_funds()")
-        except Exception as e:
-            logger.error(f"❌ Fund release failed: {e}")
-            test_results["failing"].append(f"release_milestone_funds(): {e}")
-
-        # Test 10: Log Delivery ✅ WORKING
-        logger.info("=== 10. Testing log_delivery() ===")
-        try:
-            delivery_result = app_client.send.log_delivery(
-                args=LogDeliveryArgs(
-                    recipient="Refugee Camp A - Family #1247",
-                    location="GPS: 40.7128,-74.0060"
-                )
-            )
-            logger.info(f"✅ Delivery ID: {delivery_result.abi_return}")
-            test_results["working"].append("log_delivery()")
-        except Exception as e:
-            logger.error(f"❌ Log delivery failed: {e}")
-            test_results["failing"].append(f"log_delivery(): {e}")
-
-        # Test 11: Verify Delivery ✅ WORKING
-        logger.info("=== 11. Testing verify_delivery() ===")
-        try:
-            verify_result = app_client.send.verify_delivery(
-                args=VerifyDeliveryArgs(
-                    delivery_id=1,
-                    agent="Field Agent Sarah Johnson"
-                )
-            )
-            logger.info(f"✅ Delivery verified: {verify_result.abi_return}")
-            test_results["working"].append("verify_delivery()")
-        except Exception as e:
-            logger.error(f"❌ Verify delivery failed: {e}")
-            test_results["failing"].append(f"verify_delivery(): {e}")
-
-        # Test 12: Get Statistics ✅ WORKING
-        logger.info("=== 12. Testing get_contract_stats() ===")
-        try:
-            stats_result = app_client.send.get_contract_stats()
-            logger.info(f"✅ Contract stats: {stats_result.abi_return}")
-            test_results["working"].append("get_contract_stats()")
-        except Exception as e:
-            logger.error(f"❌ Get stats failed: {e}")
-            test_results["failing"].append(f"get_contract_stats(): {e}")
-
-        # Test 13: Get Counters ✅ WORKING
-        logger.info("=== 13. Testing get_total_donations() ===")
-        try:
-            total_result = app_client.send.get_total_donations()
-            logger.info(f"✅ Total donations: {total_result.abi_return}")
-            test_results["working"].append("get_total_donations()")
-        except Exception as e:
-            logger.error(f"❌ Get total failed: {e}")
-            test_results["failing"].append(f"get_total_donations(): {e}")
-
-    except Exception as e:
-        logger.error(f"❌ Critical test failure: {e}")
-        return False
-
-    # Print comprehensive results
-    logger.info("\n" + "="*60)
-    logger.info("COMPREHENSIVE TEST RESULTS")
-    logger.info("="*60)
-    
-    logger.info(f"\n✅ WORKING TRANSACTIONS ({len(test_results['working'])}):")
-    for transaction in test_results["working"]:
-        logger.info(f"  ✅ {transaction}")
-    
-    logger.info(f"\n❌ FAILING/PARTIAL TRANSACTIONS ({len(test_results['failing'])}):")
-    for transaction in test_results["failing"]:
-        logger.info(f"  ❌ {transaction}")
-    
-    logger.info(f"\n🔍 MISSING TRANSACTIONS (not implemented):")
-    missing_transactions = [
-        "get_organization_details(org_id) -> OrganizationInfo",
-        "get_campaign_details(campaign_id) -> CampaignInfo", 
-        "accept_payment_donation() with payment transaction",
-        "opt_in_to_asset() for recipients",
-        "box_storage_operations() for complex data",
-        "multi_signature_operations() for organizations"
-    ]
-    for transaction in missing_transactions:
-        logger.info(f"  🔍 {transaction}")
-
-    success_rate = len(test_results["working"]) / (len(test_results["working"]) + len(test_results["failing"])) * 100
-    logger.info(f"\n📊 SUCCESS RATE: {success_rate:.1f}% ({len(test_results['working'])}/{len(test_results['working']) + len(test_results['failing'])})")
-
-    return True
-
-if __name__ == "__main__":
-    success = test_all_blockchain_transactions()
-    sys.exit(0 if success else 1)
\ No newline at end of file
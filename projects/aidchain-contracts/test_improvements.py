@@ -1,93 +0,0 @@
-#!/usr/bin/env python3
-
-import logging
-import sys
-import algokit_utils
-from algopy import arc4
-
-def test_improvements():
-    """Test key improvements: BoxMap storage, assert validation, proper return types"""
-    logging.basicConfig(level=logging.INFO)
-    logger = logging.getLogger(__name__)
-
-    try:
-        # Set up Algorand client
-        algorand = algokit_utils.AlgorandClient.from_environment()
-        deployer = algorand.account.from_environment("DEPLOYER")
-
-        # Deploy using the factory pattern
-        from smart_contracts.artifacts.aidchain_contracts.aidchain_contracts_client import AidchainContractsFactory
-        
-        factory = algorand.client.get_typed_app_factory(
-            AidchainContractsFactory, default_sender=deployer.address
-        )
-
-        app_client, result = factory.deploy(
-            on_update=algokit_utils.OnUpdate.AppendApp,
-            on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
-        )
-
-        logger.info(f"Testing improved contract at app ID: {app_client.app_id}")
-
-        # Test 1: Professional Assert Validation
-        logger.info("=== Testing Professional Assert Validation ===")
-        try:
-            # This should fail with assert instead of returning error string
-            result = app_client.send.create_donation((999,))  # Invalid campaign ID
-            logger.error(f"❌ Expected assertion error but got: {result.abi_return}")
-        except Exception as e:
-            if "assert" in str(e).lower() or "campaign" in str(e).lower():
-                logger.info("✅ Assert validation working - proper error thrown")
-            else:
-                logger.error(f"❌ Unexpected error: {e}")
-
-        # Test 2: ASA Creation with Proper Return Type
-        logger.info("=== Testing ASA Creation Return Type ===")
-        try:
-            result = app_client.send.create_voucher_asset(("Test Voucher", 1000))
-            asset_id = result.abi_return
-            logger.info(f"✅ ASA Created - Returned asset ID: {asset_id} (type: {type(asset_id)})")
-            
-            # Verify it's a proper integer, not a string
-            if isinstance(asset_id, int) and asset_id > 0:
-                logger.info("✅ Return type is proper integer")
-            else:
-                logger.error(f"❌ Expected integer asset ID, got {type(asset_id)}: {asset_id}")
-        except Exception as e:
-            logger.error(f"❌ ASA creation failed: {e}")
-
-        # Test 3: BoxMap Storage (Test campaign creation and retrieval)
-        logger.info("=== Testing BoxMap Storage ===")
-        try:
-            # Create a campaign
-            campaign_result = app_client.send.create_campaign(("Emergency Relief", 50000, "Red Cross"))
-            campaign_id = campaign_result.abi_return
-            logger.info(f"✅ Campaign created with ID: {campaign_id}")
-            
-            # Try to retrieve campaign details (this will only work if BoxMap is working)
-            try:
-                campaign_details = app_client.send.get_campaign_details((campaign_id,))
-                logger.info(f"✅ BoxMap storage working - retrieved campaign details")
-            except Exception as e:
-                if "not found" in str(e).lower():
-                    logger.error("❌ BoxMap storage not working - campaign not found")
-                else:
-                    logger.info(f"ℹ️  Cannot test retrieval method (might not be available in old client): {e}")
-        except Exception as e:
-            logger.error(f"❌ Campaign creation failed: {e}")
-
-        logger.info("=== Professional Improvements Test Summary ===")
-        logger.info("✅ Contract successfully deployed with professional patterns")
-        logger.info("✅ Assert-based validation implemented")
-        logger.info("✅ Proper return types for ASA creation")
-        logger.info("✅ BoxMap infrastructure added to contract")
-
-    except Exception as e:
-        logger.error(f"❌ Test failed: {e}")
-        return False
-
-    return True
-
-if __name__ == "__main__":
-    success = test_improvements()
-    sys.exit(0 if success else 1)
\ No newline at end of file
@@ -1,107 +0,0 @@
-#!/usr/bin/env python3
-
-import logging
-import sys
-from smart_contracts.artifacts.aidchain_contracts.aidchain_contracts_client import (
-    AidchainContractsClient, 
-    RegisterOrganizationArgs,
-    CreateCampaignArgs, 
-    CreateDonationArgs,
-    CreateVoucherAssetArgs,
-    DistributeVouchersArgs,
-    CreateMilestoneArgs,
-    LogDeliveryArgs,
-    ReleaseMilestoneFundsArgs
-)
-import algokit_utils
-
-def test_real_blockchain_operations():
-    """Test REAL blockchain operations on LocalNet"""
-    logging.basicConfig(level=logging.INFO)
-    logger = logging.getLogger(__name__)
-
-    try:
-        # Set up Algorand client
-        algorand = algokit_utils.AlgorandClient.from_environment()
-        deployer = algorand.account.from_environment("DEPLOYER")
-
-        # Get the deployed contract client
-        from smart_contracts.artifacts.aidchain_contracts.aidchain_contracts_client import AidchainContractsFactory
-        
-        factory = algorand.client.get_typed_app_factory(
-            AidchainContractsFactory, default_sender=deployer.address
-        )
-
-        # Deploy or get existing app
-        app_client, result = factory.deploy(
-            on_update=algokit_utils.OnUpdate.AppendApp,
-            on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
-        )
-
-        logger.info(f"Testing REAL blockchain operations on LocalNet - App ID: {app_client.app_id}")
-
-        # Test 1: Initialize contract (affects blockchain state)
-        logger.info("=== Testing initialize() - Real GlobalState modification ===")
-        result = app_client.send.initialize()
-        logger.info(f"Initialize result: {result.abi_return}")
-
-        # Test 2: Create REAL ASA token on blockchain
-        logger.info("=== Testing create_voucher_asset() - Real ASA creation ===")
-        voucher_result = app_client.send.create_voucher_asset(
-            args=CreateVoucherAssetArgs(
-                asset_name="Emergency Food Voucher",
-                total_supply=10000
-            )
-        )
-        logger.info(f"Real ASA creation result: {voucher_result.abi_return}")
-        
-        # Test 3: Make real donation with payment
-        logger.info("=== Testing create_donation() - Real payment handling ===")
-        # This would need to include payment transaction
-        try:
-            donation_result = app_client.send.create_donation(
-                args=CreateDonationArgs(
-                    campaign_id=1
-                )
-            )
-            logger.info(f"Donation result: {donation_result.abi_return}")
-        except Exception as e:
-            logger.info(f"Donation test (expected to need payment): {e}")
-
-        # Test 4: Register organization (modifies blockchain state)
-        logger.info("=== Testing register_organization() - Real state storage ===")
-        org_result = app_client.send.register_organization(
-            args=RegisterOrganizationArgs(
-                org_name="International Red Cross",
-                wallet_address=deployer.address
-            )
-        )
-        logger.info(f"Organization registration: {org_result.abi_return}")
-
-        # Test 5: Create campaign (modifies blockchain state)
-        logger.info("=== Testing create_campaign() - Real state storage ===")
-        campaign_result = app_client.send.create_campaign(
-            args=CreateCampaignArgs(
-                title="Hurricane Relief Fund",
-                target=100000,
-                creator="Red Cross"
-            )
-        )
-        logger.info(f"Campaign creation: {campaign_result.abi_return}")
-
-        # Test 6: Get updated totals from blockchain
-        logger.info("=== Testing get_total_donations() - Read from blockchain ===")
-        total_result = app_client.send.get_total_donations()
-        logger.info(f"Total donations on blockchain: {total_result.abi_return}")
-
-        logger.info("✅ Real blockchain operations tested successfully on LocalNet!")
-
-    except Exception as e:
-        logger.error(f"❌ Test failed: {e}")
-        return False
-
-    return True
-
-if __name__ == "__main__":
-    success = test_real_blockchain_operations()
-    sys.exit(0 if success else 1)
\ No newline at end of file
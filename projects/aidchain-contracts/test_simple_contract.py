@@ -1,77 +0,0 @@
-#!/usr/bin/env python3
-
-import logging
-import sys
-from smart_contracts.artifacts.aidchain_contracts.aidchain_contracts_client import (
-    AidchainContractsClient, 
-    RegisterOrganizationArgs,
-    CreateCampaignArgs, 
-    CreateDonationArgs,
-    CreateVoucherAssetArgs,
-    DistributeVouchersArgs,
-    CreateMilestoneArgs,
-    LogDeliveryArgs
-)
-import algokit_utils
-
-def test_simple_contract():
-    """Test contract functionality without complex funding"""
-    logging.basicConfig(level=logging.INFO)
-    logger = logging.getLogger(__name__)
-
-    try:
-        # Set up Algorand client
-        algorand = algokit_utils.AlgorandClient.from_environment()
-        deployer = algorand.account.from_environment("DEPLOYER")
-
-        # Get the deployed contract client
-        from smart_contracts.artifacts.aidchain_contracts.aidchain_contracts_client import AidchainContractsFactory
-        
-        factory = algorand.client.get_typed_app_factory(
-            AidchainContractsFactory, default_sender=deployer.address
-        )
-
-        # Deploy or get existing app
-        app_client, result = factory.deploy(
-            on_update=algokit_utils.OnUpdate.AppendApp,
-            on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
-        )
-
-        logger.info(f"Testing contract at app ID: {app_client.app_id}")
-        logger.info(f"Contract address: {app_client.app_address}")
-
-        # Test 1: Initialize contract
-        logger.info("=== Testing initialize() ===")
-        result = app_client.send.initialize()
-        logger.info(f"✅ Initialize: {result.abi_return}")
-
-        # Test 2: Get contract stats (read-only, no fees needed)
-        logger.info("=== Testing get_contract_stats() ===")
-        stats_result = app_client.send.get_contract_stats()
-        logger.info(f"✅ Contract stats: {stats_result.abi_return}")
-
-        # Test 3: Get total donations (read-only, no fees needed)
-        logger.info("=== Testing get_total_donations() ===")
-        donations_result = app_client.send.get_total_donations()
-        logger.info(f"✅ Total donations: {donations_result.abi_return}")
-
-        # Test 4: Get organization count (read-only, no fees needed)
-        logger.info("=== Testing get_organization_count() ===")
-        org_count_result = app_client.send.get_organization_count()
-        logger.info(f"✅ Organization count: {org_count_result.abi_return}")
-
-        # Test 5: Get campaign count (read-only, no fees needed)
-        logger.info("=== Testing get_campaign_count() ===")
-        campaign_count_result = app_client.send.get_campaign_count()
-        logger.info(f"✅ Campaign count: {campaign_count_result.abi_return}")
-
-        logger.info("\n🎉 BASIC READ-ONLY TESTS PASSED!")
-        logger.info("📝 Note: Write operations require contract funding for transaction fees")
-        logger.info("📝 The contract is functionally complete but needs ALGOs for state changes")
-
-    except Exception as e:
-        logger.error(f"❌ Test failed: {e}")
-        sys.exit(1)
-
-if __name__ == "__main__":
-    test_simple_contract()
@@ -0,0 +1,105 @@
+"""
+Localnet fixtures that let integration tests run in parallel (`pytest -n <workers>` with
+pytest-xdist). Each worker process gets its own funded account and creates fresh app
+instances in batches, one group of creates per batch, so tests never share counters or
+boxes and workers never wait on each other.
+"""
+
+from collections.abc import Callable
+
+import algokit_utils
+import pytest
+
+from smart_contracts._helpers.funding import FundingPlan
+from smart_contracts._helpers.localnet_workers import (
+    AppPool,
+    batch_creator,
+    batch_spending,
+    fund_worker,
+)
+from smart_contracts._helpers.teal_cache import with_teal_cache
+from smart_contracts.aidchain_contracts.deploy_config import funding_plan
+from smart_contracts.artifacts.aidchain_contracts.aidchain_contracts_client import (
+    AidchainContractsClient,
+    AidchainContractsFactory,
+)
+
+# Extra balance per app for payments made by tests (release_milestone_funds).
+test_payouts = 100_000
+# Apps created per group; a worker creates a new batch whenever it has used the last one.
+apps_per_batch = 8
+
+
+@pytest.fixture(scope="session")
+def algorand() -> algokit_utils.AlgorandClient:
+    algorand = algokit_utils.AlgorandClient.default_localnet()
+    try:
+        algorand.client.algod.health()
+    except Exception:
+        pytest.skip("localnet is not running (algokit localnet start)")
+    return with_teal_cache(algorand)
+
+
+@pytest.fixture(scope="session")
+def plan() -> FundingPlan:
+    return funding_plan()
+
+
+@pytest.fixture(scope="session")
+def app_funding(plan: FundingPlan) -> int:
+    return plan.required + test_payouts
+
+
+@pytest.fixture(scope="session")
+def worker_account(
+    algorand: algokit_utils.AlgorandClient, app_funding: int, plan: FundingPlan
+) -> algokit_utils.SigningAccount:
+    return fund_worker(
+        algorand, batch_spending(apps_per_batch, app_funding, plan.creator_min_balance)
+    )
+
+
+@pytest.fixture(scope="session")
+def app_factory(
+    algorand: algokit_utils.AlgorandClient, worker_account: algokit_utils.SigningAccount
+) -> AidchainContractsFactory:
+    return algorand.client.get_typed_app_factory(
+        AidchainContractsFactory,
+        default_sender=worker_account.address,
+        compilation_params=algokit_utils.AppClientCompilationParams(updatable=False),
+    )
+
+
+@pytest.fixture(scope="session")
+def app_pool(
+    algorand: algokit_utils.AlgorandClient,
+    app_factory: AidchainContractsFactory,
+    worker_account: algokit_utils.SigningAccount,
+    app_funding: int,
+    plan: FundingPlan,
+) -> AppPool:
+    def create_params(note: str) -> algokit_utils.AppCreateParams:
+        return app_factory.params.create.bare(
+            params=algokit_utils.CommonAppCallCreateParams(note=note.encode())
+        )
+
+    return AppPool(
+        batch_creator(
+            algorand, create_params, worker_account, app_funding, plan.creator_min_balance
+        ),
+        batch_size=apps_per_batch,
+    )
+
+
+@pytest.fixture
+def new_app(
+    app_pool: AppPool, app_factory: AidchainContractsFactory
+) -> Callable[[], AidchainContractsClient]:
+    """Returns a client for another fresh app each time it is called."""
+    return lambda: app_factory.get_app_client_by_id(app_pool.take())
+
+
+@pytest.fixture
+def app_client(new_app: Callable[[], AidchainContractsClient]) -> AidchainContractsClient:
+    """A fresh, funded AidchainContracts app owned by this worker's account."""
+    return new_app()
@@ -0,0 +1,80 @@
+"""
+AidchainContracts on localnet, one fresh app per test (see conftest.py). Run in parallel
+with `pytest tests/integration -n auto`; skipped when localnet is not running.
+"""
+
+from collections.abc import Callable
+
+import algokit_utils
+
+from smart_contracts.artifacts.aidchain_contracts.aidchain_contracts_client import (
+    AidchainContractsClient,
+)
+
+
+def test_records_are_numbered_from_one(app_client: AidchainContractsClient) -> None:
+    assert app_client.send.register_organization(args=("Red Cross", "ADDR")).abi_return == 1
+    campaign = app_client.send.create_campaign(args=("Flood relief", 10_000, "Red Cross"))
+    assert campaign.abi_return == 1
+    assert app_client.send.log_delivery(args=("Family 12", "Camp B")).abi_return == 1
+    assert app_client.send.get_campaign_count().abi_return == 1
+    assert app_client.state.global_state.organization_counter == 1
+
+
+def test_apps_are_isolated(new_app: Callable[[], AidchainContractsClient]) -> None:
+    first, second = new_app(), new_app()
+    first.send.create_campaign(args=("Flood relief", 10_000, "Red Cross"))
+
+    assert first.app_id != second.app_id
+    assert first.send.get_campaign_count().abi_return == 1
+    assert second.send.get_campaign_count().abi_return == 0
+
+
+def test_campaign_and_milestone_boxes(app_client: AidchainContractsClient) -> None:
+    campaign_id = app_client.send.create_campaign(args=("Flood relief", 10_000, "Red Cross"))
+    milestone_id = app_client.send.create_milestone(
+        args=(campaign_id.abi_return, 5_000, "Phase 1")
+    ).abi_return
+    app_client.send.complete_milestone(args=(milestone_id, "ipfs://proof"))
+
+    campaign = app_client.send.get_campaign_details(args=(campaign_id.abi_return,)).abi_return
+    milestone = app_client.send.get_milestone_details(args=(milestone_id,)).abi_return
+    assert campaign is not None and campaign.title == "Flood relief"
+    assert milestone is not None and (milestone.campaign_id, milestone.completed) == (1, 1)
+    assert app_client.state.box.milestones.get_value(milestone_id) == milestone
+
+
+def test_delivery_verification(app_client: AidchainContractsClient) -> None:
+    delivery_id = app_client.send.log_delivery(args=("Family 12", "Camp B")).abi_return
+    app_client.send.verify_delivery(args=(delivery_id, "agent-7"))
+
+    delivery = app_client.send.get_delivery_details(args=(delivery_id,)).abi_return
+    assert delivery is not None and (delivery.agent, delivery.verified) == ("agent-7", 1)
+
+
+def test_voucher_asset_is_created_by_the_app(
+    algorand: algokit_utils.AlgorandClient, app_client: AidchainContractsClient
+) -> None:
+    asset_id = app_client.send.create_voucher_asset(args=("Food voucher", 1_000)).abi_return
+
+    asset = algorand.asset.get_by_id(asset_id)
+    assert (asset.creator, asset.total, asset.unit_name) == (
+        app_client.app_address,
+        1_000,
+        "VOUCHER",
+    )
+    assert app_client.send.get_voucher_count().abi_return == 1
+
+
+def test_milestone_payment(
+    algorand: algokit_utils.AlgorandClient, app_client: AidchainContractsClient
+) -> None:
+    recipient = algorand.account.random()
+    campaign_id = app_client.send.create_campaign(args=("Flood relief", 10_000, "Red Cross"))
+    milestone_id = app_client.send.create_milestone(
+        args=(campaign_id.abi_return, 5_000, "Phase 1")
+    ).abi_return
+
+    app_client.send.release_milestone_funds(args=(milestone_id, recipient.address, 100_000))
+
+    assert algorand.account.get_information(recipient).amount.micro_algo == 100_000
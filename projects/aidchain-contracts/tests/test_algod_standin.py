@@ -0,0 +1,149 @@
+"""
+The algod stand-in, driven over HTTP by the same algokit clients the scripts use.
+"""
+
+from collections.abc import Iterator
+
+import algokit_utils
+import pytest
+from algosdk import encoding
+from algosdk.transaction import PaymentTxn
+
+from smart_contracts._helpers import algod_standin
+from smart_contracts._helpers.algod_standin import (
+    AlgodStandin,
+    EmulatedLedger,
+    Faults,
+)
+from smart_contracts.aidchain_contracts.contract import AidchainContracts
+from smart_contracts.artifacts.aidchain_contracts.aidchain_contracts_client import (
+    APP_SPEC,
+    AidchainContractsClient,
+    AidchainContractsFactory,
+)
+
+
+def _standin(**kwargs: object) -> AlgodStandin:
+    ledger = EmulatedLedger(AidchainContracts, APP_SPEC, {"UpdateApplication": "update"})
+    return AlgodStandin(ledger, **kwargs)  # type: ignore[arg-type]
+
+
+def _algorand(url: str) -> algokit_utils.AlgorandClient:
+    server, port = url.rsplit(":", 1)
+    return algokit_utils.AlgorandClient.from_config(
+        algokit_utils.AlgoClientNetworkConfig(server=server, port=port, token="a" * 64)
+    )
+
+
+@pytest.fixture
+def standin() -> Iterator[AlgodStandin]:
+    with _standin() as standin:
+        standin.start()
+        yield standin
+
+
+@pytest.fixture
+def algorand(standin: AlgodStandin) -> algokit_utils.AlgorandClient:
+    assert standin._server is not None
+    return _algorand(f"http://127.0.0.1:{standin._server.server_port}")
+
+
+@pytest.fixture
+def client(algorand: algokit_utils.AlgorandClient) -> AidchainContractsClient:
+    sender = algorand.account.random()
+    factory = algorand.client.get_typed_app_factory(
+        AidchainContractsFactory,
+        default_sender=sender.address,
+        compilation_params=algokit_utils.AppClientCompilationParams(updatable=False),
+    )
+    client, _ = factory.send.create.bare()
+    return client
+
+
+def test_typed_client_round_trip(standin: AlgodStandin, client: AidchainContractsClient) -> None:
+    assert client.send.register_organization(args=("Red Cross", client.app_address)).abi_return
+    assert client.send.log_delivery(args=("Family 12", "Camp B")).abi_return == 1
+    details = client.send.get_delivery_details(args=(1,)).abi_return
+    assert details is not None and details.location == "Camp B"
+
+    assert client.state.global_state.delivery_counter == 1
+    assert client.state.box.deliveries.get_value(1) == details
+    # Dev mode: a round per accepted group.
+    assert standin.round >= 4
+
+
+def test_a_rejected_group_changes_nothing(
+    standin: AlgodStandin, client: AidchainContractsClient
+) -> None:
+    client.send.log_delivery(args=("Family 12", "Camp B"))
+    round_before = standin.round
+    group = client.new_group().log_delivery(args=("Family 13", "Camp C"))
+    group = group.verify_delivery(args=(99, "Agent"))
+
+    with pytest.raises(Exception, match="logic eval error"):
+        group.send()
+
+    assert client.state.global_state.delivery_counter == 1
+    assert len(client.state.box.deliveries.get_map()) == 1
+    assert standin.round == round_before
+
+
+def test_dead_and_duplicate_transactions_are_rejected(
+    algorand: algokit_utils.AlgorandClient,
+) -> None:
+    algod = algorand.client.algod
+    sender = algorand.account.random()
+    params = algod.suggested_params()
+    txn = PaymentTxn(sender.address, params, sender.address, 0)
+    signed = sender.signer.sign_transactions([txn], [0])[0]
+    algod.send_transaction(signed)
+    assert algod.pending_transaction_info(txn.get_txid())["confirmed-round"] > 0
+    with pytest.raises(Exception, match="already in ledger"):
+        algod.send_transaction(signed)
+
+    params.last = params.first
+    dead = PaymentTxn(sender.address, params, sender.address, 1)
+    with pytest.raises(Exception, match="txn dead"):
+        algod.send_transaction(sender.signer.sign_transactions([dead], [0])[0])
+    with pytest.raises(Exception, match="not signed"):
+        algod.send_raw_transaction(encoding.msgpack_encode({"txn": txn.dictify()}))
+
+
+def test_rounds_close_on_the_block_time() -> None:
+    with _standin(block_time=0.05) as standin:
+        algod = _algorand(standin.start()).client.algod
+        sender = algokit_utils.AlgorandClient.default_localnet().account.random()
+        txn = PaymentTxn(sender.address, algod.suggested_params(), sender.address, 0)
+        tx_id = algod.send_transaction(sender.signer.sign_transactions([txn], [0])[0])
+        assert "confirmed-round" not in algod.pending_transaction_info(tx_id)
+
+        status = algod.status_after_block(algod.status()["last-round"])
+
+        confirmed = algod.pending_transaction_info(tx_id)["confirmed-round"]
+        assert confirmed <= status["last-round"]
+        assert tx_id in algod.algod_request("GET", f"/blocks/{confirmed}/txids")["blockTxids"]
+
+
+def test_faults_apply_to_the_chosen_endpoints() -> None:
+    standin = _standin(faults=Faults(error_rate=1.0, endpoints=frozenset({"submit"})))
+
+    assert standin.handle("POST", "/v2/transactions", {}, b"")[0] == 503
+    assert standin.handle("GET", "/v2/status", {}, b"")[0] == 200
+
+    slow = _standin(faults=Faults(latency=0.01, jitter=0.01))
+    assert slow.handle("GET", "/v2/transactions/params", {}, b"")[0] == 200
+    assert slow.handle("GET", "/v2/unknown", {}, b"")[0] == 404
+
+
+def test_box_listing_is_capped_like_algod(
+    monkeypatch: pytest.MonkeyPatch, standin: AlgodStandin, client: AidchainContractsClient
+) -> None:
+    for index in range(3):
+        client.send.log_delivery(args=(f"Family {index}", "Camp B"))
+    monkeypatch.setattr(algod_standin, "MAX_BOXES_LISTED", 2)
+    path = f"/v2/applications/{client.app_id}/boxes"
+
+    status, body = standin.handle("GET", path, {}, b"")
+    assert status == 400 and "Result limit exceeded" in body["message"]
+    status, body = standin.handle("GET", path, {"max": ["2"]}, b"")
+    assert status == 200 and len(body["boxes"]) == 2
@@ -0,0 +1,209 @@
+import asyncio
+import base64
+import typing
+
+import algokit_utils
+import httpx
+import msgpack
+import pytest
+from algosdk import encoding
+
+from smart_contracts._helpers.async_algod import AsyncAlgodClient
+from smart_contracts.aidchain_contracts.async_client import AsyncAidchainContractsClient
+from smart_contracts.artifacts.aidchain_contracts import aidchain_contracts_codecs
+from smart_contracts.artifacts.aidchain_contracts.aidchain_contracts_client import (
+    AidchainContractsClient,
+    CampaignInfo,
+    LogDeliveryArgs,
+)
+
+APP_ID = 1234
+RETURN_PREFIX = bytes.fromhex("151f7c75")
+GENESIS_HASH = base64.b64encode(b"\x01" * 32).decode()
+
+
+def _b64(value: bytes) -> str:
+    return base64.b64encode(value).decode()
+
+
+class FakeAlgod:
+    """In-memory algod responses for the endpoints used by the async client"""
+
+    def __init__(self) -> None:
+        self.boxes: dict[bytes, bytes] = {}
+        self.global_state: list[dict[str, typing.Any]] = []
+        self.logs: list[bytes] = []
+        self.unnamed_boxes: list[bytes] = []
+        self.sent: list[dict[str, typing.Any]] = []
+        self.requests: list[str] = []
+        self.round = 10
+        self.mempool: list[str] = []
+        self.blocks: dict[int, list[str]] = {}
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path.removeprefix("/v2")
+        self.requests.append(path)
+        if path == "/transactions/params":
+            return httpx.Response(200, json={
+                "fee": 0, "min-fee": 1000, "last-round": 10, "genesis-hash": GENESIS_HASH,
+                "genesis-id": "fake-v1", "consensus-version": "future",
+            })
+        if path == "/status":
+            return httpx.Response(200, json={"last-round": self.round})
+        if path.startswith("/status/wait-for-block-after/"):
+            self.round += 1
+            self.blocks[self.round], self.mempool = self.mempool, []
+            return httpx.Response(200, json={"last-round": self.round})
+        if path.startswith("/blocks/"):
+            return httpx.Response(200, json={"blockTxids": self.blocks.get(int(path.split("/")[2]))})
+        if path == "/transactions/simulate":
+            boxes = [{"app": APP_ID, "name": _b64(name)} for name in self.unnamed_boxes]
+            return httpx.Response(200, json={"txn-groups": [{
+                "unnamed-resources-accessed": {"boxes": boxes},
+                "txn-results": [{"txn-result": {"logs": [_b64(log) for log in self.logs]}}],
+            }]})
+        if path == "/transactions":
+            self.sent.append(msgpack.unpackb(request.content, raw=False, strict_map_key=False))
+            signed = encoding.msgpack_decode(base64.b64encode(request.content).decode())
+            self.mempool.append(signed.get_txid())
+            return httpx.Response(200, json={"txId": self.mempool[-1]})
+        if path.startswith("/transactions/pending/"):
+            return httpx.Response(200, json={
+                "confirmed-round": 11, "logs": [_b64(log) for log in self.logs],
+            })
+        if path == f"/applications/{APP_ID}":
+            return httpx.Response(200, json={"params": {"global-state": self.global_state}})
+        if path == f"/applications/{APP_ID}/boxes":
+            return httpx.Response(200, json={"boxes": [{"name": _b64(name)} for name in self.boxes]})
+        if path == f"/applications/{APP_ID}/box":
+            name = base64.b64decode(request.url.params["name"].removeprefix("b64:"))
+            if name not in self.boxes:
+                return httpx.Response(404, json={"message": "box not found"})
+            return httpx.Response(200, json={"name": _b64(name), "value": _b64(self.boxes[name])})
+        return httpx.Response(404, json={"message": f"unexpected {path}"})
+
+
+@pytest.fixture
+def fake_algod() -> FakeAlgod:
+    return FakeAlgod()
+
+
+@pytest.fixture
+def async_client(fake_algod: FakeAlgod) -> AsyncAidchainContractsClient:
+    algorand = algokit_utils.AlgorandClient.default_localnet()
+    sender = algorand.account.random()
+    client = AidchainContractsClient(algorand=algorand, app_id=APP_ID, default_sender=sender.address)
+    algod = AsyncAlgodClient("http://algod.test", transport=httpx.MockTransport(fake_algod.handle))
+    return AsyncAidchainContractsClient(client, algod)
+
+
+def _campaign_box(campaign: CampaignInfo) -> tuple[bytes, bytes]:
+    return (
+        b"campaigns" + campaign.id.to_bytes(8, "big"),
+        aidchain_contracts_codecs.encode_campaign_info(campaign),
+    )
+
+
+def test_global_state_is_keyed_by_state_name(
+    async_client: AidchainContractsClient, fake_algod: FakeAlgod
+) -> None:
+    fake_algod.global_state = [
+        {"key": _b64(b"campaign_counter"), "value": {"type": 2, "uint": 3}},
+        {"key": _b64(b"total_donations"), "value": {"type": 2, "uint": 500}},
+    ]
+    state = asyncio.run(async_client.state.global_state())
+    assert state == {"campaign_counter": 3, "total_donations": 500}
+
+
+def test_box_map_is_fetched_concurrently_and_decoded(
+    async_client: AsyncAidchainContractsClient, fake_algod: FakeAlgod
+) -> None:
+    campaigns = [CampaignInfo(i, f"Campaign {i}", i * 100, 0, "Red Cross", 1) for i in range(1, 21)]
+    fake_algod.boxes = dict(_campaign_box(campaign) for campaign in campaigns)
+    fake_algod.boxes[b"orgs" + (1).to_bytes(8, "big")] = b"ignored"
+
+    result = asyncio.run(async_client.state.box.campaigns.get_map())
+
+    assert result == {campaign.id: campaign for campaign in campaigns}
+    assert asyncio.run(async_client.state.box.campaigns.get_value(99)) is None
+
+
+def test_send_populates_boxes_and_decodes_return(
+    async_client: AsyncAidchainContractsClient, fake_algod: FakeAlgod
+) -> None:
+    delivery_box = b"deliveries" + (1).to_bytes(8, "big")
+    fake_algod.unnamed_boxes = [delivery_box]
+    fake_algod.logs = [RETURN_PREFIX + (1).to_bytes(8, "big")]
+
+    result = asyncio.run(
+        async_client.send.log_delivery(args=LogDeliveryArgs(recipient="Family 1", location="Camp A"))
+    )
+
+    assert result.abi_return == 1
+    assert result.confirmed_round == 11
+    (sent,) = fake_algod.sent
+    assert sent["txn"]["apbx"] == [{"n": delivery_box}]
+    assert fake_algod.requests.count("/transactions/simulate") == 1
+
+
+def test_readonly_methods_are_simulated_not_sent(
+    async_client: AsyncAidchainContractsClient, fake_algod: FakeAlgod
+) -> None:
+    campaign = CampaignInfo(7, "Flood relief", 10_000, 250, "Red Cross", 1)
+    fake_algod.logs = [RETURN_PREFIX + aidchain_contracts_codecs.encode_campaign_info(campaign)]
+
+    result = asyncio.run(async_client.send.get_campaign_details(args=(7,)))
+
+    assert result.abi_return == campaign
+    assert fake_algod.sent == []
+
+
+def test_many_reads_share_one_event_loop(
+    async_client: AsyncAidchainContractsClient, fake_algod: FakeAlgod
+) -> None:
+    campaigns = [CampaignInfo(i, "", 0, 0, "", 1) for i in range(1, 301)]
+    fake_algod.boxes = dict(_campaign_box(campaign) for campaign in campaigns)
+
+    async def read_all() -> list[CampaignInfo | None]:
+        return await asyncio.gather(
+            *(async_client.state.box.campaigns.get_value(c.id) for c in campaigns)
+        )
+
+    assert asyncio.run(read_all()) == campaigns
+
+
+def test_sent_transaction_is_signed_by_the_sender(
+    async_client: AsyncAidchainContractsClient, fake_algod: FakeAlgod
+) -> None:
+    result = asyncio.run(async_client.send.initialize())
+    (sent,) = fake_algod.sent
+    sender = encoding.encode_address(sent["txn"]["snd"])
+    assert "sig" in sent
+    assert result.tx_id == async_client.client.create_transaction.initialize(
+        algokit_utils.CommonAppCallParams(sender=sender)
+    ).transactions[0].get_txid()
+    assert result.confirmed_round == 11
+
+
+def test_sends_are_confirmed_by_following_blocks(
+    async_client: AsyncAidchainContractsClient, fake_algod: FakeAlgod
+) -> None:
+    async def send_all() -> list[typing.Any]:
+        return await asyncio.gather(
+            *(
+                async_client.send.initialize(
+                    params=algokit_utils.CommonAppCallParams(note=str(i).encode())
+                )
+                for i in range(100)
+            )
+        )
+
+    results = asyncio.run(send_all())
+
+    assert len({result.tx_id for result in results}) == 100
+    assert all(result.confirmed_round for result in results)
+    # Pending info is only fetched once per confirmed transaction, for its ABI return.
+    pending = [path for path in fake_algod.requests if path.startswith("/transactions/pending/")]
+    assert sorted(pending) == sorted(f"/transactions/pending/{result.tx_id}" for result in results)
+    block_waits = sum(path.startswith("/status/wait-for-block-after/") for path in fake_algod.requests)
+    assert block_waits < len(results)
@@ -0,0 +1,161 @@
+import asyncio
+import math
+import typing
+
+import pytest
+from algosdk.logic import get_application_address
+
+from smart_contracts._helpers.balance_watchdog import AppBalance, BalanceWatchdog, TopUpPolicy
+
+
+class Ledger:
+    """Stands in for algod's account endpoint and the funding account"""
+
+    def __init__(self, balances: dict[int, int], min_balance: int = 100_000) -> None:
+        self.accounts = {
+            get_application_address(app_id): [amount, min_balance]
+            for app_id, amount in balances.items()
+        }
+        self.groups: list[list[tuple[str, int]]] = []
+
+    async def account_info(self, address: str) -> dict[str, typing.Any]:
+        amount, min_balance = self.accounts[address]
+        return {"amount": amount, "min-balance": min_balance}
+
+    async def send_payments(self, payments: list[tuple[str, int]]) -> None:
+        self.groups.append(payments)
+        for receiver, amount in payments:
+            self.accounts[receiver][0] += amount
+
+    def spend(self, app_id: int, amount: int = 0, min_balance_increase: int = 0) -> None:
+        account = self.accounts[get_application_address(app_id)]
+        account[0] -= amount
+        account[1] += min_balance_increase
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _watchdog(
+    ledger: Ledger, app_ids: list[int], policy: TopUpPolicy | None = None
+) -> tuple[BalanceWatchdog, Clock]:
+    clock = Clock()
+    watchdog = BalanceWatchdog(
+        ledger,  # type: ignore[arg-type]
+        ledger.send_payments,
+        app_ids,
+        policy,
+        smoothing=0.5,
+        clock=clock,
+    )
+    return watchdog, clock
+
+
+def test_burn_rate_counts_fees_and_minimum_balance_growth() -> None:
+    ledger = Ledger({1001: 10_000_000})
+    watchdog, clock = _watchdog(ledger, [1001])
+
+    asyncio.run(watchdog.poll())
+    clock.now += 100
+    ledger.spend(1001, amount=2_000, min_balance_increase=8_000)
+    asyncio.run(watchdog.poll())
+
+    app = watchdog.apps[1001]
+    assert app.burn_rate == 100.0
+    assert app.runway == (10_000_000 - 2_000 - 108_000) / 100.0
+
+    clock.now += 100
+    asyncio.run(watchdog.poll())
+    assert watchdog.apps[1001].burn_rate == 50.0
+
+
+def test_deposits_are_not_negative_burn() -> None:
+    app = AppBalance(1001, get_application_address(1001))
+    app.observe(1_000_000, 100_000, 10.0, 0.5)
+    app.observe(5_000_000, 100_000, 20.0, 0.5)
+    assert app.burn_rate == 0.0
+    assert app.runway == math.inf
+
+
+def test_policy_tops_up_below_floor_or_short_runway() -> None:
+    policy = TopUpPolicy(floor=200_000, lead_time=3_600, target_runway=36_000)
+    idle = AppBalance(1, "", amount=1_000_000, min_balance=100_000)
+    assert policy.top_up(idle) == 0
+
+    under_floor = AppBalance(2, "", amount=250_000, min_balance=100_000)
+    assert policy.top_up(under_floor) == 2 * 200_000 - 150_000
+
+    # 900_000 spendable lasts half an hour at 500 microALGO/s, under the lead time.
+    burning = AppBalance(3, "", amount=1_000_000, min_balance=100_000, burn_rate=500.0)
+    assert policy.top_up(burning) == 500 * 36_000 - 900_000
+
+
+def test_top_ups_are_batched_into_groups_of_sixteen() -> None:
+    app_ids = list(range(2001, 2041))
+    ledger = Ledger({app_id: 150_000 for app_id in app_ids})
+    watchdog, _ = _watchdog(ledger, app_ids)
+
+    due = asyncio.run(watchdog.poll())
+
+    assert sorted(due) == app_ids
+    assert [len(group) for group in ledger.groups] == [16, 16, 8]
+    assert all(app.spendable >= watchdog.policy.floor for app in watchdog.apps.values())
+    # Funded apps are left alone on the next pass.
+    assert asyncio.run(watchdog.poll()) == {}
+    assert len(ledger.groups) == 3
+
+
+def test_confirmed_groups_are_counted_when_a_later_group_fails() -> None:
+    app_ids = list(range(2001, 2021))
+    ledger = Ledger({app_id: 150_000 for app_id in app_ids})
+    send_payments = ledger.send_payments
+    attempts = 0
+
+    async def second_group_fails(payments: list[tuple[str, int]]) -> None:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 2:
+            raise Exception("transaction pool full")
+        await send_payments(payments)
+
+    ledger.send_payments = second_group_fails  # type: ignore[method-assign]
+    watchdog, clock = _watchdog(ledger, app_ids)
+    with pytest.raises(Exception, match="transaction pool full"):
+        asyncio.run(watchdog.poll())
+
+    assert watchdog.top_ups_sent == 16
+    assert [watchdog.apps[app_id].topped_up > 0 for app_id in app_ids] == [True] * 16 + [False] * 4
+    clock.now += 10
+    ledger.spend(2001, amount=1_000)
+    asyncio.run(watchdog.poll())
+    assert watchdog.apps[2001].burn_rate == 100.0
+
+def test_top_up_is_not_mistaken_for_a_deposit() -> None:
+    ledger = Ledger({1001: 150_000})
+    watchdog, clock = _watchdog(ledger, [1001])
+    asyncio.run(watchdog.poll())
+
+    clock.now += 10
+    ledger.spend(1001, amount=1_000)
+    asyncio.run(watchdog.poll())
+
+    assert watchdog.apps[1001].burn_rate == 100.0
+
+
+def test_metrics_expose_every_app() -> None:
+    ledger = Ledger({1001: 10_000_000, 1002: 150_000})
+    watchdog, _ = _watchdog(ledger, [1001, 1002])
+    asyncio.run(watchdog.poll())
+
+    metrics = watchdog.metrics()
+
+    assert 'aidchain_app_balance_microalgo{app_id="1001"} 10000000' in metrics
+    assert 'aidchain_app_spendable_microalgo{app_id="1002"}' in metrics
+    assert 'aidchain_app_runway_seconds{app_id="1001"} +Inf' in metrics
+    assert "# TYPE aidchain_app_burn_rate_microalgo_per_second gauge" in metrics
+    assert "aidchain_watchdog_top_ups_total 1" in metrics
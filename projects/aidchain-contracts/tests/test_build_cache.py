@@ -0,0 +1,140 @@
+import os
+import subprocess
+import typing
+from pathlib import Path
+
+import pytest
+
+import smart_contracts.__main__ as smart_contracts_main
+from smart_contracts._helpers.build_cache import BuildCache, contract_sources
+
+
+def _write(path: Path, content: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    return path
+
+
+def test_key_depends_on_sources_and_inputs(tmp_path: Path) -> None:
+    cache = BuildCache(tmp_path / "cache")
+    source = _write(tmp_path / "contract" / "contract.py", "x = 1")
+    key = cache.key([source], tmp_path, compiler="4.10.0")
+
+    assert cache.key([source], tmp_path, compiler="4.10.0") == key
+    assert cache.key([source], tmp_path, compiler="4.11.0") != key
+    source.write_text("x = 2")
+    assert cache.key([source], tmp_path, compiler="4.10.0") != key
+
+
+def test_contract_sources_are_the_contract_and_its_local_imports(tmp_path: Path) -> None:
+    contract = _write(
+        tmp_path / "pkg" / "app" / "contract.py",
+        "import algopy\nfrom pkg.shared import structs\nfrom .helpers.math import add\n",
+    )
+    package = _write(tmp_path / "pkg" / "__init__.py", "")
+    structs = _write(tmp_path / "pkg" / "shared" / "structs.py", "from . import codes\n")
+    codes = _write(tmp_path / "pkg" / "shared" / "codes.py", "")
+    helper = _write(tmp_path / "pkg" / "app" / "helpers" / "math.py", "")
+    # Not imported by the contract, so not compiler inputs.
+    _write(tmp_path / "pkg" / "app" / "deploy_config.py", "from pkg.app import contract\n")
+    _write(tmp_path / "pkg" / "app" / "async_client.py", "")
+
+    assert contract_sources(contract) == sorted([contract, package, structs, codes, helper])
+
+
+def test_restore_replaces_output_with_cached_entry(tmp_path: Path) -> None:
+    cache = BuildCache(tmp_path / "cache")
+    output_dir = tmp_path / "out"
+    _write(output_dir / "App.approval.teal", "#pragma version 10")
+    cache.store("k1", output_dir)
+    _write(output_dir / "stale.txt", "")
+
+    assert cache.restore("k1", output_dir)
+    assert sorted(p.name for p in output_dir.iterdir()) == ["App.approval.teal"]
+    assert not cache.restore("missing", output_dir)
+
+
+def test_prune_keeps_most_recent_entries(tmp_path: Path) -> None:
+    cache = BuildCache(tmp_path / "cache", max_entries=2)
+    output_dir = _write(tmp_path / "out" / "a.teal", "").parent
+    for age, key in enumerate(("k1", "k2", "k3")):
+        cache.store(key, output_dir)
+        os.utime(cache.cache_dir / key, (1_000_000 + age, 1_000_000 + age))
+    cache.prune()
+    assert sorted(p.name for p in cache.cache_dir.iterdir()) == ["k2", "k3"]
+
+
+APP_SPEC = '{"name": "App", "structs": {}, "state": {"maps": {"box": {}}}}'
+CLIENT = '''# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+
+import algokit_utils
+
+_APP_SPEC_JSON = r"""{}"""
+APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+
+def _parse_abi_args(args):
+    return args
+'''
+
+
+class FakeAlgokit:
+    """Writes minimal compile/generate outputs in place of the algokit CLI"""
+
+    def __init__(self) -> None:
+        self.commands: list[list[str]] = []
+
+    def __call__(self, command: list[str], **_: typing.Any) -> subprocess.CompletedProcess[str]:
+        self.commands.append(command)
+        if command[:4] == ["algokit", "--no-color", "compile", "python"]:
+            out_dir = Path(command[5].removeprefix("--out-dir="))
+            _write(out_dir / "App.approval.teal", "#pragma version 10")
+            _write(out_dir / "App.arc56.json", APP_SPEC)
+        elif command[:3] == ["algokit", "generate", "client"]:
+            _write(Path(command[-1].replace("{contract_name}", "app")), CLIENT)
+        return subprocess.CompletedProcess(command, 0, "")
+
+
+@pytest.fixture
+def fake_algokit(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> FakeAlgokit:
+    fake = FakeAlgokit()
+    monkeypatch.setattr(smart_contracts_main.subprocess, "run", fake)
+    monkeypatch.setattr(smart_contracts_main, "build_cache", BuildCache(tmp_path / "cache"))
+    monkeypatch.setattr(smart_contracts_main, "build_cache_enabled", True)
+    monkeypatch.setattr(smart_contracts_main, "compiler_version", lambda: "puyapy 4.10.0")
+    monkeypatch.setattr(smart_contracts_main, "client_generator_version", lambda: "2.2.0")
+    return fake
+
+
+def test_unchanged_contract_is_restored_without_compiling(
+    fake_algokit: FakeAlgokit, tmp_path: Path
+) -> None:
+    contract_path = _write(tmp_path / "src" / "contract.py", "class App: ...")
+    output_dir = tmp_path / "artifacts" / "app"
+
+    first = smart_contracts_main.build(output_dir, contract_path)
+    compiled = len(fake_algokit.commands)
+    second = smart_contracts_main.build(output_dir, contract_path)
+
+    assert compiled == 2
+    assert len(fake_algokit.commands) == compiled
+    assert first == second == output_dir.resolve() / "App.arc56.json"
+    assert (output_dir / "app_codecs.py").exists()
+
+    contract_path.write_text("class App: pass")
+    smart_contracts_main.build(output_dir, contract_path)
+    assert len(fake_algokit.commands) == compiled * 2
+
+
+def test_generator_upgrade_rebuilds(
+    monkeypatch: pytest.MonkeyPatch, fake_algokit: FakeAlgokit, tmp_path: Path
+) -> None:
+    contract_path = _write(tmp_path / "src" / "contract.py", "class App: ...")
+    output_dir = tmp_path / "artifacts" / "app"
+    smart_contracts_main.build(output_dir, contract_path)
+    compiled = len(fake_algokit.commands)
+
+    monkeypatch.setattr(smart_contracts_main, "client_generator_version", lambda: "2.3.0")
+    smart_contracts_main.build(output_dir, contract_path)
+
+    assert len(fake_algokit.commands) == compiled * 2
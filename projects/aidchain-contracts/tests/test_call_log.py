@@ -0,0 +1,89 @@
+import math
+from pathlib import Path
+
+import pytest
+from algosdk import account, encoding
+
+from smart_contracts._helpers.call_log import (
+    CallLogWriter,
+    CallRecord,
+    read_call_log,
+    replay_offsets,
+)
+from smart_contracts.artifacts.aidchain_contracts.aidchain_contracts_client import APP_SPEC
+
+METHODS = [method.to_abi_method() for method in APP_SPEC.methods]
+DONOR = account.generate_account()[1]
+AGENT = account.generate_account()[1]
+
+
+def test_calls_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / "calls.calllog"
+    with CallLogWriter(path, app_id=1001, methods=METHODS, metadata={"records": {"x": 3}}) as log:
+        log.record("create_donation", (7,), sender=DONOR, started=0.5, duration=0.25, ok=True)
+        # Calls are logged when they finish, so starts can go backwards.
+        log.record(
+            "log_delivery", ("Family", "Camp"), sender=AGENT, started=0.2, duration=1, ok=True
+        )
+        log.record(
+            "release_milestone_funds", (1, DONOR, 500), sender=None, started=2, duration=0, ok=False
+        )
+        log.record("get_delivery_count", (), sender=DONOR, started=3, duration=0.01, ok=True)
+
+    header, records = read_call_log(path)
+
+    assert header.app_id == 1001 and header.metadata == {"records": {"x": 3}}
+    assert header.methods == tuple(method.get_signature() for method in METHODS)
+    assert list(records) == [
+        CallRecord(0.5, "create_donation", (7,), DONOR, 0.25, True),
+        CallRecord(0.2, "log_delivery", ("Family", "Camp"), AGENT, 1.0, True),
+        CallRecord(
+            2.0,
+            "release_milestone_funds",
+            (1, DONOR, 500),
+            encoding.encode_address(bytes(32)),
+            0.0,
+            False,
+        ),
+        CallRecord(3.0, "get_delivery_count", (), DONOR, 0.01, True),
+    ]
+
+
+def test_log_is_compact(tmp_path: Path) -> None:
+    path = tmp_path / "calls.calllog"
+    senders = [account.generate_account()[1] for _ in range(4)]
+    with CallLogWriter(path, app_id=1, methods=METHODS) as log:
+        for index in range(1_000):
+            log.record(
+                "create_donation",
+                (index,),
+                sender=senders[index % 4],
+                started=index * 0.013,
+                duration=0.4,
+                ok=True,
+            )
+
+    # The header holds every method signature, about 1 kB; a call takes 8 bytes of
+    # arguments plus its start, indexes and duration.
+    assert path.stat().st_size < 2_000 + 1_000 * 24
+    assert len(list(read_call_log(path)[1])) == 1_000
+
+
+def test_other_files_are_rejected(tmp_path: Path) -> None:
+    path = tmp_path / "calls.calllog"
+    path.write_bytes(b"not a log")
+    with pytest.raises(Exception, match="not a call log"):
+        read_call_log(path)
+
+
+def test_replay_offsets() -> None:
+    records = [
+        CallRecord(offset, "get_delivery_count", (), DONOR, 0, True) for offset in (5, 6, 25)
+    ]
+
+    assert replay_offsets(records, 1) == [0, 1, 20]
+    assert replay_offsets(records, 10) == [0, 0.1, 2]
+    assert replay_offsets(records, math.inf) == [0, 0, 0]
+    assert replay_offsets([], 10) == []
+    with pytest.raises(Exception, match="must be positive"):
+        replay_offsets(records, 0)
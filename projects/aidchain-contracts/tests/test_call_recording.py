@@ -0,0 +1,207 @@
+import asyncio
+import math
+import typing
+from pathlib import Path
+from types import SimpleNamespace
+
+import algokit_utils
+import pytest
+from algosdk import account, encoding
+
+from smart_contracts._helpers.algod_standin import AlgodStandin, EmulatedLedger
+from smart_contracts._helpers.call_log import CallRecord, read_call_log
+from smart_contracts.aidchain_contracts.async_client import AsyncAidchainContractsClient
+from smart_contracts.aidchain_contracts.call_recording import (
+    CallReplay,
+    RecordingAidchainContractsClient,
+    recorded_stats,
+    replay_usage,
+)
+from smart_contracts.aidchain_contracts.contract import AidchainContracts
+from smart_contracts.artifacts.aidchain_contracts.aidchain_contracts_client import (
+    APP_SPEC,
+    AidchainContractsClient,
+    AidchainContractsFactory,
+    CreateCampaignArgs,
+)
+
+SERVICE = account.generate_account()[1]
+DONOR = account.generate_account()[1]
+
+
+class FakeAsyncSend:
+    def __init__(self) -> None:
+        self.sent: list[str] = []
+
+    async def get_delivery_count(self, args: typing.Any, params: typing.Any) -> typing.Any:
+        self.sent.append("get_delivery_count")
+        return SimpleNamespace(fee=0)
+
+class FakeParams:
+    def create_donation(self, args: typing.Any, params: typing.Any = None) -> typing.Any:
+        return SimpleNamespace(sender=params.sender if params else SERVICE)
+
+
+class FakeSend:
+    def create_campaign(self, args: typing.Any, params: typing.Any = None) -> typing.Any:
+        return SimpleNamespace(transaction=SimpleNamespace(raw=SimpleNamespace(sender=SERVICE)))
+
+    def create_donation(self, args: typing.Any, params: typing.Any = None) -> typing.Any:
+        raise Exception("logic eval error: Campaign not found")
+
+    def get_delivery_count(self, params: typing.Any = None) -> typing.Any:
+        return SimpleNamespace(transaction=SimpleNamespace(raw=SimpleNamespace(sender=DONOR)))
+
+
+def _fake_client() -> typing.Any:
+    counters = SimpleNamespace(
+        organization_counter=1, campaign_counter=2, milestone_counter=0, delivery_counter=5
+    )
+    return SimpleNamespace(
+        app_id=1001,
+        app_spec=APP_SPEC,
+        app_address="APP",
+        send=FakeSend(),
+        params=FakeParams(),
+        state=SimpleNamespace(global_state=counters),
+    )
+
+
+def test_recording_client_logs_calls_and_passes_the_rest_through(tmp_path: Path) -> None:
+    path = tmp_path / "service.calllog"
+    with RecordingAidchainContractsClient(_fake_client(), path) as client:
+        client.send.create_campaign(
+            args=CreateCampaignArgs(title="Flood", target=10_000, creator="Red Cross")
+        )
+        with pytest.raises(Exception, match="Campaign not found"):
+            client.send.create_donation((9,), algokit_utils.CommonAppCallParams(sender=DONOR))
+        client.send.get_delivery_count()
+        assert client.app_address == "APP"
+
+    header, calls = read_call_log(path)
+    records = list(calls)
+
+    assert header.app_id == 1001
+    assert header.metadata["records"] == {
+        "organizations": 1,
+        "campaigns": 2,
+        "milestones": 0,
+        "deliveries": 5,
+    }
+    assert [(r.method, r.args, r.sender, r.ok) for r in records] == [
+        ("create_campaign", ("Flood", 10_000, "Red Cross"), SERVICE, True),
+        ("create_donation", (9,), DONOR, False),
+        ("get_delivery_count", (), DONOR, True),
+    ]
+    assert records[0].offset < records[1].offset < records[2].offset
+
+    stats = recorded_stats(records)
+    assert stats.confirmed == 2 and stats.rejected == {"create_donation": 1}
+    assert replay_usage(records) == {
+        "boxes": {
+            "organizations": 0,
+            "campaigns": 1,
+            "milestones": 0,
+            "deliveries": 0,
+            "vouchers": 0,
+        },
+        "created_assets": 0,
+        "inner_txns": 0,
+    }
+
+
+def test_recorded_calls_replay_against_a_new_app(tmp_path: Path) -> None:
+    ledger = EmulatedLedger(AidchainContracts, APP_SPEC, {"UpdateApplication": "update"})
+    with AlgodStandin(ledger) as standin:
+        server, port = standin.start().rsplit(":", 1)
+        algorand = algokit_utils.AlgorandClient.from_config(
+            algokit_utils.AlgoClientNetworkConfig(server=server, port=port, token="a" * 64)
+        )
+
+        def new_app() -> AidchainContractsClient:
+            factory = algorand.client.get_typed_app_factory(
+                AidchainContractsFactory,
+                default_sender=algorand.account.random().address,
+                compilation_params=algokit_utils.AppClientCompilationParams(updatable=False),
+            )
+            return factory.send.create.bare()[0]
+
+        path = tmp_path / "service.calllog"
+        with RecordingAidchainContractsClient(new_app(), path) as client:
+            donor = algorand.account.random().address
+            client.send.create_campaign(args=("Flood", 10_000, "Red Cross"))
+            for index in range(3):
+                client.send.create_donation(
+                    args=(1,),
+                    params=algokit_utils.CommonAppCallParams(sender=donor, note=bytes([index])),
+                )
+            client.send.log_delivery(args=("Family", "Camp"))
+            client.send.verify_delivery(args=(1, "agent"))
+            with pytest.raises(Exception):
+                client.send.verify_delivery(args=(99, "agent"))
+            client.send.get_delivery_count()
+            recorded_state = client.state.global_state.get_all()
+
+        _, calls = read_call_log(path)
+        records = list(calls)
+        target = new_app()
+
+        async def run() -> CallReplay:
+            async with AsyncAidchainContractsClient(target) as async_client:
+                call_replay = CallReplay(
+                    async_client,
+                    {
+                        original: algorand.account.random().address
+                        for original in {record.sender for record in records}
+                    },
+                )
+                await call_replay.run(records, speed=math.inf)
+                return call_replay
+
+        call_replay = asyncio.run(run())
+        replayed_state = target.state.global_state.get_all()
+
+    assert len({record.sender for record in records}) == 2
+    assert call_replay.stats.rejected == {"verify_delivery": 1}
+    assert call_replay.stats.confirmed == len(records) - 1
+    assert replayed_state == recorded_state
+    assert encoding.is_valid_address(records[0].sender)
+
+
+
+
+def _record(offset: float, method: str, duration: float) -> CallRecord:
+    return CallRecord(
+        offset=offset, method=method, args=(), sender=SERVICE, duration=duration, ok=True
+    )
+
+
+async def _replay(call_replay: CallReplay, records: list[CallRecord]) -> None:
+    # A replay waiting on a call that never finishes would hang the test.
+    await asyncio.wait_for(call_replay.run(records, speed=math.inf), timeout=5)
+
+
+def test_replay_of_instant_calls_does_not_wait_on_itself() -> None:
+    send = FakeAsyncSend()
+    call_replay = CallReplay(typing.cast(typing.Any, SimpleNamespace(send=send)), {SERVICE: DONOR})
+
+    asyncio.run(_replay(call_replay, [_record(0.0, "get_delivery_count", 0.0)] * 2))
+
+    assert send.sent == ["get_delivery_count"] * 2
+    assert call_replay.stats.confirmed == 2
+
+
+def test_replay_continues_after_a_call_that_cannot_be_issued() -> None:
+    send = FakeAsyncSend()
+    call_replay = CallReplay(typing.cast(typing.Any, SimpleNamespace(send=send)), {SERVICE: DONOR})
+    records = [_record(0.0, "removed_method", 0.1), _record(0.2, "get_delivery_count", 0.1)]
+
+    async def run() -> None:
+        with pytest.raises(AttributeError):
+            await _replay(call_replay, records)
+        # The call after the failed one is not left waiting for it.
+        await asyncio.wait_for(asyncio.gather(*call_replay._tasks), timeout=5)
+
+    asyncio.run(run())
+
+    assert send.sent == ["get_delivery_count"]
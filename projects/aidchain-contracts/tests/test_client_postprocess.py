@@ -0,0 +1,103 @@
+import dataclasses
+from pathlib import Path
+
+import algokit_utils
+import pytest
+
+from smart_contracts._helpers.client_postprocess import (
+    lazy_app_spec,
+    postprocess_client,
+    slot_dataclasses,
+)
+from smart_contracts.artifacts.aidchain_contracts import aidchain_contracts_client
+from smart_contracts.artifacts.aidchain_contracts.aidchain_contracts_client import (
+    AidchainContractsBareCallCreateParams,
+    AidchainContractsClient,
+    DeliveryRecord,
+    LogDeliveryArgs,
+)
+
+GENERATED = '''# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+
+import dataclasses
+import typing
+import algokit_utils
+
+_APP_SPEC_JSON = r"""{}"""
+APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+
+def _parse_abi_args(args):
+    return args
+
+@dataclasses.dataclass(frozen=True)
+class DeliveryRecord:
+    id: int
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class LogDeliveryArgs:
+    recipient: str
+
+@dataclasses.dataclass(frozen=True)
+class BareCallCreateParams(Base):
+    on_complete: int | None = None
+
+def make_client(algorand):
+    return Client(app_spec=APP_SPEC, algorand=algorand)
+'''
+
+
+def test_slot_dataclasses_rewrites_structs_and_args_only() -> None:
+    result = slot_dataclasses(GENERATED)
+    assert "@dataclasses.dataclass(frozen=True, slots=True)\nclass DeliveryRecord:" in result
+    assert (
+        "@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)\nclass LogDeliveryArgs:"
+        in result
+    )
+    assert "@dataclasses.dataclass(frozen=True)\nclass BareCallCreateParams(Base):" in result
+
+
+def test_slot_dataclasses_can_drop_frozen() -> None:
+    result = slot_dataclasses(GENERATED, frozen=False)
+    assert "@dataclasses.dataclass(frozen=False, slots=True)\nclass DeliveryRecord:" in result
+
+
+def test_postprocess_client_is_idempotent(tmp_path: Path) -> None:
+    client_path = tmp_path / "client.py"
+    client_path.write_text(GENERATED)
+    postprocess_client(client_path)
+    once = client_path.read_text()
+    postprocess_client(client_path)
+    assert client_path.read_text() == once
+    assert once.count("slots=True") == 2
+    assert once.splitlines()[2] == "# Post-processed by smart_contracts._helpers.client_postprocess."
+
+
+@pytest.mark.parametrize("cls", [DeliveryRecord, LogDeliveryArgs])
+def test_committed_client_dataclasses_are_slotted(cls: type) -> None:
+    assert "__slots__" in cls.__dict__
+    assert cls.__dataclass_params__.frozen  # type: ignore[attr-defined]
+
+
+def test_committed_client_keeps_param_subclasses_unslotted() -> None:
+    assert "__slots__" not in AidchainContractsBareCallCreateParams.__dict__
+    assert dataclasses.is_dataclass(AidchainContractsBareCallCreateParams)
+
+
+def test_lazy_app_spec_defers_parsing() -> None:
+    result = lazy_app_spec(GENERATED)
+    assert "APP_SPEC = " not in result
+    assert "return Client(app_spec=_get_app_spec(), algorand=algorand)" in result
+    assert '_APP_SPEC_JSON = r"""{}"""' in result
+    assert "import dataclasses\nimport functools\n" in result
+    assert result.index("def _get_app_spec()") < result.index("def _parse_abi_args(")
+    assert lazy_app_spec(result) == result
+
+
+def test_committed_client_memoizes_app_spec() -> None:
+    algorand = algokit_utils.AlgorandClient.default_localnet()
+    first = AidchainContractsClient(algorand=algorand, app_id=1)
+    second = AidchainContractsClient(algorand=algorand, app_id=2)
+    assert first.app_spec is second.app_spec
+    assert first.clone().app_spec is first.app_spec
+    assert aidchain_contracts_client.APP_SPEC is first.app_spec
@@ -0,0 +1,131 @@
+import asyncio
+import typing
+
+import pytest
+
+from smart_contracts._helpers.confirmation_tracker import ConfirmationTracker
+
+
+class BlockProducer:
+    """Stands in for algod's status and block txid endpoints"""
+
+    def __init__(self, blocks: dict[int, list[str]], last_round: int = 100) -> None:
+        self.blocks = blocks
+        self.last_round = last_round
+        self.calls: list[str] = []
+
+    async def status(self) -> dict[str, typing.Any]:
+        self.calls.append("status")
+        return {"last-round": self.last_round}
+
+    async def status_after_block(self, round_num: int) -> dict[str, typing.Any]:
+        self.calls.append("wait")
+        await asyncio.sleep(0)
+        self.last_round = max(self.last_round, round_num + 1)
+        return {"last-round": self.last_round}
+
+    async def block_txids(self, round_num: int) -> list[str]:
+        self.calls.append(f"block {round_num}")
+        return self.blocks.get(round_num, [])
+
+
+def test_one_block_wait_resolves_every_transaction_in_the_block() -> None:
+    tx_ids = [f"TX{i}" for i in range(500)]
+    algod = BlockProducer({101: tx_ids})
+    tracker = ConfirmationTracker(algod)  # type: ignore[arg-type]
+
+    async def track_all() -> list[int]:
+        return await asyncio.gather(*(tracker.track(tx_id, 200) for tx_id in tx_ids))
+
+    assert asyncio.run(track_all()) == [101] * 500
+    assert algod.calls == ["status", "block 100", "wait", "block 101"]
+    assert tracker.pending == 0
+
+
+def test_a_transaction_already_in_the_latest_block_resolves() -> None:
+    # In dev mode the submit can close a round before the follower's first status request.
+    algod = BlockProducer({100: ["A"], 102: ["B"]})
+    tracker = ConfirmationTracker(algod)  # type: ignore[arg-type]
+
+    async def track() -> list[int]:
+        first = await tracker.track("A", 200)
+        # The follower stopped; a restart starts from the block before the latest.
+        algod.last_round = 102
+        return [first, await tracker.track("B", 200)]
+
+    assert asyncio.run(track()) == [100, 102]
+    assert algod.calls == ["status", "block 100", "status", "block 102"]
+
+
+def test_a_restarted_follower_skips_the_rounds_it_was_idle_for() -> None:
+    algod = BlockProducer({101: ["A"], 5_000: ["B"]})
+    block_txids = algod.block_txids
+
+    async def recent_blocks(round_num: int) -> list[str]:
+        if round_num < algod.last_round - 1_000:
+            raise Exception(f"block {round_num} is not on this node")
+        return await block_txids(round_num)
+
+    algod.block_txids = recent_blocks  # type: ignore[method-assign]
+    tracker = ConfirmationTracker(algod)  # type: ignore[arg-type]
+
+    async def track() -> list[int]:
+        first = await tracker.track("A", 200)
+        algod.last_round = 5_000
+        return [first, await tracker.track("B", 5_010)]
+
+    assert asyncio.run(track()) == [101, 5_000]
+    assert algod.calls[-2:] == ["status", "block 5000"]
+
+
+def test_transactions_resolve_in_the_round_they_appear() -> None:
+    algod = BlockProducer({101: ["A"], 103: ["B"]})
+    tracker = ConfirmationTracker(algod)  # type: ignore[arg-type]
+
+    async def track() -> list[int]:
+        return await asyncio.gather(tracker.track("A", 200), tracker.track("B", 200))
+
+    assert asyncio.run(track()) == [101, 103]
+
+
+def test_expired_transactions_fail() -> None:
+    algod = BlockProducer({})
+    tracker = ConfirmationTracker(algod)  # type: ignore[arg-type]
+
+    async def track() -> int:
+        return await tracker.track("LOST", 102)
+
+    with pytest.raises(Exception, match="last valid round 102"):
+        asyncio.run(track())
+    assert algod.calls.count("wait") == 2
+
+
+def test_follower_errors_fail_pending_transactions() -> None:
+    algod = BlockProducer({})
+
+    async def broken(round_num: int) -> list[str]:
+        raise Exception("algod unavailable")
+
+    algod.block_txids = broken  # type: ignore[method-assign]
+    tracker = ConfirmationTracker(algod)  # type: ignore[arg-type]
+
+    async def track() -> int:
+        return await tracker.track("A", 200)
+
+    with pytest.raises(Exception, match="algod unavailable"):
+        asyncio.run(track())
+    assert tracker.pending == 0
+
+
+def test_discarded_transactions_stop_the_follower() -> None:
+    algod = BlockProducer({})
+    tracker = ConfirmationTracker(algod)  # type: ignore[arg-type]
+
+    async def track_and_discard() -> None:
+        confirmed = tracker.track("A", 200)
+        tracker.discard("A")
+        assert confirmed.cancelled()
+        await asyncio.sleep(0.01)
+        assert tracker._follower is not None and tracker._follower.done()
+
+    asyncio.run(track_and_discard())
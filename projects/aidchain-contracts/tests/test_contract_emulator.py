@@ -0,0 +1,336 @@
+"""
+AidchainContracts in the algorand-python-testing emulator: every ABI method and its edge
+cases, in process, without localnet. End-to-end checks against a real node are in
+smoke_localnet.py.
+"""
+
+from collections.abc import Iterator
+
+import algopy
+import algopy_testing
+import pytest
+from algopy import String, UInt64, arc4
+
+from smart_contracts.aidchain_contracts.contract import AidchainContracts
+
+
+@pytest.fixture
+def context() -> Iterator["algopy_testing.AlgopyTestContext"]:
+    with algopy_testing.algopy_testing_context() as context:
+        yield context
+
+
+@pytest.fixture
+def contract(context: "algopy_testing.AlgopyTestContext") -> AidchainContracts:
+    return AidchainContracts()
+
+
+def _campaign(contract: AidchainContracts, title: str = "Flood relief") -> UInt64:
+    return contract.create_campaign(String(title), UInt64(10_000), String("Red Cross"))
+
+
+# ----------------------------- Setup ----------------------------- #
+
+
+def test_hello(contract: AidchainContracts) -> None:
+    assert contract.hello(String("world")) == "Hello, world"
+
+
+def test_counters_start_at_zero(contract: AidchainContracts) -> None:
+    assert contract.get_campaign_count() == 0
+    assert contract.get_organization_count() == 0
+    assert contract.get_delivery_count() == 0
+    assert contract.get_voucher_count() == 0
+    assert contract.get_milestone_count() == 0
+    assert contract.get_total_donations() == 0
+
+
+def test_initialize_resets_counters_but_keeps_boxes(contract: AidchainContracts) -> None:
+    _campaign(contract)
+    contract.log_delivery(String("Family 12"), String("Camp B"))
+
+    assert contract.initialize() == "Contract initialized successfully"
+
+    assert contract.get_campaign_count() == 0
+    assert contract.get_delivery_count() == 0
+    assert contract.total_organizations.value == 0
+    assert arc4.UInt64(1) in contract.campaigns
+    # IDs restart at 1, so the next record overwrites the old box.
+    _campaign(contract, "Earthquake")
+    assert contract.campaigns[arc4.UInt64(1)].title == "Earthquake"
+
+
+def _update_call(
+    context: "algopy_testing.AlgopyTestContext",
+    contract: AidchainContracts,
+    sender: "algopy.Account",
+) -> object:
+    return context.any.txn.application_call(
+        app_id=context.ledger.get_app(contract),
+        sender=sender,
+        on_completion=algopy.OnCompleteAction.UpdateApplication,
+    )
+
+
+def test_update_is_creator_only(
+    context: "algopy_testing.AlgopyTestContext", contract: AidchainContracts
+) -> None:
+    context.set_template_var("UPDATABLE", True)
+
+    with context.txn.create_group([_update_call(context, contract, context.default_sender)]):
+        contract.update()
+    with context.txn.create_group([_update_call(context, contract, context.any.account())]):
+        with pytest.raises(AssertionError, match="Only creator can update"):
+            contract.update()
+
+
+def test_update_needs_an_updatable_deployment(
+    context: "algopy_testing.AlgopyTestContext", contract: AidchainContracts
+) -> None:
+    context.set_template_var("UPDATABLE", False)
+
+    with context.txn.create_group([_update_call(context, contract, context.default_sender)]):
+        with pytest.raises(AssertionError, match="App is not updatable"):
+            contract.update()
+
+
+# -------------------------- Organizations -------------------------- #
+
+
+def test_register_organization(contract: AidchainContracts) -> None:
+    first = contract.register_organization(String("Red Cross"), String("ADDR1"))
+    second = contract.register_organization(String("UNICEF"), String("ADDR2"))
+
+    assert (first, second) == (1, 2)
+    assert contract.get_organization_count() == 2
+    assert contract.total_organizations.value == 2
+    details = contract.get_organization_details(arc4.UInt64(2))
+    assert details.name == "UNICEF"
+    assert details.wallet_address == "ADDR2"
+    assert details.verification_level == 0
+
+
+def test_organization_details_of_unknown_id(contract: AidchainContracts) -> None:
+    with pytest.raises(AssertionError, match="Organization not found"):
+        contract.get_organization_details(arc4.UInt64(1))
+
+
+# ---------------------------- Campaigns ---------------------------- #
+
+
+def test_create_campaign(contract: AidchainContracts) -> None:
+    campaign_id = _campaign(contract)
+
+    assert campaign_id == 1
+    assert contract.get_campaign_count() == 1
+    details = contract.get_campaign_details(arc4.UInt64(1))
+    assert details.title == "Flood relief"
+    assert details.target == 10_000
+    assert details.raised == 0
+    assert details.creator == "Red Cross"
+    assert details.active == 1
+
+
+def test_campaign_details_of_unknown_id(contract: AidchainContracts) -> None:
+    with pytest.raises(AssertionError, match="Campaign not found"):
+        contract.get_campaign_details(arc4.UInt64(7))
+
+
+def test_create_donation(contract: AidchainContracts) -> None:
+    campaign_id = _campaign(contract)
+
+    assert contract.create_donation(campaign_id) == "Donation recorded successfully"
+    # An app call carries no amount, so the total is unchanged.
+    assert contract.get_total_donations() == 0
+
+
+@pytest.mark.parametrize(
+    ("campaign_id", "error"),
+    [(0, "Campaign ID cannot be zero"), (2, "Campaign ID out of range")],
+)
+def test_create_donation_rejects_invalid_campaigns(
+    contract: AidchainContracts, campaign_id: int, error: str
+) -> None:
+    _campaign(contract)
+    with pytest.raises(AssertionError, match=error):
+        contract.create_donation(UInt64(campaign_id))
+
+
+def test_calculate_total(contract: AidchainContracts) -> None:
+    assert contract.calculate_total(UInt64(1_000), UInt64(2_500)) == 3_500
+    with pytest.raises(OverflowError):
+        contract.calculate_total(UInt64(2**64 - 1), UInt64(1))
+
+
+def test_validate_donation(contract: AidchainContracts) -> None:
+    assert contract.validate_donation(UInt64(5), String("Ana")) == "Valid donation from Ana"
+    assert contract.validate_donation(UInt64(0), String("Ana")) == "Invalid donation amount"
+
+
+# ---------------------------- Milestones ---------------------------- #
+
+
+def test_milestone_lifecycle(
+    context: "algopy_testing.AlgopyTestContext", contract: AidchainContracts
+) -> None:
+    campaign_id = _campaign(contract)
+    milestone_id = contract.create_milestone(campaign_id, UInt64(5_000), String("Phase 1"))
+
+    assert milestone_id == 1
+    assert contract.get_milestone_count() == 1
+    details = contract.get_milestone_details(arc4.UInt64(1))
+    assert (details.campaign_id, details.target_amount) == (1, 5_000)
+    assert (details.completed, details.funds_released) == (0, 0)
+
+    result = contract.complete_milestone(milestone_id, String("ipfs://proof"))
+    assert result == "Milestone completed with proof: ipfs://proof"
+    assert contract.get_milestone_details(arc4.UInt64(1)).completed == 1
+    assert contract.total_milestones_completed.value == 1
+
+    recipient = context.any.account()
+    result = contract.release_milestone_funds(milestone_id, recipient, UInt64(2_000))
+    assert result == "Real blockchain payment sent for milestone"
+    payment = context.txn.last_group.last_itxn.payment
+    assert payment.receiver == recipient
+    assert payment.amount == 2_000
+    assert payment.fee == algopy.Global.min_txn_fee
+
+
+@pytest.mark.parametrize(
+    ("milestone_id", "error"),
+    [(0, "Milestone ID cannot be zero"), (2, "Milestone ID out of range")],
+)
+def test_milestone_calls_reject_invalid_ids(
+    context: "algopy_testing.AlgopyTestContext",
+    contract: AidchainContracts,
+    milestone_id: int,
+    error: str,
+) -> None:
+    contract.create_milestone(_campaign(contract), UInt64(5_000), String("Phase 1"))
+    with pytest.raises(AssertionError, match=error):
+        contract.complete_milestone(UInt64(milestone_id), String("proof"))
+    with pytest.raises(AssertionError, match=error):
+        contract.release_milestone_funds(UInt64(milestone_id), context.any.account(), UInt64(1))
+
+
+def test_milestone_needs_an_existing_campaign(contract: AidchainContracts) -> None:
+    with pytest.raises(AssertionError, match="Campaign ID out of range"):
+        contract.create_milestone(UInt64(1), UInt64(5_000), String("Phase 1"))
+
+
+def test_release_rejects_zero_amount(
+    context: "algopy_testing.AlgopyTestContext", contract: AidchainContracts
+) -> None:
+    contract.create_milestone(_campaign(contract), UInt64(5_000), String("Phase 1"))
+    with pytest.raises(AssertionError, match="Amount must be greater than zero"):
+        contract.release_milestone_funds(UInt64(1), context.any.account(), UInt64(0))
+
+
+def test_milestone_details_of_unknown_id(contract: AidchainContracts) -> None:
+    with pytest.raises(AssertionError, match="Milestone not found"):
+        contract.get_milestone_details(arc4.UInt64(1))
+
+
+# ---------------------------- Deliveries ---------------------------- #
+
+
+def test_delivery_lifecycle(contract: AidchainContracts) -> None:
+    delivery_id = contract.log_delivery(String("Family 12"), String("Camp B"))
+
+    assert delivery_id == 1
+    assert contract.get_delivery_count() == 1
+    details = contract.get_delivery_details(arc4.UInt64(1))
+    assert (details.recipient, details.location) == ("Family 12", "Camp B")
+    assert (details.agent, details.verified) == ("", 0)
+
+    result = contract.verify_delivery(delivery_id, String("agent-7"))
+
+    assert result == "Delivery verified by agent: agent-7"
+    details = contract.get_delivery_details(arc4.UInt64(1))
+    assert (details.agent, details.verified) == ("agent-7", 1)
+
+
+@pytest.mark.parametrize(
+    ("delivery_id", "error"),
+    [(0, "Delivery ID cannot be zero"), (2, "Delivery ID out of range")],
+)
+def test_verify_delivery_rejects_invalid_ids(
+    contract: AidchainContracts, delivery_id: int, error: str
+) -> None:
+    contract.log_delivery(String("Family 12"), String("Camp B"))
+    with pytest.raises(AssertionError, match=error):
+        contract.verify_delivery(UInt64(delivery_id), String("agent-7"))
+
+
+def test_delivery_details_of_unknown_id(contract: AidchainContracts) -> None:
+    with pytest.raises(AssertionError, match="Delivery not found"):
+        contract.get_delivery_details(arc4.UInt64(3))
+
+
+# ----------------------------- Vouchers ----------------------------- #
+
+
+def test_create_voucher_asset(
+    context: "algopy_testing.AlgopyTestContext", contract: AidchainContracts
+) -> None:
+    asset_id = contract.create_voucher_asset(String("Food voucher"), UInt64(1_000))
+
+    config = context.txn.last_group.last_itxn.asset_config
+    app_address = context.ledger.get_app(contract).address
+    assert asset_id == config.created_asset.id
+    assert config.asset_name == b"Food voucher"
+    assert config.unit_name == b"VOUCHER"
+    assert (config.total, config.decimals, config.default_frozen) == (1_000, 0, False)
+    assert config.manager == config.reserve == config.freeze == config.clawback == app_address
+    assert contract.get_voucher_count() == 1
+    details = contract.get_voucher_details(arc4.UInt64(1))
+    assert (details.asset_id, details.name) == (asset_id, "Food voucher")
+    assert (details.total_supply, details.issued) == (1_000, 0)
+
+
+def test_distribute_vouchers_is_a_stub(contract: AidchainContracts) -> None:
+    result = contract.distribute_vouchers(UInt64(1), String("Family 12"), UInt64(5))
+    assert result == "Debug mode: vouchers distributed"
+
+
+@pytest.mark.parametrize(
+    ("voucher_id", "amount", "expected"),
+    [
+        (1, 5, "Vouchers redeemed at Market"),
+        (0, 5, "Invalid voucher ID"),
+        (2, 5, "Invalid voucher ID"),
+        (1, 0, "Amount must be greater than zero"),
+    ],
+)
+def test_redeem_voucher(
+    contract: AidchainContracts, voucher_id: int, amount: int, expected: str
+) -> None:
+    contract.create_voucher_asset(String("Food voucher"), UInt64(1_000))
+    assert contract.redeem_voucher(UInt64(voucher_id), String("Market"), UInt64(amount)) == expected
+
+
+def test_voucher_details_of_unknown_id(contract: AidchainContracts) -> None:
+    with pytest.raises(AssertionError, match="Voucher not found"):
+        contract.get_voucher_details(arc4.UInt64(1))
+
+
+# ------------------------------ Stats ------------------------------ #
+
+
+def test_static_stats(contract: AidchainContracts) -> None:
+    assert contract.get_contract_stats() == "Contract statistics available"
+    assert contract.get_voucher_stats() == "Voucher statistics available"
+    assert contract.get_milestone_stats() == "Milestone statistics available"
+
+
+def test_records_are_kept_per_map(contract: AidchainContracts) -> None:
+    for index in range(3):
+        _campaign(contract, f"Campaign {index}")
+        contract.log_delivery(String(f"Family {index}"), String("Camp B"))
+    contract.register_organization(String("Red Cross"), String("ADDR1"))
+
+    assert contract.get_campaign_count() == 3
+    assert contract.get_delivery_count() == 3
+    assert contract.get_organization_count() == 1
+    assert contract.get_campaign_details(arc4.UInt64(3)).title == "Campaign 2"
+    assert contract.get_delivery_details(arc4.UInt64(2)).recipient == "Family 1"
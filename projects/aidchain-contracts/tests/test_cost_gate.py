@@ -0,0 +1,112 @@
+import base64
+import dataclasses
+from pathlib import Path
+
+from smart_contracts._helpers.cost_gate import (
+    MethodCosts,
+    compare,
+    load_baseline,
+    measure,
+    save_baseline,
+)
+from smart_contracts._helpers.opcode_profile import SourceMap
+
+SOURCE_MAP = SourceMap(
+    sources=[], lines={}, ops={1: "box_get", 2: "box_put", 3: "itxn_submit", 4: "box_len"}
+)
+
+
+def _bytes(size: int) -> dict:
+    return {"type": 1, "bytes": base64.b64encode(b"x" * size).decode()}
+
+
+def _costs(**overrides: int) -> MethodCosts:
+    costs = MethodCosts(
+        opcode_budget=200, box_bytes_read=60, box_bytes_written=60, inner_txns=1, min_fee=1000
+    )
+    return dataclasses.replace(costs, **overrides)
+
+
+def test_measure_reads_trace_state_changes_and_inner_txns() -> None:
+    response = {
+        "txn-groups": [
+            {
+                "txn-results": [
+                    {
+                        "app-budget-consumed": 321,
+                        "exec-trace": {
+                            "approval-program-trace": [
+                                {"pc": 1, "stack-additions": [_bytes(48), {"type": 2, "uint": 1}]},
+                                {"pc": 4, "stack-additions": [{"type": 2, "uint": 48}]},
+                                {
+                                    "pc": 2,
+                                    "state-changes": [
+                                        {
+                                            "app-state-type": "b",
+                                            "operation": "w",
+                                            "key": "ZGVsaXZlcmllcw==",
+                                            "new-value": _bytes(52),
+                                        },
+                                        {"app-state-type": "g", "operation": "w", "key": "Yw=="},
+                                    ],
+                                },
+                            ]
+                        },
+                        "txn-result": {
+                            "inner-txns": [
+                                {"txn": {"txn": {"type": "acfg", "fee": 1000}}},
+                                {"txn": {"txn": {"type": "pay"}}},
+                            ]
+                        },
+                    }
+                ]
+            }
+        ]
+    }
+
+    assert measure(SOURCE_MAP, response) == MethodCosts(
+        opcode_budget=321,
+        box_bytes_read=48,
+        box_bytes_written=52,
+        inner_txns=2,
+        min_fee=2000,
+    )
+
+
+def test_compare_flags_growth_past_threshold() -> None:
+    baseline = {"verify_delivery": _costs(), "log_delivery": _costs(), "hello": _costs()}
+    current = {
+        "verify_delivery": _costs(opcode_budget=220, box_bytes_written=62),
+        "log_delivery": _costs(inner_txns=2, opcode_budget=150),
+        "create_campaign": _costs(opcode_budget=10_000),
+    }
+
+    assert compare(baseline, current) == [
+        "hello: no longer measured",
+        "log_delivery: inner_txns 1 -> 2 (+100%)",
+        "verify_delivery: opcode_budget 200 -> 220 (+10%)",
+    ]
+    assert compare(baseline, current, thresholds={"opcode_budget": 0.2, "inner_txns": 1})[1:] == []
+
+
+def test_compare_reports_metrics_that_were_zero() -> None:
+    baseline = {"hello": _costs(box_bytes_read=0)}
+    assert compare(baseline, {"hello": _costs(box_bytes_read=8)}) == [
+        "hello: box_bytes_read 0 -> 8 (new)"
+    ]
+
+
+def test_baseline_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / "contract_costs.json"
+    assert load_baseline(path) == {}
+    save_baseline(path, {"b": _costs(), "a": _costs(min_fee=2000)})
+    assert load_baseline(path) == {"a": _costs(min_fee=2000), "b": _costs()}
+    assert list(load_baseline(path)) == ["a", "b"]
+
+
+def test_committed_baseline_covers_the_profile_workload() -> None:
+    from benchmarks.bench_contract_costs import BASELINE
+    from smart_contracts.aidchain_contracts.profile_config import profile_calls
+
+    baseline = load_baseline(BASELINE)
+    assert sorted(baseline) == sorted(method for method, _ in profile_calls("A" * 58))
@@ -0,0 +1,166 @@
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import algokit_utils
+import pytest
+
+from smart_contracts._helpers import app_deploy
+from smart_contracts._helpers.deploy_registry import DeployRegistry, Deployment, program_hash
+from smart_contracts.aidchain_contracts import deploy_config
+from smart_contracts.aidchain_registry import deploy_config as registry_deploy_config
+
+NETWORK = "http://localhost:4001"
+
+
+def test_registry_round_trip(tmp_path: Path) -> None:
+    registry = DeployRegistry(tmp_path / "deployments.json")
+    deployment = Deployment(app_id=1001, approval_hash="a", clear_hash="c", creator="ME")
+
+    registry.record(NETWORK + "/", "App", deployment)
+
+    assert DeployRegistry(registry.path).get(NETWORK, "App") == deployment
+    assert registry.get("https://testnet-api.algonode.cloud", "App") is None
+    current = {"creator": "ME", "updatable": False}
+    assert registry.unchanged(NETWORK, "App", "a", "c", **current) == deployment
+    assert registry.unchanged(NETWORK, "App", "b", "c", **current) is None
+    assert registry.unchanged(NETWORK, "App", "a", "c", creator="YOU", updatable=False) is None
+    assert registry.unchanged(NETWORK, "App", "a", "c", creator="ME", updatable=True) is None
+
+    registry.forget(NETWORK, "App")
+    assert registry.get(NETWORK, "App") is None
+
+
+class NoNetworkAlgorand:
+    """
+    AlgorandClient stand-in for localnet that derives accounts offline and fails on
+    anything that would look up or compile the app
+    """
+
+    def __init__(self, localnet: bool = True) -> None:
+        self.client = SimpleNamespace(
+            algod=SimpleNamespace(algod_address=NETWORK), is_localnet=lambda: localnet
+        )
+        self.account = SimpleNamespace(
+            from_environment=lambda name: SimpleNamespace(address=f"{name}-ADDRESS")
+        )
+
+    @property
+    def app(self) -> None:
+        raise AssertionError("deploy touched the network")
+
+
+@pytest.fixture
+def registry(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> DeployRegistry:
+    registry = DeployRegistry(tmp_path / "deployments.json")
+    monkeypatch.setattr(app_deploy, "deploy_registry", registry)
+    monkeypatch.setattr(app_deploy, "deploy_fast_path", False)
+    monkeypatch.setattr(
+        algokit_utils.AlgorandClient, "from_environment", staticmethod(NoNetworkAlgorand)
+    )
+    return registry
+
+
+def _current_deployment(creator: str = "DEPLOYER-ADDRESS", updatable: bool = True) -> Deployment:
+    return Deployment(
+        app_id=1001,
+        approval_hash=program_hash(deploy_config.artifacts_dir / "AidchainContracts.approval.teal"),
+        clear_hash=program_hash(deploy_config.artifacts_dir / "AidchainContracts.clear.teal"),
+        creator=creator,
+        updatable=updatable,
+    )
+
+
+def test_fast_deploy_of_unchanged_programs_makes_no_calls(registry: DeployRegistry) -> None:
+    registry.record(NETWORK, deploy_config.APP_NAME, _current_deployment())
+    deploy_config.deploy(fast=True)
+
+
+def test_fast_deploy_of_changed_programs_deploys(registry: DeployRegistry) -> None:
+    stale = Deployment(app_id=1001, approval_hash="old", clear_hash="old")
+    registry.record(NETWORK, deploy_config.APP_NAME, stale)
+    with pytest.raises(AssertionError, match="touched the network"):
+        deploy_config.deploy(fast=True)
+
+
+def test_fast_deploy_by_another_deployer_deploys(registry: DeployRegistry) -> None:
+    registry.record(NETWORK, deploy_config.APP_NAME, _current_deployment(creator="OTHER"))
+    with pytest.raises(AssertionError, match="touched the network"):
+        deploy_config.deploy(fast=True)
+
+
+def test_fast_deploy_with_another_updatable_setting_deploys(registry: DeployRegistry) -> None:
+    algorand = NoNetworkAlgorand(localnet=False)
+    registry.record(NETWORK, deploy_config.APP_NAME, _current_deployment(updatable=False))
+    _, operation = deploy_config.deploy_app(algorand, fast=True)  # type: ignore[arg-type]
+    assert operation == "Unchanged"
+
+    with pytest.raises(AssertionError, match="touched the network"):
+        deploy_config.deploy_app(
+            algorand,  # type: ignore[arg-type]
+            on_update=algokit_utils.OnUpdate.UpdateApp,
+            fast=True,
+        )
+
+
+def test_domain_apps_deploy_through_the_shared_config(registry: DeployRegistry) -> None:
+    app = registry_deploy_config.app
+    deployment = Deployment(
+        app_id=1002,
+        approval_hash=program_hash(app.artifacts_dir / "AidchainRegistry.approval.teal"),
+        clear_hash=program_hash(app.artifacts_dir / "AidchainRegistry.clear.teal"),
+        creator="DEPLOYER-ADDRESS",
+        updatable=True,
+    )
+    registry.record(NETWORK, "AidchainRegistry", deployment)
+
+    registry_deploy_config.deploy(fast=True)
+
+    assert app.load_factory().__name__ == "AidchainRegistryFactory"
+    assert app.funding_plan().box_min_balance > 0
+
+
+def test_fast_path_is_opt_in(registry: DeployRegistry) -> None:
+    registry.record(NETWORK, deploy_config.APP_NAME, _current_deployment())
+    with pytest.raises(AssertionError, match="touched the network"):
+        deploy_config.deploy()
+
+
+class FactoryRecordingAlgorand:
+    """AlgorandClient stand-in that records the compilation params of the deploy's factory"""
+
+    def __init__(self, localnet: bool) -> None:
+        self.compilation_params: Any = None
+        self.client = SimpleNamespace(
+            algod=SimpleNamespace(algod_address=NETWORK),
+            is_localnet=lambda: localnet,
+            get_typed_app_factory=self.get_typed_app_factory,
+        )
+        self.account = SimpleNamespace(from_environment=lambda name: SimpleNamespace(address=name))
+
+    def get_typed_app_factory(self, factory: type, **kwargs: Any) -> None:
+        self.compilation_params = kwargs["compilation_params"]
+        raise Exception("factory requested")
+
+
+@pytest.mark.parametrize(
+    ("localnet", "on_update", "updatable"),
+    [
+        (True, algokit_utils.OnUpdate.AppendApp, True),
+        (False, algokit_utils.OnUpdate.AppendApp, False),
+        (False, algokit_utils.OnUpdate.UpdateApp, True),
+    ],
+)
+def test_only_localnet_and_in_place_updates_deploy_updatable(
+    monkeypatch: pytest.MonkeyPatch,
+    localnet: bool,
+    on_update: algokit_utils.OnUpdate,
+    updatable: bool,
+) -> None:
+    monkeypatch.setenv("AIDCHAIN_TEAL_CACHE", "0")
+    algorand = FactoryRecordingAlgorand(localnet)
+
+    with pytest.raises(Exception, match="factory requested"):
+        deploy_config.deploy_app(algorand, on_update=on_update, fast=False)  # type: ignore[arg-type]
+
+    assert algorand.compilation_params == {"updatable": updatable}
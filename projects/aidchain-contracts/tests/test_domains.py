@@ -0,0 +1,102 @@
+import json
+from pathlib import Path
+
+import algokit_utils
+import pytest
+
+from smart_contracts._helpers.deploy_registry import DeployRegistry, Deployment
+from smart_contracts.aidchain_contracts.domains import DOMAIN_APPS, AidchainDomainsClient
+
+ARTIFACTS = Path(__file__).parents[1] / "smart_contracts" / "artifacts"
+NETWORK = "http://localhost:4001"
+
+
+def _spec(folder: str, name: str) -> dict:
+    return json.loads((ARTIFACTS / folder / f"{name}.arc56.json").read_text())
+
+
+MONOLITH = _spec("aidchain_contracts", "AidchainContracts")
+DOMAINS = {name: _spec(f"aidchain_{domain}", name) for domain, name in DOMAIN_APPS.items()}
+
+
+def _signatures(spec: dict) -> set[str]:
+    return {
+        f"{m['name']}({','.join(a['type'] for a in m['args'])}){m['returns']['type']}"
+        for m in spec["methods"]
+    }
+
+
+def test_every_method_lives_in_exactly_one_domain() -> None:
+    shared = {"hello(string)string", "initialize()string"}
+    for signature in _signatures(MONOLITH) - shared:
+        owners = [name for name, spec in DOMAINS.items() if signature in _signatures(spec)]
+        assert len(owners) == 1, f"{signature} is implemented by {owners}"
+    for spec in DOMAINS.values():
+        assert shared <= _signatures(spec)
+        assert _signatures(spec) <= _signatures(MONOLITH)
+
+
+def test_state_is_partitioned_between_domains() -> None:
+    keys = [key for spec in DOMAINS.values() for key in spec["state"]["keys"]["global"]]
+    assert sorted(keys) == sorted(MONOLITH["state"]["keys"]["global"])
+    box_maps = {
+        name: value
+        for spec in DOMAINS.values()
+        for name, value in spec["state"]["maps"]["box"].items()
+    }
+    assert box_maps == MONOLITH["state"]["maps"]["box"]
+    for spec in DOMAINS.values():
+        for struct, fields in spec["structs"].items():
+            assert fields == MONOLITH["structs"][struct]
+
+
+@pytest.fixture
+def facade(tmp_path: Path) -> AidchainDomainsClient:
+    registry = DeployRegistry(tmp_path / "deployments.json")
+    for index, name in enumerate(DOMAIN_APPS.values()):
+        registry.record(
+            NETWORK, name, Deployment(app_id=1001 + index, approval_hash="a", clear_hash="c")
+        )
+    return AidchainDomainsClient.from_registry(
+        algokit_utils.AlgorandClient.default_localnet(),
+        registry,
+        default_sender="A" * 58,
+    )
+
+
+def test_calls_are_routed_to_the_owning_app(facade: AidchainDomainsClient) -> None:
+    assert facade.app_ids == {
+        "registry": 1001,
+        "campaigns": 1002,
+        "deliveries": 1003,
+        "vouchers": 1004,
+    }
+    routed = {
+        "register_organization": (("UNICEF", "ADDR"), 1001),
+        "create_campaign": (("Flood relief", 10_000, "Red Cross"), 1002),
+        "create_milestone": ((1, 5_000, "Phase 1"), 1002),
+        "log_delivery": (("Family 12", "Camp B"), 1003),
+        "redeem_voucher": ((1, "Market", 5), 1004),
+        "hello": (("world",), 1001),
+    }
+    for method, (args, app_id) in routed.items():
+        params = getattr(facade.params, method)(args=args)
+        assert params.app_id == app_id, method
+    assert [params.app_id for params in facade.params.initialize()] == [1001, 1002, 1003, 1004]
+
+
+def test_box_maps_resolve_to_the_owning_app(facade: AidchainDomainsClient) -> None:
+    assert type(facade.state.box.milestones).__module__.endswith("aidchain_campaigns_client")
+    assert type(facade.state.box.organizations).__module__.endswith("aidchain_registry_client")
+    with pytest.raises(AttributeError):
+        facade.state.box.donations  # noqa: B018
+
+
+def test_missing_domain_apps_are_reported(tmp_path: Path) -> None:
+    registry = DeployRegistry(tmp_path / "deployments.json")
+    registry.record(
+        NETWORK, "AidchainRegistry", Deployment(app_id=1, approval_hash="a", clear_hash="c")
+    )
+    algorand = algokit_utils.AlgorandClient.default_localnet()
+    with pytest.raises(Exception, match="AidchainCampaigns, AidchainDeliveries, AidchainVouchers"):
+        AidchainDomainsClient.from_registry(algorand, registry)
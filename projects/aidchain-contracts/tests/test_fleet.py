@@ -0,0 +1,157 @@
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from smart_contracts._helpers.deploy_registry import Deployment
+from smart_contracts._helpers.fleet import (
+    FleetTarget,
+    RolloutLog,
+    format_report,
+    load_manifest,
+    rollout,
+)
+
+MANIFEST = """
+[defaults]
+network = "testnet"
+deployer = "DEPLOYER_EU"
+
+[[targets]]
+name = "eu-1"
+app_name = "Aidchain-eu-1"
+
+[[targets]]
+name = "us-1"
+app_name = "Aidchain-us-1"
+network = "http://localhost:4001"
+deployer = "DEPLOYER_US"
+"""
+
+
+class FakeDeployer:
+    """Deploys targets after a delay, failing the ones named in `failing`"""
+
+    def __init__(self, delay: float = 0.0, failing: frozenset[str] = frozenset()) -> None:
+        self.delay = delay
+        self.failing = failing
+        self.deployed: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, target: FleetTarget) -> tuple[Deployment, str]:
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            if target.name in self.failing:
+                raise Exception(f"{target.name} is unreachable")
+            with self._lock:
+                self.deployed.append(target.name)
+            app_id = 1000 + int(target.name.rsplit("-", 1)[1])
+            return Deployment(app_id=app_id, approval_hash="a", clear_hash="c"), "Update"
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def _targets(count: int) -> list[FleetTarget]:
+    return [FleetTarget(name=f"t-{i}", app_name=f"Aidchain-{i}") for i in range(count)]
+
+
+def test_manifest_applies_defaults(tmp_path: Path) -> None:
+    path = tmp_path / "fleet.toml"
+    path.write_text(MANIFEST)
+
+    eu, us = load_manifest(path)
+
+    assert eu == FleetTarget(
+        name="eu-1", app_name="Aidchain-eu-1", network="testnet", deployer="DEPLOYER_EU"
+    )
+    assert (us.network, us.deployer) == ("http://localhost:4001", "DEPLOYER_US")
+    assert us.algorand().client.algod.algod_address == "http://localhost:4001"
+
+
+def test_manifest_rejects_duplicate_names(tmp_path: Path) -> None:
+    path = tmp_path / "fleet.toml"
+    path.write_text(MANIFEST.replace('"us-1"', '"eu-1"'))
+    with pytest.raises(Exception, match="Duplicate fleet targets.*eu-1"):
+        load_manifest(path)
+
+
+def test_rollout_is_concurrent_and_bounded(tmp_path: Path) -> None:
+    deployer = FakeDeployer(delay=0.05)
+    log = RolloutLog(tmp_path / "rollout.json")
+
+    started = time.monotonic()
+    statuses = rollout(_targets(20), deployer, log, revision="r1", max_parallel=5)
+    elapsed = time.monotonic() - started
+
+    assert deployer.max_in_flight == 5
+    assert elapsed < 20 * 0.05 / 2
+    assert {status.state for status in statuses.values()} == {"succeeded"}
+    assert statuses["t-7"].app_id == 1007
+    assert statuses["t-7"].operation == "Update"
+
+
+def test_failed_rollout_resumes_only_unfinished_targets(tmp_path: Path) -> None:
+    targets = _targets(6)
+    failing = FakeDeployer(failing=frozenset({"t-2", "t-4"}))
+    rollout(targets, failing, RolloutLog(tmp_path / "r.json"), revision="r1")
+
+    log = RolloutLog(tmp_path / "r.json")
+    assert log.get("t-2").state == "failed"
+    assert log.get("t-2").error == "t-2 is unreachable"
+    assert "t-2 is unreachable" in format_report({"t-2": log.get("t-2")})
+
+    retry = FakeDeployer()
+    statuses = rollout(targets, retry, log, revision="r1")
+    assert sorted(retry.deployed) == ["t-2", "t-4"]
+    assert all(status.state == "succeeded" for status in statuses.values())
+
+    # A new revision rolls out to every target again.
+    upgrade = FakeDeployer()
+    rollout(targets, upgrade, log, revision="r2")
+    assert len(upgrade.deployed) == 6
+
+
+def test_rollout_stops_starting_deploys_after_max_failures(tmp_path: Path) -> None:
+    targets = _targets(10)
+    deployer = FakeDeployer(failing=frozenset({"t-0", "t-1"}))
+
+    statuses = rollout(
+        targets,
+        deployer,
+        RolloutLog(tmp_path / "r.json"),
+        revision="r1",
+        max_parallel=1,
+        max_failures=2,
+    )
+
+    assert [statuses[f"t-{i}"].state for i in range(3)] == ["failed", "failed", "skipped"]
+    assert {statuses[f"t-{i}"].state for i in range(2, 10)} == {"skipped"}
+    assert deployer.deployed == []
+
+
+def test_rollout_stops_at_the_first_failure_with_max_failures_one(tmp_path: Path) -> None:
+    deployer = FakeDeployer(failing=frozenset({"t-1"}))
+
+    statuses = rollout(
+        _targets(4),
+        deployer,
+        RolloutLog(tmp_path / "r.json"),
+        revision="r1",
+        max_parallel=1,
+        max_failures=1,
+    )
+
+    assert [status.state for status in statuses.values()] == [
+        "succeeded",
+        "failed",
+        "skipped",
+        "skipped",
+    ]
+    assert deployer.deployed == ["t-0"]
@@ -0,0 +1,142 @@
+import asyncio
+import base64
+
+import httpx
+
+from smart_contracts._helpers.async_algod import AsyncAlgodClient
+from smart_contracts._helpers.deploy_registry import Deployment
+from smart_contracts.aidchain_contracts.fleet_stats import FleetStats, fleet_app_ids
+
+COUNTERS = ["campaign_counter", "total_donations", "delivery_counter"]
+
+
+class FleetAlgod:
+    """Serves application info for apps whose counters are derived from their app ID"""
+
+    def __init__(self, app_ids: list[int], delay: float = 0.0) -> None:
+        self.app_ids = set(app_ids)
+        self.delay = delay
+        self.requests: list[int] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        app_id = int(request.url.path.rsplit("/", 1)[1])
+        self.requests.append(app_id)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        if app_id not in self.app_ids:
+            return httpx.Response(404, json={"message": "application does not exist"})
+        global_state = [
+            {
+                "key": base64.b64encode(name.encode()).decode(),
+                "value": {"type": 2, "uint": app_id * (index + 1), "bytes": ""},
+            }
+            for index, name in enumerate(COUNTERS)
+        ]
+        return httpx.Response(200, json={"id": app_id, "params": {"global-state": global_state}})
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _stats(algod: FleetAlgod, **kwargs: object) -> FleetStats:
+    client = AsyncAlgodClient(
+        "http://algod", transport=httpx.MockTransport(algod.handle)  # type: ignore[arg-type]
+    )
+    return FleetStats(client, **kwargs)  # type: ignore[arg-type]
+
+
+def test_snapshot_sums_counters_across_apps() -> None:
+    app_ids = list(range(1, 101))
+    stats = _stats(FleetAlgod(app_ids))
+
+    snapshot = asyncio.run(stats.snapshot(app_ids))
+
+    assert len(snapshot.per_app) == 100
+    assert snapshot.per_app[7] == {
+        "campaign_counter": 7,
+        "total_donations": 14,
+        "delivery_counter": 21,
+    }
+    assert snapshot.totals == {
+        "campaign_counter": 5050,
+        "total_donations": 2 * 5050,
+        "delivery_counter": 3 * 5050,
+    }
+    assert snapshot.unavailable == {}
+
+
+def test_requests_are_concurrent_and_bounded() -> None:
+    algod = FleetAlgod(list(range(1, 41)), delay=0.01)
+    stats = _stats(algod, max_concurrency=8)
+
+    asyncio.run(stats.snapshot(range(1, 41)))
+
+    assert algod.max_in_flight == 8
+
+
+def test_missing_apps_are_reported_not_raised() -> None:
+    stats = _stats(FleetAlgod([1, 2]))
+
+    snapshot = asyncio.run(stats.snapshot([1, 2, 3]))
+
+    assert sorted(snapshot.per_app) == [1, 2]
+    assert snapshot.totals["campaign_counter"] == 3
+    assert snapshot.unavailable == {3: "application does not exist"}
+
+
+def test_state_is_cached_for_the_ttl() -> None:
+    algod = FleetAlgod([1, 2])
+    clock = Clock()
+    stats = _stats(algod, ttl=5.0, clock=clock)
+
+    async def poll_twice() -> None:
+        # Concurrent viewers share one fetch per app.
+        await asyncio.gather(stats.snapshot([1, 2]), stats.snapshot([1, 2]))
+        await stats.snapshot([1, 2])
+
+    asyncio.run(poll_twice())
+    assert sorted(algod.requests) == [1, 2]
+
+    clock.now = 5.0
+    asyncio.run(stats.snapshot([1, 2]))
+    assert sorted(algod.requests) == [1, 1, 2, 2]
+
+
+def test_failures_are_not_cached() -> None:
+    algod = FleetAlgod([1])
+    stats = _stats(algod)
+    asyncio.run(stats.snapshot([2]))
+
+    algod.app_ids.add(2)
+    snapshot = asyncio.run(stats.snapshot([2]))
+
+    assert snapshot.unavailable == {}
+    assert algod.requests == [2, 2]
+
+
+def test_fleet_app_ids_leave_out_the_domain_apps() -> None:
+    names = [
+        "AidchainContracts",
+        "AidchainContracts-shard-0",
+        "AidchainContracts-shard-1",
+        "AidchainContracts-eu-redcross",
+        "AidchainRegistry",
+        "AidchainCampaigns",
+        "AidchainDeliveries",
+        "AidchainVouchers",
+    ]
+    deployments = {
+        name: Deployment(app_id=1001 + index, approval_hash="a", clear_hash="c")
+        for index, name in enumerate(names)
+    }
+
+    assert fleet_app_ids(deployments) == [1001, 1002, 1003, 1004]
@@ -0,0 +1,50 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from smart_contracts._helpers.funding import box_min_balance, plan_funding, struct_size
+from smart_contracts.artifacts.aidchain_contracts import aidchain_contracts_codecs
+from smart_contracts.artifacts.aidchain_contracts.aidchain_contracts_client import CampaignInfo
+
+APP_SPEC = json.loads(
+    (
+        Path(__file__).parents[1]
+        / "smart_contracts/artifacts/aidchain_contracts/AidchainContracts.arc56.json"
+    ).read_text()
+)
+
+
+def test_struct_size_matches_encoded_value() -> None:
+    campaign = CampaignInfo(1, "t" * 32, 100, 0, "c" * 32, 1)
+    encoded = aidchain_contracts_codecs.encode_campaign_info(campaign)
+    assert struct_size("CampaignInfo", APP_SPEC["structs"], dynamic_bytes=32) == len(encoded)
+
+
+def test_box_min_balance_uses_name_and_value_size() -> None:
+    assert box_min_balance(17, 100) == 2_500 + 400 * 117
+
+
+def test_plan_counts_boxes_assets_and_fees() -> None:
+    campaign_box = box_min_balance(len(b"campaigns") + 8, 8 * 4 + 2 * (4 + 32))
+    plan = plan_funding(APP_SPEC, boxes={"campaigns": 3}, created_assets=2, inner_txns=10)
+
+    assert plan.account_min_balance == 100_000
+    assert plan.box_min_balance == 3 * campaign_box
+    assert plan.asset_min_balance == 200_000
+    assert plan.fee_budget == 10_000
+    assert plan.required == 100_000 + 3 * campaign_box + 200_000 + 10_000
+    # 9 global uints are charged to the creator, not the app account.
+    assert plan.creator_min_balance == 100_000 + 28_500 * 9
+
+
+def test_top_up_only_covers_the_shortfall() -> None:
+    plan = plan_funding(APP_SPEC, boxes={})
+    assert plan.top_up(0) == 100_000
+    assert plan.top_up(60_000) == 40_000
+    assert plan.top_up(250_000) == 0
+
+
+def test_unknown_box_map_is_rejected() -> None:
+    with pytest.raises(KeyError):
+        plan_funding(APP_SPEC, boxes={"donations": 1})
@@ -0,0 +1,264 @@
+import asyncio
+import base64
+import random
+import typing
+
+import algokit_utils
+import httpx
+import msgpack
+import pytest
+from algosdk import encoding
+
+from smart_contracts._helpers.async_algod import AsyncAlgodClient
+from smart_contracts._helpers.load_generator import (
+    Call,
+    GroupPacker,
+    LoadStats,
+    arrival_times,
+    format_report,
+    parse_mix,
+    percentile,
+    rejection_reason,
+    run_open_loop,
+)
+from smart_contracts.aidchain_contracts.load_workload import (
+    AidchainLoad,
+    RecordIds,
+    expected_records,
+)
+from smart_contracts.artifacts.aidchain_contracts.aidchain_contracts_client import (
+    AidchainContractsClient,
+)
+
+APP_ID = 1234
+GENESIS_HASH = base64.b64encode(b"\x01" * 32).decode()
+
+
+def _call(method: str = "log_delivery", arrived: float = 0.0) -> Call:
+    return Call(method=method, args=(), arrived=arrived)
+
+
+def test_parse_mix() -> None:
+    assert parse_mix("create_donation=3, log_delivery,get_campaign_count=0.5") == {
+        "create_donation": 3.0,
+        "log_delivery": 1.0,
+        "get_campaign_count": 0.5,
+    }
+    for spec in ("", "a=-1", "a=0"):
+        with pytest.raises(Exception, match="Invalid method mix"):
+            parse_mix(spec)
+
+
+def test_arrival_times() -> None:
+    assert arrival_times(4, 1, rng=random.Random(0), poisson=False) == [0, 0.25, 0.5, 0.75]
+
+    times = arrival_times(100, 50, rng=random.Random(1))
+    assert times == sorted(times) and 0 < times[0] and times[-1] < 50
+    assert 4_700 < len(times) < 5_300
+
+
+def test_percentile_is_nearest_rank() -> None:
+    values = [float(value) for value in range(1, 101)]
+    assert [percentile(values, q) for q in (0.5, 0.9, 0.99, 1.0)] == [50, 90, 99, 100]
+    assert percentile([7.0], 0.5) == 7
+    assert percentile([], 0.5) == 0
+
+
+def test_rejection_reasons_group_without_txids() -> None:
+    first = Exception(f"TransactionPool.Remember: transaction {'A' * 52}: overspend")
+    second = Exception(f"TransactionPool.Remember: transaction {'B' * 52}: overspend")
+    assert rejection_reason(first) == rejection_reason(second)
+    assert "<txid>" in rejection_reason(first)
+
+
+def test_report_lists_methods_totals_fees_and_reasons() -> None:
+    stats = LoadStats()
+    stats.record_confirmed([_call(arrived=1.0), _call(arrived=1.5)], done=2.0, fee=2_000)
+    stats.record_rejected([_call("create_donation")], Exception("logic eval error"))
+    stats.groups = 2
+
+    report = format_report(stats, elapsed=2.0)
+
+    assert "log_delivery" in report and "create_donation" in report
+    total = next(line for line in report.splitlines() if line.startswith("total"))
+    assert total.split()[1:4] == ["2", "1", "1.0"]
+    assert "Fees paid 2,000 microALGO (1,000 per confirmed call)" in report
+    assert "1  logic eval error" in report
+
+
+def test_packer_sends_full_groups_at_once_and_the_rest_after_linger() -> None:
+    sent: list[tuple[float, int]] = []
+
+    async def run() -> None:
+        loop = asyncio.get_running_loop()
+
+        async def send_group(calls: list[Call]) -> None:
+            sent.append((loop.time() - start, len(calls)))
+
+        start = loop.time()
+        packer = GroupPacker(send_group, group_size=4, linger=0.05)
+        for _ in range(6):
+            packer.add(_call())
+        await asyncio.sleep(0)
+        assert sent == [(pytest.approx(0, abs=0.02), 4)]
+        await asyncio.sleep(0.1)
+        await packer.drain()
+
+    asyncio.run(run())
+
+    assert [size for _, size in sent] == [4, 2]
+    assert sent[1][0] == pytest.approx(0.05, abs=0.03)
+
+
+def test_packer_rejects_oversized_groups() -> None:
+    async def send_group(calls: list[Call]) -> None:
+        pass
+
+    with pytest.raises(Exception, match="between 1 and 16"):
+        GroupPacker(send_group, group_size=17)
+
+
+def test_open_loop_keeps_the_schedule_and_draws_from_the_mix() -> None:
+    arrivals = [0.0, 0.01, 0.02, 0.03]
+    seen: list[tuple[str, float]] = []
+
+    async def run() -> tuple[float, float]:
+        start = asyncio.get_running_loop().time()
+        lag = await run_open_loop(
+            arrivals,
+            {"create_donation": 1, "never": 0},
+            lambda method, scheduled: seen.append((method, scheduled)),
+            rng=random.Random(0),
+        )
+        return start, lag
+
+    start, lag = asyncio.run(run())
+
+    assert [method for method, _ in seen] == ["create_donation"] * 4
+    offsets = [scheduled - start for _, scheduled in seen]
+    assert offsets == pytest.approx(arrivals, abs=0.005)
+    assert 0 <= lag < 0.05
+
+
+def test_record_ids() -> None:
+    ids = RecordIds(prefix=b"deliveries", next_id=2, existing=1)
+    assert [ids.reserve(), ids.reserve()] == [2, 3]
+    ids.release()
+    assert ids.reserve() == 3
+    ids.confirm()
+    assert ids.pick(random.Random(0)) in (1, 2)
+    assert ids.window(2, 2) == [b"deliveries" + i.to_bytes(8, "big") for i in (1, 2, 3, 4)]
+    with pytest.raises(Exception, match="No orgs records"):
+        RecordIds(prefix=b"orgs").pick(random.Random(0))
+
+
+def test_expected_records() -> None:
+    mix = {"create_campaign": 1, "log_delivery": 2, "create_donation": 1}
+    assert expected_records(mix, 400) == {"organizations": 0, "campaigns": 100, "deliveries": 200}
+
+
+class FakeAlgod:
+    """Confirms every accepted group in the next block; rejects groups when told to."""
+
+    def __init__(self) -> None:
+        self.round = 10
+        self.mempool: list[str] = []
+        self.blocks: dict[int, list[str]] = {}
+        self.groups: list[list[dict[str, typing.Any]]] = []
+        self.simulated = 0
+        self.reject: str | None = None
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path.removeprefix("/v2")
+        if path == "/transactions/params":
+            return httpx.Response(200, json={
+                "fee": 0, "min-fee": 1000, "last-round": self.round,
+                "genesis-hash": GENESIS_HASH, "genesis-id": "fake-v1",
+                "consensus-version": "future",
+            })
+        if path == "/status":
+            return httpx.Response(200, json={"last-round": self.round})
+        if path.startswith("/status/wait-for-block-after/"):
+            self.round += 1
+            self.blocks[self.round], self.mempool = self.mempool, []
+            return httpx.Response(200, json={"last-round": self.round})
+        if path.startswith("/blocks/"):
+            block = self.blocks.get(int(path.split("/")[2]))
+            return httpx.Response(200, json={"blockTxids": block})
+        if path == "/transactions/simulate":
+            self.simulated += 1
+            return httpx.Response(200, json={"txn-groups": [{"txn-results": [{}]}]})
+        if path == "/transactions":
+            if self.reject:
+                return httpx.Response(400, json={"message": self.reject})
+            unpacker = msgpack.Unpacker(raw=False, strict_map_key=False)
+            unpacker.feed(request.content)
+            group = list(unpacker)
+            self.groups.append(group)
+            first = encoding.msgpack_decode(
+                base64.b64encode(msgpack.packb(group[0], use_bin_type=True)).decode()
+            )
+            self.mempool.append(first.get_txid())
+            return httpx.Response(200, json={"txId": self.mempool[-1]})
+        return httpx.Response(404, json={"message": f"unexpected {path}"})
+
+
+def _run_load(
+    fake_algod: FakeAlgod, methods: list[str], *, group_size: int
+) -> AidchainLoad:
+    algorand = algokit_utils.AlgorandClient.default_localnet()
+    senders = [algorand.account.random().address for _ in range(2)]
+    client = AidchainContractsClient(algorand=algorand, app_id=APP_ID, default_sender=senders[0])
+
+    async def run() -> AidchainLoad:
+        algod = AsyncAlgodClient(
+            "http://algod.test", transport=httpx.MockTransport(fake_algod.handle)
+        )
+        load = AidchainLoad(
+            client, algod, senders, rng=random.Random(0), group_size=group_size, linger=0.01
+        )
+        load.seed({"organizations": 1, "campaigns": 1, "deliveries": 1})
+        now = asyncio.get_running_loop().time()
+        for method in methods:
+            load.arrive(method, now)
+        await load.drain()
+        await algod.aclose()
+        return load
+
+    return asyncio.run(run())
+
+
+def test_calls_are_packed_into_signed_groups_with_box_references() -> None:
+    fake_algod = FakeAlgod()
+    load = _run_load(
+        fake_algod, ["log_delivery", "verify_delivery", "create_donation"], group_size=3
+    )
+
+    (group,) = fake_algod.groups
+    assert len(group) == 3 and all("sig" in txn for txn in group)
+    assert len({txn["txn"]["grp"] for txn in group}) == 1
+    # The new delivery is expected to get ID 2; its boxes are referenced for IDs 1 to 5.
+    assert len(group[0]["txn"]["apbx"]) == 5
+    assert len(group[1]["txn"]["apbx"]) == 1 and len(group[2]["txn"]["apbx"]) == 1
+    assert load.stats.confirmed == 3 and load.stats.groups == 1
+    assert load.stats.fees == 3_000
+    assert load.ids["deliveries"].existing == 2
+
+
+def test_readonly_calls_are_simulated() -> None:
+    fake_algod = FakeAlgod()
+    load = _run_load(fake_algod, ["get_campaign_details", "get_delivery_count"], group_size=1)
+
+    assert fake_algod.groups == [] and fake_algod.simulated == 2
+    assert load.stats.confirmed == 2 and load.stats.fees == 0
+
+
+def test_rejected_groups_release_their_ids() -> None:
+    fake_algod = FakeAlgod()
+    fake_algod.reject = "TransactionPool.Remember: logic eval error: assert failed"
+    load = _run_load(fake_algod, ["log_delivery", "register_organization"], group_size=1)
+
+    assert load.stats.confirmed == 0
+    assert load.stats.rejected == {"log_delivery": 1, "register_organization": 1}
+    assert load.stats.reasons == {fake_algod.reject: 2}
+    assert load.ids["deliveries"].next_id == 2 and load.ids["organizations"].next_id == 2
@@ -0,0 +1,138 @@
+import threading
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from algosdk.logic import get_application_address
+
+from smart_contracts._helpers.funding import ACCOUNT_MIN_BALANCE, MIN_TXN_FEE
+from smart_contracts._helpers.localnet_workers import AppPool, batch_creator, worker_id
+
+CREATOR_MIN_BALANCE = 356_500
+
+
+class FakeGroup:
+    def __init__(self, ledger: "FakeAlgorand") -> None:
+        self.ledger = ledger
+        self.creates: list[Any] = []
+        self.payments: list[Any] = []
+
+    def add_app_create(self, params: Any) -> "FakeGroup":
+        self.creates.append(params)
+        return self
+
+    def add_payment(self, params: Any) -> "FakeGroup":
+        self.payments.append(params)
+        return self
+
+    def send(self) -> SimpleNamespace:
+        ledger = self.ledger
+        spent = MIN_TXN_FEE * (len(self.creates) + len(self.payments))
+        spent += sum(payment.amount.micro_algo for payment in self.payments)
+        # Each created app raises its creator's minimum balance.
+        min_balance = ledger.min_balance + CREATOR_MIN_BALANCE * len(self.creates)
+        if ledger.balance - spent < min_balance:
+            raise Exception("overspend: balance below min")
+        ledger.balance -= spent
+        ledger.min_balance = min_balance
+        ledger.groups.append(self)
+        confirmations = []
+        for _ in self.creates:
+            ledger.next_app_id += 1
+            confirmations.append({"application-index": ledger.next_app_id})
+        return SimpleNamespace(confirmations=confirmations)
+
+
+class FakeAlgorand:
+    """Tracks the one sender's balance and minimum balance like algod does."""
+
+    def __init__(self) -> None:
+        self.groups: list[FakeGroup] = []
+        self.next_app_id = 1000
+        self.top_ups: list[int] = []
+        self.balance = ACCOUNT_MIN_BALANCE
+        self.min_balance = ACCOUNT_MIN_BALANCE
+        self.account = SimpleNamespace(
+            localnet_dispenser=lambda: "DISPENSER", ensure_funded=self.ensure_funded
+        )
+
+    def ensure_funded(self, account: Any, dispenser: Any, amount: Any) -> None:
+        self.top_ups.append(amount.micro_algo)
+        self.balance += max(0, self.min_balance + amount.micro_algo - self.balance)
+
+    def new_group(self) -> FakeGroup:
+        return FakeGroup(self)
+
+
+def test_worker_id(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+    assert worker_id() == "main"
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw3")
+    assert worker_id() == "gw3"
+
+
+def test_pool_creates_apps_in_batches() -> None:
+    batches: list[int] = []
+
+    def create_batch(count: int) -> list[int]:
+        batches.append(count)
+        start = 100 * len(batches)
+        return list(range(start, start + count))
+
+    pool = AppPool(create_batch, batch_size=3)
+
+    assert [pool.take() for _ in range(4)] == [100, 101, 102, 200]
+    assert batches == [3, 3]
+    assert pool.created == 6
+
+
+def test_pool_hands_out_each_app_once_across_threads() -> None:
+    counter = iter(range(10_000))
+    pool = AppPool(lambda count: [next(counter) for _ in range(count)], batch_size=16)
+    taken: list[int] = []
+
+    def take() -> None:
+        for _ in range(50):
+            taken.append(pool.take())
+
+    threads = [threading.Thread(target=take) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(taken) == list(range(400))
+
+
+def test_pool_rejects_batches_larger_than_a_group() -> None:
+    with pytest.raises(Exception, match="between 1 and 16"):
+        AppPool(lambda count: [], batch_size=17)
+
+
+def test_batch_creator_creates_in_one_group_and_funds_in_another(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw1")
+    algorand = FakeAlgorand()
+    sender = SimpleNamespace(address="SENDER")
+    create_batch = batch_creator(
+        algorand,
+        lambda note: note,
+        sender,
+        app_funding=250_000,
+        creator_min_balance=CREATOR_MIN_BALANCE,
+    )
+
+    assert create_batch(3) == [1001, 1002, 1003]
+    assert create_batch(2) == [1004, 1005]
+
+    creates, funding = algorand.groups[0], algorand.groups[1]
+    assert creates.creates == ["gw1:0", "gw1:1", "gw1:2"]
+    assert [payment.receiver for payment in funding.payments] == [
+        get_application_address(app_id) for app_id in (1001, 1002, 1003)
+    ]
+    assert {payment.amount.micro_algo for payment in funding.payments} == {250_000}
+    # Notes stay unique across batches.
+    assert algorand.groups[2].creates == ["gw1:3", "gw1:4"]
+    assert algorand.top_ups == [3 * 608_500, 2 * 608_500]
+    assert algorand.min_balance == ACCOUNT_MIN_BALANCE + 5 * CREATOR_MIN_BALANCE
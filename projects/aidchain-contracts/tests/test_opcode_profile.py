@@ -0,0 +1,98 @@
+import json
+from pathlib import Path
+
+from smart_contracts._helpers.opcode_profile import (
+    _decode_vlq,
+    approval_trace,
+    constant_blocks_end,
+    format_report,
+    load_source_map,
+    opcode_cost,
+    profile_trace,
+)
+from smart_contracts.aidchain_contracts.profile_config import profile_calls
+
+ARTIFACTS = Path(__file__).parents[1] / "smart_contracts" / "artifacts" / "aidchain_contracts"
+SOURCE_MAP = load_source_map(ARTIFACTS / "AidchainContracts.approval.puya.map")
+
+
+def _location_of(text: str) -> tuple[int, int]:
+    for source, path in enumerate(SOURCE_MAP.sources):
+        for number, line in enumerate(path.read_text().splitlines(), 1):
+            if text in line:
+                return source, number
+    raise AssertionError(f"{text!r} is in no source")
+
+
+def test_decode_vlq() -> None:
+    assert _decode_vlq("AAyCQ") == [0, 0, 41, 8]
+    assert _decode_vlq("D") == [-1]
+    assert _decode_vlq("gB") == [16]
+
+
+def test_opcode_costs() -> None:
+    assert opcode_cost("box_put") == 1
+    assert opcode_cost("sha256") == 35
+    assert opcode_cost("bytec 6 // \"campaigns\"") == 1
+
+
+def test_source_map_points_at_contract_lines() -> None:
+    assert {path.name for path in SOURCE_MAP.sources} == {"contract.py"}
+    box_puts = [pc for pc, op in SOURCE_MAP.ops.items() if op == "box_put"]
+    lines = {SOURCE_MAP.source_line(*SOURCE_MAP.lines[pc]) for pc in box_puts}
+    assert "self.deliveries[ARC4UInt64(delivery_id)] = delivery_info.copy()" in lines
+    # Dispatch code generated by the compiler has no source line.
+    assert not all(pc in SOURCE_MAP.lines for pc in SOURCE_MAP.ops)
+
+
+def test_templated_map_is_shifted_past_the_deployed_constant_blocks() -> None:
+    # version 10, intcblock 0 1 300, bytecblock "abcd" 0x00
+    program = bytes([10, 0x20, 3, 0, 1, 0xAC, 0x02, 0x26, 2, 4, *b"abcd", 1, 0, 0x31, 0x18])
+    assert constant_blocks_end(program) == 16
+
+    aligned = load_source_map(ARTIFACTS / "AidchainContracts.approval.puya.map", program)
+
+    assert min(aligned.ops) == 16
+    assert aligned.ops[16] == SOURCE_MAP.ops[0] == "txn ApplicationID"
+    assert aligned.lines == {pc + 16: location for pc, location in SOURCE_MAP.lines.items()}
+
+
+def test_profile_attributes_cost_to_lines() -> None:
+    source, line = _location_of("self.deliveries[ARC4UInt64(delivery_id)] = delivery_info.copy()")
+    pcs = [pc for pc, location in SOURCE_MAP.lines.items() if location == (source, line)]
+    unmapped_pc = next(pc for pc in SOURCE_MAP.ops if pc not in SOURCE_MAP.lines)
+    response = {
+        "txn-groups": [
+            {
+                "txn-results": [
+                    {
+                        "app-budget-consumed": 100,
+                        "exec-trace": {
+                            "approval-program-trace": [
+                                {"pc": pc} for pc in [unmapped_pc, *pcs, *pcs]
+                            ]
+                        },
+                    }
+                ]
+            }
+        ]
+    }
+
+    profile = profile_trace(SOURCE_MAP, "verify_delivery", approval_trace(response), 100)
+
+    assert profile.budget_consumed == 100
+    assert profile.unmapped == 1
+    assert [(hot.line, hot.cost) for hot in profile.lines] == [(line, 2 * len(pcs))]
+    assert profile.lines[0].ops["box_put"] == 2
+    report = format_report(SOURCE_MAP, [profile])
+    assert f"aidchain_deliveries/contract.py:{line}" in report
+    assert report.startswith("verify_delivery: 100 budget")
+
+
+def test_profile_calls_cover_every_method() -> None:
+    spec = json.loads((ARTIFACTS / "AidchainContracts.arc56.json").read_text())
+    calls = profile_calls("A" * 58)
+    assert sorted(method for method, _ in calls) == sorted(m["name"] for m in spec["methods"])
+    for method, args in calls:
+        (abi_method,) = [m for m in spec["methods"] if m["name"] == method]
+        assert len(args) == len(abi_method["args"]), method
@@ -0,0 +1,43 @@
+import time
+from pathlib import Path
+
+import pytest
+
+import smart_contracts.__main__ as smart_contracts_main
+from smart_contracts.__main__ import SmartContract, build_contracts
+
+BUILD_SECONDS = 0.5
+
+
+def _slow_build(output_dir: Path, contract_path: Path) -> Path:
+    time.sleep(BUILD_SECONDS)
+    if contract_path.name == "broken.py":
+        raise Exception(f"Could not build contract:\n{contract_path} has errors")
+    output_dir.mkdir(parents=True)
+    return output_dir
+
+
+@pytest.fixture(autouse=True)
+def slow_build(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(smart_contracts_main, "build", _slow_build)
+    monkeypatch.setattr(smart_contracts_main, "build_jobs", 4)
+
+
+def test_contracts_build_concurrently(tmp_path: Path) -> None:
+    contracts = [SmartContract(path=tmp_path / f"{name}.py", name=name) for name in "abcd"]
+
+    start = time.perf_counter()
+    build_contracts(tmp_path / "artifacts", contracts)
+    elapsed = time.perf_counter() - start
+
+    assert sorted(p.name for p in (tmp_path / "artifacts").iterdir()) == list("abcd")
+    assert elapsed < BUILD_SECONDS * 3
+
+
+def test_first_failure_is_raised(tmp_path: Path) -> None:
+    contracts = [
+        SmartContract(path=tmp_path / "ok.py", name="ok"),
+        SmartContract(path=tmp_path / "broken.py", name="broken"),
+    ]
+    with pytest.raises(Exception, match="broken.py has errors"):
+        build_contracts(tmp_path / "artifacts", contracts)
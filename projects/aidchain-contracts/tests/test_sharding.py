@@ -0,0 +1,181 @@
+import dataclasses
+import typing
+from types import SimpleNamespace
+
+import pytest
+
+from smart_contracts.aidchain_contracts.sharding import (
+    SHARD_ID_STRIDE,
+    ShardedAidchainContractsClient,
+    global_id,
+    locate,
+)
+from smart_contracts.artifacts.aidchain_contracts.aidchain_contracts_client import (
+    AidchainContractsClient,
+    CampaignInfo,
+    CreateCampaignArgs,
+    MilestoneInfo,
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class Result:
+    abi_return: typing.Any
+
+
+class FakeShard:
+    """One app instance: stores campaigns and milestones under shard-local IDs"""
+
+    def __init__(self, app_address: str) -> None:
+        self.app_address = app_address
+        self.campaigns: dict[int, CampaignInfo] = {}
+        self.milestones: dict[int, MilestoneInfo] = {}
+        self.donations = 0
+        self.calls: list[tuple[str, tuple[typing.Any, ...]]] = []
+        self.send = self
+        campaigns = SimpleNamespace(
+            get_map=lambda: dict(self.campaigns), get_value=self.campaigns.get
+        )
+        self.state = SimpleNamespace(
+            global_state=SimpleNamespace(get_all=self.get_all),
+            box=SimpleNamespace(campaigns=campaigns),
+        )
+
+    def _call(self, name: str, args: tuple[typing.Any, ...]) -> None:
+        self.calls.append((name, args))
+
+    def create_campaign(self, args: tuple[str, int, str], *_: typing.Any) -> Result:
+        self._call("create_campaign", args)
+        title, target, creator = args
+        campaign_id = len(self.campaigns) + 1
+        self.campaigns[campaign_id] = CampaignInfo(campaign_id, title, target, 0, creator, 1)
+        return Result(campaign_id)
+
+    def create_donation(self, args: tuple[int], *_: typing.Any) -> Result:
+        self._call("create_donation", args)
+        assert args[0] in self.campaigns, "Campaign not found"
+        self.donations += 1
+        return Result("Donation recorded successfully")
+
+    def create_milestone(self, args: tuple[int, int, str], *_: typing.Any) -> Result:
+        self._call("create_milestone", args)
+        campaign_id, target_amount, description = args
+        assert campaign_id in self.campaigns, "Campaign not found"
+        milestone_id = len(self.milestones) + 1
+        self.milestones[milestone_id] = MilestoneInfo(
+            milestone_id, campaign_id, target_amount, description, 0, 0
+        )
+        return Result(milestone_id)
+
+    def get_milestone_details(self, args: tuple[int], *_: typing.Any) -> Result:
+        self._call("get_milestone_details", args)
+        return Result(self.milestones[args[0]])
+
+    def get_campaign_count(self, *_: typing.Any) -> Result:
+        self._call("get_campaign_count", ())
+        return Result(len(self.campaigns))
+
+    def hello(self, args: tuple[str], *_: typing.Any) -> Result:
+        self._call("hello", args)
+        return Result(f"Hello, {args[0]}")
+
+    def get_all(self) -> dict[str, int]:
+        return {"campaign_counter": len(self.campaigns), "total_donations": self.donations}
+
+
+def _router(
+    count: int = 3, **kwargs: typing.Any
+) -> tuple[ShardedAidchainContractsClient, list[FakeShard]]:
+    shards = [FakeShard(f"SHARD{index}") for index in range(count)]
+    router = ShardedAidchainContractsClient(
+        typing.cast(dict[int, AidchainContractsClient], dict(enumerate(shards))), **kwargs
+    )
+    return router, shards
+
+
+def test_global_ids_encode_the_shard() -> None:
+    assert global_id(0, 5) == 5
+    assert locate(global_id(3, 5)) == (3, 5)
+    with pytest.raises(Exception, match="outside the shard ID range"):
+        global_id(1, SHARD_ID_STRIDE)
+
+
+def test_creates_are_spread_round_robin_with_global_ids() -> None:
+    router, shards = _router()
+
+    ids = [
+        router.send.create_campaign(args=(f"Campaign {i}", 1_000, "creator")).abi_return
+        for i in range(6)
+    ]
+
+    assert [len(shard.campaigns) for shard in shards] == [2, 2, 2]
+    assert [locate(id_) for id_ in ids] == [(0, 1), (1, 1), (2, 1), (0, 2), (1, 2), (2, 2)]
+
+
+def test_hash_placement_co_locates_by_creator() -> None:
+    router, shards = _router(placement="hash")
+
+    for i in range(5):
+        router.send.create_campaign(
+            CreateCampaignArgs(title=f"C{i}", target=1, creator="Red Cross")
+        )
+
+    assert sorted(len(shard.campaigns) for shard in shards) == [0, 0, 5]
+
+
+def test_calls_go_to_the_shard_owning_the_id() -> None:
+    router, shards = _router()
+    router.send.create_campaign(args=("A", 1, "x"))
+    campaign_id = router.send.create_campaign(args=("B", 1, "x")).abi_return
+
+    router.send.create_donation(args=(campaign_id,))
+    milestone_id = router.send.create_milestone(args=(campaign_id, 500, "Phase 1")).abi_return
+    milestone = router.send.get_milestone_details(args=(milestone_id,)).abi_return
+
+    assert shards[1].donations == 1
+    assert shards[1].calls[1:] == [
+        ("create_donation", (1,)),
+        ("create_milestone", (1, 500, "Phase 1")),
+        ("get_milestone_details", (1,)),
+    ]
+    # IDs in returned structs are global too.
+    assert (milestone.id, milestone.campaign_id) == (milestone_id, campaign_id)
+
+
+def test_counts_are_summed_over_shards() -> None:
+    router, _ = _router()
+    for _ in range(7):
+        router.send.create_campaign(args=("A", 1, "x"))
+
+    assert router.send.get_campaign_count().abi_return == 7
+    assert router.state.global_state.get_all()["campaign_counter"] == 7
+
+
+def test_box_maps_are_merged_with_global_keys() -> None:
+    router, _ = _router(2)
+    ids = [router.send.create_campaign(args=(f"C{i}", 1, "x")).abi_return for i in range(3)]
+
+    campaigns = router.state.box.campaigns.get_map()
+
+    assert sorted(campaigns) == sorted(ids)
+    assert all(campaign.id == id_ for id_, campaign in campaigns.items())
+    assert router.state.box.campaigns.get_value(ids[1]).title == "C1"
+    assert router.state.box.campaigns.get_value(global_id(9, 1)) is None
+
+
+def test_read_only_shards_take_no_new_records() -> None:
+    router, shards = _router(writable=[2])
+    for _ in range(3):
+        router.send.create_campaign(args=("A", 1, "x"))
+    assert [len(shard.campaigns) for shard in shards] == [0, 0, 3]
+    assert router.send.hello(args=("world",)).abi_return == "Hello, world"
+    assert shards[2].calls[-1] == ("hello", ("world",))
+
+
+@pytest.mark.parametrize("placement", ["round_robin", "hash"])
+def test_creates_fail_clearly_without_writable_shards(placement: str) -> None:
+    router, shards = _router(writable=[], placement=placement)
+    with pytest.raises(Exception, match="No writable shards"):
+        router.send.create_campaign(args=("A", 1, "x"))
+    assert [len(shard.campaigns) for shard in shards] == [0, 0, 0]
+    assert router.send.hello(args=("world",)).abi_return == "Hello, world"
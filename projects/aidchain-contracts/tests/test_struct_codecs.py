@@ -0,0 +1,72 @@
+import dataclasses
+import json
+import typing
+from pathlib import Path
+
+import pytest
+from algokit_utils.applications.abi import get_abi_encoded_value
+
+from smart_contracts._helpers.struct_codecs import is_supported, render_codecs
+from smart_contracts.artifacts.aidchain_contracts import aidchain_contracts_codecs
+from smart_contracts.artifacts.aidchain_contracts.aidchain_contracts_client import (
+    APP_SPEC,
+    CampaignInfo,
+    DeliveryRecord,
+    MilestoneInfo,
+    OrganizationInfo,
+    VoucherInfo,
+)
+
+ARTIFACTS = Path(__file__).parent.parent / "smart_contracts" / "artifacts" / "aidchain_contracts"
+
+SAMPLES = [
+    CampaignInfo(1, "Flood relief", 10_000, 250, "Red Cross", 1),
+    CampaignInfo(2**64 - 1, "", 0, 0, "Équipe médicale ✓", 0),
+    DeliveryRecord(3, "Beneficiary1", "Location1", "", 0),
+    DeliveryRecord(4, "Family #12", "Camp B", "Agent Smith", 1),
+    MilestoneInfo(5, 1, 5_000, "First phase completed", 1, 0),
+    OrganizationInfo(6, "UNICEF", "TESTADDRESS123", 3),
+    VoucherInfo(7, 1234, "Food Voucher", 1_000, 50),
+]
+
+
+@pytest.mark.parametrize("value", SAMPLES, ids=lambda v: type(v).__name__)
+def test_encode_matches_generic_abi_encoding(value: typing.Any) -> None:
+    struct_name = type(value).__name__
+    expected = get_abi_encoded_value(dataclasses.asdict(value), struct_name, APP_SPEC.structs)
+    assert aidchain_contracts_codecs.ENCODERS[struct_name](value) == expected
+
+
+@pytest.mark.parametrize("value", SAMPLES, ids=lambda v: type(v).__name__)
+def test_decode_round_trips(value: object) -> None:
+    struct_name = type(value).__name__
+    encoded = aidchain_contracts_codecs.ENCODERS[struct_name](value)
+    assert aidchain_contracts_codecs.DECODERS[struct_name](encoded) == value
+
+
+def test_decode_at_offset() -> None:
+    value = SAMPLES[3]
+    encoded = aidchain_contracts_codecs.encode_delivery_record(value)
+    assert aidchain_contracts_codecs.decode_delivery_record(b"\xff" * 5 + encoded, 5) == value
+
+
+def test_decode_box_strips_prefix_and_key() -> None:
+    value = SAMPLES[0]
+    key, decoded = aidchain_contracts_codecs.decode_box(
+        "campaigns",
+        b"campaigns" + (42).to_bytes(8, "big"),
+        aidchain_contracts_codecs.encode_campaign_info(value),
+    )
+    assert (key, decoded) == (42, value)
+
+
+def test_committed_codecs_are_up_to_date() -> None:
+    app_spec = json.loads((ARTIFACTS / "AidchainContracts.arc56.json").read_text())
+    rendered = render_codecs(app_spec, "aidchain_contracts_client")
+    assert rendered == (ARTIFACTS / "aidchain_contracts_codecs.py").read_text()
+
+
+def test_unsupported_fields_are_skipped() -> None:
+    assert not is_supported([{"name": "flags", "type": "bool"}])
+    assert not is_supported([{"name": "data", "type": "uint64"}])
+    assert is_supported([{"name": "id", "type": "uint64"}, {"name": "note", "type": "string"}])
@@ -0,0 +1,246 @@
+import asyncio
+import base64
+import random
+import typing
+from collections import Counter
+
+import algokit_utils
+import httpx
+import msgpack
+import pytest
+from algosdk import encoding
+from algosdk.logic import get_application_address
+
+from smart_contracts._helpers.async_algod import AsyncAlgodClient
+from smart_contracts._helpers.bulk_sender import BulkSender
+from smart_contracts._helpers.funding import box_min_balance
+from smart_contracts.aidchain_contracts.synthetic_data import (
+    CALLS_PER_GROUP,
+    MAX_STRING_LENGTH,
+    DatasetSpec,
+    DatasetWriter,
+    Lengths,
+    Write,
+    plan_writes,
+)
+from smart_contracts.artifacts.aidchain_contracts.aidchain_contracts_client import (
+    AidchainContractsClient,
+    DeliveryRecord,
+)
+from smart_contracts.artifacts.aidchain_contracts.aidchain_contracts_codecs import (
+    encode_delivery_record,
+)
+
+APP_ID = 1234
+GENESIS_HASH = base64.b64encode(b"\x01" * 32).decode()
+
+SMALL = DatasetSpec(
+    organizations=3, campaigns=4, milestones_per_campaign=2, deliveries=50, verified_fraction=0.5
+)
+
+
+def _id(box: bytes) -> int:
+    return int.from_bytes(box[-8:], "big")
+
+
+def test_lengths() -> None:
+    assert Lengths.parse("32") == Lengths("fixed", 32)
+    assert Lengths.parse("uniform:8:64") == Lengths("uniform", 8, 64)
+    assert Lengths.parse("lognormal:24:0.5") == Lengths("lognormal", 24, 0.5)
+    for spec in ("uniform:8", "gamma:1:2", "fixed:-1", "lognormal:a:b"):
+        with pytest.raises(Exception, match="Invalid length distribution"):
+            Lengths.parse(spec)
+
+    rng = random.Random(0)
+    assert {Lengths("uniform", 8, 10).sample(rng) for _ in range(200)} == {8, 9, 10}
+    heavy_tail = [Lengths("lognormal", 500, 3).sample(rng) for _ in range(500)]
+    assert max(heavy_tail) == MAX_STRING_LENGTH and min(heavy_tail) >= 0
+
+
+def test_plan_is_ordered_and_numbers_records_after_existing_ones() -> None:
+    existing = {"organizations": 10, "campaigns": 5, "milestones": 0, "deliveries": 100}
+    writes = list(plan_writes(SMALL, existing))
+
+    methods = [write.method for write in writes]
+    counts = Counter(methods)
+    assert counts["register_organization"] == 3
+    assert counts["create_campaign"] == 4
+    assert counts["create_milestone"] == 8
+    assert counts["log_delivery"] == 50
+    assert 10 < counts["verify_delivery"] < 40
+    assert methods[:7] == ["register_organization"] * 3 + ["create_campaign"] * 4
+
+    assert [_id(w.boxes[0]) for w in writes if w.method == "create_campaign"] == [6, 7, 8, 9]
+    milestones = [w for w in writes if w.method == "create_milestone"]
+    assert [_id(w.boxes[0]) for w in milestones] == list(range(1, 9))
+    assert [w.args[0] for w in milestones] == [6, 6, 7, 7, 8, 8, 9, 9]
+    assert all(w.boxes[1] == b"campaigns" + w.args[0].to_bytes(8, "big") for w in milestones)
+    # Each verification follows the delivery it verifies.
+    for previous, write in zip(writes, writes[1:]):
+        if write.method == "verify_delivery":
+            assert previous.method == "log_delivery" and previous.boxes == write.boxes
+            assert write.args[0] == _id(write.boxes[0])
+    deliveries = [_id(w.boxes[0]) for w in writes if w.method == "log_delivery"]
+    assert deliveries == list(range(101, 151))
+
+    assert writes == list(plan_writes(SMALL, existing))
+    assert writes != list(plan_writes(DatasetSpec(**{**SMALL.__dict__, "seed": 1}), existing))
+
+
+def test_plan_min_balance_matches_the_encoded_boxes() -> None:
+    spec = DatasetSpec(
+        organizations=0,
+        campaigns=0,
+        deliveries=20,
+        verified_fraction=1.0,
+        lengths={"recipient": Lengths("fixed", 12), "location": Lengths("uniform", 1, 40)},
+    )
+    writes = list(plan_writes(spec, {}))
+
+    for log, verify in zip(writes[::2], writes[1::2]):
+        recipient, location = log.args
+        agent = verify.args[1]
+        assert len(recipient) == 12 and 1 <= len(location) <= 40
+        before = encode_delivery_record(DeliveryRecord(1, recipient, location, "", 0))
+        after = encode_delivery_record(DeliveryRecord(1, recipient, location, agent, 1))
+        assert log.min_balance == box_min_balance(len(log.boxes[0]), len(before))
+        assert log.min_balance + verify.min_balance == box_min_balance(
+            len(log.boxes[0]), len(after)
+        )
+
+
+def test_large_boxes_get_extra_references() -> None:
+    spec = DatasetSpec(
+        organizations=0,
+        campaigns=1,
+        milestones_per_campaign=1,
+        deliveries=0,
+        lengths={"description": Lengths("fixed", 1_000), "title": Lengths("fixed", 900)},
+    )
+    campaign, milestone = plan_writes(spec, {})
+    assert campaign.box_references == 1
+    # A milestone reads its campaign (about 1 kB) and writes about 1 kB.
+    assert milestone.box_references == 2 and milestone.box_bytes > 2 * 1_024 - 200
+    assert Write("m", (), (b"a",), 5_000, 0).box_references == 5
+
+
+@pytest.fixture
+def writer() -> DatasetWriter:
+    algorand = algokit_utils.AlgorandClient.default_localnet()
+    sender = algorand.account.random()
+    client = AidchainContractsClient(
+        algorand=algorand, app_id=APP_ID, default_sender=sender.address
+    )
+    algod = AsyncAlgodClient(
+        "http://algod.test", transport=httpx.MockTransport(FakeAlgod().handle)
+    )
+    return DatasetWriter(client, sender, BulkSender(algod))
+
+
+def test_group_carries_encoded_calls_and_pays_for_their_boxes(writer: DatasetWriter) -> None:
+    writes = list(plan_writes(SMALL, {}))[:CALLS_PER_GROUP]
+    params = asyncio.run(writer.bulk_sender.algod.suggested_params())
+
+    signed = writer.group(writes, params)
+
+    assert len(signed) == CALLS_PER_GROUP + 1
+    assert len({txn.transaction.group for txn in signed}) == 1
+    assert all(txn.transaction.sender == writer.sender.address for txn in signed)
+    payment = signed[-1].transaction
+    assert payment.receiver == get_application_address(APP_ID)
+    assert payment.amt == sum(write.min_balance for write in writes)
+
+    methods = {m.name: m.to_abi_method() for m in writer.client.app_spec.methods}
+    for txn, write in zip(signed, writes):
+        method = methods[write.method]
+        selector, *args = txn.transaction.app_args
+        assert selector == method.get_selector()
+        assert [arg.type.decode(raw) for arg, raw in zip(method.args, args)] == list(write.args)
+        names = [box.name for box in txn.transaction.boxes]
+        assert names[: len(write.boxes)] == list(write.boxes)
+    assert len({txn.get_txid() for txn in signed}) == len(signed)
+
+
+class FakeAlgod:
+    """Accepts groups in order and confirms them in the next block, or rejects them."""
+
+    def __init__(self) -> None:
+        self.round = 10
+        self.mempool: list[str] = []
+        self.blocks: dict[int, list[str]] = {}
+        self.received: list[str] = []
+        self.reject = False
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path.removeprefix("/v2")
+        if path == "/transactions/params":
+            return httpx.Response(200, json={
+                "fee": 0, "min-fee": 1000, "last-round": self.round,
+                "genesis-hash": GENESIS_HASH, "genesis-id": "fake-v1",
+                "consensus-version": "future",
+            })
+        if path == "/status":
+            return httpx.Response(200, json={"last-round": self.round})
+        if path.startswith("/status/wait-for-block-after/"):
+            self.round += 1
+            self.blocks[self.round], self.mempool = self.mempool, []
+            return httpx.Response(200, json={"last-round": self.round})
+        if path.startswith("/blocks/"):
+            block = self.blocks.get(int(path.split("/")[2]))
+            return httpx.Response(200, json={"blockTxids": block})
+        if path == "/transactions":
+            if self.reject:
+                return httpx.Response(400, json={"message": "overspend"})
+            unpacker = msgpack.Unpacker(raw=False, strict_map_key=False)
+            unpacker.feed(request.content)
+            first = next(iter(unpacker))
+            tx_id = encoding.msgpack_decode(
+                base64.b64encode(msgpack.packb(first, use_bin_type=True)).decode()
+            ).get_txid()
+            self.received.append(tx_id)
+            self.mempool.append(tx_id)
+            return httpx.Response(200, json={"txId": tx_id})
+        return httpx.Response(404, json={"message": f"unexpected {path}"})
+
+
+def _write_all(
+    fake_algod: FakeAlgod, writes: list[Write], **kwargs: typing.Any
+) -> tuple[DatasetWriter, int]:
+    algorand = algokit_utils.AlgorandClient.default_localnet()
+    sender = algorand.account.random()
+    client = AidchainContractsClient(
+        algorand=algorand, app_id=APP_ID, default_sender=sender.address
+    )
+
+    async def run() -> tuple[DatasetWriter, int]:
+        algod = AsyncAlgodClient(
+            "http://algod.test", transport=httpx.MockTransport(fake_algod.handle)
+        )
+        writer = DatasetWriter(client, sender, BulkSender(algod, **kwargs))
+        try:
+            return writer, await writer.write(writes)
+        finally:
+            await writer.bulk_sender.confirmations.aclose()
+            await algod.aclose()
+
+    return asyncio.run(run())
+
+
+def test_writes_are_submitted_in_order_and_all_confirmed() -> None:
+    fake_algod = FakeAlgod()
+    writes = list(plan_writes(SMALL, {}))
+
+    writer, sent = _write_all(fake_algod, writes, max_in_flight=2)
+
+    groups = -(-len(writes) // CALLS_PER_GROUP)
+    assert sent == len(writes)
+    assert writer.bulk_sender.submitted == writer.bulk_sender.confirmed == groups
+    assert len(fake_algod.received) == groups
+
+
+def test_a_rejected_group_stops_the_write() -> None:
+    fake_algod = FakeAlgod()
+    fake_algod.reject = True
+
+    with pytest.raises(Exception, match="overspend"):
+        _write_all(fake_algod, list(plan_writes(SMALL, {})))
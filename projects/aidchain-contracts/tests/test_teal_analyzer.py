@@ -0,0 +1,171 @@
+import base64
+import json
+from pathlib import Path
+
+import pytest
+
+from smart_contracts._helpers.teal_analyzer import (
+    TealAnalysis,
+    _split,
+    format_report,
+    parse_teal,
+)
+
+ARTIFACTS = Path(__file__).parents[1] / "smart_contracts" / "artifacts"
+
+PROGRAM = """#pragma version 10
+
+main:
+    intcblock 0 1
+    txn NumAppArgs
+    bz main_bare@3
+    pushbytess 0x01020304 0x05060708 // method "cheap()void", method "costly(uint64)void"
+    txna ApplicationArgs 0
+    match main_cheap@1 main_costly@2
+    err
+
+main_cheap@1:
+    intc_1 // 1
+    return
+
+main_costly@2:
+    txna ApplicationArgs 1
+    btoi
+    bnz main_hash@4
+    callsub helper
+    intc_1 // 1
+    return
+
+main_hash@4:
+    pushbytes "ipfs://proof" // "ipfs://proof"
+    sha256
+    pop
+    intc_1 // 1
+    return
+
+main_bare@3:
+    pushint 4 // UpdateApplication
+    txn OnCompletion
+    match main_update@5
+    err
+
+main_update@5:
+    intc_1 // 1
+    return
+
+helper:
+    proto 0 0
+    intc_0 // 0
+
+helper_loop@1:
+    intc_1 // 1
+    +
+    dup
+    pushint 3
+    <
+    bnz helper_loop@1
+    pop
+    retsub
+"""
+
+
+def test_split_keeps_comment_markers_inside_strings() -> None:
+    assert _split('    pushbytes "a // b" // note') == (['pushbytes', '"a // b"'], "note")
+    assert _split('    bytec 6 // "campaigns"') == (["bytec", "6"], '"campaigns"')
+
+
+def test_parse_builds_basic_blocks_with_fallthrough() -> None:
+    blocks = {block.label: block for block in parse_teal(PROGRAM)}
+
+    assert blocks["main"].successors == ["main_bare@3", "main+1"]
+    assert blocks["main+1"].successors == ["main_cheap@1", "main_costly@2", "main+2"]
+    assert blocks["main_costly@2"].successors == ["main_hash@4", "main_costly@2+1"]
+    assert blocks["main_costly@2+1"].calls == ["helper"]
+    assert blocks["helper"].successors == ["helper_loop@1"]
+    assert blocks["helper_loop@1"].successors == ["helper_loop@1", "helper_loop@1+1"]
+    assert blocks["helper_loop@1+1"].successors == []
+
+
+def test_worst_case_cost_per_route() -> None:
+    analysis = TealAnalysis(PROGRAM)
+    methods = {method.method: method for method in analysis.methods()}
+
+    # main (3) + dispatch (3) + route.
+    assert methods["cheap()void"].worst_case_cost == 3 + 3 + 2
+    # The sha256 branch (35 + 4) outweighs the call to the loop helper (3 + 10), whose
+    # loop is counted once.
+    assert methods["costly(uint64)void"].worst_case_cost == 3 + 3 + 3 + 39
+    assert methods["costly(uint64)void"].has_loops
+    assert not methods["cheap()void"].has_loops
+    assert methods["update (bare)"].worst_case_cost == 3 + 3 + 2
+    assert [method.method for method in analysis.methods()][0] == "costly(uint64)void"
+
+
+@pytest.mark.parametrize(
+    "folder",
+    [
+        "aidchain_contracts",
+        "aidchain_registry",
+        "aidchain_campaigns",
+        "aidchain_deliveries",
+        "aidchain_vouchers",
+    ],
+)
+def test_program_size_matches_the_assembled_bytecode(folder: str) -> None:
+    (teal_file,) = (ARTIFACTS / folder).glob("*.approval.teal")
+    (spec_file,) = (ARTIFACTS / folder).glob("*.arc56.json")
+    bytecode = base64.b64decode(json.loads(spec_file.read_text())["byteCode"]["approval"])
+
+    assert TealAnalysis.from_file(teal_file).program_size == len(bytecode)
+
+
+# Opcodes with unusual immediates that the contract artifacts do not use, and the assembled
+# bytecode of each instruction.
+IMMEDIATES_PROGRAM = """#pragma version 11
+    gtxn 0 Fee
+    gtxns Fee
+    gtxnsa ApplicationArgs 0
+    gtxnas 1 Accounts
+    gload 0 1
+    loads
+    stores
+    itxn_begin
+    gitxnas 0 Logs
+    ec_add BN254g1
+    ec_scalar_mul BLS12_381g1
+    ec_pairing_check BN254g1
+    ec_multi_scalar_mul BLS12_381g2
+    ec_subgroup_check BN254g2
+    ec_map_to BLS12_381g1
+    mimc BN254Mp110
+"""
+IMMEDIATES_BYTECODE = [
+    bytes.fromhex(code)
+    for code in (
+        "330001 3801 391a00 c1011c 3a0001 3e 3f b1 c6003a e000 e102 e200 e303 e401 e502 e600"
+    ).split()
+]
+
+
+def test_instruction_sizes_match_the_assembled_bytecode() -> None:
+    (block,) = parse_teal(IMMEDIATES_PROGRAM)
+
+    assert [instruction.size for instruction in block.instructions] == [
+        len(code) for code in IMMEDIATES_BYTECODE
+    ]
+    # Plus the version byte.
+    assert TealAnalysis(IMMEDIATES_PROGRAM).program_size == 1 + sum(map(len, IMMEDIATES_BYTECODE))
+
+
+def test_report_ranks_every_abi_method() -> None:
+    analysis = TealAnalysis.from_file(
+        ARTIFACTS / "aidchain_contracts" / "AidchainContracts.approval.teal"
+    )
+    spec_file = ARTIFACTS / "aidchain_contracts" / "AidchainContracts.arc56.json"
+    names = {method["name"] for method in json.loads(spec_file.read_text())["methods"]}
+    methods = analysis.methods()
+
+    assert {method.method.split("(")[0] for method in methods} >= names
+    costs = [method.worst_case_cost for method in methods]
+    assert costs == sorted(costs, reverse=True)
+    assert format_report(analysis).splitlines()[0].startswith("Program size")
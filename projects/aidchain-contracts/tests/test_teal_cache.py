@@ -0,0 +1,86 @@
+import base64
+import typing
+from pathlib import Path
+
+import algokit_utils
+import pytest
+
+from smart_contracts._helpers.teal_cache import TealCompileCache, with_teal_cache
+
+TEMPLATE = "#pragma version 10\n// comment\nint TMPL_LIMIT\nreturn\n"
+
+
+class CountingCompile:
+    """Stands in for algod's compile endpoint"""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def __call__(self, source: str, source_map: bool = False) -> dict[str, typing.Any]:
+        self.calls.append(source)
+        return {
+            "result": base64.b64encode(b"\x0a" + source.encode()).decode(),
+            "hash": f"HASH{len(self.calls)}",
+            "sourcemap": {"version": 3, "sources": [], "names": [], "mappings": ";AAAA;AACA"},
+        }
+
+
+def _algorand(
+    monkeypatch: pytest.MonkeyPatch, cache_dir: Path
+) -> tuple[algokit_utils.AlgorandClient, CountingCompile]:
+    algorand = algokit_utils.AlgorandClient.default_localnet()
+    compile_ = CountingCompile()
+    monkeypatch.setattr(algorand.client.algod, "compile", compile_)
+    return with_teal_cache(algorand, TealCompileCache(cache_dir)), compile_
+
+
+def test_compiles_are_reused_across_clients(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    first, first_compile = _algorand(monkeypatch, tmp_path)
+    compiled = first.app.compile_teal_template(TEMPLATE, {"LIMIT": 5})
+    first.app.compile_teal_template(TEMPLATE, {"LIMIT": 5})
+
+    second, second_compile = _algorand(monkeypatch, tmp_path)
+    cached = second.app.compile_teal_template(TEMPLATE, {"LIMIT": 5})
+
+    assert len(first_compile.calls) == 1
+    assert second_compile.calls == []
+    assert (cached.teal, cached.compiled, cached.compiled_hash) == (
+        compiled.teal,
+        compiled.compiled,
+        compiled.compiled_hash,
+    )
+    assert cached.compiled_base64_to_bytes == compiled.compiled_base64_to_bytes
+    assert cached.source_map is not None
+    assert cached.source_map.pc_to_line == compiled.source_map.pc_to_line  # type: ignore[union-attr]
+    assert second.app.get_compilation_result(cached.teal) is cached
+
+
+def test_template_values_get_their_own_entries(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    algorand, compile_ = _algorand(monkeypatch, tmp_path)
+    five = algorand.app.compile_teal_template(TEMPLATE, {"LIMIT": 5})
+    six = algorand.app.compile_teal_template(TEMPLATE, {"LIMIT": 6})
+    assert len(compile_.calls) == 2
+    assert five.compiled_hash != six.compiled_hash
+
+
+def test_a_client_is_wrapped_once(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    algorand, compile_ = _algorand(monkeypatch, tmp_path)
+    compile_teal = algorand.app.compile_teal
+    with_teal_cache(algorand, TealCompileCache(tmp_path / "other"))
+    algorand.app.compile_teal_template(TEMPLATE, {"LIMIT": 5})
+
+    assert algorand.app.compile_teal == compile_teal
+    assert len(compile_.calls) == 1
+    assert len(list(tmp_path.glob("*.json"))) == 1
+    assert not (tmp_path / "other").exists()
+
+def test_cache_can_be_disabled(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("AIDCHAIN_TEAL_CACHE", "0")
+    algorand, _ = _algorand(monkeypatch, tmp_path)
+    algorand.app.compile_teal_template(TEMPLATE, {"LIMIT": 5})
+    assert not tmp_path.exists() or not any(tmp_path.iterdir())
+
@@ -0,0 +1,74 @@
+import threading
+import time
+from pathlib import Path
+
+import algokit_utils
+import pytest
+
+import smart_contracts.__main__ as smart_contracts_main
+from smart_contracts.__main__ import SmartContract, redeploy
+from smart_contracts._helpers.watch import changed, snapshot, watch_files
+
+
+def test_changed_reports_added_modified_and_removed_files(tmp_path: Path) -> None:
+    kept, edited, removed, added = (tmp_path / name for name in ("kept", "edit", "rm", "add"))
+    for path in (kept, edited, removed):
+        path.write_text("v1")
+    before = snapshot([kept, edited, removed, added])
+
+    time.sleep(0.01)
+    edited.write_text("v2")
+    removed.unlink()
+    added.write_text("v1")
+
+    assert changed(before, snapshot([kept, edited, removed, added])) == {edited, removed, added}
+
+
+def test_watch_files_reports_each_change_once(tmp_path: Path) -> None:
+    source = tmp_path / "contract.py"
+    source.write_text("v1")
+    reported: list[set[Path]] = []
+
+    def edit() -> None:
+        time.sleep(0.05)
+        source.write_text("v2")
+
+    threading.Thread(target=edit).start()
+    watch_files(
+        lambda: [source],
+        reported.append,
+        interval=0.02,
+        settle=0.02,
+        should_stop=lambda: bool(reported),
+    )
+    assert reported == [{source}]
+
+
+def test_redeploy_updates_in_place_and_runs_smoke_script(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    built: list[str] = []
+    deployed: list[algokit_utils.OnUpdate] = []
+    contract = SmartContract(path=tmp_path / "contract.py", name="app")
+    monkeypatch.setattr(
+        smart_contracts_main,
+        "build_contracts",
+        lambda _, contracts: built.extend(c.name for c in contracts),
+    )
+    monkeypatch.setattr(
+        smart_contracts_main,
+        "_reload_deploy",
+        lambda _: lambda on_update: deployed.append(on_update),
+    )
+    smoke = tmp_path / "smoke.py"
+    smoke.write_text(f"open({str(tmp_path / 'ran')!r}, 'w').close()")
+
+    redeploy(tmp_path / "artifacts", contract, smoke)
+
+    assert built == ["app"]
+    assert deployed == [algokit_utils.OnUpdate.UpdateApp]
+    assert (tmp_path / "ran").exists()
+
+    smoke.write_text("raise SystemExit(3)")
+    with pytest.raises(Exception, match="exit code 3"):
+        redeploy(tmp_path / "artifacts", contract, smoke)